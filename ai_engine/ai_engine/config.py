@@ -54,9 +54,13 @@ class AISettings(BaseSettings):
     llm_model: str = "claude-sonnet-4-5-20250929"
     llm_timeout: float = 10.0
     llm_max_tokens: int = 1024
+    llm_client_pool_size: int = 64  # pooled clients for tenant-provided keys
+    llm_client_idle_ttl: float = 300.0  # seconds before an idle client is closed
 
     # --- cost model ---
     cost_model_path: Path = Path("models/cost_model.joblib")
+    prediction_snapshot_path: Path | None = None  # .npz drift history; None = in-memory only
+    prediction_snapshot_interval: float = 300.0  # seconds between snapshots
 
     # --- risk thresholds ---
     risk_auto_approve_threshold: float = 3.0
@@ -68,6 +72,7 @@ class AISettings(BaseSettings):
     # --- response cache ---
     cache_enabled: bool = True
     cache_max_entries: int = 10_000
+    cache_redis_url: str | None = None  # shared L2 tier; None = in-process only
 
     # --- LLM budget (platform-level; None = unlimited) ---
     llm_daily_budget_usd: float | None = None
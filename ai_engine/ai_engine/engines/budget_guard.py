@@ -2,12 +2,20 @@
 
 Enforces per-tenant daily and monthly spending limits on LLM API calls.
 
-The correct atomic pattern is :meth:`BudgetGuard.guard_call`, which holds
-the per-tenant lock across the full check → call → record sequence,
-eliminating the TOCTOU race where multiple concurrent requests pass the
-budget check before any usage has been committed:
-
-    usage = await guard.guard_call(my_llm_coro, call_type="classify", model_id="...")
+The correct atomic pattern is :meth:`BudgetGuard.guard_call`, which
+reserves the call's worst-case cost under the per-tenant lock, runs the
+call with the lock released, then settles the actual spend.  Concurrent
+calls for one tenant therefore overlap, but every budget check still sees
+the spend of calls that are in flight, so the TOCTOU race where several
+requests all pass the check before any usage is committed cannot occur:
+
+    usage = await guard.guard_call(
+        my_llm_coro,
+        call_type="classify",
+        model_id="...",
+        input_tokens=estimate_prompt_tokens(system, user),
+        max_output_tokens=1024,
+    )
 
 If you need finer control, acquire the lock manually via ``guard.lock``:
 
@@ -16,6 +24,12 @@ If you need finer control, acquire the lock manually via ``guard.lock``:
         usage_info = await llm_call()
         await guard.record_usage(**usage_info)
 
+Settled period spend is read from the usage repository once and then
+kept on the tenant's shared ledger, where every call recorded by any guard
+for the tenant is added as it settles.  The cached totals are re-read
+every ``_LEDGER_REFRESH_SECONDS`` so spend recorded by other processes is
+picked up.
+
 Token-based cost estimation uses Anthropic Claude pricing:
     Input:  $3.00  / 1M tokens
     Output: $15.00 / 1M tokens
@@ -25,6 +39,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
+import time
 import weakref
 from collections.abc import Callable
 from datetime import UTC, datetime
@@ -33,39 +49,100 @@ from typing import Any, NamedTuple
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Per-tenant asyncio locks for atomic budget enforcement
+# Pricing constants (Claude Sonnet 4 pricing, USD per token)
 # ---------------------------------------------------------------------------
 
-# BL-092: Use WeakValueDictionary so that locks for idle tenants are GC'd
-# automatically when no coroutine holds a reference to them.  This bounds
-# the dict size to the number of *concurrently active* tenants rather than
-# the total number of tenants ever seen, preventing unbounded memory growth.
-_TENANT_BUDGET_LOCKS: weakref.WeakValueDictionary[str, asyncio.Lock] = (
-    weakref.WeakValueDictionary()
-)
+_COST_PER_INPUT_TOKEN = 3.0 / 1_000_000  # $3.00 / 1M
+_COST_PER_OUTPUT_TOKEN = 15.0 / 1_000_000  # $15.00 / 1M
 
+# Rough prompt size heuristic used to size reservations before a call.
+_CHARS_PER_TOKEN = 4
 
-def _get_tenant_lock(tenant_id: str) -> asyncio.Lock:
-    """Return (creating if needed) the asyncio.Lock for a tenant.
-
-    Asyncio is single-threaded so plain dict access is safe without a
-    meta-lock.  The lock is kept alive as long as the caller holds a
-    reference to it; WeakValueDictionary releases the entry after all
-    callers release their references.
-    """
-    lock = _TENANT_BUDGET_LOCKS.get(tenant_id)
-    if lock is None:
-        lock = asyncio.Lock()
-        _TENANT_BUDGET_LOCKS[tenant_id] = lock
-    return lock
+# How long a cached period total is trusted before it is re-read from the
+# usage repository.  Spend recorded through this process is applied
+# immediately; the refresh only matters for spend recorded by other
+# processes.
+_LEDGER_REFRESH_SECONDS = 60.0
 
 
 # ---------------------------------------------------------------------------
-# Pricing constants (Claude Sonnet 4 pricing, USD per token)
+# Per-tenant ledgers for atomic budget enforcement
 # ---------------------------------------------------------------------------
 
-_COST_PER_INPUT_TOKEN = 3.0 / 1_000_000  # $3.00 / 1M
-_COST_PER_OUTPUT_TOKEN = 15.0 / 1_000_000  # $15.00 / 1M
+
+class _PeriodTotal:
+    """Cached settled spend for one budget period."""
+
+    __slots__ = ("loaded_at", "spent", "start")
+
+    def __init__(self, start: datetime, spent: float, loaded_at: float) -> None:
+        self.start = start
+        self.spent = spent
+        self.loaded_at = loaded_at
+
+
+class _TenantLedger:
+    """Lock, in-flight reservations and settled period spend for one tenant.
+
+    Every :class:`BudgetGuard` for a tenant shares the same ledger, so a
+    reservation made or a call settled through one guard is visible to
+    budget checks made through any other.  All mutations that must be
+    atomic with a budget check happen while holding :attr:`lock`.
+    """
+
+    __slots__ = ("__weakref__", "lock", "periods", "reserved")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.reserved = 0.0
+        self.periods: dict[str, _PeriodTotal] = {}
+
+    def reserve(self, amount: float) -> _Reservation:
+        """Hold *amount* against the budget until the reservation is released."""
+        self.reserved += amount
+        return _Reservation(self, amount)
+
+    def settle(self, cost: float) -> None:
+        """Add the actual *cost* of a finished call to every cached period."""
+        for entry in self.periods.values():
+            entry.spent += cost
+
+
+class _Reservation:
+    """An amount held against a tenant's budget while an LLM call runs."""
+
+    __slots__ = ("_ledger", "amount")
+
+    def __init__(self, ledger: _TenantLedger, amount: float) -> None:
+        self._ledger = ledger
+        self.amount = amount
+
+    def release(self) -> None:
+        """Return the held amount to the budget.  Safe to call more than once."""
+        if self.amount:
+            self._ledger.reserved = max(0.0, self._ledger.reserved - self.amount)
+            self.amount = 0.0
+
+
+# BL-092: Use WeakValueDictionary so that ledgers for idle tenants are GC'd
+# automatically once no BudgetGuard references them.  This bounds the dict
+# size to the number of *concurrently active* tenants rather than the total
+# number of tenants ever seen, preventing unbounded memory growth.
+_TENANT_LEDGERS: weakref.WeakValueDictionary[str, _TenantLedger] = weakref.WeakValueDictionary()
+
+
+def _get_tenant_ledger(tenant_id: str) -> _TenantLedger:
+    """Return (creating if needed) the shared ledger for a tenant.
+
+    Asyncio is single-threaded so plain dict access is safe without a
+    meta-lock.  Each :class:`BudgetGuard` keeps a strong reference to its
+    ledger, so the ledger lives exactly as long as some guard uses it.
+    """
+    ledger = _TENANT_LEDGERS.get(tenant_id)
+    if ledger is None:
+        ledger = _TenantLedger()
+        _TENANT_LEDGERS[tenant_id] = ledger
+    return ledger
 
 
 # ---------------------------------------------------------------------------
@@ -116,6 +193,11 @@ def estimate_call_cost(input_tokens: int, output_tokens: int) -> float:
     return (input_tokens * _COST_PER_INPUT_TOKEN) + (output_tokens * _COST_PER_OUTPUT_TOKEN)
 
 
+def estimate_prompt_tokens(*texts: str) -> int:
+    """Roughly estimate the prompt tokens for *texts* before sending them."""
+    return math.ceil(sum(len(text) for text in texts) / _CHARS_PER_TOKEN)
+
+
 # ---------------------------------------------------------------------------
 # BudgetGuard
 # ---------------------------------------------------------------------------
@@ -124,7 +206,7 @@ def estimate_call_cost(input_tokens: int, output_tokens: int) -> float:
 class BudgetGuard:
     """Enforces per-tenant LLM spending limits.
 
-    **Preferred usage — fully atomic via** :meth:`guard_call`::
+    **Preferred usage — reservation-based via** :meth:`guard_call`::
 
         guard = BudgetGuard(usage_repo, tenant_id="t1", daily_budget_usd=10.0)
 
@@ -137,12 +219,19 @@ class BudgetGuard:
                 latency_ms=int((time.monotonic() - t0) * 1000),
             )
 
-        cost = await guard.guard_call(my_llm_call, call_type="classify", model_id="claude-sonnet-4")
+        cost = await guard.guard_call(
+            my_llm_call,
+            call_type="classify",
+            model_id="claude-sonnet-4",
+            input_tokens=estimate_prompt_tokens(system, user),
+            max_output_tokens=1024,
+        )
 
-    ``guard_call`` holds the per-tenant lock for the full
-    check → call → record window, preventing TOCTOU races where
-    concurrent requests all pass the budget check before any usage is
-    recorded.
+    ``guard_call`` checks the budget and reserves the call's worst-case
+    cost under the per-tenant lock, releases the lock for the call itself,
+    and settles the actual cost under the lock afterwards.  Reserved
+    amounts count as spent for every budget check, so concurrent requests
+    cannot all pass the check before any usage is recorded.
 
     **Lower-level API** (when you need to interleave your own logic)::
 
@@ -156,7 +245,7 @@ class BudgetGuard:
     usage_repo:
         ``LLMUsageLogRepository`` for the tenant.
     tenant_id:
-        Tenant identifier used for the per-tenant lock.
+        Tenant identifier used for the shared per-tenant ledger and lock.
     daily_budget_usd:
         Maximum daily LLM spend (``None`` = unlimited).
     monthly_budget_usd:
@@ -175,6 +264,7 @@ class BudgetGuard:
         self._tenant_id = tenant_id
         self._daily_budget = daily_budget_usd
         self._monthly_budget = monthly_budget_usd
+        self._ledger = _get_tenant_ledger(tenant_id)
 
     # ------------------------------------------------------------------
     # Properties
@@ -193,7 +283,7 @@ class BudgetGuard:
         Use this property only when you need explicit control over the
         critical section boundaries.
         """
-        return _get_tenant_lock(self._tenant_id)
+        return self._ledger.lock
 
     # ------------------------------------------------------------------
     # Atomic high-level API
@@ -205,12 +295,22 @@ class BudgetGuard:
         *,
         call_type: str,
         model_id: str,
+        input_tokens: int = 0,
+        max_output_tokens: int = 0,
     ) -> float:
-        """Atomically check budget, run *call*, and record usage.
+        """Reserve budget, run *call*, and settle the actual spend.
 
         This is the **recommended entry point** for budget-guarded LLM
-        calls.  All three steps execute while holding the per-tenant lock,
-        eliminating the TOCTOU race.
+        calls.  The budget check and the reservation of the call's
+        worst-case cost happen atomically under the per-tenant lock.  The
+        lock is released while *call* runs, so other calls for the same
+        tenant proceed concurrently, and the reservation is replaced by
+        the actual cost under the lock once *call* finishes.
+
+        A call is admitted while settled spend plus outstanding
+        reservations is below the limit, so a tenant can overshoot by at
+        most one call's reserved cost -- the same bound as when calls
+        were fully serialized.
 
         Parameters
         ----------
@@ -224,6 +324,11 @@ class BudgetGuard:
             for usage logging and analytics.
         model_id:
             Model identifier (e.g. ``"claude-sonnet-4"``).
+        input_tokens:
+            Estimated prompt tokens (see :func:`estimate_prompt_tokens`).
+        max_output_tokens:
+            The ``max_tokens`` limit of the request.  Together with
+            *input_tokens* this sizes the reservation.
 
         Returns
         -------
@@ -233,7 +338,8 @@ class BudgetGuard:
         Raises
         ------
         BudgetExceededError
-            If the tenant has already exceeded its daily or monthly limit.
+            If the tenant has already exceeded its daily or monthly limit,
+            counting calls that are still in flight.
         Exception
             Any exception raised by *call* is re-raised after recording a
             failed usage entry (with zero token counts) so costs are still
@@ -252,43 +358,53 @@ class BudgetGuard:
                     latency_ms=int((time.monotonic() - t0) * 1000),
                 )
 
-            cost = await guard.guard_call(my_llm, call_type="plan", model_id="claude-sonnet-4")
+            cost = await guard.guard_call(
+                my_llm, call_type="plan", model_id="claude-sonnet-4", max_output_tokens=1024
+            )
         """
-        async with _get_tenant_lock(self._tenant_id):
-            # 1. Reject the call if budget is already exhausted.
+        ledger = self._ledger
+
+        # 1. Reject the call if budget is exhausted, otherwise hold its
+        #    worst-case cost so concurrent checks see it as spent.
+        async with ledger.lock:
             await self.check_budget()
+            reservation = ledger.reserve(estimate_call_cost(input_tokens, max_output_tokens))
 
-            # 2. Run the actual LLM call; capture usage or failure.
-            error_type: str | None = None
-            usage: LLMUsage | None = None
+        try:
+            # 2. Run the actual LLM call without holding the lock.
             try:
                 usage = await call()
             except Exception as exc:
-                error_type = type(exc).__name__
-                # Record the failed call (zero tokens) so failure rates are visible.
-                await self.record_usage(
+                async with ledger.lock:
+                    reservation.release()
+                    # Record the failed call (zero tokens) so failure rates are visible.
+                    await self.record_usage(
+                        call_type=call_type,
+                        model_id=model_id,
+                        input_tokens=0,
+                        output_tokens=0,
+                        latency_ms=0,
+                        success=False,
+                        error_type=type(exc).__name__,
+                    )
+                raise
+
+            # 3. Swap the reservation for the actual cost under the lock so
+            #    no budget check observes the call as neither reserved nor
+            #    spent.
+            async with ledger.lock:
+                reservation.release()
+                return await self.record_usage(
                     call_type=call_type,
                     model_id=model_id,
-                    input_tokens=0,
-                    output_tokens=0,
-                    latency_ms=0,
-                    success=False,
-                    error_type=error_type,
+                    input_tokens=usage.input_tokens,
+                    output_tokens=usage.output_tokens,
+                    latency_ms=usage.latency_ms,
+                    success=True,
                 )
-                raise
-
-            # 3. Record successful usage while still holding the lock so no
-            #    other coroutine for this tenant can check budget until the
-            #    spend is committed to the repository.
-            cost = await self.record_usage(
-                call_type=call_type,
-                model_id=model_id,
-                input_tokens=usage.input_tokens,
-                output_tokens=usage.output_tokens,
-                latency_ms=usage.latency_ms,
-                success=True,
-            )
-            return cost
+        finally:
+            # Cancellation, or a failure while settling, must not leak the hold.
+            reservation.release()
 
     # ------------------------------------------------------------------
     # Lower-level primitives (use guard_call when possible)
@@ -297,6 +413,10 @@ class BudgetGuard:
     async def check_budget(self) -> None:
         """Verify the tenant has not exceeded any configured budget.
 
+        Spend is the tenant's cached settled total for the period plus
+        every outstanding reservation, both shared by all of the tenant's
+        guards.
+
         This method is **not** atomic by itself.  Use :meth:`guard_call`
         or acquire :attr:`lock` before calling this to prevent TOCTOU.
 
@@ -310,7 +430,7 @@ class BudgetGuard:
         # Daily check.
         if self._daily_budget is not None:
             day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            daily_spent = await self._usage_repo.get_period_cost(since=day_start)
+            daily_spent = await self._period_spent("daily", day_start) + self._ledger.reserved
             if daily_spent >= self._daily_budget:
                 raise BudgetExceededError(
                     tenant_id=self._tenant_id,
@@ -322,7 +442,7 @@ class BudgetGuard:
         # Monthly check.
         if self._monthly_budget is not None:
             month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            monthly_spent = await self._usage_repo.get_period_cost(since=month_start)
+            monthly_spent = await self._period_spent("monthly", month_start) + self._ledger.reserved
             if monthly_spent >= self._monthly_budget:
                 raise BudgetExceededError(
                     tenant_id=self._tenant_id,
@@ -344,7 +464,9 @@ class BudgetGuard:
         """Record an LLM call and return the estimated cost.
 
         Always records regardless of budget state — call :meth:`check_budget`
-        (or :meth:`guard_call`) before the LLM call.
+        (or :meth:`guard_call`) before the LLM call.  The cost is also
+        added to the tenant's cached period totals; hold :attr:`lock` when
+        calling this directly so the update cannot race a refresh.
         """
         cost = estimate_call_cost(input_tokens, output_tokens)
 
@@ -358,6 +480,7 @@ class BudgetGuard:
             success=success,
             error_type=error_type,
         )
+        self._ledger.settle(cost)
 
         logger.info(
             "LLM usage: tenant=%s type=%s tokens=%d+%d cost=$%.6f latency=%dms",
@@ -377,8 +500,11 @@ class BudgetGuard:
         day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-        daily_spent = await self._usage_repo.get_period_cost(since=day_start)
-        monthly_spent = await self._usage_repo.get_period_cost(since=month_start)
+        # Take the lock so a refresh cannot race a settlement and drop it.
+        async with self._ledger.lock:
+            daily_spent = await self._period_spent("daily", day_start)
+            monthly_spent = await self._period_spent("monthly", month_start)
+            reserved = self._ledger.reserved
 
         daily_remaining = (
             max(0.0, self._daily_budget - daily_spent) if self._daily_budget is not None else None
@@ -403,5 +529,20 @@ class BudgetGuard:
             "monthly_remaining_usd": (
                 round(monthly_remaining, 6) if monthly_remaining is not None else None
             ),
+            "reserved_usd": round(reserved, 6),
             "budget_exceeded": exceeded,
         }
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    async def _period_spent(self, period: str, start: datetime) -> float:
+        """Return settled spend since *start*, querying the repository only when stale."""
+        periods = self._ledger.periods
+        entry = periods.get(period)
+        now = time.monotonic()
+        if entry is None or entry.start != start or now - entry.loaded_at >= _LEDGER_REFRESH_SECONDS:
+            spent = float(await self._usage_repo.get_period_cost(since=start))
+            entry = periods[period] = _PeriodTotal(start, spent, now)
+        return entry.spent
@@ -1,4 +1,4 @@
-"""In-process advisory response cache with SHA-256 keys and per-type TTL.
+"""Two-tier advisory response cache with SHA-256 keys and per-type TTL.
 
 Caches deterministic AI engine responses (semantic classification, cost
 prediction, risk scoring, SQL optimisation) to avoid redundant computation
@@ -9,25 +9,39 @@ sorted keys) plus the prompt version, so prompt updates automatically
 invalidate stale entries.
 
 Design notes:
-    * In-process dict — no external dependency (Redis comes later with
-      horizontal scaling).
+    * L1 is an in-process LRU (``OrderedDict``): lookups, inserts and
+      evictions are all O(1).
+    * L2 is an optional shared Redis tier (``AI_ENGINE_CACHE_REDIS_URL``)
+      so every worker and replica benefits from a response computed once.
+      It uses the same ``make_key`` keys and per-type TTLs.  Redis errors
+      are logged and treated as misses; the cache never fails a request.
+    * :meth:`ResponseCache.get_or_compute` coalesces concurrent misses for
+      one key (single flight): the first caller computes, the others
+      await its result, so identical requests trigger at most one LLM call
+      per process.
     * Thread-safe via a threading lock (FastAPI runs handlers in an async
       event loop but may dispatch sync work to thread pool executors).
     * Each entry stores an expiry timestamp; a background sweep is not
       needed because expired entries are lazily evicted on access.
     * ``invalidate_all()`` supports immediate full-cache flush, e.g.
       after a cost model retrain or prompt version change.
+      ``invalidate_shared()`` does the same for the Redis tier.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
 import threading
 import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +58,11 @@ DEFAULT_TTL: dict[str, int] = {
 
 _FALLBACK_TTL = 900  # 15 min for unknown request types
 
+# Namespace for shared (L2) entries: ``aicache:<request_type>:<key>``.
+_L2_PREFIX = "aicache"
+
+T = TypeVar("T")
+
 
 # ---------------------------------------------------------------------------
 # Internal types
@@ -66,7 +85,7 @@ class _CacheEntry:
 
 
 class ResponseCache:
-    """SHA-256 keyed in-process cache for AI advisory responses.
+    """SHA-256 keyed two-tier cache for AI advisory responses.
 
     Parameters
     ----------
@@ -74,11 +93,14 @@ class ResponseCache:
         Optional mapping of ``{request_type: ttl_seconds}`` to override
         the built-in defaults.
     max_entries:
-        Maximum number of entries to store.  When exceeded, the oldest
-        entries are evicted (LRU-style, not LFU).
+        Maximum number of in-process (L1) entries.  When exceeded, the
+        least recently used entry is evicted.
     enabled:
         If ``False``, all operations are no-ops.  Allows disabling via
         config without changing call sites.
+    l2:
+        Optional ``redis.asyncio`` client for the shared tier (see
+        :func:`connect_redis_l2`).  ``None`` keeps the cache in-process.
     """
 
     def __init__(
@@ -87,11 +109,14 @@ class ResponseCache:
         ttl_overrides: dict[str, int] | None = None,
         max_entries: int = 10_000,
         enabled: bool = True,
+        l2: Any | None = None,
     ) -> None:
-        self._store: dict[str, _CacheEntry] = {}
+        self._store: OrderedDict[str, _CacheEntry] = OrderedDict()
         self._lock = threading.Lock()
         self._enabled = enabled
         self._max_entries = max_entries
+        self._l2 = l2
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
 
         self._ttls = dict(DEFAULT_TTL)
         if ttl_overrides:
@@ -100,6 +125,10 @@ class ResponseCache:
         # Stats
         self._hits = 0
         self._misses = 0
+        self._l2_hits = 0
+        self._l2_misses = 0
+        self._l2_errors = 0
+        self._coalesced = 0
 
     # ------------------------------------------------------------------
     # Public API
@@ -128,7 +157,7 @@ class ResponseCache:
         return hashlib.sha256(canonical.encode()).hexdigest()
 
     def get(self, key: str) -> Any | None:
-        """Look up a cached response.  Returns ``None`` on miss or expiry."""
+        """Look up an in-process (L1) response.  Returns ``None`` on miss or expiry."""
         if not self._enabled:
             return None
 
@@ -145,12 +174,13 @@ class ResponseCache:
                 logger.debug("Cache expired: key=%s type=%s", key[:12], entry.request_type)
                 return None
 
+            self._store.move_to_end(key)
             self._hits += 1
             logger.debug("Cache hit: key=%s type=%s", key[:12], entry.request_type)
             return entry.value
 
     def put(self, key: str, value: Any, request_type: str) -> None:
-        """Store a response in the cache.
+        """Store a response in the in-process (L1) cache.
 
         Parameters
         ----------
@@ -168,16 +198,16 @@ class ResponseCache:
         now = time.monotonic()
 
         with self._lock:
-            # Evict if at capacity — remove oldest entries first
-            if len(self._store) >= self._max_entries and key not in self._store:
-                self._evict_oldest()
-
             self._store[key] = _CacheEntry(
                 value=value,
                 expires_at=now + ttl,
                 request_type=request_type,
                 created_at=now,
             )
+            self._store.move_to_end(key)
+            # Evict least recently used entries beyond capacity.
+            while len(self._store) > self._max_entries:
+                self._store.popitem(last=False)
 
         logger.debug(
             "Cache put: key=%s type=%s ttl=%ds entries=%d",
@@ -187,14 +217,111 @@ class ResponseCache:
             len(self._store),
         )
 
+    async def get_or_compute(
+        self,
+        key: str,
+        request_type: str,
+        compute: Callable[[], Awaitable[T]],
+        *,
+        response_model: type[BaseModel] | None = None,
+    ) -> T:
+        """Return the cached response for *key*, computing it at most once.
+
+        Looks in L1, then L2, and only then awaits *compute*.  Concurrent
+        callers that miss on the same key while a computation is running
+        await that computation instead of starting their own.  The result
+        is written to both tiers.
+
+        Parameters
+        ----------
+        key:
+            The SHA-256 key from ``make_key()``.
+        request_type:
+            Used to look up the TTL and to namespace the L2 entry.
+        compute:
+            Zero-argument coroutine function producing the response.
+        response_model:
+            Pydantic model used to rebuild responses read from L2.  Without
+            it, L2 values round-trip as plain JSON.
+        """
+        if not self._enabled:
+            return await compute()
+
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            self._coalesced += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The computing caller was cancelled; take over.
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        # Mark the outcome as retrieved even when nobody else is waiting.
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            value = await self._fill(key, request_type, compute, response_model)
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def get_many(
+        self,
+        keys: list[str],
+        request_type: str,
+        *,
+        response_model: type[BaseModel] | None = None,
+    ) -> list[Any | None]:
+        """Look up several keys, in order, with ``None`` for each miss.
+
+        Checks L1 for every key, then L2 for the L1 misses; L2 hits are
+        copied into L1.  Used by batch endpoints, which compute all misses
+        in one call and store them with :meth:`put_many`.
+        """
+        if not self._enabled:
+            return [None] * len(keys)
+
+        values = [self.get(key) for key in keys]
+        for index, key in enumerate(keys):
+            if values[index] is None:
+                value = await self._l2_get(key, request_type, response_model)
+                if value is not None:
+                    self.put(key, value, request_type)
+                    values[index] = value
+        return values
+
+    async def put_many(self, entries: list[tuple[str, Any]], request_type: str) -> None:
+        """Store several ``(key, value)`` responses in both tiers."""
+        if not self._enabled:
+            return
+        for key, value in entries:
+            await self._l2_put(key, value, request_type)
+            self.put(key, value, request_type)
+
     def invalidate(self, key: str) -> bool:
-        """Remove a single entry.  Returns ``True`` if found."""
+        """Remove a single L1 entry.  Returns ``True`` if found."""
         with self._lock:
             removed = self._store.pop(key, None)
         return removed is not None
 
     def invalidate_by_type(self, request_type: str) -> int:
-        """Remove all entries of a given request type.  Returns count removed."""
+        """Remove all L1 entries of a given request type.  Returns count removed."""
         with self._lock:
             keys = [k for k, v in self._store.items() if v.request_type == request_type]
             for k in keys:
@@ -203,20 +330,46 @@ class ResponseCache:
         return len(keys)
 
     def invalidate_all(self) -> int:
-        """Flush the entire cache.  Returns count removed."""
+        """Flush the entire L1 cache.  Returns count removed."""
         with self._lock:
             count = len(self._store)
             self._store.clear()
             self._hits = 0
             self._misses = 0
+            self._l2_hits = 0
+            self._l2_misses = 0
+            self._l2_errors = 0
+            self._coalesced = 0
         logger.info("Full cache invalidation: removed %d entries", count)
         return count
 
+    async def invalidate_shared(self, request_type: str | None = None) -> int:
+        """Remove L2 entries, of one request type or all.  Returns count removed."""
+        if self._l2 is None:
+            return 0
+        pattern = f"{_L2_PREFIX}:{request_type or '*'}:*"
+        removed = 0
+        try:
+            batch: list[Any] = []
+            async for l2_key in self._l2.scan_iter(match=pattern, count=500):
+                batch.append(l2_key)
+                if len(batch) >= 500:
+                    removed += await self._l2.delete(*batch)
+                    batch.clear()
+            if batch:
+                removed += await self._l2.delete(*batch)
+        except Exception:
+            self._l2_errors += 1
+            logger.warning("Shared cache invalidation failed", exc_info=True)
+        logger.info("Invalidated %d shared cache entries (type=%s)", removed, request_type or "*")
+        return removed
+
     @property
     def stats(self) -> dict[str, Any]:
-        """Return cache hit/miss statistics."""
+        """Return cache hit/miss statistics, overall (L1) and per tier."""
         with self._lock:
             total = self._hits + self._misses
+            l2_total = self._l2_hits + self._l2_misses
             return {
                 "entries": len(self._store),
                 "hits": self._hits,
@@ -224,43 +377,123 @@ class ResponseCache:
                 "hit_rate": round(self._hits / total, 4) if total > 0 else 0.0,
                 "max_entries": self._max_entries,
                 "enabled": self._enabled,
+                "coalesced": self._coalesced,
+                "tiers": {
+                    "l1": {
+                        "hits": self._hits,
+                        "misses": self._misses,
+                        "hit_rate": round(self._hits / total, 4) if total > 0 else 0.0,
+                    },
+                    "l2": {
+                        "enabled": self._l2 is not None,
+                        "hits": self._l2_hits,
+                        "misses": self._l2_misses,
+                        "errors": self._l2_errors,
+                        "hit_rate": round(self._l2_hits / l2_total, 4) if l2_total > 0 else 0.0,
+                    },
+                },
             }
 
     @property
     def size(self) -> int:
-        """Number of entries currently in the cache (including expired)."""
+        """Number of L1 entries currently in the cache (including expired)."""
         return len(self._store)
 
+    async def aclose(self) -> None:
+        """Close the L2 connection pool, if any.  Called on shutdown."""
+        if self._l2 is None:
+            return
+        try:
+            await self._l2.aclose()
+        except Exception:
+            logger.debug("Error closing shared cache client", exc_info=True)
+        self._l2 = None
+
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
 
-    def _evict_oldest(self) -> None:
-        """Remove the 10% oldest entries when at capacity.
+    async def _fill(
+        self,
+        key: str,
+        request_type: str,
+        compute: Callable[[], Awaitable[T]],
+        response_model: type[BaseModel] | None,
+    ) -> Any:
+        """Read *key* from L2 or compute it, then store it in both tiers."""
+        value = await self._l2_get(key, request_type, response_model)
+        if value is None:
+            value = await compute()
+            await self._l2_put(key, value, request_type)
+        self.put(key, value, request_type)
+        return value
+
+    async def _l2_get(self, key: str, request_type: str, response_model: type[BaseModel] | None) -> Any | None:
+        """Read and decode a shared entry; any failure counts as a miss."""
+        if self._l2 is None:
+            return None
+        try:
+            raw = await self._l2.get(f"{_L2_PREFIX}:{request_type}:{key}")
+            if raw is None:
+                self._l2_misses += 1
+                return None
+            value = response_model.model_validate_json(raw) if response_model else json.loads(raw)
+        except Exception:
+            self._l2_errors += 1
+            self._l2_misses += 1
+            logger.warning("Shared cache read failed: key=%s type=%s", key[:12], request_type, exc_info=True)
+            return None
+        self._l2_hits += 1
+        logger.debug("Shared cache hit: key=%s type=%s", key[:12], request_type)
+        return value
 
-        Must be called while holding ``self._lock``.
-        """
-        now = time.monotonic()
+    async def _l2_put(self, key: str, value: Any, request_type: str) -> None:
+        """Encode and write a shared entry with the request type's TTL."""
+        if self._l2 is None or value is None:
+            return
+        ttl = self._ttls.get(request_type, _FALLBACK_TTL)
+        if ttl <= 0:
+            return
+        try:
+            raw = value.model_dump_json() if isinstance(value, BaseModel) else json.dumps(value)
+            await self._l2.set(f"{_L2_PREFIX}:{request_type}:{key}", raw, ex=ttl)
+        except Exception:
+            self._l2_errors += 1
+            logger.warning("Shared cache write failed: key=%s type=%s", key[:12], request_type, exc_info=True)
 
-        # First try to remove expired entries
-        expired_keys = [k for k, v in self._store.items() if now > v.expires_at]
-        for k in expired_keys:
-            del self._store[k]
 
-        if len(self._store) < self._max_entries:
-            return
+async def connect_redis_l2(redis_url: str) -> Any | None:
+    """Connect to Redis for the shared cache tier.
 
-        # Still full — evict oldest 10%
-        evict_count = max(1, self._max_entries // 10)
-        sorted_keys = sorted(
-            self._store.keys(),
-            key=lambda k: self._store[k].created_at,
+    Returns the ``redis.asyncio`` client, or ``None`` (in-process cache
+    only) when the ``redis`` package is missing or the server is
+    unreachable.
+    """
+    try:
+        import redis.asyncio as aioredis  # type: ignore[import-untyped]
+    except ImportError:
+        logger.warning(
+            "redis package not installed — response cache stays in-process. Install with: pip install redis[asyncio]"
         )
-        for k in sorted_keys[:evict_count]:
-            del self._store[k]
-
-        logger.debug(
-            "Evicted %d expired + %d oldest entries",
-            len(expired_keys),
-            min(evict_count, len(sorted_keys)),
+        return None
+
+    client = aioredis.from_url(
+        redis_url,
+        encoding="utf-8",
+        decode_responses=True,
+        socket_connect_timeout=2,
+        socket_timeout=2,
+        health_check_interval=30,
+    )
+    try:
+        await client.ping()
+    except Exception as exc:
+        logger.warning(
+            "Redis connection failed (%s) — response cache stays in-process: %s",
+            redis_url.split("@")[-1],
+            exc,
         )
+        await client.aclose()
+        return None
+    logger.info("Shared response cache enabled: %s", redis_url.split("@")[-1])
+    return client
@@ -17,7 +17,9 @@ from __future__ import annotations
 
 import logging
 import math
+from collections import defaultdict
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
@@ -126,7 +128,105 @@ class CostAnomalyDetector:
         equal_count = sum(1 for c in cost_history if c == latest_cost)
         percentile = round((below_count + 0.5 * equal_count) / len(cost_history) * 100.0, 2)
 
-        # --- Classification ---
+        return self._classify(
+            model_name,
+            latest_cost,
+            mean=mean,
+            z_score=z_score,
+            percentile=percentile,
+            lower_fence=lower_fence,
+            upper_fence=upper_fence,
+        )
+
+    def detect_batch(
+        self,
+        models: dict[str, list[float]],
+    ) -> list[AnomalyReport]:
+        """Analyse multiple models, returning results sorted by severity.
+
+        Parameters
+        ----------
+        models:
+            Mapping of ``model_name → cost_history``.
+
+        Returns
+        -------
+        list[AnomalyReport]
+            Results sorted by severity (critical → major → minor → none),
+            then by absolute z-score descending within each severity level.
+        """
+        severity_order = {"critical": 0, "major": 1, "minor": 2, "none": 3}
+        names = sorted(models)
+        reports: dict[str, AnomalyReport] = {}
+
+        # Histories of equal length stack into one 2-D array, so each
+        # length group is analysed with a single set of NumPy reductions.
+        by_length: dict[int, list[str]] = defaultdict(list)
+        for name in names:
+            if len(models[name]) < 3:
+                reports[name] = self.detect(name, models[name])
+            else:
+                by_length[len(models[name])].append(name)
+
+        for length, group in by_length.items():
+            costs = np.array([models[name] for name in group], dtype=np.float64)
+            latest = costs[:, -1]
+
+            # --- Z-score analysis ---
+            mean = costs.mean(axis=1)
+            variance = ((costs - mean[:, None]) ** 2).mean(axis=1)
+            std_dev = np.sqrt(variance)
+            z_scores = np.divide(latest - mean, std_dev, out=np.zeros(len(group)), where=std_dev > 0)
+
+            # --- IQR analysis ---
+            sorted_costs = np.sort(costs, axis=1)
+            q1 = self._percentile_columns(sorted_costs, 25)
+            q3 = self._percentile_columns(sorted_costs, 75)
+            iqr = q3 - q1
+            lower_fences = q1 - self._iqr_factor * iqr
+            upper_fences = q3 + self._iqr_factor * iqr
+
+            # --- Percentile of latest cost ---
+            below = (costs < latest[:, None]).sum(axis=1)
+            equal = (costs == latest[:, None]).sum(axis=1)
+            ranks = (below + 0.5 * equal) / length * 100.0
+
+            for name, latest_cost, avg, z_score, rank, lower_fence, upper_fence in zip(
+                group,
+                latest.tolist(),
+                mean.tolist(),
+                z_scores.tolist(),
+                ranks.tolist(),
+                lower_fences.tolist(),
+                upper_fences.tolist(),
+                strict=True,
+            ):
+                reports[name] = self._classify(
+                    name,
+                    latest_cost,
+                    mean=avg,
+                    z_score=z_score,
+                    percentile=round(rank, 2),
+                    lower_fence=lower_fence,
+                    upper_fence=upper_fence,
+                )
+
+        ordered = [reports[name] for name in names]
+        ordered.sort(key=lambda r: (severity_order.get(r.severity, 3), -abs(r.z_score)))
+        return ordered
+
+    def _classify(
+        self,
+        model_name: str,
+        latest_cost: float,
+        *,
+        mean: float,
+        z_score: float,
+        percentile: float,
+        lower_fence: float,
+        upper_fence: float,
+    ) -> AnomalyReport:
+        """Turn the z-score and IQR fences into a severity and suggestion."""
         abs_z = abs(z_score)
         iqr_anomaly = latest_cost < lower_fence or latest_cost > upper_fence
 
@@ -170,28 +270,6 @@ class CostAnomalyDetector:
             suggested_investigation=suggestion,
         )
 
-    def detect_batch(
-        self,
-        models: dict[str, list[float]],
-    ) -> list[AnomalyReport]:
-        """Analyse multiple models, returning results sorted by severity.
-
-        Parameters
-        ----------
-        models:
-            Mapping of ``model_name → cost_history``.
-
-        Returns
-        -------
-        list[AnomalyReport]
-            Results sorted by severity (critical → major → minor → none),
-            then by absolute z-score descending within each severity level.
-        """
-        severity_order = {"critical": 0, "major": 1, "minor": 2, "none": 3}
-        reports = [self.detect(name, history) for name, history in sorted(models.items())]
-        reports.sort(key=lambda r: (severity_order.get(r.severity, 3), -abs(r.z_score)))
-        return reports
-
     @staticmethod
     def _percentile(sorted_data: list[float], p: float) -> float:
         """Compute the p-th percentile of sorted data using linear interpolation."""
@@ -203,3 +281,13 @@ class CostAnomalyDetector:
         ceil_k = min(floor_k + 1, n - 1)
         frac = k - floor_k
         return sorted_data[floor_k] + frac * (sorted_data[ceil_k] - sorted_data[floor_k])
+
+    @staticmethod
+    def _percentile_columns(sorted_rows: np.ndarray, p: float) -> np.ndarray:
+        """Row-wise :meth:`_percentile` for a 2-D array of sorted rows."""
+        n = sorted_rows.shape[1]
+        k = (p / 100.0) * (n - 1)
+        floor_k = math.floor(k)
+        ceil_k = min(floor_k + 1, n - 1)
+        frac = k - floor_k
+        return sorted_rows[:, floor_k] + frac * (sorted_rows[:, ceil_k] - sorted_rows[:, floor_k])
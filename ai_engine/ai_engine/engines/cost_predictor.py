@@ -33,42 +33,29 @@ _HEURISTIC_BASE_SECONDS = 300.0
 _HEURISTIC_PER_PARTITION_SECONDS = 30.0
 
 
-def _compute_confidence_band(
-    estimated_cost_usd: float,
-    confidence: float,
-) -> tuple[float, float, str]:
-    """Compute cost confidence bands based on prediction confidence.
-
-    Parameters
-    ----------
-    estimated_cost_usd:
-        The point estimate cost.
-    confidence:
-        The confidence score (0.0 to 1.0).
-
-    Returns
-    -------
-    tuple[float, float, str]
-        (lower_bound, upper_bound, confidence_label)
-
-    Confidence band widths:
+def _compute_confidence_bands(
+    estimated_costs_usd: np.ndarray,
+    confidence: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute cost confidence bands for a batch of estimates.
+
+    Band widths by confidence score:
+
     - Low confidence (< 0.5): +-40% of estimate
     - Medium confidence (0.5-0.79): +-20% of estimate
     - High confidence (>= 0.8): +-5% of estimate
+
+    Returns unrounded ``(lower_bounds, upper_bounds, labels)`` arrays; the
+    caller rounds each bound when building the response.
     """
-    if confidence >= 0.8:
-        margin = 0.05
-        label = "high"
-    elif confidence >= 0.5:
-        margin = 0.20
-        label = "medium"
-    else:
-        margin = 0.40
-        label = "low"
+    high = confidence >= 0.8
+    medium = confidence >= 0.5
+    margin = np.where(high, 0.05, np.where(medium, 0.20, 0.40))
+    labels = np.where(high, "high", np.where(medium, "medium", "low"))
 
-    lower = round(max(0.0, estimated_cost_usd * (1.0 - margin)), 6)
-    upper = round(estimated_cost_usd * (1.0 + margin), 6)
-    return lower, upper, label
+    lower = np.maximum(0.0, estimated_costs_usd * (1.0 - margin))
+    upper = estimated_costs_usd * (1.0 + margin)
+    return lower, upper, labels
 
 
 class CostPredictor:
@@ -151,10 +138,83 @@ class CostPredictor:
 
     def predict(self, request: CostPredictRequest) -> CostPredictResponse:
         """Return cost / runtime prediction for the requested model run."""
+        return self.predict_batch([request])[0]
+
+    def predict_batch(self, requests: list[CostPredictRequest]) -> list[CostPredictResponse]:
+        """Return predictions for several model runs, in request order.
+
+        Builds one feature matrix and runs a single model (or vectorised
+        heuristic) pass instead of one inference call per request.
+        :meth:`predict` is this method applied to a one-item batch.
+        """
         self._ensure_loaded()  # BL-100: load on first use
+        if not requests:
+            return []
+
+        partitions = np.fromiter((r.partition_count for r in requests), dtype=np.float64, count=len(requests))
+        volumes = np.fromiter(
+            (r.data_volume_bytes if r.data_volume_bytes is not None else 0 for r in requests),
+            dtype=np.float64,
+            count=len(requests),
+        )
+        workers = np.fromiter(
+            (max(r.num_workers, 1) if r.num_workers is not None else 1 for r in requests),
+            dtype=np.float64,
+            count=len(requests),
+        )
+
         if self._model is not None:
-            return self._model_predict(request)
-        return self._heuristic_predict(request)
+            predicted_seconds, volume_log = self._model_predict_seconds(partitions, volumes, workers)
+            confidence = 0.8
+        else:
+            historical = np.fromiter(
+                (r.historical_runtime_avg if r.historical_runtime_avg is not None else 0.0 for r in requests),
+                dtype=np.float64,
+                count=len(requests),
+            )
+            predicted_seconds = self._heuristic_seconds(partitions, volumes, workers, historical)
+            confidence = 0.4
+
+        runtime_minutes = predicted_seconds / 60.0
+        cost_rates = np.fromiter(
+            (_COST_RATES.get(r.cluster_size, _COST_RATES["medium"]) for r in requests),
+            dtype=np.float64,
+            count=len(requests),
+        )
+        costs = [round(cost, 4) for cost in (runtime_minutes * cost_rates).tolist()]
+        lower, upper, labels = _compute_confidence_bands(
+            np.asarray(costs, dtype=np.float64),
+            np.full(len(requests), confidence),
+        )
+
+        if self._model is not None and self._registry is not None:
+            for request, volume, worker_count, cost in zip(
+                requests, volume_log.tolist(), workers.tolist(), costs, strict=True
+            ):
+                self._registry.record_prediction(
+                    model_name="cost_model",
+                    features={
+                        "partition_count": float(request.partition_count),
+                        "log1p_data_volume_bytes": volume,
+                        "num_workers": worker_count,
+                        "cluster_size": request.cluster_size,
+                    },
+                    prediction=cost,
+                )
+
+        return [
+            CostPredictResponse(
+                estimated_runtime_minutes=round(minutes, 2),
+                estimated_cost_usd=cost,
+                confidence=confidence,
+                cost_lower_bound_usd=round(low, 6),
+                cost_upper_bound_usd=round(high, 6),
+                confidence_label=label,
+            )
+            for minutes, cost, low, high, label in zip(
+                runtime_minutes.tolist(), costs, lower.tolist(), upper.tolist(), labels.tolist(), strict=True
+            )
+        ]
 
     def train(self, telemetry_data: list[dict]) -> None:
         """Train (or retrain) the cost model from historical telemetry.
@@ -186,115 +246,75 @@ class CostPredictor:
     # Trained-model path
     # ------------------------------------------------------------------
 
-    def _model_predict(self, request: CostPredictRequest) -> CostPredictResponse:
-        """Predict using the trained LinearRegression model.
+    def _model_predict_seconds(
+        self,
+        partitions: np.ndarray,
+        volumes: np.ndarray,
+        workers: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Predict runtimes in seconds with the trained LinearRegression model.
 
-        Constructs the same 8-feature vector that ``extract_features``
-        produces during training:
+        Builds the same 8-feature rows that ``extract_features`` produces
+        during training:
 
           [partition_count, log1p_data_volume_bytes, num_workers,
            sql_complexity_score, join_count, cte_count,
            has_window_functions, distinct_table_count]
 
-        SQL-complexity features default to 0.0 when not available at
+        SQL-complexity features are 0.0, since they are not available at
         prediction time (the model was trained on telemetry that may or
         may not include SQL metadata).
+
+        Returns the clamped runtime predictions in seconds and the
+        ``log1p`` data-volume column used to build the feature matrix.
         """
         if self._model is None:
             raise RuntimeError(
-                "CostPredictor._model_predict called without a loaded model — "
-                "call predict() which routes through _ensure_loaded() first"
+                "CostPredictor._model_predict_seconds called without a loaded model — "
+                "call predict_batch() which routes through _ensure_loaded() first"
             )
 
-        volume_log = np.log1p(request.data_volume_bytes) if request.data_volume_bytes is not None else 0.0
-        workers = float(max(request.num_workers, 1)) if request.num_workers is not None else 1.0
-
-        features = np.array(
-            [
-                [
-                    float(request.partition_count),
-                    volume_log,
-                    workers,
-                    0.0,  # sql_complexity_score
-                    0.0,  # join_count
-                    0.0,  # cte_count
-                    0.0,  # has_window_functions
-                    0.0,  # distinct_table_count
-                ]
-            ],
-            dtype=np.float64,
-        )
-        predicted_seconds = float(CostModelTrainer.predict(self._model, features)[0])
-        # Clamp to sane range
-        predicted_seconds = max(predicted_seconds, 30.0)
-
-        runtime_minutes = predicted_seconds / 60.0
-        cost_rate = _COST_RATES.get(request.cluster_size, _COST_RATES["medium"])
-        cost_usd = runtime_minutes * cost_rate
-
-        confidence = 0.8
-        lower, upper, label = _compute_confidence_band(round(cost_usd, 4), confidence)
-
-        # Record prediction for drift tracking when a registry is wired in.
-        if self._registry is not None:
-            self._registry.record_prediction(
-                model_name="cost_model",
-                features={
-                    "partition_count": float(request.partition_count),
-                    "log1p_data_volume_bytes": volume_log,
-                    "num_workers": workers,
-                    "cluster_size": request.cluster_size,
-                },
-                prediction=round(cost_usd, 4),
-            )
+        # A missing volume is passed as 0 and maps to log1p(0) == 0.0.
+        volume_log = np.log1p(volumes)
+        features = np.zeros((partitions.shape[0], 8), dtype=np.float64)
+        features[:, 0] = partitions
+        features[:, 1] = volume_log
+        features[:, 2] = workers
+        # Columns 3-7 (SQL-complexity features) stay 0.0.
 
-        return CostPredictResponse(
-            estimated_runtime_minutes=round(runtime_minutes, 2),
-            estimated_cost_usd=round(cost_usd, 4),
-            confidence=confidence,
-            cost_lower_bound_usd=lower,
-            cost_upper_bound_usd=upper,
-            confidence_label=label,
-        )
+        # Clamp to sane range
+        predicted_seconds = np.maximum(CostModelTrainer.predict(self._model, features), 30.0)
+        return predicted_seconds, volume_log
 
     # ------------------------------------------------------------------
     # Heuristic fallback
     # ------------------------------------------------------------------
 
-    def _heuristic_predict(
-        self,
-        request: CostPredictRequest,
-    ) -> CostPredictResponse:
-        """Deterministic heuristic when no trained model is available."""
-
-        if request.historical_runtime_avg is not None and request.historical_runtime_avg > 0:
-            predicted_seconds = request.historical_runtime_avg
-        else:
-            predicted_seconds = _HEURISTIC_BASE_SECONDS + request.partition_count * _HEURISTIC_PER_PARTITION_SECONDS
+    @staticmethod
+    def _heuristic_seconds(
+        partitions: np.ndarray,
+        volumes: np.ndarray,
+        workers: np.ndarray,
+        historical: np.ndarray,
+    ) -> np.ndarray:
+        """Deterministic runtime estimate in seconds when no trained model is available.
+
+        A positive historical average is used as is; otherwise the estimate
+        grows linearly with the partition count.  Either is then scaled by
+        data volume and worker count where known.
+        """
+        predicted_seconds = np.where(
+            historical > 0,
+            historical,
+            _HEURISTIC_BASE_SECONDS + partitions * _HEURISTIC_PER_PARTITION_SECONDS,
+        )
 
-        # Scale by data volume if available (logarithmic factor)
-        if request.data_volume_bytes is not None and request.data_volume_bytes > 0:
-            volume_factor = 1.0 + np.log1p(request.data_volume_bytes) / 50.0
-            predicted_seconds *= volume_factor
+        # Scale by data volume where known (logarithmic factor)
+        volume_factor = 1.0 + np.log1p(volumes) / 50.0
+        predicted_seconds = np.where(volumes > 0, predicted_seconds * volume_factor, predicted_seconds)
 
-        # Scale by workers (diminishing returns)
-        if request.num_workers is not None and request.num_workers > 1:
-            parallelism_factor = 1.0 / (1.0 + np.log2(request.num_workers))
-            predicted_seconds *= parallelism_factor
+        # Scale by workers (diminishing returns); ``workers`` is always >= 1
+        parallelism_factor = 1.0 / (1.0 + np.log2(workers))
+        predicted_seconds = np.where(workers > 1, predicted_seconds * parallelism_factor, predicted_seconds)
 
-        predicted_seconds = max(predicted_seconds, 30.0)
-        runtime_minutes = predicted_seconds / 60.0
-        cost_rate = _COST_RATES.get(request.cluster_size, _COST_RATES["medium"])
-        cost_usd = runtime_minutes * cost_rate
-
-        confidence = 0.4
-        lower, upper, label = _compute_confidence_band(round(cost_usd, 4), confidence)
-
-        return CostPredictResponse(
-            estimated_runtime_minutes=round(runtime_minutes, 2),
-            estimated_cost_usd=round(cost_usd, 4),
-            confidence=confidence,
-            cost_lower_bound_usd=lower,
-            cost_upper_bound_usd=upper,
-            confidence_label=label,
-        )
+        return np.maximum(predicted_seconds, 30.0)
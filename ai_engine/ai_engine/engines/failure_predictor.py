@@ -21,6 +21,9 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import dataclass
+from operator import attrgetter
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +35,9 @@ logger = logging.getLogger(__name__)
 _DEFAULT_WARNING_THRESHOLD = 0.3
 _DEFAULT_CRITICAL_THRESHOLD = 0.6
 
+# Error types that usually clear on retry and so do not raise the score
+_TRANSIENT_ERRORS: frozenset[str] = frozenset({"timeout", "throttled", "network", "connection"})
+
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -105,90 +111,79 @@ class FailurePredictor:
 
     def predict(self, history: RunHistory) -> FailurePrediction:
         """Compute failure probability and generate actionable insights."""
+        prediction = self._predict_all([history])[0]
 
-        score = 0.0
-        factors: list[str] = []
-        actions: list[str] = []
-
-        # --- Signal 1: Historical failure rate (weight: 2.5) ---
-        if history.total_runs > 0:
-            failure_rate = history.failed_runs / history.total_runs
-            signal = min(failure_rate / 0.3, 1.0)  # saturates at 30% failure rate
-            score += signal * 2.5
-            if failure_rate > 0.05:
-                factors.append(
-                    f"Historical failure rate: {failure_rate:.1%} ({history.failed_runs}/{history.total_runs} runs)"
-                )
-            if failure_rate > 0.15:
-                actions.append(
-                    "Investigate recurring failure patterns — consider reviewing error logs for systematic issues"
-                )
-
-        # --- Signal 2: Recent failure acceleration (weight: 2.0) ---
-        if history.recent_runs > 0:
-            recent_rate = history.recent_failures / history.recent_runs
-            historical_rate = history.failed_runs / history.total_runs if history.total_runs > 0 else 0.0
-            if recent_rate > historical_rate * 1.5 and history.recent_failures > 0:
-                acceleration = min((recent_rate - historical_rate) / 0.2, 1.0)
-                score += acceleration * 2.0
-                factors.append(
-                    f"Recent failure rate ({recent_rate:.1%}) exceeds historical average ({historical_rate:.1%})"
-                )
-                actions.append("Recent failure rate is accelerating — prioritise investigation of recent changes")
-
-        # --- Signal 3: Consecutive failures (weight: 1.5) ---
-        if history.consecutive_failures > 0:
-            signal = min(history.consecutive_failures / 3.0, 1.0)
-            score += signal * 1.5
-            factors.append(f"Consecutive failures: {history.consecutive_failures} (most recent runs all failed)")
-            if history.consecutive_failures >= 3:
-                actions.append("Model has failed 3+ times in a row — manual intervention strongly recommended")
-
-        # --- Signal 4: Runtime trend (weight: 1.0) ---
-        if history.runtime_trend > 0.2 and history.avg_runtime_seconds > 0:
-            signal = min(history.runtime_trend / 1.0, 1.0)  # saturates at 100% growth
-            score += signal * 1.0
-            factors.append(
-                f"Runtime trend: +{history.runtime_trend:.0%} "
-                f"(recent avg {history.recent_avg_runtime_seconds:.0f}s "
-                f"vs historical {history.avg_runtime_seconds:.0f}s)"
+        logger.info(
+            "Failure prediction: model=%s prob=%.4f risk=%s factors=%d",
+            history.model_name,
+            prediction.failure_probability,
+            prediction.risk_level,
+            len(prediction.factors),
+        )
+
+        return prediction
+
+    def predict_batch(
+        self,
+        histories: list[RunHistory],
+    ) -> list[FailurePrediction]:
+        """Predict failure probability for multiple models.
+
+        Scores every history in one vectorised pass through the same
+        scorer as :meth:`predict`.
+
+        Returns predictions sorted by descending failure probability.
+        """
+        if not histories:
+            return []
+
+        predictions = self._predict_all(histories)
+
+        logger.info(
+            "Failure prediction batch: models=%d high=%d medium=%d",
+            len(predictions),
+            sum(1 for p in predictions if p.risk_level == "high"),
+            sum(1 for p in predictions if p.risk_level == "medium"),
+        )
+
+        predictions.sort(key=lambda p: p.failure_probability, reverse=True)
+        return predictions
+
+    def _predict_all(self, histories: list[RunHistory]) -> list[FailurePrediction]:
+        """Score *histories* and describe each one, in input order."""
+        scores = _score_histories(histories)
+        return [
+            self._build_prediction(
+                history,
+                probability,
+                failure_rate=rate,
+                recent_rate=recent,
+                accelerating=accel,
             )
-            if history.runtime_trend > 0.5:
-                actions.append(
-                    "Runtime has grown significantly — consider reviewing data volume growth or query optimisation"
-                )
-
-        # --- Signal 5: Shuffle growth (weight: 0.8) ---
-        if history.shuffle_trend > 0.3 and history.avg_shuffle_bytes > 0:
-            signal = min(history.shuffle_trend / 1.5, 1.0)
-            score += signal * 0.8
-            factors.append(f"Shuffle volume trend: +{history.shuffle_trend:.0%} growth")
-            if history.shuffle_trend > 1.0:
-                actions.append(
-                    "Data shuffle volume has more than doubled — review partition strategy and cluster sizing"
-                )
-
-        # --- Signal 6: Staleness (weight: 0.7) ---
-        if history.hours_since_last_success > 168:  # > 1 week
-            signal = min(history.hours_since_last_success / 720, 1.0)  # caps at 30 days
-            score += signal * 0.7
-            days = history.hours_since_last_success / 24
-            factors.append(f"No successful run in {days:.0f} days")
-            actions.append("Model hasn't succeeded recently — verify upstream data availability and configuration")
-
-        # --- Signal 7: Known-bad error type (weight: 0.5) ---
-        _transient_errors = {"timeout", "throttled", "network", "connection"}
-        if (
-            history.last_error_type
-            and history.consecutive_failures > 0
-            and history.last_error_type.lower() not in _transient_errors
-        ):
-            score += 0.5
-            factors.append(f"Last error type: {history.last_error_type}")
-
-        # --- Compute probability via sigmoid ---
-        # Score range: [0, ~9.0], logistic midpoint at 3.5
-        probability = _sigmoid(score, midpoint=3.5, steepness=1.2)
+            for history, probability, rate, recent, accel in zip(
+                histories,
+                scores.probability.tolist(),
+                scores.failure_rate.tolist(),
+                scores.recent_rate.tolist(),
+                scores.accelerating.tolist(),
+                strict=True,
+            )
+        ]
+
+    def _build_prediction(
+        self,
+        history: RunHistory,
+        probability: float,
+        *,
+        failure_rate: float,
+        recent_rate: float,
+        accelerating: bool,
+    ) -> FailurePrediction:
+        """Attach risk level, contributing factors and actions to a score."""
+        factors, actions = _describe_rates(history, failure_rate, recent_rate, accelerating)
+        trend_factors, trend_actions = _describe_trends(history)
+        factors += trend_factors
+        actions += trend_actions
 
         # Determine risk level
         if probability >= self._critical_threshold:
@@ -204,7 +199,7 @@ class FailurePredictor:
         if not actions and probability < self._warning_threshold:
             actions.append("No action required — model is healthy")
 
-        prediction = FailurePrediction(
+        return FailurePrediction(
             model_name=history.model_name,
             failure_probability=round(probability, 4),
             risk_level=risk_level,
@@ -212,27 +207,155 @@ class FailurePredictor:
             suggested_actions=actions,
         )
 
-        logger.info(
-            "Failure prediction: model=%s prob=%.4f risk=%s factors=%d",
-            history.model_name,
-            probability,
-            risk_level,
-            len(factors),
+
+@dataclass(frozen=True)
+class _FailureScores:
+    """Per-history scoring outputs of :func:`_score_histories`, as arrays."""
+
+    probability: np.ndarray
+    failure_rate: np.ndarray
+    recent_rate: np.ndarray
+    accelerating: np.ndarray
+
+
+# RunHistory fields read by the scorer, in the column order of its matrix.
+_SIGNAL_FIELDS = (
+    "total_runs",
+    "failed_runs",
+    "recent_runs",
+    "recent_failures",
+    "consecutive_failures",
+    "runtime_trend",
+    "avg_runtime_seconds",
+    "shuffle_trend",
+    "avg_shuffle_bytes",
+    "hours_since_last_success",
+)
+_read_signals = attrgetter(*_SIGNAL_FIELDS)
+
+
+def _score_histories(histories: list[RunHistory]) -> _FailureScores:
+    """Score every history with the weighted logistic model in one NumPy pass.
+
+    Each signal contributes a weight in ``[0, weight]``; a signal that does
+    not fire contributes exactly 0.0.  The summed score (range ``[0, ~9]``)
+    goes through a sigmoid with its midpoint at 3.5.
+    """
+    n = len(histories)
+    signals = np.array([_read_signals(h) for h in histories], dtype=np.float64).reshape(n, len(_SIGNAL_FIELDS))
+    (
+        total_runs,
+        failed_runs,
+        recent_runs,
+        recent_failures,
+        consecutive,
+        runtime_trend,
+        avg_runtime,
+        shuffle_trend,
+        avg_shuffle,
+        hours_stale,
+    ) = signals.T
+    known_bad = np.fromiter((_is_known_bad_error(h) for h in histories), dtype=bool, count=n)
+
+    score = np.zeros(n)
+
+    # Signal 1: historical failure rate, saturating at 30% (weight 2.5).
+    has_runs = total_runs > 0
+    failure_rate = np.divide(failed_runs, total_runs, out=np.zeros(n), where=has_runs)
+    score += np.where(has_runs, np.minimum(failure_rate / 0.3, 1.0) * 2.5, 0.0)
+
+    # Signal 2: recent failure acceleration (weight 2.0).
+    recent_rate = np.divide(recent_failures, recent_runs, out=np.zeros(n), where=recent_runs > 0)
+    accelerating = (recent_runs > 0) & (recent_rate > failure_rate * 1.5) & (recent_failures > 0)
+    score += np.where(accelerating, np.minimum((recent_rate - failure_rate) / 0.2, 1.0) * 2.0, 0.0)
+
+    # Signal 3: consecutive failures (weight 1.5).
+    score += np.where(consecutive > 0, np.minimum(consecutive / 3.0, 1.0) * 1.5, 0.0)
+
+    # Signal 4: runtime growth, saturating at 100% (weight 1.0).
+    runtime_growing = (runtime_trend > 0.2) & (avg_runtime > 0)
+    score += np.where(runtime_growing, np.minimum(runtime_trend / 1.0, 1.0) * 1.0, 0.0)
+
+    # Signal 5: shuffle growth (weight 0.8).
+    shuffle_growing = (shuffle_trend > 0.3) & (avg_shuffle > 0)
+    score += np.where(shuffle_growing, np.minimum(shuffle_trend / 1.5, 1.0) * 0.8, 0.0)
+
+    # Signal 6: staleness beyond one week, capped at 30 days (weight 0.7).
+    score += np.where(hours_stale > 168, np.minimum(hours_stale / 720, 1.0) * 0.7, 0.0)
+
+    # Signal 7: known-bad error type (weight 0.5).
+    score += np.where(known_bad, 0.5, 0.0)
+
+    return _FailureScores(
+        probability=_sigmoid_array(score, midpoint=3.5, steepness=1.2),
+        failure_rate=failure_rate,
+        recent_rate=recent_rate,
+        accelerating=accelerating,
+    )
+
+
+def _describe_rates(
+    history: RunHistory,
+    failure_rate: float,
+    recent_rate: float,
+    accelerating: bool,
+) -> tuple[list[str], list[str]]:
+    """Return the factors and actions for the failure-count signals."""
+    factors: list[str] = []
+    actions: list[str] = []
+
+    if history.total_runs > 0:
+        if failure_rate > 0.05:
+            factors.append(
+                f"Historical failure rate: {failure_rate:.1%} ({history.failed_runs}/{history.total_runs} runs)"
+            )
+        if failure_rate > 0.15:
+            actions.append(
+                "Investigate recurring failure patterns — consider reviewing error logs for systematic issues"
+            )
+
+    if accelerating:
+        factors.append(f"Recent failure rate ({recent_rate:.1%}) exceeds historical average ({failure_rate:.1%})")
+        actions.append("Recent failure rate is accelerating — prioritise investigation of recent changes")
+
+    if history.consecutive_failures > 0:
+        factors.append(f"Consecutive failures: {history.consecutive_failures} (most recent runs all failed)")
+        if history.consecutive_failures >= 3:
+            actions.append("Model has failed 3+ times in a row — manual intervention strongly recommended")
+
+    return factors, actions
+
+
+def _describe_trends(history: RunHistory) -> tuple[list[str], list[str]]:
+    """Return the factors and actions for the trend, staleness and error-type signals."""
+    factors: list[str] = []
+    actions: list[str] = []
+
+    if history.runtime_trend > 0.2 and history.avg_runtime_seconds > 0:
+        factors.append(
+            f"Runtime trend: +{history.runtime_trend:.0%} "
+            f"(recent avg {history.recent_avg_runtime_seconds:.0f}s "
+            f"vs historical {history.avg_runtime_seconds:.0f}s)"
         )
+        if history.runtime_trend > 0.5:
+            actions.append(
+                "Runtime has grown significantly — consider reviewing data volume growth or query optimisation"
+            )
 
-        return prediction
+    if history.shuffle_trend > 0.3 and history.avg_shuffle_bytes > 0:
+        factors.append(f"Shuffle volume trend: +{history.shuffle_trend:.0%} growth")
+        if history.shuffle_trend > 1.0:
+            actions.append("Data shuffle volume has more than doubled — review partition strategy and cluster sizing")
 
-    def predict_batch(
-        self,
-        histories: list[RunHistory],
-    ) -> list[FailurePrediction]:
-        """Predict failure probability for multiple models.
+    if history.hours_since_last_success > 168:
+        days = history.hours_since_last_success / 24
+        factors.append(f"No successful run in {days:.0f} days")
+        actions.append("Model hasn't succeeded recently — verify upstream data availability and configuration")
 
-        Returns predictions sorted by descending failure probability.
-        """
-        predictions = [self.predict(h) for h in histories]
-        predictions.sort(key=lambda p: p.failure_probability, reverse=True)
-        return predictions
+    if _is_known_bad_error(history):
+        factors.append(f"Last error type: {history.last_error_type}")
+
+    return factors, actions
 
 
 # ---------------------------------------------------------------------------
@@ -339,3 +462,18 @@ def _sigmoid(x: float, midpoint: float = 0.0, steepness: float = 1.0) -> float:
     # Clamp to avoid overflow
     z = max(-20.0, min(20.0, z))
     return 1.0 / (1.0 + math.exp(-z))
+
+
+def _sigmoid_array(x: np.ndarray, midpoint: float = 0.0, steepness: float = 1.0) -> np.ndarray:
+    """Element-wise :func:`_sigmoid` for a NumPy array."""
+    z = np.clip(steepness * (x - midpoint), -20.0, 20.0)
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def _is_known_bad_error(history: RunHistory) -> bool:
+    """Return ``True`` if the current failure streak ended on a non-transient error."""
+    return bool(
+        history.last_error_type
+        and history.consecutive_failures > 0
+        and history.last_error_type.lower() not in _TRANSIENT_ERRORS
+    )
@@ -20,11 +20,14 @@ from __future__ import annotations
 import json
 import logging
 import time as _time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ValidationError
 
-from ai_engine.engines.budget_guard import BudgetExceededError, BudgetGuard, LLMUsage
+from ai_engine.engines.budget_guard import BudgetExceededError, BudgetGuard, LLMUsage, estimate_prompt_tokens
+from ai_engine.engines.llm_client_pool import LLMClientPool
 from ai_engine.engines.pii_scrubber import (
     contains_pii,
     scrub_for_llm,
@@ -78,9 +81,9 @@ class LLMClient:
        ``AI_ENGINE_LLM_API_KEY``.  Used as a fallback or for
        demo/trial tenants.
     2. **Per-tenant key**: Callers pass ``api_key`` on each request.
-       The client creates a short-lived ``AsyncAnthropic`` client for that
-       call and disposes it immediately.  This lets each tenant bring their
-       own LLM API key without sharing credentials across tenants.
+       Each key gets its own ``AsyncAnthropic`` client from a bounded
+       :class:`LLMClientPool`, so its keep-alive connections are reused
+       across calls while credentials are never shared across tenants.
 
     All public methods are **async coroutines** that must be awaited.
     The async Anthropic SDK is used so that LLM I/O never blocks the
@@ -108,6 +111,11 @@ class LLMClient:
         self._client: Any = None
         self._has_platform_key = False
         self._budget_guard = budget_guard
+        self._client_pool = LLMClientPool(
+            self._build_tenant_client,
+            max_clients=settings.llm_client_pool_size,
+            idle_ttl_seconds=settings.llm_client_idle_ttl,
+        )
 
         if self._enabled:
             try:
@@ -145,6 +153,15 @@ class LLMClient:
     def enabled(self) -> bool:
         return self._enabled
 
+    @property
+    def client_pool_stats(self) -> dict[str, Any]:
+        """Hit/miss and connection-reuse counters of the per-tenant client pool."""
+        return self._client_pool.stats
+
+    async def aclose(self) -> None:
+        """Close pooled per-tenant clients.  Called on application shutdown."""
+        await self._client_pool.aclose()
+
     async def classify_change(
         self,
         old_sql: str,
@@ -165,8 +182,8 @@ class LLMClient:
             Per-request override.  When ``False`` the call is skipped even
             if the global LLM flag is on (used for per-tenant opt-out).
         api_key:
-            Per-tenant API key.  If provided, a temporary AsyncAnthropic
-            client is created for this call.  Falls back to the platform key.
+            Per-tenant API key.  If provided, the pooled AsyncAnthropic
+            client for that key is used.  Falls back to the platform key.
         """
         if not self._enabled or not llm_enabled:
             return None
@@ -219,8 +236,8 @@ class LLMClient:
             Per-request override.  When ``False`` the call is skipped even
             if the global LLM flag is on (used for per-tenant opt-out).
         api_key:
-            Per-tenant API key.  If provided, a temporary AsyncAnthropic
-            client is created for this call.  Falls back to the platform key.
+            Per-tenant API key.  If provided, the pooled AsyncAnthropic
+            client for that key is used.  Falls back to the platform key.
         """
         if not self._enabled or not llm_enabled:
             return None
@@ -278,35 +295,51 @@ class LLMClient:
             logger.debug("PII detected and scrubbed from %s before LLM call", field_name)
         return scrub_for_llm(text)
 
-    def _resolve_client(self, api_key: str | None) -> Any:
-        """Return the AsyncAnthropic client to use for a request.
+    def _build_tenant_client(self, api_key: str) -> Any:
+        """Create the ``AsyncAnthropic`` client pooled for a tenant-provided key.
+
+        The client gets its own ``httpx.AsyncClient`` carrying the pool's
+        request hook, so connection reuse shows up in the pool stats.
+        """
+        try:
+            import anthropic
+            import httpx
 
-        If ``api_key`` is provided, creates a one-shot ``AsyncAnthropic``
-        client scoped to that key.  Otherwise, falls back to the platform-
+            http_client = httpx.AsyncClient(
+                timeout=self._timeout,
+                event_hooks={"request": [self._client_pool.on_request]},
+            )
+            return anthropic.AsyncAnthropic(
+                api_key=api_key,
+                timeout=self._timeout,
+                http_client=http_client,
+            )
+        except Exception as exc:
+            logger.warning("Failed to create per-tenant AsyncAnthropic client: %s", exc)
+            raise LLMDisabledError(
+                "Tenant-provided LLM API key is invalid or the Anthropic SDK "
+                "could not initialise. Check the key and try again."
+            ) from exc
+
+    @asynccontextmanager
+    async def _resolve_client(self, api_key: str | None) -> AsyncIterator[Any]:
+        """Yield the AsyncAnthropic client to use for a request.
+
+        If ``api_key`` is provided, leases the pooled client for that key
+        (creating it on first use).  Otherwise, falls back to the platform-
         level client.  Raises :class:`LLMDisabledError` if neither is
         available.
         """
         if api_key:
-            try:
-                import anthropic
+            async with self._client_pool.lease(api_key) as client:
+                yield client
+            return
 
-                return anthropic.AsyncAnthropic(
-                    api_key=api_key,
-                    timeout=self._timeout,
-                )
-            except Exception as exc:
-                logger.warning("Failed to create per-tenant AsyncAnthropic client: %s", exc)
-                raise LLMDisabledError(
-                    "Tenant-provided LLM API key is invalid or the Anthropic SDK "
-                    "could not initialise. Check the key and try again."
-                ) from exc
-
-        if self._client is not None:
-            return self._client
-
-        raise LLMDisabledError(
-            "No LLM API key available. Provide a key in Settings or contact your platform administrator."
-        )
+        if self._client is None:
+            raise LLMDisabledError(
+                "No LLM API key available. Provide a key in Settings or contact your platform administrator."
+            )
+        yield self._client
 
     async def _call_llm(
         self,
@@ -320,23 +353,27 @@ class LLMClient:
 
         Uses ``AsyncAnthropic`` so the event loop is never blocked.
 
-        When a :class:`BudgetGuard` is configured, the entire sequence of
-        check → call → record executes atomically under the per-tenant
-        ``asyncio.Lock`` via :meth:`BudgetGuard.guard_call`.  This eliminates
-        the TOCTOU race where multiple concurrent requests could all pass the
-        budget check before any spend has been committed.
+        When a :class:`BudgetGuard` is configured, the call's worst-case
+        cost (estimated prompt plus ``max_tokens`` of output) is reserved
+        against the budget via :meth:`BudgetGuard.guard_call` before the
+        request is sent, and settled afterwards.  Concurrent calls for the
+        same tenant run in parallel, yet cannot all pass the budget check
+        before any spend has been committed.
 
         Parameters
         ----------
         api_key:
-            Optional per-tenant API key.  When provided, a temporary
-            ``AsyncAnthropic`` client is created for this call only.
+            Optional per-tenant API key.  When provided, the pooled
+            ``AsyncAnthropic`` client for that key is used.
         call_type:
             Label for the type of call (e.g. ``"classify_change"``),
             used for budget tracking.
         """
-        client = self._resolve_client(api_key)
+        async with self._resolve_client(api_key) as client:
+            return await self._call_with_client(client, system, user, call_type=call_type)
 
+    async def _call_with_client(self, client: Any, system: str, user: str, *, call_type: str) -> str:
+        """Send one request on *client*, under the budget guard when configured."""
         # _response_holder captures the Anthropic response object from inside
         # the inner coroutine so we can extract the text after guard_call().
         # Using a list as a mutable closure cell avoids instance-level state
@@ -366,11 +403,13 @@ class LLMClient:
             )
 
         if self._budget_guard is not None and self._budget_guard.has_budget:
-            # Atomic: check budget, run the call, record usage — all under lock.
+            # Atomic: reserve the worst-case cost, run the call, settle usage.
             await self._budget_guard.guard_call(
                 _make_request,
                 call_type=call_type,
                 model_id=self._model,
+                input_tokens=estimate_prompt_tokens(system, user),
+                max_output_tokens=self._max_tokens,
             )
         else:
             # No budget enforcement — call directly.
@@ -0,0 +1,205 @@
+"""Bounded pool of reusable LLM SDK clients keyed by tenant credential.
+
+Every ``AsyncAnthropic`` client owns an HTTP connection pool, so building
+one per call means a fresh TCP connect and TLS handshake on every request
+made with a tenant's own API key.  :class:`LLMClientPool` keeps one client
+per credential and hands it out again on later calls, so keep-alive
+connections to the LLM API are reused.
+
+Design notes:
+    * Keyed by the SHA-256 of the API key; raw keys are never stored as
+      dict keys or logged.
+    * Bounded LRU: when more than ``max_clients`` credentials are pooled,
+      the least recently used client is evicted.
+    * Idle clients (unused for ``idle_ttl_seconds``) are evicted lazily on
+      the next checkout, like expired entries in
+      :class:`~ai_engine.engines.cache.ResponseCache`.
+    * Evicting a client closes its transport.  A client still leased to
+      an in-flight call is closed when that call returns it.
+    * Asyncio is single-threaded and the pool never awaits between looking
+      up and inserting an entry, so no lock is needed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# httpcore trace event emitted once per newly opened TCP connection.
+_CONNECT_EVENT = "connection.connect_tcp.complete"
+
+
+@dataclass(slots=True)
+class _PooledClient:
+    """A pooled client and its lease bookkeeping."""
+
+    client: Any
+    last_used: float
+    leases: int = 0
+    evicted: bool = False
+
+
+class LLMClientPool:
+    """LRU pool of LLM SDK clients, one per tenant credential.
+
+    Parameters
+    ----------
+    factory:
+        Called with the raw API key on a pool miss; returns a new client.
+        Clients are closed with their ``close()`` method (sync or async).
+    max_clients:
+        Maximum number of credentials with a pooled client.
+    idle_ttl_seconds:
+        Clients unused for this long are closed and dropped.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], Any],
+        *,
+        max_clients: int = 64,
+        idle_ttl_seconds: float = 300.0,
+    ) -> None:
+        if max_clients < 1:
+            raise ValueError("max_clients must be at least 1")
+        self._factory = factory
+        self._max_clients = max_clients
+        self._idle_ttl = idle_ttl_seconds
+        self._entries: OrderedDict[str, _PooledClient] = OrderedDict()
+
+        # Stats
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._requests = 0
+        self._connections_opened = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(api_key: str) -> str:
+        """Return the pool key (SHA-256 hex digest) for *api_key*."""
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+    @asynccontextmanager
+    async def lease(self, api_key: str) -> AsyncIterator[Any]:
+        """Borrow the pooled client for *api_key*, creating it on a miss.
+
+        The client must only be used inside the ``async with`` block.
+        """
+        entry = self._checkout(api_key)
+        try:
+            # Evict inside the try: if closing a victim is cancelled, the
+            # lease taken by _checkout is still returned.
+            await self._evict(entry.last_used)
+            yield entry.client
+        finally:
+            entry.leases -= 1
+            entry.last_used = time.monotonic()
+            if entry.evicted and entry.leases == 0:
+                await self._close(entry)
+
+    async def aclose(self) -> None:
+        """Close every pooled client.  Called on application shutdown."""
+        entries = list(self._entries.values())
+        self._entries.clear()
+        for entry in entries:
+            entry.evicted = True
+            if entry.leases == 0:
+                await self._close(entry)
+
+    async def on_request(self, request: Any) -> None:
+        """``httpx`` request event hook that tracks connection reuse.
+
+        Install it on the ``httpx.AsyncClient`` handed to each pooled SDK
+        client.  It counts requests and attaches an ``httpcore`` trace
+        callback that counts newly opened connections; every other request
+        was served on a reused keep-alive connection.
+        """
+        self._requests += 1
+        request.extensions["trace"] = self._trace
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return pool hit/miss and connection-reuse counters."""
+        checkouts = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_clients": self._max_clients,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / checkouts, 4) if checkouts > 0 else 0.0,
+            "evictions": self._evictions,
+            "requests": self._requests,
+            "connections_opened": self._connections_opened,
+            "connections_reused": max(0, self._requests - self._connections_opened),
+        }
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _checkout(self, api_key: str) -> _PooledClient:
+        now = time.monotonic()
+        key = self.make_key(api_key)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._hits += 1
+            self._entries.move_to_end(key)
+        else:
+            self._misses += 1
+            entry = _PooledClient(client=self._factory(api_key), last_used=now)
+            self._entries[key] = entry
+        entry.leases += 1
+        entry.last_used = now
+        return entry
+
+    async def _evict(self, now: float) -> None:
+        """Drop idle clients, then the least recently used beyond capacity."""
+        victims = [
+            key
+            for key, entry in self._entries.items()
+            if entry.leases == 0 and now - entry.last_used >= self._idle_ttl
+        ]
+        overflow = len(self._entries) - len(victims) - self._max_clients
+        if overflow > 0:
+            # OrderedDict iterates oldest first; the newest entry is never chosen.
+            idle = set(victims)
+            lru = [key for key in self._entries if key not in idle]
+            victims.extend(lru[:overflow])
+
+        # Detach every victim before the first await so a concurrent
+        # checkout cannot revive an entry that is about to be closed.
+        evicted = [self._entries.pop(key) for key in victims]
+        self._evictions += len(evicted)
+        for entry in evicted:
+            entry.evicted = True
+        for entry in evicted:
+            if entry.leases == 0:
+                await self._close(entry)
+
+    async def _close(self, entry: _PooledClient) -> None:
+        close = getattr(entry.client, "close", None)
+        if close is None:
+            return
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            logger.warning("Failed to close pooled LLM client", exc_info=True)
+
+    async def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == _CONNECT_EVENT:
+            self._connections_opened += 1
@@ -12,6 +12,8 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
+
 from ai_engine.models.requests import RiskScoreRequest
 from ai_engine.models.responses import RiskScoreResponse
 
@@ -34,56 +36,110 @@ class RiskScorer:
 
     def score(self, request: RiskScoreRequest) -> RiskScoreResponse:
         """Compute a deterministic risk score with contributing factors."""
+        response = self._score_all([request])[0]
+
+        logger.info(
+            "Risk score for model=%s: %.1f (business_critical=%s, approval_required=%s)",
+            request.model_name,
+            response.risk_score,
+            response.business_critical,
+            response.approval_required,
+        )
+
+        return response
+
+    def score_batch(self, requests: list[RiskScoreRequest]) -> list[RiskScoreResponse]:
+        """Score several model changes in one vectorised pass, in request order.
+
+        Uses the same scorer as :meth:`score`, so each response matches
+        what :meth:`score` returns for the same request.
+        """
+        if not requests:
+            return []
+
+        responses = self._score_all(requests)
+
+        logger.info(
+            "Risk score batch: models=%d approval_required=%d business_critical=%d",
+            len(responses),
+            sum(1 for r in responses if r.approval_required),
+            sum(1 for r in responses if r.business_critical),
+        )
 
-        risk: float = 0.0
+        return responses
+
+    def _score_all(self, requests: list[RiskScoreRequest]) -> list[RiskScoreResponse]:
+        """Score *requests* and describe each one, in request order."""
+        matched = [_matched_critical_tags(r) for r in requests]
+        risk = _score_requests(requests, matched)
+        return [
+            self._build_response(request, score, tags)
+            for request, score, tags in zip(requests, risk.tolist(), matched, strict=True)
+        ]
+
+    def _build_response(
+        self,
+        request: RiskScoreRequest,
+        risk: float,
+        matched_tags: list[str],
+    ) -> RiskScoreResponse:
+        """Describe the contributing factors and apply the approval thresholds."""
         factors: list[str] = []
 
-        # 1. Downstream depth impact (capped at 6.0)
         if request.downstream_depth > 0:
             depth_score = min(request.downstream_depth * 1.5, 6.0)
-            risk += depth_score
             factors.append(f"Downstream depth: {request.downstream_depth} model(s) affected (+{depth_score:.1f})")
 
-        # 2. SLA tags
         if request.sla_tags:
-            risk += 3.0
             tag_str = ", ".join(request.sla_tags)
             factors.append(f"SLA-tagged: {tag_str} (+3.0)")
 
-        # 3. Dashboard dependencies
         if request.dashboard_dependencies:
-            risk += 2.0
             dep_str = ", ".join(request.dashboard_dependencies)
             factors.append(f"Dashboard dependencies: {dep_str} (+2.0)")
 
-        # 4. Historical failure rate
         if request.historical_failure_rate > 0.05:
-            risk += 1.0
             factors.append(f"Historical failure rate: {request.historical_failure_rate:.1%} (+1.0)")
 
-        # 5. Critical model tags
-        matched_tags = _CRITICAL_TAGS & {t.lower() for t in request.model_tags}
-        for tag in sorted(matched_tags):
-            risk += 0.5
+        for tag in matched_tags:
             factors.append(f"Critical tag: {tag} (+0.5)")
 
-        # Clamp to [0.0, 10.0]
-        risk = max(0.0, min(risk, 10.0))
-
-        business_critical = risk >= self._manual_review_threshold
-        approval_required = risk >= self._auto_approve_threshold
-
-        logger.info(
-            "Risk score for model=%s: %.1f (business_critical=%s, approval_required=%s)",
-            request.model_name,
-            risk,
-            business_critical,
-            approval_required,
-        )
-
         return RiskScoreResponse(
             risk_score=round(risk, 2),
-            business_critical=business_critical,
-            approval_required=approval_required,
+            business_critical=risk >= self._manual_review_threshold,
+            approval_required=risk >= self._auto_approve_threshold,
             risk_factors=factors,
         )
+
+
+def _matched_critical_tags(request: RiskScoreRequest) -> list[str]:
+    """Return the request's critical model tags, lower-cased and sorted."""
+    return sorted(_CRITICAL_TAGS & {t.lower() for t in request.model_tags})
+
+
+def _score_requests(requests: list[RiskScoreRequest], matched_tags: list[list[str]]) -> np.ndarray:
+    """Return the clamped risk score of each request as one NumPy array.
+
+    All score components are multiples of 0.5, so summing them as arrays
+    is exact.
+    """
+    n = len(requests)
+    depth = np.fromiter((r.downstream_depth for r in requests), dtype=np.float64, count=n)
+    has_sla = np.fromiter((bool(r.sla_tags) for r in requests), dtype=bool, count=n)
+    has_dashboards = np.fromiter((bool(r.dashboard_dependencies) for r in requests), dtype=bool, count=n)
+    failure_rate = np.fromiter((r.historical_failure_rate for r in requests), dtype=np.float64, count=n)
+    critical_tags = np.fromiter((len(tags) for tags in matched_tags), dtype=np.float64, count=n)
+
+    # 1. Downstream depth impact (capped at 6.0)
+    risk = np.where(depth > 0, np.minimum(depth * 1.5, 6.0), 0.0)
+    # 2. SLA tags
+    risk += np.where(has_sla, 3.0, 0.0)
+    # 3. Dashboard dependencies
+    risk += np.where(has_dashboards, 2.0, 0.0)
+    # 4. Historical failure rate
+    risk += np.where(failure_rate > 0.05, 1.0, 0.0)
+    # 5. Critical model tags (+0.5 each)
+    risk += critical_tags * 0.5
+
+    # Clamp to [0.0, 10.0]
+    return np.clip(risk, 0.0, 10.0)
@@ -7,11 +7,14 @@ suggestions.  It **never** mutates execution plans.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -20,7 +23,7 @@ from fastapi.responses import JSONResponse
 from ai_engine import __version__
 from ai_engine.config import AISettings, load_ai_settings
 from ai_engine.engines.budget_guard import BudgetGuard
-from ai_engine.engines.cache import ResponseCache
+from ai_engine.engines.cache import ResponseCache, connect_redis_l2
 from ai_engine.engines.cost_predictor import CostPredictor
 from ai_engine.engines.failure_predictor import FailurePredictor
 from ai_engine.engines.fragility_scorer import FragilityScorer
@@ -80,6 +83,19 @@ def _configure_otel(app: FastAPI) -> None:
     logger.info("OpenTelemetry enabled — exporting traces to %s", endpoint)
 
 
+async def _snapshot_predictions(registry: ModelRegistry, interval_seconds: float) -> None:
+    """Periodically persist the registry's prediction buffers.
+
+    The write runs in a worker thread so the event loop is not blocked.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(registry.save_snapshot)
+        except Exception:
+            logger.warning("Prediction snapshot failed", exc_info=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application startup / shutdown lifecycle."""
@@ -95,9 +111,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("LLM model: %s (enabled=%s)", settings.llm_model, settings.llm_enabled)
 
     # --- Initialise response cache ---
+    cache_l2 = None
+    if settings.cache_enabled and settings.cache_redis_url:
+        cache_l2 = await connect_redis_l2(settings.cache_redis_url)
     cache = ResponseCache(
         enabled=settings.cache_enabled,
         max_entries=settings.cache_max_entries,
+        l2=cache_l2,
     )
     cache_router.init_cache(cache)
 
@@ -119,6 +139,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     # --- Initialise shared components ---
     llm_client = LLMClient(settings, budget_guard=budget_guard)
+    app.state.llm_client = llm_client
 
     classifier = SemanticClassifier(
         llm_client=llm_client if llm_client.enabled else None,
@@ -127,8 +148,14 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     semantic_router.init_classifier(classifier, cache=cache)
 
     registry = ModelRegistry(
-        models_dir=Path(__file__).parent / "ml" / "models"
+        models_dir=Path(__file__).parent / "ml" / "models",
+        snapshot_path=settings.prediction_snapshot_path,
     )
+    snapshot_task: asyncio.Task[None] | None = None
+    if settings.prediction_snapshot_path is not None:
+        snapshot_task = asyncio.create_task(
+            _snapshot_predictions(registry, settings.prediction_snapshot_interval)
+        )
     # BL-100: Predictor is constructed here but does NOT load the model file.
     # Loading is deferred to the first predict() call (lazy loading) so that
     # startup / replica scale-up is fast.  The /readiness endpoint returns 503
@@ -170,6 +197,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     yield  # application runs here
 
     logger.info("Shutting down AI Advisory Engine")
+    if snapshot_task is not None:
+        snapshot_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await snapshot_task
+        try:
+            registry.save_snapshot()
+        except Exception:
+            logger.warning("Final prediction snapshot failed", exc_info=True)
+    await llm_client.aclose()
+    await cache.aclose()
 
 
 def create_app() -> FastAPI:
@@ -267,6 +304,14 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=503, detail="Models not yet initialized")
         return {"status": "ready"}
 
+    @app.get("/llm/client-pool/stats", tags=["system"])
+    async def llm_client_pool_stats(request: Request) -> dict[str, Any]:
+        """Return per-tenant LLM client pool hit/miss and connection-reuse counters."""
+        llm_client: LLMClient | None = getattr(request.app.state, "llm_client", None)
+        if llm_client is None:
+            raise HTTPException(status_code=503, detail="LLM client not yet initialized")
+        return llm_client.client_pool_stats
+
     # -- Exception handlers --------------------------------------------------
 
     @app.exception_handler(Exception)
@@ -4,32 +4,39 @@ Provides a ``ModelRegistry`` that:
 - Scans a configurable ``models_dir`` for joblib files following the
   naming convention ``{name}_v{version}.joblib`` (e.g. ``cost_model_v1.2.0.joblib``).
 - Caches loaded models in memory keyed by ``(name, version)``.
-- Records predictions per model (ring buffer, 10 000 entries max) for
-  retrospective drift analysis.
+- Records predictions per model in a columnar ring buffer
+  (:class:`~ai_engine.ml.prediction_buffer.PredictionBuffer`, 10 000
+  entries max) for retrospective drift analysis.
 - Implements Population Stability Index (PSI) drift detection comparing
-  recent predictions against the earliest baseline window.
-
-Thread-safety: uses ``collections.deque`` with ``maxlen`` for the ring
-buffer; all operations are synchronous and GIL-safe.  No additional
-locking is required for asyncio-only callers.
+  recent predictions (and numeric features) against the earliest
+  baseline window, computed directly on the buffer's arrays.
+- Optionally snapshots the prediction buffers to a ``.npz`` file so drift
+  history survives restarts.
+
+Thread-safety: all operations are synchronous.  Buffer appends take a
+short lock so :meth:`ModelRegistry.save_snapshot` may run in a worker
+thread; asyncio-only callers need no additional locking.
 """
 
 from __future__ import annotations
 
 import hashlib
 import hmac as _hmac
-import itertools
 import logging
+import os
 import re
+import threading
 import time
-from collections import deque
+import zipfile
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, NamedTuple, TypedDict
+from typing import Any, NamedTuple
 
 import joblib
 import numpy as np
 
+from ai_engine.ml.prediction_buffer import PredictionBuffer
+
 logger = logging.getLogger(__name__)
 
 # Regex matching the versioned model filename convention.
@@ -182,17 +189,6 @@ class ModelRecord(NamedTuple):
     loaded_at: datetime
 
 
-class PredictionRecord(TypedDict):
-    """One recorded prediction, stored for drift analysis."""
-
-    model_name: str
-    version: str
-    features: dict[str, Any]
-    prediction: Any
-    actual: Any | None  # ground-truth value if already known at record time
-    recorded_at: str  # ISO-8601 timestamp
-
-
 # ---------------------------------------------------------------------------
 # PSI calculation (module-private)
 # ---------------------------------------------------------------------------
@@ -232,6 +228,11 @@ def _compute_psi(expected: np.ndarray, actual: np.ndarray, n_bins: int = 10) ->
     return float(psi)
 
 
+def _finite(values: np.ndarray) -> np.ndarray:
+    """Drop ``NaN`` / infinite entries (non-numeric or missing values)."""
+    return values[np.isfinite(values)]
+
+
 # ---------------------------------------------------------------------------
 # ModelRegistry
 # ---------------------------------------------------------------------------
@@ -252,15 +253,23 @@ class ModelRegistry:
     For example ``cost_model_v1.2.0.joblib``.
     """
 
-    def __init__(self, models_dir: Path | str = "models") -> None:
+    def __init__(
+        self,
+        models_dir: Path | str = "models",
+        snapshot_path: Path | str | None = None,
+    ) -> None:
         """Initialise the registry pointing at *models_dir*.
 
         The directory is created lazily — missing directories produce no
         error at construction time; a ``FileNotFoundError`` is raised
         only when a ``load_model`` call cannot resolve the requested
         model file.
+
+        When *snapshot_path* is given, prediction buffers are restored
+        from it if the file exists, and :meth:`save_snapshot` writes to it.
         """
         self._models_dir = Path(models_dir)
+        self._snapshot_path = Path(snapshot_path) if snapshot_path is not None else None
         # (name, version) -> (model_object, loaded_at: float) — BL-103: TTL eviction
         self._cache: dict[tuple[str, str], tuple[Any, float]] = {}
         # (name, version) -> ModelRecord (metadata)
@@ -269,11 +278,17 @@ class ModelRegistry:
         # Updated on every successful load_model call; used by
         # record_prediction to tag predictions with the correct version.
         self._active_version: dict[str, str] = {}
-        # model_name -> deque[PredictionRecord] (ring buffer)
-        self._predictions: dict[str, deque[PredictionRecord]] = {}
+        # model_name -> columnar ring buffer of recorded predictions
+        self._predictions: dict[str, PredictionBuffer] = {}
         # Track which models have already emitted a buffer-full warning so we
         # log it once, not on every single record_prediction() call.
         self._warned_buffer_full: set[str] = set()
+        # Serialises save_snapshot() so a periodic save in a worker thread
+        # and the shutdown save never write the same temp file at once.
+        self._snapshot_lock = threading.Lock()
+
+        if self._snapshot_path is not None and self._snapshot_path.exists():
+            self._load_snapshot(self._snapshot_path)
 
         logger.info("ModelRegistry initialised (models_dir=%s)", self._models_dir)
 
@@ -379,27 +394,19 @@ class ModelRegistry:
             Ground-truth value if already known; can be filled in later
             for offline accuracy tracking.
 
-        Keeps the last ``10_000`` records per model (ring buffer).
-        This method is synchronous and GIL-safe — safe to call from
-        asyncio code without extra locking.
+        Keeps the last ``10_000`` records per model (ring buffer).  Numeric
+        values are written into preallocated arrays; non-numeric
+        predictions and features are stored as ``NaN`` (see
+        :class:`~ai_engine.ml.prediction_buffer.PredictionBuffer`).
+        This method is synchronous — safe to call from asyncio code
+        without extra locking.
         """
-        if model_name not in self._predictions:
-            self._predictions[model_name] = deque(maxlen=_MAX_PREDICTION_RECORDS)
-
-        # Resolve which version is currently cached for this model name.
-        version = self._current_version(model_name)
-
-        record: PredictionRecord = {
-            "model_name": model_name,
-            "version": version,
-            "features": features,
-            "prediction": prediction,
-            "actual": actual,
-            "recorded_at": datetime.now(tz=UTC).isoformat(),
-        }
+        buf = self._predictions.get(model_name)
+        if buf is None:
+            buf = self._predictions[model_name] = PredictionBuffer(_MAX_PREDICTION_RECORDS)
+
         # BL-091: Warn *once* when the ring buffer first fills up (not on every append).
-        buf = self._predictions[model_name]
-        if len(buf) == buf.maxlen and model_name not in self._warned_buffer_full:
+        if buf.is_full and model_name not in self._warned_buffer_full:
             self._warned_buffer_full.add(model_name)
             logger.warning(
                 "Prediction ring buffer full for model %s — oldest entries will be "
@@ -407,7 +414,8 @@ class ModelRegistry:
                 "_MAX_PREDICTION_RECORDS.",
                 model_name,
             )
-        buf.append(record)
+        # Tag the record with the version currently cached for this model name.
+        buf.append(features, prediction, actual, version=self._current_version(model_name))
 
     # ------------------------------------------------------------------
     # Drift detection
@@ -418,11 +426,12 @@ class ModelRegistry:
 
         Compares the distribution of the most recent 500 predictions
         against the earliest 500 recorded predictions (baseline window).
+        The same comparison is made for every numeric feature column.
 
         PSI thresholds
         --------------
         - ``< 0.1``   → ``"stable"``
-        - ``0.1–0.2`` → ``"warning"``
+        - ``0.1-0.2`` → ``"warning"``
         - ``> 0.2``   → ``"drift"``
 
         Parameters
@@ -434,17 +443,19 @@ class ModelRegistry:
         -------
         dict[str, Any]
             A dict with keys:
-            - ``"model"`` – model name
-            - ``"status"`` – ``"stable"`` | ``"warning"`` | ``"drift"`` |
+            - ``"model"`` - model name
+            - ``"status"`` - ``"stable"`` | ``"warning"`` | ``"drift"`` |
               ``"insufficient_data"``
-            - ``"psi"`` – computed PSI (omitted when ``insufficient_data``)
-            - ``"sample_size"`` – total recorded predictions
-            - ``"message"`` – human-readable description
+            - ``"psi"`` - computed PSI (omitted when ``insufficient_data``)
+            - ``"feature_psi"`` - PSI per numeric feature with values in
+              both windows (omitted when ``insufficient_data``)
+            - ``"sample_size"`` - total recorded predictions
+            - ``"message"`` - human-readable description
         """
-        records = self._predictions.get(model_name)
-        total = len(records) if records else 0
+        buf = self._predictions.get(model_name)
+        total = len(buf) if buf is not None else 0
 
-        if total < _PSI_MIN_RECORDS:
+        if buf is None or total < _PSI_MIN_RECORDS:
             return {
                 "model": model_name,
                 "status": "insufficient_data",
@@ -455,15 +466,11 @@ class ModelRegistry:
                 ),
             }
 
-        # BL-090: avoid materialising the full 10 000-entry deque into a list.
-        # Baseline: first _PSI_WINDOW entries — use islice to read only what we need.
-        baseline_window = list(itertools.islice(records, _PSI_WINDOW))
-        # Recent: last _PSI_WINDOW entries — direct deque index access, then reverse.
-        recent_size = min(_PSI_WINDOW, len(records))
-        recent_window = [records[-(i + 1)] for i in range(recent_size)][::-1]
-
-        baseline_values = self._extract_numeric_predictions(baseline_window)
-        recent_values = self._extract_numeric_predictions(recent_window)
+        # BL-090: read only the two windows — array views into the ring
+        # buffer, never the full 10 000 records.  Non-numeric predictions
+        # were stored as NaN and are dropped here.
+        baseline_values = _finite(buf.head(_PSI_WINDOW))
+        recent_values = _finite(buf.tail(_PSI_WINDOW))
 
         if len(baseline_values) == 0 or len(recent_values) == 0:
             return {
@@ -473,10 +480,14 @@ class ModelRegistry:
                 "message": "Predictions are non-numeric; PSI cannot be computed.",
             }
 
-        psi = _compute_psi(
-            np.array(baseline_values, dtype=np.float64),
-            np.array(recent_values, dtype=np.float64),
-        )
+        psi = _compute_psi(baseline_values, recent_values)
+
+        feature_psi: dict[str, float] = {}
+        for feature in buf.feature_names:
+            baseline_feature = _finite(buf.head(_PSI_WINDOW, feature))
+            recent_feature = _finite(buf.tail(_PSI_WINDOW, feature))
+            if len(baseline_feature) > 0 and len(recent_feature) > 0:
+                feature_psi[feature] = _compute_psi(baseline_feature, recent_feature)
 
         if psi < _PSI_WARN_THRESHOLD:
             status = "stable"
@@ -492,10 +503,46 @@ class ModelRegistry:
             "model": model_name,
             "status": status,
             "psi": psi,
+            "feature_psi": feature_psi,
             "sample_size": total,
             "message": message,
         }
 
+    # ------------------------------------------------------------------
+    # Prediction snapshots
+    # ------------------------------------------------------------------
+
+    def save_snapshot(self) -> Path | None:
+        """Write every prediction buffer to the configured ``.npz`` file.
+
+        The file is replaced atomically, so a crash mid-write leaves the
+        previous snapshot intact.  Safe to call from a worker thread
+        (e.g. via ``asyncio.to_thread``) while predictions are recorded;
+        concurrent saves are serialised.
+
+        Returns
+        -------
+        Path | None
+            The snapshot path, or ``None`` when snapshots are not configured.
+        """
+        if self._snapshot_path is None:
+            return None
+
+        buffers = list(self._predictions.items())
+        arrays: dict[str, np.ndarray] = {"models": np.array([name for name, _ in buffers], dtype=str)}
+        for index, (_, buf) in enumerate(buffers):
+            for key, value in buf.to_arrays().items():
+                arrays[f"m{index}__{key}"] = value
+
+        with self._snapshot_lock:
+            self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._snapshot_path.with_name(self._snapshot_path.name + ".tmp")
+            with tmp_path.open("wb") as fh:
+                np.savez(fh, **arrays)
+            os.replace(tmp_path, self._snapshot_path)
+        logger.debug("Saved prediction snapshot for %d model(s) to %s", len(buffers), self._snapshot_path)
+        return self._snapshot_path
+
     # ------------------------------------------------------------------
     # Version listing
     # ------------------------------------------------------------------
@@ -653,14 +700,23 @@ class ModelRegistry:
         """
         return self._active_version.get(model_name, "unknown")
 
-    @staticmethod
-    def _extract_numeric_predictions(records: list[PredictionRecord]) -> list[float]:
-        """Extract numeric prediction values from a list of records."""
-        values: list[float] = []
-        for rec in records:
-            pred = rec["prediction"]
-            try:
-                values.append(float(pred))
-            except (TypeError, ValueError):
-                pass
-        return values
+    def _load_snapshot(self, path: Path) -> None:
+        """Restore prediction buffers written by :meth:`save_snapshot`.
+
+        A corrupt or incompatible snapshot is logged and ignored; drift
+        history then starts empty, as it would without a snapshot.
+        Loaded without pickle, so the file cannot execute code.
+        """
+        try:
+            with np.load(path, allow_pickle=False) as snapshot:
+                for index, name in enumerate(snapshot["models"].tolist()):
+                    prefix = f"m{index}__"
+                    arrays = {
+                        key[len(prefix):]: snapshot[key] for key in snapshot.files if key.startswith(prefix)
+                    }
+                    self._predictions[name] = PredictionBuffer.from_arrays(_MAX_PREDICTION_RECORDS, arrays)
+        except (OSError, ValueError, KeyError, IndexError, zipfile.BadZipFile):
+            logger.warning("Could not restore prediction snapshot from %s — starting empty", path, exc_info=True)
+            self._predictions.clear()
+            return
+        logger.info("Restored prediction history for %d model(s) from %s", len(self._predictions), path)
@@ -0,0 +1,270 @@
+"""Columnar ring buffer for recorded model predictions.
+
+:class:`~ai_engine.ml.model_registry.ModelRegistry` keeps the most recent
+predictions of every model for drift analysis.  Storing each prediction as
+a dict with a feature dict and an ISO timestamp costs several Python
+objects per record, and every drift check had to pull the numbers back
+out of them.  :class:`PredictionBuffer` instead preallocates one NumPy
+array per column and overwrites the oldest slot once full.
+
+Design notes:
+    * Columns: ``prediction`` and ``actual`` (float64), ``timestamp``
+      (int64 nanoseconds since the Unix epoch, UTC), a version id (int32,
+      interned version strings), and one float64 column per numeric
+      feature.
+    * Missing or non-numeric values are stored as ``NaN``.  Feature keys
+      whose first value is not a number (e.g. ``cluster_size``) get no
+      column.
+    * Feature columns are allocated the first time a key is seen, up to
+      ``_MAX_FEATURE_COLUMNS``; records written earlier read as ``NaN``.
+      After that, appends write into existing slots and allocate nothing.
+    * :meth:`head` / :meth:`tail` return windows in chronological order.
+      They are views into the buffer unless the window wraps around the
+      physical end, and are only valid until the next append.
+    * Appends and snapshot copies take a small ``threading.Lock`` so a
+      snapshot written from a worker thread is never torn.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on feature columns per buffer; further keys are ignored.
+_MAX_FEATURE_COLUMNS = 64
+
+# Built-in column names accepted by head() / tail() / column().
+_PREDICTION = "prediction"
+_ACTUAL = "actual"
+_TIMESTAMP = "timestamp"
+
+
+def _as_float(value: Any) -> float:
+    """Return *value* as a float, or ``NaN`` if it has no numeric value."""
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class PredictionBuffer:
+    """Fixed-capacity, NumPy-backed ring buffer of prediction records.
+
+    Parameters
+    ----------
+    capacity:
+        Number of records kept.  Once full, each append overwrites the
+        oldest record.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._head = 0  # next slot to write
+        self._size = 0
+
+        self._predictions = np.full(capacity, np.nan, dtype=np.float64)
+        self._actuals = np.full(capacity, np.nan, dtype=np.float64)
+        self._timestamps = np.zeros(capacity, dtype=np.int64)
+        self._version_ids = np.zeros(capacity, dtype=np.int32)
+        self._features: dict[str, np.ndarray] = {}
+
+        self._versions: list[str] = []
+        self._version_index: dict[str, int] = {}
+        # Keys refused a column (non-numeric first value or column limit).
+        self._skipped_features: set[str] = set()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def append(
+        self,
+        features: dict[str, Any],
+        prediction: Any,
+        actual: Any | None = None,
+        *,
+        version: str = "unknown",
+        timestamp_ns: int | None = None,
+    ) -> None:
+        """Write one record into the next slot, overwriting the oldest if full."""
+        with self._lock:
+            version_id = self._version_index.get(version)
+            if version_id is None:
+                version_id = self._intern_version(version)
+
+            slot = self._head
+            self._predictions[slot] = _as_float(prediction)
+            self._actuals[slot] = _as_float(actual)
+            self._timestamps[slot] = time.time_ns() if timestamp_ns is None else timestamp_ns
+            self._version_ids[slot] = version_id
+
+            # Every known column is written, so a key missing from this
+            # record cannot leave the overwritten record's value behind.
+            matched = 0
+            for name, column in self._features.items():
+                value = features.get(name)
+                if value is not None:
+                    matched += 1
+                column[slot] = _as_float(value)
+            if matched < len(features):
+                for name, value in features.items():
+                    if value is not None and name not in self._features and name not in self._skipped_features:
+                        new_column = self._add_feature_column(name, value)
+                        if new_column is not None:
+                            new_column[slot] = _as_float(value)
+
+            self._head = (slot + 1) % self._capacity
+            self._size = min(self._size + 1, self._capacity)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of records kept."""
+        return self._capacity
+
+    @property
+    def is_full(self) -> bool:
+        """``True`` once the next append will overwrite the oldest record."""
+        return self._size == self._capacity
+
+    @property
+    def feature_names(self) -> list[str]:
+        """Names of the numeric feature columns, in first-seen order."""
+        return list(self._features)
+
+    @property
+    def versions(self) -> list[str]:
+        """Model versions seen by this buffer; a record's version id indexes this list."""
+        return list(self._versions)
+
+    def head(self, n: int, column: str = _PREDICTION) -> np.ndarray:
+        """Return the oldest *n* values of *column*, oldest first."""
+        return self._window(self._resolve(column), 0, min(n, self._size))
+
+    def tail(self, n: int, column: str = _PREDICTION) -> np.ndarray:
+        """Return the newest *n* values of *column*, oldest first."""
+        count = min(n, self._size)
+        return self._window(self._resolve(column), self._size - count, count)
+
+    def column(self, name: str) -> np.ndarray:
+        """Return every stored value of column *name*, oldest first.
+
+        *name* is ``"prediction"``, ``"actual"``, ``"timestamp"`` or a
+        feature name.
+        """
+        return self._window(self._resolve(name), 0, self._size)
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """Return a chronological copy of every column for persistence.
+
+        Feature values are stacked into one ``(records, features)`` matrix
+        whose column order matches ``feature_names``.
+        """
+        with self._lock:
+            names = list(self._features)
+            features = np.empty((self._size, len(names)), dtype=np.float64)
+            for index, name in enumerate(names):
+                features[:, index] = self._window(self._features[name], 0, self._size)
+            return {
+                "prediction": self._window(self._predictions, 0, self._size).copy(),
+                "actual": self._window(self._actuals, 0, self._size).copy(),
+                "timestamp": self._window(self._timestamps, 0, self._size).copy(),
+                "version_id": self._window(self._version_ids, 0, self._size).copy(),
+                "versions": np.array(self._versions, dtype=str),
+                "feature_names": np.array(names, dtype=str),
+                "features": features,
+            }
+
+    @classmethod
+    def from_arrays(cls, capacity: int, arrays: dict[str, np.ndarray]) -> PredictionBuffer:
+        """Rebuild a buffer from :meth:`to_arrays` output.
+
+        When more records are given than *capacity* allows, only the
+        newest are kept.
+        """
+        buffer = cls(capacity)
+        size = min(len(arrays["prediction"]), capacity)
+        keep = slice(len(arrays["prediction"]) - size, None)
+
+        buffer._predictions[:size] = arrays["prediction"][keep]
+        buffer._actuals[:size] = arrays["actual"][keep]
+        buffer._timestamps[:size] = arrays["timestamp"][keep]
+        buffer._version_ids[:size] = arrays["version_id"][keep]
+        for version in arrays["versions"].tolist():
+            buffer._intern_version(version)
+        for index, name in enumerate(arrays["feature_names"].tolist()[:_MAX_FEATURE_COLUMNS]):
+            column = np.full(capacity, np.nan, dtype=np.float64)
+            column[:size] = arrays["features"][keep, index]
+            buffer._features[name] = column
+
+        buffer._size = size
+        buffer._head = size % capacity
+        return buffer
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _intern_version(self, version: str) -> int:
+        self._version_index[version] = len(self._versions)
+        self._versions.append(version)
+        return self._version_index[version]
+
+    def _add_feature_column(self, name: str, value: Any) -> np.ndarray | None:
+        """Allocate a column for feature *name*, or remember to skip it."""
+        if not isinstance(value, int | float | np.number):
+            self._skipped_features.add(name)
+            return None
+        if len(self._features) >= _MAX_FEATURE_COLUMNS:
+            self._skipped_features.add(name)
+            logger.warning(
+                "Prediction buffer already tracks %d features — ignoring feature %r",
+                _MAX_FEATURE_COLUMNS,
+                name,
+            )
+            return None
+        column = np.full(self._capacity, np.nan, dtype=np.float64)
+        self._features[name] = column
+        return column
+
+    def _resolve(self, name: str) -> np.ndarray:
+        if name == _PREDICTION:
+            return self._predictions
+        if name == _ACTUAL:
+            return self._actuals
+        if name == _TIMESTAMP:
+            return self._timestamps
+        try:
+            return self._features[name]
+        except KeyError:
+            raise KeyError(f"Unknown prediction buffer column {name!r}") from None
+
+    def _window(self, column: np.ndarray, offset: int, count: int) -> np.ndarray:
+        """Return *count* values starting *offset* records after the oldest."""
+        start = (self._head - self._size + offset) % self._capacity
+        end = start + count
+        if end <= self._capacity:
+            return column[start:end]
+        return np.concatenate((column[start:], column[: end - self._capacity]))
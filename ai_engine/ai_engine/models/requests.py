@@ -21,6 +21,7 @@ _MAX_MODELS_IN_DAG: int = 500
 _MAX_TABLE_STATS_BYTES: int = 51_200  # 50 KB
 _MAX_TAG_LIST_LEN: int = 100
 _MAX_DASHBOARD_LIST_LEN: int = 200
+_MAX_BATCH_ITEMS: int = 100
 
 
 # ---------------------------------------------------------------------------
@@ -49,6 +50,15 @@ def _check_dag_size(v: dict[str, list[str]]) -> dict[str, list[str]]:
     return v
 
 
+def _check_batch_size(v: list, field_name: str = "items") -> list:
+    """Raise ``ValueError`` when a batch is empty or has too many items."""
+    if not v:
+        raise ValueError(f"{field_name} must contain at least one item")
+    if len(v) > _MAX_BATCH_ITEMS:
+        raise ValueError(f"{field_name} has {len(v)} entries; maximum is {_MAX_BATCH_ITEMS}")
+    return v
+
+
 def _check_dict_serialised_size(v: dict | None, field_name: str, max_bytes: int) -> dict | None:
     """Raise ``ValueError`` when a dict's JSON representation is too large."""
     if v is None:
@@ -220,6 +230,48 @@ class RiskScoreRequest(BaseModel):
         return v
 
 
+class SemanticClassifyBatchRequest(BaseModel):
+    """Request body for ``POST /semantic_classify/batch``."""
+
+    items: list[SemanticClassifyRequest] = Field(
+        ...,
+        description=f"Changes to classify (at most {_MAX_BATCH_ITEMS}).",
+    )
+
+    @field_validator("items")
+    @classmethod
+    def validate_items(cls, v: list[SemanticClassifyRequest]) -> list[SemanticClassifyRequest]:
+        return _check_batch_size(v)
+
+
+class CostPredictBatchRequest(BaseModel):
+    """Request body for ``POST /predict_cost/batch``."""
+
+    items: list[CostPredictRequest] = Field(
+        ...,
+        description=f"Model runs to predict (at most {_MAX_BATCH_ITEMS}).",
+    )
+
+    @field_validator("items")
+    @classmethod
+    def validate_items(cls, v: list[CostPredictRequest]) -> list[CostPredictRequest]:
+        return _check_batch_size(v)
+
+
+class RiskScoreBatchRequest(BaseModel):
+    """Request body for ``POST /risk_score/batch``."""
+
+    items: list[RiskScoreRequest] = Field(
+        ...,
+        description=f"Model changes to score (at most {_MAX_BATCH_ITEMS}).",
+    )
+
+    @field_validator("items")
+    @classmethod
+    def validate_items(cls, v: list[RiskScoreRequest]) -> list[RiskScoreRequest]:
+        return _check_batch_size(v)
+
+
 class FragilityScoreRequest(BaseModel):
     """Request body for ``POST /fragility_score``."""
 
@@ -68,6 +68,40 @@ class RiskScoreResponse(BaseModel):
     )
 
 
+class BatchItemError(BaseModel):
+    """A batch item that could not be processed."""
+
+    index: int = Field(..., ge=0, description="Position of the item in the request.")
+    error: str = Field(..., description="Why the item failed.")
+
+
+class SemanticClassifyBatchResponse(BaseModel):
+    """Response from ``POST /semantic_classify/batch``."""
+
+    results: list[SemanticClassifyResponse | None] = Field(
+        ..., description="One entry per request item, in order; ``None`` where the item failed."
+    )
+    errors: list[BatchItemError] = Field(default_factory=list, description="Failed items.")
+
+
+class CostPredictBatchResponse(BaseModel):
+    """Response from ``POST /predict_cost/batch``."""
+
+    results: list[CostPredictResponse | None] = Field(
+        ..., description="One entry per request item, in order; ``None`` where the item failed."
+    )
+    errors: list[BatchItemError] = Field(default_factory=list, description="Failed items.")
+
+
+class RiskScoreBatchResponse(BaseModel):
+    """Response from ``POST /risk_score/batch``."""
+
+    results: list[RiskScoreResponse | None] = Field(
+        ..., description="One entry per request item, in order; ``None`` where the item failed."
+    )
+    errors: list[BatchItemError] = Field(default_factory=list, description="Failed items.")
+
+
 class SQLSuggestion(BaseModel):
     """A single SQL optimisation suggestion."""
 
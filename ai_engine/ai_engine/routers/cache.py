@@ -36,7 +36,12 @@ def init_cache(cache: ResponseCache) -> None:
 async def cache_stats(
     cache: Annotated[ResponseCache, Depends(get_cache)],
 ) -> dict[str, Any]:
-    """Return current cache hit/miss statistics and entry count."""
+    """Return current cache hit/miss statistics and entry count.
+
+    ``tiers`` breaks hits, misses and hit rate down for the in-process
+    (``l1``) and shared Redis (``l2``) tiers; ``coalesced`` counts
+    requests that awaited an identical in-flight computation.
+    """
     return cache.stats
 
 
@@ -47,13 +52,14 @@ async def cache_stats(
 async def invalidate_all(
     cache: Annotated[ResponseCache, Depends(get_cache)],
 ) -> dict[str, Any]:
-    """Flush the entire response cache.
+    """Flush the entire response cache, including the shared tier.
 
     Use after cost model retraining or prompt version changes.
     """
     removed = cache.invalidate_all()
-    logger.info("Cache invalidated via API: %d entries removed", removed)
-    return {"removed": removed}
+    removed_shared = await cache.invalidate_shared()
+    logger.info("Cache invalidated via API: %d entries removed (%d shared)", removed, removed_shared)
+    return {"removed": removed, "removed_shared": removed_shared}
 
 
 @router.post(
@@ -70,5 +76,8 @@ async def invalidate_by_type(
     ``optimize_sql``.
     """
     removed = cache.invalidate_by_type(request_type)
-    logger.info("Cache invalidated for type=%s: %d entries removed", request_type, removed)
-    return {"request_type": request_type, "removed": removed}
+    removed_shared = await cache.invalidate_shared(request_type)
+    logger.info(
+        "Cache invalidated for type=%s: %d entries removed (%d shared)", request_type, removed, removed_shared
+    )
+    return {"request_type": request_type, "removed": removed, "removed_shared": removed_shared}
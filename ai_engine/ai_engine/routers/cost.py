@@ -9,8 +9,8 @@ from fastapi import APIRouter, Depends
 
 from ai_engine.engines.cache import ResponseCache
 from ai_engine.engines.cost_predictor import CostPredictor
-from ai_engine.models.requests import CostPredictRequest
-from ai_engine.models.responses import CostPredictResponse
+from ai_engine.models.requests import CostPredictBatchRequest, CostPredictRequest
+from ai_engine.models.responses import BatchItemError, CostPredictBatchResponse, CostPredictResponse
 
 logger = logging.getLogger(__name__)
 
@@ -47,21 +47,74 @@ async def predict_cost(
 
     Advisory only -- does **not** trigger any execution.
     """
-    # Check cache
-    if _cache is not None:
-        cache_key = ResponseCache.make_key(
-            "predict_cost",
-            request.model_dump(mode="json"),
-        )
-        cached = _cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-    logger.info("Predicting cost for model=%s partitions=%d", request.model_name, request.partition_count)
-    result = predictor.predict(request)
-
-    # Store in cache
-    if _cache is not None:
-        _cache.put(cache_key, result, "predict_cost")
-
-    return result
+    return await _predict_cached(request, predictor)
+
+
+@router.post(
+    "/predict_cost/batch",
+    response_model=CostPredictBatchResponse,
+    summary="Predict execution cost for several model runs",
+)
+async def predict_cost_batch(
+    request: CostPredictBatchRequest,
+    predictor: Annotated[CostPredictor, Depends(get_predictor)],
+) -> CostPredictBatchResponse:
+    """Process every item of the batch, returning results in order.
+
+    Items already in the response cache are answered from it; all the
+    misses go to one :meth:`CostPredictor.predict_batch` call.  If that call
+    raises, the misses are retried one at a time, so a failing item
+    yields ``None`` in ``results`` plus an entry in ``errors`` and the rest
+    of the batch is unaffected.
+    """
+    items = request.items
+    keys = [ResponseCache.make_key("predict_cost", item.model_dump(mode="json")) for item in items]
+    results: list[CostPredictResponse | None] = (
+        await _cache.get_many(keys, "predict_cost", response_model=CostPredictResponse)
+        if _cache is not None
+        else [None] * len(items)
+    )
+    errors: list[BatchItemError] = []
+
+    misses = [index for index, result in enumerate(results) if result is None]
+    if misses:
+        logger.info("Predicting cost for %d uncached model run(s) in one batch", len(misses))
+        computed: list[CostPredictResponse | None]
+        try:
+            computed = list(predictor.predict_batch([items[index] for index in misses]))
+        except Exception:
+            logger.warning("Batch predict_cost failed; retrying %d item(s) one at a time", len(misses), exc_info=True)
+            computed = []
+            for index in misses:
+                try:
+                    computed.append(predictor.predict(items[index]))
+                except Exception as exc:
+                    logger.warning("Batch predict_cost item %d failed: %s", index, exc)
+                    computed.append(None)
+                    errors.append(BatchItemError(index=index, error=str(exc) or type(exc).__name__))
+        for index, result in zip(misses, computed, strict=True):
+            results[index] = result
+        if _cache is not None:
+            await _cache.put_many(
+                [(keys[index], result) for index, result in zip(misses, computed, strict=True) if result is not None],
+                "predict_cost",
+            )
+
+    return CostPredictBatchResponse(results=results, errors=errors)
+
+
+async def _predict_cached(request: CostPredictRequest, predictor: CostPredictor) -> CostPredictResponse:
+    """Predict one model run, consulting and filling the response cache."""
+
+    async def _compute() -> CostPredictResponse:
+        logger.info("Predicting cost for model=%s partitions=%d", request.model_name, request.partition_count)
+        return predictor.predict(request)
+
+    if _cache is None:
+        return await _compute()
+
+    cache_key = ResponseCache.make_key(
+        "predict_cost",
+        request.model_dump(mode="json"),
+    )
+    return await _cache.get_or_compute(cache_key, "predict_cost", _compute, response_model=CostPredictResponse)
@@ -48,21 +48,16 @@ async def optimize_sql(
     All suggestions are advisory and **must** be validated before use.
     The engine never mutates execution plans.
     """
-    # Check cache
-    if _cache is not None:
-        cache_key = ResponseCache.make_key(
-            "optimize_sql",
-            request.model_dump(mode="json"),
-        )
-        cached = _cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-    logger.info("Optimising SQL (length=%d)", len(request.sql))
-    result = await optimizer.optimize(request)
-
-    # Store in cache
-    if _cache is not None:
-        _cache.put(cache_key, result, "optimize_sql")
-
-    return result
+
+    async def _compute() -> OptimizeSQLResponse:
+        logger.info("Optimising SQL (length=%d)", len(request.sql))
+        return await optimizer.optimize(request)
+
+    if _cache is None:
+        return await _compute()
+
+    cache_key = ResponseCache.make_key(
+        "optimize_sql",
+        request.model_dump(mode="json"),
+    )
+    return await _cache.get_or_compute(cache_key, "optimize_sql", _compute, response_model=OptimizeSQLResponse)
@@ -9,8 +9,8 @@ from fastapi import APIRouter, Depends
 
 from ai_engine.engines.cache import ResponseCache
 from ai_engine.engines.risk_scorer import RiskScorer
-from ai_engine.models.requests import RiskScoreRequest
-from ai_engine.models.responses import RiskScoreResponse
+from ai_engine.models.requests import RiskScoreBatchRequest, RiskScoreRequest
+from ai_engine.models.responses import BatchItemError, RiskScoreBatchResponse, RiskScoreResponse
 
 logger = logging.getLogger(__name__)
 
@@ -47,21 +47,74 @@ async def risk_score(
 
     Advisory only -- does **not** approve or reject any plan.
     """
-    # Check cache
-    if _cache is not None:
-        cache_key = ResponseCache.make_key(
-            "risk_score",
-            request.model_dump(mode="json"),
-        )
-        cached = _cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-    logger.info("Scoring risk for model=%s downstream_depth=%d", request.model_name, request.downstream_depth)
-    result = scorer.score(request)
-
-    # Store in cache
-    if _cache is not None:
-        _cache.put(cache_key, result, "risk_score")
-
-    return result
+    return await _score_cached(request, scorer)
+
+
+@router.post(
+    "/risk_score/batch",
+    response_model=RiskScoreBatchResponse,
+    summary="Score the risk of several model changes",
+)
+async def risk_score_batch(
+    request: RiskScoreBatchRequest,
+    scorer: Annotated[RiskScorer, Depends(get_scorer)],
+) -> RiskScoreBatchResponse:
+    """Process every item of the batch, returning results in order.
+
+    Items already in the response cache are answered from it; all the
+    misses go to one :meth:`RiskScorer.score_batch` call.  If that call
+    raises, the misses are retried one at a time, so a failing item
+    yields ``None`` in ``results`` plus an entry in ``errors`` and the rest
+    of the batch is unaffected.
+    """
+    items = request.items
+    keys = [ResponseCache.make_key("risk_score", item.model_dump(mode="json")) for item in items]
+    results: list[RiskScoreResponse | None] = (
+        await _cache.get_many(keys, "risk_score", response_model=RiskScoreResponse)
+        if _cache is not None
+        else [None] * len(items)
+    )
+    errors: list[BatchItemError] = []
+
+    misses = [index for index, result in enumerate(results) if result is None]
+    if misses:
+        logger.info("Scoring risk for %d uncached model change(s) in one batch", len(misses))
+        computed: list[RiskScoreResponse | None]
+        try:
+            computed = list(scorer.score_batch([items[index] for index in misses]))
+        except Exception:
+            logger.warning("Batch risk_score failed; retrying %d item(s) one at a time", len(misses), exc_info=True)
+            computed = []
+            for index in misses:
+                try:
+                    computed.append(scorer.score(items[index]))
+                except Exception as exc:
+                    logger.warning("Batch risk_score item %d failed: %s", index, exc)
+                    computed.append(None)
+                    errors.append(BatchItemError(index=index, error=str(exc) or type(exc).__name__))
+        for index, result in zip(misses, computed, strict=True):
+            results[index] = result
+        if _cache is not None:
+            await _cache.put_many(
+                [(keys[index], result) for index, result in zip(misses, computed, strict=True) if result is not None],
+                "risk_score",
+            )
+
+    return RiskScoreBatchResponse(results=results, errors=errors)
+
+
+async def _score_cached(request: RiskScoreRequest, scorer: RiskScorer) -> RiskScoreResponse:
+    """Score one model change, consulting and filling the response cache."""
+
+    async def _compute() -> RiskScoreResponse:
+        logger.info("Scoring risk for model=%s downstream_depth=%d", request.model_name, request.downstream_depth)
+        return scorer.score(request)
+
+    if _cache is None:
+        return await _compute()
+
+    cache_key = ResponseCache.make_key(
+        "risk_score",
+        request.model_dump(mode="json"),
+    )
+    return await _cache.get_or_compute(cache_key, "risk_score", _compute, response_model=RiskScoreResponse)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Annotated
 
@@ -9,8 +10,12 @@ from fastapi import APIRouter, Depends
 
 from ai_engine.engines.cache import ResponseCache
 from ai_engine.engines.semantic_classifier import SemanticClassifier
-from ai_engine.models.requests import SemanticClassifyRequest
-from ai_engine.models.responses import SemanticClassifyResponse
+from ai_engine.models.requests import SemanticClassifyBatchRequest, SemanticClassifyRequest
+from ai_engine.models.responses import (
+    BatchItemError,
+    SemanticClassifyBatchResponse,
+    SemanticClassifyResponse,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +24,9 @@ router = APIRouter(tags=["semantic"])
 _classifier: SemanticClassifier | None = None
 _cache: ResponseCache | None = None
 
+# Classification may call the LLM; cap how many items of one batch do so at once.
+_BATCH_CONCURRENCY = 8
+
 
 def get_classifier() -> SemanticClassifier:
     """Return the module-level classifier instance."""
@@ -48,21 +56,66 @@ async def semantic_classify(
     This endpoint **never** mutates execution plans.  It returns
     classification metadata only.
     """
-    # Check cache
-    if _cache is not None:
-        cache_key = ResponseCache.make_key(
-            "semantic_classify",
-            request.model_dump(mode="json"),
-        )
-        cached = _cache.get(cache_key)
-        if cached is not None:
-            return cached
+    return await _classify_cached(request, classifier)
 
-    logger.info("Classifying change (old_sql length=%d, new_sql length=%d)", len(request.old_sql), len(request.new_sql))
-    result = await classifier.classify(request)
 
-    # Store in cache
-    if _cache is not None:
-        _cache.put(cache_key, result, "semantic_classify")
+@router.post(
+    "/semantic_classify/batch",
+    response_model=SemanticClassifyBatchResponse,
+    summary="Classify several SQL changes in one call",
+)
+async def semantic_classify_batch(
+    request: SemanticClassifyBatchRequest,
+    classifier: Annotated[SemanticClassifier, Depends(get_classifier)],
+) -> SemanticClassifyBatchResponse:
+    """Classify every item of the batch, at most ``_BATCH_CONCURRENCY`` at a time.
 
-    return result
+    A failing item yields ``None`` in ``results`` plus an entry in
+    ``errors``; the rest of the batch is unaffected.
+    """
+    logger.info("Classifying batch of %d change(s)", len(request.items))
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def _one(item: SemanticClassifyRequest) -> SemanticClassifyResponse:
+        async with semaphore:
+            return await _classify_cached(item, classifier)
+
+    outcomes = await asyncio.gather(*(_one(item) for item in request.items), return_exceptions=True)
+    results: list[SemanticClassifyResponse | None] = []
+    errors: list[BatchItemError] = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning("Batch classification item %d failed: %s", index, outcome)
+            results.append(None)
+            errors.append(BatchItemError(index=index, error=str(outcome) or type(outcome).__name__))
+        else:
+            results.append(outcome)
+    return SemanticClassifyBatchResponse(results=results, errors=errors)
+
+
+async def _classify_cached(
+    request: SemanticClassifyRequest,
+    classifier: SemanticClassifier,
+) -> SemanticClassifyResponse:
+    """Classify one change, consulting and filling the response cache.
+
+    Concurrent identical requests share one classification (and so at
+    most one LLM call) through :meth:`ResponseCache.get_or_compute`.
+    """
+
+    async def _compute() -> SemanticClassifyResponse:
+        logger.info(
+            "Classifying change (old_sql length=%d, new_sql length=%d)", len(request.old_sql), len(request.new_sql)
+        )
+        return await classifier.classify(request)
+
+    if _cache is None:
+        return await _compute()
+
+    cache_key = ResponseCache.make_key(
+        "semantic_classify",
+        request.model_dump(mode="json"),
+    )
+    return await _cache.get_or_compute(
+        cache_key, "semantic_classify", _compute, response_model=SemanticClassifyResponse
+    )
@@ -0,0 +1,152 @@
+"""Throughput benchmark for the batch inference paths.
+
+Scores the same inputs once through each engine's single-item method in a
+Python loop and once through its batch method, and reports items per
+second for both.  Timings are printed, not asserted, since wall-clock
+ratios are noisy on shared runners; each test only checks that the batch
+path returns the same results as the loop.
+
+Marked with ``@pytest.mark.inference_benchmark``, which the ai_engine
+pytest configuration deselects by default.  Run it explicitly with::
+
+    pytest -m inference_benchmark -v -s
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+
+from ai_engine.engines.cost_anomaly import CostAnomalyDetector
+from ai_engine.engines.cost_predictor import CostPredictor
+from ai_engine.engines.failure_predictor import FailurePredictor, RunHistory
+from ai_engine.engines.risk_scorer import RiskScorer
+from ai_engine.models.requests import CostPredictRequest, RiskScoreRequest
+
+_ITEMS = 2_000
+_ROUNDS = 3
+
+
+def _best_seconds(fn: Callable[[], Any]) -> tuple[float, Any]:
+    """Return the fastest of ``_ROUNDS`` timed runs of *fn* and its last result."""
+    best = float("inf")
+    result = None
+    for _ in range(_ROUNDS):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _compare(name: str, loop: Callable[[], Any], batch: Callable[[], Any]) -> None:
+    """Time both paths, print throughput, and check they return the same results."""
+    loop_s, expected = _best_seconds(loop)
+    batch_s, actual = _best_seconds(batch)
+    print(f"\n{name}: loop={_ITEMS / loop_s:,.0f}/s  batch={_ITEMS / batch_s:,.0f}/s  speedup={loop_s / batch_s:.1f}x")
+    assert actual == expected
+
+
+def _cost_requests(rng: random.Random) -> list[CostPredictRequest]:
+    return [
+        CostPredictRequest(
+            model_name=f"catalog.schema.model_{i}",
+            partition_count=rng.randint(0, 500),
+            cluster_size=rng.choice(["small", "medium", "large"]),
+            data_volume_bytes=rng.randint(0, 10**12),
+            num_workers=rng.randint(1, 32),
+        )
+        for i in range(_ITEMS)
+    ]
+
+
+@pytest.fixture()
+def trained_cost_predictor(tmp_path) -> CostPredictor:
+    rng = np.random.default_rng(0)
+    features = rng.uniform(0, 50, size=(200, 8))
+    targets = features @ rng.uniform(1, 20, size=8) + 60.0
+    model_path = tmp_path / "cost_model.joblib"
+    joblib.dump(LinearRegression().fit(features, targets), model_path)
+    return CostPredictor(model_path=model_path)
+
+
+@pytest.mark.inference_benchmark
+class TestBatchInferenceThroughput:
+    """Batch methods against a loop over the single-item methods."""
+
+    def test_cost_model_batch_throughput(self, trained_cost_predictor) -> None:
+        requests = _cost_requests(random.Random(1))
+        _compare(
+            "cost (trained model)",
+            lambda: [trained_cost_predictor.predict(r) for r in requests],
+            lambda: trained_cost_predictor.predict_batch(requests),
+        )
+
+    def test_cost_heuristic_batch_throughput(self) -> None:
+        predictor = CostPredictor(model_path=None)
+        requests = _cost_requests(random.Random(2))
+        _compare(
+            "cost (heuristic)",
+            lambda: [predictor.predict(r) for r in requests],
+            lambda: predictor.predict_batch(requests),
+        )
+
+    def test_risk_batch_throughput(self) -> None:
+        scorer = RiskScorer()
+        rng = random.Random(3)
+        requests = [
+            RiskScoreRequest(
+                model_name=f"catalog.schema.model_{i}",
+                downstream_depth=rng.randint(0, 8),
+                sla_tags=rng.sample(["gold", "p1"], rng.randint(0, 2)),
+                model_tags=rng.sample(["critical", "revenue", "pii"], rng.randint(0, 3)),
+                historical_failure_rate=rng.random() * 0.2,
+            )
+            for i in range(_ITEMS)
+        ]
+        _compare(
+            "risk",
+            lambda: [scorer.score(r) for r in requests],
+            lambda: scorer.score_batch(requests),
+        )
+
+    def test_failure_batch_throughput(self) -> None:
+        predictor = FailurePredictor()
+        rng = random.Random(4)
+        histories = [
+            RunHistory(
+                model_name=f"model_{i}",
+                total_runs=100,
+                failed_runs=rng.randint(0, 40),
+                recent_runs=10,
+                recent_failures=rng.randint(0, 10),
+                consecutive_failures=rng.randint(0, 4),
+                avg_runtime_seconds=300.0,
+                runtime_trend=rng.uniform(-0.2, 1.5),
+                hours_since_last_success=rng.uniform(0, 400),
+            )
+            for i in range(_ITEMS)
+        ]
+        _compare(
+            "failure",
+            lambda: sorted(
+                (predictor.predict(h) for h in histories), key=lambda p: p.failure_probability, reverse=True
+            ),
+            lambda: predictor.predict_batch(histories),
+        )
+
+    def test_anomaly_batch_throughput(self) -> None:
+        detector = CostAnomalyDetector()
+        rng = random.Random(5)
+        models = {f"model_{i}": [rng.uniform(5.0, 15.0) for _ in range(30)] for i in range(_ITEMS)}
+        _compare(
+            "anomaly",
+            lambda: {name: detector.detect(name, history) for name, history in models.items()},
+            lambda: {report.model_name: report for report in detector.detect_batch(models)},
+        )
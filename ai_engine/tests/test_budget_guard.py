@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from ai_engine.engines import budget_guard
 from ai_engine.engines.budget_guard import (
     _COST_PER_INPUT_TOKEN,
     _COST_PER_OUTPUT_TOKEN,
     BudgetExceededError,
     BudgetGuard,
+    LLMUsage,
     estimate_call_cost,
+    estimate_prompt_tokens,
 )
+from ai_engine.engines.in_memory_usage_repo import InMemoryLLMUsageRepo
+
+
+@pytest.fixture(autouse=True)
+def _fresh_ledgers():
+    # Settled totals live on the shared per-tenant ledger; a guard kept
+    # alive by a traceback cycle must not leak them into the next test.
+    budget_guard._TENANT_LEDGERS.clear()
 
 # ---------------------------------------------------------------------------
 # estimate_call_cost
@@ -264,6 +276,158 @@ class TestRecordUsage:
         assert call_kwargs["error_type"] == "timeout"
 
 
+# ---------------------------------------------------------------------------
+# BudgetGuard.guard_call
+# ---------------------------------------------------------------------------
+
+
+class TestGuardCall:
+    """Tests for reservation-based budget enforcement."""
+
+    def test_estimate_prompt_tokens(self):
+        assert estimate_prompt_tokens("abcd", "efgh") == 2
+        assert estimate_prompt_tokens("abcde") == 2
+        assert estimate_prompt_tokens() == 0
+
+    @pytest.mark.asyncio
+    async def test_calls_for_one_tenant_run_concurrently(self):
+        guard = BudgetGuard(InMemoryLLMUsageRepo(), tenant_id="gc-concurrent", daily_budget_usd=10.0)
+        release = asyncio.Event()
+        in_flight = 0
+        peak = 0
+
+        async def llm() -> LLMUsage:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+            return LLMUsage(input_tokens=100, output_tokens=10, latency_ms=5)
+
+        tasks = [
+            asyncio.ensure_future(guard.guard_call(llm, call_type="t", model_id="m", max_output_tokens=100))
+            for _ in range(3)
+        ]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert peak == 3
+        release.set()
+        costs = await asyncio.gather(*tasks)
+        assert costs == [estimate_call_cost(100, 10)] * 3
+
+    @pytest.mark.asyncio
+    async def test_in_flight_reservations_block_further_calls(self):
+        # Each call may cost up to $0.015, so two in flight exhaust $0.02.
+        guard = BudgetGuard(InMemoryLLMUsageRepo(), tenant_id="gc-reserve", daily_budget_usd=0.02)
+        release = asyncio.Event()
+
+        async def llm() -> LLMUsage:
+            await release.wait()
+            return LLMUsage(input_tokens=0, output_tokens=10, latency_ms=1)
+
+        first = asyncio.ensure_future(guard.guard_call(llm, call_type="t", model_id="m", max_output_tokens=1000))
+        second = asyncio.ensure_future(guard.guard_call(llm, call_type="t", model_id="m", max_output_tokens=1000))
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        with pytest.raises(BudgetExceededError) as exc_info:
+            await guard.guard_call(llm, call_type="t", model_id="m", max_output_tokens=1000)
+        assert exc_info.value.spent_usd == pytest.approx(0.03)
+
+        release.set()
+        await asyncio.gather(first, second)
+        status = await guard.get_budget_status()
+        assert status["reserved_usd"] == 0.0
+        assert status["daily_spent_usd"] == pytest.approx(2 * estimate_call_cost(0, 10))
+
+    @pytest.mark.asyncio
+    async def test_failed_call_releases_reservation(self):
+        repo = InMemoryLLMUsageRepo()
+        guard = BudgetGuard(repo, tenant_id="gc-failure", daily_budget_usd=1.0)
+
+        async def llm() -> LLMUsage:
+            raise TimeoutError("slow")
+
+        with pytest.raises(TimeoutError):
+            await guard.guard_call(llm, call_type="t", model_id="m", max_output_tokens=4096)
+
+        status = await guard.get_budget_status()
+        assert status["reserved_usd"] == 0.0
+        assert repo.total_records() == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_releases_reservation(self):
+        guard = BudgetGuard(InMemoryLLMUsageRepo(), tenant_id="gc-cancel", daily_budget_usd=1.0)
+
+        async def llm() -> LLMUsage:
+            await asyncio.Event().wait()
+            raise AssertionError("unreachable")
+
+        task = asyncio.ensure_future(guard.guard_call(llm, call_type="t", model_id="m", max_output_tokens=4096))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert (await guard.get_budget_status())["reserved_usd"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_period_cost_is_cached_and_settled_incrementally(self):
+        repo = MagicMock()
+        repo.get_period_cost = AsyncMock(return_value=0.5)
+        repo.record_usage = AsyncMock()
+        guard = BudgetGuard(repo, tenant_id="gc-cache", daily_budget_usd=1.0)
+
+        async def llm() -> LLMUsage:
+            return LLMUsage(input_tokens=0, output_tokens=1000, latency_ms=1)
+
+        for _ in range(3):
+            await guard.guard_call(llm, call_type="t", model_id="m")
+
+        repo.get_period_cost.assert_awaited_once()
+        status = await guard.get_budget_status()
+        assert status["daily_spent_usd"] == pytest.approx(0.5 + 3 * estimate_call_cost(0, 1000))
+
+    @pytest.mark.asyncio
+    async def test_guards_for_one_tenant_share_reservations(self):
+        repo = InMemoryLLMUsageRepo()
+        first = BudgetGuard(repo, tenant_id="gc-shared", daily_budget_usd=0.01)
+        second = BudgetGuard(repo, tenant_id="gc-shared", daily_budget_usd=0.01)
+        release = asyncio.Event()
+
+        async def llm() -> LLMUsage:
+            await release.wait()
+            return LLMUsage(input_tokens=0, output_tokens=1, latency_ms=1)
+
+        task = asyncio.ensure_future(first.guard_call(llm, call_type="t", model_id="m", max_output_tokens=1000))
+        await asyncio.sleep(0)
+        with pytest.raises(BudgetExceededError):
+            await second.check_budget()
+        release.set()
+        await task
+
+    @pytest.mark.asyncio
+    async def test_settled_spend_is_visible_to_other_guards(self):
+        cost = estimate_call_cost(0, 1000)
+        first_repo = MagicMock()
+        first_repo.get_period_cost = AsyncMock(return_value=0.5)
+        first_repo.record_usage = AsyncMock()
+        second_repo = MagicMock()
+        second_repo.get_period_cost = AsyncMock(return_value=0.5)
+        first = BudgetGuard(first_repo, tenant_id="gc-settled", daily_budget_usd=0.5 + cost / 2)
+        second = BudgetGuard(second_repo, tenant_id="gc-settled", daily_budget_usd=0.5 + cost / 2)
+
+        async def llm() -> LLMUsage:
+            return LLMUsage(input_tokens=0, output_tokens=1000, latency_ms=1)
+
+        await first.guard_call(llm, call_type="t", model_id="m")
+
+        # The second guard sees the settled call without re-reading its repo.
+        with pytest.raises(BudgetExceededError) as exc_info:
+            await second.check_budget()
+        assert exc_info.value.spent_usd == pytest.approx(0.5 + cost)
+        second_repo.get_period_cost.assert_not_awaited()
+
+
 # ---------------------------------------------------------------------------
 # BudgetGuard.get_budget_status
 # ---------------------------------------------------------------------------
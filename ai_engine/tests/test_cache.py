@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import fnmatch
 import time
 
+import pytest
+from pydantic import BaseModel
+
 from ai_engine.engines.cache import DEFAULT_TTL, ResponseCache
 
 # ---------------------------------------------------------------------------
@@ -221,6 +226,17 @@ class TestEviction:
         assert cache.get(new_key) == "new"
         assert cache.size <= 3
 
+    def test_get_refreshes_recency(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", "va", "risk_score")
+        cache.put("b", "vb", "risk_score")
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", "vc", "risk_score")
+
+        assert cache.get("a") == "va"
+        assert cache.get("b") is None
+        assert cache.get("c") == "vc"
+
 
 # ---------------------------------------------------------------------------
 # Default TTLs
@@ -246,3 +262,195 @@ class TestDefaultTTL:
         cache = ResponseCache(ttl_overrides={"risk_score": 60})
         assert cache._ttls["risk_score"] == 60
         assert cache._ttls["predict_cost"] == 900  # default unchanged
+
+
+# ---------------------------------------------------------------------------
+# ResponseCache.get_or_compute
+# ---------------------------------------------------------------------------
+
+
+class _Result(BaseModel):
+    score: float
+
+
+class _FakeRedis:
+    """Minimal async stand-in for the redis.asyncio calls the cache makes."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value
+        self.ttls[key] = ex
+
+    async def scan_iter(self, match, count=None):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def delete(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+
+class TestGetOrCompute:
+    """Tests for single-flight computation and the shared tier."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(self):
+        cache = ResponseCache()
+        calls = 0
+        release = asyncio.Event()
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"score": 1.0}
+
+        tasks = [asyncio.ensure_future(cache.get_or_compute("k", "risk_score", compute)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert results == [{"score": 1.0}] * 5
+        assert cache.stats["coalesced"] == 4
+        assert cache.get("k") == {"score": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_waiters_and_is_not_cached(self):
+        cache = ResponseCache()
+        release = asyncio.Event()
+
+        async def boom():
+            await release.wait()
+            raise RuntimeError("engine failed")
+
+        tasks = [asyncio.ensure_future(cache.get_or_compute("k", "risk_score", boom)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(o, RuntimeError) for o in outcomes)
+
+        async def ok():
+            return {"score": 2.0}
+
+        assert await cache.get_or_compute("k", "risk_score", ok) == {"score": 2.0}
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_when_leader_cancelled(self):
+        cache = ResponseCache()
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        async def ok():
+            return {"score": 3.0}
+
+        leader = asyncio.ensure_future(cache.get_or_compute("k", "risk_score", hang))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(cache.get_or_compute("k", "risk_score", ok))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == {"score": 3.0}
+
+    @pytest.mark.asyncio
+    async def test_l2_shared_between_instances(self):
+        redis = _FakeRedis()
+        worker_a = ResponseCache(l2=redis)
+        worker_b = ResponseCache(l2=redis)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            return _Result(score=4.5)
+
+        key = ResponseCache.make_key("risk_score", {"m": "x"})
+        first = await worker_a.get_or_compute(key, "risk_score", compute, response_model=_Result)
+        second = await worker_b.get_or_compute(key, "risk_score", compute, response_model=_Result)
+
+        assert calls == 1
+        assert second == first
+        assert isinstance(second, _Result)
+        assert redis.ttls[f"aicache:risk_score:{key}"] == DEFAULT_TTL["risk_score"]
+        tiers = worker_b.stats["tiers"]
+        assert tiers["l1"]["misses"] == 1
+        assert tiers["l2"]["hits"] == 1
+        assert tiers["l2"]["hit_rate"] == 1.0
+        # Now served from worker B's own L1.
+        assert worker_b.get(key) == first
+
+    @pytest.mark.asyncio
+    async def test_l2_errors_fall_back_to_compute(self):
+        cache = ResponseCache(l2=_FakeRedis(fail=True))
+
+        async def compute():
+            return {"score": 5.0}
+
+        assert await cache.get_or_compute("k", "risk_score", compute) == {"score": 5.0}
+        assert cache.stats["tiers"]["l2"]["errors"] == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_shared_by_type(self):
+        redis = _FakeRedis()
+        cache = ResponseCache(l2=redis)
+
+        async def compute():
+            return {"v": 1}
+
+        await cache.get_or_compute("k1", "risk_score", compute)
+        await cache.get_or_compute("k2", "predict_cost", compute)
+
+        assert await cache.invalidate_shared("risk_score") == 1
+        assert list(redis.data) == ["aicache:predict_cost:k2"]
+        assert await cache.invalidate_shared() == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_computes(self):
+        cache = ResponseCache(enabled=False, l2=_FakeRedis())
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            return {"v": calls}
+
+        await cache.get_or_compute("k", "risk_score", compute)
+        await cache.get_or_compute("k", "risk_score", compute)
+        assert calls == 2
+
+
+class TestGetManyPutMany:
+    """Tests for the batch lookup and store used by batch endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_misses_are_none_and_l2_hits_fill_l1(self):
+        redis = _FakeRedis()
+        writer = ResponseCache(l2=redis)
+        reader = ResponseCache(l2=redis)
+        reader.put("l1", _Result(score=1.0), "risk_score")
+
+        await writer.put_many([("l2", _Result(score=2.0))], "risk_score")
+        values = await reader.get_many(["l1", "l2", "missing"], "risk_score", response_model=_Result)
+
+        assert values == [_Result(score=1.0), _Result(score=2.0), None]
+        assert reader.get("l2") == _Result(score=2.0)
+        assert reader.stats["tiers"]["l2"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_stores_nothing(self):
+        cache = ResponseCache(enabled=False, l2=_FakeRedis())
+        await cache.put_many([("k", {"v": 1})], "risk_score")
+        assert await cache.get_many(["k"], "risk_score") == [None]
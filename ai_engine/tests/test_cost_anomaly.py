@@ -6,6 +6,8 @@ insufficient data handling, and batch sorting.
 
 from __future__ import annotations
 
+import random
+
 import pytest
 from ai_engine.engines.cost_anomaly import AnomalyReport, CostAnomalyDetector
 
@@ -202,6 +204,29 @@ class TestBatchDetection:
             assert a.z_score == b.z_score
 
 
+    def test_batch_matches_single(self, detector: CostAnomalyDetector) -> None:
+        """Grouped NumPy analysis must reproduce detect() for every history."""
+        rng = random.Random(17)
+        models: dict[str, list[float]] = {}
+        for i in range(200):
+            length = rng.choice([2, 5, 14, 30])
+            base = rng.uniform(1.0, 500.0)
+            history = [round(base * rng.uniform(0.8, 1.2), 2) for _ in range(length)]
+            if rng.random() < 0.3:
+                history[-1] = round(history[-1] * rng.choice([0.1, 3.0, 8.0]), 2)
+            models[f"model_{i:03d}"] = history
+        models["flat"] = [10.0] * 6
+        models["empty"] = []
+
+        severity_order = {"critical": 0, "major": 1, "minor": 2, "none": 3}
+        expected = [detector.detect(name, history) for name, history in sorted(models.items())]
+        expected.sort(key=lambda r: (severity_order[r.severity], -abs(r.z_score)))
+        assert detector.detect_batch(models) == expected
+
+    def test_batch_empty(self, detector: CostAnomalyDetector) -> None:
+        assert detector.detect_batch({}) == []
+
+
 # ---------------------------------------------------------------------------
 # Percentile computation
 # ---------------------------------------------------------------------------
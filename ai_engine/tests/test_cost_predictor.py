@@ -7,6 +7,7 @@ cost rate variation, and edge cases (zero partitions, very large volumes).
 
 from __future__ import annotations
 
+import random
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -40,6 +41,21 @@ def _req(
     )
 
 
+def _random_requests(seed: int, count: int) -> list[CostPredictRequest]:
+    """Requests covering every optional-field combination, reproducibly."""
+    rng = random.Random(seed)
+    return [
+        _req(
+            partition_count=rng.randint(0, 500),
+            cluster_size=rng.choice(["small", "medium", "large"]),
+            historical_runtime_avg=rng.choice([None, 0.0, rng.uniform(1.0, 5_000.0)]),
+            data_volume_bytes=rng.choice([None, 0, rng.randint(1, 10**13)]),
+            num_workers=rng.choice([None, 1, rng.randint(2, 64)]),
+        )
+        for _ in range(count)
+    ]
+
+
 # ================================================================== #
 # has_trained_model property
 # ================================================================== #
@@ -223,6 +239,22 @@ class TestTrainedModelPrediction:
         # 30 seconds = 0.5 minutes
         assert result.estimated_runtime_minutes >= 0.5
 
+    def test_batch_matches_single(self, trained_predictor):
+        """One feature-matrix pass yields the same responses as per-item predict()."""
+        requests = _random_requests(seed=7, count=200)
+        batch = trained_predictor.predict_batch(requests)
+        assert batch == [trained_predictor.predict(r) for r in requests]
+
+    def test_batch_records_each_prediction(self, trained_predictor):
+        registry = MagicMock()
+        trained_predictor._registry = registry
+        requests = _random_requests(seed=11, count=5)
+        batch = trained_predictor.predict_batch(requests)
+
+        assert registry.record_prediction.call_count == 5
+        recorded = [c.kwargs["prediction"] for c in registry.record_prediction.call_args_list]
+        assert recorded == [r.estimated_cost_usd for r in batch]
+
     def test_trained_model_uses_medium_rate_for_unknown_cluster(self, trained_predictor):
         """Unknown cluster_size falls back to medium rate."""
         # The pattern validation on cluster_size prevents truly unknown values,
@@ -346,3 +378,35 @@ class TestEdgeCases:
         assert "estimated_runtime_minutes" in data
         assert "estimated_cost_usd" in data
         assert "confidence" in data
+
+
+# ================================================================== #
+# Batch prediction
+# ================================================================== #
+
+
+class TestBatchPrediction:
+    """predict_batch() must agree exactly with predict()."""
+
+    def test_heuristic_batch_matches_single(self):
+        predictor = CostPredictor(model_path=None)
+        requests = _random_requests(seed=3, count=300)
+        assert predictor.predict_batch(requests) == [predictor.predict(r) for r in requests]
+
+    def test_preserves_request_order(self):
+        predictor = CostPredictor(model_path=None)
+        batch = predictor.predict_batch([_req(partition_count=100), _req(partition_count=1)])
+        assert batch[0].estimated_runtime_minutes > batch[1].estimated_runtime_minutes
+
+    def test_confidence_bands_match_single(self):
+        predictor = CostPredictor(model_path=None)
+        requests = [_req(partition_count=n, cluster_size="large") for n in (0, 7, 5_000)]
+        for batched, request in zip(predictor.predict_batch(requests), requests, strict=True):
+            single = predictor.predict(request)
+            assert batched.cost_lower_bound_usd == single.cost_lower_bound_usd
+            assert batched.cost_upper_bound_usd == single.cost_upper_bound_usd
+            assert batched.confidence_label == single.confidence_label == "low"
+
+    def test_empty_batch(self):
+        predictor = CostPredictor(model_path=None)
+        assert predictor.predict_batch([]) == []
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import random
+
 import pytest
 from ai_engine.engines.failure_predictor import (
     FailurePredictor,
@@ -235,6 +237,37 @@ class TestFailurePredictor:
         assert predictions[0].failure_probability >= predictions[1].failure_probability
         assert predictions[1].failure_probability >= predictions[2].failure_probability
 
+    def test_predict_batch_matches_single(self, predictor):
+        """The vectorised batch path must reproduce predict() for every history."""
+        rng = random.Random(13)
+        histories = []
+        for i in range(300):
+            total = rng.choice([0, rng.randint(1, 500)])
+            recent = rng.randint(0, 50)
+            histories.append(
+                RunHistory(
+                    model_name=f"model_{i}",
+                    total_runs=total,
+                    failed_runs=rng.randint(0, total),
+                    recent_runs=recent,
+                    recent_failures=rng.randint(0, recent),
+                    consecutive_failures=rng.choice([0, 0, rng.randint(1, 6)]),
+                    avg_runtime_seconds=rng.choice([0.0, rng.uniform(10, 3_600)]),
+                    recent_avg_runtime_seconds=rng.uniform(10, 3_600),
+                    runtime_trend=rng.uniform(-0.5, 2.0),
+                    avg_shuffle_bytes=rng.choice([0.0, rng.uniform(1e6, 1e11)]),
+                    shuffle_trend=rng.uniform(-0.5, 2.5),
+                    hours_since_last_success=rng.uniform(0, 1_000),
+                    last_error_type=rng.choice([None, "timeout", "Network", "OutOfMemory", "AnalysisException"]),
+                )
+            )
+
+        expected = sorted((predictor.predict(h) for h in histories), key=lambda p: p.failure_probability, reverse=True)
+        assert predictor.predict_batch(histories) == expected
+
+    def test_predict_batch_empty(self, predictor):
+        assert predictor.predict_batch([]) == []
+
     def test_probability_bounded(self, predictor):
         """Probability should always be between 0 and 1."""
         # Extreme case
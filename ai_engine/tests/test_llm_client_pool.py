@@ -0,0 +1,212 @@
+"""Tests for the per-tenant LLM client pool."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+
+from ai_engine.config import AISettings
+from ai_engine.engines import llm_client_pool
+from ai_engine.engines.llm_client import LLMClient
+from ai_engine.engines.llm_client_pool import LLMClientPool
+
+
+class _FakeClient:
+    def __init__(self, api_key: str) -> None:
+        self.api_key = api_key
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+# ---------------------------------------------------------------------------
+# LLMClientPool
+# ---------------------------------------------------------------------------
+
+
+class TestLLMClientPool:
+    """Tests for pooling, eviction and stats."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_for_same_key(self):
+        pool = LLMClientPool(_FakeClient)
+        async with pool.lease("key-a") as first:
+            pass
+        async with pool.lease("key-a") as second:
+            pass
+        async with pool.lease("key-b") as other:
+            pass
+
+        assert first is second
+        assert other is not first
+        stats = pool.stats
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["size"] == 2
+
+    def test_key_is_hashed(self):
+        key = LLMClientPool.make_key("sk-secret")
+        assert len(key) == 64
+        assert "sk-secret" not in key
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_closes_oldest(self):
+        pool = LLMClientPool(_FakeClient, max_clients=2)
+        async with pool.lease("key-a") as a:
+            pass
+        async with pool.lease("key-b") as b:
+            pass
+        async with pool.lease("key-a"):
+            pass
+        async with pool.lease("key-c"):
+            pass
+
+        assert b.closed is True
+        assert a.closed is False
+        assert pool.stats["evictions"] == 1
+        assert pool.stats["size"] == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_clients_are_evicted(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(llm_client_pool.time, "monotonic", lambda: now[0])
+        pool = LLMClientPool(_FakeClient, idle_ttl_seconds=60.0)
+        async with pool.lease("key-a") as a:
+            pass
+
+        now[0] += 61.0
+        async with pool.lease("key-b"):
+            pass
+
+        assert a.closed is True
+        assert pool.stats["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_leased_client_closed_only_after_release(self):
+        pool = LLMClientPool(_FakeClient, max_clients=1)
+        async with pool.lease("key-a") as a:
+            async with pool.lease("key-b"):
+                pass
+            assert a.closed is False
+        assert a.closed is True
+
+    @pytest.mark.asyncio
+    async def test_cancelled_eviction_returns_lease(self):
+        closing = asyncio.Event()
+
+        class _SlowClose(_FakeClient):
+            async def close(self) -> None:
+                closing.set()
+                await asyncio.Event().wait()
+
+        pool = LLMClientPool(_SlowClose, max_clients=1)
+        async with pool.lease("key-a"):
+            pass
+
+        async def _lease_b() -> None:
+            async with pool.lease("key-b"):
+                pass
+
+        task = asyncio.create_task(_lease_b())
+        await closing.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert pool._entries[LLMClientPool.make_key("key-b")].leases == 0
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_everything(self):
+        pool = LLMClientPool(_FakeClient)
+        async with pool.lease("key-a") as a:
+            pass
+        async with pool.lease("key-b") as b:
+            pass
+        await pool.aclose()
+        assert a.closed and b.closed
+        assert pool.stats["size"] == 0
+
+    def test_rejects_empty_pool(self):
+        with pytest.raises(ValueError):
+            LLMClientPool(_FakeClient, max_clients=0)
+
+
+# ---------------------------------------------------------------------------
+# LLMClient against a stub Messages API
+# ---------------------------------------------------------------------------
+
+
+_STUB_RESPONSE = {
+    "id": "msg_stub",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-sonnet-4-5-20250929",
+    "content": [{"type": "text", "text": "ok"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 10, "output_tokens": 2},
+}
+
+
+@pytest.fixture()
+async def stub_llm_api(monkeypatch) -> AsyncIterator[dict[str, int]]:
+    """Serve canned Messages API responses over keep-alive HTTP/1.1."""
+    counts = {"connections": 0, "requests": 0}
+    body = json.dumps(_STUB_RESPONSE).encode()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        counts["connections"] += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode("latin-1").split("\r\n"):
+                    name, _, value = line.partition(":")
+                    if name.lower() == "content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+                counts["requests"] += 1
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                    + f"content-length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", f"http://127.0.0.1:{port}")
+    try:
+        yield counts
+    finally:
+        server.close()
+
+
+class TestLLMClientConnectionReuse:
+    """Tenant-key calls reuse the pooled client's connections."""
+
+    @pytest.mark.asyncio
+    async def test_tenant_key_calls_share_one_connection(self, stub_llm_api):
+        pytest.importorskip("anthropic")
+        client = LLMClient(AISettings(llm_enabled=True, llm_api_key=None))
+        try:
+            for _ in range(3):
+                assert await client._call_llm("system", "user", api_key="tenant-key") == "ok"
+            await client._call_llm("system", "user", api_key="other-tenant-key")
+        finally:
+            await client.aclose()
+
+        assert stub_llm_api["requests"] == 4
+        assert stub_llm_api["connections"] == 2
+        stats = client.client_pool_stats
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["connections_opened"] == 2
+        assert stats["connections_reused"] == 2
@@ -7,6 +7,7 @@ Covers:
 - ModelRegistry.drift_check returns "insufficient_data" when < 100 records.
 - ModelRegistry.drift_check returns "stable" for identical distributions.
 - ModelRegistry.drift_check returns "drift" for very different distributions.
+- ModelRegistry.save_snapshot round-trips prediction history through ``.npz``.
 - ModelRegistry.list_versions returns versions in sorted ascending order.
 - _compute_psi returns 0 for identical distributions.
 - CostPredictor integrates with ModelRegistry (record_prediction called).
@@ -370,6 +371,57 @@ class TestDriftCheck:
         assert result["status"] == "insufficient_data"
 
 
+    def test_feature_psi_flags_shifted_feature(self, registry: ModelRegistry) -> None:
+        """Numeric features get their own PSI; non-numeric features are skipped."""
+        rng = np.random.default_rng(3)
+        for v in rng.normal(0.0, 1.0, size=_PSI_WINDOW):
+            registry.record_prediction("model_feat", {"rows": float(v), "steady": 1.0, "tier": "small"}, 1.0)
+        for v in rng.normal(50.0, 1.0, size=_PSI_WINDOW):
+            registry.record_prediction("model_feat", {"rows": float(v), "steady": 1.0, "tier": "small"}, 1.0)
+        result = registry.drift_check("model_feat")
+        assert set(result["feature_psi"]) == {"rows", "steady"}
+        assert result["feature_psi"]["rows"] > 0.2
+        assert result["feature_psi"]["steady"] < 0.1
+
+
+# ================================================================== #
+# Prediction snapshots
+# ================================================================== #
+
+
+class TestPredictionSnapshots:
+    """Tests for ModelRegistry.save_snapshot and restore on construction."""
+
+    def test_snapshot_disabled_by_default(self, registry: ModelRegistry) -> None:
+        registry.record_prediction("m", {}, 1.0)
+        assert registry.save_snapshot() is None
+
+    def test_history_survives_restart(self, tmp_path: Path) -> None:
+        snapshot = tmp_path / "drift" / "predictions.npz"
+        registry = ModelRegistry(models_dir=tmp_path, snapshot_path=snapshot)
+        rng = np.random.default_rng(9)
+        for v in rng.uniform(1.0, 10.0, size=300):
+            registry.record_prediction("model_a", {"x": float(v)}, float(v))
+        registry.record_prediction("model_b", {}, 5.0)
+        before = registry.drift_check("model_a")
+
+        assert registry.save_snapshot() == snapshot
+        restored = ModelRegistry(models_dir=tmp_path, snapshot_path=snapshot)
+
+        assert restored.drift_check("model_a") == before
+        assert restored.drift_check("model_b")["sample_size"] == 1
+
+    def test_corrupt_snapshot_is_ignored(self, tmp_path: Path) -> None:
+        snapshot = tmp_path / "predictions.npz"
+        snapshot.write_bytes(b"not an npz file")
+        registry = ModelRegistry(models_dir=tmp_path, snapshot_path=snapshot)
+        assert registry.drift_check("model_a")["sample_size"] == 0
+
+        registry.record_prediction("model_a", {}, 1.0)
+        registry.save_snapshot()
+        assert ModelRegistry(models_dir=tmp_path, snapshot_path=snapshot).drift_check("model_a")["sample_size"] == 1
+
+
 # ================================================================== #
 # list_versions
 # ================================================================== #
@@ -0,0 +1,143 @@
+"""Tests for ai_engine.ml.prediction_buffer.PredictionBuffer.
+
+Covers ring-buffer wrap-around, chronological head/tail windows, NaN
+handling for missing and non-numeric values, feature column allocation,
+and the to_arrays/from_arrays snapshot round trip.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from ai_engine.ml import prediction_buffer
+from ai_engine.ml.prediction_buffer import PredictionBuffer
+
+
+def _fill(buffer: PredictionBuffer, values: range) -> None:
+    for v in values:
+        buffer.append({"x": float(v)}, float(v), timestamp_ns=v)
+
+
+class TestRingBuffer:
+    def test_rejects_zero_capacity(self):
+        with pytest.raises(ValueError):
+            PredictionBuffer(0)
+
+    def test_len_caps_at_capacity(self):
+        buffer = PredictionBuffer(5)
+        _fill(buffer, range(3))
+        assert len(buffer) == 3
+        assert not buffer.is_full
+        _fill(buffer, range(3, 12))
+        assert len(buffer) == 5
+        assert buffer.is_full
+
+    def test_windows_are_chronological_after_wrap(self):
+        buffer = PredictionBuffer(5)
+        _fill(buffer, range(8))  # keeps 3..7, physically [5, 6, 7, 3, 4]
+
+        assert buffer.column("prediction").tolist() == [3.0, 4.0, 5.0, 6.0, 7.0]
+        assert buffer.head(3).tolist() == [3.0, 4.0, 5.0]
+        assert buffer.tail(2).tolist() == [6.0, 7.0]
+        assert buffer.tail(3, "x").tolist() == [5.0, 6.0, 7.0]
+        assert buffer.column("timestamp").tolist() == [3, 4, 5, 6, 7]
+
+    def test_window_larger_than_size(self):
+        buffer = PredictionBuffer(10)
+        _fill(buffer, range(4))
+        assert buffer.head(100).tolist() == [0.0, 1.0, 2.0, 3.0]
+        assert buffer.tail(100).tolist() == [0.0, 1.0, 2.0, 3.0]
+
+    def test_unwrapped_window_is_a_view(self):
+        buffer = PredictionBuffer(10)
+        _fill(buffer, range(6))
+        assert np.shares_memory(buffer.head(4), buffer._predictions)
+
+    def test_appends_do_not_reallocate(self):
+        buffer = PredictionBuffer(4)
+        buffer.append({"x": 1.0}, 1.0)
+        columns = (buffer._predictions, buffer._timestamps, buffer._features["x"])
+        _fill(buffer, range(20))
+        after = (buffer._predictions, buffer._timestamps, buffer._features["x"])
+        assert all(a is b for a, b in zip(columns, after, strict=True))
+
+
+class TestValues:
+    def test_non_numeric_prediction_is_nan(self):
+        buffer = PredictionBuffer(4)
+        buffer.append({}, "label_a")
+        buffer.append({}, "2.5")
+        values = buffer.column("prediction")
+        assert math.isnan(values[0])
+        assert values[1] == 2.5
+
+    def test_missing_feature_is_nan_and_does_not_leak_old_values(self):
+        buffer = PredictionBuffer(2)
+        buffer.append({"x": 1.0}, 1.0)
+        buffer.append({"x": 2.0}, 2.0)
+        buffer.append({}, 3.0)  # overwrites the x=1.0 slot
+        assert buffer.column("x")[0] == 2.0
+        assert math.isnan(buffer.column("x")[1])
+
+    def test_late_feature_reads_nan_for_earlier_records(self):
+        buffer = PredictionBuffer(4)
+        buffer.append({}, 1.0)
+        buffer.append({"y": 5}, 2.0)
+        assert buffer.feature_names == ["y"]
+        values = buffer.column("y")
+        assert math.isnan(values[0])
+        assert values[1] == 5.0
+
+    def test_non_numeric_feature_gets_no_column(self):
+        buffer = PredictionBuffer(4)
+        buffer.append({"cluster_size": "medium", "workers": 4}, 1.0)
+        assert buffer.feature_names == ["workers"]
+        with pytest.raises(KeyError):
+            buffer.column("cluster_size")
+
+    def test_feature_column_limit(self, monkeypatch):
+        monkeypatch.setattr(prediction_buffer, "_MAX_FEATURE_COLUMNS", 2)
+        buffer = PredictionBuffer(4)
+        buffer.append({"a": 1, "b": 2, "c": 3}, 1.0)
+        assert buffer.feature_names == ["a", "b"]
+
+    def test_versions_are_interned(self):
+        buffer = PredictionBuffer(4)
+        buffer.append({}, 1.0, version="1.0.0")
+        buffer.append({}, 1.0, version="2.0.0")
+        buffer.append({}, 1.0, version="1.0.0")
+        assert buffer.versions == ["1.0.0", "2.0.0"]
+        assert buffer.to_arrays()["version_id"].tolist() == [0, 1, 0]
+
+
+class TestSnapshotArrays:
+    def test_round_trip(self):
+        buffer = PredictionBuffer(5)
+        for v in range(7):
+            buffer.append({"x": v, "label": "a"}, float(v), actual=v + 0.5, version=f"{v % 2}.0.0", timestamp_ns=v)
+
+        restored = PredictionBuffer.from_arrays(5, buffer.to_arrays())
+
+        assert len(restored) == 5
+        for name in ("prediction", "actual", "timestamp", "x"):
+            assert restored.column(name).tolist() == buffer.column(name).tolist()
+        assert restored.versions == buffer.versions
+
+        restored.append({"x": 99}, 99.0)
+        assert restored.tail(2).tolist() == [6.0, 99.0]
+        assert restored.head(1).tolist() == [3.0]  # 2.0 was the oldest and got overwritten
+
+    def test_restore_into_smaller_capacity_keeps_newest(self):
+        buffer = PredictionBuffer(10)
+        _fill(buffer, range(10))
+        restored = PredictionBuffer.from_arrays(4, buffer.to_arrays())
+        assert restored.column("prediction").tolist() == [6.0, 7.0, 8.0, 9.0]
+        assert restored.is_full
+
+    def test_empty_round_trip(self):
+        restored = PredictionBuffer.from_arrays(3, PredictionBuffer(3).to_arrays())
+        assert len(restored) == 0
+        assert restored.feature_names == []
@@ -9,6 +9,8 @@ and custom threshold configuration.
 
 from __future__ import annotations
 
+import random
+
 import pytest
 from ai_engine.engines.risk_scorer import RiskScorer
 from ai_engine.models.requests import RiskScoreRequest
@@ -435,3 +437,44 @@ class TestCompositeScenarios:
         assert "business_critical" in data
         assert "approval_required" in data
         assert "risk_factors" in data
+
+
+# ================================================================== #
+# Batch scoring
+# ================================================================== #
+
+
+class TestScoreBatch:
+    """score_batch() must agree exactly with score()."""
+
+    def test_batch_matches_single(self):
+        rng = random.Random(5)
+        tag_pool = ["critical", "Production", "revenue", "finance", "pii"]
+        requests = [
+            _req(
+                downstream_depth=rng.randint(0, 10),
+                sla_tags=rng.sample(["gold", "p1"], rng.randint(0, 2)),
+                dashboard_dependencies=rng.sample(["exec", "ops"], rng.randint(0, 2)),
+                model_tags=rng.sample(tag_pool, rng.randint(0, len(tag_pool))),
+                historical_failure_rate=rng.choice([0.0, 0.05, rng.random()]),
+                model_name=f"catalog.schema.model_{i}",
+            )
+            for i in range(300)
+        ]
+        scorer = RiskScorer()
+        assert scorer.score_batch(requests) == [scorer.score(r) for r in requests]
+
+    def test_batch_clamps_and_preserves_order(self):
+        scorer = RiskScorer()
+        maxed = _req(
+            downstream_depth=10,
+            sla_tags=["gold"],
+            dashboard_dependencies=["exec"],
+            model_tags=["critical", "production", "revenue"],
+            historical_failure_rate=0.5,
+        )
+        results = scorer.score_batch([maxed, _req()])
+        assert [r.risk_score for r in results] == [10.0, 0.0]
+
+    def test_empty_batch(self):
+        assert RiskScorer().score_batch([]) == []
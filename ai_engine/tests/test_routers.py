@@ -282,6 +282,7 @@ class TestCacheRoutes:
         assert resp.status_code == 200
         data = resp.json()
         assert isinstance(data, dict)
+        assert set(data["tiers"]) == {"l1", "l2"}
 
     async def test_cache_stats_missing_auth_returns_401(self, client):
         resp = await client.get("/cache/stats")
@@ -402,3 +403,116 @@ class TestFragilityScore:
             headers={"Authorization": "Bearer wrong-secret"},
         )
         assert resp.status_code == 401
+
+
+# ===========================================================================
+# 8. Batch advisory endpoints
+# ===========================================================================
+
+
+class TestBatchEndpoints:
+    async def test_semantic_classify_batch_matches_single(self, client):
+        items = [TestSemanticClassify.VALID_BODY, {"old_sql": "SELECT 1", "new_sql": "SELECT 1"}]
+        resp = await client.post("/semantic_classify/batch", json={"items": items}, headers=_auth())
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["errors"] == []
+        assert len(data["results"]) == 2
+
+        single = await client.post(TestSemanticClassify.ENDPOINT, json=items[0], headers=_auth())
+        assert data["results"][0] == single.json()
+
+    async def test_semantic_classify_batch_isolates_cancelled_item(self, client, monkeypatch):
+        from ai_engine.routers import semantic as semantic_router
+
+        real_classify = semantic_router.get_classifier().classify
+
+        async def _cancelled(request):
+            if request.new_sql == "SELECT 2":
+                raise asyncio.CancelledError
+            return await real_classify(request)
+
+        monkeypatch.setattr(semantic_router.get_classifier(), "classify", _cancelled)
+        monkeypatch.setattr(semantic_router, "_cache", None)
+        items = [TestSemanticClassify.VALID_BODY, {"old_sql": "SELECT 1", "new_sql": "SELECT 2"}]
+        resp = await client.post("/semantic_classify/batch", json={"items": items}, headers=_auth())
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["results"][0] is not None
+        assert data["results"][1] is None
+        assert [e["index"] for e in data["errors"]] == [1]
+
+    async def test_predict_cost_batch_happy_path(self, client):
+        items = [TestPredictCost.VALID_BODY, {**TestPredictCost.VALID_BODY, "model_name": "catalog.schema.other"}]
+        resp = await client.post("/predict_cost/batch", json={"items": items}, headers=_auth())
+        assert resp.status_code == 200
+        results = resp.json()["results"]
+        assert len(results) == 2
+        assert all("estimated_cost_usd" in r for r in results)
+
+    async def test_risk_score_batch_reports_item_failures(self, client, monkeypatch):
+        from ai_engine.routers import risk as risk_router
+
+        scorer = risk_router.get_scorer()
+        real_score, real_score_batch = scorer.score, scorer.score_batch
+
+        def _flaky(request):
+            if request.model_name == "boom":
+                raise RuntimeError("scorer exploded")
+            return real_score(request)
+
+        def _flaky_batch(requests):
+            for request in requests:
+                _flaky(request)
+            return real_score_batch(requests)
+
+        monkeypatch.setattr(scorer, "score", _flaky)
+        monkeypatch.setattr(scorer, "score_batch", _flaky_batch)
+        items = [TestRiskScore.VALID_BODY, {**TestRiskScore.VALID_BODY, "model_name": "boom"}]
+        resp = await client.post("/risk_score/batch", json={"items": items}, headers=_auth())
+        assert resp.status_code == 200
+        data = resp.json()
+        assert "risk_score" in data["results"][0]
+        assert data["results"][1] is None
+        assert data["errors"] == [{"index": 1, "error": "scorer exploded"}]
+
+    async def test_predict_cost_batch_sends_only_cache_misses_in_one_call(self, client, monkeypatch):
+        from ai_engine.routers import cost as cost_router
+
+        predictor = cost_router.get_predictor()
+        cached_body = {**TestPredictCost.VALID_BODY, "model_name": "catalog.schema.cached"}
+        warm = await client.post("/predict_cost", json=cached_body, headers=_auth())
+
+        batches = []
+        real_predict_batch = predictor.predict_batch
+
+        def _spy(requests):
+            batches.append([r.model_name for r in requests])
+            return real_predict_batch(requests)
+
+        monkeypatch.setattr(predictor, "predict_batch", _spy)
+        monkeypatch.setattr(predictor, "predict", lambda request: pytest.fail("single-item predict called"))
+        items = [
+            {**TestPredictCost.VALID_BODY, "model_name": "catalog.schema.a"},
+            cached_body,
+            {**TestPredictCost.VALID_BODY, "model_name": "catalog.schema.b"},
+        ]
+        resp = await client.post("/predict_cost/batch", json={"items": items}, headers=_auth())
+
+        assert resp.status_code == 200
+        assert batches == [["catalog.schema.a", "catalog.schema.b"]]
+        data = resp.json()
+        assert data["errors"] == []
+        assert data["results"][1] == warm.json()
+
+    async def test_empty_or_oversized_batch_returns_422(self, client):
+        resp = await client.post("/risk_score/batch", json={"items": []}, headers=_auth())
+        assert resp.status_code == 422
+        resp = await client.post(
+            "/risk_score/batch", json={"items": [TestRiskScore.VALID_BODY] * 101}, headers=_auth()
+        )
+        assert resp.status_code == 422
+
+    async def test_batch_requires_auth(self, client):
+        resp = await client.post("/predict_cost/batch", json={"items": [TestPredictCost.VALID_BODY]})
+        assert resp.status_code == 401
@@ -149,6 +149,30 @@ class APISettings(BaseSettings):
     db_max_overflow: int = Field(default=10, validation_alias='DB_MAX_OVERFLOW')
     db_pool_timeout: float = Field(default=30.0, validation_alias='DB_POOL_TIMEOUT')
 
+    # Maximum number of plan steps executed concurrently per apply request.
+    # A tenant's ``tenant_config.max_concurrent_steps`` overrides this default.
+    execution_max_concurrency: int = Field(default=8, ge=1)
+
+    # Background plan jobs (``POST /plans/jobs``): process-pool size, the
+    # per-tenant running/queued caps, and how long finished jobs stay pollable.
+    plan_job_workers: int = Field(default=2, ge=1)
+    plan_job_max_running_per_tenant: int = Field(default=1, ge=1)
+    plan_job_max_queued_per_tenant: int = Field(default=20, ge=1)
+    plan_job_retention_seconds: float = Field(default=3600.0, gt=0)
+
+    # How often monthly usage counters are checked against ``usage_events``
+    # to correct drift and clear abandoned quota reservations.
+    quota_reconcile_interval_seconds: float = Field(default=3600.0, gt=0)
+
+    # API key authentication: how long a validated key is trusted before it
+    # is re-checked, and how often buffered ``last_used_at`` values are written.
+    api_key_cache_ttl_seconds: float = Field(default=30.0, gt=0)
+    api_key_last_used_flush_seconds: float = Field(default=30.0, gt=0)
+
+    # Threads reserved for bcrypt and PBKDF2 work, kept apart from the
+    # event loop's default executor.
+    crypto_executor_workers: int = Field(default=4, ge=1)
+
     # Invoice PDF storage path.
     invoice_storage_path: str = "/var/lib/ironlayer/invoices"
 
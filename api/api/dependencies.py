@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from api.config import APISettings
 from api.services.ai_client import AIServiceClient
+from api.services.plan_job_service import PlanJobEngine
 
 logger = logging.getLogger(__name__)
 
@@ -238,6 +239,43 @@ def get_metering_collector(request: Request) -> MeteringCollector:
 
 MeteringDep = Annotated[MeteringCollector, Depends(get_metering_collector)]
 
+# ---------------------------------------------------------------------------
+# Plan job engine (created in lifespan, stored on app.state)
+# ---------------------------------------------------------------------------
+
+
+def init_plan_job_engine(
+    session_factory: async_sessionmaker[AsyncSession],
+    ai_client: AIServiceClient,
+    settings: APISettings,
+    metering: MeteringCollector | None = None,
+) -> PlanJobEngine:
+    """Create :class:`PlanJobEngine`. Caller stores on app.state."""
+    return PlanJobEngine(
+        session_factory,
+        ai_client,
+        settings,
+        metering=metering,
+        max_workers=settings.plan_job_workers,
+        max_running_per_tenant=settings.plan_job_max_running_per_tenant,
+        max_queued_per_tenant=settings.plan_job_max_queued_per_tenant,
+        retention_seconds=settings.plan_job_retention_seconds,
+    )
+
+
+async def dispose_plan_job_engine(engine: PlanJobEngine | None) -> None:
+    """Cancel outstanding plan jobs and shut down the worker pool."""
+    if engine is not None:
+        await engine.close()
+
+
+def get_plan_job_engine(request: Request) -> PlanJobEngine:
+    """Return the :class:`PlanJobEngine` from app.state."""
+    return request.app.state.plan_jobs
+
+
+PlanJobsDep = Annotated[PlanJobEngine, Depends(get_plan_job_engine)]
+
 # ---------------------------------------------------------------------------
 # Tenant / user identity (populated by AuthenticationMiddleware)
 # ---------------------------------------------------------------------------
@@ -18,9 +18,11 @@ from api.dependencies import (
     dispose_ai_client,
     dispose_engine,
     dispose_metering,
+    dispose_plan_job_engine,
     init_ai_client,
     init_engine,
     init_metering,
+    init_plan_job_engine,
 )
 from api.middleware.auth import AuthenticationMiddleware, LicenseMiddleware
 from api.middleware.body_limit import BodyLimitMiddleware
@@ -181,6 +183,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         redis_client = await get_redis_client()
         configure_login_limiter_redis(redis_client)
 
+    # Dedicated thread pool for bcrypt / PBKDF2 so they never block the loop.
+    from core_engine.crypto import configure_crypto_executor
+
+    configure_crypto_executor(settings.crypto_executor_workers)
+
     # Database engine and session factory.
     engine, session_factory = init_engine(settings)
     app.state.engine = engine
@@ -213,6 +220,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.metering = metering
     logger.info("Metering collector initialised")
 
+    # Background plan jobs (process pool is created on first submission).
+    app.state.plan_jobs = init_plan_job_engine(session_factory, ai_client, settings, metering)
+    logger.info("Plan job engine initialised (%d worker(s))", settings.plan_job_workers)
+
+    # Periodic rebuild of the monthly usage counters behind quota checks.
+    from api.services.quota_service import UsageCounterReconciler
+
+    app.state.usage_counter_reconciler = UsageCounterReconciler(
+        session_factory, interval_seconds=settings.quota_reconcile_interval_seconds
+    )
+    await app.state.usage_counter_reconciler.start()
+
     # Token revocation checker (L1 in-process + optional L2 Redis).
     if settings.token_revocation_enabled:
         from api.middleware.auth import init_revocation_checker
@@ -223,6 +242,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             "yes" if settings.redis_url else "no",
         )
 
+    # Cached API key validation with batched last_used_at writes.
+    from api.middleware.auth import init_api_key_auth
+
+    await init_api_key_auth(
+        session_factory,
+        cache_ttl_seconds=settings.api_key_cache_ttl_seconds,
+        last_used_flush_seconds=settings.api_key_last_used_flush_seconds,
+    )
+
     # License manager.
     import os
 
@@ -263,9 +291,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await _rl_backend.stop()
         logger.info("Rate limit backend cleanup task stopped")
 
+    await app.state.usage_counter_reconciler.stop()
+    from api.middleware.auth import close_api_key_auth
+
+    await close_api_key_auth()
+    await dispose_plan_job_engine(app.state.plan_jobs)
+    from api.services.execution_service import close_databricks_executors
+
+    await close_databricks_executors()
     dispose_metering(app.state.metering)
     await dispose_ai_client(app.state.ai_client)
     await dispose_engine(app.state.engine)
+    from core_engine.crypto import shutdown_crypto_executor
+
+    shutdown_crypto_executor()
     if settings.redis_url:
         from api.services.redis_client import close_redis_client
 
@@ -278,25 +317,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 # ---------------------------------------------------------------------------
 
 
-def create_app() -> FastAPI:
-    """Construct and configure the FastAPI application."""
-    settings = load_api_settings()
-
-    _is_dev = settings.platform_env == PlatformEnv.DEV
-    app = FastAPI(
-        title="IronLayer API",
-        description="Control Plane for deterministic SQL transformation orchestration.",
-        version=__version__,
-        lifespan=lifespan,
-        # Disable interactive docs outside dev — OpenAPI schema leaks routes,
-        # parameter names, and response shapes to unauthenticated callers.
-        docs_url="/docs" if _is_dev else None,
-        redoc_url="/redoc" if _is_dev else None,
-        openapi_url="/openapi.json" if _is_dev else None,
-    )
-
-    # -- Middleware (outermost first) ----------------------------------------
+def _add_middleware(app: FastAPI, settings: APISettings) -> None:
+    """Install the HTTP middleware stack on *app*.
 
+    Every layer is a pure ASGI middleware that shares per-request state
+    through :func:`api.middleware.asgi.get_request_context`.  Each
+    ``add_middleware`` call wraps the layers before it, so the last one
+    added runs first.
+    """
     app.add_middleware(PrometheusMiddleware)
     app.add_middleware(BodyLimitMiddleware, max_body_size=settings.max_request_body_size)
     app.add_middleware(
@@ -332,6 +360,26 @@ def create_app() -> FastAPI:
     app.add_middleware(RequestLoggingMiddleware)
     app.add_middleware(MeteringMiddleware)
 
+
+def create_app() -> FastAPI:
+    """Construct and configure the FastAPI application."""
+    settings = load_api_settings()
+
+    _is_dev = settings.platform_env == PlatformEnv.DEV
+    app = FastAPI(
+        title="IronLayer API",
+        description="Control Plane for deterministic SQL transformation orchestration.",
+        version=__version__,
+        lifespan=lifespan,
+        # Disable interactive docs outside dev — OpenAPI schema leaks routes,
+        # parameter names, and response shapes to unauthenticated callers.
+        docs_url="/docs" if _is_dev else None,
+        redoc_url="/redoc" if _is_dev else None,
+        openapi_url="/openapi.json" if _is_dev else None,
+    )
+
+    _add_middleware(app, settings)
+
     # -- Routers -------------------------------------------------------------
 
     # Versioned API routes — all business endpoints live under /api/v1.
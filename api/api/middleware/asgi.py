@@ -0,0 +1,106 @@
+"""Shared plumbing for the pure-ASGI middleware stack.
+
+The API middlewares are plain ASGI callables rather than
+``BaseHTTPMiddleware`` subclasses.  ``BaseHTTPMiddleware`` runs each
+downstream app in a new task, proxies the response body through a memory
+stream, and makes every layer build its own ``Request`` and re-parse the
+headers and cookies.  With ten such layers that overhead dominated small
+JSON endpoints and buffered streaming responses.
+
+Every layer instead calls :func:`get_request_context` to get the one
+:class:`RequestContext` for the request.  The context is created on first
+use and stored on the ASGI scope, and it parses headers, cookies and the
+client address at most once.  Per-request identity (``tenant_id``, ``role``,
+trace IDs, ...) lives in :attr:`RequestContext.state`.  That is the same
+``scope["state"]`` dict that ``request.state`` exposes to route handlers
+and dependencies, so nothing has to be derived twice.
+
+Response headers are added by wrapping ``send`` and editing the
+``http.response.start`` message with :func:`response_headers`.  Short-circuit
+responses are sent with ``await response(scope, receive, send)``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import cookie_parser
+from starlette.types import Message, Scope
+
+_CONTEXT_KEY = "ironlayer.request_context"
+
+
+class RequestContext:
+    """Per-request values shared by every middleware layer.
+
+    Attributes are parsed lazily from the ASGI *scope* and cached, so the
+    first layer that needs the headers or cookies pays for parsing them and
+    every later layer reuses the result.
+    """
+
+    __slots__ = ("_cookies", "_headers", "method", "path", "scope")
+
+    def __init__(self, scope: Scope) -> None:
+        self.scope = scope
+        self.method: str = scope["method"]
+        self.path: str = scope["path"]
+        self._headers: Headers | None = None
+        self._cookies: dict[str, str] | None = None
+
+    @property
+    def headers(self) -> Headers:
+        """Case-insensitive, read-only view of the request headers."""
+        if self._headers is None:
+            self._headers = Headers(scope=self.scope)
+        return self._headers
+
+    @property
+    def cookies(self) -> dict[str, str]:
+        """Request cookies parsed from the ``Cookie`` header."""
+        if self._cookies is None:
+            cookie_header = self.headers.get("cookie")
+            self._cookies = cookie_parser(cookie_header) if cookie_header else {}
+        return self._cookies
+
+    @property
+    def query_string(self) -> str:
+        """The raw query string, decoded as Latin-1 (empty if absent)."""
+        return self.scope.get("query_string", b"").decode("latin-1")
+
+    @property
+    def client_host(self) -> str | None:
+        """The peer IP address, or ``None`` when the server did not supply one."""
+        client = self.scope.get("client")
+        return client[0] if client else None
+
+    @property
+    def app(self) -> Any:
+        """The outermost application (``request.app`` in handlers)."""
+        return self.scope.get("app")
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """Mutable per-request state backing ``request.state``."""
+        return self.scope.setdefault("state", {})
+
+    @property
+    def tenant_id(self) -> str | None:
+        """The authenticated tenant, once :class:`AuthenticationMiddleware` has run."""
+        return self.state.get("tenant_id")
+
+
+def get_request_context(scope: Scope) -> RequestContext:
+    """Return the :class:`RequestContext` for *scope*, creating it on first use."""
+    context = scope.get(_CONTEXT_KEY)
+    if context is None:
+        context = scope[_CONTEXT_KEY] = RequestContext(scope)
+    return context
+
+
+def response_headers(message: Message) -> MutableHeaders:
+    """Return mutable headers for an ``http.response.start`` *message*.
+
+    Changes are written straight back into the message before it is sent.
+    """
+    return MutableHeaders(scope=message)
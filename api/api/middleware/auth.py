@@ -14,17 +14,21 @@ Endpoints explicitly listed in ``_PUBLIC_PATHS`` bypass authentication.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import os
 import secrets
 import time
 from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from api.middleware.asgi import RequestContext, get_request_context
 from api.security import AuthMode, TokenConfig, TokenManager
 
 logger = logging.getLogger(__name__)
@@ -343,6 +347,217 @@ def init_revocation_checker(session_factory: Any, redis_url: str | None = None)
     _check_revocation_batch = _batch_checker
 
 
+# ---------------------------------------------------------------------------
+# API key validation cache and last-used write-behind
+# ---------------------------------------------------------------------------
+
+# Redis marker written when an API key is revoked so that every replica
+# drops its cached validation for that key on the next request.
+_API_KEY_REVOKED_PREFIX = "ironlayer:apikey_revoked:"
+
+
+@dataclass(frozen=True)
+class _APIKeyIdentity:
+    """What a successful API key validation puts on ``request.state``."""
+
+    key_id: str
+    tenant_id: str
+    user_id: str
+    scopes: list[str]
+    role: str
+
+
+class _APIKeyCache:
+    """Short-TTL cache of validated API keys, keyed by the key's SHA-256.
+
+    A hit authenticates the request without touching the database.  Only
+    successful validations are cached, so an unknown key always reaches
+    the database.  Revoking a key evicts it here and, when Redis is
+    configured, marks it revoked for other replicas (see
+    :func:`invalidate_api_key`); otherwise other replicas may accept a
+    revoked key, or a deactivated user's key, for up to ``ttl_seconds``.
+
+    Parameters
+    ----------
+    ttl_seconds:
+        How long a validated key is trusted before it is re-checked.
+    max_entries:
+        Hard cap on cache size to prevent unbounded memory growth.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 10_000) -> None:
+        self._cache: dict[str, tuple[_APIKeyIdentity, float]] = {}
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+
+    def get(self, key_hash: str) -> _APIKeyIdentity | None:
+        """Return the cached identity, or ``None`` on miss/expiry."""
+        entry = self._cache.get(key_hash)
+        if entry is None:
+            return None
+        identity, cached_at = entry
+        if time.monotonic() - cached_at > self._ttl:
+            del self._cache[key_hash]
+            return None
+        return identity
+
+    def set(self, key_hash: str, identity: _APIKeyIdentity) -> None:
+        """Cache a successful validation."""
+        if len(self._cache) >= self._max_entries:
+            self.cleanup()
+            if len(self._cache) >= self._max_entries:
+                self._cache.clear()
+        self._cache[key_hash] = (identity, time.monotonic())
+
+    def invalidate(self, key_id: str) -> None:
+        """Drop every cached validation of the key with ID *key_id*."""
+        stale = [h for h, (identity, _) in self._cache.items() if identity.key_id == key_id]
+        for h in stale:
+            del self._cache[h]
+
+    def cleanup(self) -> None:
+        """Remove all entries whose TTL has expired."""
+        now = time.monotonic()
+        stale = [h for h, (_, t) in self._cache.items() if now - t > self._ttl]
+        for h in stale:
+            del self._cache[h]
+
+
+class _APIKeyUsageBuffer:
+    """Coalesces ``api_keys.last_used_at`` writes into periodic bulk updates.
+
+    Each authenticated request only records ``key_id -> now`` in memory;
+    repeated use of the same key between flushes collapses to one entry.
+    A background task writes the buffer with one ``UPDATE`` per tenant
+    every ``flush_interval_seconds``.  ``last_used_at`` may therefore lag
+    by up to one interval, and a crash loses at most one interval of
+    timestamps.
+
+    Parameters
+    ----------
+    session_factory:
+        Async session factory used for each flush.
+    flush_interval_seconds:
+        Time between flushes.
+    """
+
+    def __init__(self, session_factory: Any, flush_interval_seconds: float = 30.0) -> None:
+        self._session_factory = session_factory
+        self._interval = flush_interval_seconds
+        self._pending: dict[str, tuple[str, datetime]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def record(self, key_id: str, tenant_id: str) -> None:
+        """Note that *key_id* was used just now."""
+        self._pending[key_id] = (tenant_id, datetime.now(UTC))
+
+    async def flush(self) -> int:
+        """Write all buffered timestamps; return the number of keys written."""
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+
+        by_tenant: dict[str, dict[str, datetime]] = {}
+        for key_id, (tenant_id, used_at) in batch.items():
+            by_tenant.setdefault(tenant_id, {})[key_id] = used_at
+
+        from core_engine.state.repository import APIKeyRepository
+
+        try:
+            async with self._session_factory() as session:
+                for tenant_id, last_used in by_tenant.items():
+                    await APIKeyRepository(session, tenant_id=tenant_id).record_last_used(last_used)
+                await session.commit()
+        except Exception:
+            logger.warning("Failed to flush API key last_used_at updates; will retry", exc_info=True)
+            # Requeue, keeping any newer timestamps recorded meanwhile.
+            for key_id, entry in batch.items():
+                self._pending.setdefault(key_id, entry)
+            return 0
+        return len(batch)
+
+    async def start(self) -> None:
+        """Start the periodic flush task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.flush()
+
+
+# Module-level singletons used by AuthenticationMiddleware._authenticate_api_key.
+_api_key_cache = _APIKeyCache()
+_api_key_usage: _APIKeyUsageBuffer | None = None
+
+
+async def init_api_key_auth(
+    session_factory: Any,
+    *,
+    cache_ttl_seconds: float = 30.0,
+    last_used_flush_seconds: float = 30.0,
+) -> None:
+    """Enable cached API key validation with write-behind ``last_used_at``.
+
+    Until this is called, every API-key request validates against the
+    database and updates ``last_used_at`` inline.
+    """
+    global _api_key_cache, _api_key_usage
+    _api_key_cache = _APIKeyCache(ttl_seconds=cache_ttl_seconds)
+    _api_key_usage = _APIKeyUsageBuffer(session_factory, flush_interval_seconds=last_used_flush_seconds)
+    await _api_key_usage.start()
+
+
+async def close_api_key_auth() -> None:
+    """Flush buffered ``last_used_at`` updates on application shutdown."""
+    global _api_key_usage
+    if _api_key_usage is not None:
+        await _api_key_usage.stop()
+        _api_key_usage = None
+
+
+async def invalidate_api_key(key_id: str) -> None:
+    """Drop cached validations of a revoked key on this and other replicas."""
+    _api_key_cache.invalidate(key_id)
+    from api.services.redis_client import get_redis_client
+
+    redis = await get_redis_client()
+    if redis is None:
+        return
+    try:
+        await redis.set(f"{_API_KEY_REVOKED_PREFIX}{key_id}", "1", ex=86400)
+    except Exception:
+        logger.warning("Failed to publish API key revocation for key_id=%s to Redis", key_id, exc_info=True)
+
+
+async def _api_key_revoked_elsewhere(key_id: str) -> bool:
+    """Return ``True`` if Redis holds a revocation marker for *key_id*."""
+    from api.services.redis_client import get_redis_client
+
+    redis = await get_redis_client()
+    if redis is None:
+        return False
+    try:
+        return await redis.get(f"{_API_KEY_REVOKED_PREFIX}{key_id}") is not None
+    except Exception:
+        # Redis outage: re-validate against the database instead of
+        # trusting a cache entry we cannot cross-check.
+        logger.warning("API key revocation Redis GET failed for key_id=%s", key_id, exc_info=True)
+        return True
+
+
 # Paths that do not require authentication.
 # OpenAPI docs paths (/docs, /redoc, /openapi.json) are only included when
 # running in development mode — in staging/production the FastAPI application
@@ -460,8 +675,8 @@ def _is_public_path(path: str) -> bool:
     return any(path.startswith(prefix) for prefix in _PUBLIC_PREFIXES)
 
 
-class AuthenticationMiddleware(BaseHTTPMiddleware):
-    """Starlette middleware that enforces Bearer token authentication.
+class AuthenticationMiddleware:
+    """ASGI middleware that enforces Bearer token authentication.
 
     On each request the middleware:
 
@@ -472,16 +687,16 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
     5. Returns a 401/403 JSON response on failure.
     """
 
-    def __init__(self, app: Any) -> None:
-        super().__init__(app)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
         self._token_manager: TokenManager | None = None
         self._auth_mode: AuthMode | None = None
 
-    def _ensure_token_manager(self, request: Request) -> None:
+    def _ensure_token_manager(self, ctx: RequestContext) -> None:
         """Build token manager from app.state.settings on first request."""
         if self._token_manager is not None:
             return
-        settings = getattr(request.app.state, "settings", None)
+        settings = getattr(ctx.app.state, "settings", None)
         if settings is None:
             raise RuntimeError("app.state.settings not set; ensure lifespan has run")
         config = _build_token_config_from_settings(settings)
@@ -510,17 +725,32 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             return None  # Pydantic v1 or missing model_dump
         return None
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        path = request.url.path
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        ctx = get_request_context(scope)
 
         # Allow public endpoints through without authentication.
-        if _is_public_path(path):
-            return await call_next(request)
+        if not _is_public_path(ctx.path):
+            response = await self._authenticate(ctx)
+            if response is not None:
+                await response(scope, receive, send)
+                return
 
-        self._ensure_token_manager(request)
+        await self.app(scope, receive, send)
+
+    async def _authenticate(self, ctx: RequestContext) -> Response | None:
+        """Authenticate the request and populate ``request.state``.
+
+        Returns ``None`` when the request may proceed, or the error
+        response to send instead.
+        """
+        self._ensure_token_manager(ctx)
 
         # Extract the Authorization header.
-        auth_header = request.headers.get("authorization")
+        auth_header = ctx.headers.get("authorization")
         if not auth_header:
             return JSONResponse(
                 status_code=401,
@@ -541,7 +771,7 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
 
         # --- API Key authentication (bmkey. prefix) -----------------------
         if token.startswith("bmkey."):
-            return await self._authenticate_api_key(request, call_next, token)
+            return await self._authenticate_api_key(ctx, token)
 
         # --- JWT / HMAC token authentication ------------------------------
         if self._token_manager is None:
@@ -561,7 +791,7 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             # Log the specific reason server-side only for debugging.
             logger.info(
                 "Token validation failed for %s: %s",
-                request.url.path,
+                ctx.path,
                 exc,
             )
             return JSONResponse(
@@ -584,13 +814,14 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
                 )
 
         # Populate request.state for downstream dependencies and handlers.
-        request.state.tenant_id = claims.tenant_id
-        request.state.sub = claims.sub
-        request.state.scopes = claims.scopes
+        state = ctx.state
+        state["tenant_id"] = claims.tenant_id
+        state["sub"] = claims.sub
+        state["scopes"] = claims.scopes
 
         # Identity kind (user vs service account).
         identity_kind = getattr(claims, "identity_kind", "user")
-        request.state.identity_kind = identity_kind
+        state["identity_kind"] = identity_kind
 
         # Extract the role claim for RBAC enforcement.  The claim may be
         # present as a top-level field on TokenClaims or as an extra field
@@ -617,72 +848,89 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             )
             role_value = "viewer"
 
-        request.state.role = role_value
-
-        return await call_next(request)
+        state["role"] = role_value
+        return None
 
-    async def _authenticate_api_key(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-        api_key: str,
-    ) -> Response:
+    async def _authenticate_api_key(self, ctx: RequestContext, api_key: str) -> Response | None:
         """Validate an API key (``bmkey.`` prefix) and populate request.state.
 
         API keys are validated via the :class:`APIKeyRepository` which checks
-        the SHA-256 hash, expiration, and revocation status.
+        the SHA-256 hash, expiration, and revocation status.  Once
+        :func:`init_api_key_auth` has run, successful validations are cached
+        for a short TTL and ``last_used_at`` is written behind in batches,
+        so repeat requests with the same key need no database access.
         """
-        session_factory = getattr(request.app.state, "session_factory", None)
-        if session_factory is None:
-            logger.error("Cannot validate API key: database not initialised")
-            return JSONResponse(
-                status_code=503,
-                content={"detail": "Service unavailable"},
-            )
+        key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+        identity = _api_key_cache.get(key_hash) if _api_key_usage is not None else None
+        if identity is not None and await _api_key_revoked_elsewhere(identity.key_id):
+            _api_key_cache.invalidate(identity.key_id)
+            identity = None
+
+        if identity is None:
+            session_factory = getattr(ctx.app.state, "session_factory", None)
+            if session_factory is None:
+                logger.error("Cannot validate API key: database not initialised")
+                return JSONResponse(
+                    status_code=503,
+                    content={"detail": "Service unavailable"},
+                )
 
-        try:
-            async with session_factory() as session:
-                from core_engine.state.repository import APIKeyRepository, UserRepository
+            try:
+                async with session_factory() as session:
+                    from core_engine.state.repository import APIKeyRepository, UserRepository
 
-                repo = APIKeyRepository(session)
-                key_row = await repo.validate_key(api_key)
+                    repo = APIKeyRepository(session)
+                    key_row = await repo.validate_key(api_key, touch=_api_key_usage is None)
 
-                if key_row is None:
-                    return JSONResponse(
-                        status_code=401,
-                        content={"detail": "Invalid or expired API key"},
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
+                    if key_row is None:
+                        return JSONResponse(
+                            status_code=401,
+                            content={"detail": "Invalid or expired API key"},
+                            headers={"WWW-Authenticate": "Bearer"},
+                        )
+
+                    # Look up the owning user to get their role.
+                    user_repo = UserRepository(session, tenant_id=key_row.tenant_id)
+                    user = await user_repo.get_by_id(key_row.user_id)
 
-                # Look up the owning user to get their role.
-                user_repo = UserRepository(session, tenant_id=key_row.tenant_id)
-                user = await user_repo.get_by_id(key_row.user_id)
+                    if user is None or not user.is_active:
+                        return JSONResponse(
+                            status_code=401,
+                            content={"detail": "Invalid or expired API key"},
+                            headers={"WWW-Authenticate": "Bearer"},
+                        )
 
-                if user is None or not user.is_active:
-                    return JSONResponse(
-                        status_code=401,
-                        content={"detail": "Invalid or expired API key"},
-                        headers={"WWW-Authenticate": "Bearer"},
+                    identity = _APIKeyIdentity(
+                        key_id=key_row.id,
+                        tenant_id=key_row.tenant_id,
+                        user_id=key_row.user_id,
+                        scopes=key_row.scopes or ["read", "write"],
+                        role=user.role,
                     )
+                    await session.commit()
 
-                # Populate request.state.
-                request.state.tenant_id = key_row.tenant_id
-                request.state.sub = key_row.user_id
-                request.state.scopes = key_row.scopes or ["read", "write"]
-                request.state.identity_kind = "service"
-                request.state.role = user.role
+            except Exception:  # Intentional: do not leak DB/session errors; return 401
+                logger.warning("API key validation failed", exc_info=True)
+                return JSONResponse(
+                    status_code=401,
+                    content={"detail": "API key validation failed"},
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
 
-                await session.commit()
+            if _api_key_usage is not None:
+                _api_key_cache.set(key_hash, identity)
 
-        except Exception:  # Intentional: do not leak DB/session errors; return 401
-            logger.warning("API key validation failed", exc_info=True)
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "API key validation failed"},
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        if _api_key_usage is not None:
+            _api_key_usage.record(identity.key_id, identity.tenant_id)
 
-        return await call_next(request)
+        # Populate request.state.
+        state = ctx.state
+        state["tenant_id"] = identity.tenant_id
+        state["sub"] = identity.user_id
+        state["scopes"] = list(identity.scopes)
+        state["identity_kind"] = "service"
+        state["role"] = identity.role
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -737,18 +985,22 @@ _GATED_ENDPOINTS: dict[str, str] = {
 }
 
 
-class LicenseMiddleware(BaseHTTPMiddleware):
+class LicenseMiddleware:
     """Enforce license-tier feature gating on API endpoints.
 
     Returns HTTP 402 (Payment Required) when an endpoint requires a
     feature that is not available at the current license tier.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if _license_manager is None:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if _license_manager is None or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        path = request.url.path
+        path = get_request_context(scope).path
 
         for prefix, feature_name in _GATED_ENDPOINTS.items():
             if path.startswith(prefix):
@@ -760,7 +1012,7 @@ class LicenseMiddleware(BaseHTTPMiddleware):
                     break
 
                 if not _license_manager.check_entitlement(feature):
-                    return JSONResponse(
+                    response = JSONResponse(
                         status_code=402,
                         content={
                             "detail": (
@@ -769,6 +1021,8 @@ class LicenseMiddleware(BaseHTTPMiddleware):
                             ),
                         },
                     )
+                    await response(scope, receive, send)
+                    return
                 break
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
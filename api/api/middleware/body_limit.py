@@ -16,53 +16,66 @@ from __future__ import annotations
 import logging
 
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.middleware.asgi import get_request_context
 
 logger = logging.getLogger(__name__)
 
 
-class BodyLimitMiddleware(BaseHTTPMiddleware):
+class BodyLimitMiddleware:
     """Reject requests whose body exceeds *max_body_size* bytes."""
 
     def __init__(self, app: ASGIApp, *, max_body_size: int = 1_048_576) -> None:
-        super().__init__(app)
+        self.app = app
         self._max_size = max_body_size
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    def _too_large(self) -> JSONResponse:
+        return JSONResponse(
+            {"detail": f"Request body too large. Maximum: {self._max_size} bytes"},
+            status_code=413,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        ctx = get_request_context(scope)
+
         # Layer 1: fast Content-Length check.
-        content_length = request.headers.get("content-length")
+        content_length = ctx.headers.get("content-length")
         if content_length is not None:
             try:
                 length = int(content_length)
             except (ValueError, OverflowError):
-                return JSONResponse(
+                response = JSONResponse(
                     {"detail": "Invalid Content-Length header"},
                     status_code=400,
                 )
+                await response(scope, receive, send)
+                return
             if length > self._max_size:
                 logger.warning(
                     "Rejected request to %s: Content-Length %d exceeds limit %d",
-                    request.url.path,
+                    ctx.path,
                     length,
                     self._max_size,
                 )
-                return JSONResponse(
-                    {"detail": f"Request body too large. Maximum: {self._max_size} bytes"},
-                    status_code=413,
-                )
+                await self._too_large()(scope, receive, send)
+                return
 
-        # Layer 2: streaming byte counter for chunked requests.
+        # Layer 2: streaming byte counter for chunked requests.  Once the
+        # limit is crossed the body is truncated, and whatever the app then
+        # tries to send is replaced by a 413.
         bytes_received = 0
         max_size = self._max_size
-        original_receive = request.receive
         exceeded = False
+        rejected = False
 
-        async def _counting_receive():
+        async def counting_receive() -> Message:
             nonlocal bytes_received, exceeded
-            message = await original_receive()
+            message = await receive()
             if message.get("type") == "http.request":
                 body = message.get("body", b"")
                 bytes_received += len(body)
@@ -70,20 +83,21 @@ class BodyLimitMiddleware(BaseHTTPMiddleware):
                     exceeded = True
                     logger.warning(
                         "Rejected chunked request to %s: streamed %d bytes exceeds limit %d",
-                        request.url.path,
+                        ctx.path,
                         bytes_received,
                         max_size,
                     )
                     return {"type": "http.request", "body": b"", "more_body": False}
             return message
 
-        request._receive = _counting_receive
-        response = await call_next(request)
-
-        if exceeded:
-            return JSONResponse(
-                {"detail": f"Request body too large. Maximum: {self._max_size} bytes"},
-                status_code=413,
-            )
+        async def guarded_send(message: Message) -> None:
+            nonlocal rejected
+            if rejected:
+                return
+            if exceeded and message["type"] == "http.response.start":
+                rejected = True
+                await self._too_large()(scope, receive, send)
+                return
+            await send(message)
 
-        return response
+        await self.app(scope, counting_receive, guarded_send)
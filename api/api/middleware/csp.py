@@ -5,9 +5,9 @@ from __future__ import annotations
 import logging
 import os
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.middleware.asgi import response_headers
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +28,11 @@ _DEFAULT_CSP = (
 )
 
 
-class ContentSecurityPolicyMiddleware(BaseHTTPMiddleware):
+class ContentSecurityPolicyMiddleware:
     """Adds Content-Security-Policy and other security headers to responses."""
 
-    def __init__(self, app, *, csp_policy: str | None = None, api_url: str | None = None) -> None:
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, *, csp_policy: str | None = None, api_url: str | None = None) -> None:
+        self.app = app
         policy = csp_policy or _DEFAULT_CSP
         if api_url:
             policy += f"; connect-src 'self' {api_url}"
@@ -50,14 +50,27 @@ class ContentSecurityPolicyMiddleware(BaseHTTPMiddleware):
         if self._add_hsts:
             self._csp += "; upgrade-insecure-requests"
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        response = await call_next(request)
-        response.headers["Content-Security-Policy"] = self._csp
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
+        self._headers: list[tuple[str, str]] = [
+            ("Content-Security-Policy", self._csp),
+            ("X-Content-Type-Options", "nosniff"),
+            ("X-Frame-Options", "DENY"),
+            ("Referrer-Policy", "strict-origin-when-cross-origin"),
+            ("Permissions-Policy", "camera=(), microphone=(), geolocation=()"),
+        ]
         # BL-079: Add HSTS in non-dev environments to prevent SSL-stripping attacks.
         if self._add_hsts:
-            response.headers["Strict-Transport-Security"] = _HSTS_VALUE
-        return response
+            self._headers.append(("Strict-Transport-Security", _HSTS_VALUE))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = response_headers(message)
+                for name, value in self._headers:
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
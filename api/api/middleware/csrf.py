@@ -16,12 +16,14 @@ defence-in-depth, but the double-submit check remains as a second layer.
 
 from __future__ import annotations
 
+import http.cookies
 import logging
 import secrets
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.middleware.asgi import get_request_context, response_headers
 
 logger = logging.getLogger(__name__)
 
@@ -31,61 +33,92 @@ _CSRF_HEADER = "X-CSRF-Token"
 _CSRF_COOKIE_MAX_AGE = 7 * 24 * 3600  # 7 days, matches refresh token
 
 
-class CSRFMiddleware(BaseHTTPMiddleware):
+def _csrf_cookie_header(csrf_token: str) -> str:
+    """Build the ``Set-Cookie`` value for a fresh CSRF token.
+
+    Matches what ``Response.set_cookie`` emits for the same attributes.
+    The cookie is deliberately **not** HttpOnly: JavaScript must be able
+    to read it and echo it back in the ``X-CSRF-Token`` header.
+    """
+    cookie: http.cookies.BaseCookie[str] = http.cookies.SimpleCookie()
+    cookie[_CSRF_COOKIE] = csrf_token
+    cookie[_CSRF_COOKIE]["max-age"] = _CSRF_COOKIE_MAX_AGE
+    cookie[_CSRF_COOKIE]["path"] = "/"
+    cookie[_CSRF_COOKIE]["secure"] = True
+    cookie[_CSRF_COOKIE]["samesite"] = "strict"
+    return cookie.output(header="").strip()
+
+
+class CSRFMiddleware:
     """Validates that state-changing requests include a valid CSRF token.
 
     The token is validated using :func:`secrets.compare_digest` to prevent
     timing side-channel attacks.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        ctx = get_request_context(scope)
+        cookies = ctx.cookies
+
         # Safe methods do not need CSRF protection.
-        if request.method in _SAFE_METHODS:
-            response = await call_next(request)
+        if ctx.method in _SAFE_METHODS:
+            if _CSRF_COOKIE in cookies:
+                await self.app(scope, receive, send)
+                return
+
             # Ensure the CSRF cookie exists (set on first GET so JS can read it).
-            if _CSRF_COOKIE not in request.cookies:
-                csrf_token = secrets.token_hex(32)
-                response.set_cookie(
-                    key=_CSRF_COOKIE,
-                    value=csrf_token,
-                    httponly=False,  # JavaScript must be able to read this.
-                    secure=True,
-                    samesite="strict",
-                    max_age=_CSRF_COOKIE_MAX_AGE,
-                    path="/",
-                )
-            return response
+            set_cookie = _csrf_cookie_header(secrets.token_hex(32))
+
+            async def send_with_cookie(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    response_headers(message).append("set-cookie", set_cookie)
+                await send(message)
+
+            await self.app(scope, receive, send_with_cookie)
+            return
 
         # State-changing methods: validate CSRF token.
-        cookie_token = request.cookies.get(_CSRF_COOKIE, "")
-        header_token = request.headers.get(_CSRF_HEADER, "")
+        cookie_token = cookies.get(_CSRF_COOKIE, "")
+        header_token = ctx.headers.get(_CSRF_HEADER, "")
 
         # Only enforce on endpoints that use cookie-based auth.
         # API-key / Bearer-only requests don't carry a refresh_token cookie
         # and therefore aren't susceptible to CSRF.
-        if "refresh_token" not in request.cookies:
-            return await call_next(request)
+        if "refresh_token" not in cookies:
+            await self.app(scope, receive, send)
+            return
 
         if not cookie_token or not header_token:
             logger.warning(
                 "CSRF token missing on cookie-authenticated request: %s %s",
-                request.method,
-                request.url.path,
+                ctx.method,
+                ctx.path,
             )
-            return JSONResponse(
+            response = JSONResponse(
                 {"detail": "CSRF token required"},
                 status_code=403,
             )
+            await response(scope, receive, send)
+            return
 
         if not secrets.compare_digest(cookie_token, header_token):
             logger.warning(
                 "CSRF token mismatch: %s %s",
-                request.method,
-                request.url.path,
+                ctx.method,
+                ctx.path,
             )
-            return JSONResponse(
+            response = JSONResponse(
                 {"detail": "CSRF token mismatch"},
                 status_code=403,
             )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -7,9 +7,10 @@ import time
 import uuid
 from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.middleware.asgi import get_request_context, response_headers
 
 logger = logging.getLogger("api.access")
 
@@ -20,10 +21,10 @@ _MASK: str = "***"
 _CORRELATION_HEADER: str = "X-Correlation-ID"
 
 
-def _safe_headers(request: Request) -> dict[str, str]:
+def _safe_headers(headers: Headers) -> dict[str, str]:
     """Return a copy of the request headers with sensitive values masked."""
     out: dict[str, str] = {}
-    for key, value in request.headers.items():
+    for key, value in headers.items():
         if key.lower() in _SENSITIVE_HEADERS:
             out[key] = _MASK
         else:
@@ -31,7 +32,7 @@ def _safe_headers(request: Request) -> dict[str, str]:
     return out
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """Log every request with method, path, status code, and duration.
 
     Each request is tagged with a ``correlation_id`` (taken from the
@@ -45,47 +46,60 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     individual fields without regex parsing.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        ctx = get_request_context(scope)
+
         # Derive or generate a correlation ID for this request.
-        correlation_id = request.headers.get(
-            _CORRELATION_HEADER.lower(),
-            request.headers.get(_CORRELATION_HEADER, ""),
-        )
+        correlation_id = ctx.headers.get(_CORRELATION_HEADER, "")
         if not correlation_id:
             correlation_id = str(uuid.uuid4())
 
+        status_code = 500
+
+        async def send_with_correlation(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Attach the correlation ID to the response for tracing.
+                response_headers(message)[_CORRELATION_HEADER] = correlation_id
+            await send(message)
+
         start = time.monotonic()
-        response: Response | None = None
         try:
-            response = await call_next(request)
-            # Attach the correlation ID to the response for tracing.
-            response.headers[_CORRELATION_HEADER] = correlation_id
-            return response
+            await self.app(scope, receive, send_with_correlation)
         finally:
             duration_ms = round((time.monotonic() - start) * 1000, 2)
-            status_code = response.status_code if response is not None else 500
 
             # Extract tenant_id from request.state if the auth middleware
             # has already populated it; fall back to "anonymous".
-            tenant_id = getattr(request.state, "tenant_id", "anonymous")
+            state = ctx.state
+            tenant_id = state.get("tenant_id", "anonymous")
 
             # Include trace context if the TraceContextMiddleware populated it.
-            trace_id = getattr(request.state, "trace_id", "")
-            span_id = getattr(request.state, "span_id", "")
+            trace_id = state.get("trace_id", "")
+            span_id = state.get("span_id", "")
 
+            query = ctx.query_string
             log_payload: dict[str, Any] = {
-                "method": request.method,
-                "path": request.url.path,
-                "query": str(request.url.query) if request.url.query else None,
+                "method": ctx.method,
+                "path": ctx.path,
+                "query": query or None,
                 "status_code": status_code,
                 "duration_ms": duration_ms,
-                "client": request.client.host if request.client else None,
+                "client": ctx.client_host,
                 "correlation_id": correlation_id,
                 "tenant_id": tenant_id,
-                "identity_kind": getattr(request.state, "identity_kind", "user"),
+                "identity_kind": state.get("identity_kind", "user"),
                 "trace_id": trace_id,
                 "span_id": span_id,
-                "headers": _safe_headers(request),
+                "headers": _safe_headers(ctx.headers),
             }
             if status_code >= 500:
                 logger.error("request completed", extra={"request": log_payload})
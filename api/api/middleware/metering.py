@@ -10,9 +10,10 @@ from __future__ import annotations
 
 import logging
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.middleware.asgi import get_request_context
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +31,7 @@ _SKIP_PATHS: frozenset[str] = frozenset(
 )
 
 
-class MeteringMiddleware(BaseHTTPMiddleware):
+class MeteringMiddleware:
     """Record an ``API_REQUEST`` usage event for every non-skipped request.
 
     The middleware is deliberately fault-tolerant: if the metering
@@ -38,28 +39,46 @@ class MeteringMiddleware(BaseHTTPMiddleware):
     the request proceeds normally and the event is silently dropped.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        response = await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code: int | None = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_with_status)
+        if status_code is None:
+            return
 
         # Skip health probes, docs, and internal paths.
-        path = request.url.path.rstrip("/") or "/"
+        ctx = get_request_context(scope)
+        path = ctx.path.rstrip("/") or "/"
         if path in _SKIP_PATHS:
-            return response
+            return
 
         try:
             from core_engine.metering.events import UsageEventType
 
             from api.dependencies import get_metering_collector
 
-            collector = get_metering_collector(request)
-            tenant_id = getattr(request.state, "tenant_id", "anonymous")
+            collector = get_metering_collector(Request(scope))
+            tenant_id = ctx.state.get("tenant_id", "anonymous")
             collector.record_event(
                 tenant_id=tenant_id,
                 event_type=UsageEventType.API_REQUEST,
                 metadata={
-                    "method": request.method,
+                    "method": ctx.method,
                     "path": path,
-                    "status_code": response.status_code,
+                    "status_code": status_code,
                 },
             )
         except RuntimeError:
@@ -68,5 +87,3 @@ class MeteringMiddleware(BaseHTTPMiddleware):
             pass
         except Exception:
             logger.debug("Metering middleware failed to record event", exc_info=True)
-
-        return response
@@ -14,9 +14,9 @@ import logging
 import re
 import time
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.middleware.asgi import get_request_context
 
 logger = logging.getLogger(__name__)
 
@@ -109,36 +109,55 @@ def _normalise_path(path: str) -> str:
 _SKIP_PATHS: frozenset[str] = frozenset({"/metrics", "/docs", "/redoc", "/openapi.json", "/favicon.ico"})
 
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
+class PrometheusMiddleware:
     """Record HTTP request rate, error rate, and latency as Prometheus metrics.
 
+    Duration covers the whole exchange, up to the last body chunk, so
+    streamed responses are timed in full.  Requests that raise before a
+    response starts are not recorded.
+
     The middleware is a no-op if ``prometheus_client`` is not installed.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if not _METRICS_AVAILABLE:
-            return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not _METRICS_AVAILABLE or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        path = request.url.path
+        ctx = get_request_context(scope)
+        path = ctx.path
         if path in _SKIP_PATHS:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-        method = request.method
-        normalised = _normalise_path(path)
+        status_code: int | None = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         start = time.monotonic()
-        response = await call_next(request)
+        await self.app(scope, receive, send_with_status)
         duration = time.monotonic() - start
 
+        if status_code is None:
+            return
+
+        method = ctx.method
+        normalised = _normalise_path(path)
+
         HTTP_REQUESTS_TOTAL.labels(
             method=method,
             path=normalised,
-            status_code=str(response.status_code),
+            status_code=str(status_code),
         ).inc()
 
         HTTP_REQUEST_DURATION.labels(
             method=method,
             path=normalised,
         ).observe(duration)
-
-        return response
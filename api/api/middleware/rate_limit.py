@@ -1,11 +1,12 @@
 """Rate-limiting middleware -- sliding-window, per-tenant and per-IP.
 
-Implements a sliding window counter with two backends:
+Implements an approximated sliding window counter (two fixed windows per
+key, interpolated) with two backends:
 
-* :class:`InProcessRateLimitBackend` — in-process deque counter.  Zero
-  external dependencies; suitable for single-replica deployments.
-* :class:`RedisRateLimitBackend` — Redis sorted-set counter.  Enforces
-  globally consistent limits across *all* replicas.
+* :class:`InProcessRateLimitBackend` — in-process, lock-striped counter.
+  Zero external dependencies; suitable for single-replica deployments.
+* :class:`RedisRateLimitBackend` — one Lua script per hit over a Redis
+  hash.  Enforces globally consistent limits across *all* replicas.
 
 The backend is selected by :func:`build_rate_limit_backend`:
 - When ``REDIS_URL`` is configured and reachable, Redis is used.
@@ -25,15 +26,15 @@ import asyncio
 import fnmatch
 import logging
 import random
+import threading
 import time
-import uuid
-from collections import deque
 from typing import Any, Protocol, runtime_checkable
 
 from pydantic import BaseModel
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.middleware.asgi import RequestContext, get_request_context, response_headers
 
 logger = logging.getLogger(__name__)
 
@@ -90,23 +91,59 @@ class RateLimitConfig(BaseModel):
 
 _WINDOW_SECONDS: float = 60.0
 _CLEANUP_INTERVAL_SECONDS: float = 60.0
+_DEFAULT_SHARDS: int = 16
+
+
+class _WindowSlot:
+    """Fixed-window counts for one key: the current window and the one before."""
+
+    __slots__ = ("current", "previous", "window")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.current = 0
+        self.previous = 0
+
+    def roll(self, window: int) -> None:
+        """Advance to *window*, carrying the current count over if adjacent."""
+        if window == self.window:
+            return
+        self.previous = self.current if window == self.window + 1 else 0
+        self.current = 0
+        self.window = window
+
+
+class _Shard:
+    __slots__ = ("lock", "slots")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.slots: dict[str, _WindowSlot] = {}
 
 
 class SlidingWindowCounter:
-    """Thread-safe (asyncio-safe) sliding window request counter.
+    """Approximated sliding window request counter with O(1) memory per key.
+
+    Each key keeps two fixed-window counters, one for the current window
+    and one for the previous window.  The sliding count interpolates
+    between them::
+
+        count = current + previous * (1 - elapsed_in_current / window)
 
-    Each client key maps to a :class:`~collections.deque` of UNIX
-    timestamps.  Calling :meth:`hit` prunes entries older than
-    ``window_seconds`` before appending the current timestamp.
+    This is exact when requests are spread evenly.  It never undercounts a
+    burst inside the current window.  Memory per key is constant however
+    much traffic the key receives.
 
-    A background task periodically removes keys that have been idle for
-    longer than the window to prevent unbounded memory growth.
+    Keys are spread over lock-striped shards.  A shard's lock is held only
+    for a few arithmetic operations and never across an ``await``, so
+    concurrent requests for different keys do not serialise on one lock.
+    A background task sweeps one shard at a time and removes keys whose
+    windows have both expired.
     """
 
-    def __init__(self, window_seconds: float = _WINDOW_SECONDS) -> None:
+    def __init__(self, window_seconds: float = _WINDOW_SECONDS, shards: int = _DEFAULT_SHARDS) -> None:
         self._window: float = window_seconds
-        self._buckets: dict[str, deque[float]] = {}
-        self._lock: asyncio.Lock = asyncio.Lock()
+        self._shards: tuple[_Shard, ...] = tuple(_Shard() for _ in range(max(shards, 1)))
         self._cleanup_task: asyncio.Task[None] | None = None
         self._running: bool = False
 
@@ -132,79 +169,85 @@ class SlidingWindowCounter:
 
     # -- Core API ------------------------------------------------------------
 
-    async def hit(self, key: str) -> int:
-        """Record a request for *key* and return the current count.
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
 
-        The count reflects only timestamps within the sliding window
-        (i.e. the last ``window_seconds``).
-        """
-        now = time.monotonic()
-        cutoff = now - self._window
+    def _position(self) -> tuple[int, float]:
+        """Return ``(window_index, fraction_of_window_elapsed)`` for now."""
+        window, offset = divmod(time.monotonic(), self._window)
+        return int(window), offset / self._window
 
-        async with self._lock:
-            bucket = self._buckets.get(key)
-            if bucket is None:
-                bucket = deque()
-                self._buckets[key] = bucket
+    @staticmethod
+    def _estimate(slot: _WindowSlot, elapsed: float) -> int:
+        return slot.current + int(slot.previous * (1.0 - elapsed))
 
-            # Prune expired entries.
-            while bucket and bucket[0] <= cutoff:
-                bucket.popleft()
+    async def hit(self, key: str) -> int:
+        """Record a request for *key* and return the current count.
 
-            bucket.append(now)
-            return len(bucket)
+        The count approximates the number of requests in the last
+        ``window_seconds``.
+        """
+        window, elapsed = self._position()
+        shard = self._shard(key)
+        with shard.lock:
+            slot = shard.slots.get(key)
+            if slot is None:
+                slot = shard.slots[key] = _WindowSlot(window)
+            else:
+                slot.roll(window)
+            slot.current += 1
+            return self._estimate(slot, elapsed)
 
     async def count(self, key: str) -> int:
         """Return the current request count without recording a new hit."""
-        now = time.monotonic()
-        cutoff = now - self._window
-
-        async with self._lock:
-            bucket = self._buckets.get(key)
-            if bucket is None:
+        window, elapsed = self._position()
+        shard = self._shard(key)
+        with shard.lock:
+            slot = shard.slots.get(key)
+            if slot is None:
                 return 0
-
-            while bucket and bucket[0] <= cutoff:
-                bucket.popleft()
-
-            return len(bucket)
+            slot.roll(window)
+            return self._estimate(slot, elapsed)
 
     async def time_until_reset(self, key: str) -> float:
-        """Seconds until the oldest entry in *key*'s window expires.
+        """Seconds until the current fixed window for *key* ends.
 
-        Returns ``0.0`` if the key has no recorded timestamps.
+        By then every request from the previous window has aged out of the
+        count.  Returns ``0.0`` if the key has no recorded requests.
         """
-        now = time.monotonic()
-        async with self._lock:
-            bucket = self._buckets.get(key)
-            if not bucket:
+        window, elapsed = self._position()
+        shard = self._shard(key)
+        with shard.lock:
+            slot = shard.slots.get(key)
+            if slot is None:
+                return 0.0
+            slot.roll(window)
+            if slot.current == 0 and slot.previous == 0:
                 return 0.0
-            oldest = bucket[0]
-            remaining = (oldest + self._window) - now
-            return max(remaining, 0.0)
+        return (1.0 - elapsed) * self._window
 
     # -- Housekeeping --------------------------------------------------------
 
+    def _sweep_shard(self, shard: _Shard, window: int) -> int:
+        """Drop *shard*'s keys with no requests in the current or previous window."""
+        with shard.lock:
+            stale = [key for key, slot in shard.slots.items() if slot.window < window - 1]
+            for key in stale:
+                del shard.slots[key]
+        return len(stale)
+
     async def _cleanup_loop(self) -> None:
-        """Remove keys whose entries have all expired."""
+        """Periodically remove keys whose windows have all expired."""
         while self._running:
             await asyncio.sleep(_CLEANUP_INTERVAL_SECONDS)
-            now = time.monotonic()
-            cutoff = now - self._window
-
-            async with self._lock:
-                stale_keys: list[str] = []
-                for key, bucket in self._buckets.items():
-                    # Prune expired entries.
-                    while bucket and bucket[0] <= cutoff:
-                        bucket.popleft()
-                    if not bucket:
-                        stale_keys.append(key)
-                for key in stale_keys:
-                    del self._buckets[key]
-
-                if stale_keys:
-                    logger.debug("Rate-limit cleanup removed %d stale keys", len(stale_keys))
+            window, _ = self._position()
+            removed = 0
+            for shard in self._shards:
+                removed += self._sweep_shard(shard, window)
+                # Let requests run between shards.
+                await asyncio.sleep(0)
+            if removed:
+                logger.debug("Rate-limit cleanup removed %d stale keys", removed)
 
 
 # ---------------------------------------------------------------------------
@@ -230,7 +273,7 @@ class RateLimitBackend(Protocol):
         ...
 
     async def time_until_reset(self, key: str) -> float:
-        """Seconds until the oldest entry in *key*'s window expires."""
+        """Seconds until the current window for *key* ends."""
         ...
 
 
@@ -262,54 +305,81 @@ class InProcessRateLimitBackend:
         return await self._counter.time_until_reset(key)
 
 
+# Approximated sliding window over one Redis hash per counter key (fields:
+# w = window index, c = current count, p = previous count), evaluated in a
+# single round trip.  Server time keeps every replica on the same window
+# boundaries.  ARGV[1] is the window in milliseconds and ARGV[2] the
+# increment (0 for a read-only count).  Returns {count, ms_until_window_end}.
+_SLIDING_WINDOW_SCRIPT = """
+local window_ms = tonumber(ARGV[1])
+local increment = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now_ms = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local window = math.floor(now_ms / window_ms)
+local elapsed = (now_ms % window_ms) / window_ms
+
+local state = redis.call('HMGET', KEYS[1], 'w', 'c', 'p')
+local current = tonumber(state[2]) or 0
+local previous = tonumber(state[3]) or 0
+local stored = tonumber(state[1])
+if stored ~= window then
+    if stored == window - 1 then
+        previous = current
+    else
+        previous = 0
+    end
+    current = 0
+end
+
+if increment > 0 then
+    current = current + increment
+    redis.call('HSET', KEYS[1], 'w', window, 'c', current, 'p', previous)
+    redis.call('PEXPIRE', KEYS[1], window_ms * 2)
+end
+
+local count = current + math.floor(previous * (1 - elapsed))
+local reset_ms = 0
+if current > 0 or previous > 0 then
+    reset_ms = window_ms - (now_ms % window_ms)
+end
+return {count, reset_ms}
+"""
+
+
 class RedisRateLimitBackend:
-    """Redis-backed :class:`RateLimitBackend` using sorted-set sliding windows.
+    """Redis-backed :class:`RateLimitBackend` using approximated sliding windows.
 
-    Uses a Redis sorted set per counter key where each member is a unique
-    ID scored by its creation timestamp.  The ZREMRANGEBYSCORE +
-    ZADD + ZCARD pipeline is executed atomically, giving globally
-    consistent counts across all replicas.
+    Applies the same two-window interpolation as
+    :class:`SlidingWindowCounter`, as a Lua script over one small hash per
+    counter key.  Each call is one atomic round trip, which gives globally
+    consistent counts across all replicas.  Memory per key is constant.
 
-    Key format: ``rl:<counter_key>`` (e.g. ``rl:tenant:abc123:60``)
+    Key format: ``rlw:<counter_key>`` (e.g. ``rlw:tenant:abc123:60``).  The
+    prefix differs from the sorted-set keys of earlier releases so the two
+    formats never collide during a rolling deploy.
     """
 
     def __init__(self, redis_client: Any, window_seconds: float = _WINDOW_SECONDS) -> None:
         self._redis = redis_client
         self._window = window_seconds
+        self._window_ms = max(int(window_seconds * 1000), 1)
+        self._script = redis_client.register_script(_SLIDING_WINDOW_SCRIPT)
+
+    async def _run(self, key: str, increment: int) -> tuple[int, float]:
+        count, reset_ms = await self._script(keys=[f"rlw:{key}"], args=[self._window_ms, increment])
+        return int(count), int(reset_ms) / 1000
 
     async def hit(self, key: str) -> int:
-        now = time.time()
-        cutoff = now - self._window
-        redis_key = f"rl:{key}"
-        member = f"{now}:{uuid.uuid4().hex}"
-
-        pipe = self._redis.pipeline(transaction=True)
-        pipe.zremrangebyscore(redis_key, "-inf", cutoff)
-        pipe.zadd(redis_key, {member: now})
-        pipe.zcard(redis_key)
-        pipe.expire(redis_key, int(self._window) + 2)
-        results = await pipe.execute()
-        return int(results[2])  # ZCARD result
+        count, _ = await self._run(key, 1)
+        return count
 
     async def count(self, key: str) -> int:
-        now = time.time()
-        cutoff = now - self._window
-        redis_key = f"rl:{key}"
-
-        pipe = self._redis.pipeline()
-        pipe.zremrangebyscore(redis_key, "-inf", cutoff)
-        pipe.zcard(redis_key)
-        results = await pipe.execute()
-        return int(results[1])
+        count, _ = await self._run(key, 0)
+        return count
 
     async def time_until_reset(self, key: str) -> float:
-        redis_key = f"rl:{key}"
-        oldest = await self._redis.zrange(redis_key, 0, 0, withscores=True)
-        if not oldest:
-            return 0.0
-        oldest_score = float(oldest[0][1])
-        remaining = (oldest_score + self._window) - time.time()
-        return max(remaining, 0.0)
+        _, reset_seconds = await self._run(key, 0)
+        return reset_seconds
 
 
 async def build_rate_limit_backend(
@@ -367,8 +437,8 @@ def get_inprocess_rate_limit_backend() -> InProcessRateLimitBackend | None:
 # ---------------------------------------------------------------------------
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Starlette middleware enforcing per-client sliding-window rate limits.
+class RateLimitMiddleware:
+    """ASGI middleware enforcing per-client sliding-window rate limits.
 
     Client identification strategy:
 
@@ -386,12 +456,12 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: Any,
+        app: ASGIApp,
         config: RateLimitConfig | None = None,
         backend: InProcessRateLimitBackend | RedisRateLimitBackend | None = None,
         redis_url: str | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self._config: RateLimitConfig = config or RateLimitConfig()
         self._redis_url = redis_url
         self._backend_upgraded = False  # True once we've tried to upgrade to Redis
@@ -418,7 +488,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     async def _maybe_upgrade_backend(self) -> None:
         """On the first request after startup, attempt to upgrade to Redis if configured.
 
-        Called at the start of each ``dispatch()`` until the upgrade succeeds
+        Called at the start of each request until the upgrade succeeds
         or is determined to be unavailable.  After the first attempt the
         ``_backend_upgraded`` flag is set so this becomes a no-op.
         """
@@ -440,18 +510,17 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     # -- Helpers -------------------------------------------------------------
 
-    def _client_key(self, request: Request) -> str:
+    def _client_key(self, ctx: RequestContext) -> str:
         """Derive a rate-limit key from the request.
 
         Prefers tenant_id (set by the auth middleware) so that all requests
         from the same tenant share a quota regardless of source IP.  Falls
         back to the client IP for unauthenticated endpoints.
         """
-        tenant_id: str | None = getattr(request.state, "tenant_id", None)
+        tenant_id = ctx.tenant_id
         if tenant_id:
             return f"tenant:{tenant_id}"
-        ip = request.client.host if request.client else "unknown"
-        return f"ip:{ip}"
+        return f"ip:{ctx.client_host or 'unknown'}"
 
     def _limit_for_path(self, path: str) -> int:
         """Return the effective per-minute limit for *path*.
@@ -480,22 +549,25 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     # -- Dispatch ------------------------------------------------------------
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if not self._config.enabled:
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._config.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Lazily upgrade to Redis backend after startup (no-op after first attempt).
         await self._maybe_upgrade_backend()
 
-        path = request.url.path
+        ctx = get_request_context(scope)
+        path = ctx.path
         base_limit = self._limit_for_path(path)
 
         # Sentinel 0 means exempt.
         if base_limit == 0:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         burst_limit = self._effective_burst_limit(base_limit)
-        client_key = self._client_key(request)
+        client_key = self._client_key(ctx)
 
         # Scope the counter key to the specific limit tier so that a
         # tenant's general requests and their expensive-endpoint requests
@@ -525,7 +597,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             if _RL_METRICS:
                 RATE_LIMIT_REJECTED_TOTAL.labels(endpoint=_normalise_path(path)).inc()
 
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "detail": "Rate limit exceeded. Try again later.",
@@ -537,16 +609,21 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "X-RateLimit-Reset": str(retry_after_int),
                 },
             )
+            await response(scope, receive, send)
+            return
 
         # Request is within budget -- forward downstream.
-        response = await call_next(request)
-
         remaining = max(burst_limit - current_count, 0)
-        reset_seconds = await self._backend.time_until_reset(counter_key)
-        reset_int = max(int(reset_seconds) + 1, 1)
 
-        response.headers["X-RateLimit-Limit"] = str(burst_limit)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(reset_int)
+        async def send_with_limits(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                reset_seconds = await self._backend.time_until_reset(counter_key)
+                reset_int = max(int(reset_seconds) + 1, 1)
+
+                headers = response_headers(message)
+                headers["X-RateLimit-Limit"] = str(burst_limit)
+                headers["X-RateLimit-Remaining"] = str(remaining)
+                headers["X-RateLimit-Reset"] = str(reset_int)
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_limits)
@@ -22,9 +22,10 @@ import logging
 import os
 import re
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.middleware.asgi import get_request_context, response_headers
 
 logger = logging.getLogger(__name__)
 
@@ -105,7 +106,7 @@ def get_trace_context(request: Request) -> dict[str, str]:
 # ---------------------------------------------------------------------------
 
 
-class TraceContextMiddleware(BaseHTTPMiddleware):
+class TraceContextMiddleware:
     """Parse or generate W3C trace context and inject into request lifecycle.
 
     Behaviour
@@ -118,10 +119,21 @@ class TraceContextMiddleware(BaseHTTPMiddleware):
     3. ``request.state.trace_id`` and ``request.state.span_id`` are set for
        downstream handlers.
     4. ``X-Trace-ID`` is added to the response for client-side correlation.
+
+    The context vars are reset once the downstream app returns, so they
+    never leak into the caller's context.
     """
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        traceparent = request.headers.get("traceparent", "")
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        ctx = get_request_context(scope)
+        traceparent = ctx.headers.get("traceparent", "")
         trace_id, parent_span_id, flags = self._parse_traceparent(traceparent)
 
         # Always generate a new span_id for this service's span.
@@ -131,22 +143,28 @@ class TraceContextMiddleware(BaseHTTPMiddleware):
             trace_id = _generate_trace_id()
             flags = "00"
 
-        # Store on context vars (available to all coroutines in this task).
-        _trace_id_var.set(trace_id)
-        _span_id_var.set(span_id)
-        _trace_flags_var.set(flags)
-
         # Store on request.state for handlers that receive the Request.
-        request.state.trace_id = trace_id
-        request.state.span_id = span_id
-        request.state.parent_span_id = parent_span_id or ""
-
-        response = await call_next(request)
-
-        # Always include trace ID in response for client-side correlation.
-        response.headers["X-Trace-ID"] = trace_id
-
-        return response
+        state = ctx.state
+        state["trace_id"] = trace_id
+        state["span_id"] = span_id
+        state["parent_span_id"] = parent_span_id or ""
+
+        async def send_with_trace_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Always include trace ID in response for client-side correlation.
+                response_headers(message)["X-Trace-ID"] = trace_id
+            await send(message)
+
+        # Store on context vars (available to all coroutines downstream).
+        trace_token = _trace_id_var.set(trace_id)
+        span_token = _span_id_var.set(span_id)
+        flags_token = _trace_flags_var.set(flags)
+        try:
+            await self.app(scope, receive, send_with_trace_id)
+        finally:
+            _trace_flags_var.reset(flags_token)
+            _span_id_var.reset(span_token)
+            _trace_id_var.reset(trace_token)
 
     @staticmethod
     def _parse_traceparent(header: str) -> tuple[str, str, str]:
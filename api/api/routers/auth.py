@@ -576,6 +576,11 @@ async def revoke_api_key(
     if not revoked:
         raise not_found_404("API key")
 
+    # Stop cached validations of the key from authenticating further requests.
+    from api.middleware.auth import invalidate_api_key
+
+    await invalidate_api_key(key_id)
+
     # Audit log the revocation.
     audit = AuditService(session, tenant_id=tenant_id, actor=user)
     await audit.log(
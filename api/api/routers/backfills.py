@@ -70,6 +70,12 @@ class ChunkedBackfillRequest(BaseModel):
         le=365,
         description="Number of days per chunk (default 7).",
     )
+    max_concurrent_chunks: int = Field(
+        default=1,
+        ge=1,
+        le=32,
+        description="Maximum number of non-overlapping chunks executed at once (default 1).",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -145,9 +151,10 @@ async def create_chunked_backfill(
 ) -> dict[str, Any]:
     """Trigger a chunked backfill with checkpoint-based resume.
 
-    Splits the date range into chunks and executes them sequentially.
-    If a chunk fails, the backfill can be resumed from the last
-    successfully completed chunk via ``POST /backfills/{backfill_id}/resume``.
+    Splits the date range into chunks and executes up to
+    ``max_concurrent_chunks`` of them at a time.  If a chunk fails, the
+    backfill can be resumed via ``POST /backfills/{backfill_id}/resume``,
+    which re-runs only the chunks that did not complete.
     """
     from core_engine.metering.events import UsageEventType
 
@@ -159,6 +166,7 @@ async def create_chunked_backfill(
             end_date=body.end_date,
             cluster_size=body.cluster_size,
             chunk_size_days=body.chunk_size_days,
+            max_concurrent_chunks=body.max_concurrent_chunks,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -174,6 +182,7 @@ async def create_chunked_backfill(
             "start_date": body.start_date,
             "end_date": body.end_date,
             "chunk_size_days": body.chunk_size_days,
+            "max_concurrent_chunks": body.max_concurrent_chunks,
             "cluster_size": body.cluster_size,
             "backfill_type": "chunked",
         },
@@ -189,6 +198,7 @@ async def create_chunked_backfill(
         end_date=body.end_date,
         cluster_size=body.cluster_size,
         chunk_size_days=body.chunk_size_days,
+        max_concurrent_chunks=body.max_concurrent_chunks,
         backfill_type="chunked",
     )
 
@@ -203,17 +213,23 @@ async def resume_backfill(
     tenant_id: TenantDep,
     user_identity: UserDep,
     metering: MeteringDep,
+    max_concurrent_chunks: int | None = Query(
+        default=None,
+        ge=1,
+        le=32,
+        description="Override the chunk concurrency the backfill was started with.",
+    ),
     _role: Role = Depends(require_permission(Permission.CREATE_BACKFILLS)),
 ) -> dict[str, Any]:
     """Resume a failed or interrupted chunked backfill.
 
-    Picks up execution from the last successfully completed chunk.
+    Executes only the chunks not yet recorded as completed.
     """
     from core_engine.metering.events import UsageEventType
 
     service = ExecutionService(session, settings, tenant_id=tenant_id)
     try:
-        result = await service.resume_backfill(backfill_id)
+        result = await service.resume_backfill(backfill_id, max_concurrent_chunks=max_concurrent_chunks)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except RuntimeError as exc:
@@ -12,6 +12,7 @@ import logging
 from typing import Any
 
 import bcrypt
+from core_engine.crypto import run_crypto
 from core_engine.state.repository import EventSubscriptionRepository
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
@@ -109,9 +110,10 @@ def _row_to_response(row: Any) -> EventSubscriptionResponse:
     )
 
 
-def _hash_secret(secret: str) -> str:
-    """Bcrypt hash a webhook signing secret."""
-    return bcrypt.hashpw(secret.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+async def _hash_secret(secret: str) -> str:
+    """Bcrypt hash a webhook signing secret on the crypto thread pool."""
+    hashed = await run_crypto(bcrypt.hashpw, secret.encode("utf-8"), bcrypt.gensalt())
+    return hashed.decode("utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -136,7 +138,7 @@ async def create_subscription(
 
     secret_hash: str | None = None
     if body.secret:
-        secret_hash = _hash_secret(body.secret)
+        secret_hash = await _hash_secret(body.secret)
 
     row = await repo.create(
         name=body.name,
@@ -212,7 +214,7 @@ async def update_subscription(
     if body.url is not None:
         kwargs["url"] = body.url
     if body.secret is not None:
-        kwargs["secret_hash"] = _hash_secret(body.secret)
+        kwargs["secret_hash"] = await _hash_secret(body.secret)
     if body.event_types is not None:
         kwargs["event_types"] = body.event_types
     if body.active is not None:
@@ -7,6 +7,7 @@ import logging
 from typing import Any
 
 from core_engine.state.repository import (
+    LineageRepository,
     ModelRepository,
     RunRepository,
     WatermarkRepository,
@@ -231,86 +232,48 @@ async def get_model_lineage(
     session: SessionDep,
     tenant_id: TenantDep,
     _role: Role = Depends(require_permission(Permission.READ_MODELS)),
+    max_depth: int = Query(default=100, ge=1, le=1000, description="Deepest lineage level to return."),
+    limit: int = Query(default=100, ge=1, le=1000, description="Max models per direction."),
+    offset: int = Query(default=0, ge=0, le=100_000, description="Models to skip per direction."),
+    snapshot_id: str | None = Query(
+        default=None,
+        max_length=64,
+        description="Lineage snapshot to read (a plan's target SHA).  Defaults to the latest.",
+    ),
 ) -> dict[str, Any]:
     """Return upstream and downstream lineage for a model.
 
-    Lineage is computed by loading all models from the database and
-    building a lightweight in-memory graph from their declared
-    dependencies (tags JSON encodes referenced tables when available).
+    Lineage is read from the dependency edges recorded when plans and
+    snapshots are created, walked by recursive CTEs inside the database in
+    one query.  ``upstream`` and ``downstream`` list one page of model
+    names ordered by distance; ``upstream_nodes`` / ``downstream_nodes``
+    carry each model's shortest distance from *model_name*.
     """
     repo = ModelRepository(session, tenant_id=tenant_id)
     target = await repo.get(model_name)
     if target is None:
         raise not_found_404("Model", model_name)
 
-    # BL-074: cap list_all at 1000 to support larger tenants; report truncation.
-    # Design note: a PostgreSQL recursive CTE would give O(1) memory at scale.
-    _LINEAGE_MODEL_CAP = 1000
-    all_models = await repo.list_all(limit=_LINEAGE_MODEL_CAP)
-    graph_truncated = len(all_models) >= _LINEAGE_MODEL_CAP
-
-    # Build adjacency from model metadata.
-    # Each model's tags field may contain dependency info, but the
-    # canonical source is the repo_path + SQL parsing.  For the API
-    # we construct lineage from the model table relationships.
-    upstream: set[str] = set()
-    downstream: set[str] = set()
-    _visited_up: set[str] = set()
-    _visited_down: set[str] = set()
-
-    # Build dependency edges: child -> set of parents.
-    # We use a simple heuristic: for each model, its tags may list
-    # upstream names, and the repo_path can indicate project structure.
-    # A more robust implementation would load the full DAG from the repo.
-    children_of: dict[str, set[str]] = {}
-    parents_of: dict[str, set[str]] = {}
-    for m in all_models:
-        children_of.setdefault(m.model_name, set())
-        parents_of.setdefault(m.model_name, set())
-
-    # BL-074: Maximum graph traversal depth.  Chains deeper than this limit
-    # would cause RecursionError (~1000 default) and are pathological.
-    _MAX_LINEAGE_DEPTH = 50
-    depth_truncated = False
-
-    def _walk_upstream(name: str, depth: int = 0) -> int:
-        nonlocal depth_truncated
-        # BL-074: hard depth cap — stop traversal and flag truncation.
-        if depth > _MAX_LINEAGE_DEPTH:
-            depth_truncated = True
-            return depth
-        max_depth = depth
-        for parent in parents_of.get(name, set()):
-            if parent not in _visited_up:
-                _visited_up.add(parent)
-                upstream.add(parent)
-                max_depth = max(max_depth, _walk_upstream(parent, depth + 1))
-        return max_depth
-
-    def _walk_downstream(name: str, depth: int = 0) -> int:
-        nonlocal depth_truncated
-        # BL-074: hard depth cap — stop traversal and flag truncation.
-        if depth > _MAX_LINEAGE_DEPTH:
-            depth_truncated = True
-            return depth
-        max_depth = depth
-        for child in children_of.get(name, set()):
-            if child not in _visited_down:
-                _visited_down.add(child)
-                downstream.add(child)
-                max_depth = max(max_depth, _walk_downstream(child, depth + 1))
-        return max_depth
-
-    depth_up = _walk_upstream(model_name)
-    depth_down = _walk_downstream(model_name)
-    is_truncated = depth_truncated or graph_truncated
+    lineage = await LineageRepository(session, tenant_id=tenant_id).get_lineage(
+        model_name,
+        snapshot_id=snapshot_id,
+        max_depth=max_depth,
+        limit=limit,
+        offset=offset,
+    )
 
     return {
         "model_name": model_name,
-        "upstream": sorted(upstream),
-        "downstream": sorted(downstream),
-        "depth": max(depth_up, depth_down),
-        "is_truncated": is_truncated,
+        "upstream": [node["model_name"] for node in lineage["upstream"]],
+        "downstream": [node["model_name"] for node in lineage["downstream"]],
+        "upstream_nodes": lineage["upstream"],
+        "downstream_nodes": lineage["downstream"],
+        "upstream_total": lineage["upstream_total"],
+        "downstream_total": lineage["downstream_total"],
+        "depth": max(lineage["upstream_depth"], lineage["downstream_depth"]),
+        "is_truncated": lineage["is_truncated"],
+        "limit": limit,
+        "offset": offset,
     }
 
 
@@ -1,4 +1,4 @@
-"""Plan management endpoints: generate, list, get, augment, and apply."""
+"""Plan management endpoints: generate, background plan jobs, list, get, augment, and apply."""
 
 from __future__ import annotations
 
@@ -7,14 +7,24 @@ from pathlib import Path
 from typing import Any
 
 from core_engine.license.feature_flags import Feature
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field, field_validator
 
-from api.dependencies import AIClientDep, MeteringDep, SessionDep, SettingsDep, TenantDep, UserDep, require_feature
+from api.dependencies import (
+    AIClientDep,
+    MeteringDep,
+    PlanJobsDep,
+    SessionDep,
+    SettingsDep,
+    TenantDep,
+    UserDep,
+    require_feature,
+)
 from api.middleware.rbac import Permission, Role, require_permission
 from api.schemas import (
     PlanFeedbackResponse,
     PlanFeedbackStatsResponse,
+    PlanJobResponse,
     PlanListItemResponse,
     PlanResponse,
     RunRecordResponse,
@@ -22,6 +32,7 @@ from api.schemas import (
 from api.services.ai_feedback_service import AIFeedbackService
 from api.services.audit_service import AuditAction, AuditService
 from api.services.execution_service import ExecutionService
+from api.services.plan_job_service import PlanJobQueueFullError, PlanJobStatus
 from api.services.plan_service import PlanService
 from api.http_errors import not_found_404
 from api.validation import resolve_repo_path_under_base
@@ -173,6 +184,94 @@ async def generate_plan(
     return plan
 
 
+@router.post("/jobs", response_model=PlanJobResponse, status_code=202)
+async def submit_plan_job(
+    body: GeneratePlanRequest,
+    request: Request,
+    response: Response,
+    session: SessionDep,
+    settings: SettingsDep,
+    tenant_id: TenantDep,
+    user_identity: UserDep,
+    plan_jobs: PlanJobsDep,
+    _role: Role = Depends(require_permission(Permission.CREATE_PLANS)),
+) -> dict[str, Any]:
+    """Queue plan generation as a background job and return immediately.
+
+    Poll ``GET /plans/jobs/{job_id}`` for progress.  A request identical to
+    one already queued or running (same repository, base and target SHA)
+    returns that job instead of starting another.
+    """
+    from api.services.quota_service import QuotaService
+
+    quota = QuotaService(session, tenant_id)
+    allowed, reason = await quota.check_plan_quota()
+    if not allowed:
+        raise HTTPException(status_code=429, detail=reason)
+
+    try:
+        validated_repo_path = str(
+            resolve_repo_path_under_base(
+                body.repo_path, Path(settings.allowed_repo_base).resolve()
+            )
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    try:
+        job, _created = plan_jobs.submit(
+            tenant_id,
+            validated_repo_path,
+            body.base_sha,
+            body.target_sha,
+            requested_by=user_identity,
+        )
+    except PlanJobQueueFullError as exc:
+        raise HTTPException(status_code=429, detail=str(exc)) from exc
+
+    response.headers["Location"] = str(request.url_for("get_plan_job", job_id=job.job_id))
+    return job.to_dict()
+
+
+@router.get("/jobs/{job_id}", response_model=PlanJobResponse)
+async def get_plan_job(
+    job_id: str,
+    tenant_id: TenantDep,
+    plan_jobs: PlanJobsDep,
+    wait: float = Query(default=0.0, ge=0.0, le=30.0, description="Seconds to wait for the job to finish."),
+    _role: Role = Depends(require_permission(Permission.READ_PLANS)),
+) -> dict[str, Any]:
+    """Return the status of a plan job, including the plan once it has succeeded."""
+    job = plan_jobs.get(tenant_id, job_id)
+    if job is None:
+        raise not_found_404("Plan job", job_id)
+    if wait and not job.finished:
+        await plan_jobs.wait(job, timeout=wait)
+    return job.to_dict()
+
+
+@router.get("/jobs/{job_id}/result", response_model=PlanResponse)
+async def get_plan_job_result(
+    job_id: str,
+    tenant_id: TenantDep,
+    plan_jobs: PlanJobsDep,
+    _role: Role = Depends(require_permission(Permission.READ_PLANS)),
+) -> dict[str, Any]:
+    """Return the generated plan of a finished job.
+
+    Responds 409 while the job is still queued or running, and with the
+    status ``POST /plans/generate`` would have used if the job failed.
+    """
+    job = plan_jobs.get(tenant_id, job_id)
+    if job is None:
+        raise not_found_404("Plan job", job_id)
+    if not job.finished:
+        raise HTTPException(status_code=409, detail=f"Plan job is {job.status.value}")
+    if job.status is PlanJobStatus.FAILED or job.plan is None:
+        raise HTTPException(status_code=job.error_status or 500, detail=job.error)
+    return job.plan
+
+
 @router.get("", response_model=list[PlanListItemResponse])
 async def list_plans(
     session: SessionDep,
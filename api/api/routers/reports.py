@@ -1,7 +1,8 @@
 """Reporting endpoints for per-tenant cost, usage, and LLM analytics.
 
 All endpoints require ``VIEW_REPORTS`` permission (admin-only).
-Supports date-range queries, multiple grouping modes, and CSV/JSON export.
+Supports date-range queries, multiple grouping modes, and streamed
+CSV/JSON/NDJSON export.
 """
 
 from __future__ import annotations
@@ -10,12 +11,16 @@ import logging
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 
-from api.dependencies import SessionDep, TenantDep
+from api.dependencies import SessionDep, TenantDep, get_session_factory
 from api.middleware.rbac import Permission, Role, require_permission
-from api.services.reporting_service import ReportingService
+from api.services.reporting_service import (
+    ReportingService,
+    export_file_info,
+    stream_export,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -85,36 +90,48 @@ async def get_llm_report(
 
 @router.get("/export")
 async def export_report(
-    session: SessionDep,
+    request: Request,
     tenant_id: TenantDep,
     _role: Role = Depends(require_permission(Permission.VIEW_REPORTS)),
-    report_type: str = Query(..., description="Report type: cost, usage, llm"),
+    report_type: str = Query(..., description="Report type: cost, usage, llm, events"),
     since: str | None = Query(None),
     until: str | None = Query(None),
-    fmt: str = Query("csv", alias="format", description="Export format: csv, json"),
+    fmt: str = Query("csv", alias="format", description="Export format: csv, json, ndjson"),
+    gzip: bool = Query(False, description="Gzip-compress the file on the fly."),
 ) -> StreamingResponse:
-    """Export report data as a downloadable CSV or JSON file."""
+    """Stream report data as a downloadable CSV, JSON or NDJSON file.
+
+    Rows are read through a server-side cursor and encoded as the client
+    consumes them, so exports of any size run in constant memory.
+    """
     since_dt = _parse_date(since, 30)
     until_dt = _parse_date(until, 0) if until else datetime.now(UTC)
 
-    if report_type not in ("cost", "usage", "llm"):
+    if report_type not in ("cost", "usage", "llm", "events"):
         logger.warning("Invalid report_type in export: %r", report_type)
         raise HTTPException(
             status_code=400,
-            detail="Invalid request parameters. report_type must be one of: cost, usage, llm.",
+            detail="Invalid request parameters. report_type must be one of: cost, usage, llm, events.",
         )
-    if fmt not in ("csv", "json"):
+    if fmt not in ("csv", "json", "ndjson"):
         logger.warning("Invalid format in export: %r", fmt)
         raise HTTPException(
             status_code=400,
-            detail="Invalid request parameters. format must be csv or json.",
+            detail="Invalid request parameters. format must be csv, json or ndjson.",
         )
 
-    service = ReportingService(session, tenant_id)
-    data_bytes, content_type, filename = await service.export_data(report_type, since_dt, until_dt, fmt)
-
+    content_type, filename = export_file_info(report_type, fmt, compress=gzip)
+    body = stream_export(
+        get_session_factory(request),
+        tenant_id,
+        report_type,
+        since_dt,
+        until_dt,
+        fmt,
+        compress=gzip,
+    )
     return StreamingResponse(
-        iter([data_bytes]),
+        body,
         media_type=content_type,
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
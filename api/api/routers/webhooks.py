@@ -161,7 +161,7 @@ async def github_webhook(request: Request) -> dict[str, Any]:
             settings = get_settings(request)
             vault = CredentialVault(settings.credential_encryption_key.get_secret_value())
             try:
-                plaintext_secret = vault.decrypt(secret_encrypted)
+                plaintext_secret = await vault.decrypt_async(secret_encrypted)
             except Exception:
                 logger.error(
                     "Failed to decrypt webhook secret for config id=%s repo=%s; rejecting request.",
@@ -115,6 +115,22 @@ class PlanListItemResponse(BaseModel):
     model_config = {"extra": "allow"}
 
 
+class PlanJobResponse(BaseModel):
+    """Status of a background plan-generation job."""
+
+    job_id: str
+    status: str
+    repo_path: str
+    base_sha: str
+    target_sha: str
+    submitted_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    plan_id: str | None = None
+    plan: PlanResponse | None = None
+    error: str | None = None
+
+
 class PlanFeedbackResponse(BaseModel):
     """Response for suggestion feedback submission."""
 
@@ -21,12 +21,15 @@ import hmac
 import ipaddress
 import logging
 import socket
+import threading
 import time
 import uuid
+from collections import OrderedDict
 from enum import Enum
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlparse
 
+from core_engine.crypto import run_crypto
 from pydantic import BaseModel, Field, SecretStr
 
 if TYPE_CHECKING:
@@ -1059,6 +1062,57 @@ class TokenManager:
         return await provider.validate_token(token)
 
 
+class _DerivedKeyCache:
+    """Bounded LRU cache of PBKDF2-derived vault keys.
+
+    Deriving a key costs 480,000 PBKDF2 iterations, paid on every
+    ``encrypt``/``decrypt`` without a cache.  Entries are keyed by a digest
+    of the master secret plus the salt.  Keys are immutable ``bytes`` (as
+    are the copies held by ``Fernet``), so evicting an entry only drops the
+    reference; it does not scrub the key from memory.  Thread-safe:
+    derivations run on the crypto pool.
+
+    Parameters
+    ----------
+    max_entries:
+        Maximum number of derived keys kept in memory.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._entries: OrderedDict[tuple[bytes, bytes], bytes] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, secret_id: bytes, salt: bytes) -> bytes | None:
+        """Return the cached key, or ``None`` on a miss."""
+        with self._lock:
+            key = self._entries.get((secret_id, salt))
+            if key is None:
+                return None
+            self._entries.move_to_end((secret_id, salt))
+            return key
+
+    def put(self, secret_id: bytes, salt: bytes, key: bytes) -> None:
+        """Cache *key*, evicting the least recently used entry."""
+        with self._lock:
+            self._entries.pop((secret_id, salt), None)
+            self._entries[(secret_id, salt)] = key
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached key."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by all CredentialVault instances, which are created per request.
+_derived_key_cache = _DerivedKeyCache()
+
+
 class CredentialVault:
     """Secure storage for Databricks PATs and other secrets.
 
@@ -1092,6 +1146,9 @@ class CredentialVault:
 
     def __init__(self, secret: str) -> None:
         self._secret = secret.encode("utf-8")
+        # Identifies the master secret in the derived-key cache without
+        # keeping another copy of it there.
+        self._secret_id = hashlib.sha256(self._secret).digest()
 
     @staticmethod
     def _derive_fernet_from_key_bytes(key_bytes: bytes) -> "Fernet":
@@ -1104,17 +1161,24 @@ class CredentialVault:
     def _derive_key(self, salt: bytes) -> bytes:
         """Derive a 32-byte key from the master secret and *salt* via PBKDF2-SHA256.
 
-        Uses 480_000 iterations per OWASP 2023 recommendations.
+        Uses 480_000 iterations per OWASP 2023 recommendations.  Results
+        are cached per salt, so repeated decryption of the same ciphertext
+        (e.g. a webhook secret) pays for the derivation once.
         """
         import hashlib
 
-        return hashlib.pbkdf2_hmac(
+        cached = _derived_key_cache.get(self._secret_id, salt)
+        if cached is not None:
+            return cached
+        key = hashlib.pbkdf2_hmac(
             "sha256",
             self._secret,
             salt,
             iterations=480_000,
             dklen=32,
         )
+        _derived_key_cache.put(self._secret_id, salt, key)
+        return key
 
     def encrypt(self, plaintext: str) -> str:
         """Encrypt a plaintext credential value.
@@ -1163,6 +1227,28 @@ class CredentialVault:
         fernet = self._derive_fernet_from_key_bytes(key_bytes)
         return fernet.decrypt(token).decode("utf-8")
 
+    async def encrypt_async(self, plaintext: str) -> str:
+        """:meth:`encrypt` on the crypto thread pool.
+
+        Every encryption uses a fresh salt, so the key derivation always
+        runs and would otherwise block the event loop.
+        """
+        return await run_crypto(self.encrypt, plaintext)
+
+    async def decrypt_async(self, ciphertext: str) -> str:
+        """:meth:`decrypt` on the crypto thread pool.
+
+        Runs inline when the ciphertext's key is already cached, since
+        only the key derivation is expensive.
+        """
+        import base64
+
+        raw = base64.urlsafe_b64decode(ciphertext.encode("ascii"))
+        salt = raw[1:17] if raw[:1] == self._V2 else self._FIXED_SALT
+        if _derived_key_cache.get(self._secret_id, salt) is not None:
+            return self.decrypt(ciphertext)
+        return await run_crypto(self.decrypt, ciphertext)
+
     async def store_credential(
         self,
         session: AsyncSession,
@@ -1173,7 +1259,7 @@ class CredentialVault:
         """Encrypt and persist a credential for a tenant."""
         from core_engine.state.repository import CredentialRepository
 
-        encrypted = self.encrypt(credential_value)
+        encrypted = await self.encrypt_async(credential_value)
         repo = CredentialRepository(session, tenant_id=tenant_id)
         await repo.store(credential_name, encrypted)
         logger.info(
@@ -1195,7 +1281,7 @@ class CredentialVault:
         encrypted = await repo.get(credential_name)
         if encrypted is None:
             return None
-        return self.decrypt(encrypted)
+        return await self.decrypt_async(encrypted)
 
     async def delete_credential(
         self,
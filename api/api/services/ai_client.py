@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
 import os
 import re
@@ -169,6 +171,85 @@ def _sanitize_list(items: list[Any], parent_name: str = "list") -> list[Any]:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Request payloads (shared by the single-item and batch methods)
+# ---------------------------------------------------------------------------
+
+# Largest batch the AI engine's ``*/batch`` endpoints accept.
+_MAX_BATCH_ITEMS = 100
+
+# Serialised item bytes per batch request.  The AI engine rejects bodies
+# over 1 MiB; the rest is headroom for the envelope and JSON encoding
+# differences.
+_MAX_BATCH_BYTES = 768 * 1024
+
+
+def _semantic_classify_payload(
+    old_sql: str,
+    new_sql: str,
+    schema_diff: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "old_sql": _sanitize_ai_input(old_sql, "old_sql"),
+        "new_sql": _sanitize_ai_input(new_sql, "new_sql"),
+    }
+    if schema_diff is not None:
+        payload["schema_diff"] = _sanitize_dict(schema_diff, "schema_diff")
+    return payload
+
+
+def _predict_cost_payload(
+    model_name: str,
+    partition_count: int,
+    historical_runtime_avg: float | None,
+    data_volume: int | None,
+    cluster_size: str,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "model_name": _sanitize_ai_input(model_name, "model_name"),
+        "partition_count": partition_count,
+        "cluster_size": _sanitize_ai_input(cluster_size, "cluster_size"),
+    }
+    if historical_runtime_avg is not None:
+        payload["historical_runtime_avg"] = historical_runtime_avg
+    if data_volume is not None:
+        payload["data_volume_bytes"] = data_volume
+    return payload
+
+
+def _score_risk_payload(
+    model_name: str,
+    downstream_depth: int,
+    sla_tags: list[str],
+    dashboard_deps: list[str],
+    model_tags: list[str],
+    failure_rate: float,
+) -> dict[str, Any]:
+    return {
+        "model_name": _sanitize_ai_input(model_name, "model_name"),
+        "downstream_depth": downstream_depth,
+        "sla_tags": _sanitize_list(sla_tags, "sla_tags"),
+        "dashboard_dependencies": _sanitize_list(dashboard_deps, "dashboard_deps"),
+        "model_tags": _sanitize_list(model_tags, "model_tags"),
+        "historical_failure_rate": failure_rate,
+    }
+
+
+def _with_options(
+    payload: dict[str, Any],
+    tenant_id: str | None,
+    llm_enabled: bool,
+    api_key: str | None = None,
+) -> dict[str, Any]:
+    """Add the per-call options common to every advisory request."""
+    payload["llm_enabled"] = llm_enabled
+    if tenant_id is not None:
+        payload["tenant_id"] = tenant_id
+    if api_key is not None:
+        payload["api_key"] = api_key
+    return payload
+
+
 class _CircuitBreaker:
     """Per-instance half-open circuit breaker for the AI advisory engine.
 
@@ -238,6 +319,11 @@ class AIServiceClient:
         provided, the ``AI_ENGINE_SHARED_SECRET`` environment variable
         is read.  When empty, requests are sent without an auth header
         (the AI engine will reject them in non-dev environments).
+    batch_size:
+        Items per request for the ``*_batch`` methods (the AI engine
+        accepts at most 100).
+    batch_concurrency:
+        Most batch chunks in flight at once per ``*_batch`` call.
     """
 
     def __init__(
@@ -248,7 +334,15 @@ class AIServiceClient:
         *,
         circuit_breaker_fail_max: int = 5,
         circuit_breaker_reset_timeout: float = 30.0,
+        batch_size: int = 50,
+        batch_concurrency: int = 4,
     ) -> None:
+        if not 1 <= batch_size <= _MAX_BATCH_ITEMS:
+            raise ValueError(f"batch_size must be between 1 and {_MAX_BATCH_ITEMS}")
+        if batch_concurrency < 1:
+            raise ValueError("batch_concurrency must be at least 1")
+        self._batch_size = batch_size
+        self._batch_concurrency = batch_concurrency
         self._base_url = base_url.rstrip("/")
         _platform_env = os.environ.get("PLATFORM_ENV", "development")
         if _platform_env != "development" and self._base_url.startswith("http://"):
@@ -294,18 +388,8 @@ class AIServiceClient:
             Per-tenant LLM API key.  When provided, the AI engine uses this
             key for a one-shot Anthropic client instead of the platform key.
         """
-        payload: dict[str, Any] = {
-            "old_sql": _sanitize_ai_input(old_sql, "old_sql"),
-            "new_sql": _sanitize_ai_input(new_sql, "new_sql"),
-            "llm_enabled": llm_enabled,
-        }
-        if schema_diff is not None:
-            payload["schema_diff"] = _sanitize_dict(schema_diff, "schema_diff")
-        if tenant_id is not None:
-            payload["tenant_id"] = tenant_id
-        if api_key is not None:
-            payload["api_key"] = api_key
-        return await self._post("/semantic_classify", payload)
+        payload = _semantic_classify_payload(old_sql, new_sql, schema_diff)
+        return await self._post("/semantic_classify", _with_options(payload, tenant_id, llm_enabled, api_key))
 
     async def predict_cost(
         self,
@@ -322,19 +406,8 @@ class AIServiceClient:
 
         Calls ``POST /predict_cost`` on the AI engine.
         """
-        payload: dict[str, Any] = {
-            "model_name": _sanitize_ai_input(model_name, "model_name"),
-            "partition_count": partition_count,
-            "cluster_size": _sanitize_ai_input(cluster_size, "cluster_size"),
-            "llm_enabled": llm_enabled,
-        }
-        if historical_runtime_avg is not None:
-            payload["historical_runtime_avg"] = historical_runtime_avg
-        if data_volume is not None:
-            payload["data_volume_bytes"] = data_volume
-        if tenant_id is not None:
-            payload["tenant_id"] = tenant_id
-        return await self._post("/predict_cost", payload)
+        payload = _predict_cost_payload(model_name, partition_count, historical_runtime_avg, data_volume, cluster_size)
+        return await self._post("/predict_cost", _with_options(payload, tenant_id, llm_enabled))
 
     async def score_risk(
         self,
@@ -352,18 +425,63 @@ class AIServiceClient:
 
         Calls ``POST /risk_score`` on the AI engine.
         """
-        payload: dict[str, Any] = {
-            "model_name": _sanitize_ai_input(model_name, "model_name"),
-            "downstream_depth": downstream_depth,
-            "sla_tags": _sanitize_list(sla_tags, "sla_tags"),
-            "dashboard_dependencies": _sanitize_list(dashboard_deps, "dashboard_deps"),
-            "model_tags": _sanitize_list(model_tags, "model_tags"),
-            "historical_failure_rate": failure_rate,
-            "llm_enabled": llm_enabled,
-        }
-        if tenant_id is not None:
-            payload["tenant_id"] = tenant_id
-        return await self._post("/risk_score", payload)
+        payload = _score_risk_payload(model_name, downstream_depth, sla_tags, dashboard_deps, model_tags, failure_rate)
+        return await self._post("/risk_score", _with_options(payload, tenant_id, llm_enabled))
+
+    # -- Batched advisory endpoints ------------------------------------------
+    #
+    # Each item is a dict of the keyword arguments of the matching
+    # single-item method.  Items are sent in chunks of at most ``batch_size``
+    # items and ``_MAX_BATCH_BYTES`` of JSON, with
+    # at most ``batch_concurrency`` chunks in flight.  The result list is
+    # aligned with *items*; an entry is ``None`` when that item failed on
+    # the engine, or when its whole chunk failed (network error, HTTP
+    # error, open circuit).  Like every other method, these never raise.
+
+    async def semantic_classify_batch(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        tenant_id: str | None = None,
+        llm_enabled: bool = True,
+        api_key: str | None = None,
+    ) -> list[dict[str, Any] | None]:
+        """Classify many SQL changes via ``POST /semantic_classify/batch``.
+
+        Items take ``old_sql``, ``new_sql`` and optional ``schema_diff``.
+        """
+        payloads = [
+            _with_options(_semantic_classify_payload(**item), tenant_id, llm_enabled, api_key) for item in items
+        ]
+        return await self._post_batch("/semantic_classify/batch", payloads)
+
+    async def predict_cost_batch(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        tenant_id: str | None = None,
+        llm_enabled: bool = True,
+    ) -> list[dict[str, Any] | None]:
+        """Predict cost for many model steps via ``POST /predict_cost/batch``.
+
+        Items take the arguments of :meth:`predict_cost`.
+        """
+        payloads = [_with_options(_predict_cost_payload(**item), tenant_id, llm_enabled) for item in items]
+        return await self._post_batch("/predict_cost/batch", payloads)
+
+    async def score_risk_batch(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        tenant_id: str | None = None,
+        llm_enabled: bool = True,
+    ) -> list[dict[str, Any] | None]:
+        """Score deployment risk for many models via ``POST /risk_score/batch``.
+
+        Items take the arguments of :meth:`score_risk`.
+        """
+        payloads = [_with_options(_score_risk_payload(**item), tenant_id, llm_enabled) for item in items]
+        return await self._post_batch("/risk_score/batch", payloads)
 
     async def optimize_sql(
         self,
@@ -412,6 +530,53 @@ class AIServiceClient:
 
     # -- Internal helpers ----------------------------------------------------
 
+    async def _post_batch(self, path: str, payloads: list[dict[str, Any]]) -> list[dict[str, Any] | None]:
+        """POST *payloads* to a batch endpoint in bounded-concurrency chunks.
+
+        Each chunk goes through :meth:`_post`, so circuit-breaker accounting
+        and metrics are per chunk, exactly as for single-item calls.
+        """
+        results: list[dict[str, Any] | None] = [None] * len(payloads)
+        semaphore = asyncio.Semaphore(self._batch_concurrency)
+
+        async def _send(start: int, end: int) -> None:
+            chunk = payloads[start:end]
+            async with semaphore:
+                body = await self._post(path, {"items": chunk})
+            if body is None:
+                return
+            chunk_results = body.get("results")
+            if not isinstance(chunk_results, list) or len(chunk_results) != len(chunk):
+                logger.warning("AI engine returned a malformed batch response for %s", path)
+                return
+            results[start:end] = chunk_results
+            for item_error in body.get("errors", []):
+                logger.warning("AI engine batch item failed for %s: %s", path, item_error)
+
+        await asyncio.gather(*(_send(start, end) for start, end in self._chunk_bounds(payloads)))
+        return results
+
+    def _chunk_bounds(self, payloads: list[dict[str, Any]]) -> list[tuple[int, int]]:
+        """Split *payloads* into ``(start, end)`` runs under both batch limits.
+
+        A run ends once it holds ``batch_size`` items or adding the next
+        item would exceed ``_MAX_BATCH_BYTES``.  An item that is too large
+        on its own still gets a run of one, so the engine reports it rather
+        than it being silently dropped.
+        """
+        bounds: list[tuple[int, int]] = []
+        start = 0
+        size = 0
+        for index, payload in enumerate(payloads):
+            item_size = len(json.dumps(payload).encode())
+            if index > start and (index - start >= self._batch_size or size + item_size > _MAX_BATCH_BYTES):
+                bounds.append((start, index))
+                start, size = index, 0
+            size += item_size
+        if start < len(payloads):
+            bounds.append((start, len(payloads)))
+        return bounds
+
     async def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any] | None:
         """Fire a POST request and return the JSON body, or ``None`` on error.
 
@@ -14,6 +14,11 @@ Health status classification:
 Trend direction is computed by comparing the current score to the
 previous score: ``improving`` (>5 increase), ``declining`` (>5 decrease),
 or ``stable``.
+
+The nightly :meth:`CustomerHealthService.compute_all` job is set-based.
+It gathers every tenant's inputs with grouped aggregates, scores them in
+memory, and writes the results with multi-row upserts, so its query count
+does not grow with the number of tenants.
 """
 
 from __future__ import annotations
@@ -35,13 +40,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 logger = logging.getLogger(__name__)
 
 
-def _score_recency(dt: datetime | None, max_points: float = 25.0) -> float:
+# Max 6 event types: plan_run, plan_apply, ai_call, model_loaded, backfill_run, api_request
+_FEATURE_EVENT_TYPES = 6
+
+
+def _score_recency(dt: datetime | None, max_points: float = 25.0, now: datetime | None = None) -> float:
     """Score a timestamp by recency: full points if within 1 day, decaying
     linearly to zero at 30 days.
     """
     if dt is None:
         return 0.0
-    age_days = (datetime.now(UTC) - dt).total_seconds() / 86400
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    age_days = ((now or datetime.now(UTC)) - dt).total_seconds() / 86400
     if age_days <= 1:
         return max_points
     if age_days >= 30:
@@ -49,6 +60,32 @@ def _score_recency(dt: datetime | None, max_points: float = 25.0) -> float:
     return round(max_points * (1 - (age_days - 1) / 29), 2)
 
 
+def _score_engagement(
+    *,
+    last_login: datetime | None,
+    last_plan_run: datetime | None,
+    last_ai_call: datetime | None,
+    distinct_types: int,
+    now: datetime | None = None,
+) -> tuple[float, dict[str, float]]:
+    """Combine the four dimensions into ``(total_score, engagement_metrics)``."""
+    now = now or datetime.now(UTC)
+    login_score = _score_recency(last_login, now=now)
+    plan_score = _score_recency(last_plan_run, now=now)
+    ai_score = _score_recency(last_ai_call, now=now)
+    feature_score = min(25.0, round((distinct_types / _FEATURE_EVENT_TYPES) * 25, 2))
+
+    total_score = round(login_score + plan_score + ai_score + feature_score, 1)
+    total_score = max(0.0, min(100.0, total_score))
+    engagement_metrics = {
+        "login_recency": login_score,
+        "plan_activity": plan_score,
+        "ai_adoption": ai_score,
+        "feature_breadth": feature_score,
+    }
+    return total_score, engagement_metrics
+
+
 def _classify_status(score: float) -> str:
     """Map a numeric score to a health status label."""
     if score >= 60:
@@ -70,6 +107,54 @@ def _compute_trend(current: float, previous: float | None) -> str:
     return "stable"
 
 
+def _score_tenants(
+    tenant_ids: list[str],
+    signals: dict[str, dict[str, Any]],
+    existing: dict[str, tuple[float, str]],
+    now: datetime,
+) -> tuple[list[dict[str, Any]], list[tuple[str, str, str, float]]]:
+    """Score every tenant from pre-aggregated *signals* in a single pass.
+
+    Returns ``(records, transitions)``: upsert records for
+    :meth:`CustomerHealthRepository.upsert_many`, and
+    ``(tenant_id, old_status, new_status, score)`` for each status change.
+    """
+    records: list[dict[str, Any]] = []
+    transitions: list[tuple[str, str, str, float]] = []
+    for tenant_id in tenant_ids:
+        inputs = signals.get(tenant_id, {})
+        try:
+            total_score, engagement_metrics = _score_engagement(
+                last_login=inputs.get("last_login_at"),
+                last_plan_run=inputs.get("last_plan_run_at"),
+                last_ai_call=inputs.get("last_ai_call_at"),
+                distinct_types=inputs.get("distinct_event_types", 0),
+                now=now,
+            )
+        except Exception:
+            logger.exception("Failed to compute health for tenant=%s", tenant_id)
+            continue
+
+        status = _classify_status(total_score)
+        previous_score, old_status = existing.get(tenant_id, (None, None))
+        records.append(
+            {
+                "tenant_id": tenant_id,
+                "health_score": total_score,
+                "health_status": status,
+                "engagement_metrics": engagement_metrics,
+                "trend_direction": _compute_trend(total_score, previous_score),
+                "previous_score": previous_score,
+                "last_login_at": inputs.get("last_login_at"),
+                "last_plan_run_at": inputs.get("last_plan_run_at"),
+                "last_ai_call_at": inputs.get("last_ai_call_at"),
+            }
+        )
+        if old_status and old_status != status:
+            transitions.append((tenant_id, old_status, status, total_score))
+    return records, transitions
+
+
 class CustomerHealthService:
     """Computes and manages customer health metrics across all tenants."""
 
@@ -93,7 +178,6 @@ class CustomerHealthService:
             )
         )
         last_login = last_login_r.scalar_one_or_none()
-        login_score = _score_recency(last_login)
 
         # ----- Dimension 2: Plan activity (0-25) -----
         last_plan_r = await self._session.execute(
@@ -103,7 +187,6 @@ class CustomerHealthService:
             )
         )
         last_plan_run = last_plan_r.scalar_one_or_none()
-        plan_score = _score_recency(last_plan_run)
 
         # ----- Dimension 3: AI adoption (0-25) -----
         last_ai_r = await self._session.execute(
@@ -113,7 +196,6 @@ class CustomerHealthService:
             )
         )
         last_ai_call = last_ai_r.scalar_one_or_none()
-        ai_score = _score_recency(last_ai_call)
 
         # ----- Dimension 4: Feature breadth (0-25) -----
         # Count distinct event types used in the last 30 days.
@@ -124,12 +206,15 @@ class CustomerHealthService:
             )
         )
         distinct_types = distinct_types_r.scalar_one()
-        # Max 6 event types: plan_run, plan_apply, ai_call, model_loaded, backfill_run, api_request
-        feature_score = min(25.0, round((distinct_types / 6) * 25, 2))
 
         # ----- Aggregate -----
-        total_score = round(login_score + plan_score + ai_score + feature_score, 1)
-        total_score = max(0.0, min(100.0, total_score))
+        total_score, engagement_metrics = _score_engagement(
+            last_login=last_login,
+            last_plan_run=last_plan_run,
+            last_ai_call=last_ai_call,
+            distinct_types=distinct_types,
+            now=now,
+        )
         status = _classify_status(total_score)
 
         # Look up previous score for trend.
@@ -137,13 +222,6 @@ class CustomerHealthService:
         previous_score = existing.health_score if existing else None
         trend = _compute_trend(total_score, previous_score)
 
-        engagement_metrics = {
-            "login_recency": login_score,
-            "plan_activity": plan_score,
-            "ai_adoption": ai_score,
-            "feature_breadth": feature_score,
-        }
-
         # Detect status changes for eventing.
         old_status = existing.health_status if existing else None
 
@@ -175,23 +253,35 @@ class CustomerHealthService:
         }
 
     async def compute_all(self) -> dict[str, Any]:
-        """Recompute health scores for all active tenants.
+        """Recompute health scores for all active tenants in bulk.
+
+        Every tenant's inputs come from a handful of grouped aggregate
+        queries, scores are computed in one pass in memory, and the results
+        are written with multi-row upserts.  A tenant whose score cannot be
+        computed is logged and skipped.
 
         Returns ``{"computed_count": int, "duration_ms": int}``.
         """
         start = time.monotonic()
+        now = datetime.now(UTC)
 
         config_repo = TenantConfigRepository(self._session, "system")
         configs = await config_repo.list_all(include_deactivated=False)
+        tenant_ids = list(dict.fromkeys(config.tenant_id for config in configs))
+
+        records: list[dict[str, Any]] = []
+        transitions: list[tuple[str, str, str, float]] = []
+        if tenant_ids:
+            signals = await self._health_repo.collect_engagement_signals(since=now - timedelta(days=30))
+            existing = await self._health_repo.get_scores()
+            records, transitions = _score_tenants(tenant_ids, signals, existing, now)
+            await self._health_repo.upsert_many(records)
 
-        count = 0
-        for config in configs:
-            try:
-                await self.compute_health_score(config.tenant_id)
-                count += 1
-            except Exception:
-                logger.exception("Failed to compute health for tenant=%s", config.tenant_id)
+        # Fire only once the new statuses are written.
+        for tenant_id, old_status, new_status, score in transitions:
+            self._fire_status_change_event(tenant_id, old_status, new_status, score)
 
+        count = len(records)
         duration_ms = int((time.monotonic() - start) * 1000)
         logger.info("Computed health scores for %d tenants in %dms", count, duration_ms)
         return {"computed_count": count, "duration_ms": duration_ms}
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+from collections import OrderedDict
 from datetime import UTC, date, datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
+from core_engine.executor.chunk_progress import ChunkProgress
 from core_engine.executor.cluster_templates import get_cost_rate
+from core_engine.executor.scheduler import StepScheduler
 from core_engine.models.plan import DateRange, PlanStep, RunType, compute_deterministic_id
 from core_engine.models.run import RunStatus
 from core_engine.state.repository import (
@@ -19,6 +24,7 @@ from core_engine.state.repository import (
     PlanRepository,
     RunRepository,
     TelemetryRepository,
+    TenantConfigRepository,
     WatermarkRepository,
 )
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -32,6 +38,87 @@ logger = logging.getLogger(__name__)
 # Executor version tag written into every run record.
 _EXECUTOR_VERSION = "api-control-plane-0.1.0"
 
+# Long-lived async Databricks executors, one per (tenant, workspace,
+# credential, warehouse).  Reusing them keeps a single WorkspaceClient
+# connection pool and a single run poller per tenant instead of building
+# a fresh client for every step.  Least recently used idle executors are
+# closed once more than _MAX_DATABRICKS_EXECUTORS are cached.
+_MAX_DATABRICKS_EXECUTORS = 64
+_databricks_executors: OrderedDict[tuple[str, str, str, str | None], tuple[asyncio.AbstractEventLoop, Any]] = (
+    OrderedDict()
+)
+# Keeps aclose() tasks for evicted executors alive until they finish.
+_closing_executors: set[asyncio.Task[None]] = set()
+
+
+def _get_databricks_executor(
+    tenant_id: str,
+    host: str,
+    token: str,
+    warehouse_id: str | None,
+) -> Any:
+    """Return the cached :class:`AsyncDatabricksExecutor` for a tenant.
+
+    The cache is keyed by a hash of the token so that rotated credentials
+    get a fresh client.  Executors are bound to the running event loop and
+    are closed and rebuilt if the loop changes.
+    """
+    from core_engine.executor import AsyncDatabricksExecutor
+
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    key = (tenant_id, host, token_hash, warehouse_id)
+    loop = asyncio.get_running_loop()
+    cached = _databricks_executors.get(key)
+    if cached is not None:
+        if cached[0] is loop:
+            _databricks_executors.move_to_end(key)
+            return cached[1]
+        del _databricks_executors[key]
+        _discard_databricks_executor(*cached)
+
+    executor = AsyncDatabricksExecutor(host=host, token=token, warehouse_id=warehouse_id)
+    _databricks_executors[key] = (loop, executor)
+    _evict_idle_databricks_executors()
+    return executor
+
+
+def _evict_idle_databricks_executors() -> None:
+    """Close least recently used executors with no runs in flight until the cache fits."""
+    excess = len(_databricks_executors) - _MAX_DATABRICKS_EXECUTORS
+    if excess <= 0:
+        return
+    # Executors still awaiting runs are skipped, so the cache can exceed
+    # its bound while every cached executor is busy.
+    idle = [key for key, (_, executor) in _databricks_executors.items() if executor.in_flight == 0]
+    for key in idle[:excess]:
+        _discard_databricks_executor(*_databricks_executors.pop(key))
+
+
+def _discard_databricks_executor(loop: asyncio.AbstractEventLoop, executor: Any) -> None:
+    """Close an executor that has been removed from the cache."""
+    if loop.is_closed() or not loop.is_running():
+        # Its poller died with the loop; only the log filter is left to undo.
+        executor.close()
+    elif loop is asyncio.get_running_loop():
+        task = loop.create_task(executor.aclose())
+        _closing_executors.add(task)
+        task.add_done_callback(_closing_executors.discard)
+    else:
+        asyncio.run_coroutine_threadsafe(executor.aclose(), loop)
+
+
+async def close_databricks_executors() -> None:
+    """Close every cached Databricks executor.  Called on application shutdown."""
+    loop = asyncio.get_running_loop()
+    while _databricks_executors:
+        _, (executor_loop, executor) = _databricks_executors.popitem(last=False)
+        if executor_loop is loop:
+            await executor.aclose()
+        else:
+            _discard_databricks_executor(executor_loop, executor)
+    if _closing_executors:
+        await asyncio.gather(*_closing_executors, return_exceptions=True)
+
 
 class ExecutionService:
     """Execute plans and individual backfills against the configured backend.
@@ -63,6 +150,10 @@ class ExecutionService:
         self._feedback_service = AIFeedbackService(session, tenant_id=tenant_id)
         self._checkpoint_repo = BackfillCheckpointRepository(session, tenant_id=tenant_id)
         self._audit_repo = BackfillAuditRepository(session, tenant_id=tenant_id)
+        self._tenant_config_repo = TenantConfigRepository(session, tenant_id=tenant_id)
+        # Serialises use of the shared AsyncSession between concurrently
+        # executing plan steps.
+        self._db_lock = asyncio.Lock()
 
     # ------------------------------------------------------------------
     # Plan execution
@@ -76,7 +167,12 @@ class ExecutionService:
         auto_approve: bool,
         caller_role: Role | None = None,
     ) -> list[dict[str, Any]]:
-        """Execute every step in a plan in topological order.
+        """Execute every step in a plan, concurrently where dependencies allow.
+
+        Steps are scheduled by their ``depends_on`` edges with at most
+        ``execution_max_concurrency`` (or the tenant's
+        ``max_concurrent_steps`` override) running at once.  A failed step
+        cancels its downstream steps; independent branches keep running.
 
         Parameters
         ----------
@@ -128,8 +224,6 @@ class ExecutionService:
         plan_data = json.loads(plan_row.plan_json)  # type: ignore[arg-type]
         steps: list[dict[str, Any]] = plan_data.get("steps", [])
 
-        run_records: list[dict[str, Any]] = []
-
         # Capture AI predictions from advisory_json before execution.
         try:
             await self._feedback_service.capture_predictions_from_plan(plan_id)
@@ -140,136 +234,346 @@ class ExecutionService:
                 exc_info=True,
             )
 
+        # Idempotency: load completed step IDs once instead of re-querying
+        # the runs table for every step.
+        existing_runs = await self._run_repo.get_by_plan(plan_id)
+        completed_ids = {r.step_id for r in existing_runs if r.status == "SUCCESS"}
         for step in steps:
-            model_name: str = step["model"]
-            step_id: str = step["step_id"]
-            run_type: str = step.get("run_type", "FULL_REFRESH")
-            input_range: dict[str, str] | None = step.get("input_range")
-
-            # Idempotency: skip if a completed run already exists for this step.
-            existing_runs = await self._run_repo.get_by_plan(plan_id)
-            already_done = any(r.step_id == step_id and r.status == "SUCCESS" for r in existing_runs)
-            if already_done:
+            if step["step_id"] in completed_ids:
                 logger.info(
                     "Skipping step %s for %s: already completed",
-                    step_id[:12],
-                    model_name,
+                    step["step_id"][:12],
+                    step["model"],
                 )
-                continue
 
-            # Lock acquisition for incremental runs.
-            range_start: date | None = None
-            range_end: date | None = None
-            locked = False
-            if run_type == "INCREMENTAL" and input_range:
-                range_start = date.fromisoformat(input_range["start"])
-                range_end = date.fromisoformat(input_range["end"])
+        pending = [step for step in steps if step["step_id"] not in completed_ids]
+        if not pending:
+            return []
+
+        model_sql = await self._fetch_model_sql_batch(sorted({step["model"] for step in pending}))
+        max_concurrency = await self._resolve_max_concurrency()
+
+        results = await self._run_plan_steps(
+            plan_id=plan_id,
+            steps=steps,
+            completed_ids=completed_ids,
+            model_sql=model_sql,
+            approved_by=approved_by,
+            cluster_override=cluster_override,
+            max_concurrency=max_concurrency,
+        )
+        return [results[step["step_id"]] for step in pending]
+
+    async def _run_plan_steps(
+        self,
+        *,
+        plan_id: str,
+        steps: list[dict[str, Any]],
+        completed_ids: set[str],
+        model_sql: dict[str, str],
+        approved_by: str | None,
+        cluster_override: str | None,
+        max_concurrency: int,
+    ) -> dict[str, dict[str, Any]]:
+        """Drive plan steps through a dependency-aware ready queue.
+
+        Up to *max_concurrency* steps run at once; each starts as soon as
+        every step it ``depends_on`` has succeeded.  A failed (or
+        lock-blocked) step cancels only its downstream closure.
+
+        The ``AsyncSession`` is not safe for concurrent use, so every
+        database touch from a step task goes through ``self._db_lock``
+        while the execution itself runs unlocked.  Run records, watermarks
+        and telemetry for all steps that finished in the same scheduling
+        round are written together by :meth:`_record_step_results`, and
+        partition locks are released only after that bookkeeping is
+        persisted.
+
+        Returns a mapping of step ID to run record dict for every step that
+        was not already completed.
+        """
+        scheduler = StepScheduler(
+            [self._plan_step_from_dict(step) for step in steps],
+            completed=completed_ids,
+        )
+        step_dicts = {step["step_id"]: step for step in steps}
+        results: dict[str, dict[str, Any]] = {}
+        held_locks: dict[str, tuple[str, date, date]] = {}
+        in_flight: dict[asyncio.Task[dict[str, Any]], str] = {}
+
+        try:
+            while not scheduler.is_finished():
+                while len(in_flight) < max_concurrency and (ready := scheduler.next_ready()) is not None:
+                    task = asyncio.create_task(
+                        self._run_plan_step(
+                            plan_id=plan_id,
+                            step=step_dicts[ready.step_id],
+                            # "" = looked up, none stored -> validation-only.
+                            model_sql=model_sql.get(ready.model, ""),
+                            approved_by=approved_by,
+                            cluster_override=cluster_override,
+                            held_locks=held_locks,
+                        )
+                    )
+                    in_flight[task] = ready.step_id
+
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+                finished: list[dict[str, Any]] = []
+                for task in sorted(done, key=lambda t: in_flight[t]):
+                    step_id = in_flight.pop(task)
+                    run_dict = task.result()
+                    results[step_id] = run_dict
+
+                    if run_dict["status"] == RunStatus.SUCCESS.value:
+                        scheduler.mark_succeeded(step_id)
+                    else:
+                        for cancelled in scheduler.mark_failed(step_id):
+                            results[cancelled.step_id] = self._cancelled_run_dict(
+                                plan_id, step_dicts[cancelled.step_id], upstream=step_dicts[step_id]["model"]
+                            )
+
+                    # Lock-blocked steps never ran; they are reported but
+                    # not persisted, matching the sequential behaviour.
+                    if run_dict["status"] != RunStatus.CANCELLED.value:
+                        finished.append(run_dict)
+
+                try:
+                    await self._record_step_results(plan_id, finished, cluster_override)
+                finally:
+                    await self._release_locks(held_locks, [r["step_id"] for r in finished])
+        finally:
+            # Unexpected error: stop outstanding work and never leave
+            # partition locks behind.
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+            await self._release_locks(held_locks, list(held_locks))
+
+        return results
+
+    async def _run_plan_step(
+        self,
+        *,
+        plan_id: str,
+        step: dict[str, Any],
+        model_sql: str | None,
+        approved_by: str | None,
+        cluster_override: str | None,
+        held_locks: dict[str, tuple[str, date, date]],
+    ) -> dict[str, Any]:
+        """Acquire the step's partition lock (if incremental) and execute it.
+
+        An acquired lock is registered in *held_locks* and left held; the
+        coordinator releases it once the run has been recorded.
+        """
+        model_name: str = step["model"]
+        step_id: str = step["step_id"]
+        run_type: str = step.get("run_type", "FULL_REFRESH")
+        input_range: dict[str, str] | None = step.get("input_range")
+
+        if run_type == "INCREMENTAL" and input_range:
+            range_start = date.fromisoformat(input_range["start"])
+            range_end = date.fromisoformat(input_range["end"])
+            async with self._db_lock:
                 locked = await self._lock_repo.acquire_lock(
                     model_name=model_name,
                     range_start=range_start,
                     range_end=range_end,
                     locked_by=approved_by or "api",
                 )
-                if not locked:
-                    logger.warning(
-                        "Could not acquire lock for %s [%s, %s]; skipping",
-                        model_name,
-                        range_start,
-                        range_end,
-                    )
-                    run_records.append(
-                        self._make_run_dict(
-                            plan_id=plan_id,
-                            step_id=step_id,
-                            model_name=model_name,
-                            status=RunStatus.CANCELLED,
-                            error_message="Lock acquisition failed",
-                            range_start=range_start,
-                            range_end=range_end,
-                        )
-                    )
-                    continue
-
-            # Execute the step.  Wrap in try/finally to guarantee lock
-            # release even when _execute_step() or downstream persistence
-            # raises an unexpected exception.
-            try:
-                run_dict = await self._execute_step(
+            if not locked:
+                logger.warning(
+                    "Could not acquire lock for %s [%s, %s]; skipping",
+                    model_name,
+                    range_start,
+                    range_end,
+                )
+                return self._make_run_dict(
                     plan_id=plan_id,
-                    step=step,
-                    cluster_override=cluster_override,
+                    step_id=step_id,
+                    model_name=model_name,
+                    status=RunStatus.CANCELLED,
+                    error_message="Lock acquisition failed",
+                    range_start=range_start,
+                    range_end=range_end,
                 )
-                run_records.append(run_dict)
+            held_locks[step_id] = (model_name, range_start, range_end)
 
-                # Record the run in the database.
-                await self._run_repo.create_run(run_dict)
+        return await self._execute_step(
+            plan_id=plan_id,
+            step=step,
+            cluster_override=cluster_override,
+            model_sql=model_sql,
+        )
 
-                # Update watermark on success.
-                if run_dict["status"] == RunStatus.SUCCESS.value and range_start and range_end:
-                    await self._watermark_repo.update_watermark(
-                        model_name=model_name,
-                        partition_start=range_start,
-                        partition_end=range_end,
-                        row_count=None,
-                    )
+    async def _record_step_results(
+        self,
+        plan_id: str,
+        run_dicts: list[dict[str, Any]],
+        cluster_override: str | None,
+    ) -> None:
+        """Persist the bookkeeping for a batch of finished steps.
 
-                # Emit telemetry.
-                started = run_dict.get("started_at")
-                finished = run_dict.get("finished_at")
-                if started and finished:
-                    runtime = (finished - started).total_seconds()
-                    await self._telemetry_repo.record(
-                        {
-                            "run_id": run_dict["run_id"],
-                            "model_name": model_name,
-                            "runtime_seconds": runtime,
-                            "shuffle_bytes": 0,
-                            "input_rows": 0,
-                            "output_rows": 0,
-                            "partition_count": 1,
-                        }
+        Cost is computed in memory before the insert so no follow-up UPDATE
+        is needed, and runs, watermarks and telemetry are each written with
+        a single statement/flush for the whole batch.
+        """
+        if not run_dicts:
+            return
+
+        cluster_size = cluster_override or "small"
+        watermarks: list[tuple[str, date, date, int | None]] = []
+        telemetry: list[dict[str, Any]] = []
+
+        for run_dict in run_dicts:
+            succeeded = run_dict["status"] == RunStatus.SUCCESS.value
+            started = run_dict.get("started_at")
+            finished = run_dict.get("finished_at")
+            runtime = (finished - started).total_seconds() if started and finished else None
+
+            if succeeded and runtime is not None:
+                try:
+                    run_dict["cost_usd"] = runtime * get_cost_rate(cluster_size)
+                except ValueError:
+                    logger.warning(
+                        "Unknown cluster size '%s'; skipping cost computation",
+                        cluster_size,
                     )
 
-                # Compute and store cost from runtime x cluster rate.
-                if run_dict["status"] == RunStatus.SUCCESS.value and started and finished:
-                    cluster_size = cluster_override or "small"
-                    try:
-                        rate = get_cost_rate(cluster_size)
-                        runtime = (finished - started).total_seconds()
-                        computed_cost = runtime * rate
-                        run_dict["cost_usd"] = computed_cost
-                        await self._run_repo.update_cost(run_dict["run_id"], computed_cost)
-                    except ValueError:
-                        logger.warning(
-                            "Unknown cluster size '%s'; skipping cost computation",
-                            cluster_size,
-                        )
+            if succeeded and run_dict.get("input_range_start") and run_dict.get("input_range_end"):
+                watermarks.append(
+                    (run_dict["model_name"], run_dict["input_range_start"], run_dict["input_range_end"], None)
+                )
+
+            if runtime is not None:
+                telemetry.append(
+                    {
+                        "run_id": run_dict["run_id"],
+                        "model_name": run_dict["model_name"],
+                        "runtime_seconds": runtime,
+                        "shuffle_bytes": 0,
+                        "input_rows": 0,
+                        "output_rows": 0,
+                        "partition_count": 1,
+                    }
+                )
+
+        async with self._db_lock:
+            await self._run_repo.create_runs(run_dicts)
+            if watermarks:
+                await self._watermark_repo.update_watermarks_batch(watermarks)
+            if telemetry:
+                await self._telemetry_repo.record_batch(telemetry)
 
-                # Record AI feedback outcome.
+            for run_dict in run_dicts:
                 try:
                     await self._feedback_service.record_execution_outcome(
                         plan_id=plan_id,
-                        step_id=step_id,
-                        model_name=model_name,
+                        step_id=run_dict["step_id"],
+                        model_name=run_dict["model_name"],
                         run_dict=run_dict,
                     )
                 except Exception:
                     logger.warning(
                         "Failed to record AI feedback for step %s",
-                        step_id[:12],
+                        run_dict["step_id"][:12],
                         exc_info=True,
                     )
-            finally:
-                # Release lock regardless of success or failure to prevent
-                # orphan locks from blocking future runs.
-                if locked and range_start and range_end:
-                    await self._lock_repo.release_lock(
-                        model_name=model_name,
-                        range_start=range_start,
-                        range_end=range_end,
+
+    async def _release_locks(
+        self,
+        held_locks: dict[str, tuple[str, date, date]],
+        step_ids: list[str],
+    ) -> None:
+        """Release the partition locks held for *step_ids*, if any."""
+        for step_id in step_ids:
+            lock = held_locks.pop(step_id, None)
+            if lock is None:
+                continue
+            model_name, range_start, range_end = lock
+            async with self._db_lock:
+                await self._lock_repo.release_lock(
+                    model_name=model_name,
+                    range_start=range_start,
+                    range_end=range_end,
+                )
+
+    async def _resolve_max_concurrency(self) -> int:
+        """Return the step concurrency limit for this tenant.
+
+        ``tenant_config.max_concurrent_steps`` wins when set; otherwise the
+        deployment-wide ``execution_max_concurrency`` setting applies.
+        """
+        try:
+            config = await self._tenant_config_repo.get()
+        except Exception:
+            logger.debug("Could not load tenant config for %s", self._tenant_id, exc_info=True)
+            config = None
+        override = getattr(config, "max_concurrent_steps", None)
+        if isinstance(override, int) and override >= 1:
+            return override
+        return self._settings.execution_max_concurrency
+
+    async def _fetch_model_sql_batch(self, model_names: list[str]) -> dict[str, str]:
+        """Return the latest canonical SQL for each model in one query.
+
+        Models without a stored version are absent from the result; the
+        local executor falls back to validation-only mode for them.
+        """
+        if not model_names:
+            return {}
+        try:
+            from core_engine.state.tables import ModelVersionTable
+            from sqlalchemy import func
+            from sqlalchemy import select as sa_select
+
+            ranked = (
+                sa_select(
+                    ModelVersionTable.model_name,
+                    ModelVersionTable.canonical_sql,
+                    func.row_number()
+                    .over(
+                        partition_by=ModelVersionTable.model_name,
+                        order_by=ModelVersionTable.created_at.desc(),
                     )
+                    .label("rn"),
+                )
+                .where(
+                    ModelVersionTable.tenant_id == self._tenant_id,
+                    ModelVersionTable.model_name.in_(model_names),
+                )
+                .subquery()
+            )
+            stmt = sa_select(ranked.c.model_name, ranked.c.canonical_sql).where(ranked.c.rn == 1)
+            result = await self._session.execute(stmt)
+            return {row.model_name: row.canonical_sql for row in result.all() if row.canonical_sql}
+        except Exception:
+            logger.debug("Could not prefetch canonical SQL for plan models", exc_info=True)
+            return {}
 
-        return run_records
+    def _cancelled_run_dict(
+        self,
+        plan_id: str,
+        step: dict[str, Any],
+        *,
+        upstream: str,
+    ) -> dict[str, Any]:
+        """Run record for a step skipped because an upstream step failed."""
+        input_range = step.get("input_range")
+        return self._make_run_dict(
+            plan_id=plan_id,
+            step_id=step["step_id"],
+            model_name=step["model"],
+            status=RunStatus.CANCELLED,
+            error_message=f"Upstream step for {upstream} did not succeed",
+            range_start=date.fromisoformat(input_range["start"]) if input_range else None,
+            range_end=date.fromisoformat(input_range["end"]) if input_range else None,
+        )
 
     # ------------------------------------------------------------------
     # Backfill
@@ -430,14 +734,16 @@ class ExecutionService:
         end_date: str,
         cluster_size: str | None = None,
         chunk_size_days: int = 7,
+        max_concurrent_chunks: int = 1,
     ) -> dict[str, Any]:
         """Run a chunked backfill with checkpoint-based resume.
 
         Splits the requested date range into chunks (default 7 days each),
-        executes them sequentially, and records progress in the
-        ``backfill_checkpoints`` table.  If a chunk fails, the backfill
-        is marked FAILED and can be resumed from the last completed chunk
-        via :meth:`resume_backfill`.
+        executes up to *max_concurrent_chunks* of them at a time, and
+        records progress in the ``backfill_checkpoints`` table.  If a chunk
+        fails, the backfill is marked FAILED and can be resumed via
+        :meth:`resume_backfill`, which re-runs only the chunks that did
+        not complete.
 
         Parameters
         ----------
@@ -451,6 +757,9 @@ class ExecutionService:
             Optional cluster size override.
         chunk_size_days:
             Number of days per chunk.  Must be >= 1.
+        max_concurrent_chunks:
+            Maximum number of chunks executing at once.  Must be >= 1.
+            Chunks never overlap, so each still holds its own range lock.
 
         Returns
         -------
@@ -468,6 +777,8 @@ class ExecutionService:
             raise ValueError("start_date must be <= end_date")
         if chunk_size_days < 1:
             raise ValueError("chunk_size_days must be >= 1")
+        if max_concurrent_chunks < 1:
+            raise ValueError("max_concurrent_chunks must be >= 1")
 
         # Compute chunks.
         chunks = self._compute_chunks(range_start, range_end, chunk_size_days)
@@ -499,32 +810,38 @@ class ExecutionService:
             total_chunks=len(chunks),
             cluster_size=cluster_size,
             plan_id=plan_id,
+            max_concurrent_chunks=max_concurrent_chunks,
         )
 
-        # Execute chunks sequentially.
         return await self._execute_chunks(
             backfill_id=backfill_id,
             model_name=model_name,
             plan_id=plan_id,
             chunks=chunks,
             cluster_size=cluster_size,
-            start_chunk_index=0,
+            progress=ChunkProgress(len(chunks)),
+            max_concurrent_chunks=max_concurrent_chunks,
         )
 
     async def resume_backfill(
         self,
         backfill_id: str,
+        max_concurrent_chunks: int | None = None,
     ) -> dict[str, Any]:
         """Resume a previously failed or interrupted chunked backfill.
 
         Loads the checkpoint, verifies it is in a resumable state (FAILED
-        or RUNNING), recomputes the remaining chunks, and continues
-        execution from the first chunk after ``completed_through``.
+        or RUNNING), and executes every chunk not yet recorded in the
+        checkpoint's completed-chunk bitmap.  Checkpoints written before
+        the bitmap existed resume from the chunk after ``completed_through``.
 
         Parameters
         ----------
         backfill_id:
             The backfill identifier to resume.
+        max_concurrent_chunks:
+            Optional concurrency override.  Defaults to the value the
+            backfill was started with.
 
         Returns
         -------
@@ -548,35 +865,40 @@ class ExecutionService:
                 f"Backfill {backfill_id} has unexpected status '{checkpoint.status}' and cannot be resumed"
             )
 
-        # Determine resume point.
-        if checkpoint.completed_through is not None:
-            resume_start = checkpoint.completed_through + timedelta(days=1)
+        if max_concurrent_chunks is None:
+            stored = checkpoint.max_concurrent_chunks
+            max_concurrent_chunks = stored if isinstance(stored, int) and stored >= 1 else 1
+        elif max_concurrent_chunks < 1:
+            raise ValueError("max_concurrent_chunks must be >= 1")
+
+        chunks = self._compute_chunks(
+            checkpoint.overall_start,
+            checkpoint.overall_end,
+            checkpoint.chunk_size_days,
+        )
+        bitmap = checkpoint.completed_chunk_bitmap
+        if isinstance(bitmap, str):
+            progress = ChunkProgress.from_bitmap(len(chunks), bitmap)
         else:
-            resume_start = checkpoint.overall_start
+            progress = ChunkProgress.from_completed_through(chunks, checkpoint.completed_through)
 
-        if resume_start > checkpoint.overall_end:
+        if progress.is_complete():
             # All chunks were actually completed -- mark it done.
             await self._checkpoint_repo.mark_completed(backfill_id)
             return {
                 "backfill_id": backfill_id,
                 "status": "COMPLETED",
-                "completed_chunks": checkpoint.total_chunks,
-                "total_chunks": checkpoint.total_chunks,
+                "completed_chunks": len(chunks),
+                "total_chunks": len(chunks),
                 "runs": [],
             }
 
-        # Recompute remaining chunks.
-        remaining_chunks = self._compute_chunks(
-            resume_start,
-            checkpoint.overall_end,
-            checkpoint.chunk_size_days,
-        )
-
         logger.info(
-            "Resuming backfill %s from %s (%d chunks remaining)",
+            "Resuming backfill %s (%d of %d chunks remaining, concurrency %d)",
             backfill_id[:12],
-            resume_start.isoformat(),
-            len(remaining_chunks),
+            len(progress.pending()),
+            len(chunks),
+            max_concurrent_chunks,
         )
 
         return await self._execute_chunks(
@@ -589,9 +911,10 @@ class ExecutionService:
                 checkpoint.overall_start.isoformat(),
                 checkpoint.overall_end.isoformat(),
             ),
-            chunks=remaining_chunks,
+            chunks=chunks,
             cluster_size=checkpoint.cluster_size,
-            start_chunk_index=checkpoint.completed_chunks,
+            progress=progress,
+            max_concurrent_chunks=max_concurrent_chunks,
         )
 
     async def _execute_chunks(
@@ -601,55 +924,137 @@ class ExecutionService:
         plan_id: str,
         chunks: list[tuple[date, date]],
         cluster_size: str | None,
-        start_chunk_index: int,
+        progress: ChunkProgress,
+        max_concurrent_chunks: int = 1,
     ) -> dict[str, Any]:
-        """Execute a series of date-range chunks sequentially.
-
-        For each chunk:
-        1. Build a synthetic step dict
-        2. Acquire a lock on the chunk's date range
-        3. Execute the step
-        4. Record the run
-        5. Update watermark on success
-        6. Record chunk audit entry
-        7. Update checkpoint progress
-        8. Release the lock
-
-        On failure, the chunk is recorded as FAILED, the checkpoint is
-        marked FAILED, and the method returns immediately (no further
-        chunks are executed).
+        """Execute the pending chunks of a backfill, up to N at a time.
+
+        *chunks* is the full, ordered chunk list of the backfill and
+        *progress* records which of them already succeeded; only the
+        pending ones are run.  Each chunk is handled by
+        :meth:`_run_chunk`, which locks its range, executes, records the
+        run and audit entry, and updates the checkpoint.
+
+        Watermarks are only advanced for chunks that join the contiguous
+        completed prefix, in chunk order, so the latest watermark never
+        moves backwards when chunks finish out of order.
+
+        On the first failure no further chunks are started; chunks already
+        in flight run to completion and are recorded, then the checkpoint
+        is marked FAILED.
         """
-        checkpoint = await self._checkpoint_repo.get(backfill_id)
-        total_chunks = checkpoint.total_chunks if checkpoint else len(chunks) + start_chunk_index
-        run_dicts: list[dict[str, Any]] = []
-        completed = start_chunk_index
+        total_chunks = len(chunks)
+        pending = progress.pending()
+        runs_by_chunk: dict[int, dict[str, Any]] = {}
+        error_msg: str | None = None
 
-        for i, (chunk_start, chunk_end) in enumerate(chunks):
-            chunk_num = start_chunk_index + i + 1
-            chunk_start_iso = chunk_start.isoformat()
-            chunk_end_iso = chunk_end.isoformat()
+        in_flight: dict[asyncio.Task[tuple[dict[str, Any] | None, str | None]], int] = {}
+        next_pos = 0
+        try:
+            while True:
+                while error_msg is None and next_pos < len(pending) and len(in_flight) < max_concurrent_chunks:
+                    index = pending[next_pos]
+                    next_pos += 1
+                    task = asyncio.create_task(
+                        self._run_chunk(
+                            backfill_id=backfill_id,
+                            model_name=model_name,
+                            plan_id=plan_id,
+                            chunks=chunks,
+                            index=index,
+                            cluster_size=cluster_size,
+                            progress=progress,
+                        )
+                    )
+                    in_flight[task] = index
+
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=in_flight.__getitem__):
+                    index = in_flight.pop(task)
+                    run_dict, chunk_error = task.result()
+                    if run_dict is not None:
+                        runs_by_chunk[index] = run_dict
+                    if chunk_error is not None and error_msg is None:
+                        error_msg = chunk_error
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
 
-            step_id = compute_deterministic_id(
-                model_name,
-                "chunk",
-                chunk_start_iso,
-                chunk_end_iso,
-            )
+        run_dicts = [runs_by_chunk[i] for i in sorted(runs_by_chunk)]
 
-            step: dict[str, Any] = {
-                "step_id": step_id,
-                "model": model_name,
-                "run_type": "INCREMENTAL",
-                "input_range": {
-                    "start": chunk_start_iso,
-                    "end": chunk_end_iso,
-                },
-                "depends_on": [],
-                "parallel_group": 0,
-                "reason": f"chunked backfill chunk {chunk_num}/{total_chunks}",
+        if error_msg is not None:
+            async with self._db_lock:
+                await self._checkpoint_repo.mark_failed(backfill_id, error_msg)
+            return {
+                "backfill_id": backfill_id,
+                "status": "FAILED",
+                "completed_chunks": progress.completed_count,
+                "total_chunks": total_chunks,
+                "runs": run_dicts,
+                "error": error_msg,
             }
 
-            # Acquire lock for this chunk's range.
+        # All chunks completed successfully.
+        async with self._db_lock:
+            await self._checkpoint_repo.mark_completed(backfill_id)
+
+        return {
+            "backfill_id": backfill_id,
+            "status": "COMPLETED",
+            "completed_chunks": progress.completed_count,
+            "total_chunks": total_chunks,
+            "runs": run_dicts,
+        }
+
+    async def _run_chunk(
+        self,
+        backfill_id: str,
+        model_name: str,
+        plan_id: str,
+        chunks: list[tuple[date, date]],
+        index: int,
+        cluster_size: str | None,
+        progress: ChunkProgress,
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """Lock, execute and record a single backfill chunk.
+
+        Returns ``(run_dict, error)``.  ``run_dict`` is ``None`` when the
+        range lock could not be acquired; ``error`` is ``None`` on success.
+        All database access happens under ``_db_lock`` because concurrent
+        chunks share one session.
+        """
+        chunk_start, chunk_end = chunks[index]
+        chunk_num = index + 1
+        chunk_start_iso = chunk_start.isoformat()
+        chunk_end_iso = chunk_end.isoformat()
+
+        step_id = compute_deterministic_id(
+            model_name,
+            "chunk",
+            chunk_start_iso,
+            chunk_end_iso,
+        )
+
+        step: dict[str, Any] = {
+            "step_id": step_id,
+            "model": model_name,
+            "run_type": "INCREMENTAL",
+            "input_range": {
+                "start": chunk_start_iso,
+                "end": chunk_end_iso,
+            },
+            "depends_on": [],
+            "parallel_group": 0,
+            "reason": f"chunked backfill chunk {chunk_num}/{len(chunks)}",
+        }
+
+        # Acquire lock for this chunk's range.
+        async with self._db_lock:
             locked = await self._lock_repo.acquire_lock(
                 model_name=model_name,
                 range_start=chunk_start,
@@ -666,115 +1071,87 @@ class ExecutionService:
                     status="FAILED",
                     error_message=error_msg,
                 )
-                await self._checkpoint_repo.mark_failed(backfill_id, error_msg)
-                return {
-                    "backfill_id": backfill_id,
-                    "status": "FAILED",
-                    "completed_chunks": completed,
-                    "total_chunks": total_chunks,
-                    "runs": run_dicts,
-                    "error": error_msg,
-                }
+                return None, error_msg
 
-            # Execute.  Wrap in try/finally to guarantee lock release even
-            # when _execute_step() or downstream persistence raises.
-            try:
-                chunk_started = datetime.now(UTC)
-                run_dict = await self._execute_step(
-                    plan_id=plan_id,
-                    step=step,
-                    cluster_override=cluster_size,
-                )
-                chunk_finished = datetime.now(UTC)
-                chunk_duration = (chunk_finished - chunk_started).total_seconds()
+        # Execute.  Wrap in try/finally to guarantee lock release even
+        # when _execute_step() or downstream persistence raises.
+        try:
+            chunk_started = datetime.now(UTC)
+            run_dict = await self._execute_step(
+                plan_id=plan_id,
+                step=step,
+                cluster_override=cluster_size,
+            )
+            chunk_duration = (datetime.now(UTC) - chunk_started).total_seconds()
+            succeeded = run_dict["status"] == RunStatus.SUCCESS.value
 
-                # Record run.
-                await self._run_repo.create_run(run_dict)
-                run_dicts.append(run_dict)
+            if succeeded:
+                started = run_dict.get("started_at")
+                finished = run_dict.get("finished_at")
+                if started and finished:
+                    try:
+                        rate = get_cost_rate(cluster_size or "small")
+                        run_dict["cost_usd"] = (finished - started).total_seconds() * rate
+                    except ValueError:
+                        pass
 
-                if run_dict["status"] == RunStatus.SUCCESS.value:
-                    # Update watermark.
-                    await self._watermark_repo.update_watermark(
-                        model_name=model_name,
-                        partition_start=chunk_start,
-                        partition_end=chunk_end,
-                        row_count=None,
-                    )
+            async with self._db_lock:
+                await self._run_repo.create_run(run_dict)
 
-                    # Compute cost.
-                    started = run_dict.get("started_at")
-                    finished = run_dict.get("finished_at")
-                    if started and finished:
-                        try:
-                            rate = get_cost_rate(cluster_size or "small")
-                            runtime = (finished - started).total_seconds()
-                            computed_cost = runtime * rate
-                            run_dict["cost_usd"] = computed_cost
-                            await self._run_repo.update_cost(run_dict["run_id"], computed_cost)
-                        except ValueError:
-                            pass
-
-                    # Audit: success.
+                if not succeeded:
+                    error_msg = run_dict.get("error_message") or "Chunk execution failed"
                     await self._audit_repo.record_chunk(
                         backfill_id=backfill_id,
                         model_name=model_name,
                         chunk_start=chunk_start,
                         chunk_end=chunk_end,
-                        status="SUCCESS",
+                        status="FAILED",
                         run_id=run_dict["run_id"],
+                        error_message=error_msg,
                         duration_seconds=chunk_duration,
                     )
+                    return run_dict, error_msg
 
-                    # Advance checkpoint.
-                    completed += 1
-                    await self._checkpoint_repo.update_progress(
-                        backfill_id=backfill_id,
-                        completed_through=chunk_end,
-                        completed_chunks=completed,
-                    )
-                else:
-                    # Chunk failed: record audit, mark checkpoint failed, stop.
-                    error_msg = run_dict.get("error_message", "Unknown error")
-                    await self._audit_repo.record_chunk(
-                        backfill_id=backfill_id,
+                await self._audit_repo.record_chunk(
+                    backfill_id=backfill_id,
+                    model_name=model_name,
+                    chunk_start=chunk_start,
+                    chunk_end=chunk_end,
+                    status="SUCCESS",
+                    run_id=run_dict["run_id"],
+                    duration_seconds=chunk_duration,
+                )
+
+                # Advance watermarks only across the contiguous completed
+                # prefix, in chunk order, so they stay monotonic.
+                advanced = progress.mark_done(index)
+                for done_index in advanced:
+                    done_start, done_end = chunks[done_index]
+                    await self._watermark_repo.update_watermark(
                         model_name=model_name,
-                        chunk_start=chunk_start,
-                        chunk_end=chunk_end,
-                        status="FAILED",
-                        run_id=run_dict["run_id"],
-                        error_message=error_msg,
-                        duration_seconds=chunk_duration,
+                        partition_start=done_start,
+                        partition_end=done_end,
+                        row_count=None,
                     )
-                    await self._checkpoint_repo.mark_failed(backfill_id, error_msg or "Chunk execution failed")
-
-                    return {
-                        "backfill_id": backfill_id,
-                        "status": "FAILED",
-                        "completed_chunks": completed,
-                        "total_chunks": total_chunks,
-                        "runs": run_dicts,
-                        "error": error_msg,
-                    }
-            finally:
-                # Release lock regardless of success or failure to prevent
-                # orphan locks from blocking future chunk executions.
+
+                prefix = progress.contiguous_prefix
+                await self._checkpoint_repo.update_progress(
+                    backfill_id=backfill_id,
+                    completed_through=chunks[prefix - 1][1] if prefix else None,
+                    completed_chunks=progress.completed_count,
+                    completed_chunk_bitmap=progress.to_bitmap(),
+                )
+            return run_dict, None
+        finally:
+            # Release lock regardless of success or failure to prevent
+            # orphan locks from blocking future chunk executions.
+            async with self._db_lock:
                 await self._lock_repo.release_lock(
                     model_name=model_name,
                     range_start=chunk_start,
                     range_end=chunk_end,
                 )
 
-        # All chunks completed successfully.
-        await self._checkpoint_repo.mark_completed(backfill_id)
-
-        return {
-            "backfill_id": backfill_id,
-            "status": "COMPLETED",
-            "completed_chunks": completed,
-            "total_chunks": total_chunks,
-            "runs": run_dicts,
-        }
-
     async def get_backfill_status(
         self,
         backfill_id: str,
@@ -868,12 +1245,14 @@ class ExecutionService:
         plan_id: str,
         step: dict[str, Any],
         cluster_override: str | None,
+        model_sql: str | None = None,
     ) -> dict[str, Any]:
         """Execute a single step and return a run record dict.
 
         In development mode (or when Databricks is not configured) the
         step is executed locally via DuckDB.  In production the Databricks
-        executor is used.
+        executor is used.  *model_sql* is the prefetched canonical SQL for
+        local execution; when omitted it is looked up on demand.
         """
         run_id = str(uuid4())
         model_name = step["model"]
@@ -901,6 +1280,8 @@ class ExecutionService:
                     step=step,
                     cluster_override=cluster_override,
                 )
+            elif model_sql is not None:
+                await self._execute_locally(step=step, model_sql=model_sql)
             else:
                 await self._execute_locally(step=step)
         except Exception as exc:
@@ -941,60 +1322,46 @@ class ExecutionService:
         step: dict[str, Any],
         cluster_override: str | None,
     ) -> None:
-        """Submit a step to Databricks and poll to completion."""
+        """Submit a step to Databricks and await completion without blocking the loop."""
         import os
 
-        from core_engine.executor import DatabricksExecutor
-
         host = os.environ["PLATFORM_DATABRICKS_HOST"]
         token = os.environ["PLATFORM_DATABRICKS_TOKEN"]
         warehouse_id = os.environ.get("PLATFORM_DATABRICKS_WAREHOUSE_ID")
 
-        executor = DatabricksExecutor(
-            host=host,
-            token=token,
-            warehouse_id=warehouse_id,
-            default_cluster_size=cluster_override or "small",
-        )
+        executor = _get_databricks_executor(self._tenant_id, host, token, warehouse_id)
 
-        plan_step = PlanStep(
-            step_id=step["step_id"],
-            model=step["model"],
-            run_type=RunType(step.get("run_type", "FULL_REFRESH")),
-            input_range=(DateRange(**step["input_range"]) if step.get("input_range") else None),
-            depends_on=step.get("depends_on", []),
-            parallel_group=step.get("parallel_group", 0),
-            reason=step.get("reason", ""),
-        )
+        plan_step = self._plan_step_from_dict(step)
 
         # The model SQL would normally be loaded from the repo; for the
         # control plane we pass the model name as the query identifier.
-        result = executor.execute_step(
+        result = await executor.execute_step(
             step=plan_step,
             sql=step["model"],
             parameters={},
+            cluster_size=cluster_override or "small",
         )
 
         if result.status == RunStatus.FAIL:
             raise RuntimeError(result.error_message or "Databricks step failed")
 
-    async def _execute_locally(self, step: dict[str, Any]) -> None:
+    async def _execute_locally(self, step: dict[str, Any], model_sql: str | None = None) -> None:
         """Execute a step using the local DuckDB executor.
 
         This is used in development environments where Databricks is
         not configured.  The execution transpiles the model SQL from
         Databricks dialect to DuckDB dialect via sqlglot, applies the
         SQL guard to the final SQL, and runs it against an in-memory
-        DuckDB instance.
+        DuckDB instance.  The DuckDB work runs in a worker thread so
+        concurrently scheduled steps do not block the event loop.
 
         If the model SQL references tables that do not exist in DuckDB,
         EXPLAIN is used as a validation fallback to at least prove the
         SQL parses and has a valid plan shape.
-        """
-        import duckdb
-        from core_engine.parser.sql_guard import assert_sql_safe
-        from core_engine.sql_toolkit import Dialect, get_sql_toolkit
 
+        *model_sql* may be supplied by callers that prefetched it; when
+        ``None`` the latest canonical SQL is read from ``model_versions``.
+        """
         model_name = step["model"]
         step_id = step["step_id"]
 
@@ -1008,30 +1375,31 @@ class ExecutionService:
         # The model_name is used as a lookup key.  If the model's SQL is
         # not available (e.g. the step was synthesized for a backfill), fall
         # back to a validation-only pass.
-        model_sql: str | None = None
-        try:
-            from core_engine.state.tables import ModelVersionTable
-            from sqlalchemy import select as sa_select
-
-            stmt = (
-                sa_select(ModelVersionTable.canonical_sql)
-                .where(
-                    ModelVersionTable.tenant_id == self._tenant_id,
-                    ModelVersionTable.model_name == model_name,
+        if model_sql is None:
+            try:
+                from core_engine.state.tables import ModelVersionTable
+                from sqlalchemy import select as sa_select
+
+                stmt = (
+                    sa_select(ModelVersionTable.canonical_sql)
+                    .where(
+                        ModelVersionTable.tenant_id == self._tenant_id,
+                        ModelVersionTable.model_name == model_name,
+                    )
+                    .order_by(ModelVersionTable.created_at.desc())
+                    .limit(1)
+                )
+                async with self._db_lock:
+                    result = await self._session.execute(stmt)
+                row = result.scalar_one_or_none()
+                if row:
+                    model_sql = row
+            except Exception:
+                logger.debug(
+                    "Could not fetch canonical SQL for model %s; proceeding with validation-only mode",
+                    model_name,
+                    exc_info=True,
                 )
-                .order_by(ModelVersionTable.created_at.desc())
-                .limit(1)
-            )
-            result = await self._session.execute(stmt)
-            row = result.scalar_one_or_none()
-            if row:
-                model_sql = row
-        except Exception:
-            logger.debug(
-                "Could not fetch canonical SQL for model %s; proceeding with validation-only mode",
-                model_name,
-                exc_info=True,
-            )
 
         if not model_sql:
             logger.info(
@@ -1040,6 +1408,15 @@ class ExecutionService:
             )
             return
 
+        await asyncio.to_thread(self._run_local_sql, model_name, model_sql)
+
+    @staticmethod
+    def _run_local_sql(model_name: str, model_sql: str) -> None:
+        """Guard, transpile and run *model_sql* in a sandboxed DuckDB (blocking)."""
+        import duckdb
+        from core_engine.parser.sql_guard import assert_sql_safe
+        from core_engine.sql_toolkit import Dialect, get_sql_toolkit
+
         # Apply SQL guard to the model SQL before execution.
         assert_sql_safe(model_sql)
 
@@ -1103,6 +1480,19 @@ class ExecutionService:
         finally:
             conn.close()
 
+    @staticmethod
+    def _plan_step_from_dict(step: dict[str, Any]) -> PlanStep:
+        """Rebuild a :class:`PlanStep` from its serialised plan JSON form."""
+        return PlanStep(
+            step_id=step["step_id"],
+            model=step["model"],
+            run_type=RunType(step.get("run_type", "FULL_REFRESH")),
+            input_range=(DateRange(**step["input_range"]) if step.get("input_range") else None),
+            depends_on=step.get("depends_on", []),
+            parallel_group=step.get("parallel_group", 0),
+            reason=step.get("reason", ""),
+        )
+
     @staticmethod
     def _make_run_dict(
         plan_id: str,
@@ -13,6 +13,7 @@ import logging
 from typing import TYPE_CHECKING, Any, cast
 
 import bcrypt
+from core_engine.crypto import run_crypto
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -194,16 +195,19 @@ class GitHubWebhookService:
         """
         from core_engine.state.tables import WebhookConfigTable
 
-        secret_hash = bcrypt.hashpw(
-            secret.encode("utf-8"),
-            bcrypt.gensalt(),
+        secret_hash = (
+            await run_crypto(
+                bcrypt.hashpw,
+                secret.encode("utf-8"),
+                bcrypt.gensalt(),
+            )
         ).decode("utf-8")
 
         # Encrypt the plaintext secret so the webhook receiver can later
         # decrypt it to compute the HMAC-SHA256 digest.
         secret_encrypted: str | None = None
         if self._vault is not None:
-            secret_encrypted = self._vault.encrypt(secret)
+            secret_encrypted = await self._vault.encrypt_async(secret)
         else:
             logger.warning(
                 "CredentialVault not available; webhook secret for repo=%s "
@@ -0,0 +1,434 @@
+"""Background job engine for plan generation.
+
+``POST /plans/generate`` holds the request open for the whole of
+:meth:`PlanService.generate_plan`, which for a large repository means
+seconds of model parsing, SQL guarding, DAG building and planning.  This
+module lets callers submit the same work as a *plan job* instead:
+
+* :meth:`PlanJobEngine.submit` registers a job and returns immediately;
+  the client polls ``GET /plans/jobs/{job_id}`` for status and the result.
+* The CPU-bound phases run in a bounded, lazily created
+  :class:`~concurrent.futures.ProcessPoolExecutor`, so no amount of
+  planning blocks the API event loop.  Git and database I/O stay on the
+  loop.
+* Free slots go to the tenant that has waited longest (round-robin), with
+  a cap on how many jobs one tenant may run at once, so a tenant submitting
+  a burst of plans cannot starve the others.
+* Identical requests -- same tenant, repository, base and target SHA --
+  that arrive while a matching job is still queued or running are attached
+  to that job rather than computed twice.
+
+Job state lives in process memory: it is a work queue, not a system of
+record.  The generated plan itself is persisted by :class:`PlanService`
+as usual, and finished jobs are evicted after a retention period.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+from core_engine.metering.collector import MeteringCollector
+from core_engine.metering.events import UsageEventType
+from core_engine.parser.sql_guard import UnsafeSQLError
+from core_engine.state.database import set_tenant_context
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from api.config import APISettings
+from api.services.ai_client import AIServiceClient
+from api.services.audit_service import AuditAction, AuditService
+from api.services.plan_service import PlanService
+
+logger = logging.getLogger(__name__)
+
+
+class PlanJobStatus(str, Enum):
+    """Lifecycle states of a plan job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class PlanJobQueueFullError(Exception):
+    """Raised when a tenant already has the maximum number of queued jobs."""
+
+
+@dataclass(slots=True)
+class PlanJob:
+    """A single plan-generation request and its outcome."""
+
+    job_id: str
+    tenant_id: str
+    repo_path: str
+    base_sha: str
+    target_sha: str
+    requested_by: str
+    status: PlanJobStatus = PlanJobStatus.QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    plan: dict[str, Any] | None = None
+    error: str | None = None
+    # HTTP status a synchronous ``/plans/generate`` would have returned.
+    error_status: int | None = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def dedup_key(self) -> tuple[str, str, str, str]:
+        return (self.tenant_id, self.repo_path, self.base_sha, self.target_sha)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (PlanJobStatus.SUCCEEDED, PlanJobStatus.FAILED)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise for the status endpoint; the plan is included once ready."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status.value,
+            "repo_path": self.repo_path,
+            "base_sha": self.base_sha,
+            "target_sha": self.target_sha,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "plan_id": self.plan.get("plan_id") if self.plan is not None else None,
+            "plan": self.plan,
+            "error": self.error,
+        }
+
+
+class PlanJobEngine:
+    """In-process plan job queue with a fair scheduler and a process pool.
+
+    Parameters
+    ----------
+    session_factory:
+        Factory for the database sessions each job opens.
+    ai_client:
+        AI engine client passed through to :class:`PlanService`.
+    settings:
+        Application settings.
+    metering:
+        Optional usage collector; plan runs are metered on success.
+    max_workers:
+        Size of the process pool and the global limit on running jobs.
+    max_running_per_tenant:
+        Most jobs one tenant may have running at the same time.
+    max_queued_per_tenant:
+        Most jobs one tenant may have waiting; further submissions raise
+        :class:`PlanJobQueueFullError`.
+    retention_seconds:
+        How long finished jobs remain pollable.
+    executor:
+        Executor for the CPU-bound phases.  Defaults to a ``spawn``
+        process pool created on first use; tests may inject another.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ai_client: AIServiceClient,
+        settings: APISettings,
+        *,
+        metering: MeteringCollector | None = None,
+        max_workers: int = 2,
+        max_running_per_tenant: int = 2,
+        max_queued_per_tenant: int = 20,
+        retention_seconds: float = 3600.0,
+        executor: Executor | None = None,
+    ) -> None:
+        if max_workers < 1 or max_running_per_tenant < 1 or max_queued_per_tenant < 1:
+            raise ValueError("Plan job limits must be at least 1")
+        self._session_factory = session_factory
+        self._ai = ai_client
+        self._settings = settings
+        self._metering = metering
+        self._max_workers = max_workers
+        self._max_running_per_tenant = max_running_per_tenant
+        self._max_queued_per_tenant = max_queued_per_tenant
+        self._retention_seconds = retention_seconds
+        self._executor = executor
+        self._owns_executor = executor is None
+
+        self._jobs: dict[str, PlanJob] = {}
+        self._in_flight: dict[tuple[str, str, str, str], PlanJob] = {}
+        # Per-tenant FIFO queues, running counts, and when each tenant was
+        # last given a slot (a monotonically increasing sequence number).
+        self._queues: dict[str, deque[PlanJob]] = {}
+        self._running: dict[str, int] = {}
+        self._last_dispatch: dict[str, int] = {}
+        self._dispatch_seq = 0
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        tenant_id: str,
+        repo_path: str,
+        base_sha: str,
+        target_sha: str,
+        *,
+        requested_by: str = "system",
+    ) -> tuple[PlanJob, bool]:
+        """Queue a plan job, or join an identical one already in flight.
+
+        Returns
+        -------
+        tuple[PlanJob, bool]
+            The job and whether it was newly created (``False`` when the
+            request was deduplicated onto an existing job).
+
+        Raises
+        ------
+        PlanJobQueueFullError
+            If the tenant's queue is full.
+        RuntimeError
+            If the engine has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("Plan job engine is shut down")
+        self._evict_expired()
+
+        key = (tenant_id, repo_path, base_sha, target_sha)
+        existing = self._in_flight.get(key)
+        if existing is not None:
+            logger.info("Plan job %s reused for duplicate request (tenant=%s)", existing.job_id, tenant_id)
+            return existing, False
+
+        queue = self._queues.get(tenant_id)
+        if queue is not None and len(queue) >= self._max_queued_per_tenant:
+            raise PlanJobQueueFullError(
+                f"Too many queued plan jobs for this tenant (limit {self._max_queued_per_tenant})"
+            )
+
+        job = PlanJob(
+            job_id=uuid.uuid4().hex,
+            tenant_id=tenant_id,
+            repo_path=repo_path,
+            base_sha=base_sha,
+            target_sha=target_sha,
+            requested_by=requested_by,
+        )
+        self._jobs[job.job_id] = job
+        self._in_flight[key] = job
+        if queue is None:
+            queue = self._queues[tenant_id] = deque()
+        queue.append(job)
+        logger.info("Plan job %s queued (tenant=%s)", job.job_id, tenant_id)
+        self._dispatch()
+        return job, True
+
+    def get(self, tenant_id: str, job_id: str) -> PlanJob | None:
+        """Return the job if it exists and belongs to *tenant_id*."""
+        self._evict_expired()
+        job = self._jobs.get(job_id)
+        if job is None or job.tenant_id != tenant_id:
+            return None
+        return job
+
+    async def wait(self, job: PlanJob, timeout: float | None = None) -> PlanJob:
+        """Wait until *job* finishes (or *timeout* elapses) and return it."""
+        try:
+            await asyncio.wait_for(job.done.wait(), timeout=timeout)
+        except TimeoutError:
+            pass
+        return job
+
+    async def close(self) -> None:
+        """Cancel outstanding jobs and shut down the owned process pool."""
+        self._closed = True
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        for queue in self._queues.values():
+            for job in queue:
+                self._finish(job, error="Plan job engine shut down", error_status=503)
+        self._queues.clear()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while capacity allows, round-robin by tenant."""
+        while sum(self._running.values()) < self._max_workers:
+            job = self._next_job()
+            if job is None:
+                return
+            self._running[job.tenant_id] = self._running.get(job.tenant_id, 0) + 1
+            job.status = PlanJobStatus.RUNNING
+            job.started_at = time.time()
+            task = asyncio.get_running_loop().create_task(self._run(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _next_job(self) -> PlanJob | None:
+        """Pop the head job of the tenant that has waited longest for a slot.
+
+        Among tenants with queued work and headroom under the per-tenant
+        cap, prefer the one with the fewest running jobs, then the one
+        dispatched least recently -- a round-robin that a tenant cannot
+        jump by draining and refilling its queue.
+        """
+        best: tuple[int, int] | None = None
+        chosen: str | None = None
+        for tenant_id in self._queues:
+            running = self._running.get(tenant_id, 0)
+            if running >= self._max_running_per_tenant:
+                continue
+            rank = (running, self._last_dispatch.get(tenant_id, -1))
+            if best is None or rank < best:
+                best, chosen = rank, tenant_id
+        if chosen is None:
+            return None
+
+        queue = self._queues[chosen]
+        job = queue.popleft()
+        if not queue:
+            del self._queues[chosen]
+        self._dispatch_seq += 1
+        self._last_dispatch[chosen] = self._dispatch_seq
+        return job
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            # ``spawn`` rather than ``fork``: the API process runs threads
+            # (metering flush, DB drivers) that must not be forked mid-lock.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _discard_executor(self, executor: Executor) -> None:
+        """Drop a broken owned pool so the next job spawns a fresh one.
+
+        Only *executor* is discarded: a concurrent job that hit the same
+        failure may already have replaced it with a healthy pool.
+        """
+        if self._owns_executor and self._executor is executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    async def _run(self, job: PlanJob) -> None:
+        executor = self._get_executor()
+        try:
+            plan = await self._generate(job, executor)
+        except asyncio.CancelledError:
+            self._finish(job, error="Plan job cancelled", error_status=503)
+            raise
+        except BrokenProcessPool:
+            # A worker died (OOM kill, segfault).  BrokenProcessPool is a
+            # RuntimeError, so it must be caught before the 422 branch.
+            logger.exception("Plan job %s lost its worker process", job.job_id)
+            self._discard_executor(executor)
+            self._finish(job, error="Plan worker pool crashed; retry the request", error_status=503)
+        except (ValueError, UnsafeSQLError) as exc:
+            self._finish(job, error=str(exc), error_status=400)
+        except RuntimeError as exc:
+            self._finish(job, error=str(exc), error_status=422)
+        except Exception:
+            logger.exception("Plan job %s failed", job.job_id)
+            self._finish(job, error="Plan generation failed", error_status=500)
+        else:
+            self._finish(job, plan=plan)
+        finally:
+            self._running[job.tenant_id] -= 1
+            if not self._running[job.tenant_id]:
+                del self._running[job.tenant_id]
+            if not self._closed:
+                self._dispatch()
+
+    async def _generate(self, job: PlanJob, executor: Executor) -> dict[str, Any]:
+        """Generate, meter and audit the plan for *job* in its own session."""
+        async with self._session_factory() as session:
+            await set_tenant_context(session, job.tenant_id)
+            service = PlanService(
+                session,
+                self._ai,
+                self._settings,
+                tenant_id=job.tenant_id,
+                metering=self._metering,
+                executor=executor,
+            )
+            plan = await service.generate_plan(
+                repo_path=job.repo_path,
+                base_sha=job.base_sha,
+                target_sha=job.target_sha,
+            )
+
+            if self._metering is not None:
+                self._metering.record_event(
+                    tenant_id=job.tenant_id,
+                    event_type=UsageEventType.PLAN_RUN,
+                    metadata={
+                        "plan_id": plan.get("plan_id"),
+                        "base_sha": job.base_sha,
+                        "target_sha": job.target_sha,
+                        "total_steps": plan.get("summary", {}).get("total_steps", 0),
+                        "job_id": job.job_id,
+                    },
+                )
+
+            audit = AuditService(session, tenant_id=job.tenant_id, actor=job.requested_by)
+            await audit.log(
+                AuditAction.PLAN_CREATED,
+                entity_type="plan",
+                entity_id=plan.get("plan_id"),
+                base_sha=job.base_sha,
+                target_sha=job.target_sha,
+            )
+            await session.commit()
+        return plan
+
+    def _finish(
+        self,
+        job: PlanJob,
+        *,
+        plan: dict[str, Any] | None = None,
+        error: str | None = None,
+        error_status: int | None = None,
+    ) -> None:
+        job.plan = plan
+        job.error = error
+        job.error_status = error_status
+        job.status = PlanJobStatus.FAILED if error is not None else PlanJobStatus.SUCCEEDED
+        job.finished_at = time.time()
+        if self._in_flight.get(job.dedup_key) is job:
+            del self._in_flight[job.dedup_key]
+        job.done.set()
+        logger.info("Plan job %s %s (tenant=%s)", job.job_id, job.status.value, job.tenant_id)
+
+    def _evict_expired(self) -> None:
+        cutoff = time.time() - self._retention_seconds
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished and job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
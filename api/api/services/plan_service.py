@@ -3,22 +3,29 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
 import time
+from collections.abc import Callable
+from concurrent.futures import Executor
 from datetime import date
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 from core_engine.contracts.schema_validator import (
     ContractValidationResult,
     validate_schema_contracts_batch,
 )
 from core_engine.diff.structural_diff import compute_structural_diff
-from core_engine.graph.dag_builder import build_dag
-from core_engine.loader.model_loader import load_models_from_directory
+from core_engine.git.object_reader import GitObjectReader
+from core_engine.graph.csr import build_csr_dag
+from core_engine.loader.model_loader import (
+    load_models_from_directory,
+    parse_yaml_header,
+)
 from core_engine.metering.collector import MeteringCollector
 from core_engine.metering.events import UsageEventType
 from core_engine.models.diff import DiffResult
@@ -32,6 +39,7 @@ from core_engine.parser.sql_guard import (
 )
 from core_engine.planner import generate_plan
 from core_engine.state.repository import (
+    LineageRepository,
     ModelRepository,
     PlanRepository,
     RunRepository,
@@ -99,6 +107,8 @@ PLAN_CACHE_TTL = 300
 
 _GIT_SHA_PATTERN = re.compile(r"^[0-9a-fA-F]{4,40}$")
 
+_T = TypeVar("_T")
+
 
 def _plan_cache_key_for(tenant_id: str, plan_id: str) -> str:
     """Canonical cache key for a plan — single source of truth."""
@@ -121,6 +131,58 @@ async def invalidate_plan_cache(redis: Any, tenant_id: str, plan_id: str) -> Non
         logger.debug("Plan cache DELETE failed (Redis unavailable)", exc_info=True)
 
 
+def _load_checked_models(models_dir: str) -> list[ModelDefinition]:
+    """Load the models under *models_dir* and run the SQL safety guard.
+
+    Module-level so it can run in a worker process.
+    """
+    model_list = load_models_from_directory(Path(models_dir))
+    PlanService._validate_models_sql_safety(model_list)
+    return model_list
+
+
+def _compute_plan(
+    model_list: list[ModelDefinition],
+    base_versions: dict[str, str],
+    watermarks: dict[str, tuple[Any, Any]],
+    run_stats: dict[str, dict[str, Any]],
+    base_sha: str,
+    target_sha: str,
+    as_of_date: date,
+) -> tuple[Plan, ContractValidationResult | None, float, list[tuple[str, str]]]:
+    """Run the CPU-bound planning phase: diff, DAG, contracts and planner.
+
+    Module-level so it can run in a worker process.  Returns the plan, the
+    contract validation result (``None`` when no model has an active
+    contract), the contract check duration in seconds and the DAG's
+    ``(upstream, downstream)`` edges for the lineage store.
+    """
+    target_versions = {m.name: m.content_hash for m in model_list}
+    diff_result: DiffResult = compute_structural_diff(base_versions, target_versions)
+    dag = build_csr_dag(model_list)
+
+    models_with_contracts = [m for m in model_list if m.contract_mode != SchemaContractMode.DISABLED]
+    contract_results: ContractValidationResult | None = None
+    check_duration = 0.0
+    if models_with_contracts:
+        check_start = time.monotonic()
+        contract_results = validate_schema_contracts_batch(models_with_contracts)
+        check_duration = time.monotonic() - check_start
+
+    plan = generate_plan(
+        models={m.name: m for m in model_list},
+        diff_result=diff_result,
+        dag=dag,
+        watermarks=watermarks,
+        run_stats=run_stats,
+        base=base_sha,
+        target=target_sha,
+        as_of_date=as_of_date,
+        contract_results=contract_results,
+    )
+    return plan, contract_results, check_duration, dag.edges
+
+
 class PlanService:
     """High-level service coordinating plan lifecycle operations.
 
@@ -132,6 +194,11 @@ class PlanService:
         HTTP client for the AI advisory engine.
     settings:
         Application settings.
+    executor:
+        Optional executor (typically a process pool owned by
+        :class:`~api.services.plan_job_service.PlanJobEngine`) for the
+        CPU-bound phases of :meth:`generate_plan`.  When ``None`` they run
+        in the default thread pool so the event loop stays responsive.
     """
 
     def __init__(
@@ -143,6 +210,7 @@ class PlanService:
         tenant_id: str = "default",
         metering: MeteringCollector | None = None,
         redis: Any | None = None,
+        executor: Executor | None = None,
     ) -> None:
         self._session = session
         self._ai = ai_client
@@ -150,8 +218,10 @@ class PlanService:
         self._tenant_id = tenant_id
         self._metering = metering
         self._redis = redis  # BL-094: optional Redis client for plan caching
+        self._executor = executor
         self._plan_repo = PlanRepository(session, tenant_id=tenant_id)
         self._model_repo = ModelRepository(session, tenant_id=tenant_id)
+        self._lineage_repo = LineageRepository(session, tenant_id=tenant_id)
         self._watermark_repo = WatermarkRepository(session, tenant_id=tenant_id)
         self._run_repo = RunRepository(session, tenant_id=tenant_id)
         self._tenant_config_repo = TenantConfigRepository(session, tenant_id=tenant_id)
@@ -171,15 +241,18 @@ class PlanService:
         Steps
         -----
         1. Validate the repository path.
-        2. Load model definitions from the repo.
-        3. Build the dependency DAG.
-        4. Identify changed files between ``base_sha`` and ``target_sha``.
-        5. Parse models at both commits to produce content-hash snapshots.
-        6. Compute structural diff.
-        7. Gather watermarks and historical stats from the database.
-        8. Invoke the interval planner.
-        9. Persist the plan.
-        10. Return the plan as a dictionary.
+        2. Load and safety-check model definitions from the repo.
+        3. Identify changed files between ``base_sha`` and ``target_sha``.
+        4. Read the changed models at the base commit for content hashes.
+        5. Gather watermarks and historical stats from the database.
+        6. Compute the structural diff, build the DAG, validate contracts
+           and invoke the interval planner.
+        7. Persist the plan and record the model dependency edges at
+           ``target_sha`` as the tenant's current lineage.
+        8. Return the plan as a dictionary.
+
+        Steps 2 and 6 are CPU-bound and run on the service's executor (see
+        :meth:`_offload`); everything else is I/O on the event loop.
         """
         try:
             from api.validation import resolve_repo_path_under_base
@@ -190,10 +263,10 @@ class PlanService:
             if not (repo / ".git").is_dir():
                 raise ValueError(f"Not a valid git repository: {repo_path}")
 
-            # Load models at the target commit ---------------------------------
+            # Load and safety-check models at the target commit (CPU-bound) ---
             models_dir = self._resolve_models_dir(repo)
-            model_list = load_models_from_directory(models_dir)
-            models_by_name: dict[str, ModelDefinition] = {m.name: m for m in model_list}
+            model_list = await self._offload(_load_checked_models, str(models_dir))
+            model_names = [m.name for m in model_list]
 
             # Meter model loading.
             if self._metering is not None:
@@ -203,43 +276,35 @@ class PlanService:
                     quantity=len(model_list),
                     metadata={
                         "repo_path": repo_path,
-                        "model_names": [m.name for m in model_list],
+                        "model_names": model_names,
                     },
                 )
 
-            # SQL safety check -- catch dangerous operations early -------------
-            self._validate_models_sql_safety(model_list)
-
-            # Build DAG ---------------------------------------------------------
-            dag = build_dag(model_list)
-
             # Identify changed SQL files between base and target ----------------
             changed_files = await self._git_changed_files(repo, base_sha, target_sha)
 
-            # Build content-hash snapshots at base and target -------------------
+            # Build content-hash snapshot at base -------------------------------
             base_versions = await self._build_version_map(repo, base_sha, changed_files)
-            target_versions: dict[str, str] = {m.name: m.content_hash for m in model_list}
-
-            # Structural diff ---------------------------------------------------
-            diff_result: DiffResult = compute_structural_diff(base_versions, target_versions)
 
             # Watermarks and historical stats — fetched in batch to avoid N+1 ----
-            model_name_list = list(models_by_name.keys())
-            watermarks: dict[str, tuple[Any, Any]] = await self._watermark_repo.get_watermarks_batch(
-                model_name_list
-            )
-            batch_stats = await self._run_repo.get_historical_stats_batch(model_name_list)
+            watermarks: dict[str, tuple[Any, Any]] = await self._watermark_repo.get_watermarks_batch(model_names)
+            batch_stats = await self._run_repo.get_historical_stats_batch(model_names)
             run_stats: dict[str, dict[str, Any]] = {
                 name: stats for name, stats in batch_stats.items() if stats["run_count"] > 0
             }
 
-            # Run schema contract validation for models with active contracts ---
-            models_with_contracts = [m for m in model_list if m.contract_mode != SchemaContractMode.DISABLED]
-            contract_results: ContractValidationResult | None = None
-            if models_with_contracts:
-                _check_start = time.monotonic()
-                contract_results = validate_schema_contracts_batch(models_with_contracts)
-                _check_duration = time.monotonic() - _check_start
+            # Diff, DAG, contracts and planning (CPU-bound) ---------------------
+            plan, contract_results, check_duration, dependency_edges = await self._offload(
+                _compute_plan,
+                model_list,
+                base_versions,
+                watermarks,
+                run_stats,
+                base_sha,
+                target_sha,
+                date.today(),
+            )
+            if contract_results is not None:
                 if contract_results.violations:
                     logger.info(
                         "Schema contract validation: %d violation(s) across %d model(s) (%d breaking)",
@@ -248,20 +313,7 @@ class PlanService:
                         contract_results.breaking_count,
                     )
                 # BL-139: push only when the engine actually ran.
-                await _push_check_engine_metrics(_check_duration, outcome="success")
-
-            # Generate plan ------------------------------------------------------
-            plan: Plan = generate_plan(
-                models=models_by_name,
-                diff_result=diff_result,
-                dag=dag,
-                watermarks=watermarks,
-                run_stats=run_stats,
-                base=base_sha,
-                target=target_sha,
-                as_of_date=date.today(),
-                contract_results=contract_results,
-            )
+                await _push_check_engine_metrics(check_duration, outcome="success")
 
             # Persist ------------------------------------------------------------
             plan_json_str = plan.model_dump_json(indent=2)
@@ -271,6 +323,7 @@ class PlanService:
                 target_sha=target_sha,
                 plan_json=plan_json_str,
             )
+            await self._lineage_repo.record_edges(target_sha, dependency_edges)
 
             # BL-094: Pre-warm the read cache so the first GET is a cache hit.
             plan_dict = plan.model_dump()
@@ -329,80 +382,71 @@ class PlanService:
         advisory: dict[str, Any] = {}
 
         steps = plan_data.get("steps", [])
-        step_model_names = [step.get("model", "") for step in steps if step.get("model", "")]
+        model_steps = [step for step in steps if step.get("model", "")]
+        step_model_names = [step["model"] for step in model_steps]
 
-        # Pre-load all per-model DB data in batch before entering the step loop.
+        # Pre-load all per-model DB data in batch before calling the engine.
         batch_stats = await self._run_repo.get_historical_stats_batch(step_model_names)
         batch_failure_rates = await self._run_repo.get_failure_rates_batch(step_model_names)
         batch_models = await self._model_repo.get_models_batch(step_model_names)
 
-        for step in steps:
-            model_name = step.get("model", "")
-            if not model_name:
-                continue
-
-            model_advisory: dict[str, Any] = {}
+        classify_items: list[dict[str, Any]] = []
+        cost_items: list[dict[str, Any]] = []
+        risk_items: list[dict[str, Any]] = []
+        for step in model_steps:
+            model_name = step["model"]
+            classify_items.append({"old_sql": "", "new_sql": step.get("reason", "")})
 
-            # Semantic classification ----------------------------------------
-            classification = await self._ai.semantic_classify(
-                old_sql="",
-                new_sql=step.get("reason", ""),
-                tenant_id=self._tenant_id,
-                llm_enabled=llm_enabled,
-                api_key=tenant_api_key,
-            )
-            if classification is not None:
-                model_advisory["semantic_classification"] = classification
-                if self._metering is not None:
-                    self._metering.record_event(
-                        tenant_id=self._tenant_id,
-                        event_type=UsageEventType.AI_CALL,
-                        metadata={"call_type": "semantic_classify", "model": model_name},
-                    )
-
-            # Cost prediction — use pre-loaded batch stats -------------------
             stats = batch_stats.get(model_name, {"avg_runtime_seconds": None, "avg_cost_usd": None, "run_count": 0})
-            avg_runtime = stats.get("avg_runtime_seconds")
-            cost_pred = await self._ai.predict_cost(
-                model_name=model_name,
-                partition_count=1,
-                historical_runtime_avg=avg_runtime,
-                data_volume=None,
-                cluster_size="small",
-                tenant_id=self._tenant_id,
-                llm_enabled=llm_enabled,
+            cost_items.append(
+                {
+                    "model_name": model_name,
+                    "partition_count": 1,
+                    "historical_runtime_avg": stats.get("avg_runtime_seconds"),
+                    "data_volume": None,
+                    "cluster_size": "small",
+                }
             )
-            if cost_pred is not None:
-                model_advisory["cost_prediction"] = cost_pred
-                if self._metering is not None:
-                    self._metering.record_event(
-                        tenant_id=self._tenant_id,
-                        event_type=UsageEventType.AI_CALL,
-                        metadata={"call_type": "predict_cost", "model": model_name},
-                    )
 
-            # Risk scoring — use pre-loaded batch model/failure data ---------
             model_row = batch_models.get(model_name)
             tags: list[str] = json.loads(model_row.tags) if model_row and model_row.tags else []
-            failure_rate = batch_failure_rates.get(model_name, 0.0)
-
-            risk = await self._ai.score_risk(
-                model_name=model_name,
-                downstream_depth=0,
-                sla_tags=[],
-                dashboard_deps=[],
-                model_tags=tags,
-                failure_rate=failure_rate,
-                tenant_id=self._tenant_id,
-                llm_enabled=llm_enabled,
+            risk_items.append(
+                {
+                    "model_name": model_name,
+                    "downstream_depth": 0,
+                    "sla_tags": [],
+                    "dashboard_deps": [],
+                    "model_tags": tags,
+                    "failure_rate": batch_failure_rates.get(model_name, 0.0),
+                }
             )
-            if risk is not None:
-                model_advisory["risk_score"] = risk
+
+        # The three advisory calls are independent: batch each one and run
+        # them concurrently.  Failed items come back as None.
+        classifications, cost_preds, risks = await asyncio.gather(
+            self._ai.semantic_classify_batch(
+                classify_items, tenant_id=self._tenant_id, llm_enabled=llm_enabled, api_key=tenant_api_key
+            ),
+            self._ai.predict_cost_batch(cost_items, tenant_id=self._tenant_id, llm_enabled=llm_enabled),
+            self._ai.score_risk_batch(risk_items, tenant_id=self._tenant_id, llm_enabled=llm_enabled),
+        )
+
+        for index, model_name in enumerate(step_model_names):
+            model_advisory: dict[str, Any] = {}
+            for key, call_type, results in (
+                ("semantic_classification", "semantic_classify", classifications),
+                ("cost_prediction", "predict_cost", cost_preds),
+                ("risk_score", "score_risk", risks),
+            ):
+                result = results[index] if index < len(results) else None
+                if result is None:
+                    continue
+                model_advisory[key] = result
                 if self._metering is not None:
                     self._metering.record_event(
                         tenant_id=self._tenant_id,
                         event_type=UsageEventType.AI_CALL,
-                        metadata={"call_type": "score_risk", "model": model_name},
+                        metadata={"call_type": call_type, "model": model_name},
                     )
 
             if model_advisory:
@@ -532,6 +576,13 @@ class PlanService:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _offload(self, fn: Callable[..., _T], *args: Any) -> _T:
+        """Run the blocking callable *fn* off the event loop."""
+        if self._executor is None:
+            return await asyncio.to_thread(fn, *args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
     @staticmethod
     def _validate_models_sql_safety(
         models: list[ModelDefinition],
@@ -595,28 +646,25 @@ class PlanService:
 
         Only models whose files appear in *changed_files* are included,
         so newly-added models (absent from the base commit) are naturally
-        excluded.
+        excluded.  All files are read through a single ``git cat-file
+        --batch`` process rather than one ``git show`` per file.
         """
+        sql_files = [path for path in changed_files if path.endswith(".sql")]
+        if not sql_files:
+            return {}
+
+        def _read() -> dict[str, str | None]:
+            with GitObjectReader(repo, timeout=15.0) as reader:
+                return reader.read_blobs(commit_sha, sql_files)
+
+        contents = await asyncio.to_thread(_read)
+
         version_map: dict[str, str] = {}
-        for file_path in changed_files:
-            if not file_path.endswith(".sql"):
-                continue
-            proc = await asyncio.create_subprocess_exec(
-                "git", "show", f"{commit_sha}:{file_path}",
-                cwd=str(repo),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _stderr = await asyncio.wait_for(proc.communicate(), timeout=15.0)
-            if proc.returncode != 0:
+        for sql_content in contents.values():
+            if sql_content is None:
                 # File did not exist at that commit (new file).
                 continue
-            sql_content = stdout.decode()
             try:
-                import hashlib
-
-                from core_engine.loader.model_loader import parse_yaml_header
-
                 header = parse_yaml_header(sql_content)
                 name = header.get("name", "")
                 if name:
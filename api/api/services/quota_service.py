@@ -10,24 +10,35 @@ Tier defaults::
     team:       plans=1_000, ai=5_000,  api=100_000
     enterprise: unlimited
 
+Usage is read from per-month counters (``usage_counters``) maintained by
+the metering sink, so a check costs the same on the last day of the month
+as on the first.  :class:`UsageCounterReconciler` periodically corrects
+counters that have drifted from ``usage_events``.
+
 Grace period: checks are pre-execution.  In-flight operations complete
 even if a quota boundary is crossed during execution.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from datetime import UTC, datetime
 from typing import Any, cast
 
 from core_engine.state.repository import (
     LLMUsageLogRepository,
     QuotaRepository,
     TenantConfigRepository,
+    UsageCounterRepository,
     UserRepository,
 )
 from core_engine.state.tables import BillingCustomerTable
 from sqlalchemy import select, text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from api.services.redis_client import get_redis_client
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +67,20 @@ _TIER_DEFAULTS: dict[str, dict[str, int | None]] = {
     },
 }
 
+_QUOTA_FIELDS: dict[str, str] = {
+    "plan_run": "plan_quota_monthly",
+    "ai_call": "ai_quota_monthly",
+    "api_request": "api_quota_monthly",
+}
+
+# How long a tenant that hit a quota is refused from the Redis cache before
+# the counter is consulted again (so a plan upgrade takes effect promptly).
+_EXHAUSTED_TTL_SECONDS = 60
+
+
+def _exceeded_message(event_type: str, current: int, limit: int) -> str:
+    return f"Monthly {event_type} quota exceeded ({current}/{limit}). Upgrade your plan for higher limits."
+
 
 class QuotaService:
     """Pre-execution quota enforcement for tenant-scoped operations.
@@ -96,9 +121,18 @@ class QuotaService:
     ) -> tuple[bool, str | None]:
         """Atomically check and reserve a quota slot for *event_type*.
 
-        Acquires a PostgreSQL advisory lock scoped to the current
-        transaction so that concurrent requests for the same tenant
-        and event type cannot both pass the quota check.
+        The reservation is a single conditional ``UPDATE ... RETURNING``
+        on the tenant's monthly usage counter, so concurrent requests for
+        the same tenant and event type cannot both take the last slot and
+        no advisory lock is needed.  The slot is consumed when the usage
+        event for the operation is recorded with ``reserved=1``.  A caller whose operation
+        fails before then must hand the slot back with
+        :meth:`release_reservation`; slots that are never returned are
+        cleared by :class:`UsageCounterReconciler` once they go stale.
+
+        Once a tenant is over quota the denial is cached in Redis (when
+        configured) for :data:`_EXHAUSTED_TTL_SECONDS`, so repeated
+        requests are refused without touching the database.
 
         Parameters
         ----------
@@ -111,35 +145,63 @@ class QuotaService:
             ``(allowed, reason)`` where *allowed* is ``True`` if the
             operation may proceed.
         """
-        quota_field_map = {
-            "plan_run": "plan_quota_monthly",
-            "ai_call": "ai_quota_monthly",
-            "api_request": "api_quota_monthly",
-        }
-        quota_field = quota_field_map.get(event_type)
+        quota_field = _QUOTA_FIELDS.get(event_type)
         if quota_field is None:
             raise ValueError(f"Unknown event_type for quota reservation: {event_type}")
 
-        # Serialise concurrent checks for the same tenant + event type.
-        await self._acquire_advisory_lock(event_type)
+        redis = await get_redis_client()
+        exhausted_key = self._exhausted_key(event_type)
+        if redis is not None:
+            try:
+                cached = await redis.get(exhausted_key)
+            except Exception:
+                logger.warning("Redis quota lookup failed; using the database", exc_info=True)
+                cached = None
+            if cached is not None:
+                current, limit = (int(part) for part in cached.split("/"))
+                return False, _exceeded_message(event_type, current, limit)
 
         limit = await self._get_effective_quota(quota_field)
         if limit is None:
             return True, None
 
-        current = await self._quota_repo.get_monthly_event_count(event_type)
-        if current >= limit:
-            msg = f"Monthly {event_type} quota exceeded ({current}/{limit}). Upgrade your plan for higher limits."
-            logger.warning(
-                "Quota exceeded: tenant=%s %s=%d/%d",
-                self._tenant_id,
-                event_type,
-                current,
-                limit,
-            )
-            return False, msg
+        reserved, current = await self._quota_repo.reserve(event_type, limit)
+        if reserved:
+            return True, None
 
-        return True, None
+        logger.warning(
+            "Quota exceeded: tenant=%s %s=%d/%d",
+            self._tenant_id,
+            event_type,
+            current,
+            limit,
+        )
+        if redis is not None:
+            try:
+                await redis.set(exhausted_key, f"{current}/{limit}", ex=_EXHAUSTED_TTL_SECONDS)
+            except Exception:
+                logger.warning("Redis quota cache write failed", exc_info=True)
+        return False, _exceeded_message(event_type, current, limit)
+
+    async def release_reservation(self, event_type: str, quantity: int = 1) -> None:
+        """Return a slot taken by :meth:`check_and_reserve` after a failed operation.
+
+        Also drops any cached Redis denial for *event_type*, since the
+        released slot may bring the tenant back under quota.
+        """
+        if event_type not in _QUOTA_FIELDS:
+            raise ValueError(f"Unknown event_type for quota reservation: {event_type}")
+        await self._quota_repo.release(event_type, quantity)
+
+        redis = await get_redis_client()
+        if redis is not None:
+            try:
+                await redis.delete(self._exhausted_key(event_type))
+            except Exception:
+                logger.warning("Redis quota cache invalidation failed", exc_info=True)
+
+    def _exhausted_key(self, event_type: str) -> str:
+        return f"quota:exhausted:{self._tenant_id}:{event_type}:{datetime.now(UTC):%Y%m}"
 
     async def _get_effective_quota(self, quota_field: str) -> int | None:
         """Resolve effective quota: explicit config > tier default > unlimited.
@@ -343,12 +405,7 @@ class QuotaService:
             ``(remaining_count, monthly_limit)`` where *remaining_count*
             is ``max(0, limit - current_usage)``.
         """
-        quota_field_map = {
-            "plan_run": "plan_quota_monthly",
-            "ai_call": "ai_quota_monthly",
-            "api_request": "api_quota_monthly",
-        }
-        quota_field = quota_field_map.get(event_type)
+        quota_field = _QUOTA_FIELDS.get(event_type)
         if quota_field is None:
             return None, None
         limit = await self._get_effective_quota(quota_field)
@@ -408,3 +465,82 @@ class QuotaService:
         }
 
         return {"quotas": quotas, "llm_budget": llm_budget, "seats": seats}
+
+
+class UsageCounterReconciler:
+    """Background task that corrects drifted monthly usage counters.
+
+    Counters are kept in step with ``usage_events`` by the metering sink;
+    this periodically compares the current month's counters with the
+    events, corrects the ones that disagree and clears reservations
+    abandoned by operations that never recorded usage.
+
+    Every replica runs the loop, but a pass only proceeds on the replica
+    holding the reconciliation advisory lock, and the first pass waits one
+    interval so a rolling restart does not trigger a pass per replica.
+
+    Parameters
+    ----------
+    session_factory:
+        An ``async_sessionmaker`` used to open one session per pass.
+    interval_seconds:
+        Time between reconciliation passes.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval_seconds: float = 3600.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._interval = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the reconciliation loop is active."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the reconciliation background task."""
+        if self.running:
+            logger.warning("UsageCounterReconciler already running; ignoring start()")
+            return
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("UsageCounterReconciler started (every %.0fs)", self._interval)
+
+    async def stop(self) -> None:
+        """Stop the reconciliation task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("UsageCounterReconciler stopped")
+
+    async def reconcile_once(self) -> int:
+        """Reconcile the current month's counters; return how many drifted.
+
+        Returns 0 without touching the counters when another replica is
+        already reconciling.
+        """
+        async with self._session_factory() as session:
+            repo = UsageCounterRepository(session)
+            if not await repo.try_lock_reconciliation():
+                logger.debug("Usage counter reconciliation running elsewhere; skipping")
+                return 0
+            drifted = await repo.reconcile()
+            await session.commit()
+        if drifted:
+            logger.warning("Usage counter reconciliation corrected %d counter(s)", drifted)
+        return drifted
+
+    async def _run_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.reconcile_once()
+            except (OperationalError, InterfaceError):
+                logger.exception("UsageCounterReconciler database error")
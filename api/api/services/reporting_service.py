@@ -1,7 +1,8 @@
 """Tenant-scoped reporting service for cost, usage, and LLM analytics.
 
-Supports date-range queries, multiple grouping modes, CSV/JSON export,
-and period-over-period comparison reports.
+Supports date-range queries, multiple grouping modes, CSV/JSON/NDJSON
+export (streamed, optionally gzipped), and period-over-period comparison
+reports.
 """
 
 from __future__ import annotations
@@ -10,11 +11,15 @@ import csv
 import io
 import json
 import logging
+import textwrap
+import zlib
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
 from datetime import UTC, datetime
 from typing import Any
 
+from core_engine.state.database import set_tenant_context
 from core_engine.state.repository import ReportingRepository
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 logger = logging.getLogger(__name__)
 
@@ -41,8 +46,152 @@ def _sanitize_csv_value(value: Any) -> Any:
 # Format / report-type validation
 # ---------------------------------------------------------------------------
 
-_VALID_FORMATS = frozenset({"csv", "json"})
+_VALID_FORMATS = frozenset({"csv", "json", "ndjson"})
 _VALID_REPORT_TYPES = frozenset({"cost", "llm", "usage"})
+# Raw usage events are export-only: they have no summary report.
+_EXPORT_REPORT_TYPES = _VALID_REPORT_TYPES | {"events"}
+
+_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def export_file_info(report_type: str, fmt: str, *, compress: bool = False) -> tuple[str, str]:
+    """Return ``(content_type, filename)`` for an export.
+
+    Raises
+    ------
+    ValueError
+        If *report_type* or *fmt* is not supported.
+    """
+    if fmt not in _VALID_FORMATS:
+        raise ValueError(f"Unsupported export format '{fmt}'. Valid: {sorted(_VALID_FORMATS)}")
+    if report_type not in _EXPORT_REPORT_TYPES:
+        raise ValueError(f"Unknown report type: {report_type}")
+    date_str = datetime.now(UTC).strftime("%Y%m%d")
+    filename = f"ironlayer_{report_type}_report_{date_str}.{fmt}"
+    if compress:
+        return "application/gzip", f"{filename}.gz"
+    return _CONTENT_TYPES[fmt], filename
+
+
+# ---------------------------------------------------------------------------
+# Incremental encoders
+# ---------------------------------------------------------------------------
+
+# Encoded output is handed to the response in pieces of about this size:
+# large enough to keep per-chunk overhead low, small enough that memory
+# stays flat.  Each piece is only produced once the previous one has been
+# written to the client, so a slow reader throttles the database cursor.
+_EXPORT_CHUNK_CHARS = 64 * 1024
+
+
+async def _encode_csv(rows: AsyncIterable[dict[str, Any]]) -> AsyncIterator[str]:
+    """CSV with a header taken from the first row; nothing for no rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    fieldnames: list[str] | None = None
+    async for row in rows:
+        if fieldnames is None:
+            fieldnames = list(row.keys())
+            writer.writerow(fieldnames)
+        writer.writerow([_sanitize_csv_value(row.get(k, "")) for k in fieldnames])
+        if buffer.tell() >= _EXPORT_CHUNK_CHARS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+async def _encode_ndjson(rows: AsyncIterable[dict[str, Any]]) -> AsyncIterator[str]:
+    """One JSON object per line."""
+    parts: list[str] = []
+    size = 0
+    async for row in rows:
+        line = json.dumps(row, default=str) + "\n"
+        parts.append(line)
+        size += len(line)
+        if size >= _EXPORT_CHUNK_CHARS:
+            yield "".join(parts)
+            parts, size = [], 0
+    if parts:
+        yield "".join(parts)
+
+
+async def _encode_json(rows: AsyncIterable[dict[str, Any]]) -> AsyncIterator[str]:
+    """``{"items": [...], "exported_at": ...}``, written item by item.
+
+    The output is byte-for-byte what ``json.dumps(..., indent=2)`` produces
+    for the whole document.
+    """
+    parts: list[str] = ['{\n  "items": [']
+    size = 0
+    separator = "\n"
+    async for row in rows:
+        item = separator + textwrap.indent(json.dumps(row, indent=2, default=str), "    ")
+        separator = ",\n"
+        parts.append(item)
+        size += len(item)
+        if size >= _EXPORT_CHUNK_CHARS:
+            yield "".join(parts)
+            parts, size = [], 0
+    exported_at = datetime.now(UTC).isoformat()
+    parts.append("]" if separator == "\n" else "\n  ]")
+    parts.append(f',\n  "exported_at": {json.dumps(exported_at)}\n}}')
+    yield "".join(parts)
+
+
+_ENCODERS = {"csv": _encode_csv, "json": _encode_json, "ndjson": _encode_ndjson}
+
+
+async def _encode_export(
+    rows: AsyncIterable[dict[str, Any]],
+    fmt: str,
+    *,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """Encode *rows* as *fmt* bytes, gzip-compressing on the fly if asked."""
+    # wbits=31 selects the gzip container (header and CRC trailer).
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    async for text in _ENCODERS[fmt](rows):
+        data = text.encode("utf-8")
+        if compressor is not None:
+            data = compressor.compress(data)
+        if data:
+            yield data
+    if compressor is not None:
+        yield compressor.flush()
+
+
+async def _aiter(items: Iterable[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    for item in items:
+        yield item
+
+
+async def stream_export(
+    session_factory: async_sessionmaker[AsyncSession],
+    tenant_id: str,
+    report_type: str,
+    since: datetime,
+    until: datetime,
+    fmt: str = "csv",
+    *,
+    compress: bool = False,
+) -> AsyncIterator[bytes]:
+    """Stream an export in its own tenant-scoped session.
+
+    A ``StreamingResponse`` body runs after request-scoped dependencies
+    have closed their sessions, so the export opens (and closes) one of
+    its own for the lifetime of the stream.
+    """
+    async with session_factory() as session:
+        await set_tenant_context(session, tenant_id)
+        service = ReportingService(session, tenant_id)
+        async for chunk in service.export_stream(report_type, since, until, fmt, compress=compress):
+            yield chunk
 
 
 class ReportingService:
@@ -132,14 +281,17 @@ class ReportingService:
         until: datetime,
         fmt: str = "csv",
     ) -> tuple[bytes, str, str]:
-        """Export report data as CSV or JSON bytes.
+        """Export report data as CSV, JSON or NDJSON bytes held in memory.
+
+        Convenient for small reports; use :meth:`export_stream` (or
+        :func:`stream_export`) for anything that may be large.
 
         Parameters
         ----------
         report_type:
             One of ``"cost"``, ``"usage"``, ``"llm"``.
         fmt:
-            ``"csv"`` or ``"json"``.
+            ``"csv"``, ``"json"`` or ``"ndjson"``.
 
         Returns
         -------
@@ -167,25 +319,36 @@ class ReportingService:
         else:
             raise ValueError(f"Unknown report type: {report_type}")
 
-        date_str = datetime.now(UTC).strftime("%Y%m%d")
-        base_name = f"ironlayer_{report_type}_report_{date_str}"
-
-        if fmt == "json":
-            data = json.dumps({"items": items, "exported_at": datetime.now(UTC).isoformat()}, indent=2).encode("utf-8")
-            return data, "application/json", f"{base_name}.json"
-
-        # CSV export.
-        if not items:
-            return b"", "text/csv", f"{base_name}.csv"
-
-        output = io.StringIO()
-        fieldnames = list(items[0].keys())
-        writer = csv.writer(output)
-        writer.writerow(fieldnames)
-        for row in items:
-            writer.writerow([_sanitize_csv_value(row.get(k, "")) for k in fieldnames])
-        data = output.getvalue().encode("utf-8")
-        return data, "text/csv", f"{base_name}.csv"
+        content_type, filename = export_file_info(report_type, fmt)
+        data = b"".join([chunk async for chunk in _encode_export(_aiter(items), fmt)])
+        return data, content_type, filename
+
+    async def export_stream(
+        self,
+        report_type: str,
+        since: datetime,
+        until: datetime,
+        fmt: str = "csv",
+        *,
+        compress: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """Stream an export as encoded (optionally gzipped) byte chunks.
+
+        Rows come from a server-side cursor and are encoded as they
+        arrive, so memory use does not grow with the size of the export.
+        Supports the ``"events"`` report type (raw usage events) in
+        addition to the summary reports.
+
+        Raises
+        ------
+        ValueError
+            If *report_type* or *fmt* is not supported (raised on first
+            iteration).
+        """
+        export_file_info(report_type, fmt)
+        rows = self._repo.stream_export_rows(report_type, since, until)
+        async for chunk in _encode_export(rows, fmt, compress=compress):
+            yield chunk
 
     async def comparison_report(
         self,
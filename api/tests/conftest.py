@@ -181,6 +181,19 @@ def mock_ai_client() -> AsyncMock:
     )
     client.health_check = AsyncMock(return_value=True)
     client.close = AsyncMock()
+
+    # Batch methods fan out to the single-item mocks (looked up at call
+    # time, so tests that replace e.g. ``client.predict_cost`` still apply).
+    def _batched(single_name: str) -> AsyncMock:
+        async def _call(items: list[dict[str, Any]], **options: Any) -> list[Any]:
+            single = getattr(client, single_name)
+            return [await single(**item, **options) for item in items]
+
+        return AsyncMock(side_effect=_call)
+
+    client.semantic_classify_batch = _batched("semantic_classify")
+    client.predict_cost_batch = _batched("predict_cost")
+    client.score_risk_batch = _batched("score_risk")
     return client
 
 
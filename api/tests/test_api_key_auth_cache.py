@@ -0,0 +1,176 @@
+"""Tests for cached API key validation and write-behind ``last_used_at``.
+
+Covers:
+- _APIKeyCache: hits, TTL expiry, invalidation by key ID.
+- _APIKeyUsageBuffer: coalescing, one bulk update per tenant, requeue on failure.
+- invalidate_api_key publishes a Redis revocation marker.
+- _api_key_revoked_elsewhere consults Redis and fails safe on errors.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from api.middleware import auth
+from api.middleware.auth import (
+    _api_key_revoked_elsewhere,
+    _APIKeyCache,
+    _APIKeyIdentity,
+    _APIKeyUsageBuffer,
+    invalidate_api_key,
+)
+
+_IDENTITY = _APIKeyIdentity(
+    key_id="key-1",
+    tenant_id="tenant-a",
+    user_id="user-1",
+    scopes=["read"],
+    role="service",
+)
+
+
+def _session_factory(session: AsyncMock):
+    @asynccontextmanager
+    async def _factory():
+        yield session
+
+    return _factory
+
+
+# ---------------------------------------------------------------------------
+# _APIKeyCache
+# ---------------------------------------------------------------------------
+
+
+class TestAPIKeyCache:
+    def test_hit_and_miss(self) -> None:
+        cache = _APIKeyCache()
+        cache.set("hash-1", _IDENTITY)
+        assert cache.get("hash-1") == _IDENTITY
+        assert cache.get("hash-2") is None
+
+    def test_expired_entry_is_a_miss(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache = _APIKeyCache(ttl_seconds=1.0)
+        cache.set("hash-1", _IDENTITY)
+
+        original = time.monotonic
+        monkeypatch.setattr(time, "monotonic", lambda: original() + 2.0)
+
+        assert cache.get("hash-1") is None
+
+    def test_invalidate_by_key_id(self) -> None:
+        cache = _APIKeyCache()
+        other = _APIKeyIdentity("key-2", "tenant-a", "user-2", ["read"], "service")
+        cache.set("hash-1", _IDENTITY)
+        cache.set("hash-2", other)
+
+        cache.invalidate("key-1")
+
+        assert cache.get("hash-1") is None
+        assert cache.get("hash-2") == other
+
+    def test_bounded_size(self) -> None:
+        cache = _APIKeyCache(max_entries=2)
+        for i in range(5):
+            cache.set(f"hash-{i}", _IDENTITY)
+        assert len(cache._cache) <= 2
+        assert cache.get("hash-4") == _IDENTITY
+
+
+# ---------------------------------------------------------------------------
+# _APIKeyUsageBuffer
+# ---------------------------------------------------------------------------
+
+
+class TestAPIKeyUsageBuffer:
+    @pytest.mark.asyncio
+    async def test_coalesces_and_writes_one_update_per_tenant(self) -> None:
+        session = AsyncMock()
+        buffer = _APIKeyUsageBuffer(_session_factory(session))
+        for _ in range(100):
+            buffer.record("key-1", "tenant-a")
+        buffer.record("key-2", "tenant-a")
+        buffer.record("key-3", "tenant-b")
+
+        with patch("core_engine.state.repository.APIKeyRepository") as repo_cls:
+            repo_cls.return_value.record_last_used = AsyncMock(return_value=1)
+            written = await buffer.flush()
+
+        assert written == 3
+        tenants = sorted(call.kwargs["tenant_id"] for call in repo_cls.call_args_list)
+        assert tenants == ["tenant-a", "tenant-b"]
+        batches = [call.args[0] for call in repo_cls.return_value.record_last_used.await_args_list]
+        assert sorted(len(b) for b in batches) == [1, 2]
+        session.commit.assert_awaited_once()
+        assert await buffer.flush() == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_requeued(self) -> None:
+        session = AsyncMock()
+        session.commit = AsyncMock(side_effect=RuntimeError("db down"))
+        buffer = _APIKeyUsageBuffer(_session_factory(session))
+        buffer.record("key-1", "tenant-a")
+
+        with patch("core_engine.state.repository.APIKeyRepository") as repo_cls:
+            repo_cls.return_value.record_last_used = AsyncMock(return_value=1)
+            assert await buffer.flush() == 0
+
+        assert "key-1" in buffer._pending
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining(self) -> None:
+        session = AsyncMock()
+        buffer = _APIKeyUsageBuffer(_session_factory(session), flush_interval_seconds=3600)
+        await buffer.start()
+        buffer.record("key-1", "tenant-a")
+
+        with patch("core_engine.state.repository.APIKeyRepository") as repo_cls:
+            repo_cls.return_value.record_last_used = AsyncMock(return_value=1)
+            await buffer.stop()
+
+        repo_cls.return_value.record_last_used.assert_awaited_once()
+        assert buffer._pending == {}
+
+
+# ---------------------------------------------------------------------------
+# Revocation propagation
+# ---------------------------------------------------------------------------
+
+
+class TestAPIKeyRevocation:
+    @pytest.mark.asyncio
+    async def test_invalidate_evicts_and_publishes(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache = _APIKeyCache()
+        cache.set("hash-1", _IDENTITY)
+        monkeypatch.setattr(auth, "_api_key_cache", cache)
+        redis = AsyncMock()
+
+        with patch("api.services.redis_client.get_redis_client", AsyncMock(return_value=redis)):
+            await invalidate_api_key("key-1")
+
+        assert cache.get("hash-1") is None
+        redis.set.assert_awaited_once()
+        assert redis.set.await_args.args[0].endswith("key-1")
+
+    @pytest.mark.asyncio
+    async def test_revoked_elsewhere_without_redis(self) -> None:
+        with patch("api.services.redis_client.get_redis_client", AsyncMock(return_value=None)):
+            assert await _api_key_revoked_elsewhere("key-1") is False
+
+    @pytest.mark.asyncio
+    async def test_revoked_elsewhere_reads_marker(self) -> None:
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value="1")
+        with patch("api.services.redis_client.get_redis_client", AsyncMock(return_value=redis)):
+            assert await _api_key_revoked_elsewhere("key-1") is True
+
+    @pytest.mark.asyncio
+    async def test_redis_error_forces_revalidation(self) -> None:
+        redis = AsyncMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("redis down"))
+        with patch("api.services.redis_client.get_redis_client", AsyncMock(return_value=redis)):
+            assert await _api_key_revoked_elsewhere("key-1") is True
@@ -0,0 +1,206 @@
+"""Tests for the pure-ASGI middleware plumbing.
+
+Covers:
+- RequestContext is created once per request and shared across layers.
+- State written by middleware is visible through ``request.state``.
+- Streaming responses pass through the stack unbuffered.
+- Chunked bodies over the limit are replaced by a 413.
+- Trace context vars do not leak out of the request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
+
+from api.middleware.asgi import get_request_context
+from api.middleware.body_limit import BodyLimitMiddleware
+from api.middleware.csp import ContentSecurityPolicyMiddleware
+from api.middleware.logging import RequestLoggingMiddleware
+from api.middleware.trace_context import TraceContextMiddleware, get_trace_id
+
+
+def _http_scope(path: str = "/test", method: str = "GET", headers: list[tuple[bytes, bytes]] | None = None) -> Scope:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers or [(b"host", b"test")],
+        "client": ("10.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+
+
+# ---------------------------------------------------------------------------
+# RequestContext
+# ---------------------------------------------------------------------------
+
+
+class TestRequestContext:
+    def test_context_is_cached_on_scope(self) -> None:
+        scope = _http_scope(headers=[(b"cookie", b"a=1; b=2"), (b"x-test", b"yes")])
+        ctx = get_request_context(scope)
+
+        assert get_request_context(scope) is ctx
+        assert ctx.headers is ctx.headers
+        assert ctx.cookies == {"a": "1", "b": "2"}
+        assert ctx.headers["X-Test"] == "yes"
+        assert ctx.client_host == "10.0.0.1"
+
+    def test_state_backs_request_state(self) -> None:
+        scope = _http_scope()
+        get_request_context(scope).state["tenant_id"] = "tenant-a"
+
+        assert Request(scope).state.tenant_id == "tenant-a"
+        assert get_request_context(scope).tenant_id == "tenant-a"
+
+    @pytest.mark.asyncio
+    async def test_layers_share_one_context(self) -> None:
+        seen: list[Any] = []
+
+        async def handler(request: Request) -> JSONResponse:
+            seen.append(get_request_context(request.scope))
+            return JSONResponse({"trace_id": request.state.trace_id})
+
+        app = Starlette(routes=[Route("/test", handler)])
+        app.add_middleware(TraceContextMiddleware)
+        app.add_middleware(RequestLoggingMiddleware)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            resp = await client.get("/test")
+
+        assert resp.status_code == 200
+        assert resp.headers["X-Trace-ID"] == resp.json()["trace_id"]
+        assert "X-Correlation-ID" in resp.headers
+        assert seen[0].state["trace_id"] == resp.json()["trace_id"]
+
+
+# ---------------------------------------------------------------------------
+# Streaming
+# ---------------------------------------------------------------------------
+
+
+class TestStreamingPassThrough:
+    @pytest.mark.asyncio
+    async def test_first_chunk_sent_before_body_completes(self) -> None:
+        release = asyncio.Event()
+
+        async def body():
+            yield b"first"
+            await release.wait()
+            yield b"second"
+
+        async def handler(request: Request) -> StreamingResponse:
+            return StreamingResponse(body(), media_type="text/plain")
+
+        app = Starlette(routes=[Route("/test", handler)])
+        app.add_middleware(BodyLimitMiddleware, max_body_size=1024)
+        app.add_middleware(ContentSecurityPolicyMiddleware)
+        app.add_middleware(TraceContextMiddleware)
+        app.add_middleware(RequestLoggingMiddleware)
+
+        chunks: list[bytes] = []
+        start_headers: list[tuple[bytes, bytes]] = []
+        received = False
+
+        async def receive() -> dict[str, Any]:
+            nonlocal received
+            if not received:
+                received = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # The client never disconnects; block until the response is done.
+            await asyncio.Event().wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                start_headers.extend(message["headers"])
+            elif message["type"] == "http.response.body" and message.get("body"):
+                chunks.append(message["body"])
+                # Only a truly streaming stack delivers this chunk while the
+                # generator is still suspended.
+                release.set()
+
+        await asyncio.wait_for(app(_http_scope(), receive, send), timeout=5)
+
+        assert chunks == [b"first", b"second"]
+        names = {name for name, _ in start_headers}
+        assert b"content-security-policy" in names
+        assert b"x-trace-id" in names
+
+
+# ---------------------------------------------------------------------------
+# BodyLimitMiddleware
+# ---------------------------------------------------------------------------
+
+
+class TestChunkedBodyLimit:
+    @pytest.mark.asyncio
+    async def test_streamed_body_over_limit_returns_413(self) -> None:
+        async def handler(request: Request) -> JSONResponse:
+            body = await request.body()
+            return JSONResponse({"size": len(body)})
+
+        app = BodyLimitMiddleware(
+            Starlette(routes=[Route("/test", handler, methods=["POST"])]),
+            max_body_size=10,
+        )
+        messages = iter(
+            [
+                {"type": "http.request", "body": b"x" * 8, "more_body": True},
+                {"type": "http.request", "body": b"x" * 8, "more_body": False},
+            ]
+        )
+        sent: list[dict[str, Any]] = []
+
+        async def receive() -> dict[str, Any]:
+            return next(messages)
+
+        async def send(message: dict[str, Any]) -> None:
+            sent.append(message)
+
+        await app(_http_scope(method="POST"), receive, send)
+
+        assert sent[0]["type"] == "http.response.start"
+        assert sent[0]["status"] == 413
+        assert [m["type"] for m in sent].count("http.response.start") == 1
+
+
+# ---------------------------------------------------------------------------
+# TraceContextMiddleware
+# ---------------------------------------------------------------------------
+
+
+class TestTraceContextScope:
+    @pytest.mark.asyncio
+    async def test_context_vars_reset_after_request(self) -> None:
+        observed: list[str] = []
+
+        async def inner(scope: Scope, receive: Receive, send: Send) -> None:
+            observed.append(get_trace_id())
+            await JSONResponse({})(scope, receive, send)
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: dict[str, Any]) -> None:
+            pass
+
+        await TraceContextMiddleware(inner)(_http_scope(), receive, send)
+
+        assert len(observed[0]) == 32
+        assert get_trace_id() == ""
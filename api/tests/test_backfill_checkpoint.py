@@ -464,6 +464,170 @@ class TestChunkedBackfillFailure:
         service._checkpoint_repo.mark_failed.assert_awaited_once()
 
 
+# ---------------------------------------------------------------------------
+# Concurrent chunk execution
+# ---------------------------------------------------------------------------
+
+
+def _delayed_chunks(delays: dict[str, float], fail: set[str] | None = None, tracker: dict | None = None):
+    """Build an ``_execute_locally`` stand-in keyed by chunk start date."""
+    import asyncio
+
+    fail = fail or set()
+    tracker = tracker if tracker is not None else {}
+    tracker.setdefault("active", 0)
+    tracker.setdefault("peak", 0)
+    tracker.setdefault("started", [])
+
+    async def _run(step):
+        start = step["input_range"]["start"]
+        tracker["started"].append(start)
+        tracker["active"] += 1
+        tracker["peak"] = max(tracker["peak"], tracker["active"])
+        try:
+            await asyncio.sleep(delays.get(start, 0.0))
+            if start in fail:
+                raise RuntimeError(f"chunk {start} failed")
+        finally:
+            tracker["active"] -= 1
+
+    return _run
+
+
+class TestConcurrentChunkedBackfill:
+    """Chunked backfill with max_concurrent_chunks > 1."""
+
+    @pytest.mark.asyncio
+    async def test_runs_up_to_limit_concurrently(self, mock_session: AsyncMock):
+        service = _setup_service_for_chunked(mock_session)
+        tracker: dict = {}
+
+        with (
+            patch.object(service, "_is_databricks_available", return_value=False),
+            patch.object(service, "_execute_locally", side_effect=_delayed_chunks({}, tracker=tracker)),
+        ):
+            result = await service.chunked_backfill(
+                model_name="staging.orders",
+                start_date="2024-01-01",
+                end_date="2024-01-06",
+                chunk_size_days=1,
+                max_concurrent_chunks=3,
+            )
+
+        assert result["status"] == "COMPLETED"
+        assert result["completed_chunks"] == 6
+        assert tracker["peak"] == 3
+        # Runs are reported in chunk order regardless of completion order.
+        assert [r["input_range_start"] for r in result["runs"]] == [date(2024, 1, d) for d in range(1, 7)]
+        assert service._checkpoint_repo.create.call_args.kwargs["max_concurrent_chunks"] == 3
+        assert service._lock_repo.release_lock.await_count == 6
+
+    @pytest.mark.asyncio
+    async def test_watermarks_monotonic_when_chunks_finish_out_of_order(self, mock_session: AsyncMock):
+        service = _setup_service_for_chunked(mock_session)
+        # The first chunk is the slowest: chunks 2 and 3 finish before it.
+        delays = {"2024-01-01": 0.05}
+
+        with (
+            patch.object(service, "_is_databricks_available", return_value=False),
+            patch.object(service, "_execute_locally", side_effect=_delayed_chunks(delays)),
+        ):
+            result = await service.chunked_backfill(
+                model_name="staging.orders",
+                start_date="2024-01-01",
+                end_date="2024-01-03",
+                chunk_size_days=1,
+                max_concurrent_chunks=3,
+            )
+
+        assert result["status"] == "COMPLETED"
+        watermark_starts = [
+            c.kwargs["partition_start"] for c in service._watermark_repo.update_watermark.await_args_list
+        ]
+        assert watermark_starts == [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)]
+
+        progress_calls = [c.kwargs for c in service._checkpoint_repo.update_progress.await_args_list]
+        # Out-of-order completions are recorded in the bitmap without
+        # moving completed_through past the gap.
+        assert [c["completed_through"] for c in progress_calls] == [None, None, date(2024, 1, 3)]
+        assert [c["completed_chunk_bitmap"] for c in progress_calls] == ["2", "6", "7"]
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_new_chunks_and_drains_in_flight(self, mock_session: AsyncMock):
+        service = _setup_service_for_chunked(mock_session)
+        tracker: dict = {}
+        delays = {"2024-01-02": 0.05}
+
+        with (
+            patch.object(service, "_is_databricks_available", return_value=False),
+            patch.object(
+                service,
+                "_execute_locally",
+                side_effect=_delayed_chunks(delays, fail={"2024-01-01"}, tracker=tracker),
+            ),
+        ):
+            result = await service.chunked_backfill(
+                model_name="staging.orders",
+                start_date="2024-01-01",
+                end_date="2024-01-05",
+                chunk_size_days=1,
+                max_concurrent_chunks=2,
+            )
+
+        assert result["status"] == "FAILED"
+        # Chunk 1 failed immediately; chunk 2 was already running and
+        # completed; chunks 3-5 were never started.
+        assert tracker["started"] == ["2024-01-01", "2024-01-02"]
+        assert result["completed_chunks"] == 1
+        assert [r["status"] for r in result["runs"]] == ["FAIL", "SUCCESS"]
+        service._checkpoint_repo.mark_failed.assert_awaited_once()
+        progress = service._checkpoint_repo.update_progress.await_args.kwargs
+        assert progress["completed_through"] is None
+        assert progress["completed_chunk_bitmap"] == "2"
+        service._watermark_repo.update_watermark.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_resume_runs_only_missing_chunks_from_bitmap(self, mock_session: AsyncMock):
+        service = _setup_service_for_chunked(mock_session)
+        checkpoint = _make_checkpoint_row(
+            backfill_id="bf-bitmap",
+            status="FAILED",
+            completed_through=date(2024, 1, 7),
+            completed_chunks=2,
+            total_chunks=3,
+        )
+        # Chunks 0 and 2 succeeded; chunk 1 failed.
+        checkpoint.completed_chunk_bitmap = "5"
+        checkpoint.max_concurrent_chunks = 2
+        service._checkpoint_repo.get = AsyncMock(return_value=checkpoint)
+
+        with patch.object(service, "_is_databricks_available", return_value=False):
+            result = await service.resume_backfill("bf-bitmap")
+
+        assert result["status"] == "COMPLETED"
+        assert result["completed_chunks"] == 3
+        assert [r["input_range_start"] for r in result["runs"]] == [date(2024, 1, 8)]
+        # Completing chunk 1 closes the gap, so the watermark advances over
+        # chunk 1 and the previously out-of-order chunk 2, in order.
+        watermark_starts = [
+            c.kwargs["partition_start"] for c in service._watermark_repo.update_watermark.await_args_list
+        ]
+        assert watermark_starts == [date(2024, 1, 8), date(2024, 1, 15)]
+        assert service._checkpoint_repo.update_progress.await_args.kwargs["completed_through"] == date(2024, 1, 21)
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency_rejected(self, mock_session: AsyncMock):
+        service = _setup_service_for_chunked(mock_session)
+
+        with pytest.raises(ValueError, match="max_concurrent_chunks must be >= 1"):
+            await service.chunked_backfill(
+                model_name="staging.orders",
+                start_date="2024-01-01",
+                end_date="2024-01-21",
+                max_concurrent_chunks=0,
+            )
+
+
 # ---------------------------------------------------------------------------
 # resume_backfill()
 # ---------------------------------------------------------------------------
@@ -755,6 +919,38 @@ class TestBackfillChunkedEndpoint:
         )
         assert resp.status_code == 422  # Pydantic validation error
 
+    @pytest.mark.asyncio
+    async def test_chunked_backfill_passes_concurrency(self, client):
+        """POST /backfills/chunked forwards max_concurrent_chunks and validates it."""
+        with patch("api.routers.backfills.ExecutionService") as MockService:
+            instance = MagicMock()
+            instance.chunked_backfill = AsyncMock(return_value={"backfill_id": "bf", "status": "COMPLETED"})
+            MockService.return_value = instance
+
+            resp = await client.post(
+                "/api/v1/backfills/chunked",
+                json={
+                    "model_name": "staging.orders",
+                    "start_date": "2024-01-01",
+                    "end_date": "2024-01-21",
+                    "max_concurrent_chunks": 4,
+                },
+            )
+
+        assert resp.status_code == 200
+        assert instance.chunked_backfill.await_args.kwargs["max_concurrent_chunks"] == 4
+
+        resp = await client.post(
+            "/api/v1/backfills/chunked",
+            json={
+                "model_name": "staging.orders",
+                "start_date": "2024-01-01",
+                "end_date": "2024-01-21",
+                "max_concurrent_chunks": 0,
+            },
+        )
+        assert resp.status_code == 422
+
 
 class TestResumeBackfillEndpoint:
     """Test POST /backfills/{backfill_id}/resume router endpoint."""
@@ -5,7 +5,7 @@ Covers:
 - _classify_status: active, at_risk, churning, boundary values
 - _compute_trend: no previous, improving, declining, stable
 - CustomerHealthService.compute_health_score: 4-dimension scoring, status, trend, upsert
-- CustomerHealthService.compute_all: iterates tenant configs
+- CustomerHealthService.compute_all: bulk scoring, status-change events, per-tenant failures
 - CustomerHealthService.get_health_detail: None and found cases
 - CustomerHealthService.list_tenants: paginated results with summary
 - CustomerHealthService._fire_status_change_event: logs at WARNING level
@@ -427,85 +427,131 @@ class TestComputeHealthScore:
 
 
 class TestComputeAll:
-    """Verify compute_all iterates all tenant configs."""
+    """Verify compute_all scores every active tenant in bulk."""
+
+    @staticmethod
+    def _configs(*tenant_ids: str) -> list[MagicMock]:
+        configs = []
+        for tenant_id in tenant_ids:
+            config = MagicMock()
+            config.tenant_id = tenant_id
+            configs.append(config)
+        return configs
 
     @pytest.mark.asyncio
     async def test_computes_for_all_tenants(self, mock_session: AsyncMock) -> None:
-        """compute_all should call compute_health_score for each active tenant config."""
-        config_a = MagicMock()
-        config_a.tenant_id = "tenant-a"
-        config_b = MagicMock()
-        config_b.tenant_id = "tenant-b"
-        config_c = MagicMock()
-        config_c.tenant_id = "tenant-c"
+        """compute_all should write one record per active tenant in a single bulk upsert."""
+        recent = datetime.now(UTC) - timedelta(hours=2)
 
         with (
             patch("api.services.customer_health_service.TenantConfigRepository") as MockConfigRepo,
-            patch("api.services.customer_health_service.CustomerHealthRepository"),
+            patch("api.services.customer_health_service.CustomerHealthRepository") as MockRepo,
         ):
             config_repo_instance = AsyncMock()
-            config_repo_instance.list_all.return_value = [config_a, config_b, config_c]
+            config_repo_instance.list_all.return_value = self._configs("tenant-a", "tenant-b", "tenant-c")
             MockConfigRepo.return_value = config_repo_instance
 
+            repo_instance = AsyncMock()
+            repo_instance.collect_engagement_signals.return_value = {
+                "tenant-a": {
+                    "last_login_at": recent,
+                    "last_plan_run_at": recent,
+                    "last_ai_call_at": recent,
+                    "distinct_event_types": 6,
+                },
+            }
+            repo_instance.get_scores.return_value = {}
+            MockRepo.return_value = repo_instance
+
             service = CustomerHealthService(mock_session)
 
             with patch.object(service, "compute_health_score", new_callable=AsyncMock) as mock_compute:
-                mock_compute.return_value = {"health_score": 50.0}
                 result = await service.compute_all()
 
         assert result["computed_count"] == 3
         assert "duration_ms" in result
         assert result["duration_ms"] >= 0
-        assert mock_compute.call_count == 3
-        mock_compute.assert_any_call("tenant-a")
-        mock_compute.assert_any_call("tenant-b")
-        mock_compute.assert_any_call("tenant-c")
+        mock_compute.assert_not_called()
+        repo_instance.upsert_many.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_compute_all_handles_individual_failure(self, mock_session: AsyncMock) -> None:
-        """If one tenant fails, others still get computed and count reflects successes."""
-        config_a = MagicMock()
-        config_a.tenant_id = "tenant-ok"
-        config_b = MagicMock()
-        config_b.tenant_id = "tenant-fail"
-        config_c = MagicMock()
-        config_c.tenant_id = "tenant-ok-2"
+        records = {r["tenant_id"]: r for r in repo_instance.upsert_many.await_args.args[0]}
+        assert set(records) == {"tenant-a", "tenant-b", "tenant-c"}
+        assert records["tenant-a"]["health_score"] == 100.0
+        assert records["tenant-a"]["health_status"] == "active"
+        assert records["tenant-b"]["health_score"] == 0.0
+        assert records["tenant-b"]["health_status"] == "churning"
 
+    @pytest.mark.asyncio
+    async def test_status_change_fires_event_after_write(self, mock_session: AsyncMock) -> None:
+        """Status transitions are reported once the bulk upsert succeeds."""
         with (
             patch("api.services.customer_health_service.TenantConfigRepository") as MockConfigRepo,
-            patch("api.services.customer_health_service.CustomerHealthRepository"),
+            patch("api.services.customer_health_service.CustomerHealthRepository") as MockRepo,
         ):
             config_repo_instance = AsyncMock()
-            config_repo_instance.list_all.return_value = [config_a, config_b, config_c]
+            config_repo_instance.list_all.return_value = self._configs("tenant-a", "tenant-b")
             MockConfigRepo.return_value = config_repo_instance
 
+            repo_instance = AsyncMock()
+            repo_instance.collect_engagement_signals.return_value = {}
+            repo_instance.get_scores.return_value = {
+                "tenant-a": (80.0, "active"),
+                "tenant-b": (10.0, "churning"),
+            }
+            MockRepo.return_value = repo_instance
+
             service = CustomerHealthService(mock_session)
+            with patch.object(service, "_fire_status_change_event") as mock_fire:
+                await service.compute_all()
 
-            async def side_effect(tenant_id: str) -> dict:
-                if tenant_id == "tenant-fail":
-                    raise RuntimeError("DB error")
-                return {"health_score": 50.0}
+        mock_fire.assert_called_once_with("tenant-a", "active", "churning", 0.0)
+        records = {r["tenant_id"]: r for r in repo_instance.upsert_many.await_args.args[0]}
+        assert records["tenant-a"]["previous_score"] == 80.0
+        assert records["tenant-a"]["trend_direction"] == "declining"
 
-            with patch.object(service, "compute_health_score", side_effect=side_effect):
-                result = await service.compute_all()
+    @pytest.mark.asyncio
+    async def test_compute_all_handles_individual_failure(self, mock_session: AsyncMock) -> None:
+        """If one tenant fails to score, others still get computed and count reflects successes."""
+        with (
+            patch("api.services.customer_health_service.TenantConfigRepository") as MockConfigRepo,
+            patch("api.services.customer_health_service.CustomerHealthRepository") as MockRepo,
+        ):
+            config_repo_instance = AsyncMock()
+            config_repo_instance.list_all.return_value = self._configs("tenant-ok", "tenant-fail", "tenant-ok-2")
+            MockConfigRepo.return_value = config_repo_instance
+
+            repo_instance = AsyncMock()
+            repo_instance.collect_engagement_signals.return_value = {
+                "tenant-fail": {"last_login_at": "not-a-datetime"},
+            }
+            repo_instance.get_scores.return_value = {}
+            MockRepo.return_value = repo_instance
+
+            service = CustomerHealthService(mock_session)
+            result = await service.compute_all()
 
         assert result["computed_count"] == 2
+        written = [r["tenant_id"] for r in repo_instance.upsert_many.await_args.args[0]]
+        assert written == ["tenant-ok", "tenant-ok-2"]
 
     @pytest.mark.asyncio
     async def test_compute_all_empty_configs(self, mock_session: AsyncMock) -> None:
-        """No tenant configs means zero computed."""
+        """No tenant configs means zero computed and no aggregate queries."""
         with (
             patch("api.services.customer_health_service.TenantConfigRepository") as MockConfigRepo,
-            patch("api.services.customer_health_service.CustomerHealthRepository"),
+            patch("api.services.customer_health_service.CustomerHealthRepository") as MockRepo,
         ):
             config_repo_instance = AsyncMock()
             config_repo_instance.list_all.return_value = []
             MockConfigRepo.return_value = config_repo_instance
+            repo_instance = AsyncMock()
+            MockRepo.return_value = repo_instance
 
             service = CustomerHealthService(mock_session)
             result = await service.compute_all()
 
         assert result["computed_count"] == 0
+        repo_instance.collect_engagement_signals.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
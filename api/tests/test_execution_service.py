@@ -11,6 +11,8 @@ Covers:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 from datetime import date, datetime, timezone
 from typing import Any
@@ -88,13 +90,12 @@ async def test_apply_plan_local_execution_success(mock_session: AsyncMock) -> No
 
     service._run_repo = MagicMock()
     service._run_repo.get_by_plan = AsyncMock(return_value=[])  # no existing runs
-    service._run_repo.create_run = AsyncMock()
-    service._run_repo.update_cost = AsyncMock()
-
+    service._run_repo.create_runs = AsyncMock()
+    
     service._lock_repo = MagicMock()
     service._watermark_repo = MagicMock()
     service._telemetry_repo = MagicMock()
-    service._telemetry_repo.record = AsyncMock()
+    service._telemetry_repo.record_batch = AsyncMock()
 
     # Ensure local execution path (no Databricks)
     with patch.object(service, "_is_databricks_available", return_value=False):
@@ -115,7 +116,8 @@ async def test_apply_plan_local_execution_success(mock_session: AsyncMock) -> No
     assert run["executor_version"] == "api-control-plane-0.1.0"
 
     # Verify run was persisted
-    service._run_repo.create_run.assert_awaited_once()
+    service._run_repo.create_runs.assert_awaited_once()
+    assert service._run_repo.create_runs.call_args[0][0] == [run]
 
 
 @pytest.mark.asyncio
@@ -151,12 +153,11 @@ async def test_apply_plan_multi_step(mock_session: AsyncMock) -> None:
     service._plan_repo.get_plan = AsyncMock(return_value=plan_row)
     service._run_repo = MagicMock()
     service._run_repo.get_by_plan = AsyncMock(return_value=[])
-    service._run_repo.create_run = AsyncMock()
-    service._run_repo.update_cost = AsyncMock()
+    service._run_repo.create_runs = AsyncMock()
     service._lock_repo = MagicMock()
     service._watermark_repo = MagicMock()
     service._telemetry_repo = MagicMock()
-    service._telemetry_repo.record = AsyncMock()
+    service._telemetry_repo.record_batch = AsyncMock()
 
     with patch.object(service, "_is_databricks_available", return_value=False):
         results = await service.apply_plan(
@@ -172,8 +173,10 @@ async def test_apply_plan_multi_step(mock_session: AsyncMock) -> None:
     assert results[1]["model_name"] == "marts.revenue"
     assert all(r["status"] == "SUCCESS" for r in results)
 
-    # create_run called once per step
-    assert service._run_repo.create_run.await_count == 2
+    # s2 depends on s1, so each step is persisted in its own round
+    assert service._run_repo.create_runs.await_count == 2
+    persisted = [r for call in service._run_repo.create_runs.call_args_list for r in call[0][0]]
+    assert [r["step_id"] for r in persisted] == ["s1", "s2"]
 
 
 # ---------------------------------------------------------------------------
@@ -209,15 +212,14 @@ async def test_apply_plan_updates_watermark_on_incremental_success(
     service._plan_repo.get_plan = AsyncMock(return_value=plan_row)
     service._run_repo = MagicMock()
     service._run_repo.get_by_plan = AsyncMock(return_value=[])
-    service._run_repo.create_run = AsyncMock()
-    service._run_repo.update_cost = AsyncMock()
+    service._run_repo.create_runs = AsyncMock()
     service._lock_repo = MagicMock()
     service._lock_repo.acquire_lock = AsyncMock(return_value=True)
     service._lock_repo.release_lock = AsyncMock()
     service._watermark_repo = MagicMock()
-    service._watermark_repo.update_watermark = AsyncMock()
+    service._watermark_repo.update_watermarks_batch = AsyncMock()
     service._telemetry_repo = MagicMock()
-    service._telemetry_repo.record = AsyncMock()
+    service._telemetry_repo.record_batch = AsyncMock()
 
     with patch.object(service, "_is_databricks_available", return_value=False):
         results = await service.apply_plan(
@@ -232,11 +234,8 @@ async def test_apply_plan_updates_watermark_on_incremental_success(
     assert results[0]["status"] == "SUCCESS"
 
     # Watermark should have been updated
-    service._watermark_repo.update_watermark.assert_awaited_once_with(
-        model_name="staging.orders",
-        partition_start=date(2024, 1, 1),
-        partition_end=date(2024, 1, 31),
-        row_count=None,
+    service._watermark_repo.update_watermarks_batch.assert_awaited_once_with(
+        [("staging.orders", date(2024, 1, 1), date(2024, 1, 31), None)]
     )
 
     # Lock should have been acquired and released
@@ -262,12 +261,12 @@ async def test_apply_plan_execution_failure_records_fail_status(
     service._plan_repo.get_plan = AsyncMock(return_value=plan_row)
     service._run_repo = MagicMock()
     service._run_repo.get_by_plan = AsyncMock(return_value=[])
-    service._run_repo.create_run = AsyncMock()
+    service._run_repo.create_runs = AsyncMock()
     service._lock_repo = MagicMock()
     service._watermark_repo = MagicMock()
-    service._watermark_repo.update_watermark = AsyncMock()
+    service._watermark_repo.update_watermarks_batch = AsyncMock()
     service._telemetry_repo = MagicMock()
-    service._telemetry_repo.record = AsyncMock()
+    service._telemetry_repo.record_batch = AsyncMock()
 
     # Force the local execution to fail
     with (
@@ -292,10 +291,10 @@ async def test_apply_plan_execution_failure_records_fail_status(
     assert "DuckDB crash" in run["error_message"]
 
     # Run should still be persisted
-    service._run_repo.create_run.assert_awaited_once()
+    service._run_repo.create_runs.assert_awaited_once()
 
     # Watermark should NOT have been updated on failure
-    service._watermark_repo.update_watermark.assert_not_awaited()
+    service._watermark_repo.update_watermarks_batch.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -357,12 +356,11 @@ async def test_apply_plan_auto_approve_bypasses_gate_in_prod(
     service._plan_repo.get_plan = AsyncMock(return_value=plan_row)
     service._run_repo = MagicMock()
     service._run_repo.get_by_plan = AsyncMock(return_value=[])
-    service._run_repo.create_run = AsyncMock()
-    service._run_repo.update_cost = AsyncMock()
+    service._run_repo.create_runs = AsyncMock()
     service._lock_repo = MagicMock()
     service._watermark_repo = MagicMock()
     service._telemetry_repo = MagicMock()
-    service._telemetry_repo.record = AsyncMock()
+    service._telemetry_repo.record_batch = AsyncMock()
 
     with patch.object(service, "_is_databricks_available", return_value=False):
         results = await service.apply_plan(
@@ -436,7 +434,7 @@ async def test_apply_plan_skips_already_completed_step(
     service._plan_repo.get_plan = AsyncMock(return_value=plan_row)
     service._run_repo = MagicMock()
     service._run_repo.get_by_plan = AsyncMock(return_value=[existing_run])
-    service._run_repo.create_run = AsyncMock()
+    service._run_repo.create_runs = AsyncMock()
     service._lock_repo = MagicMock()
     service._watermark_repo = MagicMock()
     service._telemetry_repo = MagicMock()
@@ -452,7 +450,7 @@ async def test_apply_plan_skips_already_completed_step(
 
     # The step was skipped -- no new run records returned
     assert len(results) == 0
-    service._run_repo.create_run.assert_not_awaited()
+    service._run_repo.create_runs.assert_not_awaited()
 
 
 # ---------------------------------------------------------------------------
@@ -488,7 +486,7 @@ async def test_apply_plan_lock_failure_produces_cancelled_run(
     service._plan_repo.get_plan = AsyncMock(return_value=plan_row)
     service._run_repo = MagicMock()
     service._run_repo.get_by_plan = AsyncMock(return_value=[])
-    service._run_repo.create_run = AsyncMock()
+    service._run_repo.create_runs = AsyncMock()
     service._lock_repo = MagicMock()
     service._lock_repo.acquire_lock = AsyncMock(return_value=False)  # lock fails
     service._watermark_repo = MagicMock()
@@ -524,12 +522,11 @@ async def test_apply_plan_emits_telemetry(mock_session: AsyncMock) -> None:
     service._plan_repo.get_plan = AsyncMock(return_value=plan_row)
     service._run_repo = MagicMock()
     service._run_repo.get_by_plan = AsyncMock(return_value=[])
-    service._run_repo.create_run = AsyncMock()
-    service._run_repo.update_cost = AsyncMock()
+    service._run_repo.create_runs = AsyncMock()
     service._lock_repo = MagicMock()
     service._watermark_repo = MagicMock()
     service._telemetry_repo = MagicMock()
-    service._telemetry_repo.record = AsyncMock()
+    service._telemetry_repo.record_batch = AsyncMock()
 
     with patch.object(service, "_is_databricks_available", return_value=False):
         results = await service.apply_plan(
@@ -541,8 +538,8 @@ async def test_apply_plan_emits_telemetry(mock_session: AsyncMock) -> None:
         )
 
     assert len(results) == 1
-    service._telemetry_repo.record.assert_awaited_once()
-    telemetry_arg = service._telemetry_repo.record.call_args[0][0]
+    service._telemetry_repo.record_batch.assert_awaited_once()
+    (telemetry_arg,) = service._telemetry_repo.record_batch.call_args[0][0]
     assert telemetry_arg["model_name"] == "staging.orders"
     assert telemetry_arg["run_id"] == results[0]["run_id"]
     assert "runtime_seconds" in telemetry_arg
@@ -599,3 +596,255 @@ def test_make_run_dict_with_error() -> None:
     assert result["input_range_start"] == date(2024, 1, 1)
     assert result["input_range_end"] == date(2024, 1, 31)
     assert result["run_id"] == "custom-run-id"
+
+
+# ---------------------------------------------------------------------------
+# Concurrent, dependency-aware execution
+# ---------------------------------------------------------------------------
+
+
+def _dag_plan_row(plan_id: str, edges: dict[str, list[str]]) -> MagicMock:
+    """Build a plan row whose steps (one per key) depend on the listed step IDs."""
+    steps = [
+        {
+            "step_id": step_id,
+            "model": f"m.{step_id}",
+            "run_type": "FULL_REFRESH",
+            "depends_on": deps,
+            "parallel_group": 0,
+            "reason": "changed",
+        }
+        for step_id, deps in edges.items()
+    ]
+    plan_data = {
+        "plan_id": plan_id,
+        "steps": steps,
+        "summary": {"total_steps": len(steps), "estimated_cost_usd": 0.0, "models_changed": []},
+    }
+    return _make_plan_row(plan_id, plan_data)
+
+
+def _concurrent_service(mock_session: AsyncMock, plan_row: MagicMock, **settings_overrides: Any) -> ExecutionService:
+    settings = _make_settings("dev").model_copy(update=settings_overrides)
+    service = ExecutionService(mock_session, settings)
+    service._plan_repo = MagicMock()
+    service._plan_repo.get_plan = AsyncMock(return_value=plan_row)
+    service._run_repo = MagicMock()
+    service._run_repo.get_by_plan = AsyncMock(return_value=[])
+    service._run_repo.create_runs = AsyncMock()
+    service._lock_repo = MagicMock()
+    service._watermark_repo = MagicMock()
+    service._telemetry_repo = MagicMock()
+    service._telemetry_repo.record_batch = AsyncMock()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_apply_plan_runs_independent_steps_concurrently(mock_session: AsyncMock) -> None:
+    """Independent steps overlap, bounded by execution_max_concurrency."""
+    import asyncio
+
+    plan_row = _dag_plan_row("plan-wide", {f"s{i}": [] for i in range(6)})
+    service = _concurrent_service(mock_session, plan_row, execution_max_concurrency=3)
+
+    active = 0
+    peak = 0
+
+    async def _slow_local(step: dict[str, Any], model_sql: str | None = None) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    with (
+        patch.object(service, "_is_databricks_available", return_value=False),
+        patch.object(service, "_execute_locally", side_effect=_slow_local),
+    ):
+        results = await service.apply_plan(
+            plan_id="plan-wide",
+            approved_by="tester",
+            cluster_override=None,
+            auto_approve=True,
+            caller_role=Role.ADMIN,
+        )
+
+    assert peak == 3
+    assert [r["step_id"] for r in results] == [f"s{i}" for i in range(6)]
+    assert all(r["status"] == "SUCCESS" for r in results)
+    # Completed-step lookup happens once per apply, not once per step.
+    service._run_repo.get_by_plan.assert_awaited_once_with("plan-wide")
+
+
+@pytest.mark.asyncio
+async def test_apply_plan_failure_cancels_only_downstream(mock_session: AsyncMock) -> None:
+    """A failed step cancels its dependents while unrelated branches still run."""
+    plan_row = _dag_plan_row("plan-branch", {"a": [], "b": ["a"], "c": ["b"], "x": [], "y": ["x"]})
+    service = _concurrent_service(mock_session, plan_row)
+
+    async def _local(step: dict[str, Any], model_sql: str | None = None) -> None:
+        if step["step_id"] == "a":
+            raise RuntimeError("boom")
+
+    with (
+        patch.object(service, "_is_databricks_available", return_value=False),
+        patch.object(service, "_execute_locally", side_effect=_local),
+    ):
+        results = await service.apply_plan(
+            plan_id="plan-branch",
+            approved_by="tester",
+            cluster_override=None,
+            auto_approve=True,
+            caller_role=Role.ADMIN,
+        )
+
+    statuses = {r["step_id"]: r["status"] for r in results}
+    assert statuses == {"a": "FAIL", "b": "CANCELLED", "c": "CANCELLED", "x": "SUCCESS", "y": "SUCCESS"}
+    persisted = {r["step_id"] for call in service._run_repo.create_runs.call_args_list for r in call[0][0]}
+    assert persisted == {"a", "x", "y"}
+
+
+@pytest.mark.asyncio
+async def test_apply_plan_completed_upstream_unblocks_dependents(mock_session: AsyncMock) -> None:
+    """A step already completed in an earlier attempt satisfies its dependents."""
+    plan_row = _dag_plan_row("plan-resume", {"a": [], "b": ["a"]})
+    service = _concurrent_service(mock_session, plan_row)
+    done = MagicMock(step_id="a", status="SUCCESS")
+    service._run_repo.get_by_plan = AsyncMock(return_value=[done])
+
+    with patch.object(service, "_is_databricks_available", return_value=False):
+        results = await service.apply_plan(
+            plan_id="plan-resume",
+            approved_by="tester",
+            cluster_override=None,
+            auto_approve=True,
+            caller_role=Role.ADMIN,
+        )
+
+    assert [(r["step_id"], r["status"]) for r in results] == [("b", "SUCCESS")]
+
+
+@pytest.mark.asyncio
+async def test_resolve_max_concurrency_prefers_tenant_override(mock_session: AsyncMock) -> None:
+    """tenant_config.max_concurrent_steps overrides the deployment default."""
+    service = ExecutionService(mock_session, _make_settings("dev").model_copy(update={"execution_max_concurrency": 8}))
+
+    service._tenant_config_repo = MagicMock()
+    service._tenant_config_repo.get = AsyncMock(return_value=MagicMock(max_concurrent_steps=2))
+    assert await service._resolve_max_concurrency() == 2
+
+    service._tenant_config_repo.get = AsyncMock(return_value=MagicMock(max_concurrent_steps=None))
+    assert await service._resolve_max_concurrency() == 8
+
+    service._tenant_config_repo.get = AsyncMock(return_value=None)
+    assert await service._resolve_max_concurrency() == 8
+
+
+@pytest.mark.asyncio
+async def test_databricks_executor_reused_per_tenant_and_credential() -> None:
+    """One long-lived async executor per (tenant, workspace, token, warehouse)."""
+    from api.services import execution_service
+
+    execution_service._databricks_executors.clear()
+    with patch("core_engine.executor.AsyncDatabricksExecutor", side_effect=lambda **kw: MagicMock(**kw)) as factory:
+        first = execution_service._get_databricks_executor("t1", "https://h", "tok", "wh")
+        again = execution_service._get_databricks_executor("t1", "https://h", "tok", "wh")
+        other_tenant = execution_service._get_databricks_executor("t2", "https://h", "tok", "wh")
+        rotated = execution_service._get_databricks_executor("t1", "https://h", "tok-2", "wh")
+
+    assert first is again
+    assert other_tenant is not first
+    assert rotated is not first
+    assert factory.call_count == 3
+    assert all("tok" not in str(key) for key in execution_service._databricks_executors)
+    execution_service._databricks_executors.clear()
+
+
+def _fake_databricks_executor(**kwargs: Any) -> MagicMock:
+    executor = MagicMock(**kwargs)
+    executor.in_flight = 0
+    executor.aclose = AsyncMock()
+    return executor
+
+
+@pytest.mark.asyncio
+async def test_databricks_executor_cache_closes_least_recently_used_idle_executor() -> None:
+    from api.services import execution_service
+
+    def get(tenant_id: str) -> Any:
+        return execution_service._get_databricks_executor(tenant_id, "https://h", "tok", None)
+
+    execution_service._databricks_executors.clear()
+    with (
+        patch.object(execution_service, "_MAX_DATABRICKS_EXECUTORS", 3),
+        patch("core_engine.executor.AsyncDatabricksExecutor", side_effect=_fake_databricks_executor),
+    ):
+        first = get("t1")
+        busy = get("t2")
+        busy.in_flight = 1
+        idle = get("t3")
+        get("t1")
+        get("t4")
+        await asyncio.sleep(0)
+
+        assert idle.aclose.await_count == 1
+        assert first.aclose.await_count == 0
+        assert busy.aclose.await_count == 0
+
+        await execution_service.close_databricks_executors()
+
+    assert first.aclose.await_count == 1
+    assert busy.aclose.await_count == 1
+    assert not execution_service._databricks_executors
+
+
+@pytest.mark.asyncio
+async def test_databricks_executor_from_stopped_loop_is_closed() -> None:
+    from api.services import execution_service
+
+    execution_service._databricks_executors.clear()
+    stale = _fake_databricks_executor()
+    dead_loop = asyncio.new_event_loop()
+    dead_loop.close()
+    key = ("t1", "https://h", hashlib.sha256(b"tok").hexdigest(), None)
+    execution_service._databricks_executors[key] = (dead_loop, stale)
+
+    with patch("core_engine.executor.AsyncDatabricksExecutor", side_effect=_fake_databricks_executor):
+        fresh = execution_service._get_databricks_executor("t1", "https://h", "tok", None)
+
+    assert fresh is not stale
+    stale.close.assert_called_once_with()
+    stale.aclose.assert_not_called()
+    execution_service._databricks_executors.clear()
+
+
+@pytest.mark.asyncio
+async def test_execute_on_databricks_awaits_async_executor(mock_session: AsyncMock) -> None:
+    """Databricks steps are awaited on the shared executor, not polled in-loop."""
+    from core_engine.models.run import RunRecord, RunStatus
+
+    service = ExecutionService(mock_session, _make_settings("prod"), tenant_id="t1")
+    executor = MagicMock()
+    executor.execute_step = AsyncMock(
+        return_value=RunRecord(
+            run_id="r1",
+            plan_id="p",
+            step_id="s",
+            model_name="m",
+            status=RunStatus.FAIL,
+            error_message="bad",
+            executor_version="test",
+        )
+    )
+    step = {"step_id": "s", "model": "m", "run_type": "FULL_REFRESH", "depends_on": []}
+
+    env = {"PLATFORM_DATABRICKS_HOST": "https://h", "PLATFORM_DATABRICKS_TOKEN": "tok"}
+    with (
+        patch.dict("os.environ", env),
+        patch("api.services.execution_service._get_databricks_executor", return_value=executor) as get_executor,
+        pytest.raises(RuntimeError, match="bad"),
+    ):
+        await service._execute_on_databricks(step, cluster_override="large")
+
+    get_executor.assert_called_once_with("t1", "https://h", "tok", None)
+    assert executor.execute_step.await_args.kwargs["cluster_size"] == "large"
@@ -244,27 +244,42 @@ async def test_get_model_no_watermark(client: AsyncClient) -> None:
 
 @pytest.mark.asyncio
 async def test_get_model_lineage(client: AsyncClient) -> None:
-    """Lineage endpoint returns upstream and downstream lists."""
+    """Lineage endpoint returns a page of upstream and downstream models with depth."""
     target_row = _make_model_row("marts.revenue")
-    all_rows = [
-        _make_model_row("staging.orders"),
-        _make_model_row("staging.customers"),
-        target_row,
-    ]
+    lineage = {
+        "upstream": [
+            {"model_name": "staging.orders", "depth": 1},
+            {"model_name": "raw.orders", "depth": 2},
+        ],
+        "downstream": [{"model_name": "reports.kpis", "depth": 1}],
+        "upstream_total": 5,
+        "downstream_total": 1,
+        "upstream_depth": 3,
+        "downstream_depth": 1,
+        "is_truncated": False,
+    }
 
-    with patch("api.routers.models.ModelRepository") as MockModelRepo:
-        instance = MockModelRepo.return_value
-        instance.get = AsyncMock(return_value=target_row)
-        instance.list_all = AsyncMock(return_value=all_rows)
+    with (
+        patch("api.routers.models.ModelRepository") as MockModelRepo,
+        patch("api.routers.models.LineageRepository") as MockLineageRepo,
+    ):
+        MockModelRepo.return_value.get = AsyncMock(return_value=target_row)
+        MockLineageRepo.return_value.get_lineage = AsyncMock(return_value=lineage)
 
-        resp = await client.get("/api/v1/models/marts.revenue/lineage")
+        resp = await client.get("/api/v1/models/marts.revenue/lineage", params={"limit": 2, "max_depth": 10})
 
     assert resp.status_code == 200
     body = resp.json()
     assert body["model_name"] == "marts.revenue"
-    assert isinstance(body["upstream"], list)
-    assert isinstance(body["downstream"], list)
-    assert "depth" in body
+    assert body["upstream"] == ["staging.orders", "raw.orders"]
+    assert body["downstream"] == ["reports.kpis"]
+    assert body["upstream_nodes"][1] == {"model_name": "raw.orders", "depth": 2}
+    assert body["upstream_total"] == 5
+    assert body["depth"] == 3
+    assert body["is_truncated"] is False
+    MockLineageRepo.return_value.get_lineage.assert_awaited_once_with(
+        "marts.revenue", snapshot_id=None, max_depth=10, limit=2, offset=0
+    )
 
 
 @pytest.mark.asyncio
@@ -282,14 +297,24 @@ async def test_get_model_lineage_not_found(client: AsyncClient) -> None:
 
 @pytest.mark.asyncio
 async def test_get_model_lineage_no_deps(client: AsyncClient) -> None:
-    """Model with no dependencies has empty upstream/downstream."""
+    """Model with no recorded dependencies has empty upstream/downstream."""
     target_row = _make_model_row("isolated.model")
-    all_rows = [target_row]
+    lineage = {
+        "upstream": [],
+        "downstream": [],
+        "upstream_total": 0,
+        "downstream_total": 0,
+        "upstream_depth": 0,
+        "downstream_depth": 0,
+        "is_truncated": False,
+    }
 
-    with patch("api.routers.models.ModelRepository") as MockModelRepo:
-        instance = MockModelRepo.return_value
-        instance.get = AsyncMock(return_value=target_row)
-        instance.list_all = AsyncMock(return_value=all_rows)
+    with (
+        patch("api.routers.models.ModelRepository") as MockModelRepo,
+        patch("api.routers.models.LineageRepository") as MockLineageRepo,
+    ):
+        MockModelRepo.return_value.get = AsyncMock(return_value=target_row)
+        MockLineageRepo.return_value.get_lineage = AsyncMock(return_value=lineage)
 
         resp = await client.get("/api/v1/models/isolated.model/lineage")
 
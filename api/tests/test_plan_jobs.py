@@ -0,0 +1,317 @@
+"""Tests for the background plan job engine and the ``/plans/jobs`` endpoints.
+
+Covers:
+- Submission returns immediately; identical in-flight requests share a job
+- Round-robin dispatch across tenants and the per-tenant running cap
+- Error mapping, tenant isolation, queue limits and shutdown
+- The CPU-bound plan phases survive a round trip through a process pool
+- POST /api/v1/plans/jobs and GET /api/v1/plans/jobs/{job_id}[/result]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from core_engine.parser.sql_guard import UnsafeSQLError
+from httpx import AsyncClient
+
+from api.services.plan_job_service import (
+    PlanJobEngine,
+    PlanJobQueueFullError,
+    PlanJobStatus,
+)
+from api.services.plan_service import _compute_plan, _load_checked_models
+
+pytestmark = pytest.mark.usefixtures("bypass_feature_gate")
+
+
+class _SessionCM:
+    def __init__(self) -> None:
+        self.session = AsyncMock()
+        self.session.add = MagicMock()
+        self.session.get_bind = MagicMock()
+
+    async def __aenter__(self) -> Any:
+        return self.session
+
+    async def __aexit__(self, *args: object) -> None:
+        return None
+
+
+class _ControlledPlans:
+    """Stand-in for ``PlanService.generate_plan`` whose calls finish on demand."""
+
+    def __init__(self) -> None:
+        self.started: list[tuple[str, str]] = []
+        self._gates: dict[str, asyncio.Event] = {}
+        self.outcomes: dict[str, Exception] = {}
+
+    def release(self, target_sha: str) -> None:
+        self._gates.setdefault(target_sha, asyncio.Event()).set()
+
+    def factory(self, session: Any, ai: Any, settings: Any, *, tenant_id: str, **kwargs: Any) -> Any:
+        service = MagicMock()
+
+        async def _generate(repo_path: str, base_sha: str, target_sha: str) -> dict[str, Any]:
+            self.started.append((tenant_id, target_sha))
+            await self._gates.setdefault(target_sha, asyncio.Event()).wait()
+            if target_sha in self.outcomes:
+                raise self.outcomes[target_sha]
+            return {"plan_id": f"plan-{target_sha}", "summary": {"total_steps": 0}, "steps": []}
+
+        service.generate_plan = _generate
+        return service
+
+
+@pytest.fixture()
+def plans() -> _ControlledPlans:
+    controlled = _ControlledPlans()
+    with (
+        patch("api.services.plan_job_service.PlanService", side_effect=controlled.factory),
+        patch("api.services.plan_job_service.AuditService") as audit,
+    ):
+        audit.return_value.log = AsyncMock()
+        yield controlled
+
+
+def _engine(test_settings, **kwargs: Any) -> PlanJobEngine:
+    kwargs.setdefault("max_workers", 1)
+    return PlanJobEngine(
+        MagicMock(side_effect=_SessionCM),
+        AsyncMock(),
+        test_settings,
+        metering=MagicMock(),
+        executor=MagicMock(),
+        **kwargs,
+    )
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestPlanJobEngine:
+    async def test_submit_returns_before_plan_completes(self, test_settings, plans) -> None:
+        engine = _engine(test_settings)
+        job, created = engine.submit("t1", "/repo", "a1", "b1")
+        assert created and job.status is PlanJobStatus.RUNNING
+        await _settle()
+        assert job.plan is None
+
+        plans.release("b1")
+        await engine.wait(job, timeout=1)
+        assert job.status is PlanJobStatus.SUCCEEDED
+        assert job.to_dict()["plan_id"] == "plan-b1"
+        await engine.close()
+
+    async def test_identical_in_flight_requests_are_deduplicated(self, test_settings, plans) -> None:
+        engine = _engine(test_settings)
+        first, _ = engine.submit("t1", "/repo", "a1", "b1")
+        again, created = engine.submit("t1", "/repo", "a1", "b1")
+        other_tenant, other_created = engine.submit("t2", "/repo", "a1", "b1")
+        assert again is first and not created
+        assert other_tenant is not first and other_created
+
+        plans.release("b1")
+        await engine.wait(first, timeout=1)
+        await engine.wait(other_tenant, timeout=1)
+        # Finished jobs no longer absorb new submissions.
+        rerun, created = engine.submit("t1", "/repo", "a1", "b1")
+        assert created and rerun is not first
+        await engine.close()
+
+    async def test_round_robin_across_tenants(self, test_settings, plans) -> None:
+        engine = _engine(test_settings, max_workers=1, max_running_per_tenant=1)
+        for sha in ("a1", "a2", "a3"):
+            engine.submit("busy", "/repo", "base", sha)
+        engine.submit("quiet", "/repo", "base", "q1")
+        await _settle()
+
+        for sha in ("a1", "q1", "a2", "a3"):
+            plans.release(sha)
+            await _settle()
+        assert plans.started == [("busy", "a1"), ("quiet", "q1"), ("busy", "a2"), ("busy", "a3")]
+        await engine.close()
+
+    async def test_per_tenant_running_cap(self, test_settings, plans) -> None:
+        engine = _engine(test_settings, max_workers=3, max_running_per_tenant=1)
+        first, _ = engine.submit("t1", "/repo", "base", "x1")
+        second, _ = engine.submit("t1", "/repo", "base", "x2")
+        other, _ = engine.submit("t2", "/repo", "base", "y1")
+        await _settle()
+        assert (first.status, second.status, other.status) == (
+            PlanJobStatus.RUNNING,
+            PlanJobStatus.QUEUED,
+            PlanJobStatus.RUNNING,
+        )
+        plans.release("x1")
+        await engine.wait(first, timeout=1)
+        await _settle()
+        assert second.status is PlanJobStatus.RUNNING
+        await engine.close()
+
+    async def test_errors_map_to_http_status(self, test_settings, plans) -> None:
+        engine = _engine(test_settings, max_workers=3)
+        plans.outcomes = {
+            "bad": ValueError("Invalid git SHA"),
+            "diff": RuntimeError("git diff failed"),
+            "boom": KeyError("internal"),
+        }
+        jobs = [engine.submit("t1", "/repo", "base", sha)[0] for sha in plans.outcomes]
+        for sha in plans.outcomes:
+            plans.release(sha)
+        for job in jobs:
+            await engine.wait(job, timeout=1)
+        assert [(j.status, j.error_status) for j in jobs] == [
+            (PlanJobStatus.FAILED, 400),
+            (PlanJobStatus.FAILED, 422),
+            (PlanJobStatus.FAILED, 500),
+        ]
+        assert jobs[2].error == "Plan generation failed"
+        await engine.close()
+
+    async def test_broken_pool_is_replaced_and_reported_as_503(self, test_settings, plans) -> None:
+        engine = PlanJobEngine(MagicMock(side_effect=_SessionCM), AsyncMock(), test_settings, max_workers=1)
+        plans.outcomes = {"crash": BrokenProcessPool("worker died")}
+        with patch(
+            "api.services.plan_job_service.ProcessPoolExecutor",
+            side_effect=lambda **_: MagicMock(),
+        ) as pool_cls:
+            crashed, _ = engine.submit("t1", "/repo", "base", "crash")
+            await _settle()
+            broken = engine._executor
+            plans.release("crash")
+            await engine.wait(crashed, timeout=1)
+            assert (crashed.status, crashed.error_status) == (PlanJobStatus.FAILED, 503)
+            broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+            retried, _ = engine.submit("t1", "/repo", "base", "ok")
+            plans.release("ok")
+            await engine.wait(retried, timeout=1)
+            assert retried.status is PlanJobStatus.SUCCEEDED
+            assert pool_cls.call_count == 2 and engine._executor is not broken
+        await engine.close()
+
+    async def test_tenant_isolation_and_queue_limit(self, test_settings, plans) -> None:
+        engine = _engine(test_settings, max_workers=1, max_queued_per_tenant=1)
+        running, _ = engine.submit("t1", "/repo", "base", "r1")
+        engine.submit("t1", "/repo", "base", "r2")
+        with pytest.raises(PlanJobQueueFullError):
+            engine.submit("t1", "/repo", "base", "r3")
+        assert engine.get("t1", running.job_id) is running
+        assert engine.get("t2", running.job_id) is None
+        await engine.close()
+
+    async def test_close_fails_outstanding_jobs(self, test_settings, plans) -> None:
+        engine = _engine(test_settings, max_workers=1)
+        running, _ = engine.submit("t1", "/repo", "base", "c1")
+        queued, _ = engine.submit("t1", "/repo", "base", "c2")
+        await _settle()
+        await engine.close()
+        assert running.status is PlanJobStatus.FAILED and queued.status is PlanJobStatus.FAILED
+        assert queued.error_status == 503
+        with pytest.raises(RuntimeError):
+            engine.submit("t1", "/repo", "base", "c3")
+
+
+class TestProcessPoolPhases:
+    def test_plan_phases_run_in_spawned_workers(self, tmp_path: Path) -> None:
+        models_dir = tmp_path / "models"
+        models_dir.mkdir()
+        (models_dir / "orders.sql").write_text(
+            "-- name: orders\n-- kind: FULL_REFRESH\nSELECT 1 AS id\n", encoding="utf-8"
+        )
+        (models_dir / "summary.sql").write_text(
+            "-- name: summary\n-- kind: FULL_REFRESH\n-- dependencies: orders\nSELECT id FROM orders\n",
+            encoding="utf-8",
+        )
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            models = pool.submit(_load_checked_models, str(models_dir)).result(timeout=120)
+            plan, contracts, _, edges = pool.submit(
+                _compute_plan, models, {}, {}, {}, "a" * 40, "b" * 40, date(2024, 1, 1)
+            ).result(timeout=120)
+
+        expected, _, _, _ = _compute_plan(models, {}, {}, {}, "a" * 40, "b" * 40, date(2024, 1, 1))
+        assert {m.name for m in models} == {"orders", "summary"}
+        assert contracts is None
+        assert plan == expected
+        assert plan.summary.total_steps == 2
+        assert edges == [("orders", "summary")]
+
+    def test_unsafe_sql_error_survives_pickling(self) -> None:
+        import pickle
+
+        from core_engine.parser.sql_guard import check_sql_safety
+
+        violations = [v for v in check_sql_safety("DROP TABLE orders") if v.severity.value == "CRITICAL"]
+        restored = pickle.loads(pickle.dumps(UnsafeSQLError(violations)))
+        assert restored.violations == violations
+        assert "Unsafe SQL detected" in str(restored)
+
+
+# ---------------------------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------------------------
+
+
+_BODY = {"repo_path": "/tmp/repo", "base_sha": "aaa111", "target_sha": "bbb222"}
+
+
+@pytest.fixture()
+def job_engine(app, test_settings, plans) -> PlanJobEngine:
+    engine = _engine(test_settings)
+    app.state.plan_jobs = engine
+    return engine
+
+
+async def test_submit_and_poll_endpoints(client: AsyncClient, job_engine: PlanJobEngine, plans) -> None:
+    with patch("api.services.quota_service.QuotaService.check_plan_quota", AsyncMock(return_value=(True, None))):
+        resp = await client.post("/api/v1/plans/jobs", json=_BODY)
+        duplicate = await client.post("/api/v1/plans/jobs", json=_BODY)
+
+    assert resp.status_code == 202
+    job_id = resp.json()["job_id"]
+    assert resp.json()["status"] == "running"
+    assert resp.headers["location"].endswith(f"/api/v1/plans/jobs/{job_id}")
+    assert duplicate.json()["job_id"] == job_id
+
+    pending = await client.get(f"/api/v1/plans/jobs/{job_id}/result")
+    assert pending.status_code == 409
+
+    plans.release("bbb222")
+    status = await client.get(f"/api/v1/plans/jobs/{job_id}", params={"wait": 1})
+    assert status.status_code == 200
+    assert status.json()["status"] == "succeeded"
+    assert status.json()["plan"]["plan_id"] == "plan-bbb222"
+
+    result = await client.get(f"/api/v1/plans/jobs/{job_id}/result")
+    assert result.status_code == 200
+    assert result.json()["plan_id"] == "plan-bbb222"
+    await job_engine.close()
+
+
+async def test_failed_job_result_uses_error_status(client: AsyncClient, job_engine: PlanJobEngine, plans) -> None:
+    plans.outcomes["bbb222"] = ValueError("Not a valid git repository")
+    with patch("api.services.quota_service.QuotaService.check_plan_quota", AsyncMock(return_value=(True, None))):
+        job_id = (await client.post("/api/v1/plans/jobs", json=_BODY)).json()["job_id"]
+    plans.release("bbb222")
+    await job_engine.wait(job_engine._jobs[job_id], timeout=1)
+
+    result = await client.get(f"/api/v1/plans/jobs/{job_id}/result")
+    assert result.status_code == 400
+    assert "Not a valid git repository" in result.json()["detail"]
+    await job_engine.close()
+
+
+async def test_unknown_job_returns_404(client: AsyncClient, job_engine: PlanJobEngine) -> None:
+    resp = await client.get("/api/v1/plans/jobs/does-not-exist")
+    assert resp.status_code == 404
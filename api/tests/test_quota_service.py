@@ -4,17 +4,21 @@ Covers:
 - QuotaService: plan quota enforcement (community, team, enterprise tiers)
 - QuotaService: AI call quota enforcement
 - QuotaService: API request quota enforcement
+- QuotaService: counter-based check_and_reserve with Redis denial cache
+- QuotaService: releasing reservations after failed operations
+- UsageCounterReconciler: single-replica reconciliation passes
 - QuotaService: LLM daily and monthly budget checks
 - QuotaService: usage-vs-limits dashboard data assembly
 """
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from api.services.quota_service import QuotaService
+from api.services.quota_service import QuotaService, UsageCounterReconciler
 
 # ---------------------------------------------------------------------------
 # Shared fixtures
@@ -407,6 +411,139 @@ class TestCheckApiQuota:
         assert reason is None
 
 
+# ---------------------------------------------------------------------------
+# Reservation
+# ---------------------------------------------------------------------------
+
+
+class TestCheckAndReserve:
+    """Verify check_and_reserve reserves against the monthly counter."""
+
+    @pytest.mark.asyncio
+    async def test_reserves_slot_under_limit(self, mock_session: AsyncMock) -> None:
+        """A successful reservation is a single counter update, no advisory lock."""
+        service = _make_service(mock_session)
+
+        service._quota_repo = AsyncMock()
+        service._quota_repo.reserve = AsyncMock(return_value=(True, 13))
+        service._config_repo = AsyncMock()
+        service._config_repo.get = AsyncMock(return_value=None)
+
+        with patch.object(service, "_get_plan_tier", return_value="community"):
+            allowed, reason = await service.check_and_reserve("plan_run")
+
+        assert allowed is True
+        assert reason is None
+        service._quota_repo.reserve.assert_awaited_once_with("plan_run", 25)
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_denied_at_limit_is_cached_in_redis(self, mock_session: AsyncMock) -> None:
+        """A denial is cached so the next request skips the database."""
+        service = _make_service(mock_session)
+
+        service._quota_repo = AsyncMock()
+        service._quota_repo.reserve = AsyncMock(return_value=(False, 25))
+        service._config_repo = AsyncMock()
+        service._config_repo.get = AsyncMock(return_value=None)
+        redis = AsyncMock()
+        redis.get = AsyncMock(return_value=None)
+
+        with (
+            patch("api.services.quota_service.get_redis_client", AsyncMock(return_value=redis)),
+            patch.object(service, "_get_plan_tier", return_value="community"),
+        ):
+            allowed, reason = await service.check_and_reserve("plan_run")
+
+            assert allowed is False
+            assert reason is not None and "25/25" in reason
+            key, value = redis.set.await_args.args
+            assert key.startswith("quota:exhausted:test-tenant:plan_run:")
+            assert value == "25/25"
+
+            redis.get = AsyncMock(return_value="25/25")
+            allowed, reason = await service.check_and_reserve("plan_run")
+
+        assert allowed is False
+        assert reason is not None and "25/25" in reason
+        service._quota_repo.reserve.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unlimited_skips_reservation(self, mock_session: AsyncMock) -> None:
+        """Enterprise (unlimited) tenants never touch the counter."""
+        service = _make_service(mock_session)
+
+        service._quota_repo = AsyncMock()
+        service._config_repo = AsyncMock()
+        service._config_repo.get = AsyncMock(return_value=None)
+
+        with patch.object(service, "_get_plan_tier", return_value="enterprise"):
+            allowed, reason = await service.check_and_reserve("ai_call")
+
+        assert allowed is True
+        assert reason is None
+        service._quota_repo.reserve.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_event_type_raises(self, mock_session: AsyncMock) -> None:
+        service = _make_service(mock_session)
+        with pytest.raises(ValueError, match="Unknown event_type"):
+            await service.check_and_reserve("backfill_run")
+
+
+class TestReleaseReservation:
+    """Verify release_reservation hands a failed operation's slot back."""
+
+    @pytest.mark.asyncio
+    async def test_release_decrements_counter_and_clears_denial(self, mock_session: AsyncMock) -> None:
+        service = _make_service(mock_session)
+        service._quota_repo = AsyncMock()
+        redis = AsyncMock()
+
+        with patch("api.services.quota_service.get_redis_client", AsyncMock(return_value=redis)):
+            await service.release_reservation("plan_run")
+
+        service._quota_repo.release.assert_awaited_once_with("plan_run", 1)
+        (key,) = redis.delete.await_args.args
+        assert key.startswith("quota:exhausted:test-tenant:plan_run:")
+
+    @pytest.mark.asyncio
+    async def test_unknown_event_type_raises(self, mock_session: AsyncMock) -> None:
+        service = _make_service(mock_session)
+        with pytest.raises(ValueError, match="Unknown event_type"):
+            await service.release_reservation("backfill_run")
+
+
+class TestUsageCounterReconciler:
+    """Verify reconciliation passes run on a single replica."""
+
+    @pytest.mark.asyncio
+    async def test_skips_pass_when_lock_is_held_elsewhere(self, mock_session: AsyncMock) -> None:
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=None)
+        reconciler = UsageCounterReconciler(factory)
+
+        with patch("api.services.quota_service.UsageCounterRepository") as repo_cls:
+            repo_cls.return_value.try_lock_reconciliation = AsyncMock(return_value=False)
+            repo_cls.return_value.reconcile = AsyncMock(return_value=3)
+            assert await reconciler.reconcile_once() == 0
+            repo_cls.return_value.reconcile.assert_not_awaited()
+
+            repo_cls.return_value.try_lock_reconciliation = AsyncMock(return_value=True)
+            assert await reconciler.reconcile_once() == 3
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_first_pass_waits_one_interval(self, mock_session: AsyncMock) -> None:
+        reconciler = UsageCounterReconciler(MagicMock(), interval_seconds=3600)
+        with patch.object(reconciler, "reconcile_once", AsyncMock()) as reconcile_once:
+            await reconciler.start()
+            await asyncio.sleep(0)
+            await reconciler.stop()
+        reconcile_once.assert_not_awaited()
+
+
 # ---------------------------------------------------------------------------
 # LLM Budget
 # ---------------------------------------------------------------------------
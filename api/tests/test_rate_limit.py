@@ -111,6 +111,70 @@ async def test_counter_hit_and_count() -> None:
     await counter.stop()
 
 
+@pytest.mark.asyncio
+async def test_counter_memory_is_constant_per_key() -> None:
+    """Each key holds two counters no matter how many hits it receives."""
+    counter = SlidingWindowCounter(window_seconds=60.0, shards=4)
+    for _ in range(1_000):
+        await counter.hit("busy")
+    await counter.hit("quiet")
+
+    slots = [slot for shard in counter._shards for slot in shard.slots.values()]
+    assert len(slots) == 2
+    assert max(slot.current for slot in slots) == 1_000
+    await counter.stop()
+
+
+@pytest.mark.asyncio
+async def test_counter_weights_previous_window() -> None:
+    """Hits from the previous window decay linearly across the current one."""
+    counter = SlidingWindowCounter(window_seconds=60.0)
+    with patch("api.middleware.rate_limit.time.monotonic", return_value=6_000.0):
+        for _ in range(10):
+            await counter.hit("k")
+    # 15 s (a quarter) into the next window: 10 * 0.75 + 1.
+    with patch("api.middleware.rate_limit.time.monotonic", return_value=6_075.0):
+        assert await counter.hit("k") == 8
+        assert await counter.time_until_reset("k") == pytest.approx(45.0)
+    # Two windows later everything has aged out.
+    with patch("api.middleware.rate_limit.time.monotonic", return_value=6_200.0):
+        assert await counter.count("k") == 0
+        assert await counter.time_until_reset("k") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_counter_sweep_drops_idle_keys() -> None:
+    """Keys idle for two windows are removed by the cleanup sweep."""
+    counter = SlidingWindowCounter(window_seconds=60.0, shards=2)
+    with patch("api.middleware.rate_limit.time.monotonic", return_value=6_000.0):
+        await counter.hit("idle")
+    with patch("api.middleware.rate_limit.time.monotonic", return_value=6_130.0):
+        await counter.hit("active")
+        window, _ = counter._position()
+        removed = sum(counter._sweep_shard(shard, window) for shard in counter._shards)
+
+    assert removed == 1
+    assert [key for shard in counter._shards for key in shard.slots] == ["active"]
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_uses_single_script_call() -> None:
+    """Each Redis hit is one script invocation on one hash key."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from api.middleware.rate_limit import RedisRateLimitBackend
+
+    script = AsyncMock(return_value=[3, 12_500])
+    redis = MagicMock()
+    redis.register_script = MagicMock(return_value=script)
+    backend = RedisRateLimitBackend(redis, window_seconds=60.0)
+
+    assert await backend.hit("tenant:a:60") == 3
+    script.assert_awaited_once_with(keys=["rlw:tenant:a:60"], args=[60_000, 1])
+    assert await backend.time_until_reset("tenant:a:60") == 12.5
+    assert script.await_args.kwargs["args"] == [60_000, 0]
+
+
 @pytest.mark.asyncio
 async def test_counter_expiry() -> None:
     """Entries older than the window are pruned on the next access."""
@@ -229,8 +293,10 @@ async def test_sliding_window_resets() -> None:
         def _fake_monotonic() -> float:
             nonlocal call_count
             call_count += 1
-            # Immediately advance time by 61 seconds to simulate window expiry.
-            return original_monotonic() + 61.0
+            # Advance time by two windows: the approximated counter still
+            # weights the previous fixed window, so one window is not enough
+            # for the earlier requests to age out completely.
+            return original_monotonic() + 121.0
 
         # Exhaust the limit.
         for _ in range(2):
@@ -3,6 +3,7 @@
 Covers:
 - CSV export: headers, rows, empty items, special characters
 - JSON export: valid JSON, required keys, items match
+- Streaming export: chunked CSV, gzipped JSON, indented JSON layout, format validation
 - Unknown report type raises ValueError
 - Comparison report: cost delta, direction up/down/flat, zero previous, LLM, usage
 """
@@ -10,6 +11,7 @@ Covers:
 from __future__ import annotations
 
 import csv
+import gzip
 import io
 import json
 from datetime import UTC, datetime
@@ -263,6 +265,69 @@ class TestExportJSON:
         assert parsed["items"] == []
 
 
+# ---------------------------------------------------------------------------
+# TestExportStream
+# ---------------------------------------------------------------------------
+
+
+class TestExportStream:
+    """Verify export_stream encodes rows incrementally."""
+
+    @staticmethod
+    def _service_streaming(mock_session: AsyncMock, rows: list[dict]) -> ReportingService:
+        service = _make_service(mock_session)
+
+        async def _rows(report_type, since, until):
+            for row in rows:
+                yield row
+
+        service._repo.stream_export_rows = _rows
+        return service
+
+    @pytest.mark.asyncio
+    async def test_large_csv_is_emitted_in_chunks(self, mock_session: AsyncMock) -> None:
+        rows = [{"event_id": f"evt-{i:06d}", "event_type": "=cmd", "metadata": {"i": i}} for i in range(20_000)]
+        service = self._service_streaming(mock_session, rows)
+
+        chunks = [chunk async for chunk in service.export_stream("events", SINCE, UNTIL, "csv")]
+
+        assert len(chunks) > 1
+        assert max(len(c) for c in chunks) < 128 * 1024
+        parsed = list(csv.reader(io.StringIO(b"".join(chunks).decode("utf-8"))))
+        assert parsed[0] == ["event_id", "event_type", "metadata"]
+        assert len(parsed) == 20_001
+        assert parsed[1] == ["evt-000000", "'=cmd", "{'i': 0}"]
+
+    @pytest.mark.asyncio
+    async def test_gzip_json_round_trip(self, mock_session: AsyncMock) -> None:
+        rows = [{"call_type": f"t{i}", "cost_usd": i / 10} for i in range(5_000)]
+        service = self._service_streaming(mock_session, rows)
+
+        chunks = [chunk async for chunk in service.export_stream("llm", SINCE, UNTIL, "json", compress=True)]
+
+        parsed = json.loads(gzip.decompress(b"".join(chunks)))
+        assert parsed["items"] == rows
+        assert "exported_at" in parsed
+
+    @pytest.mark.asyncio
+    async def test_json_matches_indented_dump(self, mock_session: AsyncMock) -> None:
+        rows = [{"call_type": "classify", "tags": ["a", "b"], "meta": {"n": 1}}, {"call_type": "embed"}]
+        for items in (rows, []):
+            service = self._service_streaming(mock_session, items)
+
+            text = b"".join([chunk async for chunk in service.export_stream("llm", SINCE, UNTIL, "json")]).decode()
+
+            exported_at = json.loads(text)["exported_at"]
+            assert text == json.dumps({"items": items, "exported_at": exported_at}, indent=2)
+
+    @pytest.mark.asyncio
+    async def test_unsupported_format_rejected(self, mock_session: AsyncMock) -> None:
+        service = self._service_streaming(mock_session, [])
+        with pytest.raises(ValueError, match="Unsupported export format"):
+            async for _ in service.export_stream("cost", SINCE, UNTIL, "xml"):
+                pass
+
+
 # ---------------------------------------------------------------------------
 # TestExportUnknownType
 # ---------------------------------------------------------------------------
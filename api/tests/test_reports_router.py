@@ -4,7 +4,7 @@ Covers:
 - GET /admin/reports/cost: cost report with date range and grouping
 - GET /admin/reports/usage: usage report with date range and grouping
 - GET /admin/reports/llm: LLM cost and token usage report
-- GET /admin/reports/export: CSV and JSON export with streaming response
+- GET /admin/reports/export: streamed CSV, JSON and gzipped NDJSON export
 - RBAC: all endpoints require VIEW_REPORTS (admin-only)
 - Input validation: invalid report_type, invalid format, date parsing
 """
@@ -12,6 +12,7 @@ Covers:
 from __future__ import annotations
 
 import base64
+import gzip
 import hashlib
 import hmac
 import json
@@ -96,8 +97,23 @@ _LLM_REPORT: dict[str, Any] = {
     "until": "2024-07-01T00:00:00+00:00",
 }
 
-_CSV_BYTES = b"model,cost_usd,run_count\nstaging.orders,340.00,28\nmarts.revenue,510.00,42\n"
-_JSON_BYTES = b'[{"model":"staging.orders","cost_usd":340.00},{"model":"marts.revenue","cost_usd":510.00}]'
+_EXPORT_ROWS: list[dict[str, Any]] = [
+    {"model_name": "staging.orders", "cost_usd": 340.0, "run_count": 28},
+    {"model_name": "marts.revenue", "cost_usd": 510.0, "run_count": 42},
+]
+
+
+def _patch_export_rows(rows: list[dict[str, Any]] = _EXPORT_ROWS):
+    """Patch the repository so exports stream *rows* through the real encoders."""
+
+    async def _stream(report_type: str, since: Any, until: Any) -> Any:
+        for row in rows:
+            yield row
+
+    patcher = patch("api.services.reporting_service.ReportingRepository")
+    mock_repo = patcher.start()
+    mock_repo.return_value.stream_export_rows = _stream
+    return patcher
 
 
 # ---------------------------------------------------------------------------
@@ -229,11 +245,9 @@ class TestExportEndpoint:
 
     @pytest.mark.asyncio
     async def test_csv_export(self, client: AsyncClient) -> None:
-        """CSV export returns text/csv content type with Content-Disposition."""
-        with patch("api.routers.reports.ReportingService") as MockService:
-            instance = MockService.return_value
-            instance.export_data = AsyncMock(return_value=(_CSV_BYTES, "text/csv", "cost_report.csv"))
-
+        """CSV export streams text/csv with Content-Disposition."""
+        patcher = _patch_export_rows()
+        try:
             resp = await client.get(
                 f"{_BASE}/export",
                 params={
@@ -243,19 +257,23 @@ class TestExportEndpoint:
                     "format": "csv",
                 },
             )
+        finally:
+            patcher.stop()
 
         assert resp.status_code == 200
         assert resp.headers["content-type"].startswith("text/csv")
-        assert "cost_report.csv" in resp.headers["content-disposition"]
-        assert b"staging.orders" in resp.content
+        assert "ironlayer_cost_report_" in resp.headers["content-disposition"]
+        assert resp.content.splitlines() == [
+            b"model_name,cost_usd,run_count",
+            b"staging.orders,340.0,28",
+            b"marts.revenue,510.0,42",
+        ]
 
     @pytest.mark.asyncio
     async def test_json_export(self, client: AsyncClient) -> None:
         """JSON export returns application/json content type."""
-        with patch("api.routers.reports.ReportingService") as MockService:
-            instance = MockService.return_value
-            instance.export_data = AsyncMock(return_value=(_JSON_BYTES, "application/json", "cost_report.json"))
-
+        patcher = _patch_export_rows()
+        try:
             resp = await client.get(
                 f"{_BASE}/export",
                 params={
@@ -265,10 +283,32 @@ class TestExportEndpoint:
                     "format": "json",
                 },
             )
+        finally:
+            patcher.stop()
 
         assert resp.status_code == 200
         assert resp.headers["content-type"].startswith("application/json")
-        assert "cost_report.json" in resp.headers["content-disposition"]
+        assert ".json" in resp.headers["content-disposition"]
+        assert json.loads(resp.content)["items"] == _EXPORT_ROWS
+
+    @pytest.mark.asyncio
+    async def test_gzipped_ndjson_export(self, client: AsyncClient) -> None:
+        """NDJSON events export is gzip-compressed on the fly when requested."""
+        events = [{"event_id": f"e{i}", "event_type": "plan_run", "quantity": 1} for i in range(500)]
+        patcher = _patch_export_rows(events)
+        try:
+            resp = await client.get(
+                f"{_BASE}/export",
+                params={"report_type": "events", "format": "ndjson", "gzip": "true"},
+            )
+        finally:
+            patcher.stop()
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/gzip"
+        assert ".ndjson.gz" in resp.headers["content-disposition"]
+        lines = gzip.decompress(resp.content).decode("utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == events
 
     @pytest.mark.asyncio
     async def test_invalid_report_type(self, client: AsyncClient) -> None:
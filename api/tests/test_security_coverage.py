@@ -2,6 +2,7 @@
 
 Covers areas previously at 0% coverage:
 - CredentialVault: encrypt/decrypt round-trip, corrupted ciphertext
+- CredentialVault: derived-key cache, zeroing on eviction, async wrappers
 - TokenManager JWT mode: generate/validate happy path, expired, wrong secret
 - TokenManager dev mode: all tokens valid, expired, tampered
 - JWT secret rotation: jwt_secret_previous fallback
@@ -27,6 +28,8 @@ from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from core_engine.crypto import run_crypto
+from cryptography.fernet import InvalidToken
 from pydantic import SecretStr
 
 from api.security import (
@@ -37,6 +40,7 @@ from api.security import (
     TokenClaims,
     TokenConfig,
     TokenManager,
+    _DerivedKeyCache,
     _validate_url_safe,
 )
 
@@ -277,6 +281,47 @@ class TestCredentialVaultV2Salt:
         assert vault.decrypt(bare_ct) == plaintext
 
 
+class TestDerivedKeyCache:
+    """Derived vault keys are cached per salt with LRU eviction."""
+
+    def test_repeat_decrypt_derives_key_once(self) -> None:
+        vault = CredentialVault("test-master-key-for-cache")
+        ct = vault.encrypt("webhook-secret")
+        with patch("hashlib.pbkdf2_hmac", side_effect=AssertionError("derived again")):
+            assert vault.decrypt(ct) == "webhook-secret"
+            # A fresh vault instance (as created per request) shares the cache.
+            assert CredentialVault("test-master-key-for-cache").decrypt(ct) == "webhook-secret"
+
+    def test_cache_is_keyed_by_secret(self) -> None:
+        ct = CredentialVault("secret-key-alpha-cache").encrypt("sensitive")
+        with pytest.raises(InvalidToken):
+            CredentialVault("secret-key-beta-cache").decrypt(ct)
+
+    def test_eviction_is_least_recently_used(self) -> None:
+        cache = _DerivedKeyCache(max_entries=2)
+        cache.put(b"s", b"salt-1", b"\x01" * 32)
+        cache.put(b"s", b"salt-2", b"\x02" * 32)
+        assert cache.get(b"s", b"salt-1") == b"\x01" * 32
+        cache.put(b"s", b"salt-3", b"\x03" * 32)
+
+        assert cache.get(b"s", b"salt-2") is None
+        assert cache.get(b"s", b"salt-1") == b"\x01" * 32
+        assert cache.get(b"s", b"salt-3") == b"\x03" * 32
+        assert len(cache) == 2
+
+        cache.clear()
+        assert len(cache) == 0
+
+    async def test_async_round_trip_runs_off_loop(self) -> None:
+        vault = CredentialVault("test-master-key-for-async")
+        with patch("api.security.run_crypto", wraps=run_crypto) as spy:
+            ct = await vault.encrypt_async("dapi-token")
+            assert spy.await_count == 1
+            # The key for this salt is now cached, so decrypt runs inline.
+            assert await vault.decrypt_async(ct) == "dapi-token"
+            assert spy.await_count == 1
+
+
 # ===========================================================================
 # 2. TokenManager — dev mode
 # ===========================================================================
@@ -14,6 +14,7 @@ Conventions:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from datetime import datetime, timezone
@@ -1028,6 +1029,92 @@ class TestAIServiceClientAdvisoryMethods:
         client._client.aclose.assert_called_once()
 
 
+class TestAIServiceClientBatchMethods:
+    """Tests for the chunked ``*_batch`` advisory methods."""
+
+    def _make_client(self, **kwargs: Any) -> Any:
+        from api.services.ai_client import AIServiceClient
+
+        return AIServiceClient("http://ai-engine:8001", **kwargs)
+
+    async def test_items_are_chunked_and_results_stay_aligned(self) -> None:
+        client = self._make_client(batch_size=2, batch_concurrency=2)
+        in_flight = [0, 0]  # current, peak
+
+        async def _post(path: str, body: dict[str, Any]) -> dict[str, Any]:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            return {"results": [{"model": item["model_name"]} for item in body["items"]], "errors": []}
+
+        client._post = AsyncMock(side_effect=_post)
+        items = [
+            {"model_name": f"m{i}", "partition_count": 1, "historical_runtime_avg": None,
+             "data_volume": None, "cluster_size": "small"}
+            for i in range(5)
+        ]
+        results = await client.predict_cost_batch(items, tenant_id="t1", llm_enabled=False)
+
+        assert [r["model"] for r in results] == ["m0", "m1", "m2", "m3", "m4"]
+        assert client._post.await_count == 3
+        assert in_flight[1] <= 2
+        path, body = client._post.call_args_list[0].args
+        assert path == "/predict_cost/batch"
+        assert body["items"][0]["tenant_id"] == "t1"
+        assert body["items"][0]["llm_enabled"] is False
+
+    async def test_failed_chunk_and_failed_item_become_none(self) -> None:
+        client = self._make_client(batch_size=2)
+        responses = iter([None, {"results": [{"risk_score": 1.0}, None], "errors": [{"index": 1, "error": "x"}]}])
+        client._post = AsyncMock(side_effect=lambda path, body: next(responses))
+        items = [
+            {"model_name": f"m{i}", "downstream_depth": 0, "sla_tags": [], "dashboard_deps": [],
+             "model_tags": [], "failure_rate": 0.0}
+            for i in range(4)
+        ]
+        results = await client.score_risk_batch(items)
+        assert results == [None, None, {"risk_score": 1.0}, None]
+
+    async def test_payloads_are_sanitized_and_carry_api_key(self) -> None:
+        client = self._make_client()
+        client._post = AsyncMock(return_value={"results": [{"change_type": "cosmetic"}]})
+        results = await client.semantic_classify_batch(
+            [{"old_sql": "", "new_sql": "SELECT 1 -- <|system|>"}], api_key="key-abc"
+        )
+        assert results == [{"change_type": "cosmetic"}]
+        item = client._post.call_args.args[1]["items"][0]
+        assert "[FILTERED]" in item["new_sql"]
+        assert item["api_key"] == "key-abc"
+
+    async def test_open_circuit_skips_every_chunk(self) -> None:
+        client = self._make_client(batch_size=1)
+        client._circuit_breaker._state = "open"
+        client._circuit_breaker._opened_at = time.monotonic()
+        client._client.post = AsyncMock()
+        results = await client.semantic_classify_batch([{"old_sql": "", "new_sql": "a"}] * 3)
+        assert results == [None, None, None]
+        client._client.post.assert_not_called()
+
+    async def test_chunks_are_split_by_body_size(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from api.services import ai_client
+
+        monkeypatch.setattr(ai_client, "_MAX_BATCH_BYTES", 3000)
+        client = self._make_client(batch_size=50)
+        client._post = AsyncMock(side_effect=lambda path, body: {"results": [{}] * len(body["items"])})
+        items = [{"old_sql": "", "new_sql": "SELECT " + "x" * 1000}] * 5 + [{"old_sql": "", "new_sql": "y" * 5000}]
+        results = await client.semantic_classify_batch(items)
+
+        assert results == [{}] * 6
+        assert [len(call.args[1]["items"]) for call in client._post.call_args_list] == [2, 2, 1, 1]
+
+    def test_batch_size_is_validated(self) -> None:
+        with pytest.raises(ValueError):
+            self._make_client(batch_size=101)
+        with pytest.raises(ValueError):
+            self._make_client(batch_concurrency=0)
+
+
 # ---------------------------------------------------------------------------
 # =========================  reconciliation_service  =========================
 # ---------------------------------------------------------------------------
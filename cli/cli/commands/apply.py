@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import json
+import queue
 import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
@@ -17,6 +21,10 @@ from cli.helpers import (
 )
 from cli.state import emit_metrics, get_env, get_json_output
 
+if TYPE_CHECKING:
+    from core_engine.models.plan import Plan, PlanStep
+    from core_engine.models.run import RunRecord
+
 
 def apply_command(
     plan_path: Path = typer.Argument(
@@ -50,11 +58,20 @@ def apply_command(
         "--override-cluster",
         help="Override the cluster/warehouse used for execution.",
     ),
+    max_parallel: int = typer.Option(
+        1,
+        "--max-parallel",
+        min=1,
+        help=(
+            "Maximum number of steps to execute concurrently.  Each step starts as soon as "
+            "the steps it depends on have finished, and a failure cancels only its downstream "
+            "steps.  The default of 1 runs sequentially and stops at the first failure."
+        ),
+    ),
 ) -> None:
     """Execute a previously generated plan."""
     from core_engine.config import load_settings
-    from core_engine.executor import LocalExecutor
-    from core_engine.models.run import RunRecord, RunStatus
+    from core_engine.models.run import RunStatus
     from core_engine.planner import deserialize_plan
 
     try:
@@ -89,72 +106,18 @@ def apply_command(
             "total_steps": execution_plan.summary.total_steps,
             "env": get_env(),
             "approved_by": approve_by or ("auto" if auto_approve else "dev-default"),
+            "max_parallel": max_parallel,
         },
     )
 
-    run_records: list[dict] = []
-    failed = False
-
-    with LocalExecutor(db_path=settings.local_db_path) as executor:
-        for idx, step in enumerate(execution_plan.steps, start=1):
-            step_label = f"[{idx}/{execution_plan.summary.total_steps}] {step.model}"
-
-            if failed:
-                run_records.append(
-                    {
-                        "model": step.model,
-                        "status": "CANCELLED",
-                        "duration_seconds": 0.0,
-                        "input_range": format_input_range(step.input_range),
-                        "retries": 0,
-                    }
-                )
-                continue
-
-            with console.status(f"Executing {step_label}...", spinner="dots"):
-                parameters: dict[str, str] = {}
-                if step.input_range is not None:
-                    parameters["start_date"] = step.input_range.start.isoformat()
-                    parameters["end_date"] = step.input_range.end.isoformat()
-
-                if override_cluster:
-                    parameters["cluster_id"] = override_cluster
-
-                model_sql = resolve_model_sql(step.model, sql_map)
-                record: RunRecord = executor.execute_step(
-                    step=step,
-                    sql=model_sql,
-                    parameters=parameters,
-                )
-
-            duration = 0.0
-            if record.started_at and record.finished_at:
-                duration = (record.finished_at - record.started_at).total_seconds()
-
-            run_records.append(
-                {
-                    "model": step.model,
-                    "status": record.status.value,
-                    "duration_seconds": round(duration, 2),
-                    "input_range": format_input_range(step.input_range),
-                    "retries": record.retry_count,
-                }
-            )
-
-            emit_metrics(
-                "step.completed",
-                {
-                    "plan_id": execution_plan.plan_id,
-                    "step_id": step.step_id,
-                    "model": step.model,
-                    "status": record.status.value,
-                    "duration_seconds": round(duration, 2),
-                },
-            )
-
-            if record.status == RunStatus.FAIL:
-                failed = True
-                console.print(f"[red]Step {step_label} failed: {record.error_message}[/red]")
+    run_records = _execute_plan_steps(
+        execution_plan,
+        sql_map=sql_map,
+        db_path=settings.local_db_path,
+        override_cluster=override_cluster,
+        max_parallel=max_parallel,
+    )
+    failed = any(r["status"] == RunStatus.FAIL.value for r in run_records)
 
     emit_metrics(
         "apply.completed",
@@ -172,3 +135,128 @@ def apply_command(
 
     if failed:
         raise typer.Exit(code=3)
+
+
+def _step_parameters(step: PlanStep, override_cluster: str | None) -> dict[str, str]:
+    """Build the executor parameters for a single plan step."""
+    parameters: dict[str, str] = {}
+    if step.input_range is not None:
+        parameters["start_date"] = step.input_range.start.isoformat()
+        parameters["end_date"] = step.input_range.end.isoformat()
+    if override_cluster:
+        parameters["cluster_id"] = override_cluster
+    return parameters
+
+
+def _cancelled_record(step: PlanStep) -> dict:
+    """Return the run-record row for a step that was never started."""
+    return {
+        "model": step.model,
+        "status": "CANCELLED",
+        "duration_seconds": 0.0,
+        "input_range": format_input_range(step.input_range),
+        "retries": 0,
+    }
+
+
+def _execute_plan_steps(
+    execution_plan: Plan,
+    *,
+    sql_map: dict[str, str],
+    db_path: Path,
+    override_cluster: str | None,
+    max_parallel: int,
+) -> list[dict]:
+    """Run every plan step through a dependency-driven ready queue.
+
+    Steps are dispatched to a thread pool as soon as all of their
+    ``depends_on`` steps have succeeded.  Each worker borrows its own
+    :class:`LocalExecutor` (and therefore its own DuckDB connection) from a
+    small pool so no connection is ever shared between threads.
+
+    With ``max_parallel == 1`` the plan runs in plan order and the first
+    failure cancels everything that has not started, matching the historical
+    sequential behaviour.  With more workers a failure cancels only the
+    failed step's downstream closure; unrelated branches run to completion.
+
+    Returns one run-record row per step, in plan order, regardless of the
+    order in which steps actually finished.
+    """
+    from core_engine.executor import LocalExecutor, StepScheduler
+    from core_engine.models.run import RunStatus
+
+    steps = execution_plan.steps
+    total = len(steps)
+    position = {step.step_id: idx for idx, step in enumerate(steps, start=1)}
+    scheduler = StepScheduler(steps, fail_fast=max_parallel == 1)
+    results: dict[str, dict] = {}
+    worker_count = min(max_parallel, total)
+
+    with ExitStack() as stack:
+        executors: queue.SimpleQueue[LocalExecutor] = queue.SimpleQueue()
+        for _ in range(worker_count):
+            executors.put(stack.enter_context(LocalExecutor(db_path=db_path)))
+
+        def _run(step: PlanStep, sql: str) -> RunRecord:
+            executor = executors.get()
+            try:
+                return executor.execute_step(
+                    step=step,
+                    sql=sql,
+                    parameters=_step_parameters(step, override_cluster),
+                )
+            finally:
+                executors.put(executor)
+
+        pool = stack.enter_context(ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="ironlayer-apply"))
+        in_flight: dict[Future[RunRecord], PlanStep] = {}
+
+        with console.status("Executing plan...", spinner="dots") as status:
+            while not scheduler.is_finished():
+                while len(in_flight) < worker_count and (next_step := scheduler.next_ready()) is not None:
+                    model_sql = resolve_model_sql(next_step.model, sql_map)
+                    in_flight[pool.submit(_run, next_step, model_sql)] = next_step
+
+                if not in_flight:
+                    break
+
+                running = ", ".join(s.model for s in in_flight.values())
+                status.update(f"Executing [{len(results)}/{total}] {running}...")
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: position[in_flight[f].step_id]):
+                    step = in_flight.pop(future)
+                    record = future.result()
+                    step_label = f"[{position[step.step_id]}/{total}] {step.model}"
+
+                    duration = 0.0
+                    if record.started_at and record.finished_at:
+                        duration = (record.finished_at - record.started_at).total_seconds()
+
+                    results[step.step_id] = {
+                        "model": step.model,
+                        "status": record.status.value,
+                        "duration_seconds": round(duration, 2),
+                        "input_range": format_input_range(step.input_range),
+                        "retries": record.retry_count,
+                    }
+
+                    emit_metrics(
+                        "step.completed",
+                        {
+                            "plan_id": execution_plan.plan_id,
+                            "step_id": step.step_id,
+                            "model": step.model,
+                            "status": record.status.value,
+                            "duration_seconds": round(duration, 2),
+                        },
+                    )
+
+                    if record.status == RunStatus.FAIL:
+                        console.print(f"[red]Step {step_label} failed: {record.error_message}[/red]")
+                        for cancelled in scheduler.mark_failed(step.step_id):
+                            results[cancelled.step_id] = _cancelled_record(cancelled)
+                    else:
+                        scheduler.mark_succeeded(step.step_id)
+
+    return [results.get(step.step_id) or _cancelled_record(step) for step in steps]
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import json
+import queue
 import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
 from datetime import date, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
 
@@ -13,6 +17,10 @@ from cli.display import display_run_results
 from cli.helpers import console, load_model_sql_map, parse_date, resolve_model_sql
 from cli.state import emit_metrics, get_env, get_json_output
 
+if TYPE_CHECKING:
+    from core_engine.executor import ChunkProgress
+    from core_engine.models.run import RunRecord
+
 
 def backfill_command(
     model: str = typer.Option(
@@ -164,12 +172,16 @@ def backfill_chunked_command(
         "--cluster",
         help="Override the cluster/warehouse used for execution.",
     ),
+    max_concurrent_chunks: int = typer.Option(
+        1,
+        "--max-concurrent-chunks",
+        help="Maximum number of non-overlapping chunks to execute at once (default 1).",
+        min=1,
+    ),
 ) -> None:
     """Run a chunked backfill with checkpoint-based resume capability."""
-    from core_engine.config import load_settings
-    from core_engine.executor import LocalExecutor
-    from core_engine.models.plan import DateRange, PlanStep, RunType, compute_deterministic_id
-    from core_engine.models.run import RunStatus
+    from core_engine.executor import ChunkProgress
+    from core_engine.models.plan import compute_deterministic_id
 
     start_date = parse_date(start, "start")
     end_date = parse_date(end, "end")
@@ -178,13 +190,7 @@ def backfill_chunked_command(
         console.print("[red]Start date must not be after end date.[/red]")
         raise typer.Exit(code=3)
 
-    chunks: list[tuple[date, date]] = []
-    cursor = start_date
-    while cursor <= end_date:
-        chunk_end = min(cursor + timedelta(days=chunk_days - 1), end_date)
-        chunks.append((cursor, chunk_end))
-        cursor = chunk_end + timedelta(days=1)
-
+    chunks = _split_chunks(start_date, end_date, chunk_days)
     backfill_id = compute_deterministic_id("chunked_backfill", model, start, end, str(chunk_days))
 
     console.print(
@@ -193,52 +199,127 @@ def backfill_chunked_command(
         f"({len(chunks)} chunks of {chunk_days} day(s))"
     )
 
-    settings = load_settings(env=get_env())
-    with LocalExecutor(db_path=settings.local_db_path) as executor:
-        sql_map = load_model_sql_map(repo)
-        model_sql = resolve_model_sql(model, sql_map)
+    total = len(chunks)
+    progress = ChunkProgress(total)
+    sql_map = load_model_sql_map(repo)
+    model_sql = resolve_model_sql(model, sql_map)
+
+    emit_metrics(
+        "backfill_chunked.started",
+        {
+            "model": model,
+            "start": start,
+            "end": end,
+            "chunk_days": chunk_days,
+            "total_chunks": total,
+            "max_concurrent_chunks": max_concurrent_chunks,
+        },
+    )
 
-        emit_metrics(
-            "backfill_chunked.started",
-            {"model": model, "start": start, "end": end, "chunk_days": chunk_days, "total_chunks": len(chunks)},
-        )
+    results, failed = _run_chunks(
+        model,
+        model_sql,
+        chunks,
+        cluster=cluster,
+        max_concurrent_chunks=max_concurrent_chunks,
+        progress=progress,
+        backfill_id=backfill_id,
+    )
 
-        run_records: list[dict] = []
-        failed = False
-        completed_through: date | None = None
-
-        for i, (chunk_start, chunk_end) in enumerate(chunks, start=1):
-            chunk_label = f"[{i}/{len(chunks)}] {model} ({chunk_start} .. {chunk_end})"
-
-            if failed:
-                run_records.append(
-                    {
-                        "model": model,
-                        "status": "CANCELLED",
-                        "duration_seconds": 0.0,
-                        "input_range": f"{chunk_start} .. {chunk_end}",
-                        "retries": 0,
-                        "chunk": i,
-                    }
-                )
-                continue
-
-            step_id = compute_deterministic_id(
-                model, "chunk", chunk_start.isoformat(), chunk_end.isoformat()
-            )
-            input_range = DateRange(start=chunk_start, end=chunk_end)
+    run_records = [results.get(i) or _cancelled_chunk_record(model, chunks[i], i + 1) for i in range(total)]
+    # Only the contiguous completed prefix is reported, so the high-water
+    # mark never skips over a chunk that failed or never ran.
+    prefix = progress.contiguous_prefix
+    completed_through = chunks[prefix - 1][1] if prefix else None
+
+    emit_metrics(
+        "backfill_chunked.completed",
+        {
+            "model": model,
+            "backfill_id": backfill_id,
+            "failed": failed,
+            "completed_chunks": progress.completed_count,
+            "total_chunks": total,
+        },
+    )
+
+    if get_json_output():
+        result = {
+            "backfill_id": backfill_id,
+            "model": model,
+            "status": "FAILED" if failed else "COMPLETED",
+            "completed_through": completed_through.isoformat() if completed_through else None,
+            "total_chunks": total,
+            "completed_chunks": progress.completed_count,
+            "runs": run_records,
+        }
+        sys.stdout.write(json.dumps(result, indent=2, default=str) + "\n")
+    else:
+        display_run_results(console, run_records)
+
+    if failed:
+        raise typer.Exit(code=3)
+
+    console.print("[green]All chunks completed successfully.[/green]")
+
+
+def _split_chunks(start_date: date, end_date: date, chunk_days: int) -> list[tuple[date, date]]:
+    """Split the inclusive range into consecutive chunks of *chunk_days* days."""
+    chunks: list[tuple[date, date]] = []
+    cursor = start_date
+    while cursor <= end_date:
+        chunk_end = min(cursor + timedelta(days=chunk_days - 1), end_date)
+        chunks.append((cursor, chunk_end))
+        cursor = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def _run_chunks(
+    model: str,
+    model_sql: str,
+    chunks: list[tuple[date, date]],
+    *,
+    cluster: str | None,
+    max_concurrent_chunks: int,
+    progress: ChunkProgress,
+    backfill_id: str,
+) -> tuple[dict[int, dict[str, Any]], bool]:
+    """Execute *chunks* on up to *max_concurrent_chunks* worker threads.
+
+    Completed chunks are marked in *progress*.  Returns the run-record
+    row of every chunk that ran, keyed by chunk index, and whether any
+    chunk failed.
+    """
+    from core_engine.config import load_settings
+    from core_engine.executor import LocalExecutor
+    from core_engine.models.plan import DateRange, PlanStep, RunType, compute_deterministic_id
+    from core_engine.models.run import RunStatus
+
+    settings = load_settings(env=get_env())
+    total = len(chunks)
+    worker_count = min(max_concurrent_chunks, total)
+    results: dict[int, dict[str, Any]] = {}
+    failed = False
+
+    with ExitStack() as stack:
+        # One LocalExecutor (and DuckDB connection) per worker thread.
+        executors: queue.SimpleQueue[LocalExecutor] = queue.SimpleQueue()
+        for _ in range(worker_count):
+            executors.put(stack.enter_context(LocalExecutor(db_path=settings.local_db_path)))
+
+        def _run(index: int) -> RunRecord:
+            chunk_start, chunk_end = chunks[index]
             step = PlanStep(
-                step_id=step_id,
+                step_id=compute_deterministic_id(model, "chunk", chunk_start.isoformat(), chunk_end.isoformat()),
                 model=model,
                 run_type=RunType.INCREMENTAL,
-                input_range=input_range,
+                input_range=DateRange(start=chunk_start, end=chunk_end),
                 depends_on=[],
                 parallel_group=0,
-                reason=f"chunked backfill chunk {i}/{len(chunks)}",
+                reason=f"chunked backfill chunk {index + 1}/{total}",
                 estimated_compute_seconds=0.0,
                 estimated_cost_usd=0.0,
             )
-
             parameters: dict[str, str] = {
                 "start_date": chunk_start.isoformat(),
                 "end_date": chunk_end.isoformat(),
@@ -246,79 +327,96 @@ def backfill_chunked_command(
             if cluster:
                 parameters["cluster_id"] = cluster
 
-            with console.status(f"Executing {chunk_label}...", spinner="dots"):
-                record = executor.execute_step(
-                    step=step,
-                    sql=model_sql,
-                    parameters=parameters,
-                )
-
-            duration = 0.0
-            if record.started_at and record.finished_at:
-                duration = (record.finished_at - record.started_at).total_seconds()
-
-            run_records.append(
-                {
-                    "model": model,
-                    "status": record.status.value,
-                    "duration_seconds": round(duration, 2),
-                    "input_range": f"{chunk_start} .. {chunk_end}",
-                    "retries": record.retry_count,
-                    "chunk": i,
-                }
-            )
+            executor = executors.get()
+            try:
+                return executor.execute_step(step=step, sql=model_sql, parameters=parameters)
+            finally:
+                executors.put(executor)
 
-            emit_metrics(
-                "backfill_chunked.chunk_completed",
-                {
-                    "model": model,
-                    "chunk": i,
-                    "total_chunks": len(chunks),
-                    "status": record.status.value,
-                    "duration_seconds": round(duration, 2),
-                },
-            )
-
-            if record.status == RunStatus.FAIL:
-                failed = True
-                console.print(f"[red]Chunk {chunk_label} failed: {record.error_message}[/red]")
-                console.print(
-                    f"[yellow]Resume from this point with:[/yellow]\n"
-                    f"  ironlayer backfill-resume --backfill-id {backfill_id}"
-                )
-            else:
-                completed_through = chunk_end
-                console.print(f"  [green]✓[/green] Chunk {i}/{len(chunks)} completed")
-
-        emit_metrics(
-            "backfill_chunked.completed",
-            {
-                "model": model,
-                "backfill_id": backfill_id,
-                "failed": failed,
-                "completed_chunks": len([r for r in run_records if r["status"] == "SUCCESS"]),
-                "total_chunks": len(chunks),
-            },
+        pool = stack.enter_context(
+            ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="ironlayer-backfill")
         )
+        in_flight: dict[Future[RunRecord], int] = {}
+        next_index = 0
+
+        with console.status(f"Executing chunks of {model}...", spinner="dots") as status:
+            while True:
+                # Stop handing out chunks after the first failure; chunks
+                # already running are allowed to finish.
+                while not failed and next_index < total and len(in_flight) < worker_count:
+                    in_flight[pool.submit(_run, next_index)] = next_index
+                    next_index += 1
+
+                if not in_flight:
+                    break
+
+                running = ", ".join(str(i + 1) for i in sorted(in_flight.values()))
+                status.update(f"Executing chunk(s) {running} of {total} for {model}...")
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=in_flight.__getitem__):
+                    index = in_flight.pop(future)
+                    record = future.result()
+                    results[index] = _chunk_run_row(model, record, chunks[index], index + 1, total)
+
+                    if record.status == RunStatus.FAIL:
+                        chunk_start, chunk_end = chunks[index]
+                        chunk_label = f"[{index + 1}/{total}] {model} ({chunk_start} .. {chunk_end})"
+                        console.print(f"[red]Chunk {chunk_label} failed: {record.error_message}[/red]")
+                        if not failed:
+                            console.print(
+                                f"[yellow]Resume from this point with:[/yellow]\n"
+                                f"  ironlayer backfill-resume --backfill-id {backfill_id}"
+                            )
+                        failed = True
+                    else:
+                        progress.mark_done(index)
+                        console.print(f"  [green]✓[/green] Chunk {index + 1}/{total} completed")
+
+    return results, failed
+
+
+def _chunk_run_row(
+    model: str, record: RunRecord, chunk: tuple[date, date], chunk_num: int, total: int
+) -> dict[str, Any]:
+    """Return the run-record row for a finished chunk and emit its metric."""
+    chunk_start, chunk_end = chunk
+    duration = 0.0
+    if record.started_at and record.finished_at:
+        duration = (record.finished_at - record.started_at).total_seconds()
+
+    emit_metrics(
+        "backfill_chunked.chunk_completed",
+        {
+            "model": model,
+            "chunk": chunk_num,
+            "total_chunks": total,
+            "status": record.status.value,
+            "duration_seconds": round(duration, 2),
+        },
+    )
 
-        if get_json_output():
-            result = {
-                "backfill_id": backfill_id,
-                "model": model,
-                "status": "FAILED" if failed else "COMPLETED",
-                "completed_through": completed_through.isoformat() if completed_through else None,
-                "total_chunks": len(chunks),
-                "completed_chunks": len([r for r in run_records if r["status"] == "SUCCESS"]),
-                "runs": run_records,
-            }
-            sys.stdout.write(json.dumps(result, indent=2, default=str) + "\n")
-        else:
-            display_run_results(console, run_records)
-
-        if failed:
-            raise typer.Exit(code=3)
-
-        console.print("[green]All chunks completed successfully.[/green]")
+    return {
+        "model": model,
+        "status": record.status.value,
+        "duration_seconds": round(duration, 2),
+        "input_range": f"{chunk_start} .. {chunk_end}",
+        "retries": record.retry_count,
+        "chunk": chunk_num,
+    }
+
+
+def _cancelled_chunk_record(model: str, chunk: tuple[date, date], chunk_num: int) -> dict[str, Any]:
+    """Return the run-record row for a chunk that was never started."""
+    chunk_start, chunk_end = chunk
+    return {
+        "model": model,
+        "status": "CANCELLED",
+        "duration_seconds": 0.0,
+        "input_range": f"{chunk_start} .. {chunk_end}",
+        "retries": 0,
+        "chunk": chunk_num,
+    }
 
 
 def backfill_resume_command(
@@ -231,7 +231,7 @@ def _run_python_fallback(
     (model_loader, ref_resolver, sql_guard) when the Rust extension
     is not available (e.g., unsupported platform).
     """
-    from core_engine.loader import load_models_from_directory
+    from core_engine.loader import default_cache_dir, load_models_from_directory
     from core_engine.parser.sql_guard import check_sql_safety
 
     start_time = time.monotonic()
@@ -241,7 +241,7 @@ def _run_python_fallback(
         models_dir = repo
 
     try:
-        models = load_models_from_directory(models_dir)
+        models = load_models_from_directory(models_dir, cache_dir=default_cache_dir(repo))
     except Exception as exc:
         console.print(f"[red]Failed to load models: {exc}[/red]")
         raise typer.Exit(code=3) from exc
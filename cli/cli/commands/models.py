@@ -23,14 +23,14 @@ def models_command(
     ),
 ) -> None:
     """List all models discovered in a repository."""
-    from core_engine.loader import load_models_from_directory
+    from core_engine.loader import default_cache_dir, load_models_from_directory
 
     models_dir = repo / "models"
     if not models_dir.is_dir():
         models_dir = repo
 
     try:
-        model_defs = load_models_from_directory(models_dir)
+        model_defs = load_models_from_directory(models_dir, cache_dir=default_cache_dir(repo))
     except Exception as exc:
         console.print(f"[red]Failed to load models: {exc}[/red]")
         raise typer.Exit(code=3) from exc
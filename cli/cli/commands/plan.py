@@ -5,6 +5,7 @@ from __future__ import annotations
 import sys
 from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
@@ -12,6 +13,11 @@ from cli.display import display_plan_summary
 from cli.helpers import console, load_stored_token, parse_date
 from cli.state import emit_metrics, get_env, get_json_output
 
+if TYPE_CHECKING:
+    import networkx as nx
+
+    from core_engine.models.model_definition import ModelDefinition
+
 
 def plan_command(
     repo: Path = typer.Argument(
@@ -44,10 +50,8 @@ def plan_command(
     """Generate a deterministic execution plan from a git diff."""
     from core_engine.config import load_settings
     from core_engine.diff import compute_structural_diff
-    from core_engine.git import get_changed_files, get_file_at_commit, validate_repo
-    from core_engine.graph import build_dag
-    from core_engine.loader import load_models_from_directory
-    from core_engine.parser import compute_canonical_hash
+    from core_engine.git import validate_repo
+    from core_engine.loader import default_cache_dir, load_models_from_directory
     from core_engine.planner import PlannerConfig, generate_plan, serialize_plan
 
     try:
@@ -56,39 +60,15 @@ def plan_command(
         models_dir = repo / "models"
         if not models_dir.is_dir():
             models_dir = repo
-        models = load_models_from_directory(models_dir)
+        cache_dir = default_cache_dir(repo)
+        models = load_models_from_directory(models_dir, cache_dir=cache_dir)
         if not models:
             console.print("[yellow]No models found. Nothing to plan.[/yellow]")
             raise typer.Exit(code=0)
 
-        dag = build_dag(models)
-        changed_files = get_changed_files(repo, base, target)
-        sql_changed = [cf for cf in changed_files if cf.path.endswith(".sql")]
-
+        dag = _load_dag(models, cache_dir, models_dir)
         model_map = {m.name: m for m in models}
-        changed_model_names = set()
-        for cf in sql_changed:
-            for m in models:
-                if m.file_path.endswith(cf.path) or cf.path.endswith(m.file_path):
-                    changed_model_names.add(m.name)
-
-        previous_versions: dict[str, str] = {}
-        current_versions: dict[str, str] = {}
-        for m in models:
-            current_versions[m.name] = m.content_hash
-
-        for m_name in changed_model_names:
-            m_def = model_map[m_name]
-            try:
-                old_sql = get_file_at_commit(repo, m_def.file_path, base)
-                previous_versions[m_name] = compute_canonical_hash(old_sql)
-            except Exception:
-                pass
-
-        for m in models:
-            if m.name not in changed_model_names:
-                previous_versions[m.name] = m.content_hash
-                current_versions[m.name] = m.content_hash
+        previous_versions, current_versions = _model_versions(repo, base, target, models)
 
         diff_result = compute_structural_diff(previous_versions, current_versions)
         ref_date = parse_date(as_of_date, "as-of-date") if as_of_date else date.today()
@@ -147,3 +127,61 @@ def plan_command(
         console.print(f"[red]Error generating plan: {exc}[/red]")
         emit_metrics("plan.error", {"error": str(exc)})
         raise typer.Exit(code=3) from exc
+
+
+def _load_dag(models: list[ModelDefinition], cache_dir: Path, models_dir: Path) -> nx.DiGraph:
+    """Patch the previous run's DAG with only the models that changed."""
+    from core_engine.graph import CyclicDependencyError, build_dag, load_incremental_dag
+    from core_engine.loader import dag_snapshot_file
+
+    try:
+        return load_incremental_dag(models, dag_snapshot_file(cache_dir, models_dir)).graph
+    except CyclicDependencyError:
+        return build_dag(models)
+
+
+def _model_versions(
+    repo: Path,
+    base: str,
+    target: str,
+    models: list[ModelDefinition],
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Return the ``(previous, current)`` content hashes of every model.
+
+    Models whose SQL file changed between *base* and *target* get their
+    previous hash from the file at *base*; a model that did not exist
+    there has no previous hash.  Unchanged models hash the same on both
+    sides.
+    """
+    from core_engine.git import GitObjectReader, get_changed_files
+    from core_engine.parser import compute_canonical_hash
+
+    sql_changed = [cf for cf in get_changed_files(repo, base, target) if cf.path.endswith(".sql")]
+
+    changed_model_paths: dict[str, str] = {}
+    for cf in sql_changed:
+        for m in models:
+            if m.file_path.endswith(cf.path) or cf.path.endswith(m.file_path):
+                changed_model_paths.setdefault(m.name, cf.path)
+
+    previous_versions: dict[str, str] = {}
+    current_versions = {m.name: m.content_hash for m in models}
+
+    # Fetch every changed model's base version through one git process.
+    if changed_model_paths:
+        with GitObjectReader(repo) as reader:
+            old_sources = reader.read_blobs(base, changed_model_paths.values())
+        for m_name, path in changed_model_paths.items():
+            old_sql = old_sources.get(path)
+            if old_sql is None:
+                continue
+            try:
+                previous_versions[m_name] = compute_canonical_hash(old_sql)
+            except Exception:
+                pass
+
+    for m in models:
+        if m.name not in changed_model_paths:
+            previous_versions[m.name] = m.content_hash
+
+    return previous_versions, current_versions
@@ -109,12 +109,12 @@ def api_request(
 
 def load_model_sql_map(repo_path: Path) -> dict[str, str]:
     """Load all model definitions from a repo and return a {model_name: clean_sql} map."""
-    from core_engine.loader import load_models_from_directory
+    from core_engine.loader import default_cache_dir, load_models_from_directory
 
     models_dir = repo_path / "models"
     if not models_dir.is_dir():
         models_dir = repo_path
-    model_list = load_models_from_directory(models_dir)
+    model_list = load_models_from_directory(models_dir, cache_dir=default_cache_dir(repo_path))
     return {m.name: m.clean_sql for m in model_list}
 
 
@@ -58,12 +58,12 @@ async def ironlayer_plan(
     """
     from core_engine.diff.change_detector import detect_changes
     from core_engine.graph import build_dag, topological_sort
-    from core_engine.loader import load_models_from_directory
+    from core_engine.loader import default_cache_dir, load_models_from_directory
     from core_engine.planner.planner import build_plan
 
     models_dir = _resolve_models_dir(repo_path)
 
-    model_defs = load_models_from_directory(models_dir)
+    model_defs = load_models_from_directory(models_dir, cache_dir=default_cache_dir(Path(repo_path)))
     if not model_defs:
         return {"status": "empty", "message": "No models found", "steps": []}
 
@@ -158,11 +158,11 @@ async def ironlayer_lineage(
 ) -> dict[str, Any]:
     """Return upstream and downstream table-level lineage for a model."""
     from core_engine.graph import build_dag, get_downstream, get_upstream
-    from core_engine.loader import load_models_from_directory
+    from core_engine.loader import default_cache_dir, load_models_from_directory
 
     models_dir = _resolve_models_dir(repo_path)
 
-    model_defs = load_models_from_directory(models_dir)
+    model_defs = load_models_from_directory(models_dir, cache_dir=default_cache_dir(Path(repo_path)))
     if not model_defs:
         return {"error": "No models found"}
 
@@ -213,12 +213,12 @@ async def ironlayer_column_lineage(
         compute_model_column_lineage,
         trace_column_across_dag,
     )
-    from core_engine.loader import load_models_from_directory
+    from core_engine.loader import default_cache_dir, load_models_from_directory
     from core_engine.sql_toolkit import Dialect, SqlLineageError
 
     models_dir = _resolve_models_dir(repo_path)
 
-    model_defs = load_models_from_directory(models_dir)
+    model_defs = load_models_from_directory(models_dir, cache_dir=default_cache_dir(Path(repo_path)))
     if not model_defs:
         return {"error": "No models found"}
 
@@ -363,12 +363,12 @@ async def ironlayer_validate(
 
     Returns all contract violations with severity levels.
     """
-    from core_engine.loader import load_models_from_directory
+    from core_engine.loader import default_cache_dir, load_models_from_directory
     from core_engine.sql_toolkit import Dialect, get_sql_toolkit
 
     models_dir = _resolve_models_dir(repo_path)
 
-    model_defs = load_models_from_directory(models_dir)
+    model_defs = load_models_from_directory(models_dir, cache_dir=default_cache_dir(Path(repo_path)))
     if not model_defs:
         return {"error": "No models found"}
 
@@ -455,11 +455,11 @@ async def ironlayer_models(
     owner: str | None = None,
 ) -> dict[str, Any]:
     """List all models in a repository with metadata."""
-    from core_engine.loader import load_models_from_directory
+    from core_engine.loader import default_cache_dir, load_models_from_directory
 
     models_dir = _resolve_models_dir(repo_path)
 
-    model_defs = load_models_from_directory(models_dir)
+    model_defs = load_models_from_directory(models_dir, cache_dir=default_cache_dir(Path(repo_path)))
 
     if kind:
         model_defs = [m for m in model_defs if m.kind.value == kind.upper()]
@@ -902,6 +902,73 @@ class TestApplyCommand:
         parameters = call_kwargs.kwargs.get("parameters", call_kwargs[1].get("parameters"))
         assert parameters["cluster_id"] == "cluster-xyz"
 
+    @patch("cli.commands.apply.load_model_sql_map")
+    @patch("cli.commands.apply.display_run_results")
+    @patch("core_engine.executor.LocalExecutor")
+    @patch("core_engine.config.load_settings")
+    @patch("core_engine.planner.deserialize_plan")
+    def test_apply_max_parallel_cancels_only_downstream(
+        self,
+        mock_deserialize,
+        mock_load_settings,
+        mock_executor_cls,
+        mock_display,
+        mock_load_sql,
+        tmp_path,
+    ):
+        """With --max-parallel, a failure cancels its dependents but not siblings."""
+        plan = _make_plan(total_steps=4)
+        plan.steps[1].depends_on = ["step_0000"]
+        plan.steps[3].depends_on = ["step_0002"]
+        mock_deserialize.return_value = plan
+        mock_load_settings.return_value = _make_settings()
+        mock_load_sql.return_value = {f"model_{i}": f"SELECT 1 -- model_{i}" for i in range(4)}
+
+        def _execute(step, sql, parameters):
+            status = RunStatus.FAIL if step.model == "model_0" else RunStatus.SUCCESS
+            return _make_run_record(model=step.model, status=status)
+
+        executor_instance = MagicMock()
+        executor_instance.execute_step.side_effect = _execute
+        executor_instance.__enter__ = MagicMock(return_value=executor_instance)
+        executor_instance.__exit__ = MagicMock(return_value=False)
+        mock_executor_cls.return_value = executor_instance
+
+        plan_file = tmp_path / "plan.json"
+        plan_file.write_text("{}")
+
+        result = runner.invoke(
+            app,
+            ["apply", str(plan_file), "--repo", str(tmp_path), "--max-parallel", "3"],
+        )
+
+        assert result.exit_code == 3
+        executed = sorted(c.kwargs["step"].model for c in executor_instance.execute_step.call_args_list)
+        assert executed == ["model_0", "model_2", "model_3"]
+        # One executor (DuckDB connection) per worker, all closed.
+        assert mock_executor_cls.call_count == 3
+        assert executor_instance.__exit__.call_count == 3
+
+        run_records = mock_display.call_args[0][1]
+        assert [r["model"] for r in run_records] == ["model_0", "model_1", "model_2", "model_3"]
+        assert [r["status"] for r in run_records] == ["FAIL", "CANCELLED", "SUCCESS", "SUCCESS"]
+
+    @patch("cli.commands.apply.load_model_sql_map")
+    @patch("core_engine.planner.deserialize_plan")
+    def test_apply_max_parallel_must_be_positive(
+        self,
+        mock_deserialize,
+        mock_load_sql,
+        tmp_path,
+    ):
+        plan_file = tmp_path / "plan.json"
+        plan_file.write_text("{}")
+
+        result = runner.invoke(app, ["apply", str(plan_file), "--repo", str(tmp_path), "--max-parallel", "0"])
+
+        assert result.exit_code != 0
+        mock_deserialize.assert_not_called()
+
     @patch("core_engine.planner.deserialize_plan", side_effect=Exception("Bad plan"))
     def test_apply_corrupt_plan_file_exits_with_error(
         self,
@@ -1212,6 +1279,126 @@ class TestBackfillCommand:
         assert result.exit_code == 0
 
 
+class TestBackfillChunkedCommand:
+    """Tests for `platform backfill-chunked --max-concurrent-chunks N`."""
+
+    @staticmethod
+    def _invoke(tmp_path, *extra: str):
+        return runner.invoke(
+            app,
+            [
+                "--json",
+                "backfill-chunked",
+                "--model",
+                "analytics.orders_daily",
+                "--start",
+                "2025-01-01",
+                "--end",
+                "2025-01-05",
+                "--chunk-days",
+                "1",
+                "--repo",
+                str(tmp_path),
+                *extra,
+            ],
+        )
+
+    @staticmethod
+    def _json(result) -> dict:
+        raw = result.output
+        return json.loads(raw[raw.index("{") : raw.rindex("}") + 1])
+
+    @patch("cli.commands.backfill.load_model_sql_map")
+    @patch("core_engine.executor.LocalExecutor")
+    @patch("core_engine.config.load_settings")
+    def test_chunks_run_concurrently(self, mock_load_settings, mock_executor_cls, mock_load_sql, tmp_path):
+        """Up to N chunks execute at once, each on its own executor."""
+        import threading
+        import time
+
+        mock_load_settings.return_value = _make_settings()
+        mock_load_sql.return_value = {"analytics.orders_daily": "SELECT 1"}
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def _execute(step, sql, parameters):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            return _make_run_record(model=step.model)
+
+        instances = []
+
+        def _new_executor(**kwargs):
+            executor = MagicMock()
+            executor.execute_step.side_effect = _execute
+            executor.__enter__ = MagicMock(return_value=executor)
+            executor.__exit__ = MagicMock(return_value=False)
+            instances.append(executor)
+            return executor
+
+        mock_executor_cls.side_effect = _new_executor
+
+        result = self._invoke(tmp_path, "--max-concurrent-chunks", "3")
+
+        assert result.exit_code == 0, f"Output: {result.output}\n{result.exception}"
+        assert len(instances) == 3
+        assert state["peak"] == 3
+        payload = self._json(result)
+        assert payload["completed_chunks"] == 5
+        assert payload["completed_through"] == "2025-01-05"
+        assert [r["chunk"] for r in payload["runs"]] == [1, 2, 3, 4, 5]
+
+    @patch("cli.commands.backfill.load_model_sql_map")
+    @patch("core_engine.executor.LocalExecutor")
+    @patch("core_engine.config.load_settings")
+    def test_failure_stops_new_chunks_and_keeps_completed_through_contiguous(
+        self, mock_load_settings, mock_executor_cls, mock_load_sql, tmp_path
+    ):
+        """A failed chunk cancels unstarted chunks; completed_through stops before the gap."""
+        import threading
+        import time
+
+        mock_load_settings.return_value = _make_settings()
+        mock_load_sql.return_value = {"analytics.orders_daily": "SELECT 1"}
+        third_started = threading.Event()
+        first_done = threading.Event()
+
+        def _execute(step, sql, parameters):
+            start = parameters["start_date"]
+            if start == "2025-01-01":
+                # Fail only once chunk 2 has succeeded and chunk 3 took its slot.
+                third_started.wait(timeout=5)
+                first_done.set()
+                return _make_run_record(model=step.model, status=RunStatus.FAIL)
+            if start == "2025-01-03":
+                third_started.set()
+                first_done.wait(timeout=5)
+                time.sleep(0.2)
+            return _make_run_record(model=step.model)
+
+        executor = MagicMock()
+        executor.execute_step.side_effect = _execute
+        executor.__enter__ = MagicMock(return_value=executor)
+        executor.__exit__ = MagicMock(return_value=False)
+        mock_executor_cls.return_value = executor
+
+        result = self._invoke(tmp_path, "--max-concurrent-chunks", "2")
+
+        assert result.exit_code == 3
+        payload = self._json(result)
+        assert [r["status"] for r in payload["runs"]] == ["FAIL", "SUCCESS", "SUCCESS", "CANCELLED", "CANCELLED"]
+        assert payload["completed_chunks"] == 2
+        assert payload["completed_through"] is None
+
+    def test_max_concurrent_chunks_must_be_positive(self, tmp_path):
+        result = self._invoke(tmp_path, "--max-concurrent-chunks", "0")
+        assert result.exit_code == 2
+
+
 # ---------------------------------------------------------------------------
 # models command
 # ---------------------------------------------------------------------------
@@ -1329,7 +1516,7 @@ class TestModelsCommand:
         result = runner.invoke(app, ["models", str(tmp_path)])
 
         assert result.exit_code == 0
-        mock_load_models.assert_called_once_with(tmp_path)
+        mock_load_models.assert_called_once_with(tmp_path, cache_dir=tmp_path / ".ironlayer" / "cache")
 
 
 # ---------------------------------------------------------------------------
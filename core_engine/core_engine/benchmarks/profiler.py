@@ -12,9 +12,11 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+import tempfile
 import time
 import tracemalloc
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from pathlib import Path
 from typing import Any
 
 from core_engine.benchmarks.graph_generator import SyntheticGraphGenerator
@@ -22,6 +24,9 @@ from core_engine.models.model_definition import ModelDefinition
 
 logger = logging.getLogger(__name__)
 
+# Project sizes for the serial-vs-parallel loader comparison.
+LOADER_BENCHMARK_SIZES: tuple[int, ...] = (1_000, 5_000, 20_000)
+
 
 @dataclasses.dataclass(frozen=True)
 class BenchmarkResult:
@@ -52,6 +57,18 @@ def _time_call(func: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[Any
     return result, duration_ms, peak_mb
 
 
+def _write_model_files(models: list[ModelDefinition], models_dir: Path) -> None:
+    """Write *models* to *models_dir* as header-annotated ``.sql`` files."""
+    models_dir.mkdir(parents=True, exist_ok=True)
+    for model in models:
+        header = f"-- name: {model.name}\n-- kind: {model.kind.value}\n"
+        if model.time_column:
+            header += f"-- time_column: {model.time_column}\n"
+        if model.unique_key:
+            header += f"-- unique_key: {model.unique_key}\n"
+        (models_dir / f"{model.name}.sql").write_text(f"{header}\n{model.raw_sql}\n", encoding="utf-8")
+
+
 class BenchmarkProfiler:
     """Profile core-engine operations against synthetic graphs.
 
@@ -161,9 +178,10 @@ class BenchmarkProfiler:
         topology:
             Name of the graph topology (for metadata).
         """
-        from core_engine.graph.dag_builder import build_dag
+        from core_engine.graph.csr import build_csr_dag
+        from core_engine.graph.dag_builder import get_downstream_closure
 
-        dag = build_dag(models)
+        dag = build_csr_dag(models)
 
         # Mark a fraction of models as changed.
         num_changed = max(1, int(len(models) * changed_fraction))
@@ -171,15 +189,7 @@ class BenchmarkProfiler:
 
         def _generate_plan() -> list[str]:
             """Simulate plan generation by computing affected downstream."""
-            affected: set[str] = set()
-            for model_name in changed_models:
-                affected.add(model_name)
-                try:
-                    downstream = dag.get_downstream(model_name)
-                    affected.update(downstream)
-                except (KeyError, AttributeError):
-                    pass
-            return sorted(affected)
+            return sorted(set(changed_models) | get_downstream_closure(dag, changed_models))
 
         plan, duration_ms, peak_mb = _time_call(_generate_plan)
 
@@ -252,6 +262,212 @@ class BenchmarkProfiler:
         )
         return result
 
+    # ------------------------------------------------------------------
+    # Graph backends
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def profile_graph_backends(
+        models: list[ModelDefinition],
+        *,
+        changed_fraction: float = 0.01,
+        topology: str = "unknown",
+    ) -> list[BenchmarkResult]:
+        """Compare the NetworkX and CSR graph backends on the planner's hot paths.
+
+        For each backend this times DAG construction, a full topological
+        sort, the downstream closure of the changed set, and parallel-group
+        layering of the affected models, calling the same
+        :mod:`~core_engine.graph.dag_builder` functions on each graph.
+
+        Parameters
+        ----------
+        models:
+            Full model list.
+        changed_fraction:
+            Fraction of models treated as directly changed (0.0-1.0).
+        topology:
+            Name of the graph topology (for metadata).
+
+        Returns
+        -------
+        list[BenchmarkResult]
+            ``networkx`` then ``csr`` results for each operation.  CSR
+            results carry ``speedup`` and ``memory_ratio`` relative to
+            NetworkX in their metadata.
+        """
+        from core_engine.graph.csr import ModelGraph, build_csr_dag
+        from core_engine.graph.dag_builder import (
+            assign_parallel_groups,
+            build_dag,
+            get_downstream_closure,
+            topological_sort,
+        )
+
+        num_changed = max(1, int(len(models) * changed_fraction))
+        changed = sorted(m.name for m in models)[:num_changed]
+
+        def _closure(dag: ModelGraph) -> set[str]:
+            return set(changed) | get_downstream_closure(dag, changed)
+
+        backends: dict[str, Callable[[list[ModelDefinition]], ModelGraph]] = {
+            "networkx": build_dag,
+            "csr": build_csr_dag,
+        }
+
+        results: list[BenchmarkResult] = []
+        # operation -> (duration_ms, peak_mb) of the NetworkX run.
+        baseline: dict[str, tuple[float, float]] = {}
+        for backend, build in backends.items():
+            dag, build_ms, build_mb = _time_call(build, models)
+            _, sort_ms, sort_mb = _time_call(topological_sort, dag)
+            affected, closure_ms, closure_mb = _time_call(_closure, dag)
+            _, layer_ms, layer_mb = _time_call(assign_parallel_groups, dag, sorted(affected))
+
+            for operation, duration_ms, peak_mb in (
+                ("graph.build", build_ms, build_mb),
+                ("graph.topological_sort", sort_ms, sort_mb),
+                ("graph.downstream_closure", closure_ms, closure_mb),
+                ("graph.layering", layer_ms, layer_mb),
+            ):
+                metadata: dict[str, Any] = {
+                    "backend": backend,
+                    "topology": topology,
+                    "changed_count": num_changed,
+                    "affected_count": len(affected),
+                }
+                if operation in baseline:
+                    base_ms, base_mb = baseline[operation]
+                    metadata["speedup"] = round(base_ms / duration_ms, 2) if duration_ms > 0 else 0.0
+                    metadata["memory_ratio"] = round(peak_mb / base_mb, 3) if base_mb > 0 else 0.0
+                else:
+                    baseline[operation] = (duration_ms, peak_mb)
+
+                throughput = (len(models) / (duration_ms / 1000)) if duration_ms > 0 else 0.0
+                results.append(
+                    BenchmarkResult(
+                        operation=operation,
+                        model_count=len(models),
+                        duration_ms=round(duration_ms, 3),
+                        peak_memory_mb=round(peak_mb, 3),
+                        throughput_ops_per_sec=round(throughput, 1),
+                        metadata=metadata,
+                    )
+                )
+
+        for result in results:
+            if result.metadata["backend"] == "csr":
+                logger.info(
+                    "%s: %d models, csr %.1fms (%.2fx vs networkx), %.2fMB peak",
+                    result.operation,
+                    result.model_count,
+                    result.duration_ms,
+                    result.metadata["speedup"],
+                    result.peak_memory_mb,
+                )
+        return results
+
+    # ------------------------------------------------------------------
+    # Model loading
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def profile_model_loading(
+        models_dir: Path,
+        *,
+        max_workers: int | None = 1,
+    ) -> BenchmarkResult:
+        """Profile a cold :func:`load_models_from_directory` call.
+
+        Parameters
+        ----------
+        models_dir:
+            Directory of ``.sql`` model files.
+        max_workers:
+            Worker processes passed through to the loader.
+        """
+        from core_engine.loader.model_loader import load_models_from_directory
+        from core_engine.loader.parallel import effective_workers
+
+        loaded, duration_ms, peak_mb = _time_call(load_models_from_directory, models_dir, max_workers=max_workers)
+
+        throughput = (len(loaded) / (duration_ms / 1000)) if duration_ms > 0 else 0.0
+
+        result = BenchmarkResult(
+            operation="loader.directory",
+            model_count=len(loaded),
+            duration_ms=round(duration_ms, 3),
+            peak_memory_mb=round(peak_mb, 3),
+            throughput_ops_per_sec=round(throughput, 1),
+            metadata={"workers": effective_workers(max_workers, len(loaded))},
+        )
+        logger.debug(
+            "Load: %d models, %d worker(s), %.1fms",
+            result.model_count,
+            result.metadata["workers"],
+            result.duration_ms,
+        )
+        return result
+
+    @staticmethod
+    def profile_parallel_loading(
+        sizes: Sequence[int] = LOADER_BENCHMARK_SIZES,
+        *,
+        max_workers: int | None = None,
+        seed: int = 42,
+    ) -> list[BenchmarkResult]:
+        """Compare serial and process-pool model loading across project sizes.
+
+        For each size a realistic synthetic project is written to a
+        temporary directory and loaded twice, once serially and once with
+        *max_workers* processes.  The parallel result's metadata carries
+        the ``speedup`` over the serial run and whether both loads
+        produced identical models.
+
+        Parameters
+        ----------
+        sizes:
+            Model counts to benchmark (default 1k, 5k and 20k).
+        max_workers:
+            Worker processes for the parallel run; ``None`` uses one per CPU.
+        seed:
+            Random seed for the realistic generator.
+
+        Returns
+        -------
+        list[BenchmarkResult]
+            A serial and a parallel result for each size, in order.
+        """
+        from core_engine.loader.model_loader import load_models_from_directory
+
+        results: list[BenchmarkResult] = []
+        for n in sizes:
+            with tempfile.TemporaryDirectory(prefix="ironlayer-bench-") as tmp:
+                models_dir = Path(tmp) / "models"
+                _write_model_files(SyntheticGraphGenerator.generate_realistic(n, seed=seed), models_dir)
+
+                serial = BenchmarkProfiler.profile_model_loading(models_dir, max_workers=1)
+                parallel = BenchmarkProfiler.profile_model_loading(models_dir, max_workers=max_workers)
+                identical = load_models_from_directory(models_dir) == load_models_from_directory(
+                    models_dir, max_workers=max_workers
+                )
+
+            speedup = serial.duration_ms / parallel.duration_ms if parallel.duration_ms > 0 else 0.0
+            parallel = dataclasses.replace(
+                parallel,
+                metadata={**parallel.metadata, "speedup": round(speedup, 2), "identical": identical},
+            )
+            results.extend([serial, parallel])
+            logger.info(
+                "Loader: %d models, serial %.0fms, %d worker(s) %.0fms (%.2fx)",
+                n,
+                serial.duration_ms,
+                parallel.metadata["workers"],
+                parallel.duration_ms,
+                speedup,
+            )
+        return results
+
     # ------------------------------------------------------------------
     # Full pipeline
     # ------------------------------------------------------------------
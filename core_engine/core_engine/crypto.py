@@ -0,0 +1,123 @@
+"""Dedicated thread pool for CPU-heavy cryptography.
+
+bcrypt password hashing and PBKDF2 key derivation each take hundreds of
+milliseconds by design.  Run inline in an ``async`` handler they stall the
+event loop, so every concurrent request waits behind a login.  Both
+release the GIL while hashing, so they run truly in parallel on a thread
+pool.
+
+The pool is separate from the loop's default executor so that a burst of
+logins or webhook deliveries cannot starve ``asyncio.to_thread`` callers
+(file reads, SDK calls), and vice versa.
+
+Usage::
+
+    hashed = await hash_password("s3cret")
+    ok = await check_password("s3cret", hashed)
+    key = await run_crypto(hashlib.pbkdf2_hmac, "sha256", secret, salt, 480_000)
+
+Call :func:`configure_crypto_executor` at startup to size the pool (it is
+otherwise created on first use) and :func:`shutdown_crypto_executor` on
+shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.RLock()
+
+
+def _default_workers() -> int:
+    return min(4, os.cpu_count() or 1)
+
+
+def configure_crypto_executor(max_workers: int | None = None) -> ThreadPoolExecutor:
+    """(Re)create the crypto thread pool with *max_workers* threads.
+
+    Defaults to ``min(4, cpu_count)``.  Any previous pool is shut down
+    after its queued work finishes.
+    """
+    global _executor
+    with _executor_lock:
+        previous = _executor
+        _executor = ThreadPoolExecutor(
+            max_workers=max_workers or _default_workers(),
+            thread_name_prefix="ironlayer-crypto",
+        )
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return _executor
+
+
+def get_crypto_executor() -> ThreadPoolExecutor:
+    """Return the crypto thread pool, creating it on first use.
+
+    The global is read once, so a concurrent
+    :func:`shutdown_crypto_executor` can never make this return ``None``;
+    the caller gets either the live pool or a freshly created one.
+    """
+    executor = _executor
+    if executor is None:
+        with _executor_lock:
+            executor = _executor or configure_crypto_executor()
+    return executor
+
+
+def shutdown_crypto_executor() -> None:
+    """Shut down the crypto thread pool (it is recreated on next use)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+async def run_crypto(fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run *fn* on the crypto thread pool and await its result.
+
+    Raises
+    ------
+    RuntimeError
+        If the pool was shut down between being fetched and being handed
+        the work.
+    """
+    executor = get_crypto_executor()
+    try:
+        future = executor.submit(functools.partial(fn, *args, **kwargs))
+    except RuntimeError as exc:
+        raise RuntimeError("Crypto executor was shut down while work was being submitted") from exc
+    return await asyncio.wrap_future(future)
+
+
+def hash_password_sync(plaintext: str) -> str:
+    """Hash a plaintext password with bcrypt (blocking)."""
+    import bcrypt
+
+    return bcrypt.hashpw(plaintext.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+
+def check_password_sync(plaintext: str, hashed: str) -> bool:
+    """Verify a plaintext password against a bcrypt hash (blocking)."""
+    import bcrypt
+
+    return bcrypt.checkpw(plaintext.encode("utf-8"), hashed.encode("utf-8"))
+
+
+async def hash_password(plaintext: str) -> str:
+    """Hash a plaintext password with bcrypt on the crypto pool."""
+    return await run_crypto(hash_password_sync, plaintext)
+
+
+async def check_password(plaintext: str, hashed: str) -> bool:
+    """Verify a plaintext password against a bcrypt hash on the crypto pool."""
+    return await run_crypto(check_password_sync, plaintext, hashed)
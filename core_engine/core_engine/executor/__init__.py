@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
-from core_engine.executor.base import ExecutorInterface
+from core_engine.executor.async_databricks_executor import AsyncDatabricksExecutor
+from core_engine.executor.base import AsyncExecutorInterface, ExecutorInterface
+from core_engine.executor.chunk_progress import ChunkProgress
 from core_engine.executor.cluster_templates import ClusterTemplates, get_cluster_spec, get_cost_rate
 from core_engine.executor.databricks_executor import DatabricksExecutor
 from core_engine.executor.local_executor import LocalExecutor
 from core_engine.executor.retry import RetryConfig, retry_with_backoff
+from core_engine.executor.scheduler import StepScheduler, StepState
 from core_engine.executor.sql_rewriter import SQLRewriter
 
 __all__ = [
+    "AsyncDatabricksExecutor",
+    "AsyncExecutorInterface",
+    "ChunkProgress",
     "ClusterTemplates",
     "DatabricksExecutor",
     "ExecutorInterface",
     "LocalExecutor",
     "RetryConfig",
     "SQLRewriter",
+    "StepScheduler",
+    "StepState",
     "get_cluster_spec",
     "get_cost_rate",
     "retry_with_backoff",
@@ -0,0 +1,341 @@
+"""Non-blocking Databricks executor for event-loop callers.
+
+:class:`DatabricksExecutor` submits a run and then ``time.sleep``-polls it
+until completion, which is fine for the CLI but freezes an asyncio event
+loop for the whole warehouse run.  :class:`AsyncDatabricksExecutor` keeps
+the same submission and status-mapping logic but:
+
+* runs every SDK call in a worker thread, bounded by a semaphore so a burst
+  of steps cannot exhaust the default thread pool;
+* tracks all in-flight runs in one table that is serviced by a **single**
+  poller task per executor -- each poll tick checks every outstanding run
+  concurrently and resolves the corresponding awaiters;
+* is designed to be long-lived: one instance (and therefore one
+  ``WorkspaceClient`` with its HTTP connection pool) is reused for every
+  step a tenant executes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, TypeVar
+from uuid import uuid4
+
+from databricks.sdk import WorkspaceClient
+from databricks.sdk.service.compute import ClusterSpec
+
+from core_engine.executor.cluster_templates import get_cluster_spec
+from core_engine.executor.databricks_executor import (
+    _build_submit_task,
+    _extract_run_id,
+    _map_status,
+    _output_text,
+    _TokenRedactionFilter,
+)
+from core_engine.models.plan import PlanStep
+from core_engine.models.run import RunRecord, RunStatus
+from core_engine.parser.sql_guard import SQLGuardConfig, assert_sql_safe
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_FINAL_STATUSES = frozenset({RunStatus.SUCCESS, RunStatus.FAIL, RunStatus.CANCELLED})
+
+
+@dataclass
+class _Waiter:
+    """Book-keeping for one in-flight Databricks run."""
+
+    future: asyncio.Future[RunStatus]
+    deadline: float
+    consecutive_errors: int = 0
+    next_poll_at: float = field(default=0.0)
+
+
+class AsyncDatabricksExecutor:
+    """Execute SQL model steps on Databricks without blocking the event loop.
+
+    Implements :class:`~core_engine.executor.base.AsyncExecutorInterface`.
+
+    Parameters
+    ----------
+    host:
+        Databricks workspace URL.
+    token:
+        Personal access token or service-principal token.  Never logged.
+    warehouse_id:
+        Optional SQL warehouse identifier targeted by submitted ``SqlTask``\\ s.
+    default_cluster_size:
+        T-shirt size used when :meth:`execute_step` is not given one.
+    poll_interval:
+        Seconds between poll ticks of the shared poller task.
+    job_timeout:
+        Maximum seconds to wait for a single run before cancelling it and
+        raising :class:`TimeoutError`.
+    max_concurrent_api_calls:
+        Upper bound on SDK calls in flight at once across all runs.
+    max_consecutive_errors:
+        Poll failures tolerated for a single run before its awaiter fails.
+    client:
+        Pre-built workspace client (mainly for tests).  When omitted one is
+        created from *host* and *token*.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        token: str,
+        warehouse_id: str | None = None,
+        default_cluster_size: str = "small",
+        poll_interval: float = 10.0,
+        job_timeout: int = 3600,
+        max_concurrent_api_calls: int = 16,
+        max_consecutive_errors: int = 10,
+        sql_guard_config: SQLGuardConfig | None = None,
+        client: Any | None = None,
+    ) -> None:
+        self._client = client if client is not None else WorkspaceClient(host=host, token=token)
+        self._warehouse_id = warehouse_id
+        self._default_cluster_size = default_cluster_size
+        self._poll_interval = poll_interval
+        self._job_timeout = job_timeout
+        self._max_consecutive_errors = max_consecutive_errors
+        self._sql_guard_config = sql_guard_config
+        self._api_slots = asyncio.Semaphore(max_concurrent_api_calls)
+        self._waiters: dict[str, _Waiter] = {}
+        self._poller: asyncio.Task[None] | None = None
+        self._closed = False
+
+        self._redaction_filter = _TokenRedactionFilter(token)
+        logger.addFilter(self._redaction_filter)
+
+    # -- AsyncExecutorInterface implementation -------------------------------
+
+    @property
+    def in_flight(self) -> int:
+        """Number of runs currently being tracked by the poller."""
+        return len(self._waiters)
+
+    async def execute_step(
+        self,
+        step: PlanStep,
+        sql: str,
+        parameters: dict[str, str],
+        plan_id: str = "",
+        cluster_size: str | None = None,
+    ) -> RunRecord:
+        """Submit a single SQL step and await its completion.
+
+        The coroutine suspends (without blocking the loop) until the shared
+        poller observes a terminal state for the run.
+        """
+        run_id_str = str(uuid4())
+        started_at = datetime.now(UTC)
+
+        logger.info(
+            "Submitting step %s for model %s (run %s)",
+            step.step_id[:12],
+            step.model,
+            run_id_str[:12],
+        )
+
+        # The SDK serialises the payload with ``as_dict``, so the template
+        # dict is wrapped in a ClusterSpec here.
+        cluster_spec = ClusterSpec.from_dict(get_cluster_spec(cluster_size or self._default_cluster_size))
+        task = _build_submit_task(step, sql, parameters, cluster_spec, self._warehouse_id)
+
+        # SQL safety check AFTER parameter substitution so the guard
+        # inspects the final SQL that will actually be executed.
+        assert_sql_safe(sql, self._sql_guard_config)
+
+        waiter = await self._call(
+            self._client.jobs.submit,
+            run_name=f"ironlayer-{step.model}-{run_id_str[:8]}",
+            tasks=[task],
+        )
+        dbx_run_id = _extract_run_id(waiter)
+
+        final_status = await self.wait_for_completion(dbx_run_id)
+        finished_at = datetime.now(UTC)
+
+        logs_uri = ""
+        error_message: str | None = None
+        if final_status == RunStatus.FAIL:
+            try:
+                logs_uri = await self.get_logs(dbx_run_id)
+                error_message = logs_uri[:2000] if logs_uri else "Run failed with no output."
+            except Exception:
+                error_message = "Run failed and logs could not be retrieved."
+
+        return RunRecord(
+            run_id=run_id_str,
+            plan_id=plan_id or step.step_id,
+            step_id=step.step_id,
+            model_name=step.model,
+            status=final_status,
+            started_at=started_at,
+            finished_at=finished_at,
+            error_message=error_message,
+            logs_uri=logs_uri or None,
+            executor_version="databricks-sdk-async",
+        )
+
+    async def poll_status(self, run_id: str) -> RunStatus:
+        """Return the current status of *run_id* with a single API call."""
+        run = await self._call(self._client.jobs.get_run, run_id=int(run_id))
+        state = run.state
+        if state is None:
+            return RunStatus.PENDING
+        return _map_status(state.life_cycle_state, state.result_state)
+
+    async def cancel(self, run_id: str) -> None:
+        """Cancel a running Databricks job."""
+        logger.info("Cancelling Databricks run %s", run_id)
+        await self._call(self._client.jobs.cancel_run, run_id=int(run_id))
+
+    async def get_logs(self, run_id: str) -> str:
+        """Retrieve logs or error output for a completed run."""
+        try:
+            output = await self._call(self._client.jobs.get_run_output, run_id=int(run_id))
+        except Exception:
+            logger.warning("Could not retrieve output for run %s", run_id)
+            return ""
+        return _output_text(output)
+
+    async def verify_run(self, run_id: str) -> RunStatus:
+        """Verify the final status of a Databricks run for reconciliation."""
+        return await self.poll_status(run_id)
+
+    # -- Shared poller -------------------------------------------------------
+
+    async def wait_for_completion(self, run_id: str, timeout: float | None = None) -> RunStatus:
+        """Register *run_id* with the shared poller and await its final status.
+
+        If the awaiting task is cancelled, the remote run is cancelled too
+        (best effort) so no orphaned warehouse work is left behind.
+        """
+        if self._closed:
+            raise RuntimeError("AsyncDatabricksExecutor is closed")
+
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        waiter = _Waiter(
+            future=loop.create_future(),
+            deadline=now + (timeout or self._job_timeout),
+            next_poll_at=now + self._poll_interval,
+        )
+        self._waiters[run_id] = waiter
+        self._ensure_poller()
+
+        try:
+            return await waiter.future
+        except asyncio.CancelledError:
+            if self._waiters.pop(run_id, None) is not None:
+                with contextlib.suppress(Exception):
+                    await self.cancel(run_id)
+            raise
+
+    async def aclose(self) -> None:
+        """Stop the poller and fail any runs still being awaited."""
+        self._closed = True
+        if self._poller is not None:
+            self._poller.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._poller
+            self._poller = None
+        for run_id, waiter in self._waiters.items():
+            if not waiter.future.done():
+                waiter.future.set_exception(RuntimeError(f"Executor closed while awaiting run {run_id}"))
+        self._waiters.clear()
+        logger.removeFilter(self._redaction_filter)
+
+    def close(self) -> None:
+        """Release the executor without awaiting its poller.
+
+        For executors whose event loop has already stopped, where the
+        poller can no longer be awaited.  On a running loop use
+        :meth:`aclose`, which also fails any pending awaiters.
+        """
+        self._closed = True
+        self._poller = None
+        self._waiters.clear()
+        logger.removeFilter(self._redaction_filter)
+
+    def _ensure_poller(self) -> None:
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.get_running_loop().create_task(self._poll_loop(), name="databricks-run-poller")
+
+    async def _poll_loop(self) -> None:
+        """Service every registered run until none remain."""
+        while self._waiters:
+            now = time.monotonic()
+            due = [run_id for run_id, w in self._waiters.items() if w.next_poll_at <= now]
+            if due:
+                results = await asyncio.gather(
+                    *(self.poll_status(run_id) for run_id in due),
+                    return_exceptions=True,
+                )
+                for run_id, result in zip(due, results, strict=True):
+                    await self._handle_poll_result(run_id, result)
+
+            if not self._waiters:
+                break
+            next_due = min(w.next_poll_at for w in self._waiters.values())
+            await asyncio.sleep(max(0.0, next_due - time.monotonic()))
+
+    async def _handle_poll_result(self, run_id: str, result: RunStatus | BaseException) -> None:
+        waiter = self._waiters.get(run_id)
+        if waiter is None:
+            return
+        if waiter.future.done():
+            self._waiters.pop(run_id, None)
+            return
+
+        now = time.monotonic()
+
+        if isinstance(result, BaseException):
+            waiter.consecutive_errors += 1
+            if waiter.consecutive_errors >= self._max_consecutive_errors:
+                self._waiters.pop(run_id, None)
+                waiter.future.set_exception(result)
+                return
+            backoff = min(self._poll_interval * (2**waiter.consecutive_errors), 120.0)
+            logger.warning(
+                "Poll error for run %s (attempt %d/%d), retrying in %.1fs",
+                run_id,
+                waiter.consecutive_errors,
+                self._max_consecutive_errors,
+                backoff,
+            )
+            waiter.next_poll_at = now + backoff
+        elif result in _FINAL_STATUSES:
+            logger.info("Run %s finished with status %s", run_id, result.value)
+            self._waiters.pop(run_id, None)
+            waiter.future.set_result(result)
+            return
+        else:
+            waiter.consecutive_errors = 0
+            waiter.next_poll_at = now + self._poll_interval
+
+        if now > waiter.deadline:
+            logger.error("Run %s exceeded its timeout", run_id)
+            self._waiters.pop(run_id, None)
+            try:
+                await self.cancel(run_id)
+            except Exception:
+                logger.warning("Failed to cancel timed-out run %s", run_id)
+            waiter.future.set_exception(TimeoutError(f"Databricks run {run_id} did not complete within timeout"))
+
+    # -- Internal helpers ----------------------------------------------------
+
+    async def _call(self, fn: Callable[..., T], /, **kwargs: Any) -> T:
+        """Run a blocking SDK call in a worker thread, bounded by the semaphore."""
+        async with self._api_slots:
+            return await asyncio.to_thread(fn, **kwargs)
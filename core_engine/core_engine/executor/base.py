@@ -99,3 +99,38 @@ class ExecutorInterface(Protocol):
             The status as reported by the execution backend.
         """
         ...
+
+
+class AsyncExecutorInterface(Protocol):
+    """Asynchronous counterpart of :class:`ExecutorInterface`.
+
+    Used by callers that run inside an event loop (the API control plane).
+    Method semantics match the synchronous protocol; implementations must
+    never block the loop while a remote run is in progress.
+    """
+
+    async def execute_step(
+        self,
+        step: PlanStep,
+        sql: str,
+        parameters: dict[str, str],
+        plan_id: str = "",
+    ) -> RunRecord:
+        """Execute a single plan step and return the completed run record."""
+        ...
+
+    async def poll_status(self, run_id: str) -> RunStatus:
+        """Check the current lifecycle status of a running job."""
+        ...
+
+    async def cancel(self, run_id: str) -> None:
+        """Request cancellation of a running job."""
+        ...
+
+    async def get_logs(self, run_id: str) -> str:
+        """Retrieve execution logs for a completed or failed run."""
+        ...
+
+    async def verify_run(self, run_id: str) -> RunStatus:
+        """Verify the final status of a run against the execution backend."""
+        ...
@@ -0,0 +1,125 @@
+"""Completed-chunk bookkeeping for chunked backfills.
+
+A chunked backfill splits ``[overall_start, overall_end]`` into ordered,
+non-overlapping date-range chunks.  When chunks run concurrently they can
+finish out of order, so a single ``completed_through`` high-water mark is
+no longer enough to describe progress: chunk 5 may be done while chunk 3
+is still running or has failed.
+
+:class:`ChunkProgress` records completion as a bitmap over chunk indices
+(bit *i* set means chunk *i* succeeded) and separately tracks the
+**contiguous prefix** of completed chunks.  Only the prefix is safe to
+expose as ``completed_through`` or to advance watermarks with, because it
+guarantees every earlier date has been processed.  The bitmap is
+serialised as a lowercase hex string so it fits in a text column.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from datetime import date
+
+
+class ChunkProgress:
+    """Bitmap of completed chunks plus the contiguous completed prefix.
+
+    Parameters
+    ----------
+    total_chunks:
+        Number of chunks in the backfill.
+    completed:
+        Indices of chunks that already succeeded.
+
+    Raises
+    ------
+    ValueError
+        If *total_chunks* is negative or an index is out of range.
+    """
+
+    def __init__(self, total_chunks: int, completed: Iterable[int] = ()) -> None:
+        if total_chunks < 0:
+            raise ValueError("total_chunks must be >= 0")
+        self._total = total_chunks
+        self._bits = 0
+        self._prefix = 0
+        for index in completed:
+            self.mark_done(index)
+
+    # -- Construction --------------------------------------------------------
+
+    @classmethod
+    def from_bitmap(cls, total_chunks: int, bitmap: str) -> ChunkProgress:
+        """Rebuild progress from a hex bitmap produced by :meth:`to_bitmap`."""
+        bits = int(bitmap, 16) if bitmap else 0
+        if bits >> total_chunks:
+            raise ValueError(f"Bitmap {bitmap!r} has bits beyond total_chunks={total_chunks}")
+        return cls(total_chunks, (i for i in range(total_chunks) if bits >> i & 1))
+
+    @classmethod
+    def from_completed_through(
+        cls,
+        chunks: Sequence[tuple[date, date]],
+        completed_through: date | None,
+    ) -> ChunkProgress:
+        """Derive progress from a legacy ``completed_through`` high-water mark.
+
+        Every chunk ending on or before *completed_through* is treated as
+        done, which is exactly what sequential execution guaranteed.
+        """
+        if completed_through is None:
+            return cls(len(chunks))
+        return cls(len(chunks), (i for i, (_, end) in enumerate(chunks) if end <= completed_through))
+
+    def to_bitmap(self) -> str:
+        """Serialise the completed set as a lowercase hex string."""
+        return format(self._bits, "x")
+
+    # -- Queries -------------------------------------------------------------
+
+    @property
+    def total_chunks(self) -> int:
+        """Number of chunks in the backfill."""
+        return self._total
+
+    @property
+    def completed_count(self) -> int:
+        """Number of chunks that have succeeded, in any order."""
+        return self._bits.bit_count()
+
+    @property
+    def contiguous_prefix(self) -> int:
+        """Number of leading chunks that have all succeeded."""
+        return self._prefix
+
+    def is_done(self, index: int) -> bool:
+        """Return ``True`` if chunk *index* has succeeded."""
+        return bool(self._bits >> index & 1)
+
+    def is_complete(self) -> bool:
+        """Return ``True`` once every chunk has succeeded."""
+        return self._prefix == self._total
+
+    def pending(self) -> list[int]:
+        """Return the indices of chunks that have not succeeded, ascending."""
+        return [i for i in range(self._prefix, self._total) if not self._bits >> i & 1]
+
+    # -- Transitions ---------------------------------------------------------
+
+    def mark_done(self, index: int) -> list[int]:
+        """Record chunk *index* as succeeded.
+
+        Returns
+        -------
+        list[int]
+            Chunk indices that just joined the contiguous prefix, in
+            ascending order.  Empty when *index* completed ahead of an
+            earlier, still-pending chunk.  Marking a chunk twice is a no-op.
+        """
+        if not 0 <= index < self._total:
+            raise ValueError(f"Chunk index {index} out of range for {self._total} chunks")
+        self._bits |= 1 << index
+        advanced: list[int] = []
+        while self._prefix < self._total and self._bits >> self._prefix & 1:
+            advanced.append(self._prefix)
+            self._prefix += 1
+        return advanced
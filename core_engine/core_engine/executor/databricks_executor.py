@@ -10,6 +10,7 @@ from __future__ import annotations
 import logging
 import time
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from databricks.sdk import WorkspaceClient
@@ -28,6 +29,9 @@ from core_engine.models.plan import Plan, PlanStep
 from core_engine.models.run import RunRecord, RunStatus
 from core_engine.parser.sql_guard import SQLGuardConfig, assert_sql_safe
 
+if TYPE_CHECKING:
+    from databricks.sdk.service.compute import ClusterSpec
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -71,6 +75,56 @@ def _map_status(
     return RunStatus.PENDING
 
 
+def _extract_run_id(waiter: object) -> str:
+    """Return the Databricks run ID from a ``jobs.submit`` response."""
+    if hasattr(waiter, "bind"):
+        return str(waiter.bind()["run_id"])
+    return str(waiter.run_id)  # type: ignore[attr-defined]
+
+
+def _output_text(output: object) -> str:
+    """Extract the most useful text from a ``jobs.get_run_output`` response."""
+    notebook_output = getattr(output, "notebook_output", None)
+    if notebook_output and notebook_output.result:
+        return notebook_output.result
+    if getattr(output, "error", None):
+        return output.error  # type: ignore[attr-defined]
+    if getattr(output, "error_trace", None):
+        return output.error_trace  # type: ignore[attr-defined]
+    return ""
+
+
+def _build_submit_task(
+    step: PlanStep,
+    sql: str,
+    params: dict[str, str],
+    cluster_spec: dict | ClusterSpec,
+    warehouse_id: str | None,
+) -> SubmitTask:
+    """Construct a :class:`SubmitTask` for a single plan step.
+
+    Parameters are substituted directly into the query text, replacing
+    ``{{ key }}`` / ``{{key}}`` markers.
+    """
+    rendered_sql = sql
+    for key, value in params.items():
+        rendered_sql = rendered_sql.replace("{{ " + key + " }}", value)
+        rendered_sql = rendered_sql.replace("{{" + key + "}}", value)
+
+    task_key = f"step_{step.model.replace('.', '_')}_{step.step_id[:8]}"
+
+    sql_task = SqlTask(
+        query=SqlTaskQuery(query=rendered_sql),  # type: ignore[call-arg]
+        warehouse_id=warehouse_id or "",
+    )
+
+    return SubmitTask(
+        task_key=task_key,
+        sql_task=sql_task,
+        new_cluster=cluster_spec,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Token-safe logging filter
 # ---------------------------------------------------------------------------
@@ -192,7 +246,7 @@ class DatabricksExecutor:
             run_name=f"ironlayer-{step.model}-{run_id_str[:8]}",
             tasks=[task],
         )
-        dbx_run_id = str(waiter.bind()["run_id"]) if hasattr(waiter, "bind") else str(waiter.run_id)
+        dbx_run_id = _extract_run_id(waiter)
 
         final_status = self._poll_until_complete(dbx_run_id)
         finished_at = datetime.now(UTC)
@@ -322,16 +376,7 @@ class DatabricksExecutor:
             logger.warning("Could not retrieve output for run %s", run_id)
             return ""
 
-        if output.notebook_output and output.notebook_output.result:
-            return output.notebook_output.result
-
-        if output.error:
-            return output.error
-
-        if output.error_trace:
-            return output.error_trace
-
-        return ""
+        return _output_text(output)
 
     def verify_run(self, run_id: str) -> RunStatus:
         """Verify the final status of a Databricks run for reconciliation.
@@ -418,21 +463,4 @@ class DatabricksExecutor:
         wrapping them in ``{{ key }}`` markers within the query text.  The
         Databricks runtime performs the actual substitution at execution time.
         """
-        # Substitute parameters directly into the SQL for SqlTask.
-        rendered_sql = sql
-        for key, value in params.items():
-            rendered_sql = rendered_sql.replace("{{ " + key + " }}", value)
-            rendered_sql = rendered_sql.replace("{{" + key + "}}", value)
-
-        task_key = f"step_{step.model.replace('.', '_')}_{step.step_id[:8]}"
-
-        sql_task = SqlTask(
-            query=SqlTaskQuery(query=rendered_sql),  # type: ignore[call-arg]
-            warehouse_id=self._warehouse_id or "",
-        )
-
-        return SubmitTask(
-            task_key=task_key,
-            sql_task=sql_task,
-            new_cluster=cluster_spec,
-        )
+        return _build_submit_task(step, sql, params, cluster_spec, self._warehouse_id)
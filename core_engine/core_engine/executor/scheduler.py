@@ -0,0 +1,217 @@
+"""Dependency-driven ready-queue scheduling for plan steps.
+
+The planner records, for every :class:`PlanStep`, the step IDs it
+``depends_on``.  :class:`StepScheduler` turns that graph into a ready queue:
+a step becomes runnable the moment its last upstream step succeeds, rather
+than waiting for an entire ``parallel_group`` barrier to drain.
+
+The scheduler is a pure bookkeeping state machine -- it performs no I/O and
+spawns no workers.  Callers (the CLI thread pool, the API's asyncio task
+group) pull runnable steps with :meth:`StepScheduler.next_ready`, run them
+however they like, and report the outcome through
+:meth:`StepScheduler.mark_succeeded` / :meth:`StepScheduler.mark_failed`.
+Instances are **not** thread-safe; drive them from a single coordinator.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable, Sequence
+from enum import Enum
+
+from core_engine.models.plan import PlanStep
+
+
+class StepState(str, Enum):
+    """Scheduling state of a single plan step."""
+
+    PENDING = "PENDING"
+    READY = "READY"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
+_TERMINAL_STATES = frozenset({StepState.SUCCEEDED, StepState.FAILED, StepState.CANCELLED})
+
+
+class StepScheduler:
+    """Ready-queue scheduler over the ``depends_on`` graph of a plan.
+
+    Parameters
+    ----------
+    steps:
+        Plan steps in plan order.  When several steps are runnable at once
+        they are handed out in this order, so ``max_parallel=1`` reproduces
+        the planner's sequential order exactly.
+    completed:
+        Step IDs that already finished successfully in an earlier attempt.
+        They are treated as satisfied dependencies and never handed out.
+    fail_fast:
+        When ``True`` a failure cancels every step that has not started yet.
+        When ``False`` (the default) only the failed step's downstream
+        closure is cancelled and independent branches keep running.
+
+    Raises
+    ------
+    ValueError
+        If step IDs are duplicated or the dependency graph contains a cycle.
+    """
+
+    def __init__(
+        self,
+        steps: Sequence[PlanStep],
+        *,
+        completed: Iterable[str] = (),
+        fail_fast: bool = False,
+    ) -> None:
+        self._steps: dict[str, PlanStep] = {}
+        for step in steps:
+            if step.step_id in self._steps:
+                raise ValueError(f"Duplicate step_id in plan: {step.step_id}")
+            self._steps[step.step_id] = step
+
+        self._fail_fast = fail_fast
+        self._order: dict[str, int] = {sid: idx for idx, sid in enumerate(self._steps)}
+        self._children: dict[str, list[str]] = {sid: [] for sid in self._steps}
+        self._waiting_on: dict[str, int] = {}
+        self._state: dict[str, StepState] = {}
+        self._ready: list[tuple[int, str]] = []
+        self._running = 0
+
+        done = {sid for sid in completed if sid in self._steps}
+
+        for sid, step in self._steps.items():
+            # Dependencies outside the plan (or already completed) are
+            # considered satisfied -- they are not ours to run.
+            upstream = {dep for dep in step.depends_on if dep in self._steps and dep != sid}
+            for dep in upstream:
+                self._children[dep].append(sid)
+            self._waiting_on[sid] = len(upstream - done)
+
+        self._check_acyclic()
+
+        for sid in self._steps:
+            if sid in done:
+                self._state[sid] = StepState.SUCCEEDED
+            elif self._waiting_on[sid] == 0:
+                self._push_ready(sid)
+            else:
+                self._state[sid] = StepState.PENDING
+
+    # -- Queries -------------------------------------------------------------
+
+    @property
+    def running_count(self) -> int:
+        """Number of steps handed out but not yet reported."""
+        return self._running
+
+    def has_ready(self) -> bool:
+        """Return ``True`` if at least one step can be started now."""
+        return bool(self._ready)
+
+    def is_finished(self) -> bool:
+        """Return ``True`` once every step has reached a terminal state."""
+        return not self._ready and self._running == 0 and all(s in _TERMINAL_STATES for s in self._state.values())
+
+    def state_of(self, step_id: str) -> StepState:
+        """Return the current scheduling state of *step_id*."""
+        return self._state[step_id]
+
+    def steps_in_state(self, state: StepState) -> list[PlanStep]:
+        """Return all steps currently in *state*, in plan order."""
+        return [self._steps[sid] for sid, st in self._state.items() if st == state]
+
+    # -- Transitions ---------------------------------------------------------
+
+    def next_ready(self) -> PlanStep | None:
+        """Pop the earliest runnable step and mark it RUNNING.
+
+        Returns ``None`` when nothing is runnable right now (either all
+        remaining work is blocked on running steps, or the plan is done).
+        """
+        while self._ready:
+            _, sid = heapq.heappop(self._ready)
+            if self._state[sid] != StepState.READY:
+                continue
+            self._state[sid] = StepState.RUNNING
+            self._running += 1
+            return self._steps[sid]
+        return None
+
+    def mark_succeeded(self, step_id: str) -> list[PlanStep]:
+        """Record a successful step and return the steps it unblocked."""
+        self._finish(step_id, StepState.SUCCEEDED)
+        unblocked: list[PlanStep] = []
+        for child in self._children[step_id]:
+            if self._state[child] != StepState.PENDING:
+                continue
+            self._waiting_on[child] -= 1
+            if self._waiting_on[child] == 0:
+                self._push_ready(child)
+                unblocked.append(self._steps[child])
+        return unblocked
+
+    def mark_failed(self, step_id: str) -> list[PlanStep]:
+        """Record a failed step and return the steps cancelled as a result.
+
+        Without ``fail_fast`` only the transitive downstream closure of
+        *step_id* is cancelled; steps already running are left alone.
+        """
+        self._finish(step_id, StepState.FAILED)
+        if self._fail_fast:
+            return self.cancel_pending()
+
+        cancelled: list[str] = []
+        stack = list(self._children[step_id])
+        while stack:
+            sid = stack.pop()
+            if self._state[sid] not in (StepState.PENDING, StepState.READY):
+                continue
+            self._state[sid] = StepState.CANCELLED
+            cancelled.append(sid)
+            stack.extend(self._children[sid])
+        cancelled.sort(key=self._order.__getitem__)
+        return [self._steps[sid] for sid in cancelled]
+
+    def cancel_pending(self) -> list[PlanStep]:
+        """Cancel every step that has not started and return them."""
+        cancelled: list[PlanStep] = []
+        for sid, state in self._state.items():
+            if state in (StepState.PENDING, StepState.READY):
+                self._state[sid] = StepState.CANCELLED
+                cancelled.append(self._steps[sid])
+        self._ready.clear()
+        return cancelled
+
+    # -- Internals -----------------------------------------------------------
+
+    def _push_ready(self, step_id: str) -> None:
+        self._state[step_id] = StepState.READY
+        heapq.heappush(self._ready, (self._order[step_id], step_id))
+
+    def _finish(self, step_id: str, state: StepState) -> None:
+        if self._state.get(step_id) != StepState.RUNNING:
+            raise ValueError(f"Step {step_id} is not running (state={self._state.get(step_id)})")
+        self._state[step_id] = state
+        self._running -= 1
+
+    def _check_acyclic(self) -> None:
+        """Raise ``ValueError`` if the in-plan dependency graph has a cycle."""
+        indegree = {sid: 0 for sid in self._steps}
+        for children in self._children.values():
+            for child in children:
+                indegree[child] += 1
+        queue = [sid for sid, deg in indegree.items() if deg == 0]
+        visited = 0
+        while queue:
+            sid = queue.pop()
+            visited += 1
+            for child in self._children[sid]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
+        if visited != len(self._steps):
+            stuck = sorted(sid for sid, deg in indegree.items() if deg > 0)
+            raise ValueError(f"Plan step dependencies contain a cycle involving: {', '.join(stuck[:5])}")
@@ -11,11 +11,14 @@ from core_engine.git.git_client import (
     get_file_at_commit,
     validate_repo,
 )
+from core_engine.git.object_reader import GitObjectReader, TreeEntry
 
 __all__ = [
-    "ChangedFile",
     "ChangeStatus",
+    "ChangedFile",
     "GitClientError",
+    "GitObjectReader",
+    "TreeEntry",
     "get_changed_files",
     "get_current_sha",
     "get_file_at_commit",
@@ -0,0 +1,346 @@
+"""Batched git object access through a persistent ``git cat-file --batch``.
+
+:func:`~core_engine.git.git_client.get_file_at_commit` spawns one
+``git show`` per file.  That is fine for a handful of models but a
+refactor touching hundreds of models pays the process start-up cost
+hundreds of times.  :class:`GitObjectReader` keeps a single
+``git cat-file --batch`` process per repository and pipes every request
+through it:
+
+* :meth:`GitObjectReader.read_blobs` fetches many ``<sha>:<path>`` blobs
+  in one round trip;
+* :meth:`GitObjectReader.list_tree` streams ``git ls-tree -r`` for a
+  commit; and
+* :meth:`GitObjectReader.iter_tree_blobs` combines the two so that
+  hashing every model at a base commit is one streamed pass over the
+  base tree.
+
+Requests are written in bounded chunks and each chunk's responses are
+drained before the next is written, so neither side of the pipe can fill
+up and deadlock.  A watchdog kills the process if a chunk exceeds the
+timeout; the next call transparently starts a fresh one.
+"""
+
+from __future__ import annotations
+
+import logging
+import subprocess
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import IO
+
+from core_engine.git.git_client import (
+    _SUBPROCESS_TIMEOUT,
+    GitClientError,
+    _validate_git_ref,
+)
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on request bytes written before draining responses.  Kept
+# well under the smallest common pipe buffer (64 KiB on Linux, 16 KiB on
+# some BSDs) so writing a chunk never blocks.
+_MAX_REQUEST_CHUNK_BYTES = 8 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class TreeEntry:
+    """A single blob entry from ``git ls-tree -r``."""
+
+    mode: str
+    object_id: str
+    path: str
+
+
+class GitObjectReader:
+    """Read blobs and trees from one repository through a long-lived process.
+
+    The ``git cat-file --batch`` process is started lazily on first use and
+    reused until :meth:`close` (or the end of a ``with`` block).  Instances
+    are safe to share between threads; requests are serialised.
+
+    Parameters
+    ----------
+    repo_path:
+        Root of the git repository.
+    timeout:
+        Seconds allowed for a single batch of requests (or a tree listing)
+        before the git process is killed and :class:`GitClientError` raised.
+    """
+
+    def __init__(self, repo_path: Path, *, timeout: float = _SUBPROCESS_TIMEOUT) -> None:
+        self._repo_path = repo_path
+        self._timeout = timeout
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+
+    # -- Lifecycle -----------------------------------------------------------
+
+    def __enter__(self) -> GitObjectReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Terminate the ``cat-file`` process, if running."""
+        with self._lock:
+            self._terminate()
+
+    def _terminate(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        finally:
+            if proc.stdout is not None:
+                proc.stdout.close()
+
+    def _ensure_process(self) -> subprocess.Popen[bytes]:
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        self._terminate()
+        try:
+            # Fixed argv; git is resolved from PATH like every other git_client call.
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch"],  # noqa: S607
+                cwd=self._repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except FileNotFoundError as exc:
+            raise GitClientError("git executable not found. Ensure git is installed and on PATH.") from exc
+        except OSError as exc:
+            raise GitClientError(f"Could not start git cat-file in {self._repo_path}: {exc}") from exc
+        logger.debug("Started git cat-file --batch (pid %d) in %s", self._proc.pid, self._repo_path)
+        return self._proc
+
+    # -- Blobs ---------------------------------------------------------------
+
+    def read_blob(self, sha: str, file_path: str) -> str | None:
+        """Return *file_path* as it existed at *sha*, or ``None`` if absent."""
+        return self.read_blobs(sha, [file_path])[file_path]
+
+    def read_blobs(self, sha: str, file_paths: Iterable[str]) -> dict[str, str | None]:
+        """Return the contents of many files at *sha* in one batch.
+
+        Parameters
+        ----------
+        sha:
+            Commit (or other tree-ish) to read from.
+        file_paths:
+            Repository-relative paths.
+
+        Returns
+        -------
+        dict[str, str | None]
+            Contents keyed by path, in request order.  Paths that do not
+            exist at *sha* map to ``None``.
+
+        Raises
+        ------
+        GitClientError
+            If git fails or the batch times out.
+        ValueError
+            If *sha* is not a valid ref or a path contains a newline.
+        """
+        _validate_git_ref(sha)
+        paths = list(dict.fromkeys(file_paths))
+        for path in paths:
+            if "\n" in path:
+                raise ValueError(f"Invalid file path: {path!r}")
+        contents = self._read_objects([f"{sha}:{path}" for path in paths])
+        return dict(zip(paths, contents, strict=True))
+
+    def _read_objects(self, object_names: list[str]) -> list[str | None]:
+        """Resolve *object_names* through ``cat-file --batch``, in order."""
+        results: list[str | None] = []
+        with self._lock:
+            for chunk in _chunk_requests(object_names):
+                results.extend(self._read_chunk(chunk))
+        return results
+
+    def _read_chunk(self, object_names: list[str]) -> list[str | None]:
+        proc = self._ensure_process()
+        assert proc.stdin is not None and proc.stdout is not None
+        watchdog = _Watchdog(self._timeout, proc)
+        try:
+            proc.stdin.write("".join(f"{name}\n" for name in object_names).encode("utf-8"))
+            proc.stdin.flush()
+            return [_read_response(proc.stdout) for _ in object_names]
+        except (OSError, ValueError, GitClientError) as exc:
+            self._terminate()
+            if watchdog.fired:
+                raise GitClientError(f"git cat-file timed out after {self._timeout}s in {self._repo_path}") from exc
+            if isinstance(exc, GitClientError):
+                raise
+            raise GitClientError(f"git cat-file failed in {self._repo_path}: {exc}") from exc
+        finally:
+            watchdog.cancel()
+
+    # -- Trees ---------------------------------------------------------------
+
+    def list_tree(self, sha: str, *, suffix: str | None = None) -> Iterator[TreeEntry]:
+        """Stream every blob in the tree of *sha* via ``git ls-tree -r``.
+
+        Parameters
+        ----------
+        sha:
+            Commit (or other tree-ish) to list.
+        suffix:
+            If given, only yield paths ending with this suffix
+            (e.g. ``".sql"``).
+
+        Raises
+        ------
+        GitClientError
+            If *sha* does not exist, git fails, or the listing times out.
+        """
+        _validate_git_ref(sha)
+        cmd = ["git", "ls-tree", "-r", "-z", "--full-tree", sha]
+        try:
+            proc = subprocess.Popen(  # noqa: S603 - argv is fixed apart from the validated ref
+                cmd,
+                cwd=self._repo_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except FileNotFoundError as exc:
+            raise GitClientError("git executable not found. Ensure git is installed and on PATH.") from exc
+
+        watchdog = _Watchdog(self._timeout, proc)
+        try:
+            assert proc.stdout is not None
+            buffer = b""
+            while chunk := proc.stdout.read(64 * 1024):
+                *records, buffer = (buffer + chunk).split(b"\0")
+                for record in records:
+                    entry = _parse_tree_record(record)
+                    if entry is not None and (suffix is None or entry.path.endswith(suffix)):
+                        yield entry
+            stderr = proc.stderr.read() if proc.stderr is not None else b""
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            for stream in (proc.stdout, proc.stderr):
+                if stream is not None:
+                    stream.close()
+
+        if watchdog.fired:
+            raise GitClientError(f"git command timed out after {self._timeout}s: {' '.join(cmd)}")
+        if returncode != 0:
+            message = stderr.decode("utf-8", errors="replace").strip()
+            raise GitClientError(f"git command failed: {' '.join(cmd)}\nExit code {returncode}: {message}")
+
+    def iter_tree_blobs(
+        self, sha: str, *, suffix: str | None = None, batch_size: int = 500
+    ) -> Iterator[tuple[str, str]]:
+        """Stream ``(path, contents)`` for every blob in the tree of *sha*.
+
+        Blobs are fetched by object ID in batches of *batch_size* while the
+        tree listing is still streaming, so memory stays bounded by one
+        batch regardless of repository size.
+        """
+        pending: list[TreeEntry] = []
+        for entry in self.list_tree(sha, suffix=suffix):
+            pending.append(entry)
+            if len(pending) >= batch_size:
+                yield from self._read_entries(pending)
+                pending = []
+        if pending:
+            yield from self._read_entries(pending)
+
+    def _read_entries(self, entries: list[TreeEntry]) -> Iterator[tuple[str, str]]:
+        contents = self._read_objects([entry.object_id for entry in entries])
+        for entry, content in zip(entries, contents, strict=True):
+            if content is not None:
+                yield entry.path, content
+
+
+# ---------------------------------------------------------------------------
+# Protocol helpers
+# ---------------------------------------------------------------------------
+
+
+class _Watchdog:
+    """Kill *proc* if not cancelled within *timeout* seconds."""
+
+    def __init__(self, timeout: float, proc: subprocess.Popen[bytes]) -> None:
+        self._proc = proc
+        self._fired = threading.Event()
+        self._timer = threading.Timer(timeout, self._fire)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _fire(self) -> None:
+        self._fired.set()
+        self._proc.kill()
+
+    @property
+    def fired(self) -> bool:
+        return self._fired.is_set()
+
+    def cancel(self) -> None:
+        self._timer.cancel()
+
+
+def _chunk_requests(object_names: list[str]) -> Iterator[list[str]]:
+    """Split requests so each chunk stays under the pipe-safe byte budget."""
+    chunk: list[str] = []
+    size = 0
+    for name in object_names:
+        line_bytes = len(name.encode("utf-8")) + 1
+        if chunk and size + line_bytes > _MAX_REQUEST_CHUNK_BYTES:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(name)
+        size += line_bytes
+    if chunk:
+        yield chunk
+
+
+def _read_response(stdout: IO[bytes]) -> str | None:
+    """Read one ``cat-file --batch`` response; ``None`` for missing objects."""
+    header = stdout.readline()
+    if not header:
+        raise GitClientError("git cat-file exited unexpectedly.")
+    fields = header.rstrip(b"\n").split(b" ")
+    # "<name> missing" / "<name> ambiguous"; <name> may itself contain spaces.
+    if fields[-1] in (b"missing", b"ambiguous"):
+        return None
+    if len(fields) != 3:
+        raise GitClientError(f"Unexpected git cat-file header: {header!r}")
+    _oid, obj_type, raw_size = fields
+    body = stdout.read(int(raw_size) + 1)
+    if obj_type != b"blob":
+        return None
+    return body[:-1].decode("utf-8", errors="replace")
+
+
+def _parse_tree_record(record: bytes) -> TreeEntry | None:
+    """Parse ``<mode> <type> <oid>\\t<path>``; ``None`` for non-blob entries."""
+    if not record:
+        return None
+    meta, _, path = record.partition(b"\t")
+    mode, obj_type, object_id = meta.split(b" ")
+    if obj_type != b"blob":
+        return None
+    return TreeEntry(mode=mode.decode(), object_id=object_id.decode(), path=path.decode("utf-8", errors="replace"))
@@ -5,16 +5,20 @@ from core_engine.graph.column_lineage import (
     compute_model_column_lineage,
     trace_column_across_dag,
 )
+from core_engine.graph.csr import CSRDiGraph, CSRGraph, ModelGraph, build_csr_dag
 from core_engine.graph.dag_builder import (
     CyclicDependencyError,
     assign_parallel_groups,
     build_dag,
     detect_cycles,
     get_downstream,
+    get_downstream_closure,
+    get_first_upstream_sources,
     get_upstream,
     topological_sort,
     validate_dag,
 )
+from core_engine.graph.incremental import IncrementalDAG, load_incremental_dag
 
 __all__ = [
     # DAG construction
@@ -23,9 +27,19 @@ __all__ = [
     "build_dag",
     "detect_cycles",
     "get_downstream",
+    "get_downstream_closure",
+    "get_first_upstream_sources",
     "get_upstream",
     "topological_sort",
     "validate_dag",
+    # Array-backed graph core
+    "CSRDiGraph",
+    "CSRGraph",
+    "ModelGraph",
+    "build_csr_dag",
+    # Incremental maintenance
+    "IncrementalDAG",
+    "load_incremental_dag",
     # Column-level lineage
     "compute_all_column_lineage",
     "compute_model_column_lineage",
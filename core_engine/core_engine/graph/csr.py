@@ -0,0 +1,451 @@
+"""Compact array-backed (CSR) model graph.
+
+NetworkX stores a ``DiGraph`` as nested dicts keyed by node name: every
+edge costs two dict entries plus their attribute dicts, and every traversal
+step is a string hash.  At tens of thousands of models that dominates the
+memory and time of planning.
+
+:class:`CSRGraph` interns model names to dense integer IDs -- assigned in
+sorted-name order, so integer order *is* lexicographic order -- and stores
+both successor and predecessor adjacency in compressed-sparse-row form:
+one ``offsets`` and one ``targets`` :class:`array.array` per direction.
+Traversals work on those arrays with ``bytearray`` visit marks:
+
+* :meth:`CSRGraph.descendant_ids` / :meth:`CSRGraph.ancestor_ids` take a
+  whole *set* of sources and walk the graph once, instead of one
+  traversal per source;
+* :meth:`CSRGraph.topological_ids` is Kahn's algorithm over an integer
+  min-heap, yielding the same lexicographic order as
+  :func:`~core_engine.graph.dag_builder.topological_sort`;
+* :meth:`CSRGraph.layer_ids` is Kahn-style longest-path layering,
+  optionally restricted to a subset of nodes.
+
+:class:`CSRDiGraph` wraps a ``CSRGraph`` plus per-node data in a read-only,
+NetworkX-compatible facade (``nodes``, ``edges``, ``successors``,
+``predecessors``, ``has_node``, ``subgraph`` ...) so code written against
+``nx.DiGraph`` keeps working.  The functions in
+:mod:`~core_engine.graph.dag_builder` and the planner detect it and switch
+to the array-based paths.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any, TypeAlias
+
+import networkx as nx
+
+from core_engine.models.model_definition import ModelDefinition
+from core_engine.telemetry.profiling import profile_operation
+
+# Signed 32-bit indices: half the size of Python's default and ample for
+# any realistic model count.
+_INDEX_TYPECODE = "i"
+
+
+def _rows_to_csr(rows: list[list[int]]) -> tuple[array[int], array[int]]:
+    """Pack adjacency rows into ``(offsets, targets)``, sorted and de-duplicated."""
+    offsets = array(_INDEX_TYPECODE, [0])
+    targets = array(_INDEX_TYPECODE)
+    total = 0
+    for row in rows:
+        if row:
+            row = sorted(set(row))
+            targets.extend(row)
+            total += len(row)
+        offsets.append(total)
+    return offsets, targets
+
+
+class CSRGraph:
+    """Immutable directed graph over interned integer node IDs.
+
+    Parameters
+    ----------
+    names:
+        Node names; must be sorted and unique.  A node's ID is its index.
+    successors:
+        ``successors[i]`` lists the IDs node ``i`` has edges to.  Order and
+        duplicates do not matter; self-loops are not allowed.
+    """
+
+    __slots__ = ("_index", "_names", "_pred_offsets", "_pred_targets", "_succ_offsets", "_succ_targets")
+
+    def __init__(self, names: list[str], successors: list[list[int]]) -> None:
+        self._names: tuple[str, ...] = tuple(names)
+        self._index: dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        predecessors: list[list[int]] = [[] for _ in names]
+        for src, row in enumerate(successors):
+            for dst in row:
+                predecessors[dst].append(src)
+        self._succ_offsets, self._succ_targets = _rows_to_csr(successors)
+        self._pred_offsets, self._pred_targets = _rows_to_csr(predecessors)
+
+    # -- Construction --------------------------------------------------------
+
+    @classmethod
+    def from_edges(cls, names: Iterable[str], edges: Iterable[tuple[str, str]]) -> CSRGraph:
+        """Build from node names and ``(upstream, downstream)`` name pairs.
+
+        Edges naming unknown nodes or pointing a node at itself are ignored.
+        """
+        ordered = sorted(set(names))
+        index = {name: i for i, name in enumerate(ordered)}
+        successors: list[list[int]] = [[] for _ in ordered]
+        for src, dst in edges:
+            if src != dst and src in index and dst in index:
+                successors[index[src]].append(index[dst])
+        return cls(ordered, successors)
+
+    @classmethod
+    def from_networkx(cls, graph: nx.DiGraph) -> CSRGraph:
+        """Build from an existing ``nx.DiGraph``."""
+        return cls.from_edges(graph.nodes, graph.edges)
+
+    # -- Interning -----------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """Node names indexed by ID."""
+        return self._names
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._succ_targets)
+
+    def id_of(self, name: str) -> int:
+        """Return the ID of *name*; raises ``KeyError`` if absent."""
+        return self._index[name]
+
+    def ids_of(self, names: Iterable[str]) -> list[int]:
+        """Return IDs for the names in *names* that are in the graph."""
+        index = self._index
+        return [index[n] for n in names if n in index]
+
+    def names_of(self, ids: Iterable[int]) -> list[str]:
+        names = self._names
+        return [names[i] for i in ids]
+
+    # -- Adjacency -----------------------------------------------------------
+
+    def successor_ids(self, node: int) -> array[int]:
+        return self._succ_targets[self._succ_offsets[node] : self._succ_offsets[node + 1]]
+
+    def predecessor_ids(self, node: int) -> array[int]:
+        return self._pred_targets[self._pred_offsets[node] : self._pred_offsets[node + 1]]
+
+    def out_degree(self, node: int) -> int:
+        return self._succ_offsets[node + 1] - self._succ_offsets[node]
+
+    def in_degree(self, node: int) -> int:
+        return self._pred_offsets[node + 1] - self._pred_offsets[node]
+
+    # -- Traversal -----------------------------------------------------------
+
+    @staticmethod
+    def _closure(offsets: array[int], targets: array[int], sources: Iterable[int], size: int) -> list[int]:
+        seen = bytearray(size)
+        stack: list[int] = []
+        for source in sources:
+            for nxt in targets[offsets[source] : offsets[source + 1]]:
+                if not seen[nxt]:
+                    seen[nxt] = 1
+                    stack.append(nxt)
+        found = list(stack)
+        while stack:
+            node = stack.pop()
+            for nxt in targets[offsets[node] : offsets[node + 1]]:
+                if not seen[nxt]:
+                    seen[nxt] = 1
+                    stack.append(nxt)
+                    found.append(nxt)
+        return found
+
+    def descendant_ids(self, sources: Iterable[int]) -> list[int]:
+        """Return every node reachable from any of *sources*, in one pass.
+
+        A source is included only if it is reachable from another source,
+        matching the union of ``nx.descendants`` over *sources*.
+        """
+        return self._closure(self._succ_offsets, self._succ_targets, sources, len(self._names))
+
+    def ancestor_ids(self, sources: Iterable[int]) -> list[int]:
+        """Return every node that reaches any of *sources*, in one pass."""
+        return self._closure(self._pred_offsets, self._pred_targets, sources, len(self._names))
+
+    def topological_ids(self) -> list[int]:
+        """Return a lexicographic topological order of all node IDs.
+
+        Raises
+        ------
+        nx.NetworkXUnfeasible
+            If the graph contains a cycle.
+        """
+        pred_offsets = self._pred_offsets
+        in_degree = [pred_offsets[i + 1] - pred_offsets[i] for i in range(len(self._names))]
+        heap = [i for i, degree in enumerate(in_degree) if degree == 0]  # already sorted
+        succ_offsets, succ_targets = self._succ_offsets, self._succ_targets
+        order: list[int] = []
+        while heap:
+            node = heapq.heappop(heap)
+            order.append(node)
+            for nxt in succ_targets[succ_offsets[node] : succ_offsets[node + 1]]:
+                in_degree[nxt] -= 1
+                if in_degree[nxt] == 0:
+                    heapq.heappush(heap, nxt)
+        if len(order) != len(self._names):
+            raise nx.NetworkXUnfeasible("Graph contains a cycle")
+        return order
+
+    def layer_ids(self, subset: Iterable[int] | None = None) -> dict[int, int]:
+        """Return the 0-based longest-path depth of each node.
+
+        Parameters
+        ----------
+        subset:
+            If given, layer only the subgraph induced by these IDs.
+
+        Raises
+        ------
+        nx.NetworkXUnfeasible
+            If the (sub)graph contains a cycle.
+        """
+        if subset is None:
+            members = list(range(len(self._names)))
+            mask = None
+        else:
+            members = sorted(set(subset))
+            mask = bytearray(len(self._names))
+            for node in members:
+                mask[node] = 1
+        in_degree = self._in_degrees(members, mask)
+
+        succ_offsets, succ_targets = self._succ_offsets, self._succ_targets
+        depth = dict.fromkeys(members, 0)
+        frontier = [node for node in members if in_degree[node] == 0]
+        placed = 0
+        while frontier:
+            placed += len(frontier)
+            next_frontier: list[int] = []
+            for node in frontier:
+                level = depth[node] + 1
+                for nxt in succ_targets[succ_offsets[node] : succ_offsets[node + 1]]:
+                    if mask is not None and not mask[nxt]:
+                        continue
+                    if depth[nxt] < level:
+                        depth[nxt] = level
+                    in_degree[nxt] -= 1
+                    if in_degree[nxt] == 0:
+                        next_frontier.append(nxt)
+            frontier = next_frontier
+        if placed != len(members):
+            raise nx.NetworkXUnfeasible("Graph contains a cycle")
+        return depth
+
+    def _in_degrees(self, members: list[int], mask: bytearray | None) -> dict[int, int]:
+        """Count each member's predecessors, only those set in *mask* if given."""
+        pred_offsets, pred_targets = self._pred_offsets, self._pred_targets
+        in_degree: dict[int, int] = {}
+        for node in members:
+            preds = pred_targets[pred_offsets[node] : pred_offsets[node + 1]]
+            in_degree[node] = len(preds) if mask is None else sum(mask[p] for p in preds)
+        return in_degree
+
+    def first_source_ids(self, sources: Iterable[int]) -> dict[int, int]:
+        """Map every node reachable from *sources* to the lowest source ID reaching it.
+
+        Sources are walked in ascending order and a node is claimed by the
+        first walk that reaches it.  Everything below a claimed node was
+        claimed by that same walk, so each node is expanded once.
+        """
+        offsets, targets = self._succ_offsets, self._succ_targets
+        owner: dict[int, int] = {}
+        for source in sorted(set(sources)):
+            stack = [source]
+            while stack:
+                node = stack.pop()
+                for nxt in targets[offsets[node] : offsets[node + 1]]:
+                    if nxt not in owner:
+                        owner[nxt] = source
+                        stack.append(nxt)
+        return owner
+
+    def cycles(self, subset: Iterable[int] | None = None) -> list[list[str]]:
+        """Return the simple cycles in the graph (or induced *subset*)."""
+        nodes = range(len(self._names)) if subset is None else set(subset)
+        graph = nx.DiGraph()
+        for node in nodes:
+            for nxt in self.successor_ids(node):
+                if nxt in nodes:
+                    graph.add_edge(self._names[node], self._names[nxt])
+        return [list(c) for c in nx.simple_cycles(graph)]
+
+
+# ---------------------------------------------------------------------------
+# NetworkX-compatible adapter
+# ---------------------------------------------------------------------------
+
+
+class _NodeView:
+    """Read-only stand-in for ``nx.DiGraph.nodes``."""
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: CSRDiGraph) -> None:
+        self._graph = graph
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph.csr.names)
+
+    def __len__(self) -> int:
+        return len(self._graph.csr)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._graph.csr
+
+    def __getitem__(self, name: str) -> dict[str, Any]:
+        return self._graph._node_data[self._graph.csr.id_of(name)]
+
+    def data(self, key: str | None = None, default: Any = None) -> Iterator[tuple[str, Any]]:
+        for name, attrs in zip(self._graph.csr.names, self._graph._node_data, strict=True):
+            yield name, (attrs if key is None else attrs.get(key, default))
+
+    def __call__(self, data: bool | str = False, default: Any = None) -> Any:
+        if data is False:
+            return self
+        return self.data(None if data is True else data, default)
+
+
+class CSRDiGraph:
+    """Read-only ``nx.DiGraph`` look-alike backed by a :class:`CSRGraph`.
+
+    Supports the subset of the ``DiGraph`` API used across the engine.
+    Mutating methods are deliberately absent; use :meth:`to_networkx` for a
+    mutable copy.  Per-node data dicts are shared, as with ``nx.DiGraph``.
+    """
+
+    def __init__(self, csr: CSRGraph, node_data: list[dict[str, Any]] | None = None) -> None:
+        self.csr = csr
+        self._node_data = node_data if node_data is not None else [{} for _ in range(len(csr))]
+
+    @classmethod
+    def from_networkx(cls, graph: nx.DiGraph) -> CSRDiGraph:
+        csr = CSRGraph.from_networkx(graph)
+        return cls(csr, [graph.nodes[name] for name in csr.names])
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Return an equivalent mutable ``nx.DiGraph``."""
+        graph = nx.DiGraph()
+        for name, attrs in zip(self.csr.names, self._node_data, strict=True):
+            graph.add_node(name, **attrs)
+        graph.add_edges_from(self.edges)
+        return graph
+
+    # -- nx.DiGraph API ------------------------------------------------------
+
+    @property
+    def nodes(self) -> _NodeView:
+        return _NodeView(self)
+
+    @property
+    def edges(self) -> list[tuple[str, str]]:
+        names = self.csr.names
+        return [(names[u], names[v]) for u in range(len(names)) for v in self.csr.successor_ids(u)]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.csr.names)
+
+    def __len__(self) -> int:
+        return len(self.csr)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.csr
+
+    def is_directed(self) -> bool:
+        return True
+
+    def has_node(self, name: str) -> bool:
+        return name in self.csr
+
+    def has_edge(self, upstream: str, downstream: str) -> bool:
+        if upstream not in self.csr or downstream not in self.csr:
+            return False
+        return self.csr.id_of(downstream) in self.csr.successor_ids(self.csr.id_of(upstream))
+
+    def number_of_nodes(self) -> int:
+        return len(self.csr)
+
+    def number_of_edges(self) -> int:
+        return self.csr.edge_count
+
+    def successors(self, name: str) -> Iterator[str]:
+        return iter(self.csr.names_of(self.csr.successor_ids(self._id(name))))
+
+    def predecessors(self, name: str) -> Iterator[str]:
+        return iter(self.csr.names_of(self.csr.predecessor_ids(self._id(name))))
+
+    def in_degree(self, name: str | None = None) -> Any:
+        if name is None:
+            return [(n, self.csr.in_degree(i)) for i, n in enumerate(self.csr.names)]
+        return self.csr.in_degree(self._id(name))
+
+    def out_degree(self, name: str | None = None) -> Any:
+        if name is None:
+            return [(n, self.csr.out_degree(i)) for i, n in enumerate(self.csr.names)]
+        return self.csr.out_degree(self._id(name))
+
+    def subgraph(self, names: Iterable[str]) -> nx.DiGraph:
+        """Return the induced subgraph as a new ``nx.DiGraph``."""
+        ids = set(self.csr.ids_of(names))
+        graph = nx.DiGraph()
+        for node in sorted(ids):
+            graph.add_node(self.csr.names[node], **self._node_data[node])
+        for node in sorted(ids):
+            for nxt in self.csr.successor_ids(node):
+                if nxt in ids:
+                    graph.add_edge(self.csr.names[node], self.csr.names[nxt])
+        return graph
+
+    def _id(self, name: str) -> int:
+        try:
+            return self.csr.id_of(name)
+        except KeyError:
+            raise nx.NetworkXError(f"The node {name} is not in the digraph.") from None
+
+
+# Either graph representation; the functions in dag_builder and the
+# planner accept both.
+ModelGraph: TypeAlias = nx.DiGraph | CSRDiGraph
+
+
+@profile_operation("dag.build_csr")
+def build_csr_dag(models: list[ModelDefinition]) -> CSRDiGraph:
+    """Build a :class:`CSRDiGraph` with the same nodes and edges as :func:`build_dag`.
+
+    Node data holds the :class:`ModelDefinition` under ``"model"``; when
+    several models share a name the last one wins, as in ``build_dag``.
+    """
+    by_name: dict[str, ModelDefinition] = {}
+    for model in models:
+        by_name[model.name] = model
+
+    names = sorted(by_name)
+    index = {name: i for i, name in enumerate(names)}
+    successors: list[list[int]] = [[] for _ in names]
+    for model in models:
+        downstream = index[model.name]
+        for upstream in {*model.referenced_tables, *model.dependencies}:
+            upstream_id = index.get(upstream)
+            if upstream_id is not None and upstream_id != downstream:
+                successors[upstream_id].append(downstream)
+
+    csr = CSRGraph(names, successors)
+    return CSRDiGraph(csr, [{"model": by_name[name]} for name in names])
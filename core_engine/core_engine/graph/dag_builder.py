@@ -5,6 +5,12 @@ This module builds a directed acyclic graph (DAG) from a collection of
 provides topological ordering, upstream/downstream traversal, parallel
 group assignment for execution scheduling, cycle detection, and DAG
 validation against a known set of models.
+
+Every function here accepts either an ``nx.DiGraph`` from :func:`build_dag`
+or the array-backed :class:`~core_engine.graph.csr.CSRDiGraph` from
+:func:`~core_engine.graph.csr.build_csr_dag`; for the latter, traversal,
+sorting, and layering run over integer arrays instead of NetworkX's
+dict-of-dicts.
 """
 
 from __future__ import annotations
@@ -12,9 +18,11 @@ from __future__ import annotations
 import heapq
 import logging
 from collections import deque
+from collections.abc import Iterable
 
 import networkx as nx
 
+from core_engine.graph.csr import CSRDiGraph, ModelGraph
 from core_engine.models.model_definition import ModelDefinition
 from core_engine.telemetry.profiling import profile_operation
 
@@ -131,7 +139,7 @@ def _lexicographic_topological_sort(graph: nx.DiGraph) -> list[str]:
 
 
 @profile_operation("dag.topo_sort")
-def topological_sort(dag: nx.DiGraph) -> list[str]:
+def topological_sort(dag: ModelGraph) -> list[str]:
     """Return a deterministic topological ordering of models in the DAG.
 
     Uses *lexicographic* topological sort so that among nodes with no
@@ -153,6 +161,11 @@ def topological_sort(dag: nx.DiGraph) -> list[str]:
     CyclicDependencyError
         If the graph contains one or more cycles.
     """
+    if isinstance(dag, CSRDiGraph):
+        try:
+            return dag.csr.names_of(dag.csr.topological_ids())
+        except nx.NetworkXUnfeasible:
+            raise CyclicDependencyError(dag.csr.cycles()) from None
     try:
         return _lexicographic_topological_sort(dag)
     except nx.NetworkXUnfeasible:
@@ -165,7 +178,7 @@ def topological_sort(dag: nx.DiGraph) -> list[str]:
 # ---------------------------------------------------------------------------
 
 
-def get_downstream(dag: nx.DiGraph, model_name: str) -> set[str]:
+def get_downstream(dag: ModelGraph, model_name: str) -> set[str]:
     """Return all models transitively downstream of *model_name*.
 
     Performs a breadth-first traversal following successor edges.  The
@@ -185,6 +198,8 @@ def get_downstream(dag: nx.DiGraph, model_name: str) -> set[str]:
     """
     if model_name not in dag:
         return set()
+    if isinstance(dag, CSRDiGraph):
+        return set(dag.csr.names_of(dag.csr.descendant_ids([dag.csr.id_of(model_name)])))
 
     visited: set[str] = set()
     queue: deque[str] = deque(dag.successors(model_name))
@@ -199,7 +214,7 @@ def get_downstream(dag: nx.DiGraph, model_name: str) -> set[str]:
     return visited
 
 
-def get_upstream(dag: nx.DiGraph, model_name: str) -> set[str]:
+def get_upstream(dag: ModelGraph, model_name: str) -> set[str]:
     """Return all models transitively upstream of *model_name*.
 
     Performs a breadth-first traversal following predecessor edges.  The
@@ -219,6 +234,8 @@ def get_upstream(dag: nx.DiGraph, model_name: str) -> set[str]:
     """
     if model_name not in dag:
         return set()
+    if isinstance(dag, CSRDiGraph):
+        return set(dag.csr.names_of(dag.csr.ancestor_ids([dag.csr.id_of(model_name)])))
 
     visited: set[str] = set()
     queue: deque[str] = deque(dag.predecessors(model_name))
@@ -233,13 +250,66 @@ def get_upstream(dag: nx.DiGraph, model_name: str) -> set[str]:
     return visited
 
 
+def get_downstream_closure(dag: ModelGraph, model_names: Iterable[str]) -> set[str]:
+    """Return all models transitively downstream of any of *model_names*.
+
+    Equivalent to the union of :func:`get_downstream` over *model_names*,
+    but traverses the graph once for the whole set.  Names not in the DAG
+    are ignored.
+    """
+    if isinstance(dag, CSRDiGraph):
+        return set(dag.csr.names_of(dag.csr.descendant_ids(dag.csr.ids_of(model_names))))
+
+    visited: set[str] = set()
+    queue: deque[str] = deque()
+    for name in model_names:
+        if name in dag:
+            queue.extend(dag.successors(name))
+    while queue:
+        current = queue.popleft()
+        if current in visited:
+            continue
+        visited.add(current)
+        queue.extend(dag.successors(current))
+    return visited
+
+
+def get_first_upstream_sources(dag: ModelGraph, sources: Iterable[str]) -> dict[str, str]:
+    """Map every model downstream of *sources* to the first source, by name, it depends on.
+
+    A model's value is the alphabetically smallest name in *sources* among
+    its transitive upstream models.  Equivalent to
+    ``min(get_upstream(dag, m) & set(sources))`` for every such model ``m``,
+    but computed for all of them in one pass over the graph.  Names not in
+    the DAG are ignored.
+    """
+    if isinstance(dag, CSRDiGraph):
+        names = dag.csr.names
+        owners = dag.csr.first_source_ids(dag.csr.ids_of(sources))
+        return {names[node]: names[source] for node, source in owners.items()}
+
+    # Walk the sources in name order; a model is claimed by the first walk
+    # that reaches it, and everything below it was claimed by that walk too.
+    owners_by_name: dict[str, str] = {}
+    for source in sorted(set(sources)):
+        if source not in dag:
+            continue
+        stack = [source]
+        while stack:
+            for nxt in dag.successors(stack.pop()):
+                if nxt not in owners_by_name:
+                    owners_by_name[nxt] = source
+                    stack.append(nxt)
+    return owners_by_name
+
+
 # ---------------------------------------------------------------------------
 # Parallel group assignment
 # ---------------------------------------------------------------------------
 
 
 def assign_parallel_groups(
-    dag: nx.DiGraph,
+    dag: ModelGraph,
     models_to_run: list[str],
 ) -> dict[str, int]:
     """Assign parallel execution groups to a subset of models.
@@ -267,6 +337,14 @@ def assign_parallel_groups(
     if not run_set:
         return {}
 
+    if isinstance(dag, CSRDiGraph):
+        ids = dag.csr.ids_of(run_set)
+        try:
+            layers = dag.csr.layer_ids(ids)
+        except nx.NetworkXUnfeasible:
+            raise CyclicDependencyError(dag.csr.cycles(ids)) from None
+        return {dag.csr.names[node]: d + 1 for node, d in layers.items()}
+
     # Induce a subgraph containing only the models we need to run.
     subgraph = dag.subgraph(run_set).copy()
 
@@ -296,7 +374,7 @@ def assign_parallel_groups(
 # ---------------------------------------------------------------------------
 
 
-def detect_cycles(dag: nx.DiGraph) -> list[list[str]]:
+def detect_cycles(dag: ModelGraph) -> list[list[str]]:
     """Detect cycles in the DAG and raise if any are found.
 
     Parameters
@@ -314,13 +392,13 @@ def detect_cycles(dag: nx.DiGraph) -> list[list[str]]:
     CyclicDependencyError
         If one or more cycles are detected.
     """
-    cycles = list(nx.simple_cycles(dag))
+    cycles = dag.csr.cycles() if isinstance(dag, CSRDiGraph) else list(nx.simple_cycles(dag))
     if cycles:
         raise CyclicDependencyError(cycles)
     return cycles
 
 
-def validate_dag(dag: nx.DiGraph, known_models: set[str]) -> list[str]:
+def validate_dag(dag: ModelGraph, known_models: set[str]) -> list[str]:
     """Validate the DAG against a set of known model names.
 
     Checks every upstream reference reachable via edges to ensure the
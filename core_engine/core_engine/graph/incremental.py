@@ -0,0 +1,550 @@
+"""Incrementally maintained model DAG.
+
+:func:`~core_engine.graph.dag_builder.build_dag` rebuilds the dependency
+graph from scratch on every plan, lineage query, and API call.  For a
+large repository where a typical change touches a handful of files that
+is almost entirely repeated work.
+
+:class:`IncrementalDAG` owns an ``nx.DiGraph`` with exactly the nodes,
+edges, and ``"model"`` node data that :func:`build_dag` would produce, and
+additionally maintains:
+
+* a **level** per model -- its longest-path depth from a source, so models
+  on the same level never depend on each other; and
+* a **topological order** -- models sorted by ``(level, name)``, which is
+  both a valid execution order and deterministic.
+
+:meth:`IncrementalDAG.apply_changes` patches only the nodes and edges that
+belong to added, modified, or removed models.  Levels are then
+re-evaluated only for the *changed region* -- the patched nodes and their
+descendants -- since no other model's ancestry changed.  Cycle detection
+runs over that same region: any new cycle must pass through a patched
+edge, and everything on it is downstream of that edge.  If a change would
+introduce a cycle it is rolled back and :class:`CyclicDependencyError`
+raised, leaving the DAG untouched.
+
+The structure can be persisted next to the model parse cache (see
+:func:`load_incremental_dag`) so a warm ``plan`` reloads the previous DAG
+and applies only the diff.  The snapshot records a fingerprint per model
+(its content hash plus header dependencies), so only models whose
+fingerprint changed have their dependencies re-derived.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+from collections import deque
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+import networkx as nx
+
+from core_engine import __version__
+from core_engine.graph.dag_builder import CyclicDependencyError
+from core_engine.models.model_definition import ModelDefinition
+from core_engine.telemetry.profiling import profile_operation
+
+logger = logging.getLogger(__name__)
+
+# Bump when the persisted layout changes.
+_FORMAT_VERSION = 2
+
+# When more than this fraction of the order changes, re-sort instead of
+# moving entries one at a time.
+_RESORT_FRACTION = 0.125
+
+
+def _declared_upstream(model: ModelDefinition) -> frozenset[str]:
+    """Return every name *model* depends on, managed or external."""
+    return (frozenset(model.referenced_tables) | frozenset(model.dependencies)) - {model.name}
+
+
+def _fingerprint(model: ModelDefinition) -> str:
+    """Return a string that changes whenever *model*'s declared upstream can.
+
+    ``referenced_tables`` is derived from the SQL body, which
+    ``content_hash`` covers; header ``dependencies`` are not part of the
+    body and are appended explicitly.
+    """
+    return "\0".join([model.content_hash, *model.dependencies])
+
+
+class IncrementalDAG:
+    """Model dependency graph maintained under incremental changes.
+
+    Use :meth:`from_models` or :func:`load_incremental_dag` rather than the
+    constructor.  :attr:`graph` may be passed to every function in
+    :mod:`core_engine.graph.dag_builder` and to the planner, but must not
+    be mutated directly.
+    """
+
+    def __init__(self) -> None:
+        self._graph: nx.DiGraph = nx.DiGraph()
+        # Declared upstream names per model, including external tables.
+        self._upstream: dict[str, frozenset[str]] = {}
+        # Reverse index: referenced name -> models declaring it.  Kept for
+        # unmanaged names too, so adding a model with that name can wire
+        # up its dependents without scanning every model.
+        self._referrers: dict[str, set[str]] = {}
+        self._level: dict[str, int] = {}
+        self._order: list[tuple[int, str]] = []
+        # Model name -> _fingerprint() of the definition its edges reflect.
+        self._fingerprints: dict[str, str] = {}
+        # Set when the persisted snapshot would differ from the last save.
+        self._dirty = False
+
+    # -- Construction --------------------------------------------------------
+
+    @classmethod
+    @profile_operation("dag.incremental.build")
+    def from_models(cls, models: Iterable[ModelDefinition]) -> IncrementalDAG:
+        """Build a DAG from scratch.
+
+        Raises
+        ------
+        CyclicDependencyError
+            If the models' dependencies contain a cycle.
+        """
+        dag = cls()
+        dag.apply_changes(added=models)
+        return dag
+
+    # -- Read access ---------------------------------------------------------
+
+    @property
+    def graph(self) -> nx.DiGraph:
+        """The underlying graph, shaped exactly like :func:`build_dag` output."""
+        return self._graph
+
+    def __len__(self) -> int:
+        return len(self._level)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._level
+
+    def topological_order(self) -> list[str]:
+        """Return model names sorted by ``(level, name)``."""
+        return [name for _, name in self._order]
+
+    def level(self, name: str) -> int:
+        """Return the longest-path depth of *name* (0 for source models)."""
+        return self._level[name]
+
+    def levels(self) -> dict[str, int]:
+        """Return a copy of the level of every model."""
+        return dict(self._level)
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the DAG changed since it was last loaded or saved."""
+        return self._dirty
+
+    # -- Mutation ------------------------------------------------------------
+
+    def apply_changes(
+        self,
+        *,
+        added: Iterable[ModelDefinition] = (),
+        modified: Iterable[ModelDefinition] = (),
+        removed: Iterable[str] = (),
+    ) -> set[str]:
+        """Patch the DAG for a set of model changes.
+
+        Parameters
+        ----------
+        added:
+            Models not currently in the DAG.
+        modified:
+            New definitions for models already in the DAG.
+        removed:
+            Names of models to drop.
+
+        Returns
+        -------
+        set[str]
+            The changed region: models whose level was re-evaluated.
+
+        Raises
+        ------
+        ValueError
+            If an added model already exists, a modified or removed model
+            does not, or a name appears in more than one argument.
+        CyclicDependencyError
+            If the change would introduce a cycle.  The DAG is unchanged.
+        """
+        added = list(added)
+        modified = list(modified)
+        removed = list(dict.fromkeys(removed))
+        self._check_change_names(added, modified, removed)
+
+        undo: list[Callable[[], None]] = []
+        touched: set[str] = set()
+        try:
+            for name in removed:
+                touched |= self._remove_model(name, undo)
+            touched -= set(removed)
+            for model in modified:
+                touched |= self._modify_model(model, undo)
+            for model in added:
+                self._add_node(model, undo)
+            for model in added:
+                touched |= self._wire_added_model(model.name, undo)
+
+            region = self._descendants_inclusive(touched)
+            new_levels = self._compute_levels(region)
+        except BaseException:
+            for step in reversed(undo):
+                step()
+            raise
+
+        self._commit_levels(new_levels, removed)
+        if region:
+            logger.debug(
+                "Incremental DAG update: +%d ~%d -%d model(s), %d re-levelled.",
+                len(added),
+                len(modified),
+                len(removed),
+                len(region),
+            )
+        return region
+
+    def sync(self, models: Iterable[ModelDefinition]) -> set[str]:
+        """Bring the DAG in line with *models*, the complete current model set.
+
+        Models whose fingerprint matches the one recorded for them only
+        have their ``"model"`` node data refreshed, without re-deriving
+        their dependencies; graph work is limited to added, removed, and
+        re-wired models.
+
+        Returns
+        -------
+        set[str]
+            The changed region, as for :meth:`apply_changes`.
+        """
+        by_name = {m.name: m for m in models}
+        added = [m for name, m in by_name.items() if name not in self._level]
+        removed = [name for name in self._level if name not in by_name]
+        modified: list[ModelDefinition] = []
+        for name, model in by_name.items():
+            if name not in self._level:
+                continue
+            fingerprint = _fingerprint(model)
+            if fingerprint != self._fingerprints.get(name) and _declared_upstream(model) != self._upstream[name]:
+                modified.append(model)
+                continue
+            self._graph.nodes[name]["model"] = model
+            if fingerprint != self._fingerprints.get(name):
+                self._fingerprints[name] = fingerprint
+                self._dirty = True
+        return self.apply_changes(added=added, modified=modified, removed=removed)
+
+    def _check_change_names(
+        self,
+        added: list[ModelDefinition],
+        modified: list[ModelDefinition],
+        removed: list[str],
+    ) -> None:
+        seen: set[str] = set()
+        for name in [*(m.name for m in added), *(m.name for m in modified), *removed]:
+            if name in seen:
+                raise ValueError(f"Model '{name}' appears more than once in the change set")
+            seen.add(name)
+        for model in added:
+            if model.name in self._level:
+                raise ValueError(f"Cannot add model '{model.name}': it is already in the DAG")
+        for name in [*(m.name for m in modified), *removed]:
+            if name not in self._level:
+                raise ValueError(f"Cannot change model '{name}': it is not in the DAG")
+
+    # -- Graph patching (each step logs its inverse in *undo*) ----------------
+
+    def _add_edge(self, upstream: str, downstream: str, undo: list[Callable[[], None]]) -> None:
+        if upstream == downstream or self._graph.has_edge(upstream, downstream):
+            return
+        self._graph.add_edge(upstream, downstream)
+        undo.append(lambda: self._graph.remove_edge(upstream, downstream))
+
+    def _remove_edge(self, upstream: str, downstream: str, undo: list[Callable[[], None]]) -> None:
+        self._graph.remove_edge(upstream, downstream)
+        undo.append(lambda: self._graph.add_edge(upstream, downstream))
+
+    def _register_refs(self, name: str, refs: Iterable[str], undo: list[Callable[[], None]]) -> None:
+        for ref in refs:
+            referrers = self._referrers.setdefault(ref, set())
+            referrers.add(name)
+            undo.append(lambda ref=ref: self._referrers[ref].discard(name))
+
+    def _unregister_refs(self, name: str, refs: Iterable[str], undo: list[Callable[[], None]]) -> None:
+        for ref in refs:
+            referrers = self._referrers[ref]
+            referrers.discard(name)
+            if not referrers:
+                del self._referrers[ref]
+            undo.append(lambda ref=ref: self._referrers.setdefault(ref, set()).add(name))
+
+    def _set_upstream(self, name: str, refs: frozenset[str] | None, undo: list[Callable[[], None]]) -> None:
+        previous = self._upstream.get(name)
+        self._dirty = True
+        if refs is None:
+            del self._upstream[name]
+        else:
+            self._upstream[name] = refs
+
+        def _restore() -> None:
+            if previous is None:
+                self._upstream.pop(name, None)
+            else:
+                self._upstream[name] = previous
+
+        undo.append(_restore)
+
+    def _set_fingerprint(self, name: str, fingerprint: str | None, undo: list[Callable[[], None]]) -> None:
+        previous = self._fingerprints.get(name)
+        self._dirty = True
+        if fingerprint is None:
+            self._fingerprints.pop(name, None)
+        else:
+            self._fingerprints[name] = fingerprint
+
+        def _restore() -> None:
+            if previous is None:
+                self._fingerprints.pop(name, None)
+            else:
+                self._fingerprints[name] = previous
+
+        undo.append(_restore)
+
+    def _remove_model(self, name: str, undo: list[Callable[[], None]]) -> set[str]:
+        """Remove *name* and its edges; return the dependents it leaves behind."""
+        model = self._graph.nodes[name]["model"]
+        preds = list(self._graph.predecessors(name))
+        succs = list(self._graph.successors(name))
+        self._unregister_refs(name, self._upstream[name], undo)
+        self._set_upstream(name, None, undo)
+        self._set_fingerprint(name, None, undo)
+        self._graph.remove_node(name)
+
+        def _restore() -> None:
+            self._graph.add_node(name, model=model)
+            self._graph.add_edges_from((p, name) for p in preds)
+            self._graph.add_edges_from((name, s) for s in succs)
+
+        undo.append(_restore)
+        return set(succs)
+
+    def _modify_model(self, model: ModelDefinition, undo: list[Callable[[], None]]) -> set[str]:
+        """Re-wire *model*'s inbound edges; return it if any edge changed."""
+        name = model.name
+        previous_model = self._graph.nodes[name]["model"]
+        self._graph.nodes[name]["model"] = model
+        undo.append(lambda: self._graph.nodes[name].__setitem__("model", previous_model))
+        self._set_fingerprint(name, _fingerprint(model), undo)
+
+        old_refs = self._upstream[name]
+        new_refs = _declared_upstream(model)
+        if new_refs == old_refs:
+            return set()
+
+        self._unregister_refs(name, old_refs - new_refs, undo)
+        self._register_refs(name, new_refs - old_refs, undo)
+        self._set_upstream(name, new_refs, undo)
+        changed = False
+        for ref in old_refs - new_refs:
+            if self._graph.has_edge(ref, name):
+                self._remove_edge(ref, name, undo)
+                changed = True
+        for ref in new_refs - old_refs:
+            if ref in self._graph:
+                self._add_edge(ref, name, undo)
+                changed = True
+        return {name} if changed else set()
+
+    def _add_node(self, model: ModelDefinition, undo: list[Callable[[], None]]) -> None:
+        name = model.name
+        self._graph.add_node(name, model=model)
+        undo.append(lambda: self._graph.remove_node(name))
+        refs = _declared_upstream(model)
+        self._set_upstream(name, refs, undo)
+        self._set_fingerprint(name, _fingerprint(model), undo)
+        self._register_refs(name, refs, undo)
+
+    def _wire_added_model(self, name: str, undo: list[Callable[[], None]]) -> set[str]:
+        """Connect a newly added node to its upstreams and existing referrers."""
+        touched = {name}
+        for ref in self._upstream[name]:
+            if ref in self._graph:
+                self._add_edge(ref, name, undo)
+        for referrer in self._referrers.get(name, ()):
+            if referrer != name:
+                self._add_edge(name, referrer, undo)
+                touched.add(referrer)
+        return touched
+
+    # -- Levels and order ----------------------------------------------------
+
+    def _descendants_inclusive(self, nodes: set[str]) -> set[str]:
+        region: set[str] = set()
+        queue = deque(n for n in nodes if n in self._graph)
+        while queue:
+            node = queue.popleft()
+            if node in region:
+                continue
+            region.add(node)
+            queue.extend(self._graph.successors(node))
+        return region
+
+    def _compute_levels(self, region: set[str]) -> dict[str, int]:
+        """Recompute levels for *region* with Kahn's algorithm.
+
+        Predecessors outside *region* keep their current levels, which are
+        still valid because their ancestry did not change.
+
+        Raises
+        ------
+        CyclicDependencyError
+            If *region* contains a cycle.
+        """
+        graph = self._graph
+        in_degree = {node: sum(1 for p in graph.predecessors(node) if p in region) for node in region}
+        queue = deque(sorted(node for node, degree in in_degree.items() if degree == 0))
+        levels: dict[str, int] = {}
+        while queue:
+            node = queue.popleft()
+            levels[node] = max(
+                (levels[p] if p in region else self._level[p] for p in graph.predecessors(node)),
+                default=-1,
+            ) + 1
+            for successor in graph.successors(node):
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    queue.append(successor)
+
+        if len(levels) != len(region):
+            stuck = graph.subgraph(node for node in region if node not in levels)
+            raise CyclicDependencyError(list(nx.simple_cycles(stuck)))
+        return levels
+
+    def _commit_levels(self, new_levels: dict[str, int], removed: list[str]) -> None:
+        stale = [(self._level[n], n) for n in removed]
+        fresh: list[tuple[int, str]] = []
+        for node, level in new_levels.items():
+            old = self._level.get(node)
+            if old == level:
+                continue
+            if old is not None:
+                stale.append((old, node))
+            fresh.append((level, node))
+            self._level[node] = level
+        for name in removed:
+            del self._level[name]
+
+        if len(stale) + len(fresh) > _RESORT_FRACTION * max(len(self._order), 1):
+            self._order = sorted((level, node) for node, level in self._level.items())
+            return
+        for key in stale:
+            del self._order[bisect.bisect_left(self._order, key)]
+        for key in fresh:
+            bisect.insort(self._order, key)
+
+    # -- Persistence ---------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable snapshot (model definitions excluded)."""
+        return {
+            "format_version": _FORMAT_VERSION,
+            "engine_version": __version__,
+            "nodes": [
+                {
+                    "name": name,
+                    "level": level,
+                    "fingerprint": self._fingerprints.get(name, ""),
+                    "upstream": sorted(self._upstream[name]),
+                }
+                for level, name in self._order
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any], models: Iterable[ModelDefinition]) -> IncrementalDAG:
+        """Restore a snapshot from :meth:`to_dict`.
+
+        The graph is rebuilt from the recorded adjacency; nothing is
+        derived from *models*, which only supply node ``"model"`` data.
+        Call :meth:`sync` with the same models afterwards to apply any
+        changes since the snapshot was taken.
+
+        Raises
+        ------
+        ValueError
+            If *payload* is not a snapshot from this engine version.
+        """
+        if payload.get("format_version") != _FORMAT_VERSION or payload.get("engine_version") != __version__:
+            raise ValueError("DAG snapshot is from another engine version")
+        by_name = {m.name: m for m in models}
+
+        dag = cls()
+        nodes = payload["nodes"]
+        for entry in nodes:
+            name = entry["name"]
+            refs = frozenset(entry["upstream"])
+            dag._graph.add_node(name, model=by_name.get(name))
+            dag._upstream[name] = refs
+            dag._level[name] = int(entry["level"])
+            dag._fingerprints[name] = entry["fingerprint"]
+            dag._order.append((dag._level[name], name))
+            for ref in refs:
+                dag._referrers.setdefault(ref, set()).add(name)
+        for name, refs in dag._upstream.items():
+            dag._graph.add_edges_from((ref, name) for ref in refs if ref in dag._graph)
+        return dag
+
+    def save(self, path: Path) -> None:
+        """Write the snapshot to *path* atomically; failures are logged."""
+        tmp_path = path.with_suffix(f".json.tmp.{os.getpid()}")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(self.to_dict(), separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Could not write DAG snapshot '%s': %s", path, exc)
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path, models: Iterable[ModelDefinition]) -> IncrementalDAG | None:
+        """Load a snapshot from *path*; ``None`` if missing or unusable."""
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            return cls.from_dict(payload, models)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.info("Discarding DAG snapshot '%s': %s", path, exc)
+            return None
+
+
+def load_incremental_dag(models: list[ModelDefinition], snapshot_path: Path | None = None) -> IncrementalDAG:
+    """Return an :class:`IncrementalDAG` for *models*, reusing a snapshot.
+
+    When *snapshot_path* holds a usable snapshot it is loaded and patched
+    with only the models that changed since; otherwise the DAG is built
+    from scratch.  The snapshot is rewritten whenever the DAG changed.
+
+    Raises
+    ------
+    CyclicDependencyError
+        If the models' dependencies contain a cycle.
+    """
+    dag = IncrementalDAG.load(snapshot_path, models) if snapshot_path is not None else None
+    if dag is None:
+        dag = IncrementalDAG.from_models(models)
+    else:
+        dag.sync(models)
+    if snapshot_path is not None and dag.dirty:
+        dag.save(snapshot_path)
+    return dag
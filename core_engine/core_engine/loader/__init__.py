@@ -6,6 +6,7 @@ from core_engine.loader.dbt_loader import (
     load_models_from_dbt_manifest,
     parse_dbt_node,
 )
+from core_engine.loader.model_cache import ModelParseCache, dag_snapshot_file, default_cache_dir
 from core_engine.loader.model_loader import (
     HeaderParseError,
     ModelLoadError,
@@ -28,9 +29,12 @@ __all__ = [
     "DbtManifestError",
     "HeaderParseError",
     "ModelLoadError",
+    "ModelParseCache",
     "SQLMeshLoadError",
     "UnresolvedRefError",
     "build_model_registry",
+    "dag_snapshot_file",
+    "default_cache_dir",
     "discover_dbt_manifest",
     "discover_sqlmesh_project",
     "load_models_from_dbt_manifest",
@@ -20,6 +20,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from core_engine.loader.parallel import effective_workers, map_sharded
 from core_engine.models.model_definition import (
     ExposureRef,
     Materialization,
@@ -322,18 +323,20 @@ def _extract_hooks(config: dict[str, Any]) -> tuple[list[str], list[str]]:
     return (pre, post)
 
 
-def _get_exposures_for_node(node_id: str, manifest: dict[str, Any]) -> list[ExposureRef]:
-    """Return exposure refs for exposures that depend on the given node.
+def _index_exposures(manifest: dict[str, Any]) -> dict[str, list[ExposureRef]]:
+    """Map each node ID to refs for the exposures that depend on it.
 
     dbt manifest has top-level "exposures" dict. Each exposure has
-    depends_on.nodes; if node_id is in that list, the exposure consumes
-    this model. We return ExposureRef(name, type, url, label) for each.
+    depends_on.nodes; every node listed there is consumed by the exposure.
+    Built once per manifest so attaching exposures is a dict lookup per
+    model rather than a scan of every exposure.  Each node's list is sorted
+    by ``(name, type)``.
     """
     exposures_data = manifest.get("exposures") or {}
     if not isinstance(exposures_data, dict):
-        return []
+        return {}
 
-    refs: list[ExposureRef] = []
+    index: dict[str, list[ExposureRef]] = {}
     for _eid, exp in exposures_data.items():
         if not isinstance(exp, dict):
             continue
@@ -341,8 +344,6 @@ def _get_exposures_for_node(node_id: str, manifest: dict[str, Any]) -> list[Expo
         if not isinstance(depends_on, dict):
             continue
         nodes = depends_on.get("nodes") or []
-        if node_id not in nodes:
-            continue
 
         name = (exp.get("name") or "").strip()
         if not name:
@@ -353,17 +354,40 @@ def _get_exposures_for_node(node_id: str, manifest: dict[str, Any]) -> list[Expo
         label = exp.get("label")
         label = label.strip() if isinstance(label, str) and label.strip() else None
 
-        refs.append(
-            ExposureRef(
-                name=name,
-                type=exp_type,
-                url=url,
-                label=label,
-            )
+        ref = ExposureRef(
+            name=name,
+            type=exp_type,
+            url=url,
+            label=label,
         )
+        for node_id in dict.fromkeys(nodes):
+            index.setdefault(node_id, []).append(ref)
+
+    for refs in index.values():
+        refs.sort(key=lambda e: (e.name, e.type))
+    return index
+
+
+def _dependency_manifest(manifest: dict[str, Any]) -> dict[str, Any]:
+    """Return the subset of *manifest* that :func:`parse_dbt_node` reads.
+
+    Dependency resolution only needs each node's and source's naming
+    fields, so worker processes receive this instead of the full manifest
+    (compiled SQL, columns, docs), which can be hundreds of megabytes.
+    """
 
-    refs.sort(key=lambda e: (e.name, e.type))
-    return refs
+    def _slim(entries: Any, keys: tuple[str, ...]) -> Any:
+        if not isinstance(entries, dict):
+            return entries
+        return {
+            uid: {k: entry[k] for k in keys if k in entry} if isinstance(entry, dict) else entry
+            for uid, entry in entries.items()
+        }
+
+    return {
+        "nodes": _slim(manifest.get("nodes", {}), ("schema", "name", "unique_id")),
+        "sources": _slim(manifest.get("sources", {}), ("schema", "source_name", "name")),
+    }
 
 
 def _extract_owner(node: dict[str, Any]) -> str | None:
@@ -545,27 +569,20 @@ def parse_dbt_node(
     )
 
 
-def load_models_from_dbt_manifest(
-    manifest_path: Path,
-    *,
-    project_filter: str | None = None,
-    tag_filter: list[str] | None = None,
-) -> list[ModelDefinition]:
-    """Load model definitions from a dbt manifest.json file.
+def _node_tags(node: dict[str, Any]) -> set[str]:
+    """Return the union of a node's ``config.tags`` and top-level ``tags``."""
+    config = node.get("config", {})
+    config_tags = config.get("tags", []) if isinstance(config, dict) else []
+    node_tags = node.get("tags", [])
+    if not isinstance(config_tags, list):
+        config_tags = []
+    if not isinstance(node_tags, list):
+        node_tags = []
+    return {t.strip() for t in config_tags + node_tags if isinstance(t, str) and t.strip()}
 
-    Parameters
-    ----------
-    manifest_path:
-        Path to the dbt manifest.json file.
-    project_filter:
-        If provided, only load models from this dbt project.
-    tag_filter:
-        If provided, only load models that have at least one of these tags.
 
-    Returns
-    -------
-    list[ModelDefinition]
-        Fully-parsed model definitions sorted by name.
+def _read_manifest(manifest_path: Path) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Read and validate a manifest, returning it together with its ``nodes`` map.
 
     Raises
     ------
@@ -610,13 +627,20 @@ def load_models_from_dbt_manifest(
             len(nodes),
         )
 
-    tag_filter_set: frozenset[str] | None = None
-    if tag_filter:
-        tag_filter_set = frozenset(t.strip() for t in tag_filter if t.strip())
-        if not tag_filter_set:
-            tag_filter_set = None
+    return manifest, nodes
 
-    models: list[ModelDefinition] = []
+
+def _select_nodes(
+    nodes: dict[str, Any],
+    project_filter: str | None,
+    tag_filter_set: frozenset[str] | None,
+) -> tuple[list[tuple[str, dict[str, Any]]], int, int, int]:
+    """Apply the project and tag filters to the manifest *nodes*.
+
+    Returns the selected ``(node_id, node)`` pairs followed by the
+    project-filtered, tag-filtered and malformed node counts.
+    """
+    selected: list[tuple[str, dict[str, Any]]] = []
     skipped_project = 0
     skipped_tag = 0
     skipped_parse = 0
@@ -638,25 +662,67 @@ def load_models_from_dbt_manifest(
                 continue
 
         # Tag filter: check both config.tags and top-level tags before full parse.
-        if tag_filter_set:
-            config = node.get("config", {})
-            config_tags = config.get("tags", []) if isinstance(config, dict) else []
-            node_tags = node.get("tags", [])
-            if not isinstance(config_tags, list):
-                config_tags = []
-            if not isinstance(node_tags, list):
-                node_tags = []
-
-            all_node_tags = {t.strip() for t in config_tags + node_tags if isinstance(t, str) and t.strip()}
-            if not all_node_tags.intersection(tag_filter_set):
-                skipped_tag += 1
-                continue
+        if tag_filter_set and not _node_tags(node).intersection(tag_filter_set):
+            skipped_tag += 1
+            continue
+
+        selected.append((node_id, node))
+
+    return selected, skipped_project, skipped_tag, skipped_parse
 
-        model = parse_dbt_node(node, manifest)
+
+def load_models_from_dbt_manifest(
+    manifest_path: Path,
+    *,
+    project_filter: str | None = None,
+    tag_filter: list[str] | None = None,
+    max_workers: int | None = 1,
+) -> list[ModelDefinition]:
+    """Load model definitions from a dbt manifest.json file.
+
+    Parameters
+    ----------
+    manifest_path:
+        Path to the dbt manifest.json file.
+    project_filter:
+        If provided, only load models from this dbt project.
+    tag_filter:
+        If provided, only load models that have at least one of these tags.
+    max_workers:
+        Worker processes for node parsing.  ``1`` (the default) parses
+        in-process; ``None`` uses one worker per CPU.  Large manifests are
+        sharded across a process pool (see :mod:`core_engine.loader.parallel`)
+        with output identical to the serial load.
+
+    Returns
+    -------
+    list[ModelDefinition]
+        Fully-parsed model definitions sorted by name.
+
+    Raises
+    ------
+    DbtManifestError
+        If the manifest file is invalid or cannot be read.
+    """
+    manifest, nodes = _read_manifest(manifest_path)
+
+    tag_filter_set: frozenset[str] | None = None
+    if tag_filter:
+        tag_filter_set = frozenset(t.strip() for t in tag_filter if t.strip())
+        if not tag_filter_set:
+            tag_filter_set = None
+
+    selected, skipped_project, skipped_tag, skipped_parse = _select_nodes(nodes, project_filter, tag_filter_set)
+
+    parsed = _parse_selected_nodes(selected, manifest, max_workers)
+
+    exposures_by_node = _index_exposures(manifest)
+    models: list[ModelDefinition] = []
+    for (node_id, _), model in zip(selected, parsed, strict=True):
         if model is not None:
-            exposures = _get_exposures_for_node(node_id, manifest)
+            exposures = exposures_by_node.get(node_id)
             if exposures:
-                model = model.model_copy(update={"exposures": exposures})
+                model = model.model_copy(update={"exposures": list(exposures)})
             models.append(model)
         else:
             skipped_parse += 1
@@ -677,6 +743,67 @@ def load_models_from_dbt_manifest(
     return models
 
 
+# ---------------------------------------------------------------------------
+# Process-pool worker
+# ---------------------------------------------------------------------------
+
+
+def _parse_selected_nodes(
+    selected: list[tuple[str, dict[str, Any]]],
+    manifest: dict[str, Any],
+    max_workers: int | None,
+) -> list[ModelDefinition | None]:
+    """Run :func:`parse_dbt_node` over *selected*, in a process pool when worthwhile."""
+    workers = effective_workers(max_workers, len(selected))
+    if workers <= 1:
+        return [parse_dbt_node(node, manifest) for _, node in selected]
+
+    payloads = map_sharded(
+        _parse_node_shard,
+        [node for _, node in selected],
+        workers,
+        initializer=_init_node_worker,
+        initargs=(_dependency_manifest(manifest),),
+    )
+    parsed: list[ModelDefinition | None] = []
+    for (_, node), payload in zip(selected, payloads, strict=True):
+        if payload == _FATAL:
+            # Re-parse in-process on a worker failure so the original
+            # exception surfaces exactly as it would serially.
+            parsed.append(parse_dbt_node(node, manifest))
+        else:
+            parsed.append(ModelDefinition.model_validate_json(payload) if payload is not None else None)
+    return parsed
+
+
+_FATAL = "\0fatal"
+
+# Per-worker dependency manifest, installed by :func:`_init_node_worker`.
+_worker_manifest: dict[str, Any] = {}
+
+
+def _init_node_worker(dependency_manifest: dict[str, Any]) -> None:
+    global _worker_manifest
+    _worker_manifest = dependency_manifest
+
+
+def _parse_node_shard(nodes: list[dict[str, Any]]) -> list[str | None]:
+    """Parse a shard of manifest nodes in a worker process.
+
+    Returns one entry per node: the model as JSON, ``None`` for skipped
+    nodes, or ``_FATAL`` if parsing raised.
+    """
+    payloads: list[str | None] = []
+    for node in nodes:
+        try:
+            model = parse_dbt_node(node, _worker_manifest)
+        except Exception:
+            payloads.append(_FATAL)
+            continue
+        payloads.append(model.model_dump_json() if model is not None else None)
+    return payloads
+
+
 def discover_dbt_manifest(project_dir: Path) -> Path | None:
     """Locate the manifest.json file in a dbt project directory.
 
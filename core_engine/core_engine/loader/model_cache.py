@@ -0,0 +1,218 @@
+"""Persistent on-disk cache of parsed SQL model files.
+
+:func:`~core_engine.loader.model_loader.load_models_from_directory` reads,
+header-parses, and ref-resolves every ``.sql`` file on each call.  For a
+large project that is seconds of work before planning or lineage can
+start, almost all of it repeated from the previous invocation.
+
+:class:`ModelParseCache` persists, per file:
+
+* the file's ``mtime_ns`` and size, plus a SHA-256 of its raw content;
+* the fully parsed :class:`ModelDefinition` (as JSON);
+* the SQL body with the header stripped; and
+* the registry lookups its ``{{ ref() }}`` macros resolved to.
+
+On a warm run a file whose stat matches is not read at all.  When the
+stat differs but the content hash does not (e.g. after ``git checkout``),
+the entry is reused after a single read.  Ref resolution is redone --
+from the cached body, without touching the file -- only when one of the
+file's refs now resolves differently, i.e. a referenced model was renamed
+or a newly added model shadows a short name.
+
+Like the Rust check engine's cache, the file is written atomically
+(temp file + rename), last writer wins, and an unreadable or
+version-mismatched cache is discarded and rebuilt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from core_engine import __version__
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry layout or the loader's parsing semantics change.
+_CACHE_FORMAT_VERSION = 1
+
+
+@dataclass
+class CachedModelEntry:
+    """Cached parse result for one model file."""
+
+    mtime_ns: int
+    size: int
+    file_hash: str
+    model: dict[str, Any]
+    sql_body: str
+    refs: dict[str, str | None]
+
+    def refs_match(self, registry: dict[str, str]) -> bool:
+        """Return ``True`` if every ref still resolves to the cached target."""
+        return all(registry.get(name) == target for name, target in self.refs.items())
+
+
+def default_cache_dir(project_root: Path) -> Path:
+    """Return the conventional cache directory for a project checkout."""
+    return project_root / ".ironlayer" / "cache"
+
+
+def _models_dir_key(models_dir: Path) -> str:
+    return hashlib.sha256(str(models_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+
+
+def dag_snapshot_file(cache_dir: Path, models_dir: Path) -> Path:
+    """Return the path of the persisted DAG snapshot for *models_dir*.
+
+    The snapshot (see :func:`~core_engine.graph.incremental.load_incremental_dag`)
+    sits next to the directory's parse cache and shares its key.
+    """
+    return cache_dir / f"dag-{_models_dir_key(models_dir)}.json"
+
+
+def file_content_hash(raw: str) -> str:
+    """Return the SHA-256 hex digest of a model file's raw text."""
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ModelParseCache:
+    """On-disk cache of parsed model files for one models directory.
+
+    Use :meth:`open` rather than the constructor.  Lookups and stores are
+    in-memory; nothing is written until :meth:`save`.
+
+    Parameters
+    ----------
+    cache_file:
+        JSON file backing the cache.
+    models_dir:
+        Directory whose files this cache describes.
+    entries:
+        Previously persisted entries keyed by file path.
+    """
+
+    def __init__(
+        self,
+        cache_file: Path,
+        models_dir: Path,
+        entries: dict[str, CachedModelEntry] | None = None,
+    ) -> None:
+        self._cache_file = cache_file
+        self._models_dir = str(models_dir)
+        self._entries: dict[str, CachedModelEntry] = entries or {}
+        self._dirty = False
+
+    @classmethod
+    def open(cls, cache_dir: Path, models_dir: Path) -> ModelParseCache:
+        """Load the cache for *models_dir* from *cache_dir*.
+
+        Each models directory gets its own file (named after a hash of its
+        resolved path) so loading ``repo/`` and ``repo/models/`` cannot
+        evict each other's entries.  A missing, corrupt, or stale-version
+        file yields an empty cache.
+        """
+        cache_file = cache_dir / f"model_parse-{_models_dir_key(models_dir)}.json"
+
+        try:
+            payload = json.loads(cache_file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(cache_file, models_dir)
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable model cache '%s': %s", cache_file, exc)
+            return cls(cache_file, models_dir)
+
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format_version") != _CACHE_FORMAT_VERSION
+            or payload.get("engine_version") != __version__
+        ):
+            logger.info("Model cache '%s' is from another version; rebuilding.", cache_file)
+            return cls(cache_file, models_dir)
+
+        entries: dict[str, CachedModelEntry] = {}
+        try:
+            for key, raw_entry in payload.get("entries", {}).items():
+                entries[key] = CachedModelEntry(**raw_entry)
+        except TypeError as exc:
+            logger.warning("Ignoring malformed model cache '%s': %s", cache_file, exc)
+            return cls(cache_file, models_dir)
+
+        return cls(cache_file, models_dir, entries)
+
+    @property
+    def cache_file(self) -> Path:
+        """Path of the JSON file backing this cache."""
+        return self._cache_file
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -- Lookups -------------------------------------------------------------
+
+    def lookup_by_stat(self, path: Path, stat: os.stat_result) -> CachedModelEntry | None:
+        """Return the entry for *path* if its mtime and size are unchanged."""
+        entry = self._entries.get(str(path))
+        if entry is None or entry.mtime_ns != stat.st_mtime_ns or entry.size != stat.st_size:
+            return None
+        return entry
+
+    def lookup_by_content(self, path: Path, stat: os.stat_result, file_hash: str) -> CachedModelEntry | None:
+        """Return the entry for *path* if its content is unchanged.
+
+        Used after a stat mismatch; refreshes the stored stat on a hit so
+        the next run takes the stat-only path.
+        """
+        entry = self._entries.get(str(path))
+        if entry is None or entry.file_hash != file_hash:
+            return None
+        entry.mtime_ns = stat.st_mtime_ns
+        entry.size = stat.st_size
+        self._dirty = True
+        return entry
+
+    # -- Mutation ------------------------------------------------------------
+
+    def store(self, path: Path, entry: CachedModelEntry) -> None:
+        """Insert or replace the entry for *path*."""
+        self._entries[str(path)] = entry
+        self._dirty = True
+
+    def retain(self, paths: list[Path]) -> None:
+        """Drop entries for files not in *paths* (deleted or renamed files)."""
+        keep = {str(p) for p in paths}
+        stale = [key for key in self._entries if key not in keep]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if anything changed.
+
+        Failures are logged and swallowed: the cache is an optimisation and
+        must never break model loading.
+        """
+        if not self._dirty:
+            return
+        payload = {
+            "format_version": _CACHE_FORMAT_VERSION,
+            "engine_version": __version__,
+            "models_dir": self._models_dir,
+            "entries": {key: asdict(entry) for key, entry in sorted(self._entries.items())},
+        }
+        tmp_path = self._cache_file.with_suffix(f".json.tmp.{os.getpid()}")
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp_path, self._cache_file)
+        except OSError as exc:
+            logger.warning("Could not write model cache '%s': %s", self._cache_file, exc)
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._dirty = False
@@ -14,9 +14,13 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from core_engine.loader.model_cache import CachedModelEntry, ModelParseCache, file_content_hash
+from core_engine.loader.parallel import effective_workers, map_sharded
 from core_engine.loader.ref_resolver import (
     build_model_registry,
     extract_ref_names,
@@ -501,32 +505,28 @@ def parse_model_file(
     HeaderParseError
         If required header fields are missing.
     """
+    raw_sql = _read_model_file(file_path)
+    model, sql_body = _parse_model_source(file_path, raw_sql)
+    if model_registry is not None:
+        model = _resolve_model(model, sql_body, model_registry)
+    return model
+
+
+def _read_model_file(file_path: Path) -> str:
     try:
-        raw_sql = file_path.read_text(encoding="utf-8")
+        return file_path.read_text(encoding="utf-8")
     except OSError as exc:
         raise ModelLoadError(f"Failed to read model file '{file_path}': {exc}") from exc
 
-    header = parse_yaml_header(raw_sql)
-    sql_body = _extract_sql_body(raw_sql)
 
-    # Resolve refs if a registry is available, otherwise keep the raw body.
-    if model_registry is not None:
-        clean_sql = resolve_refs(sql_body, model_registry)
-    else:
-        clean_sql = sql_body
-
-    content_hash = _compute_content_hash(clean_sql)
-
-    # Extract the list of referenced model names from the raw SQL body
-    # (before resolution) so that ``referenced_tables`` captures the
-    # original ref targets.
-    ref_names = extract_ref_names(sql_body)
+def _parse_model_source(file_path: Path, raw_sql: str) -> tuple[ModelDefinition, str]:
+    """Parse file content into an unresolved model plus its SQL body.
 
-    # If a registry is available, map ref names to canonical table names.
-    if model_registry is not None:
-        referenced_tables = [model_registry.get(name, name) for name in ref_names]
-    else:
-        referenced_tables = ref_names
+    The returned model has refs left as-is: ``clean_sql`` is the header-less
+    body and ``referenced_tables`` holds the raw ref names.
+    """
+    header = parse_yaml_header(raw_sql)
+    sql_body = _extract_sql_body(raw_sql)
 
     # Parse contract_mode if present.
     contract_mode = SchemaContractMode.DISABLED
@@ -546,7 +546,7 @@ def parse_model_file(
     pre_hooks = _parse_hook_sql(header.get("pre_hook_sql", ""))
     post_hooks = _parse_hook_sql(header.get("post_hook_sql", ""))
 
-    return ModelDefinition(
+    model = ModelDefinition(
         name=header["name"],
         kind=ModelKind(header["kind"]),
         materialization=(
@@ -564,13 +564,37 @@ def parse_model_file(
         post_hooks=post_hooks,
         file_path=str(file_path),
         raw_sql=raw_sql,
-        clean_sql=clean_sql,
-        content_hash=content_hash,
-        referenced_tables=referenced_tables,
+        clean_sql=sql_body,
+        content_hash=_compute_content_hash(sql_body),
+        # Extract the referenced model names from the raw SQL body (before
+        # resolution) so that ``referenced_tables`` captures the original
+        # ref targets.
+        referenced_tables=extract_ref_names(sql_body),
         contract_mode=contract_mode,
         contract_columns=header.get("contract_columns", []),
         tests=header.get("tests", []),
     )
+    return model, sql_body
+
+
+def _resolve_model(model: ModelDefinition, sql_body: str, model_registry: dict[str, str]) -> ModelDefinition:
+    """Return *model* with ``{{ ref() }}`` macros in *sql_body* resolved.
+
+    Raises
+    ------
+    UnresolvedRefError
+        If a ref names a model missing from *model_registry*.
+    """
+    clean_sql = resolve_refs(sql_body, model_registry)
+    ref_names = extract_ref_names(sql_body)
+    return model.model_copy(
+        update={
+            "clean_sql": clean_sql,
+            "content_hash": _compute_content_hash(clean_sql),
+            # Map ref names to canonical table names.
+            "referenced_tables": [model_registry.get(name, name) for name in ref_names],
+        }
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -578,21 +602,42 @@ def parse_model_file(
 # ---------------------------------------------------------------------------
 
 
-def load_models_from_directory(models_dir: Path) -> list[ModelDefinition]:
+def load_models_from_directory(
+    models_dir: Path,
+    *,
+    cache_dir: Path | None = None,
+    max_workers: int | None = 1,
+) -> list[ModelDefinition]:
     """Discover, parse, and resolve all ``.sql`` model files under *models_dir*.
 
     The loading happens in two passes:
 
-    1. **Scan pass** -- Iterate over every ``.sql`` file, parse its header
-       only (no ref resolution), and build a model registry.
-    2. **Full-parse pass** -- Re-parse every file with the complete model
-       registry so that all ``{{ ref() }}`` macros can be resolved.
+    1. **Scan pass** -- Read every ``.sql`` file once, parse its header
+       (no ref resolution), and build a model registry.
+    2. **Resolve pass** -- Resolve every model's ``{{ ref() }}`` macros
+       against the complete registry, from the SQL body read in pass 1.
+
+    When *cache_dir* is given, parse results are persisted there (see
+    :class:`~core_engine.loader.model_cache.ModelParseCache`).  Unchanged
+    files are then neither re-read nor re-parsed, and ref resolution is
+    only redone for models whose refs now resolve to a different target.
+
+    With *max_workers* other than ``1``, files that must be parsed (cache
+    misses) are sharded across a process pool when there are enough of
+    them to amortise its start-up (see :mod:`core_engine.loader.parallel`).
+    The result is identical to the serial load.
 
     Parameters
     ----------
     models_dir:
         Root directory to search for ``.sql`` files.  The search is
         recursive.
+    cache_dir:
+        Optional directory for the persistent parse cache, typically
+        ``<project>/.ironlayer/cache``.
+    max_workers:
+        Worker processes for parsing.  ``1`` (the default) parses
+        in-process; ``None`` uses one worker per CPU.
 
     Returns
     -------
@@ -613,6 +658,8 @@ def load_models_from_directory(models_dir: Path) -> list[ModelDefinition]:
         logger.warning("No .sql files found under '%s'.", models_dir)
         return []
 
+    cache = ModelParseCache.open(cache_dir, models_dir) if cache_dir is not None else None
+
     logger.info(
         "Pass 1: scanning %d SQL file(s) under '%s'.",
         len(sql_files),
@@ -620,34 +667,182 @@ def load_models_from_directory(models_dir: Path) -> list[ModelDefinition]:
     )
 
     # -- Pass 1: headers only, no ref resolution --------------------------
-    header_models: list[ModelDefinition] = []
-    for path in sql_files:
-        try:
-            model = parse_model_file(path, model_registry=None)
-            header_models.append(model)
-        except (HeaderParseError, ModelLoadError) as exc:
-            logger.error("Skipping '%s': %s", path, exc)
+    scanned = _scan_model_files(sql_files, cache, max_workers)
+    cache_hits = sum(1 for item in scanned if item.cached is not None)
 
-    registry = build_model_registry(header_models)
+    registry = build_model_registry([item.model for item in scanned])
     logger.info(
         "Built model registry with %d entries from %d model(s).",
         len(registry),
-        len(header_models),
+        len(scanned),
     )
 
-    # -- Pass 2: full parse with ref resolution ---------------------------
-    logger.info("Pass 2: resolving refs for %d model(s).", len(sql_files))
+    # -- Pass 2: ref resolution -------------------------------------------
+    logger.info("Pass 2: resolving refs for %d model(s).", len(scanned))
 
     resolved_models: list[ModelDefinition] = []
-    for path in sql_files:
-        try:
-            model = parse_model_file(path, model_registry=registry)
-            resolved_models.append(model)
-        except (HeaderParseError, ModelLoadError) as exc:
-            logger.error("Skipping '%s' during ref resolution: %s", path, exc)
+    for item in scanned:
+        if item.cached is not None and item.cached.refs_match(registry):
+            resolved_models.append(item.model)
+            continue
+
+        model = _resolve_model(item.model, item.sql_body, registry)
+        resolved_models.append(model)
+        if cache is not None:
+            cache.store(
+                item.path,
+                CachedModelEntry(
+                    mtime_ns=item.stat.st_mtime_ns,
+                    size=item.stat.st_size,
+                    file_hash=item.file_hash,
+                    model=model.model_dump(mode="json"),
+                    sql_body=item.sql_body,
+                    refs={name: registry.get(name) for name in extract_ref_names(item.sql_body)},
+                ),
+            )
+
+    if cache is not None:
+        cache.retain(sql_files)
+        cache.save()
+        logger.info("Model cache: %d of %d file(s) unchanged.", cache_hits, len(sql_files))
 
     # Sort by name for deterministic graph construction downstream.
     resolved_models.sort(key=lambda m: m.name)
 
     logger.info("Loaded %d model(s) from '%s'.", len(resolved_models), models_dir)
     return resolved_models
+
+
+@dataclass
+class _ScannedModel:
+    """Pass-1 result for one file."""
+
+    path: Path
+    stat: os.stat_result
+    file_hash: str
+    model: ModelDefinition
+    sql_body: str
+    cached: CachedModelEntry | None
+
+
+def _scan_model_files(
+    sql_files: list[Path],
+    cache: ModelParseCache | None,
+    max_workers: int | None,
+) -> list[_ScannedModel]:
+    """Run pass 1 over *sql_files*, returning results in file order.
+
+    Cache hits are resolved in-process from a ``stat`` alone; only the
+    remaining files are read and parsed, in a process pool when
+    worthwhile.  Unreadable files and header errors are logged and skipped.
+    """
+    slots: list[_ScannedModel | None] = []
+    misses: list[tuple[int, Path, os.stat_result]] = []
+    for path in sql_files:
+        try:
+            stat = path.stat()
+        except OSError as exc:
+            logger.error("Skipping '%s': Failed to read model file '%s': %s", path, path, exc)
+            continue
+        entry = cache.lookup_by_stat(path, stat) if cache is not None else None
+        if entry is not None:
+            slots.append(_scanned_from_cache(path, stat, entry))
+        else:
+            misses.append((len(slots), path, stat))
+            slots.append(None)
+
+    workers = effective_workers(max_workers, len(misses))
+    payloads: list[_FilePayload | None] = [None] * len(misses)
+    if workers > 1:
+        parsed = map_sharded(_parse_file_shard, [str(path) for _, path, _ in misses], workers)
+        payloads = list(parsed)
+
+    for (slot, path, stat), payload in zip(misses, payloads, strict=True):
+        try:
+            if payload is None or payload[3] == _FATAL:
+                # Serial path -- and the fallback for files a worker could
+                # not handle, so their exception surfaces exactly as it
+                # would have without the pool.
+                slots[slot] = _scan_uncached_file(path, stat, cache)
+            elif payload[3] is not None:
+                logger.error("Skipping '%s': %s", path, payload[3])
+            else:
+                slots[slot] = _scanned_from_payload(path, stat, payload, cache)
+        except (HeaderParseError, ModelLoadError) as exc:
+            logger.error("Skipping '%s': %s", path, exc)
+
+    return [item for item in slots if item is not None]
+
+
+def _scanned_from_cache(path: Path, stat: os.stat_result, entry: CachedModelEntry) -> _ScannedModel:
+    return _ScannedModel(
+        path=path,
+        stat=stat,
+        file_hash=entry.file_hash,
+        model=ModelDefinition.model_validate(entry.model),
+        sql_body=entry.sql_body,
+        cached=entry,
+    )
+
+
+def _scan_uncached_file(path: Path, stat: os.stat_result, cache: ModelParseCache | None) -> _ScannedModel:
+    """Read and parse *path*, still reusing a cache entry if only its stat changed."""
+    raw_sql = _read_model_file(path)
+    file_hash = file_content_hash(raw_sql) if cache is not None else ""
+    if cache is not None:
+        entry = cache.lookup_by_content(path, stat, file_hash)
+        if entry is not None:
+            return _scanned_from_cache(path, stat, entry)
+    model, sql_body = _parse_model_source(path, raw_sql)
+    return _ScannedModel(path=path, stat=stat, file_hash=file_hash, model=model, sql_body=sql_body, cached=None)
+
+
+# ---------------------------------------------------------------------------
+# Process-pool worker
+# ---------------------------------------------------------------------------
+
+# Worker payload per file: (file_hash, model_json, sql_body, error).
+# ``error`` is a skip message for header/read errors, ``_FATAL`` for
+# anything else (the parent re-parses the file to raise it), else ``None``.
+_FilePayload = tuple[str, str | None, str | None, str | None]
+
+_FATAL = "\0fatal"
+
+
+def _parse_file_shard(paths: list[str]) -> list[_FilePayload]:
+    """Parse a shard of model files in a worker process."""
+    payloads: list[_FilePayload] = []
+    for path_str in paths:
+        path = Path(path_str)
+        try:
+            raw_sql = _read_model_file(path)
+            model, sql_body = _parse_model_source(path, raw_sql)
+        except (HeaderParseError, ModelLoadError) as exc:
+            payloads.append(("", None, None, str(exc)))
+            continue
+        except Exception:
+            payloads.append(("", None, None, _FATAL))
+            continue
+        payloads.append((file_content_hash(raw_sql), model.model_dump_json(), sql_body, None))
+    return payloads
+
+
+def _scanned_from_payload(
+    path: Path,
+    stat: os.stat_result,
+    payload: _FilePayload,
+    cache: ModelParseCache | None,
+) -> _ScannedModel:
+    file_hash, model_json, sql_body, _ = payload
+    if cache is not None:
+        entry = cache.lookup_by_content(path, stat, file_hash)
+        if entry is not None:
+            return _scanned_from_cache(path, stat, entry)
+    return _ScannedModel(
+        path=path,
+        stat=stat,
+        file_hash=file_hash if cache is not None else "",
+        model=ModelDefinition.model_validate_json(model_json or ""),
+        sql_body=sql_body or "",
+        cached=None,
+    )
@@ -85,7 +85,12 @@ class DatabaseSink:
             asyncio.run(self._async_flush(events))
 
     async def _async_flush(self, events: Sequence[UsageEvent]) -> None:
-        """Persist events to the usage_events table."""
+        """Persist events to the usage_events table.
+
+        The monthly ``usage_counters`` read by quota checks are updated in
+        the same transaction, so they never disagree with the events.
+        """
+        from core_engine.state.repository import UsageCounterRepository
         from core_engine.state.tables import UsageEventTable
 
         try:
@@ -100,6 +105,9 @@ class DatabaseSink:
                         created_at=event.timestamp,
                     )
                     session.add(row)
+                await UsageCounterRepository(session).add_usage(
+                    [(e.tenant_id, e.event_type.value, e.timestamp, e.quantity, e.reserved) for e in events]
+                )
                 await session.commit()
             logger.debug("Flushed %d events to database", len(events))
         except Exception:
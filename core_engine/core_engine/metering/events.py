@@ -43,6 +43,9 @@ class UsageEvent(BaseModel):
         Number of units consumed (e.g., 1 plan run, 150 tokens).
     metadata:
         Additional context (model names, plan IDs, etc.).
+    reserved:
+        Quota units reserved for this operation through
+        ``QuotaService.check_and_reserve``; recording the event consumes them.
     """
 
     event_id: str = Field(default_factory=lambda: f"evt-{uuid.uuid4().hex[:12]}")
@@ -51,3 +54,4 @@ class UsageEvent(BaseModel):
     timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
     quantity: int = 1
     metadata: dict[str, Any] = Field(default_factory=dict)
+    reserved: int = 0
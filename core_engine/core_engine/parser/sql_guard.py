@@ -143,6 +143,10 @@ class UnsafeSQLError(Exception):
         descriptions = "; ".join(v.description for v in violations)
         super().__init__(f"Unsafe SQL detected: {descriptions}")
 
+    def __reduce__(self) -> tuple[type[UnsafeSQLError], tuple[list[SQLGuardViolation]]]:
+        # Rebuild from the violations so the error survives a process-pool hop.
+        return (self.__class__, (self.violations,))
+
 
 # ---------------------------------------------------------------------------
 # Internal detection helpers
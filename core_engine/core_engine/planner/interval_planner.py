@@ -21,13 +21,15 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from collections import deque
 from datetime import date, timedelta
 
 import networkx as nx
 from pydantic import BaseModel, Field
 
 from core_engine.contracts.schema_validator import ContractValidationResult
-from core_engine.graph.dag_builder import topological_sort
+from core_engine.graph.csr import CSRDiGraph, ModelGraph
+from core_engine.graph.dag_builder import get_downstream_closure, get_first_upstream_sources
 from core_engine.models.diff import DiffResult
 from core_engine.models.model_definition import ModelDefinition, ModelKind
 from core_engine.models.plan import (
@@ -93,7 +95,7 @@ _DEFAULT_ESTIMATED_SECONDS: float = 300.0  # 5 minutes
 def generate_plan(
     models: dict[str, ModelDefinition],
     diff_result: DiffResult,
-    dag: nx.DiGraph,
+    dag: ModelGraph,
     watermarks: dict[str, tuple[date, date]],
     run_stats: dict[str, dict],
     config: PlannerConfig | None = None,
@@ -171,11 +173,8 @@ def generate_plan(
         directly_changed -= cosmetic_models
 
     # 2. Compute transitive downstream closure via the DAG. -----------------
-    all_affected: set[str] = set(directly_changed)
-    for model_name in sorted(directly_changed):
-        if dag.has_node(model_name):
-            downstream = nx.descendants(dag, model_name)
-            all_affected |= downstream
+    # One multi-source traversal for the whole changed set.
+    all_affected: set[str] = set(directly_changed) | get_downstream_closure(dag, directly_changed)
 
     # Only keep models that actually exist in the target model set.
     all_affected = {m for m in all_affected if m in models}
@@ -187,6 +186,8 @@ def generate_plan(
     parallel_groups = _assign_parallel_groups(affected_sorted, dag)
 
     # 5. Build a step for each affected model. -----------------------------
+    # First changed upstream of every downstream model, for step reasons.
+    root_causes = get_first_upstream_sources(dag, directly_changed)
     steps: list[PlanStep] = []
     # Pre-compute step IDs so we can wire up depends_on references.
     step_id_map: dict[str, str] = {name: _compute_step_id(name, base, target) for name in affected_sorted}
@@ -209,6 +210,7 @@ def generate_plan(
             is_direct=(model_name in directly_changed),
             dag=dag,
             directly_changed=directly_changed,
+            root_cause=root_causes.get(model_name),
         )
 
         # Compute depends_on: upstream models within the affected set.
@@ -285,7 +287,7 @@ def _determine_run_type(
     model_def: ModelDefinition,
     diff_result: DiffResult,
     watermarks: dict[str, tuple[date, date]],
-    dag: nx.DiGraph,
+    dag: ModelGraph,
     all_affected: set[str],
     config: PlannerConfig,
     as_of_date: date,
@@ -400,7 +402,7 @@ def _compute_incremental_range(
 
 def _assign_parallel_groups(
     affected_models: list[str],
-    dag: nx.DiGraph,
+    dag: ModelGraph,
 ) -> dict[str, int]:
     """Assign each affected model to a parallel execution group.
 
@@ -417,31 +419,40 @@ def _assign_parallel_groups(
         return {}
 
     affected_set = set(affected_models)
-    subgraph = dag.subgraph(affected_set & set(dag.nodes))
+    in_dag = [m for m in affected_models if dag.has_node(m)]
 
-    # If the subgraph is empty (no edges among affected nodes) or a model is
-    # not even present in the DAG, everything lands in group 0.
-    if subgraph.number_of_nodes() == 0:
+    # If no affected model is even present in the DAG, everything lands in
+    # group 0.
+    if not in_dag:
         return {m: 0 for m in affected_models}
 
+    if isinstance(dag, CSRDiGraph):
+        return _assign_parallel_groups_csr(affected_models, in_dag, dag)
+
     groups: dict[str, int] = {}
 
-    # Topological layering via longest path from any source.
-    try:
-        topo_order = topological_sort(subgraph)
-    except Exception:
+    # Topological layering via longest path from any source, following only
+    # edges between affected models.  Walking the DAG's adjacency directly
+    # keeps this O(affected) instead of materialising an induced subgraph.
+    in_degree = {node: sum(1 for p in dag.predecessors(node) if p in affected_set) for node in in_dag}
+    queue: deque[str] = deque(node for node in in_dag if in_degree[node] == 0)
+    longest_path: dict[str, int] = {}
+    while queue:
+        node = queue.popleft()
+        longest_path[node] = (
+            max((longest_path[p] for p in dag.predecessors(node) if p in affected_set), default=-1) + 1
+        )
+        for successor in dag.successors(node):
+            if successor in in_degree:
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    queue.append(successor)
+
+    if len(longest_path) != len(in_dag):
         # Cycle detected -- defensive fallback to sequential execution.
         logger.warning("Cycle detected in affected subgraph; assigning sequential groups.")
         return {m: idx for idx, m in enumerate(affected_models)}
 
-    longest_path: dict[str, int] = {}
-    for node in topo_order:
-        preds_in_sub = [p for p in subgraph.predecessors(node) if p in longest_path]
-        if preds_in_sub:
-            longest_path[node] = max(longest_path[p] for p in preds_in_sub) + 1
-        else:
-            longest_path[node] = 0
-
     # Any affected model not in the subgraph (isolated node) gets group 0.
     for model_name in affected_models:
         groups[model_name] = longest_path.get(model_name, 0)
@@ -449,6 +460,21 @@ def _assign_parallel_groups(
     return groups
 
 
+def _assign_parallel_groups_csr(
+    affected_models: list[str],
+    in_dag: list[str],
+    dag: CSRDiGraph,
+) -> dict[str, int]:
+    """:func:`_assign_parallel_groups` over the integer arrays of a :class:`CSRDiGraph`."""
+    try:
+        layers = dag.csr.layer_ids(dag.csr.ids_of(in_dag))
+    except nx.NetworkXUnfeasible:
+        logger.warning("Cycle detected in affected subgraph; assigning sequential groups.")
+        return {m: idx for idx, m in enumerate(affected_models)}
+    names = dag.csr.names
+    return {m: 0 for m in affected_models} | {names[node]: d for node, d in layers.items()}
+
+
 # ---------------------------------------------------------------------------
 # Cost estimation
 # ---------------------------------------------------------------------------
@@ -496,8 +522,9 @@ def _build_reason(
     model_name: str,
     diff_result: DiffResult,
     is_direct: bool,
-    dag: nx.DiGraph,
+    dag: ModelGraph,
     directly_changed: set[str],
+    root_cause: str | None,
 ) -> str:
     """Produce a human-readable reason string for why a model is in the plan.
 
@@ -514,6 +541,9 @@ def _build_reason(
         Full dependency DAG.
     directly_changed:
         Set of directly changed model names.
+    root_cause:
+        First directly changed model, by name, upstream of *model_name*
+        (see :func:`~core_engine.graph.dag_builder.get_first_upstream_sources`).
 
     Returns
     -------
@@ -532,15 +562,9 @@ def _build_reason(
         if changed_upstreams:
             return f"downstream of {changed_upstreams[0]}"
 
-        # The model may be multiple hops downstream.  Walk ancestors in the
-        # affected set to find the root cause.
-        try:
-            ancestors = nx.ancestors(dag, model_name)
-            root_causes = sorted(ancestors & directly_changed)
-            if root_causes:
-                return f"downstream of {root_causes[0]}"
-        except nx.NetworkXError:
-            pass
+        # The model may be multiple hops downstream.
+        if root_cause is not None:
+            return f"downstream of {root_cause}"
 
     return "included by planner policy"
 
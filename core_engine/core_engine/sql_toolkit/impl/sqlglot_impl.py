@@ -14,8 +14,11 @@ Supports SQLGlot 26.x and later (see core_engine pyproject.toml).
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
+import threading
+from collections import OrderedDict
 from typing import Any
 
 import sqlglot
@@ -29,6 +32,8 @@ from sqlglot.optimizer.scope import build_scope
 from sqlglot.optimizer.simplify import simplify as sqlglot_simplify
 from sqlglot.schema import MappingSchema
 
+from core_engine.telemetry.profiling import ProfileCollector
+
 from .._types import (
     AstDiffResult,
     ColumnExtractionResult,
@@ -268,12 +273,178 @@ def _collect_cte_names(ast: exp.Expression) -> set[str]:
     return cte_names
 
 
+# ---------------------------------------------------------------------------
+# Parsed-AST cache
+# ---------------------------------------------------------------------------
+
+# Rough per-node footprint of a sqlglot expression (object, args dict,
+# identifier strings).  Used only to size entries against the byte budget.
+_EST_BYTES_PER_NODE = 512
+
+
+class SqlGlotAstCache:
+    """Bounded, thread-safe LRU cache of parsed sqlglot trees.
+
+    The same model SQL is parsed many times per command (table extraction,
+    column extraction, normalisation, diffing, safety checks, lineage), so
+    every :class:`SqlGlotToolkit` component parses through one shared cache.
+    Entries are keyed by the SHA-256 of the SQL text, the dialect, and the
+    parser error level; parse failures are never cached.
+
+    Cached trees are never handed out directly.  :meth:`parse` and
+    :meth:`parse_one` return deep copies by default, so callers may mutate
+    the result freely.  Internal read-only callers pass ``copy=False`` to
+    skip the copy -- they must not mutate the tree (rendering via
+    ``Expression.sql()`` is safe; it copies before transforming).
+
+    Eviction is least-recently-used against an estimated memory budget.
+    Hits, misses, and evictions are counted in the
+    :class:`~core_engine.telemetry.profiling.ProfileCollector` under
+    ``sql_toolkit.ast_cache.*``.
+
+    Parameters
+    ----------
+    max_bytes:
+        Estimated memory budget for all cached trees.  ``0`` disables caching.
+    """
+
+    COUNTER_PREFIX = "sql_toolkit.ast_cache."
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str, str], tuple[tuple[exp.Expression | None, ...], int]] = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        """Estimated memory budget in bytes."""
+        return self._max_bytes
+
+    @property
+    def current_bytes(self) -> int:
+        """Estimated memory held by cached trees."""
+        return self._current_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached tree."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def parse(
+        self,
+        sql: str,
+        dialect: str,
+        *,
+        error_level: ErrorLevel | None = None,
+        copy: bool = True,
+    ) -> list[exp.Expression | None]:
+        """Cached equivalent of ``sqlglot.parse(sql, read=dialect)``.
+
+        Raises whatever ``sqlglot.parse`` raises on a miss.
+        """
+        statements = self._get_or_parse(sql, dialect, error_level)
+        if not copy:
+            return list(statements)
+        return [stmt.copy() if stmt is not None else None for stmt in statements]
+
+    def parse_one(
+        self,
+        sql: str,
+        dialect: str,
+        *,
+        error_level: ErrorLevel | None = None,
+        copy: bool = True,
+    ) -> exp.Expression:
+        """Cached equivalent of ``sqlglot.parse_one(sql, read=dialect)``.
+
+        Raises
+        ------
+        ParseError
+            If the SQL is invalid or contains no statement.
+        """
+        statements = self._get_or_parse(sql, dialect, error_level)
+        if not statements or statements[0] is None:
+            raise ParseError(f"No expression was parsed from '{sql}'")
+        return statements[0].copy() if copy else statements[0]
+
+    def _get_or_parse(
+        self,
+        sql: str,
+        dialect: str,
+        error_level: ErrorLevel | None,
+    ) -> tuple[exp.Expression | None, ...]:
+        key = (
+            hashlib.sha256(sql.encode("utf-8")).hexdigest(),
+            dialect,
+            error_level.name if error_level is not None else "",
+        )
+        collector = ProfileCollector.get_instance()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is not None:
+            collector.increment(self.COUNTER_PREFIX + "hits")
+            return entry[0]
+
+        collector.increment(self.COUNTER_PREFIX + "misses")
+        # Parse outside the lock: two threads racing on the same SQL both
+        # parse it, which is cheaper than serialising every parse.
+        opts: dict[str, Any] = {} if error_level is None else {"error_level": error_level}
+        statements = tuple(sqlglot.parse(sql, read=dialect, **opts))
+        size = sum(sum(1 for _ in stmt.walk()) for stmt in statements if stmt is not None) * _EST_BYTES_PER_NODE
+        if size > self._max_bytes:
+            return statements
+
+        evicted = 0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous[1]
+            self._entries[key] = (statements, size)
+            self._current_bytes += size
+            while self._current_bytes > self._max_bytes:
+                _, (_, old_size) = self._entries.popitem(last=False)
+                self._current_bytes -= old_size
+                evicted += 1
+        if evicted:
+            collector.increment(self.COUNTER_PREFIX + "evictions", evicted)
+        return statements
+
+
+_SHARED_AST_CACHE = SqlGlotAstCache()
+
+
+def get_ast_cache() -> SqlGlotAstCache:
+    """Return the process-wide AST cache shared by all SQLGlot components."""
+    return _SHARED_AST_CACHE
+
+
+class _CachedParsing:
+    """Base for components that parse through a :class:`SqlGlotAstCache`.
+
+    Defaults to the process-wide cache so components built directly share
+    parses with those owned by :class:`SqlGlotToolkit`.
+    """
+
+    def __init__(self, ast_cache: SqlGlotAstCache | None = None) -> None:
+        self._ast_cache = ast_cache if ast_cache is not None else _SHARED_AST_CACHE
+
+
 # ---------------------------------------------------------------------------
 # SqlGlotParser
 # ---------------------------------------------------------------------------
 
 
-class SqlGlotParser:
+class SqlGlotParser(_CachedParsing):
     """SQLGlot-backed :class:`SqlParser` implementation."""
 
     def parse_one(
@@ -285,18 +456,11 @@ class SqlGlotParser:
     ) -> ParseResult:
         """Parse a single SQL statement."""
         try:
-            if raise_on_error:
-                ast = sqlglot.parse_one(
-                    sql,
-                    read=_dialect_value(dialect),
-                    error_level=ErrorLevel.RAISE,
-                )
-            else:
-                ast = sqlglot.parse_one(
-                    sql,
-                    read=_dialect_value(dialect),
-                    error_level=ErrorLevel.WARN,
-                )
+            ast = self._ast_cache.parse_one(
+                sql,
+                _dialect_value(dialect),
+                error_level=ErrorLevel.RAISE if raise_on_error else ErrorLevel.WARN,
+            )
         except ParseError as exc:
             if raise_on_error:
                 raise SqlParseError(f"Failed to parse SQL: {exc}") from exc
@@ -321,7 +485,7 @@ class SqlGlotParser:
     ) -> ParseResult:
         """Parse potentially multi-statement SQL."""
         try:
-            asts = sqlglot.parse(sql, read=_dialect_value(dialect))
+            asts = self._ast_cache.parse(sql, _dialect_value(dialect))
         except Exception as exc:
             raise SqlParseError(f"Failed to parse multi-statement SQL: {exc}") from exc
 
@@ -394,7 +558,7 @@ class SqlGlotRenderer:
 # ---------------------------------------------------------------------------
 
 
-class SqlGlotScopeAnalyzer:
+class SqlGlotScopeAnalyzer(_CachedParsing):
     """SQLGlot-backed :class:`SqlScopeAnalyzer` implementation.
 
     Consolidates scope-analysis logic from ``ast_parser.py`` (lines 153-175)
@@ -408,10 +572,11 @@ class SqlGlotScopeAnalyzer:
     ) -> ScopeResult:
         """Extract table references with CTE-aware scope resolution."""
         try:
-            ast = sqlglot.parse_one(
+            ast = self._ast_cache.parse_one(
                 sql,
-                read=_dialect_value(dialect),
+                _dialect_value(dialect),
                 error_level=ErrorLevel.RAISE,
+                copy=False,
             )
         except ParseError as exc:
             raise SqlParseError(f"Failed to parse SQL for table extraction: {exc}") from exc
@@ -453,10 +618,11 @@ class SqlGlotScopeAnalyzer:
     ) -> ColumnExtractionResult:
         """Extract column references and output columns from SQL."""
         try:
-            ast = sqlglot.parse_one(
+            ast = self._ast_cache.parse_one(
                 sql,
-                read=_dialect_value(dialect),
+                _dialect_value(dialect),
                 error_level=ErrorLevel.RAISE,
+                copy=False,
             )
         except ParseError as exc:
             raise SqlParseError(f"Failed to parse SQL for column extraction: {exc}") from exc
@@ -541,7 +707,7 @@ class SqlGlotScopeAnalyzer:
 # ---------------------------------------------------------------------------
 
 
-class SqlGlotTranspiler:
+class SqlGlotTranspiler(_CachedParsing):
     """SQLGlot-backed :class:`SqlTranspiler` implementation."""
 
     def transpile(
@@ -559,12 +725,11 @@ class SqlGlotTranspiler:
         ``local_executor.py`` and ``execution_service.py``.
         """
         try:
-            results = sqlglot.transpile(
-                sql,
-                read=_dialect_value(source_dialect),
-                write=_dialect_value(target_dialect),
-                pretty=pretty,
-            )
+            statements = self._ast_cache.parse(sql, _dialect_value(source_dialect), copy=False)
+            results = [
+                stmt.sql(dialect=_dialect_value(target_dialect), pretty=pretty) if stmt is not None else ""
+                for stmt in statements
+            ]
             if results:
                 return TranspileResult(
                     output_sql=results[0],
@@ -617,7 +782,7 @@ class SqlGlotTranspiler:
 # ---------------------------------------------------------------------------
 
 
-class SqlGlotNormalizer:
+class SqlGlotNormalizer(_CachedParsing):
     """SQLGlot-backed :class:`SqlNormalizer` implementation.
 
     Consolidates normalisation logic from ``normalizer.py`` including CTE
@@ -663,7 +828,7 @@ class SqlGlotNormalizer:
 
         # Rule 2: Parse.
         try:
-            parsed = sqlglot.parse_one(cleaned, read=_dialect_value(dialect))
+            parsed = self._ast_cache.parse_one(cleaned, _dialect_value(dialect))
         except ParseError as exc:
             raise SqlNormalizationError(f"Failed to canonicalize SQL: {cleaned[:200]}") from exc
         applied_rules.append("parse_and_regenerate")
@@ -747,7 +912,7 @@ class SqlGlotNormalizer:
 # ---------------------------------------------------------------------------
 
 
-class SqlGlotDiffer:
+class SqlGlotDiffer(_CachedParsing):
     """SQLGlot-backed :class:`SqlDiffer` implementation.
 
     Consolidates diff logic from ``ast_diff.py`` including the two-phase
@@ -779,8 +944,9 @@ class SqlGlotDiffer:
         # Phase 2: Full AST diff.
         dialect_str = _dialect_value(dialect)
         try:
-            base_ast = sqlglot.parse_one(old_sql, read=dialect_str)
-            target_ast = sqlglot.parse_one(new_sql, read=dialect_str)
+            # sqlglot's diff copies both trees, so the cached ones are safe.
+            base_ast = self._ast_cache.parse_one(old_sql, dialect_str, copy=False)
+            target_ast = self._ast_cache.parse_one(new_sql, dialect_str, copy=False)
         except (SqlglotError, Exception):
             logger.warning("sqlglot parse failed during diff; defaulting to non-identical.")
             return AstDiffResult(
@@ -830,8 +996,8 @@ class SqlGlotDiffer:
         """
         dialect_str = _dialect_value(dialect)
         try:
-            old_ast = sqlglot.parse_one(old_sql, read=dialect_str)
-            new_ast = sqlglot.parse_one(new_sql, read=dialect_str)
+            old_ast = self._ast_cache.parse_one(old_sql, dialect_str, copy=False)
+            new_ast = self._ast_cache.parse_one(new_sql, dialect_str, copy=False)
         except Exception:
             return {}
 
@@ -855,8 +1021,8 @@ class SqlGlotDiffer:
 
         return changes
 
-    @staticmethod
     def _is_cosmetic_only(
+        self,
         old_sql: str,
         new_sql: str,
         dialect: Dialect,
@@ -868,13 +1034,18 @@ class SqlGlotDiffer:
         """
         dialect_str = _dialect_value(dialect)
         try:
-            norm_old = sqlglot.transpile(old_sql, read=dialect_str, write=dialect_str, pretty=False)[0]
-            norm_new = sqlglot.transpile(new_sql, read=dialect_str, write=dialect_str, pretty=False)[0]
+            norm_old = self._render_first(old_sql, dialect_str)
+            norm_new = self._render_first(new_sql, dialect_str)
         except Exception:
             return False
 
         return norm_old == norm_new
 
+    def _render_first(self, sql: str, dialect_str: str) -> str:
+        """Round-trip the first statement of *sql*, like ``sqlglot.transpile(...)[0]``."""
+        first = self._ast_cache.parse(sql, dialect_str, copy=False)[0]
+        return first.sql(dialect=dialect_str, pretty=False) if first is not None else ""
+
     @staticmethod
     def _extract_select_columns(
         ast: exp.Expression,
@@ -972,7 +1143,7 @@ _DROP_KIND_MAP: dict[str, str] = {
 }
 
 
-class SqlGlotSafetyGuard:
+class SqlGlotSafetyGuard(_CachedParsing):
     """SQLGlot-backed :class:`SqlSafetyGuard` implementation.
 
     Consolidates ALL detection logic from ``sql_guard.py`` lines 190-442.
@@ -992,7 +1163,7 @@ class SqlGlotSafetyGuard:
         violations: list[SafetyViolation] = []
 
         try:
-            statements = sqlglot.parse(sql, read=dialect_str)
+            statements = self._ast_cache.parse(sql, dialect_str, copy=False)
         except Exception as exc:
             logger.warning("SQL safety guard could not parse input: %s", exc)
             violations.append(
@@ -1232,7 +1403,7 @@ class SqlGlotSafetyGuard:
 # ---------------------------------------------------------------------------
 
 
-class SqlGlotRewriter:
+class SqlGlotRewriter(_CachedParsing):
     """SQLGlot-backed :class:`SqlRewriter` implementation.
 
     Consolidates rewriting logic from ``sql_rewriter.py``.
@@ -1259,7 +1430,7 @@ class SqlGlotRewriter:
             )
 
         try:
-            parsed = sqlglot.parse(sql, read=dialect_str)
+            parsed = self._ast_cache.parse(sql, dialect_str)
         except ParseError as exc:
             logger.warning(
                 "SQLGlot parse error during rewrite; returning original SQL: %s",
@@ -1391,7 +1562,7 @@ _AGG_EXPRESSION_NAMES: frozenset[str] = frozenset(
 )
 
 
-class SqlGlotLineageAnalyzer:
+class SqlGlotLineageAnalyzer(_CachedParsing):
     """SQLGlot-backed column lineage analyzer.
 
     Uses ``sqlglot.lineage.lineage()`` to trace each output column back
@@ -1424,7 +1595,7 @@ class SqlGlotLineageAnalyzer:
 
         # Parse to extract output column names.
         try:
-            ast = sqlglot.parse_one(sql, read=dialect_str, error_level=ErrorLevel.RAISE)
+            ast = self._ast_cache.parse_one(sql, dialect_str, error_level=ErrorLevel.RAISE, copy=False)
         except (ParseError, SqlglotError) as exc:
             raise SqlLineageError(f"Cannot parse SQL for lineage: {exc}") from exc
 
@@ -1440,7 +1611,7 @@ class SqlGlotLineageAnalyzer:
             try:
                 mapping_schema = MappingSchema(schema, dialect=dialect_str)
                 qualified_ast = sqlglot_qualify(
-                    ast,
+                    ast.copy(),
                     schema=mapping_schema,
                     dialect=dialect_str,
                     validate_qualify_columns=False,
@@ -1507,9 +1678,11 @@ class SqlGlotLineageAnalyzer:
                 mapping_schema = None
 
         try:
+            # Hand lineage a private copy of the cached tree: it qualifies
+            # the expression in place, and re-parsing per column is wasted work.
             lineage_node = sqlglot_lineage(
                 column,
-                sql,
+                self._ast_cache.parse_one(sql, dialect_str),
                 schema=mapping_schema or {},
                 dialect=dialect_str,
             )
@@ -1749,7 +1922,7 @@ class SqlGlotLineageAnalyzer:
 # ---------------------------------------------------------------------------
 
 
-class SqlGlotQualifier:
+class SqlGlotQualifier(_CachedParsing):
     """SQLGlot-backed column qualifier and boolean simplifier.
 
     Uses ``sqlglot.optimizer.qualify`` to resolve ambiguous column
@@ -1768,7 +1941,7 @@ class SqlGlotQualifier:
         warnings: list[str] = []
 
         try:
-            ast = sqlglot.parse_one(sql, read=dialect_str, error_level=ErrorLevel.RAISE)
+            ast = self._ast_cache.parse_one(sql, dialect_str, error_level=ErrorLevel.RAISE)
         except (ParseError, SqlglotError) as exc:
             return QualifyResult(
                 qualified_sql=sql,
@@ -1817,7 +1990,7 @@ class SqlGlotQualifier:
         dialect_str = _dialect_value(dialect)
 
         try:
-            ast = sqlglot.parse_one(sql, read=dialect_str, error_level=ErrorLevel.RAISE)
+            ast = self._ast_cache.parse_one(sql, dialect_str, error_level=ErrorLevel.RAISE)
         except (ParseError, SqlglotError):
             return SimplifyResult(
                 simplified_sql=sql,
@@ -1859,19 +2032,28 @@ class SqlGlotToolkit:
     Instantiates all individual protocol implementations and exposes them
     as properties.  This is the default implementation returned by
     :func:`get_sql_toolkit`.
+
+    Every component parses through one :class:`SqlGlotAstCache` -- the
+    process-wide cache unless *ast_cache* is given -- so SQL parsed by one
+    component is reused by the others.
     """
 
-    def __init__(self) -> None:
-        self._parser = SqlGlotParser()
+    def __init__(self, ast_cache: SqlGlotAstCache | None = None) -> None:
+        self._ast_cache = ast_cache if ast_cache is not None else _SHARED_AST_CACHE
+        self._parser = SqlGlotParser(self._ast_cache)
         self._renderer = SqlGlotRenderer()
-        self._scope_analyzer = SqlGlotScopeAnalyzer()
-        self._transpiler = SqlGlotTranspiler()
-        self._normalizer = SqlGlotNormalizer()
-        self._differ = SqlGlotDiffer()
-        self._safety_guard = SqlGlotSafetyGuard()
-        self._rewriter = SqlGlotRewriter()
-        self._lineage_analyzer = SqlGlotLineageAnalyzer()
-        self._qualifier = SqlGlotQualifier()
+        self._scope_analyzer = SqlGlotScopeAnalyzer(self._ast_cache)
+        self._transpiler = SqlGlotTranspiler(self._ast_cache)
+        self._normalizer = SqlGlotNormalizer(self._ast_cache)
+        self._differ = SqlGlotDiffer(self._ast_cache)
+        self._safety_guard = SqlGlotSafetyGuard(self._ast_cache)
+        self._rewriter = SqlGlotRewriter(self._ast_cache)
+        self._lineage_analyzer = SqlGlotLineageAnalyzer(self._ast_cache)
+        self._qualifier = SqlGlotQualifier(self._ast_cache)
+
+    @property
+    def ast_cache(self) -> SqlGlotAstCache:
+        return self._ast_cache
 
     @property
     def parser(self) -> SqlGlotParser:
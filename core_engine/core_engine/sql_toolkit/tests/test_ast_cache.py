@@ -0,0 +1,178 @@
+"""Tests for the SQLGlot parsed-AST cache.
+
+Unlike :mod:`test_protocols`, these exercise the SQLGlot implementation
+directly: cache keying, copy-on-handout isolation, byte-budget LRU
+eviction, and the hit/miss counters reported to ``ProfileCollector``.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+from sqlglot.errors import ErrorLevel, ParseError
+
+from core_engine.sql_toolkit import Dialect, RewriteRule
+from core_engine.sql_toolkit.impl.sqlglot_impl import SqlGlotAstCache, SqlGlotToolkit, get_ast_cache
+from core_engine.telemetry.profiling import ProfileCollector
+
+_HITS = SqlGlotAstCache.COUNTER_PREFIX + "hits"
+_MISSES = SqlGlotAstCache.COUNTER_PREFIX + "misses"
+_EVICTIONS = SqlGlotAstCache.COUNTER_PREFIX + "evictions"
+
+_SQL = "SELECT o.id, o.amount FROM analytics.orders AS o WHERE o.amount > 10"
+
+
+@pytest.fixture(autouse=True)
+def _reset_collector():
+    ProfileCollector.reset()
+    yield
+    ProfileCollector.reset()
+
+
+@pytest.fixture()
+def cache() -> SqlGlotAstCache:
+    return SqlGlotAstCache()
+
+
+def _counter(name: str) -> int:
+    return ProfileCollector.get_instance().get_counter(name)
+
+
+class TestKeying:
+    def test_repeat_parse_hits(self, cache: SqlGlotAstCache) -> None:
+        cache.parse_one(_SQL, "databricks")
+        cache.parse_one(_SQL, "databricks")
+        assert _counter(_MISSES) == 1
+        assert _counter(_HITS) == 1
+        assert len(cache) == 1
+
+    def test_dialect_is_part_of_key(self, cache: SqlGlotAstCache) -> None:
+        cache.parse_one(_SQL, "databricks")
+        cache.parse_one(_SQL, "duckdb")
+        assert _counter(_MISSES) == 2
+        assert len(cache) == 2
+
+    def test_error_level_is_part_of_key(self, cache: SqlGlotAstCache) -> None:
+        cache.parse_one(_SQL, "databricks")
+        cache.parse_one(_SQL, "databricks", error_level=ErrorLevel.RAISE)
+        assert _counter(_MISSES) == 2
+
+    def test_parse_and_parse_one_share_entries(self, cache: SqlGlotAstCache) -> None:
+        cache.parse(_SQL, "databricks")
+        cache.parse_one(_SQL, "databricks")
+        assert _counter(_HITS) == 1
+
+    def test_parse_errors_are_not_cached(self, cache: SqlGlotAstCache) -> None:
+        for _ in range(2):
+            with pytest.raises(ParseError):
+                cache.parse_one("SELECT FROM (", "databricks", error_level=ErrorLevel.RAISE)
+        assert len(cache) == 0
+        assert _counter(_MISSES) == 2
+
+
+class TestCopyOnHandout:
+    def test_mutating_result_does_not_corrupt_cache(self, cache: SqlGlotAstCache) -> None:
+        first = cache.parse_one(_SQL, "databricks")
+        first.find(type(first)).set("where", None)
+        second = cache.parse_one(_SQL, "databricks")
+        assert "WHERE" in second.sql()
+        assert first is not second
+
+    def test_borrow_returns_shared_tree(self, cache: SqlGlotAstCache) -> None:
+        a = cache.parse_one(_SQL, "databricks", copy=False)
+        b = cache.parse_one(_SQL, "databricks", copy=False)
+        assert a is b
+        assert cache.parse_one(_SQL, "databricks") is not a
+
+    def test_rewriter_leaves_cached_tree_intact(self) -> None:
+        tk = SqlGlotToolkit(ast_cache=SqlGlotAstCache())
+        rule = RewriteRule(source_catalog=None, source_schema="analytics", target_catalog=None, target_schema="sandbox")
+        rewritten = tk.rewriter.rewrite_tables(_SQL, [rule], Dialect.DATABRICKS)
+        assert "sandbox.orders" in rewritten.rewritten_sql
+        tables = tk.scope_analyzer.extract_tables(_SQL, Dialect.DATABRICKS)
+        assert [t.schema for t in tables.referenced_tables] == ["analytics"]
+
+
+class TestEviction:
+    def test_lru_evicts_least_recently_used(self) -> None:
+        probe = SqlGlotAstCache()
+        probe.parse_one("SELECT a FROM t1", "databricks")
+        one_entry = probe.current_bytes
+
+        cache = SqlGlotAstCache(max_bytes=one_entry * 2)
+        cache.parse_one("SELECT a FROM t1", "databricks")
+        cache.parse_one("SELECT a FROM t2", "databricks")
+        cache.parse_one("SELECT a FROM t1", "databricks")  # refresh t1
+        cache.parse_one("SELECT a FROM t3", "databricks")  # evicts t2
+        assert _counter(_EVICTIONS) == 1
+        assert cache.current_bytes <= cache.max_bytes
+
+        ProfileCollector.get_instance().clear()
+        cache.parse_one("SELECT a FROM t1", "databricks")
+        cache.parse_one("SELECT a FROM t2", "databricks")
+        assert _counter(_HITS) == 1
+        assert _counter(_MISSES) == 1
+
+    def test_zero_budget_disables_caching(self) -> None:
+        cache = SqlGlotAstCache(max_bytes=0)
+        cache.parse_one(_SQL, "databricks")
+        cache.parse_one(_SQL, "databricks")
+        assert len(cache) == 0
+        assert _counter(_HITS) == 0
+
+    def test_negative_budget_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            SqlGlotAstCache(max_bytes=-1)
+
+    def test_clear(self, cache: SqlGlotAstCache) -> None:
+        cache.parse_one(_SQL, "databricks")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.current_bytes == 0
+
+
+class TestToolkitSharing:
+    def test_default_toolkit_uses_process_wide_cache(self) -> None:
+        assert SqlGlotToolkit().ast_cache is get_ast_cache()
+
+    def test_components_share_one_parse(self) -> None:
+        tk = SqlGlotToolkit(ast_cache=SqlGlotAstCache())
+        tk.scope_analyzer.extract_tables(_SQL, Dialect.DATABRICKS)
+        tk.scope_analyzer.extract_columns(_SQL, Dialect.DATABRICKS)
+        tk.safety_guard.check(_SQL, Dialect.DATABRICKS)
+        tk.transpiler.transpile(_SQL, Dialect.DATABRICKS, Dialect.DUCKDB)
+        # extract_* parse with ErrorLevel.RAISE; the guard and transpiler
+        # use the default level, so two distinct entries are expected.
+        assert _counter(_MISSES) == 2
+        assert _counter(_HITS) == 2
+
+    def test_lineage_parses_once_for_all_columns(self) -> None:
+        tk = SqlGlotToolkit(ast_cache=SqlGlotAstCache())
+        result = tk.lineage_analyzer.trace_column_lineage("SELECT a, b, c FROM t", Dialect.DATABRICKS)
+        assert set(result.column_lineage) == {"a", "b", "c"}
+        assert _counter(_MISSES) == 2  # RAISE-level parse + default-level parse
+        assert _counter(_HITS) == 2
+
+    def test_concurrent_access(self) -> None:
+        cache = SqlGlotAstCache()
+        errors: list[Exception] = []
+        queries = ["SELECT a FROM t0", "SELECT a FROM t1", "SELECT a FROM t2", "SELECT a FROM t3", "SELECT a FROM t4"]
+
+        def worker() -> None:
+            try:
+                for i in range(50):
+                    tree = cache.parse_one(queries[i % len(queries)], "databricks")
+                    tree.set("expressions", [])
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert cache.parse_one("SELECT a FROM t0", "databricks").sql() == "SELECT a FROM t0"
+        assert _counter(_HITS) + _counter(_MISSES) == 8 * 50 + 1
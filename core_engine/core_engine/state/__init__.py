@@ -5,6 +5,7 @@ from core_engine.state.repository import (
     AuditRepository,
     CredentialRepository,
     EnvironmentRepository,
+    LineageRepository,
     LockRepository,
     ModelRepository,
     PlanRepository,
@@ -19,6 +20,7 @@ __all__ = [
     "AuditRepository",
     "CredentialRepository",
     "EnvironmentRepository",
+    "LineageRepository",
     "LockRepository",
     "ModelRepository",
     "PlanRepository",
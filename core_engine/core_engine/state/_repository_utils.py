@@ -48,6 +48,41 @@ async def _dialect_upsert(
     return await session.execute(stmt)
 
 
+async def _dialect_upsert_many(
+    session: AsyncSession,
+    table: Any,
+    rows: list[dict[str, Any]],
+    index_elements: list[str],
+    update_columns: list[str],
+) -> Any:
+    """Multi-row variant of :func:`_dialect_upsert` issued as one statement.
+
+    Both PostgreSQL and SQLite accept ``excluded.<col>`` in the conflict
+    clause, so each row's own values are applied on conflict.  Callers must
+    not pass two rows with the same conflict key -- PostgreSQL rejects a
+    statement that would update the same row twice.
+    """
+    if not rows:
+        return None
+    bind = session.get_bind()
+    dialect_name = getattr(getattr(bind, "dialect", None), "name", "")
+
+    stmt: Any
+    if "postgresql" in str(dialect_name):
+        from sqlalchemy.dialects.postgresql import insert as _pg_insert
+
+        stmt = _pg_insert(table).values(rows)
+    else:
+        from sqlalchemy.dialects.sqlite import insert as _sqlite_insert
+
+        stmt = _sqlite_insert(table).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={col: getattr(stmt.excluded, col) for col in update_columns},
+    )
+    return await session.execute(stmt)
+
+
 async def _dialect_upsert_nothing(
     session: AsyncSession,
     table: Any,
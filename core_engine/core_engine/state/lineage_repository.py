@@ -0,0 +1,286 @@
+"""LineageRepository — persisted model dependency edges and lineage queries.
+
+Each recorded snapshot stores the *direct* ``upstream -> downstream`` edges
+of the model graph.  Transitive lineage is resolved inside the database by
+a recursive CTE (``WITH RECURSIVE``), which PostgreSQL and SQLite both
+support, so neither the edge list nor the model registry is ever loaded
+into the API process.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import and_, case, delete, func, insert, literal_column, or_, select, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core_engine.state._repository_utils import _dialect_upsert_nothing
+from core_engine.state.tables import LineageSnapshotTable, ModelDependencyTable
+
+# Older snapshots beyond this many per tenant are pruned on each write.
+_MAX_LINEAGE_SNAPSHOTS = 10
+
+_MAX_LINEAGE_PAGE_SIZE = 1000
+
+
+class LineageRepository:
+    """Read and write the ``lineage_snapshots`` / ``model_dependencies`` tables."""
+
+    def __init__(self, session: AsyncSession, tenant_id: str = "default") -> None:
+        self._session = session
+        self._tenant_id = tenant_id
+
+    async def record_edges(self, snapshot_id: str, edges: Iterable[tuple[str, str]]) -> int:
+        """Store the direct dependency edges of *snapshot_id* and make it current.
+
+        Snapshot IDs identify immutable model graphs (a git commit or a
+        content-addressed snapshot), so re-recording a known snapshot only
+        marks it current again instead of rewriting its edges.
+
+        Parameters
+        ----------
+        snapshot_id:
+            Identifier of the graph, e.g. a plan's target commit SHA.
+        edges:
+            ``(upstream_model, downstream_model)`` pairs.  Duplicates and
+            self-edges are dropped.
+
+        Returns
+        -------
+        int
+            Number of edges stored for the snapshot.
+        """
+        now = datetime.now(UTC)
+        unique_edges = sorted({(up, down) for up, down in edges if up != down})
+
+        # Insert-or-skip on the (tenant_id, snapshot_id) key, so two plans
+        # recording the same snapshot at once cannot both try to insert it.
+        created = await _dialect_upsert_nothing(
+            self._session,
+            LineageSnapshotTable,
+            values={
+                "tenant_id": self._tenant_id,
+                "snapshot_id": snapshot_id,
+                "edge_count": len(unique_edges),
+                "recorded_at": now,
+            },
+            index_elements=["tenant_id", "snapshot_id"],
+        )
+        if not (created.rowcount or 0) > 0:  # type: ignore[attr-defined]
+            existing = await self._session.execute(
+                update(LineageSnapshotTable)
+                .where(
+                    LineageSnapshotTable.tenant_id == self._tenant_id,
+                    LineageSnapshotTable.snapshot_id == snapshot_id,
+                )
+                .values(recorded_at=now)
+                .returning(LineageSnapshotTable.edge_count)
+            )
+            await self._session.flush()
+            return int(existing.scalar_one())
+
+        if unique_edges:
+            await self._session.execute(
+                insert(ModelDependencyTable),
+                [
+                    {
+                        "tenant_id": self._tenant_id,
+                        "snapshot_id": snapshot_id,
+                        "upstream_model": up,
+                        "downstream_model": down,
+                    }
+                    for up, down in unique_edges
+                ],
+            )
+        await self._prune()
+        await self._session.flush()
+        return len(unique_edges)
+
+    async def current_snapshot_id(self) -> str | None:
+        """Return the most recently recorded snapshot ID, if any."""
+        result = await self._session.execute(self._current_snapshot_stmt())
+        return result.scalar_one_or_none()
+
+    async def get_lineage(
+        self,
+        model_name: str,
+        *,
+        snapshot_id: str | None = None,
+        max_depth: int = 100,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        """Return a page of the upstream and downstream lineage of *model_name*.
+
+        Both directions are walked by recursive CTEs in a single statement.
+        A model's ``depth`` is its shortest distance from *model_name*
+        (direct parents and children are depth 1).  Nodes are ordered by
+        depth, then name, and each direction is paginated independently.
+
+        Parameters
+        ----------
+        model_name:
+            The model whose lineage to resolve.
+        snapshot_id:
+            Snapshot to read.  Defaults to the tenant's current snapshot.
+        max_depth:
+            Deepest level to return.  Lineage continuing past it sets
+            ``is_truncated``.
+        limit:
+            Page size per direction (capped at ``_MAX_LINEAGE_PAGE_SIZE``).
+        offset:
+            Nodes to skip per direction.
+
+        Returns
+        -------
+        dict[str, Any]
+            ``upstream`` and ``downstream`` (lists of ``{"model_name",
+            "depth"}``), ``upstream_total`` / ``downstream_total`` (node
+            counts within ``max_depth``), ``upstream_depth`` /
+            ``downstream_depth`` (deepest level reached) and
+            ``is_truncated``.
+        """
+        max_depth = max(1, max_depth)
+        limit = max(1, min(limit, _MAX_LINEAGE_PAGE_SIZE))
+        offset = max(offset, 0)
+        snapshot: Any = snapshot_id if snapshot_id is not None else self._current_snapshot_stmt().scalar_subquery()
+
+        per_direction = []
+        for direction in ("upstream", "downstream"):
+            walk = self._walk_cte(direction, model_name, snapshot, max_depth)
+            per_direction.append(
+                select(
+                    literal_column(f"'{direction}'").label("direction"),
+                    walk.c.model_name,
+                    func.min(walk.c.depth).label("depth"),
+                )
+                .where(walk.c.model_name != model_name)
+                .group_by(walk.c.model_name)
+            )
+        nodes = union_all(*per_direction).subquery("lineage_nodes")
+
+        direction_col = nodes.c.direction
+        ranked = select(
+            nodes.c.direction,
+            nodes.c.model_name,
+            nodes.c.depth,
+            func.row_number()
+            .over(partition_by=direction_col, order_by=(nodes.c.depth, nodes.c.model_name))
+            .label("position"),
+            func.sum(case((nodes.c.depth <= max_depth, 1), else_=0)).over(partition_by=direction_col).label("total"),
+            func.max(nodes.c.depth).over(partition_by=direction_col).label("deepest"),
+        ).subquery("lineage_ranked")
+
+        # The first row of each direction is always returned so the totals
+        # survive an offset past the end of the list.
+        stmt = (
+            select(ranked)
+            .where(
+                or_(
+                    ranked.c.position == 1,
+                    and_(
+                        ranked.c.position > offset,
+                        ranked.c.position <= offset + limit,
+                        ranked.c.depth <= max_depth,
+                    ),
+                )
+            )
+            .order_by(ranked.c.direction, ranked.c.position)
+        )
+        result = await self._session.execute(stmt)
+
+        lineage: dict[str, Any] = {
+            "upstream": [],
+            "downstream": [],
+            "upstream_total": 0,
+            "downstream_total": 0,
+            "upstream_depth": 0,
+            "downstream_depth": 0,
+            "is_truncated": False,
+        }
+        for row in result.all():
+            direction = row.direction
+            lineage[f"{direction}_total"] = int(row.total)
+            lineage[f"{direction}_depth"] = min(int(row.deepest), max_depth)
+            if row.deepest > max_depth:
+                lineage["is_truncated"] = True
+            if offset < row.position <= offset + limit and row.depth <= max_depth:
+                lineage[direction].append({"model_name": row.model_name, "depth": int(row.depth)})
+        return lineage
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _current_snapshot_stmt(self) -> Any:
+        return (
+            select(LineageSnapshotTable.snapshot_id)
+            .where(LineageSnapshotTable.tenant_id == self._tenant_id)
+            .order_by(LineageSnapshotTable.recorded_at.desc(), LineageSnapshotTable.snapshot_id.desc())
+            .limit(1)
+        )
+
+    def _walk_cte(self, direction: str, model_name: str, snapshot: Any, max_depth: int) -> Any:
+        """Recursive CTE of ``(model_name, depth)`` reachable from *model_name*.
+
+        The walk goes one level past *max_depth* so callers can tell
+        whether lineage was cut off.  ``UNION`` (not ``UNION ALL``) keeps
+        one row per node and depth, which bounds the work on diamond-heavy
+        graphs and guarantees termination even if the stored graph has a
+        cycle.
+        """
+        edges = ModelDependencyTable.__table__
+        if direction == "upstream":
+            src, dst = "downstream_model", "upstream_model"
+        else:
+            src, dst = "upstream_model", "downstream_model"
+
+        seed = select(edges.c[dst].label("model_name"), literal_column("1").label("depth")).where(
+            edges.c.tenant_id == self._tenant_id,
+            edges.c.snapshot_id == snapshot,
+            edges.c[src] == model_name,
+        )
+        walk = seed.cte(f"{direction}_walk", recursive=True)
+        step = edges.alias(f"{direction}_step")
+        return walk.union(
+            select(step.c[dst], walk.c.depth + 1).where(
+                step.c.tenant_id == self._tenant_id,
+                step.c.snapshot_id == snapshot,
+                step.c[src] == walk.c.model_name,
+                walk.c.depth <= max_depth,
+            )
+        )
+
+    async def _prune(self) -> None:
+        """Drop all but the newest ``_MAX_LINEAGE_SNAPSHOTS`` snapshots."""
+        keep = (
+            select(LineageSnapshotTable.snapshot_id)
+            .where(LineageSnapshotTable.tenant_id == self._tenant_id)
+            .order_by(LineageSnapshotTable.recorded_at.desc(), LineageSnapshotTable.snapshot_id.desc())
+            .limit(_MAX_LINEAGE_SNAPSHOTS)
+        )
+        stale_result = await self._session.execute(
+            select(LineageSnapshotTable.snapshot_id).where(
+                LineageSnapshotTable.tenant_id == self._tenant_id,
+                LineageSnapshotTable.snapshot_id.not_in(keep),
+            )
+        )
+        stale = list(stale_result.scalars().all())
+        if not stale:
+            return
+        # Edges are deleted explicitly: SQLite only honours the cascade
+        # when foreign keys are enabled on the connection.
+        await self._session.execute(
+            delete(ModelDependencyTable).where(
+                ModelDependencyTable.tenant_id == self._tenant_id,
+                ModelDependencyTable.snapshot_id.in_(stale),
+            )
+        )
+        await self._session.execute(
+            delete(LineageSnapshotTable).where(
+                LineageSnapshotTable.tenant_id == self._tenant_id,
+                LineageSnapshotTable.snapshot_id.in_(stale),
+            )
+        )
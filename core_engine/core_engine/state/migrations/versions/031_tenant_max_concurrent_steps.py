@@ -0,0 +1,36 @@
+"""Add max_concurrent_steps column to tenant_config.
+
+Caps how many plan steps the execution engine runs concurrently for a
+tenant.  ``NULL`` means the deployment-wide default
+(``API_EXECUTION_MAX_CONCURRENCY``) applies; an explicit value overrides
+it for tenants whose warehouses need a tighter or looser limit.
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-10-16 00:00:00.000000+00:00
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "031"
+down_revision: str | None = "030"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tenant_config",
+        sa.Column("max_concurrent_steps", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("tenant_config", "max_concurrent_steps")
@@ -0,0 +1,45 @@
+"""Add completed-chunk bitmap and concurrency to backfill_checkpoints.
+
+Chunked backfills can now run several non-overlapping chunks at once, so
+chunks may finish out of order.  ``completed_chunk_bitmap`` records which
+chunk indices have succeeded (hex-encoded, bit *i* = chunk *i*) so resume
+skips exactly those chunks; ``completed_through`` keeps meaning "every
+date up to here is done".  ``max_concurrent_chunks`` remembers the
+requested concurrency so a resume runs the same way.  Both are nullable:
+rows written before this revision resume from ``completed_through``
+sequentially, as before.
+
+Revision ID: 032
+Revises: 031
+Create Date: 2026-10-16 00:00:00.000000+00:00
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "032"
+down_revision: str | None = "031"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "backfill_checkpoints",
+        sa.Column("completed_chunk_bitmap", sa.Text(), nullable=True),
+    )
+    op.add_column(
+        "backfill_checkpoints",
+        sa.Column("max_concurrent_chunks", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("backfill_checkpoints", "max_concurrent_chunks")
+    op.drop_column("backfill_checkpoints", "completed_chunk_bitmap")
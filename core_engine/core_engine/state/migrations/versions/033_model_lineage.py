@@ -0,0 +1,91 @@
+"""Add lineage_snapshots and model_dependencies tables.
+
+Model lineage used to be rebuilt in the API from the ``models`` table,
+which holds no dependency information.  Plans (and snapshots) now persist
+the direct ``upstream -> downstream`` edges of the model graph, one set
+per snapshot, so lineage is answered by a recursive CTE over
+``model_dependencies``.  ``lineage_snapshots`` records each stored graph;
+the most recent one per tenant is the current lineage.
+
+Revision ID: 033
+Revises: 032
+Create Date: 2026-10-16 00:00:00.000000+00:00
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "033"
+down_revision: str | None = "032"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLES = ("lineage_snapshots", "model_dependencies")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "lineage_snapshots",
+        sa.Column("tenant_id", sa.String(64), nullable=False, server_default="default"),
+        sa.Column("snapshot_id", sa.String(64), nullable=False),
+        sa.Column("edge_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "recorded_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("tenant_id", "snapshot_id"),
+    )
+    op.create_index(
+        "ix_lineage_snapshots_tenant_recorded",
+        "lineage_snapshots",
+        ["tenant_id", "recorded_at"],
+    )
+
+    op.create_table(
+        "model_dependencies",
+        sa.Column("tenant_id", sa.String(64), nullable=False, server_default="default"),
+        sa.Column("snapshot_id", sa.String(64), nullable=False),
+        sa.Column("upstream_model", sa.String(512), nullable=False),
+        sa.Column("downstream_model", sa.String(512), nullable=False),
+        sa.PrimaryKeyConstraint("tenant_id", "snapshot_id", "upstream_model", "downstream_model"),
+        sa.ForeignKeyConstraint(
+            ["tenant_id", "snapshot_id"],
+            ["lineage_snapshots.tenant_id", "lineage_snapshots.snapshot_id"],
+            name="fk_model_dependencies_snapshot",
+            ondelete="CASCADE",
+        ),
+    )
+    op.create_index(
+        "ix_model_dependencies_downstream",
+        "model_dependencies",
+        ["tenant_id", "snapshot_id", "downstream_model"],
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ENABLE ROW LEVEL SECURITY")
+        op.execute(
+            f"CREATE POLICY tenant_isolation_{table} ON {table} "
+            "USING (tenant_id = current_setting('app.tenant_id', true))"
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        for table in _TABLES:
+            op.execute(f"DROP POLICY IF EXISTS tenant_isolation_{table} ON {table}")
+    op.drop_index("ix_model_dependencies_downstream", table_name="model_dependencies")
+    op.drop_table("model_dependencies")
+    op.drop_index("ix_lineage_snapshots_tenant_recorded", table_name="lineage_snapshots")
+    op.drop_table("lineage_snapshots")
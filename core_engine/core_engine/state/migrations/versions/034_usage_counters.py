@@ -0,0 +1,67 @@
+"""Add usage_counters table for O(1) quota enforcement.
+
+Quota checks used to ``SUM(quantity)`` over every ``usage_events`` row of
+the current month, so they got slower as the month went on.  The metering
+sink now maintains one counter row per ``(tenant_id, event_type, month)``
+alongside the events it writes, and quota reservations are a single
+conditional ``UPDATE ... RETURNING`` on that row.  Existing events are
+folded into counters here.
+
+Revision ID: 034
+Revises: 033
+Create Date: 2026-10-16 00:00:00.000000+00:00
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "034"
+down_revision: str | None = "033"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "usage_counters",
+        sa.Column("tenant_id", sa.String(64), nullable=False),
+        sa.Column("event_type", sa.String(64), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("used", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("reserved", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("tenant_id", "event_type", "period_start"),
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "INSERT INTO usage_counters (tenant_id, event_type, period_start, used) "
+        "SELECT tenant_id, event_type, date_trunc('month', created_at AT TIME ZONE 'UTC')::date, "
+        "SUM(quantity) FROM usage_events GROUP BY 1, 2, 3"
+    )
+    op.execute("ALTER TABLE usage_counters ENABLE ROW LEVEL SECURITY")
+    op.execute(
+        "CREATE POLICY tenant_isolation_usage_counters ON usage_counters "
+        "USING (tenant_id = current_setting('app.tenant_id', true))"
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("DROP POLICY IF EXISTS tenant_isolation_usage_counters ON usage_counters")
+    op.drop_table("usage_counters")
@@ -13,18 +13,22 @@ import hashlib
 import json
 import logging
 import uuid
+from collections.abc import AsyncIterator
 from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import and_, delete, func, select, text, update
+from sqlalchemy import and_, case, delete, func, select, text, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core_engine.crypto import check_password, hash_password
 from core_engine.state._repository_utils import (
     _dialect_upsert,
+    _dialect_upsert_many,
     _dialect_upsert_nothing,
     _escape_like,
 )
+from core_engine.state.lineage_repository import LineageRepository as LineageRepository
 from core_engine.state.plan_repository import PlanRepository as PlanRepository  # noqa: F401
 from core_engine.state.run_repository import RunRepository as RunRepository  # noqa: F401
 from core_engine.state.tables import (
@@ -54,6 +58,7 @@ from core_engine.state.tables import (
     TenantConfigTable,
     TestResultTable,
     TokenRevocationTable,
+    UsageCounterTable,
     UsageEventTable,
     UserTable,
     WatermarkTable,
@@ -232,6 +237,7 @@ class SnapshotRepository:
         self,
         environment: str,
         model_versions: dict[str, str],
+        dependency_edges: list[tuple[str, str]] | None = None,
     ) -> SnapshotTable:
         """Persist a new snapshot mapping model names to version IDs.
 
@@ -241,6 +247,10 @@ class SnapshotRepository:
             Target environment name (e.g. ``"production"``).
         model_versions:
             Mapping of ``{model_name: version_id}``.
+        dependency_edges:
+            Optional ``(upstream_model, downstream_model)`` edges of the
+            snapshot's model graph.  When given they are recorded as the
+            tenant's current lineage (see :class:`LineageRepository`).
         """
         import hashlib
 
@@ -261,6 +271,10 @@ class SnapshotRepository:
         )
         self._session.add(row)
         await self._session.flush()
+        if dependency_edges is not None:
+            await LineageRepository(self._session, tenant_id=self._tenant_id).record_edges(
+                snapshot_id, dependency_edges
+            )
         return row
 
     async def get_latest(self, environment: str) -> SnapshotTable | None:
@@ -348,6 +362,37 @@ class WatermarkRepository:
         )
         await self._session.flush()
 
+    async def update_watermarks_batch(
+        self,
+        entries: list[tuple[str, date, date, int | None]],
+    ) -> None:
+        """Upsert several ``(model_name, partition_start, partition_end, row_count)`` watermarks at once.
+
+        Issues a single multi-row upsert.  Duplicate partition keys within
+        *entries* collapse to the last occurrence.
+        """
+        if not entries:
+            return
+        now = datetime.now(UTC)
+        rows: dict[tuple[str, date, date], dict[str, Any]] = {}
+        for model_name, partition_start, partition_end, row_count in entries:
+            rows[(model_name, partition_start, partition_end)] = {
+                "tenant_id": self._tenant_id,
+                "model_name": model_name,
+                "partition_start": partition_start,
+                "partition_end": partition_end,
+                "row_count": row_count,
+                "last_updated": now,
+            }
+        await _dialect_upsert_many(
+            self._session,
+            WatermarkTable,
+            rows=list(rows.values()),
+            index_elements=["tenant_id", "model_name", "partition_start", "partition_end"],
+            update_columns=["row_count", "last_updated"],
+        )
+        await self._session.flush()
+
     async def get_all_for_model(self, model_name: str) -> list[WatermarkTable]:
         """Return all watermark records for *model_name*, ordered by partition start."""
         stmt = (
@@ -626,6 +671,31 @@ class TelemetryRepository:
         await self._session.flush()
         return row
 
+    async def record_batch(self, telemetry: list[dict[str, Any]]) -> list[TelemetryTable]:
+        """Persist several telemetry records with a single flush.
+
+        Each dictionary uses the same keys as :meth:`record`.
+        """
+        rows = [
+            TelemetryTable(
+                tenant_id=self._tenant_id,
+                run_id=entry["run_id"],
+                model_name=entry["model_name"],
+                runtime_seconds=entry["runtime_seconds"],
+                shuffle_bytes=entry["shuffle_bytes"],
+                input_rows=entry["input_rows"],
+                output_rows=entry["output_rows"],
+                partition_count=entry["partition_count"],
+                cluster_id=entry.get("cluster_id"),
+            )
+            for entry in telemetry
+        ]
+        if not rows:
+            return rows
+        self._session.add_all(rows)
+        await self._session.flush()
+        return rows
+
     async def get_for_run(self, run_id: str) -> list[TelemetryTable]:
         """Return all telemetry entries for a given run."""
         stmt = (
@@ -1716,6 +1786,7 @@ class BackfillCheckpointRepository:
         total_chunks: int,
         cluster_size: str | None = None,
         plan_id: str | None = None,
+        max_concurrent_chunks: int = 1,
     ) -> BackfillCheckpointTable:
         """Create a new backfill checkpoint record."""
         row = BackfillCheckpointTable(
@@ -1728,6 +1799,8 @@ class BackfillCheckpointRepository:
             status="RUNNING",
             total_chunks=total_chunks,
             completed_chunks=0,
+            completed_chunk_bitmap="0",
+            max_concurrent_chunks=max_concurrent_chunks,
             cluster_size=cluster_size,
             plan_id=plan_id,
         )
@@ -1747,21 +1820,30 @@ class BackfillCheckpointRepository:
     async def update_progress(
         self,
         backfill_id: str,
-        completed_through: date,
+        completed_through: date | None,
         completed_chunks: int,
+        completed_chunk_bitmap: str | None = None,
     ) -> None:
-        """Advance the checkpoint after a successful chunk execution."""
+        """Advance the checkpoint after a successful chunk execution.
+
+        *completed_through* is the end of the contiguous run of completed
+        chunks; *completed_chunk_bitmap* (when given) records every
+        completed chunk, including those that finished out of order.
+        """
+        values: dict[str, Any] = {
+            "completed_through": completed_through,
+            "completed_chunks": completed_chunks,
+            "updated_at": datetime.now(UTC),
+        }
+        if completed_chunk_bitmap is not None:
+            values["completed_chunk_bitmap"] = completed_chunk_bitmap
         stmt = (
             update(BackfillCheckpointTable)
             .where(
                 BackfillCheckpointTable.tenant_id == self._tenant_id,
                 BackfillCheckpointTable.backfill_id == backfill_id,
             )
-            .values(
-                completed_through=completed_through,
-                completed_chunks=completed_chunks,
-                updated_at=datetime.now(UTC),
-            )
+            .values(**values)
         )
         await self._session.execute(stmt)
         await self._session.flush()
@@ -2717,27 +2799,14 @@ class UserRepository:
     """CRUD operations for the ``users`` table.
 
     Handles user creation, lookup, password verification, and profile
-    updates.  Password hashing uses bcrypt via passlib.
+    updates.  Password hashing uses bcrypt on the dedicated crypto thread
+    pool (:mod:`core_engine.crypto`) so it never blocks the event loop.
     """
 
     def __init__(self, session: AsyncSession, tenant_id: str = "default") -> None:
         self._session = session
         self._tenant_id = tenant_id
 
-    @staticmethod
-    def _hash_password(plaintext: str) -> str:
-        """Hash a plaintext password with bcrypt."""
-        import bcrypt
-
-        return bcrypt.hashpw(plaintext.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
-
-    @staticmethod
-    def _verify_password(plaintext: str, hashed: str) -> bool:
-        """Verify a plaintext password against a bcrypt hash."""
-        import bcrypt
-
-        return bcrypt.checkpw(plaintext.encode("utf-8"), hashed.encode("utf-8"))
-
     async def create(
         self,
         email: str,
@@ -2751,7 +2820,7 @@ class UserRepository:
             id=uuid.uuid4().hex,
             tenant_id=self._tenant_id,
             email=email.lower().strip(),
-            password_hash=self._hash_password(password),
+            password_hash=await hash_password(password),
             display_name=display_name.strip(),
             role=role,
             is_active=True,
@@ -2801,9 +2870,9 @@ class UserRepository:
         if user is None:
             # Prevent timing-based user enumeration by still performing
             # a bcrypt hash comparison against a dummy value.
-            self._hash_password("dummy-password-for-timing")
+            await hash_password("dummy-password-for-timing")
             return None
-        if not self._verify_password(password, user.password_hash):
+        if not await check_password(password, user.password_hash):
             return None
         return user
 
@@ -2906,11 +2975,13 @@ class APIKeyRepository:
         await self._session.flush()
         return row, plaintext
 
-    async def validate_key(self, plaintext_key: str) -> APIKeyTable | None:
+    async def validate_key(self, plaintext_key: str, *, touch: bool = True) -> APIKeyTable | None:
         """Look up an API key by its SHA-256 hash and validate it.
 
         Returns the API key row if valid, or ``None`` if not found, revoked,
-        or expired.  Updates ``last_used_at`` on successful validation.
+        or expired.  Updates ``last_used_at`` on successful validation
+        unless *touch* is ``False`` -- callers that batch those writes pass
+        ``touch=False`` and later call :meth:`record_last_used`.
 
         All validation criteria are enforced in SQL to guarantee tenant
         isolation and prevent timing-based information leaks:
@@ -2929,14 +3000,46 @@ class APIKeyRepository:
         result = await self._session.execute(stmt)
         row = result.scalar_one_or_none()
 
-        if row is None:
-            return None
+        if row is None or not touch:
+            return row
 
         # Update last_used_at
         row.last_used_at = datetime.now(UTC)
         await self._session.flush()
         return row
 
+    async def record_last_used(self, last_used: dict[str, datetime]) -> int:
+        """Set ``last_used_at`` for many keys in one ``UPDATE``.
+
+        Parameters
+        ----------
+        last_used:
+            ``key_id -> timestamp``.  A key's ``last_used_at`` is never
+            moved backwards, so a delayed batch cannot overwrite a newer
+            value written by another replica.
+
+        Returns
+        -------
+        int
+            Number of rows updated.
+        """
+        if not last_used:
+            return 0
+        new_value = case(last_used, value=APIKeyTable.id)
+        stmt = (
+            update(APIKeyTable)
+            .where(
+                APIKeyTable.tenant_id == self._tenant_id,
+                APIKeyTable.id.in_(list(last_used)),
+                APIKeyTable.last_used_at.is_(None) | (APIKeyTable.last_used_at < new_value),
+            )
+            .values(last_used_at=new_value)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        await self._session.flush()
+        return result.rowcount  # type: ignore[attr-defined,no-any-return]
+
     async def list_by_user(self, user_id: str) -> list[APIKeyTable]:
         """Return all non-revoked API keys for a user in this tenant."""
         stmt = (
@@ -3326,11 +3429,28 @@ class AnalyticsRepository:
 # ---------------------------------------------------------------------------
 
 
+# Idle time after which a counter's reservations are treated as abandoned.
+_RESERVATION_TTL = timedelta(hours=1)
+
+# Advisory lock key for usage counter reconciliation.  Derived with
+# hashlib rather than hash() so every replica computes the same key.
+_RECONCILE_LOCK_ID = int.from_bytes(hashlib.sha256(b"usage_counter_reconcile").digest()[:4], "big") & 0x7FFFFFFF
+
+
+def _month_start(moment: datetime | None = None) -> date:
+    """Return the first day of the UTC calendar month containing *moment*."""
+    moment = moment or datetime.now(UTC)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(UTC)
+    return date(moment.year, moment.month, 1)
+
+
 class QuotaRepository:
     """Queries for quota enforcement and usage display.
 
-    Reads from ``usage_events`` to determine current-month usage counts
-    for comparison against per-tenant or tier-default quotas.
+    Reads the current month's row of ``usage_counters`` per event type
+    rather than scanning ``usage_events``, so every check is a primary-key
+    lookup regardless of how far into the month it is.
     """
 
     def __init__(self, session: AsyncSession, tenant_id: str = "default") -> None:
@@ -3338,19 +3458,18 @@ class QuotaRepository:
         self._tenant_id = tenant_id
 
     async def get_monthly_event_count(self, event_type: str) -> int:
-        """Count usage events of *event_type* in the current calendar month.
+        """Return usage of *event_type* in the current calendar month.
 
-        Returns 0 if no matching events exist.
+        Includes quota slots reserved by in-flight operations whose usage
+        events have not been written yet.  Returns 0 if there is no usage.
         """
-        now = datetime.now(UTC)
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        stmt = select(func.coalesce(func.sum(UsageEventTable.quantity), 0)).where(
-            UsageEventTable.tenant_id == self._tenant_id,
-            UsageEventTable.event_type == event_type,
-            UsageEventTable.created_at >= month_start,
+        stmt = select(UsageCounterTable.used + UsageCounterTable.reserved).where(
+            UsageCounterTable.tenant_id == self._tenant_id,
+            UsageCounterTable.event_type == event_type,
+            UsageCounterTable.period_start == _month_start(),
         )
         result = await self._session.execute(stmt)
-        return int(result.scalar_one() or 0)
+        return int(result.scalar_one_or_none() or 0)
 
     async def get_current_usage(self) -> dict[str, int]:
         """Return current-month usage counts for all tracked event types.
@@ -3360,25 +3479,284 @@ class QuotaRepository:
         dict
             ``{"plan_run": int, "ai_call": int, "api_request": int, ...}``
         """
-        now = datetime.now(UTC)
-        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        stmt = select(UsageCounterTable.event_type, UsageCounterTable.used).where(
+            UsageCounterTable.tenant_id == self._tenant_id,
+            UsageCounterTable.period_start == _month_start(),
+        )
+        result = await self._session.execute(stmt)
+        return {row.event_type: int(row.used) for row in result.all()}
+
+    async def reserve(self, event_type: str, limit: int, quantity: int = 1) -> tuple[bool, int]:
+        """Atomically reserve *quantity* units of *event_type* under *limit*.
+
+        The reservation is one conditional ``UPDATE ... RETURNING`` on the
+        tenant's counter row, so concurrent callers cannot both take the
+        last slot.  The reservation is released when the usage event that
+        carries it is recorded through :meth:`UsageCounterRepository.add_usage`,
+        or by :meth:`release` if the operation fails.
+
+        Returns
+        -------
+        tuple[bool, int]
+            ``(reserved, current)`` where *current* is the month's usage
+            including reservations -- after this one if it succeeded.
+        """
+        period = _month_start()
         stmt = (
+            update(UsageCounterTable)
+            .where(
+                UsageCounterTable.tenant_id == self._tenant_id,
+                UsageCounterTable.event_type == event_type,
+                UsageCounterTable.period_start == period,
+                UsageCounterTable.used + UsageCounterTable.reserved + quantity <= limit,
+            )
+            .values(reserved=UsageCounterTable.reserved + quantity, updated_at=datetime.now(UTC))
+            .returning(UsageCounterTable.used + UsageCounterTable.reserved)
+        )
+        total = (await self._session.execute(stmt)).scalar_one_or_none()
+        if total is None:
+            # Either the quota is exhausted or this is the month's first
+            # reservation; create the row and retry only in the latter case.
+            created = await _dialect_upsert_nothing(
+                self._session,
+                UsageCounterTable,
+                values={
+                    "tenant_id": self._tenant_id,
+                    "event_type": event_type,
+                    "period_start": period,
+                    "used": 0,
+                    "reserved": 0,
+                    "updated_at": datetime.now(UTC),
+                },
+                index_elements=["tenant_id", "event_type", "period_start"],
+            )
+            if created.rowcount:
+                total = (await self._session.execute(stmt)).scalar_one_or_none()
+        if total is None:
+            return False, await self.get_monthly_event_count(event_type)
+        return True, int(total)
+
+    async def release(self, event_type: str, quantity: int = 1) -> None:
+        """Return *quantity* reserved units of *event_type* to the quota.
+
+        Called when an operation that reserved a slot through
+        :meth:`reserve` fails before recording usage.  Never drops the
+        counter's reservations below zero.
+        """
+        await self._session.execute(
+            update(UsageCounterTable)
+            .where(
+                UsageCounterTable.tenant_id == self._tenant_id,
+                UsageCounterTable.event_type == event_type,
+                UsageCounterTable.period_start == _month_start(),
+                UsageCounterTable.reserved > 0,
+            )
+            .values(
+                reserved=case(
+                    (UsageCounterTable.reserved > quantity, UsageCounterTable.reserved - quantity),
+                    else_=0,
+                ),
+                updated_at=datetime.now(UTC),
+            )
+        )
+
+
+class UsageCounterRepository:
+    """Maintains ``usage_counters`` across tenants.
+
+    Cross-tenant like :class:`CustomerHealthRepository`: the metering sink
+    writes events for many tenants in one batch, and reconciliation runs
+    over all tenants of a month at once.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add_usage(self, events: list[tuple[str, str, datetime, int, int]]) -> None:
+        """Fold recorded usage into the counters.
+
+        Parameters
+        ----------
+        events:
+            ``(tenant_id, event_type, occurred_at, quantity, reserved)``
+            tuples, as written to ``usage_events`` in the same transaction.
+            *reserved* is the number of quota units the event's operation
+            took through :meth:`QuotaRepository.reserve`; only those are
+            consumed from the counter's outstanding reservations, so usage
+            recorded without a reservation leaves other callers' slots alone.
+        """
+        totals: dict[tuple[str, str, date], tuple[int, int]] = {}
+        for tenant_id, event_type, occurred_at, quantity, reserved in events:
+            key = (tenant_id, event_type, _month_start(occurred_at))
+            used_total, reserved_total = totals.get(key, (0, 0))
+            totals[key] = (used_total + quantity, reserved_total + reserved)
+
+        now = datetime.now(UTC)
+        for (tenant_id, event_type, period), (quantity, reserved) in sorted(totals.items()):
+            await _dialect_upsert_nothing(
+                self._session,
+                UsageCounterTable,
+                values={
+                    "tenant_id": tenant_id,
+                    "event_type": event_type,
+                    "period_start": period,
+                    "used": 0,
+                    "reserved": 0,
+                    "updated_at": now,
+                },
+                index_elements=["tenant_id", "event_type", "period_start"],
+            )
+            values: dict[str, Any] = {"used": UsageCounterTable.used + quantity, "updated_at": now}
+            if reserved:
+                values["reserved"] = case(
+                    (UsageCounterTable.reserved > reserved, UsageCounterTable.reserved - reserved),
+                    else_=0,
+                )
+            await self._session.execute(
+                update(UsageCounterTable)
+                .where(
+                    UsageCounterTable.tenant_id == tenant_id,
+                    UsageCounterTable.event_type == event_type,
+                    UsageCounterTable.period_start == period,
+                )
+                .values(**values)
+            )
+        await self._session.flush()
+
+    async def try_lock_reconciliation(self) -> bool:
+        """Take the transaction-scoped lock that serialises reconciliation.
+
+        Returns ``False`` when another replica holds it, in which case the
+        caller should skip this pass.  On non-PostgreSQL databases (e.g.
+        SQLite in tests) there is nothing to lock and this returns ``True``.
+        """
+        bind = self._session.get_bind()
+        dialect_name = getattr(getattr(bind, "dialect", None), "name", "")
+        if "postgresql" not in str(dialect_name):
+            return True
+        result = await self._session.execute(
+            text("SELECT pg_try_advisory_xact_lock(:id)"),
+            {"id": _RECONCILE_LOCK_ID},
+        )
+        return bool(result.scalar_one())
+
+    async def reconcile(
+        self,
+        period_start: date | None = None,
+        *,
+        reservation_ttl: timedelta = _RESERVATION_TTL,
+    ) -> int:
+        """Correct one month's counters that have drifted from ``usage_events``.
+
+        Drift comes from events written or deleted outside the metering
+        sink.  Counters are read before the events, and each drifted
+        counter is corrected with an ``UPDATE ... WHERE used = <value
+        read>``: usage the sink records meanwhile moves ``used`` on, so
+        that counter is left alone until the next pass rather than being
+        overwritten with a stale total.  Counters that agree with the
+        events are not written.
+
+        Reservations are only cleared on counters untouched for
+        *reservation_ttl*, i.e. those abandoned by operations that neither
+        recorded usage nor released their slot.
+
+        Parameters
+        ----------
+        period_start:
+            First day of the month to reconcile; defaults to the current one.
+        reservation_ttl:
+            How long a counter must be idle before its reservations are
+            treated as abandoned.
+
+        Returns
+        -------
+        int
+            Number of counters whose ``used`` value was corrected.
+        """
+        period = period_start or _month_start()
+        if period.month == 12:
+            period_end = date(period.year + 1, 1, 1)
+        else:
+            period_end = date(period.year, period.month + 1, 1)
+        window_start = datetime(period.year, period.month, 1, tzinfo=UTC)
+        window_end = datetime(period_end.year, period_end.month, 1, tzinfo=UTC)
+
+        stored_result = await self._session.execute(
+            select(UsageCounterTable.tenant_id, UsageCounterTable.event_type, UsageCounterTable.used).where(
+                UsageCounterTable.period_start == period
+            )
+        )
+        stored = {(r.tenant_id, r.event_type): int(r.used) for r in stored_result.all()}
+
+        actual_result = await self._session.execute(
             select(
+                UsageEventTable.tenant_id,
                 UsageEventTable.event_type,
                 func.coalesce(func.sum(UsageEventTable.quantity), 0).label("total"),
             )
             .where(
-                UsageEventTable.tenant_id == self._tenant_id,
-                UsageEventTable.created_at >= month_start,
+                UsageEventTable.created_at >= window_start,
+                UsageEventTable.created_at < window_end,
             )
-            .group_by(UsageEventTable.event_type)
+            .group_by(UsageEventTable.tenant_id, UsageEventTable.event_type)
         )
-        result = await self._session.execute(stmt)
-        rows = result.all()
-        usage: dict[str, int] = {}
-        for row in rows:
-            usage[row.event_type] = int(row.total)
-        return usage
+        actual = {(r.tenant_id, r.event_type): int(r.total) for r in actual_result.all()}
+
+        now = datetime.now(UTC)
+        drifted = 0
+        for key in sorted(stored.keys() | actual.keys()):
+            tenant_id, event_type = key
+            counter, events = stored.get(key), actual.get(key, 0)
+            if counter == events or (counter is None and not events):
+                continue
+            if counter is None:
+                result = await _dialect_upsert_nothing(
+                    self._session,
+                    UsageCounterTable,
+                    values={
+                        "tenant_id": tenant_id,
+                        "event_type": event_type,
+                        "period_start": period,
+                        "used": events,
+                        "reserved": 0,
+                        "updated_at": now,
+                    },
+                    index_elements=["tenant_id", "event_type", "period_start"],
+                )
+            else:
+                result = await self._session.execute(
+                    update(UsageCounterTable)
+                    .where(
+                        UsageCounterTable.tenant_id == tenant_id,
+                        UsageCounterTable.event_type == event_type,
+                        UsageCounterTable.period_start == period,
+                        UsageCounterTable.used == counter,
+                    )
+                    .values(used=events, updated_at=now)
+                )
+            if not result.rowcount:
+                continue
+            drifted += 1
+            logger.warning(
+                "Usage counter drift: tenant=%s %s period=%s counter=%d events=%d",
+                tenant_id,
+                event_type,
+                period.isoformat(),
+                counter or 0,
+                events,
+            )
+
+        await self._session.execute(
+            update(UsageCounterTable)
+            .where(
+                UsageCounterTable.period_start == period,
+                UsageCounterTable.reserved > 0,
+                UsageCounterTable.updated_at < now - reservation_ttl,
+            )
+            .values(reserved=0, updated_at=now)
+        )
+        await self._session.flush()
+        return drifted
 
 
 # ---------------------------------------------------------------------------
@@ -3403,26 +3781,8 @@ class ReportingRepository:
         until: datetime,
     ) -> list[dict[str, Any]]:
         """Aggregate ``runs.cost_usd`` by ``model_name`` for the period."""
-        stmt = (
-            select(
-                RunTable.model_name,
-                func.sum(RunTable.cost_usd).label("cost"),
-                func.count().label("run_count"),
-            )
-            .where(
-                RunTable.tenant_id == self._tenant_id,
-                RunTable.started_at >= since,
-                RunTable.started_at < until,
-                RunTable.cost_usd.is_not(None),
-            )
-            .group_by(RunTable.model_name)
-            .order_by(func.sum(RunTable.cost_usd).desc())
-        )
-        result = await self._session.execute(stmt)
-        return [
-            {"model_name": r.model_name, "cost_usd": round(float(r.cost or 0), 4), "run_count": int(r.run_count)}
-            for r in result.all()
-        ]
+        result = await self._session.execute(self._cost_by_model_stmt(since, until))
+        return [self._cost_by_model_row(r) for r in result.all()]
 
     async def get_cost_by_time(
         self,
@@ -3459,22 +3819,8 @@ class ReportingRepository:
         until: datetime,
     ) -> list[dict[str, Any]]:
         """Aggregate audit log actions by actor for the period."""
-        stmt = (
-            select(
-                AuditLogTable.actor,
-                AuditLogTable.action,
-                func.count().label("cnt"),
-            )
-            .where(
-                AuditLogTable.tenant_id == self._tenant_id,
-                AuditLogTable.created_at >= since,
-                AuditLogTable.created_at < until,
-            )
-            .group_by(AuditLogTable.actor, AuditLogTable.action)
-            .order_by(func.count().desc())
-        )
-        result = await self._session.execute(stmt)
-        return [{"actor": r.actor, "action": r.action, "count": int(r.cnt)} for r in result.all()]
+        result = await self._session.execute(self._usage_by_actor_stmt(since, until))
+        return [self._usage_by_actor_row(r) for r in result.all()]
 
     async def get_llm_cost_by_call_type(
         self,
@@ -3482,33 +3828,8 @@ class ReportingRepository:
         until: datetime,
     ) -> list[dict[str, Any]]:
         """Aggregate LLM usage by call_type for the period."""
-        stmt = (
-            select(
-                LLMUsageLogTable.call_type,
-                func.sum(LLMUsageLogTable.estimated_cost_usd).label("cost"),
-                func.sum(LLMUsageLogTable.input_tokens).label("input_tokens"),
-                func.sum(LLMUsageLogTable.output_tokens).label("output_tokens"),
-                func.count().label("call_count"),
-            )
-            .where(
-                LLMUsageLogTable.tenant_id == self._tenant_id,
-                LLMUsageLogTable.created_at >= since,
-                LLMUsageLogTable.created_at < until,
-            )
-            .group_by(LLMUsageLogTable.call_type)
-            .order_by(func.sum(LLMUsageLogTable.estimated_cost_usd).desc())
-        )
-        result = await self._session.execute(stmt)
-        return [
-            {
-                "call_type": r.call_type,
-                "cost_usd": round(float(r.cost or 0), 6),
-                "input_tokens": int(r.input_tokens or 0),
-                "output_tokens": int(r.output_tokens or 0),
-                "call_count": int(r.call_count),
-            }
-            for r in result.all()
-        ]
+        result = await self._session.execute(self._llm_cost_by_call_type_stmt(since, until))
+        return [self._llm_cost_by_call_type_row(r) for r in result.all()]
 
     async def get_llm_cost_by_time(
         self,
@@ -3566,6 +3887,149 @@ class ReportingRepository:
         result = await self._session.execute(stmt)
         return [{"period": str(r.period), "event_type": r.event_type, "count": int(r.total)} for r in result.all()]
 
+    # -- Streaming exports -------------------------------------------------
+
+    async def stream_export_rows(
+        self,
+        report_type: str,
+        since: datetime,
+        until: datetime,
+        *,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the rows of an export report one at a time.
+
+        Rows are fetched through a server-side cursor (``yield_per``), so
+        at most *batch_size* of them are held in memory whatever the size
+        of the report.
+
+        Parameters
+        ----------
+        report_type:
+            ``"cost"`` (cost by model), ``"usage"`` (actions by actor),
+            ``"llm"`` (LLM cost by call type) or ``"events"`` (raw usage
+            events, oldest first).
+
+        Raises
+        ------
+        ValueError
+            If *report_type* is unknown.
+        """
+        if report_type == "cost":
+            stmt, to_row = self._cost_by_model_stmt(since, until), self._cost_by_model_row
+        elif report_type == "usage":
+            stmt, to_row = self._usage_by_actor_stmt(since, until), self._usage_by_actor_row
+        elif report_type == "llm":
+            stmt, to_row = self._llm_cost_by_call_type_stmt(since, until), self._llm_cost_by_call_type_row
+        elif report_type == "events":
+            stmt, to_row = self._usage_events_stmt(since, until), self._usage_event_row
+        else:
+            raise ValueError(f"Unknown report type: {report_type}")
+
+        result = await self._session.stream(stmt.execution_options(yield_per=batch_size))
+        try:
+            async for partition in result.partitions():
+                for r in partition:
+                    yield to_row(r)
+        finally:
+            await result.close()
+
+    def _cost_by_model_stmt(self, since: datetime, until: datetime) -> Any:
+        return (
+            select(
+                RunTable.model_name,
+                func.sum(RunTable.cost_usd).label("cost"),
+                func.count().label("run_count"),
+            )
+            .where(
+                RunTable.tenant_id == self._tenant_id,
+                RunTable.started_at >= since,
+                RunTable.started_at < until,
+                RunTable.cost_usd.is_not(None),
+            )
+            .group_by(RunTable.model_name)
+            .order_by(func.sum(RunTable.cost_usd).desc())
+        )
+
+    @staticmethod
+    def _cost_by_model_row(r: Any) -> dict[str, Any]:
+        return {"model_name": r.model_name, "cost_usd": round(float(r.cost or 0), 4), "run_count": int(r.run_count)}
+
+    def _usage_by_actor_stmt(self, since: datetime, until: datetime) -> Any:
+        return (
+            select(
+                AuditLogTable.actor,
+                AuditLogTable.action,
+                func.count().label("cnt"),
+            )
+            .where(
+                AuditLogTable.tenant_id == self._tenant_id,
+                AuditLogTable.created_at >= since,
+                AuditLogTable.created_at < until,
+            )
+            .group_by(AuditLogTable.actor, AuditLogTable.action)
+            .order_by(func.count().desc())
+        )
+
+    @staticmethod
+    def _usage_by_actor_row(r: Any) -> dict[str, Any]:
+        return {"actor": r.actor, "action": r.action, "count": int(r.cnt)}
+
+    def _llm_cost_by_call_type_stmt(self, since: datetime, until: datetime) -> Any:
+        return (
+            select(
+                LLMUsageLogTable.call_type,
+                func.sum(LLMUsageLogTable.estimated_cost_usd).label("cost"),
+                func.sum(LLMUsageLogTable.input_tokens).label("input_tokens"),
+                func.sum(LLMUsageLogTable.output_tokens).label("output_tokens"),
+                func.count().label("call_count"),
+            )
+            .where(
+                LLMUsageLogTable.tenant_id == self._tenant_id,
+                LLMUsageLogTable.created_at >= since,
+                LLMUsageLogTable.created_at < until,
+            )
+            .group_by(LLMUsageLogTable.call_type)
+            .order_by(func.sum(LLMUsageLogTable.estimated_cost_usd).desc())
+        )
+
+    @staticmethod
+    def _llm_cost_by_call_type_row(r: Any) -> dict[str, Any]:
+        return {
+            "call_type": r.call_type,
+            "cost_usd": round(float(r.cost or 0), 6),
+            "input_tokens": int(r.input_tokens or 0),
+            "output_tokens": int(r.output_tokens or 0),
+            "call_count": int(r.call_count),
+        }
+
+    def _usage_events_stmt(self, since: datetime, until: datetime) -> Any:
+        return (
+            select(
+                UsageEventTable.event_id,
+                UsageEventTable.event_type,
+                UsageEventTable.quantity,
+                UsageEventTable.created_at,
+                UsageEventTable.metadata_json,
+            )
+            .where(
+                UsageEventTable.tenant_id == self._tenant_id,
+                UsageEventTable.created_at >= since,
+                UsageEventTable.created_at < until,
+            )
+            .order_by(UsageEventTable.created_at, UsageEventTable.event_id)
+        )
+
+    @staticmethod
+    def _usage_event_row(r: Any) -> dict[str, Any]:
+        return {
+            "event_id": r.event_id,
+            "event_type": r.event_type,
+            "quantity": int(r.quantity),
+            "created_at": r.created_at.isoformat() if r.created_at else None,
+            "metadata": r.metadata_json,
+        }
+
 
 # ---------------------------------------------------------------------------
 # CustomerHealthRepository (cross-tenant admin view)
@@ -3579,9 +4043,54 @@ class CustomerHealthRepository:
     churn signals, and health trends for all tenants.
     """
 
+    _UPDATE_COLUMNS = [
+        "health_score",
+        "health_status",
+        "engagement_metrics_json",
+        "trend_direction",
+        "previous_score",
+        "last_login_at",
+        "last_plan_run_at",
+        "last_ai_call_at",
+        "computed_at",
+        "updated_at",
+    ]
+
+    # Rows per multi-row upsert statement.  Eleven bound parameters per row
+    # keeps each statement well under the PostgreSQL and SQLite limits.
+    _UPSERT_CHUNK_SIZE = 1_000
+
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
+    @staticmethod
+    def _row(
+        tenant_id: str,
+        *,
+        health_score: float,
+        health_status: str,
+        engagement_metrics: dict | None = None,
+        trend_direction: str | None = None,
+        previous_score: float | None = None,
+        last_login_at: datetime | None = None,
+        last_plan_run_at: datetime | None = None,
+        last_ai_call_at: datetime | None = None,
+        computed_at: datetime,
+    ) -> dict[str, Any]:
+        return {
+            "tenant_id": tenant_id,
+            "health_score": health_score,
+            "health_status": health_status,
+            "engagement_metrics_json": engagement_metrics,
+            "trend_direction": trend_direction,
+            "previous_score": previous_score,
+            "last_login_at": last_login_at,
+            "last_plan_run_at": last_plan_run_at,
+            "last_ai_call_at": last_ai_call_at,
+            "computed_at": computed_at,
+            "updated_at": computed_at,
+        }
+
     async def upsert(
         self,
         tenant_id: str,
@@ -3596,40 +4105,127 @@ class CustomerHealthRepository:
         last_ai_call_at: datetime | None = None,
     ) -> CustomerHealthTable:
         """Create or update a customer health record."""
-        now = datetime.now(UTC)
         await _dialect_upsert(
             self._session,
             CustomerHealthTable,
-            values={
-                "tenant_id": tenant_id,
-                "health_score": health_score,
-                "health_status": health_status,
-                "engagement_metrics_json": engagement_metrics,
-                "trend_direction": trend_direction,
-                "previous_score": previous_score,
-                "last_login_at": last_login_at,
-                "last_plan_run_at": last_plan_run_at,
-                "last_ai_call_at": last_ai_call_at,
-                "computed_at": now,
-                "updated_at": now,
-            },
+            values=self._row(
+                tenant_id,
+                health_score=health_score,
+                health_status=health_status,
+                engagement_metrics=engagement_metrics,
+                trend_direction=trend_direction,
+                previous_score=previous_score,
+                last_login_at=last_login_at,
+                last_plan_run_at=last_plan_run_at,
+                last_ai_call_at=last_ai_call_at,
+                computed_at=datetime.now(UTC),
+            ),
             index_elements=["tenant_id"],
-            update_columns=[
-                "health_score",
-                "health_status",
-                "engagement_metrics_json",
-                "trend_direction",
-                "previous_score",
-                "last_login_at",
-                "last_plan_run_at",
-                "last_ai_call_at",
-                "computed_at",
-                "updated_at",
-            ],
+            update_columns=self._UPDATE_COLUMNS,
         )
         await self._session.flush()
         return await self.get(tenant_id)  # type: ignore[return-value]
 
+    async def upsert_many(self, records: list[dict[str, Any]]) -> int:
+        """Create or update many health records with multi-row upserts.
+
+        Parameters
+        ----------
+        records:
+            One dict per tenant with the keyword arguments of
+            :meth:`upsert` plus ``tenant_id``.  Tenant IDs must be unique.
+
+        Returns
+        -------
+        int
+            The number of records written.
+        """
+        now = datetime.now(UTC)
+        rows = [self._row(computed_at=now, **record) for record in records]
+        for offset in range(0, len(rows), self._UPSERT_CHUNK_SIZE):
+            await _dialect_upsert_many(
+                self._session,
+                CustomerHealthTable,
+                rows[offset : offset + self._UPSERT_CHUNK_SIZE],
+                index_elements=["tenant_id"],
+                update_columns=self._UPDATE_COLUMNS,
+            )
+        await self._session.flush()
+        return len(rows)
+
+    async def get_scores(self) -> dict[str, tuple[float, str]]:
+        """Return ``{tenant_id: (health_score, health_status)}`` for every record."""
+        result = await self._session.execute(
+            select(
+                CustomerHealthTable.tenant_id,
+                CustomerHealthTable.health_score,
+                CustomerHealthTable.health_status,
+            )
+        )
+        return {row.tenant_id: (float(row.health_score), row.health_status) for row in result.all()}
+
+    async def collect_engagement_signals(self, since: datetime) -> dict[str, dict[str, Any]]:
+        """Gather the raw health-score inputs for every tenant at once.
+
+        Three grouped aggregate queries replace the per-tenant lookups:
+        the latest login of any active user, the latest ``plan_run`` and
+        ``ai_call`` events, and the number of distinct event types recorded
+        since *since*.
+
+        Returns
+        -------
+        dict
+            ``{tenant_id: {"last_login_at", "last_plan_run_at",
+            "last_ai_call_at", "distinct_event_types"}}``.  Tenants with
+            no activity at all are absent.
+        """
+        signals: dict[str, dict[str, Any]] = {}
+
+        def _signals(tenant_id: str) -> dict[str, Any]:
+            entry = signals.get(tenant_id)
+            if entry is None:
+                entry = signals[tenant_id] = {
+                    "last_login_at": None,
+                    "last_plan_run_at": None,
+                    "last_ai_call_at": None,
+                    "distinct_event_types": 0,
+                }
+            return entry
+
+        logins = await self._session.execute(
+            select(UserTable.tenant_id, func.max(UserTable.last_login_at).label("last_login_at"))
+            .where(UserTable.is_active == True)  # noqa: E712
+            .group_by(UserTable.tenant_id)
+        )
+        for login in logins.all():
+            _signals(login.tenant_id)["last_login_at"] = login.last_login_at
+
+        latest_events = await self._session.execute(
+            select(
+                UsageEventTable.tenant_id,
+                UsageEventTable.event_type,
+                func.max(UsageEventTable.created_at).label("last_at"),
+            )
+            .where(UsageEventTable.event_type.in_(["plan_run", "ai_call"]))
+            .group_by(UsageEventTable.tenant_id, UsageEventTable.event_type)
+        )
+        for latest in latest_events.all():
+            field = "last_plan_run_at" if latest.event_type == "plan_run" else "last_ai_call_at"
+            _signals(latest.tenant_id)[field] = latest.last_at
+
+        breadth = await self._session.execute(
+            select(
+                UsageEventTable.tenant_id,
+                func.count(func.distinct(UsageEventTable.event_type)).label("distinct_types"),
+            )
+            .where(UsageEventTable.created_at >= since)
+            .group_by(UsageEventTable.tenant_id)
+        )
+        for tenant_breadth in breadth.all():
+            _signals(tenant_breadth.tenant_id)["distinct_event_types"] = int(tenant_breadth.distinct_types)
+
+        return signals
+
     async def get(self, tenant_id: str) -> CustomerHealthTable | None:
         """Fetch health record for a specific tenant."""
         stmt = select(CustomerHealthTable).where(
@@ -20,7 +20,27 @@ class RunRepository:
 
     async def create_run(self, run_record: dict[str, Any]) -> RunTable:
         """Create a run row from a dictionary matching ``RunRecord`` fields."""
-        row = RunTable(
+        row = self._row_from_record(run_record)
+        self._session.add(row)
+        await self._session.flush()
+        return row
+
+    async def create_runs(self, run_records: list[dict[str, Any]]) -> list[RunTable]:
+        """Create several run rows with a single flush.
+
+        Used by the execution engine to persist every step that finished in
+        the same scheduling round in one round-trip instead of one per step.
+        """
+        rows = [self._row_from_record(record) for record in run_records]
+        if not rows:
+            return rows
+        self._session.add_all(rows)
+        await self._session.flush()
+        return rows
+
+    def _row_from_record(self, run_record: dict[str, Any]) -> RunTable:
+        """Build an (unattached) ``RunTable`` row from a run record dict."""
+        return RunTable(
             run_id=run_record["run_id"],
             tenant_id=self._tenant_id,
             plan_id=run_record["plan_id"],
@@ -39,9 +59,6 @@ class RunRepository:
             cost_usd=run_record.get("cost_usd"),
             external_run_id=run_record.get("external_run_id"),
         )
-        self._session.add(row)
-        await self._session.flush()
-        return row
 
     async def update_status(
         self,
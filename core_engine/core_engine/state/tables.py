@@ -136,6 +136,56 @@ class SnapshotTable(Base):
     )
 
 
+# ---------------------------------------------------------------------------
+# Model lineage
+# ---------------------------------------------------------------------------
+
+
+class LineageSnapshotTable(Base):
+    """One recorded model dependency graph per tenant and snapshot.
+
+    ``snapshot_id`` is the git commit a plan was generated for, or the ID
+    of a :class:`SnapshotTable` row.  The most recently recorded snapshot
+    is the tenant's current lineage.
+    """
+
+    __tablename__ = "lineage_snapshots"
+
+    tenant_id: Mapped[str] = mapped_column(String(64), nullable=False, default="default")
+    snapshot_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    edge_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    recorded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("tenant_id", "snapshot_id"),
+        Index("ix_lineage_snapshots_tenant_recorded", "tenant_id", "recorded_at"),
+    )
+
+
+class ModelDependencyTable(Base):
+    """Direct ``upstream -> downstream`` model edges of a lineage snapshot."""
+
+    __tablename__ = "model_dependencies"
+
+    tenant_id: Mapped[str] = mapped_column(String(64), nullable=False, default="default")
+    snapshot_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    upstream_model: Mapped[str] = mapped_column(String(512), nullable=False)
+    downstream_model: Mapped[str] = mapped_column(String(512), nullable=False)
+
+    __table_args__ = (
+        PrimaryKeyConstraint("tenant_id", "snapshot_id", "upstream_model", "downstream_model"),
+        ForeignKeyConstraint(
+            ["tenant_id", "snapshot_id"],
+            ["lineage_snapshots.tenant_id", "lineage_snapshots.snapshot_id"],
+            name="fk_model_dependencies_snapshot",
+            ondelete="CASCADE",
+        ),
+        # The primary key serves downstream walks (upstream -> children);
+        # this index serves upstream walks (downstream -> parents).
+        Index("ix_model_dependencies_downstream", "tenant_id", "snapshot_id", "downstream_model"),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Watermarks
 # ---------------------------------------------------------------------------
@@ -433,6 +483,7 @@ class TenantConfigTable(Base):
     api_quota_monthly: Mapped[int | None] = mapped_column(Integer, nullable=True, default=None)
     ai_quota_monthly: Mapped[int | None] = mapped_column(Integer, nullable=True, default=None)
     max_seats: Mapped[int | None] = mapped_column(Integer, nullable=True, default=None)
+    max_concurrent_steps: Mapped[int | None] = mapped_column(Integer, nullable=True, default=None)
     retention_days: Mapped[int] = mapped_column(Integer, nullable=False, default=365)
     updated_by: Mapped[str | None] = mapped_column(String(256), nullable=True)
     deactivated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, default=None)
@@ -571,6 +622,29 @@ class UsageEventTable(Base):
     )
 
 
+class UsageCounterTable(Base):
+    """Monthly usage totals per tenant and event type.
+
+    ``used`` mirrors ``SUM(usage_events.quantity)`` for the month and is
+    maintained as events are written, so quota checks read one row instead
+    of scanning the month's events.  ``reserved`` holds quota slots taken by
+    in-flight operations whose usage events have not been written yet.
+    """
+
+    __tablename__ = "usage_counters"
+
+    tenant_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(64), nullable=False)
+    period_start: Mapped[date] = mapped_column(Date, nullable=False)
+    used: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    reserved: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utcnow, onupdate=_utcnow, nullable=False
+    )
+
+    __table_args__ = (PrimaryKeyConstraint("tenant_id", "event_type", "period_start"),)
+
+
 # ---------------------------------------------------------------------------
 # Billing
 # ---------------------------------------------------------------------------
@@ -660,8 +734,10 @@ class BackfillCheckpointTable(Base):
 
     Each row represents a single backfill operation that may span many
     day-sized chunks.  The ``completed_through`` field records the last
-    date that was successfully processed, enabling resume from the next
-    day on failure without re-executing already-completed chunks.
+    date up to which every chunk was successfully processed.  Because
+    chunks may run concurrently and finish out of order,
+    ``completed_chunk_bitmap`` records exactly which chunk indices have
+    succeeded so that resume re-executes only the missing ones.
     """
 
     __tablename__ = "backfill_checkpoints"
@@ -676,6 +752,8 @@ class BackfillCheckpointTable(Base):
     status: Mapped[str] = mapped_column(String(32), default="RUNNING", nullable=False)
     total_chunks: Mapped[int] = mapped_column(Integer, nullable=False)
     completed_chunks: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    completed_chunk_bitmap: Mapped[str | None] = mapped_column(Text, nullable=True)
+    max_concurrent_chunks: Mapped[int | None] = mapped_column(Integer, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     cluster_size: Mapped[str | None] = mapped_column(String(32), nullable=True)
     plan_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
@@ -18,7 +18,9 @@ Usage::
         ...
 
 The collector stores the last ``max_results`` per operation and
-exposes ``get_stats()`` for p50/p95/p99/mean aggregation.
+exposes ``get_stats()`` for p50/p95/p99/mean aggregation.  It also keeps
+monotonic named counters (e.g. cache hits and misses) via ``increment()``
+and ``get_counters()``.
 """
 
 from __future__ import annotations
@@ -73,6 +75,7 @@ class ProfileCollector:
     def __init__(self, max_results: int = 100) -> None:
         self._max_results = max_results
         self._data: dict[str, deque[ProfileResult]] = {}
+        self._counters: dict[str, int] = {}
         self._lock = threading.Lock()
 
     @classmethod
@@ -97,6 +100,21 @@ class ProfileCollector:
                 self._data[result.operation] = deque(maxlen=self._max_results)
             self._data[result.operation].append(result)
 
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add *amount* to the named counter.  Thread-safe."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def get_counter(self, name: str) -> int:
+        """Return the current value of a counter (``0`` if never incremented)."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def get_counters(self, prefix: str = "") -> dict[str, int]:
+        """Return a snapshot of all counters whose name starts with *prefix*."""
+        with self._lock:
+            return {name: value for name, value in sorted(self._counters.items()) if name.startswith(prefix)}
+
     def get_stats(self, operation: str) -> dict[str, Any] | None:
         """Compute aggregate statistics for an operation.
 
@@ -139,9 +157,10 @@ class ProfileCollector:
         return results
 
     def clear(self) -> None:
-        """Clear all stored results."""
+        """Clear all stored results and counters."""
         with self._lock:
             self._data.clear()
+            self._counters.clear()
 
     @staticmethod
     def _percentile(sorted_data: list[float], p: float) -> float:
@@ -239,3 +239,34 @@ class TestBenchmarkResultStructure:
         assert isinstance(result.peak_memory_mb, float)
         assert isinstance(result.throughput_ops_per_sec, float)
         assert isinstance(result.metadata, dict)
+
+
+@pytest.mark.benchmark
+class TestParallelLoadingPerformance:
+    """Process-pool loading must reproduce the serial loader exactly."""
+
+    def test_parallel_loading_matches_serial(self) -> None:
+        results = BenchmarkProfiler.profile_parallel_loading([300], max_workers=2)
+        serial, parallel = results
+        assert serial.operation == parallel.operation == "loader.directory"
+        assert serial.model_count == parallel.model_count == 300
+        assert serial.metadata["workers"] == 1
+        assert parallel.metadata["workers"] == 2
+        assert parallel.metadata["identical"] is True
+        assert parallel.metadata["speedup"] > 0
+
+
+@pytest.mark.benchmark
+class TestGraphBackendComparison:
+    """The CSR backend must agree with NetworkX and report relative numbers."""
+
+    def test_backend_comparison_structure(self) -> None:
+        models = SyntheticGraphGenerator.generate_realistic(500)
+        results = BenchmarkProfiler.profile_graph_backends(models, changed_fraction=0.05)
+        assert len(results) == 8
+        by_backend = {(r.metadata["backend"], r.operation): r for r in results}
+        for operation in ("graph.build", "graph.topological_sort", "graph.downstream_closure", "graph.layering"):
+            nx_result = by_backend[("networkx", operation)]
+            csr_result = by_backend[("csr", operation)]
+            assert csr_result.metadata["affected_count"] == nx_result.metadata["affected_count"]
+            assert csr_result.metadata["speedup"] > 0
@@ -0,0 +1,304 @@
+"""Unit tests for core_engine.executor.async_databricks_executor."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from databricks.sdk.service.jobs import RunLifeCycleState, RunResultState
+
+from core_engine.executor.async_databricks_executor import AsyncDatabricksExecutor
+from core_engine.executor.databricks_executor import _build_submit_task
+from core_engine.models.plan import PlanStep, RunType
+from core_engine.models.run import RunStatus
+
+
+class _InlineQuery:
+    """Inline-SQL stand-in for ``SqlTaskQuery``.
+
+    The installed SDK's ``SqlTaskQuery`` only accepts a saved ``query_id``;
+    this shim lets the submit payload round-trip through ``as_dict``.
+    """
+
+    def __init__(self, query: str) -> None:
+        self.query = query
+
+    def as_dict(self) -> dict:
+        return {"query": self.query}
+
+
+@pytest.fixture(autouse=True)
+def _inline_sql_query(monkeypatch):
+    monkeypatch.setattr("core_engine.executor.databricks_executor.SqlTaskQuery", _InlineQuery)
+
+
+def _step(step_id: str = "a" * 64, model: str = "analytics.orders") -> PlanStep:
+    return PlanStep(step_id=step_id, model=model, run_type=RunType.FULL_REFRESH)
+
+
+# ---------------------------------------------------------------------------
+# In-process fake client
+# ---------------------------------------------------------------------------
+
+
+class _FakeJobs:
+    """Minimal stand-in for ``WorkspaceClient.jobs``.
+
+    Each run terminates with *result* after *polls_to_finish* ``get_run``
+    calls.
+    """
+
+    def __init__(self, polls_to_finish: int = 2, result: str = "SUCCESS") -> None:
+        self._polls_to_finish = polls_to_finish
+        self._result = result
+        self._next_id = 100
+        self._polls: dict[int, int] = {}
+        self.cancelled: list[int] = []
+        self.get_run_calls = 0
+        self.fail_next_polls = 0
+        self._lock = threading.Lock()
+
+    def submit(self, run_name: str, tasks: list) -> SimpleNamespace:
+        with self._lock:
+            self._next_id += 1
+            run_id = self._next_id
+            self._polls[run_id] = 0
+        return SimpleNamespace(run_id=run_id)
+
+    def get_run(self, run_id: int) -> SimpleNamespace:
+        with self._lock:
+            self.get_run_calls += 1
+            if self.fail_next_polls:
+                self.fail_next_polls -= 1
+                raise ConnectionError("transient")
+            self._polls[run_id] += 1
+            done = self._polls[run_id] >= self._polls_to_finish
+        state = SimpleNamespace(
+            life_cycle_state=RunLifeCycleState.TERMINATED if done else RunLifeCycleState.RUNNING,
+            result_state=RunResultState(self._result) if done else None,
+        )
+        return SimpleNamespace(state=state)
+
+    def cancel_run(self, run_id: int) -> None:
+        self.cancelled.append(run_id)
+
+    def get_run_output(self, run_id: int) -> SimpleNamespace:
+        return SimpleNamespace(notebook_output=None, error="boom: table missing", error_trace=None)
+
+
+def _executor(jobs: _FakeJobs, **kwargs) -> AsyncDatabricksExecutor:
+    kwargs.setdefault("poll_interval", 0.01)
+    return AsyncDatabricksExecutor(
+        host="https://example.cloud.databricks.com",
+        token="dapi-secret",  # noqa: S106 - fake test credential
+        client=SimpleNamespace(jobs=jobs),
+        **kwargs,
+    )
+
+
+class TestFakeClient:
+    async def test_execute_step_success(self):
+        jobs = _FakeJobs()
+        executor = _executor(jobs)
+        try:
+            record = await executor.execute_step(_step(), "SELECT 1", {}, plan_id="plan-1")
+        finally:
+            await executor.aclose()
+
+        assert record.status == RunStatus.SUCCESS
+        assert record.plan_id == "plan-1"
+        assert record.error_message is None
+
+    async def test_failed_run_collects_logs(self):
+        jobs = _FakeJobs(result="FAILED")
+        executor = _executor(jobs)
+        try:
+            record = await executor.execute_step(_step(), "SELECT 1", {})
+        finally:
+            await executor.aclose()
+
+        assert record.status == RunStatus.FAIL
+        assert record.error_message == "boom: table missing"
+
+    async def test_single_poller_serves_many_runs(self):
+        jobs = _FakeJobs(polls_to_finish=3)
+        executor = _executor(jobs)
+        try:
+            steps = [_step(step_id=f"{i:064d}", model=f"m.t{i}") for i in range(25)]
+            records = await asyncio.gather(*(executor.execute_step(s, "SELECT 1", {}) for s in steps))
+            assert executor.in_flight == 0
+        finally:
+            await executor.aclose()
+
+        assert all(r.status == RunStatus.SUCCESS for r in records)
+        assert len({r.run_id for r in records}) == 25
+        # Exactly three polls per run: the poller batches, it never spins.
+        assert jobs.get_run_calls == 75
+
+    async def test_transient_poll_errors_are_retried(self):
+        jobs = _FakeJobs(polls_to_finish=1)
+        jobs.fail_next_polls = 2
+        executor = _executor(jobs, poll_interval=0.001)
+        try:
+            record = await executor.execute_step(_step(), "SELECT 1", {})
+        finally:
+            await executor.aclose()
+        assert record.status == RunStatus.SUCCESS
+
+    async def test_timeout_cancels_remote_run(self):
+        jobs = _FakeJobs(polls_to_finish=10_000)
+        executor = _executor(jobs, job_timeout=0)
+        try:
+            with pytest.raises(TimeoutError):
+                await executor.execute_step(_step(), "SELECT 1", {})
+        finally:
+            await executor.aclose()
+        assert jobs.cancelled == [101]
+
+    async def test_caller_cancellation_cancels_remote_run(self):
+        jobs = _FakeJobs(polls_to_finish=10_000)
+        executor = _executor(jobs)
+        task = asyncio.create_task(executor.execute_step(_step(), "SELECT 1", {}))
+        while executor.in_flight == 0 and not task.done():
+            await asyncio.sleep(0.005)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await executor.aclose()
+        assert jobs.cancelled == [101]
+
+    async def test_unsafe_sql_rejected_before_submit(self):
+        from core_engine.parser.sql_guard import UnsafeSQLError
+
+        jobs = _FakeJobs()
+        executor = _executor(jobs)
+        try:
+            with pytest.raises(UnsafeSQLError):
+                await executor.execute_step(_step(), "DROP TABLE analytics.orders", {})
+        finally:
+            await executor.aclose()
+        assert jobs._next_id == 100
+
+    async def test_close_removes_redaction_filter(self):
+        from core_engine.executor import async_databricks_executor
+
+        executor = _executor(_FakeJobs())
+        assert executor._redaction_filter in async_databricks_executor.logger.filters
+        executor.close()
+        assert executor._redaction_filter not in async_databricks_executor.logger.filters
+        with pytest.raises(RuntimeError, match="closed"):
+            await executor.wait_for_completion("1")
+
+
+class TestSubmitTask:
+    def test_cluster_dict_passed_through_unchanged(self):
+        spec = {"spark_version": "14.3.x-scala2.12", "num_workers": 2, "custom_tags": {"team": "data"}}
+        task = _build_submit_task(_step(), "SELECT {{ day }}", {"day": "1"}, spec, "wh-1")
+        assert task.new_cluster is spec
+        assert task.sql_task.query.query == "SELECT 1"
+        assert task.sql_task.warehouse_id == "wh-1"
+
+
+# ---------------------------------------------------------------------------
+# Local fake Jobs API server driven through the real WorkspaceClient
+# ---------------------------------------------------------------------------
+
+
+class _JobsAPIHandler(BaseHTTPRequestHandler):
+    server: _FakeJobsServer
+
+    def log_message(self, *args) -> None:  # silence stderr
+        pass
+
+    def _send(self, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if self.path.endswith("/jobs/runs/submit"):
+            self._send({"run_id": self.server.submit(body)})
+        elif self.path.endswith("/jobs/runs/cancel"):
+            self.server.cancelled.append(body["run_id"])
+            self._send({})
+        else:
+            self.send_error(404)
+
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        if parsed.path.endswith("/jobs/runs/get"):
+            run_id = int(query["run_id"][0])
+            self._send({"run_id": run_id, "state": self.server.poll(run_id)})
+        elif parsed.path.endswith("/jobs/runs/get-output"):
+            self._send({"error": "remote failure"})
+        else:
+            # Includes the SDK's /.well-known/databricks-config probe.
+            self._send({})
+
+
+class _FakeJobsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, polls_to_finish: int = 2) -> None:
+        super().__init__(("127.0.0.1", 0), _JobsAPIHandler)
+        self._polls_to_finish = polls_to_finish
+        self._lock = threading.Lock()
+        self._polls: dict[int, int] = {}
+        self.submitted: list[dict] = []
+        self.cancelled: list[int] = []
+
+    def submit(self, body: dict) -> int:
+        with self._lock:
+            run_id = 1000 + len(self.submitted)
+            self.submitted.append(body)
+            self._polls[run_id] = 0
+            return run_id
+
+    def poll(self, run_id: int) -> dict:
+        with self._lock:
+            self._polls[run_id] += 1
+            if self._polls[run_id] >= self._polls_to_finish:
+                return {"life_cycle_state": "TERMINATED", "result_state": "SUCCESS"}
+            return {"life_cycle_state": "RUNNING"}
+
+
+@pytest.fixture()
+def jobs_server():
+    server = _FakeJobsServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestFakeJobsServer:
+    async def test_concurrent_runs_against_http_api(self, jobs_server):
+        executor = AsyncDatabricksExecutor(
+            host=f"http://127.0.0.1:{jobs_server.server_port}",
+            token="dapi-secret",  # noqa: S106 - fake test credential
+            warehouse_id="wh-1",
+            poll_interval=0.01,
+        )
+        try:
+            steps = [_step(step_id=f"{i:064d}", model=f"m.t{i}") for i in range(8)]
+            records = await asyncio.gather(*(executor.execute_step(s, "SELECT * FROM raw.t", {}) for s in steps))
+        finally:
+            await executor.aclose()
+
+        assert [r.status for r in records] == [RunStatus.SUCCESS] * 8
+        assert len(jobs_server.submitted) == 8
+        task = jobs_server.submitted[0]["tasks"][0]
+        assert task["sql_task"]["warehouse_id"] == "wh-1"
+        assert task["sql_task"]["query"]["query"] == "SELECT * FROM raw.t"
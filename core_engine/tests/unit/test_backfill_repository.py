@@ -185,6 +185,38 @@ class TestBackfillCheckpointUpdateProgress:
         assert row.completed_chunks == 2
 
 
+    @pytest.mark.asyncio
+    async def test_update_progress_records_bitmap(self, async_session: AsyncSession):
+        repo = BackfillCheckpointRepository(async_session, tenant_id=_TENANT)
+        backfill_id = uuid4().hex
+
+        row = await repo.create(
+            backfill_id=backfill_id,
+            model_name="analytics.orders",
+            overall_start=date(2024, 1, 1),
+            overall_end=date(2024, 1, 21),
+            chunk_size_days=7,
+            total_chunks=3,
+            max_concurrent_chunks=3,
+        )
+        assert row.completed_chunk_bitmap == "0"
+        assert row.max_concurrent_chunks == 3
+
+        # Chunk 3 finished before chunks 1 and 2.
+        await repo.update_progress(
+            backfill_id=backfill_id,
+            completed_through=None,
+            completed_chunks=1,
+            completed_chunk_bitmap="4",
+        )
+
+        row = await repo.get(backfill_id)
+        assert row is not None
+        assert row.completed_through is None
+        assert row.completed_chunks == 1
+        assert row.completed_chunk_bitmap == "4"
+
+
 class TestBackfillCheckpointMarkCompleted:
     """Verify marking a backfill as completed."""
 
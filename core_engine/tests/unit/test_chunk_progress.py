@@ -0,0 +1,66 @@
+"""Unit tests for core_engine.executor.chunk_progress."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from core_engine.executor.chunk_progress import ChunkProgress
+
+
+class TestMarkDone:
+    def test_in_order_completion_advances_prefix(self):
+        progress = ChunkProgress(3)
+        assert progress.mark_done(0) == [0]
+        assert progress.mark_done(1) == [1]
+        assert progress.contiguous_prefix == 2
+        assert not progress.is_complete()
+        assert progress.mark_done(2) == [2]
+        assert progress.is_complete()
+
+    def test_out_of_order_completion_holds_prefix_until_gap_closes(self):
+        progress = ChunkProgress(4)
+        assert progress.mark_done(2) == []
+        assert progress.mark_done(1) == []
+        assert progress.contiguous_prefix == 0
+        assert progress.completed_count == 2
+        assert progress.pending() == [0, 3]
+        assert progress.mark_done(0) == [0, 1, 2]
+        assert progress.contiguous_prefix == 3
+
+    def test_marking_twice_is_noop(self):
+        progress = ChunkProgress(2)
+        progress.mark_done(0)
+        assert progress.mark_done(0) == []
+        assert progress.completed_count == 1
+
+    def test_out_of_range_rejected(self):
+        with pytest.raises(ValueError, match="out of range"):
+            ChunkProgress(2).mark_done(2)
+
+
+class TestSerialisation:
+    def test_bitmap_round_trip(self):
+        progress = ChunkProgress(70, completed=[0, 3, 69])
+        restored = ChunkProgress.from_bitmap(70, progress.to_bitmap())
+        assert [i for i in range(70) if restored.is_done(i)] == [0, 3, 69]
+        assert restored.contiguous_prefix == 1
+
+    def test_empty_bitmap(self):
+        assert ChunkProgress(3).to_bitmap() == "0"
+        assert ChunkProgress.from_bitmap(3, "").completed_count == 0
+
+    def test_bitmap_wider_than_total_rejected(self):
+        with pytest.raises(ValueError, match="beyond total_chunks"):
+            ChunkProgress.from_bitmap(2, "4")
+
+    def test_from_completed_through(self):
+        chunks = [
+            (date(2024, 1, 1), date(2024, 1, 7)),
+            (date(2024, 1, 8), date(2024, 1, 14)),
+            (date(2024, 1, 15), date(2024, 1, 21)),
+        ]
+        progress = ChunkProgress.from_completed_through(chunks, date(2024, 1, 14))
+        assert progress.pending() == [2]
+        assert ChunkProgress.from_completed_through(chunks, None).pending() == [0, 1, 2]
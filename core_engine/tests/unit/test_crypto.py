@@ -0,0 +1,72 @@
+"""Unit tests for the dedicated crypto thread pool."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from core_engine import crypto
+
+
+@pytest.fixture(autouse=True)
+def _fresh_executor():
+    crypto.configure_crypto_executor(2)
+    yield
+    crypto.shutdown_crypto_executor()
+
+
+async def test_password_round_trip() -> None:
+    hashed = await crypto.hash_password("s3cret")
+    assert hashed.startswith("$2")
+    assert await crypto.check_password("s3cret", hashed) is True
+    assert await crypto.check_password("wrong", hashed) is False
+
+
+async def test_runs_on_crypto_threads_not_the_loop() -> None:
+    loop_thread = threading.get_ident()
+    name = await crypto.run_crypto(lambda: threading.current_thread().name)
+    ident = await crypto.run_crypto(threading.get_ident)
+    assert name.startswith("ironlayer-crypto")
+    assert ident != loop_thread
+
+
+async def test_event_loop_stays_responsive_during_hashing() -> None:
+    release = threading.Event()
+    blocked = asyncio.ensure_future(crypto.run_crypto(release.wait, 5))
+    # The loop keeps serving other work while the pool thread is busy.
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    release.set()
+    assert await blocked is True
+
+
+def test_executor_is_created_lazily_after_shutdown() -> None:
+    crypto.shutdown_crypto_executor()
+    executor = crypto.get_crypto_executor()
+    assert executor is crypto.get_crypto_executor()
+
+
+async def test_submit_after_concurrent_shutdown_raises_clearly(monkeypatch) -> None:
+    stale = crypto.get_crypto_executor()
+    crypto.shutdown_crypto_executor()
+    monkeypatch.setattr(crypto, "get_crypto_executor", lambda: stale)
+    with pytest.raises(RuntimeError, match="Crypto executor was shut down"):
+        await crypto.run_crypto(threading.get_ident)
+
+
+def test_get_never_returns_none_while_shutting_down() -> None:
+    stop = threading.Event()
+
+    def churn() -> None:
+        while not stop.is_set():
+            crypto.shutdown_crypto_executor()
+
+    thread = threading.Thread(target=churn)
+    thread.start()
+    try:
+        assert all(crypto.get_crypto_executor() is not None for _ in range(2_000))
+    finally:
+        stop.set()
+        thread.join()
@@ -0,0 +1,144 @@
+"""Unit tests for the array-backed CSR graph core and its NetworkX adapter.
+
+The CSR paths must be drop-in replacements: every public graph function
+and the planner have to produce identical results whether they are given
+``build_dag`` or ``build_csr_dag`` output.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+import networkx as nx
+import pytest
+
+from core_engine.benchmarks.graph_generator import SyntheticGraphGenerator
+from core_engine.graph import (
+    CSRDiGraph,
+    CSRGraph,
+    CyclicDependencyError,
+    assign_parallel_groups,
+    build_csr_dag,
+    build_dag,
+    detect_cycles,
+    get_downstream,
+    get_downstream_closure,
+    get_first_upstream_sources,
+    get_upstream,
+    topological_sort,
+    validate_dag,
+)
+from core_engine.models.diff import DiffResult
+from core_engine.planner.interval_planner import generate_plan
+
+
+@pytest.fixture(scope="module")
+def models():
+    return SyntheticGraphGenerator.generate_realistic(400, seed=17)
+
+
+@pytest.fixture(scope="module")
+def graphs(models):
+    return build_dag(models), build_csr_dag(models)
+
+
+class TestEquivalence:
+    def test_same_nodes_edges_and_data(self, graphs) -> None:
+        nx_dag, csr_dag = graphs
+        assert set(csr_dag.nodes) == set(nx_dag.nodes)
+        assert set(csr_dag.edges) == set(nx_dag.edges)
+        assert csr_dag.number_of_edges() == nx_dag.number_of_edges()
+        name = next(iter(nx_dag.nodes))
+        assert csr_dag.nodes[name]["model"] is nx_dag.nodes[name]["model"]
+
+    def test_topological_sort_identical(self, graphs) -> None:
+        nx_dag, csr_dag = graphs
+        assert topological_sort(csr_dag) == topological_sort(nx_dag)
+
+    def test_traversals_identical(self, graphs) -> None:
+        nx_dag, csr_dag = graphs
+        for name in list(nx_dag.nodes)[::37]:
+            assert get_downstream(csr_dag, name) == get_downstream(nx_dag, name)
+            assert get_upstream(csr_dag, name) == get_upstream(nx_dag, name)
+        assert get_downstream(csr_dag, "missing") == set()
+
+    def test_multi_source_closure_matches_union(self, graphs) -> None:
+        nx_dag, csr_dag = graphs
+        sources = [*list(nx_dag.nodes)[::50], "not_a_model"]
+        expected = set().union(*(nx.descendants(nx_dag, s) for s in sources if s in nx_dag))
+        assert get_downstream_closure(nx_dag, sources) == expected
+        assert get_downstream_closure(csr_dag, sources) == expected
+
+    def test_first_upstream_sources_match_min_of_ancestors(self, graphs) -> None:
+        nx_dag, csr_dag = graphs
+        sources = set(list(nx_dag.nodes)[::40])
+        expected = {}
+        for name in nx_dag.nodes:
+            upstream = get_upstream(nx_dag, name) & sources
+            if upstream:
+                expected[name] = min(upstream)
+        assert get_first_upstream_sources(nx_dag, sources | {"not_a_model"}) == expected
+        assert get_first_upstream_sources(csr_dag, sources | {"not_a_model"}) == expected
+
+    def test_parallel_groups_identical(self, graphs) -> None:
+        nx_dag, csr_dag = graphs
+        subset = list(nx_dag.nodes)[::3]
+        assert assign_parallel_groups(csr_dag, subset) == assign_parallel_groups(nx_dag, subset)
+        assert assign_parallel_groups(csr_dag, list(nx_dag.nodes)) == assign_parallel_groups(
+            nx_dag, list(nx_dag.nodes)
+        )
+
+    def test_validate_dag_identical(self, models, graphs) -> None:
+        nx_dag, csr_dag = graphs
+        known = {m.name for m in models[:-20]}
+        assert validate_dag(csr_dag, known) == validate_dag(nx_dag, known)
+
+    def test_generate_plan_identical(self, models, graphs) -> None:
+        nx_dag, csr_dag = graphs
+        model_map = {m.name: m for m in models}
+        diff = DiffResult(modified_models=sorted(model_map)[:5], added_models=sorted(model_map)[-2:])
+        kwargs = {
+            "models": model_map,
+            "diff_result": diff,
+            "watermarks": {},
+            "run_stats": {},
+            "base": "a" * 40,
+            "target": "b" * 40,
+            "as_of_date": date(2024, 6, 1),
+        }
+        assert generate_plan(dag=csr_dag, **kwargs) == generate_plan(dag=nx_dag, **kwargs)
+
+
+class TestCycles:
+    def test_cycle_raises_with_cycle_members(self) -> None:
+        csr = CSRGraph.from_edges("abcd", [("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")])
+        dag = CSRDiGraph(csr)
+        with pytest.raises(CyclicDependencyError) as excinfo:
+            topological_sort(dag)
+        assert sorted(excinfo.value.cycles[0]) == ["a", "b", "c"]
+        with pytest.raises(CyclicDependencyError):
+            detect_cycles(dag)
+        with pytest.raises(CyclicDependencyError):
+            assign_parallel_groups(dag, ["a", "b", "c"])
+        assert assign_parallel_groups(dag, ["c", "d"]) == {"c": 1, "d": 2}
+
+
+class TestAdapter:
+    def test_read_only_digraph_api(self) -> None:
+        dag = CSRDiGraph(CSRGraph.from_edges(["x", "y", "z"], [("x", "y"), ("x", "z"), ("x", "y"), ("q", "x")]))
+        assert len(dag) == 3 and "x" in dag and dag.has_node("y")
+        assert dag.has_edge("x", "y") and not dag.has_edge("y", "x")
+        assert sorted(dag.successors("x")) == ["y", "z"]
+        assert list(dag.predecessors("y")) == ["x"]
+        assert dag.in_degree("y") == 1 and dag.out_degree("x") == 2
+        assert dict(dag.in_degree()) == {"x": 0, "y": 1, "z": 1}
+        with pytest.raises(nx.NetworkXError):
+            list(dag.successors("missing"))
+
+    def test_subgraph_and_round_trip(self, graphs) -> None:
+        nx_dag, csr_dag = graphs
+        subset = list(nx_dag.nodes)[:100]
+        assert set(csr_dag.subgraph(subset).edges) == set(nx_dag.subgraph(subset).edges)
+        round_trip = csr_dag.to_networkx()
+        assert set(round_trip.edges) == set(nx_dag.edges)
+        assert set(CSRDiGraph.from_networkx(nx_dag).edges) == set(nx_dag.edges)
@@ -0,0 +1,105 @@
+"""Unit tests for the batched ``git cat-file`` object reader."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from core_engine.git import GitClientError, GitObjectReader
+from core_engine.git import object_reader as object_reader_module
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(  # noqa: S603
+        ["git", *args],  # noqa: S607
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "dev")
+    models = tmp_path / "models"
+    models.mkdir()
+    (models / "orders.sql").write_text("-- name: analytics.orders\nSELECT 1\n", encoding="utf-8")
+    (models / "customers.sql").write_text("SELECT 'ünïcode'\n", encoding="utf-8")
+    (tmp_path / "README.md").write_text("# readme\n", encoding="utf-8")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    return tmp_path
+
+
+class TestReadBlobs:
+    def test_reads_many_files_in_one_call(self, repo: Path) -> None:
+        sha = _git(repo, "rev-parse", "HEAD")
+        with GitObjectReader(repo) as reader:
+            blobs = reader.read_blobs(sha, ["models/orders.sql", "models/customers.sql", "models/missing.sql"])
+        assert blobs == {
+            "models/orders.sql": "-- name: analytics.orders\nSELECT 1\n",
+            "models/customers.sql": "SELECT 'ünïcode'\n",
+            "models/missing.sql": None,
+        }
+
+    def test_reads_historical_version(self, repo: Path) -> None:
+        base = _git(repo, "rev-parse", "HEAD")
+        (repo / "models" / "orders.sql").write_text("SELECT 2\n", encoding="utf-8")
+        _git(repo, "commit", "-q", "-am", "change")
+        with GitObjectReader(repo) as reader:
+            assert reader.read_blob(base, "models/orders.sql").endswith("SELECT 1\n")
+            assert reader.read_blob("HEAD", "models/orders.sql") == "SELECT 2\n"
+
+    def test_process_is_reused_across_calls(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader:
+            reader.read_blob("HEAD", "README.md")
+            pid = reader._proc.pid
+            reader.read_blob("HEAD", "models/orders.sql")
+            assert reader._proc.pid == pid
+
+    def test_requests_span_multiple_chunks(self, repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(object_reader_module, "_MAX_REQUEST_CHUNK_BYTES", 32)
+        paths = ["models/orders.sql", "README.md", "models/customers.sql", "nope.sql"]
+        with GitObjectReader(repo) as reader:
+            blobs = reader.read_blobs("HEAD", paths)
+        assert list(blobs) == paths
+        assert blobs["README.md"] == "# readme\n"
+        assert blobs["nope.sql"] is None
+
+    def test_restarts_after_process_dies(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader:
+            reader.read_blob("HEAD", "README.md")
+            reader._proc.kill()
+            reader._proc.wait()
+            assert reader.read_blob("HEAD", "README.md") == "# readme\n"
+
+    def test_unknown_commit_reads_as_missing(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader:
+            assert reader.read_blob("deadbeef", "README.md") is None
+
+    def test_rejects_invalid_ref(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader, pytest.raises(ValueError):
+            reader.read_blobs("HEAD; rm -rf /", ["README.md"])
+
+
+class TestTree:
+    def test_list_tree_filters_by_suffix(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader:
+            entries = list(reader.list_tree("HEAD", suffix=".sql"))
+        assert [e.path for e in entries] == ["models/customers.sql", "models/orders.sql"]
+        assert all(len(e.object_id) == 40 and e.mode == "100644" for e in entries)
+
+    def test_iter_tree_blobs_streams_contents(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader:
+            blobs = dict(reader.iter_tree_blobs("HEAD", batch_size=1))
+        assert set(blobs) == {"README.md", "models/customers.sql", "models/orders.sql"}
+        assert blobs["models/orders.sql"].startswith("-- name: analytics.orders")
+
+    def test_unknown_commit_raises(self, repo: Path) -> None:
+        with GitObjectReader(repo) as reader, pytest.raises(GitClientError):
+            list(reader.list_tree("deadbeef"))
@@ -0,0 +1,172 @@
+"""Unit tests for the incrementally maintained model DAG."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from core_engine.benchmarks.graph_generator import SyntheticGraphGenerator
+from core_engine.graph import (
+    CyclicDependencyError,
+    IncrementalDAG,
+    assign_parallel_groups,
+    build_dag,
+    incremental,
+    load_incremental_dag,
+)
+from core_engine.models.model_definition import ModelDefinition
+
+
+def _model(name: str, deps: list[str] | None = None) -> ModelDefinition:
+    return SyntheticGraphGenerator.generate_linear_chain(1)[0].model_copy(
+        update={
+            "name": name,
+            "dependencies": deps or [],
+            "referenced_tables": deps or [],
+            "file_path": f"models/{name}.sql",
+        }
+    )
+
+
+def _assert_consistent(dag: IncrementalDAG, models: list[ModelDefinition]) -> None:
+    """The incremental state must match a from-scratch build exactly."""
+    expected = build_dag(models)
+    assert set(dag.graph.nodes) == set(expected.nodes)
+    assert set(dag.graph.edges) == set(expected.edges)
+    for name in expected.nodes:
+        assert dag.graph.nodes[name]["model"] is expected.nodes[name]["model"]
+
+    groups = assign_parallel_groups(expected, list(expected.nodes))
+    assert dag.levels() == {name: group - 1 for name, group in groups.items()}
+    assert dag.topological_order() == sorted(expected.nodes, key=lambda n: (groups[n], n))
+
+
+class TestApplyChanges:
+    def test_from_models_matches_build_dag(self) -> None:
+        models = SyntheticGraphGenerator.generate_realistic(300, seed=3)
+        _assert_consistent(IncrementalDAG.from_models(models), models)
+
+    def test_add_modify_remove(self) -> None:
+        models = [_model("a"), _model("b", ["a"]), _model("c", ["b"]), _model("d", ["x"])]
+        dag = IncrementalDAG.from_models(models)
+
+        # "x" was an external table; adding it must wire up "d".
+        x = _model("x", ["c"])
+        dag.apply_changes(added=[x])
+        assert dag.level("d") == 4
+
+        c2 = _model("c", ["a"])
+        dag.apply_changes(modified=[c2], removed=["b"])
+        _assert_consistent(dag, [models[0], c2, models[3], x])
+
+    def test_randomised_changes_stay_consistent(self) -> None:
+        rng = random.Random(11)
+        models = {m.name: m for m in SyntheticGraphGenerator.generate_realistic(150, seed=5)}
+        dag = IncrementalDAG.from_models(models.values())
+        order = {name: i for i, name in enumerate(sorted(models))}
+
+        for step in range(40):
+            names = sorted(models)
+            victim = rng.choice(names)
+            # Only depend on earlier names so changes never form a cycle.
+            candidates = [n for n in names if order[n] < order[victim]]
+            new_deps = rng.sample(candidates, k=min(2, len(candidates)))
+            modified = models[victim].model_copy(update={"dependencies": new_deps, "referenced_tables": new_deps})
+            removed = rng.choice([n for n in names if n != victim])
+            added = _model(f"z_{step:03d}", [victim])
+            order[added.name] = len(order) + step
+
+            dag.apply_changes(added=[added], modified=[modified], removed=[removed])
+            models[victim] = modified
+            models[added.name] = added
+            del models[removed]
+            _assert_consistent(dag, list(models.values()))
+
+    def test_small_diff_touches_only_changed_region(self) -> None:
+        models = SyntheticGraphGenerator.generate_realistic(2000, seed=42)
+        dag = IncrementalDAG.from_models(models)
+        leaves = [n for n in dag.topological_order() if dag.graph.out_degree(n) == 0]
+        changed = [dag.graph.nodes[n]["model"].model_copy(update={"dependencies": []}) for n in leaves[:3]]
+
+        region = dag.apply_changes(modified=changed)
+        assert region <= {m.name for m in changed}
+
+    def test_cycle_is_rejected_and_rolled_back(self) -> None:
+        models = [_model("a"), _model("b", ["a"]), _model("c", ["b"])]
+        dag = IncrementalDAG.from_models(models)
+        before = (set(dag.graph.edges), dag.levels(), dag.topological_order())
+
+        with pytest.raises(CyclicDependencyError) as excinfo:
+            dag.apply_changes(modified=[_model("a", ["c"])], added=[_model("d", ["a"])])
+        assert sorted(excinfo.value.cycles[0]) == ["a", "b", "c"]
+        assert (set(dag.graph.edges), dag.levels(), dag.topological_order()) == before
+        assert "d" not in dag
+        _assert_consistent(dag, models)
+
+    def test_invalid_change_sets_rejected(self) -> None:
+        dag = IncrementalDAG.from_models([_model("a")])
+        with pytest.raises(ValueError):
+            dag.apply_changes(added=[_model("a")])
+        with pytest.raises(ValueError):
+            dag.apply_changes(removed=["missing"])
+        with pytest.raises(ValueError):
+            dag.apply_changes(modified=[_model("a")], removed=["a"])
+
+
+class TestPersistence:
+    def test_round_trip_and_sync(self, tmp_path: Path) -> None:
+        models = SyntheticGraphGenerator.generate_realistic(200, seed=9)
+        snapshot = tmp_path / "dag.json"
+        load_incremental_dag(models, snapshot)
+        assert snapshot.exists()
+
+        changed = [*models[:-1], _model("new_model", [models[0].name])]
+        dag = load_incremental_dag(changed, snapshot)
+        _assert_consistent(dag, changed)
+        assert IncrementalDAG.load(snapshot, changed).topological_order() == dag.topological_order()
+
+    def test_unchanged_models_skip_rewrite(self, tmp_path: Path) -> None:
+        models = SyntheticGraphGenerator.generate_realistic(50, seed=1)
+        snapshot = tmp_path / "dag.json"
+        load_incremental_dag(models, snapshot)
+        mtime = snapshot.stat().st_mtime_ns
+        load_incremental_dag(models, snapshot)
+        assert snapshot.stat().st_mtime_ns == mtime
+
+    def test_warm_load_rederives_only_changed_models(self, tmp_path: Path, monkeypatch) -> None:
+        models = SyntheticGraphGenerator.generate_realistic(200, seed=3)
+        snapshot = tmp_path / "dag.json"
+        load_incremental_dag(models, snapshot)
+
+        derived: list[str] = []
+        original = incremental._declared_upstream
+
+        def _counting(model: ModelDefinition) -> frozenset[str]:
+            derived.append(model.name)
+            return original(model)
+
+        monkeypatch.setattr(incremental, "_declared_upstream", _counting)
+        target = models[-1]
+        edited = target.model_copy(update={"content_hash": "edited", "referenced_tables": [models[0].name]})
+        changed = [*models[:-1], edited]
+
+        dag = load_incremental_dag(changed, snapshot)
+        assert set(derived) == {target.name}
+        assert not dag.dirty  # the re-wired model was saved back
+        _assert_consistent(dag, changed)
+
+    def test_header_dependency_change_is_detected(self, tmp_path: Path) -> None:
+        models = [_model("a"), _model("b"), _model("c", ["a"])]
+        snapshot = tmp_path / "dag.json"
+        load_incremental_dag(models, snapshot)
+
+        changed = [models[0], models[1], models[2].model_copy(update={"dependencies": ["a", "b"]})]
+        _assert_consistent(load_incremental_dag(changed, snapshot), changed)
+
+    def test_corrupt_snapshot_rebuilds(self, tmp_path: Path) -> None:
+        models = SyntheticGraphGenerator.generate_realistic(50, seed=1)
+        snapshot = tmp_path / "dag.json"
+        snapshot.write_text("{not json", encoding="utf-8")
+        _assert_consistent(load_incremental_dag(models, snapshot), models)
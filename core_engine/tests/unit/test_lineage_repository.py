@@ -0,0 +1,201 @@
+"""Unit tests for LineageRepository (persisted model dependency edges).
+
+Uses an in-memory SQLite database via aiosqlite, which runs the same
+recursive CTE the repository issues against PostgreSQL.
+
+Covers:
+- record_edges: de-duplication, re-recording a known snapshot, pruning,
+  concurrent recording of the same snapshot
+- get_lineage: shortest-path depth on diamonds, pagination per direction,
+  max_depth truncation, explicit snapshots, tenant isolation
+- SnapshotRepository.create_snapshot recording edges
+- the lineage query compiles to a recursive CTE on PostgreSQL
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from core_engine.state import lineage_repository
+from core_engine.state.repository import LineageRepository, SnapshotRepository
+from core_engine.state.tables import Base, LineageSnapshotTable, ModelDependencyTable
+
+_TENANT = "test-tenant"
+
+# raw.a -> stg.b -> mart.d ; raw.a -> stg.c -> mart.d ; mart.d -> rpt.e ; raw.a -> rpt.e
+_EDGES = [
+    ("raw.a", "stg.b"),
+    ("raw.a", "stg.c"),
+    ("stg.b", "mart.d"),
+    ("stg.c", "mart.d"),
+    ("mart.d", "rpt.e"),
+    ("raw.a", "rpt.e"),
+]
+
+
+@pytest_asyncio.fixture
+async def async_session():
+    """Provide an async session backed by an in-memory SQLite database."""
+    engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+
+    await engine.dispose()
+
+
+def _names(nodes: list[dict]) -> list[tuple[str, int]]:
+    return [(node["model_name"], node["depth"]) for node in nodes]
+
+
+class TestRecordEdges:
+    async def test_deduplicates_and_drops_self_edges(self, async_session: AsyncSession):
+        repo = LineageRepository(async_session, tenant_id=_TENANT)
+        stored = await repo.record_edges("sha1", [*_EDGES, ("raw.a", "stg.b"), ("stg.b", "stg.b")])
+        assert stored == len(_EDGES)
+        assert await repo.current_snapshot_id() == "sha1"
+
+    async def test_rerecording_known_snapshot_makes_it_current(self, async_session: AsyncSession):
+        repo = LineageRepository(async_session, tenant_id=_TENANT)
+        await repo.record_edges("sha1", _EDGES)
+        await repo.record_edges("sha2", [("x", "y")])
+        assert await repo.current_snapshot_id() == "sha2"
+
+        # Edges of a known snapshot are immutable; the new list is ignored.
+        assert await repo.record_edges("sha1", []) == len(_EDGES)
+        assert await repo.current_snapshot_id() == "sha1"
+
+    async def test_prunes_old_snapshots(self, async_session: AsyncSession, monkeypatch):
+        monkeypatch.setattr(lineage_repository, "_MAX_LINEAGE_SNAPSHOTS", 2)
+        repo = LineageRepository(async_session, tenant_id=_TENANT)
+        for sha in ("s1", "s2", "s3"):
+            await repo.record_edges(sha, [("up", f"down-{sha}")])
+
+        result = await async_session.execute(select(ModelDependencyTable.snapshot_id).distinct())
+        assert sorted(result.scalars().all()) == ["s2", "s3"]
+
+    async def test_concurrent_recording_of_same_snapshot(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'lineage.db'}", echo=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async def record() -> int:
+            async with factory() as session:
+                stored = await LineageRepository(session, tenant_id=_TENANT).record_edges("sha1", _EDGES)
+                await session.commit()
+                return stored
+
+        try:
+            assert await asyncio.gather(record(), record()) == [len(_EDGES)] * 2
+            async with factory() as session:
+                snapshots = await session.scalar(select(func.count()).select_from(LineageSnapshotTable))
+                edges = await session.scalar(select(func.count()).select_from(ModelDependencyTable))
+        finally:
+            await engine.dispose()
+
+        assert snapshots == 1
+        assert edges == len(_EDGES)
+
+
+class TestGetLineage:
+    async def test_depth_is_shortest_distance(self, async_session: AsyncSession):
+        repo = LineageRepository(async_session, tenant_id=_TENANT)
+        await repo.record_edges("sha1", _EDGES)
+
+        downstream = await repo.get_lineage("raw.a")
+        assert _names(downstream["downstream"]) == [("rpt.e", 1), ("stg.b", 1), ("stg.c", 1), ("mart.d", 2)]
+        assert downstream["upstream"] == []
+        assert downstream["downstream_total"] == 4
+        assert downstream["downstream_depth"] == 2
+        assert downstream["is_truncated"] is False
+
+        upstream = await repo.get_lineage("rpt.e")
+        assert _names(upstream["upstream"]) == [("mart.d", 1), ("raw.a", 1), ("stg.b", 2), ("stg.c", 2)]
+
+    async def test_paginates_each_direction(self, async_session: AsyncSession):
+        repo = LineageRepository(async_session, tenant_id=_TENANT)
+        await repo.record_edges("sha1", _EDGES)
+
+        page = await repo.get_lineage("raw.a", limit=2, offset=2)
+        assert _names(page["downstream"]) == [("stg.c", 1), ("mart.d", 2)]
+        assert page["downstream_total"] == 4
+
+        past_end = await repo.get_lineage("raw.a", limit=2, offset=10)
+        assert past_end["downstream"] == []
+        assert past_end["downstream_total"] == 4
+
+    async def test_long_chain_reports_true_depth_and_truncation(self, async_session: AsyncSession):
+        repo = LineageRepository(async_session, tenant_id=_TENANT)
+        chain = [(f"m{i:03d}", f"m{i + 1:03d}") for i in range(120)]
+        await repo.record_edges("sha1", chain)
+
+        full = await repo.get_lineage("m000", max_depth=200, limit=1000)
+        assert full["downstream_total"] == 120
+        assert full["downstream_depth"] == 120
+        assert full["is_truncated"] is False
+
+        capped = await repo.get_lineage("m000", max_depth=10, limit=1000)
+        assert capped["downstream_total"] == 10
+        assert capped["downstream"][-1] == {"model_name": "m010", "depth": 10}
+        assert capped["is_truncated"] is True
+
+    async def test_reads_explicit_snapshot_and_isolates_tenants(self, async_session: AsyncSession):
+        repo = LineageRepository(async_session, tenant_id=_TENANT)
+        await repo.record_edges("old", [("raw.a", "legacy")])
+        await repo.record_edges("new", _EDGES)
+        other = LineageRepository(async_session, tenant_id="other-tenant")
+        await other.record_edges("new", [("raw.a", "foreign")])
+
+        assert _names((await repo.get_lineage("raw.a", snapshot_id="old"))["downstream"]) == [("legacy", 1)]
+        assert (await repo.get_lineage("raw.a"))["downstream_total"] == 4
+        assert _names((await other.get_lineage("raw.a"))["downstream"]) == [("foreign", 1)]
+
+    async def test_no_recorded_lineage(self, async_session: AsyncSession):
+        lineage = await LineageRepository(async_session, tenant_id=_TENANT).get_lineage("raw.a")
+        assert lineage["upstream"] == [] and lineage["downstream"] == []
+        assert lineage["is_truncated"] is False
+
+    async def test_cycle_terminates(self, async_session: AsyncSession):
+        repo = LineageRepository(async_session, tenant_id=_TENANT)
+        await repo.record_edges("sha1", [("a", "b"), ("b", "c"), ("c", "a")])
+        lineage = await repo.get_lineage("a", max_depth=5)
+        assert _names(lineage["downstream"]) == [("b", 1), ("c", 2)]
+
+
+async def test_create_snapshot_records_edges(async_session: AsyncSession):
+    snapshots = SnapshotRepository(async_session, tenant_id=_TENANT)
+    row = await snapshots.create_snapshot("production", {"raw.a": "v1", "stg.b": "v2"}, [("raw.a", "stg.b")])
+
+    repo = LineageRepository(async_session, tenant_id=_TENANT)
+    assert await repo.current_snapshot_id() == row.snapshot_id
+    count = await async_session.execute(select(func.count()).select_from(ModelDependencyTable))
+    assert count.scalar_one() == 1
+
+
+async def test_lineage_query_compiles_to_recursive_cte_on_postgres():
+    captured = []
+
+    class _Session:
+        async def execute(self, stmt):
+            captured.append(stmt)
+
+            class _Result:
+                def all(self):
+                    return []
+
+            return _Result()
+
+    await LineageRepository(_Session(), tenant_id=_TENANT).get_lineage("raw.a")  # type: ignore[arg-type]
+    sql = str(captured[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("WITH RECURSIVE")
+    assert "upstream_walk" in sql and "downstream_walk" in sql
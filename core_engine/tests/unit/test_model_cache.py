@@ -0,0 +1,165 @@
+"""Unit tests for the persistent model-parse cache used by the directory loader."""
+
+from __future__ import annotations
+
+import json
+import os
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from core_engine.loader import model_loader
+from core_engine.loader.model_cache import ModelParseCache
+from core_engine.loader.model_loader import load_models_from_directory
+from core_engine.loader.ref_resolver import UnresolvedRefError
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+RAW_ORDERS = "-- name: staging.raw_orders\n-- kind: FULL_REFRESH\n\nSELECT 1 AS id"
+
+ORDERS = textwrap.dedent("""\
+    -- name: analytics.orders
+    -- kind: FULL_REFRESH
+    -- tags: finance
+    -- contract_mode: WARN
+    -- contract_columns: id:INT:NOT_NULL
+    -- tests: not_null(id)
+
+    SELECT * FROM {{ ref('raw_orders') }}
+""")
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    models = tmp_path / "models"
+    models.mkdir()
+    (models / "raw_orders.sql").write_text(RAW_ORDERS, encoding="utf-8")
+    (models / "orders.sql").write_text(ORDERS, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture()
+def read_counter(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record every model file the loader reads from disk."""
+    reads: list[Path] = []
+    original = model_loader._read_model_file
+
+    def _counting_read(path: Path) -> str:
+        reads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(model_loader, "_read_model_file", _counting_read)
+    return reads
+
+
+def _load(project: Path) -> list:
+    return load_models_from_directory(project / "models", cache_dir=project / ".ironlayer" / "cache")
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestModelParseCache:
+    def test_warm_load_matches_uncached_load(self, project: Path) -> None:
+        uncached = load_models_from_directory(project / "models")
+        cold = _load(project)
+        warm = _load(project)
+        assert cold == uncached
+        assert warm == uncached
+
+    def test_cache_file_written_under_cache_dir(self, project: Path) -> None:
+        _load(project)
+        files = list((project / ".ironlayer" / "cache").glob("model_parse-*.json"))
+        assert len(files) == 1
+        payload = json.loads(files[0].read_text(encoding="utf-8"))
+        assert len(payload["entries"]) == 2
+
+    def test_cold_load_reads_each_file_once(self, project: Path, read_counter: list[Path]) -> None:
+        _load(project)
+        assert sorted(p.name for p in read_counter) == ["orders.sql", "raw_orders.sql"]
+
+    def test_warm_load_reads_no_files(self, project: Path, read_counter: list[Path]) -> None:
+        _load(project)
+        read_counter.clear()
+        _load(project)
+        assert read_counter == []
+
+    def test_only_changed_file_is_reread(self, project: Path, read_counter: list[Path]) -> None:
+        _load(project)
+        read_counter.clear()
+        raw = project / "models" / "raw_orders.sql"
+        raw.write_text(RAW_ORDERS.replace("SELECT 1", "SELECT 2"), encoding="utf-8")
+        _bump_mtime(raw)
+
+        models = {m.name: m for m in _load(project)}
+        assert read_counter == [raw]
+        assert "SELECT 2" in models["staging.raw_orders"].clean_sql
+
+    def test_touched_but_unchanged_file_reuses_entry(self, project: Path, read_counter: list[Path]) -> None:
+        _load(project)
+        orders = project / "models" / "orders.sql"
+        _bump_mtime(orders)
+        read_counter.clear()
+
+        _load(project)
+        assert read_counter == [orders]
+        read_counter.clear()
+        _load(project)
+        assert read_counter == []  # stat refreshed by the content hit
+
+    def test_added_model_shadowing_short_name_re_resolves(self, project: Path, read_counter: list[Path]) -> None:
+        _load(project)
+        read_counter.clear()
+        # A later file with the same short name wins the registry entry.
+        sub = project / "models" / "zz"
+        sub.mkdir()
+        (sub / "raw_orders.sql").write_text(
+            "-- name: zz_schema.raw_orders\n-- kind: FULL_REFRESH\n\nSELECT 3 AS id", encoding="utf-8"
+        )
+
+        models = {m.name: m for m in _load(project)}
+        assert [p.name for p in read_counter] == ["raw_orders.sql"]  # only the new file
+        assert models["analytics.orders"].referenced_tables == ["zz_schema.raw_orders"]
+        assert models == {m.name: m for m in load_models_from_directory(project / "models")}
+
+    def test_renamed_ref_target_fails_like_uncached(self, project: Path) -> None:
+        _load(project)
+        raw = project / "models" / "raw_orders.sql"
+        raw.write_text(RAW_ORDERS.replace("staging.raw_orders", "staging.orders_src"), encoding="utf-8")
+        _bump_mtime(raw)
+        with pytest.raises(UnresolvedRefError):
+            _load(project)
+
+    def test_deleted_files_are_pruned(self, project: Path) -> None:
+        _load(project)
+        (project / "models" / "orders.sql").unlink()
+        _load(project)
+        cache = ModelParseCache.open(project / ".ironlayer" / "cache", project / "models")
+        assert len(cache) == 1
+
+    def test_corrupt_cache_is_rebuilt(self, project: Path) -> None:
+        _load(project)
+        cache_file = next((project / ".ironlayer" / "cache").glob("model_parse-*.json"))
+        cache_file.write_text("{not json", encoding="utf-8")
+        assert _load(project) == load_models_from_directory(project / "models")
+        assert json.loads(cache_file.read_text(encoding="utf-8"))["entries"]
+
+    def test_version_mismatch_discards_entries(self, project: Path, read_counter: list[Path]) -> None:
+        _load(project)
+        cache_file = next((project / ".ironlayer" / "cache").glob("model_parse-*.json"))
+        payload = json.loads(cache_file.read_text(encoding="utf-8"))
+        payload["engine_version"] = "0.0.0-old"
+        cache_file.write_text(json.dumps(payload), encoding="utf-8")
+        read_counter.clear()
+        _load(project)
+        assert len(read_counter) == 2
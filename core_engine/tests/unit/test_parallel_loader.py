@@ -0,0 +1,142 @@
+"""Unit tests for the opt-in process-pool paths of the model loaders.
+
+The parallel loaders must be indistinguishable from the serial ones: same
+models, same order, same content hashes.  ``MIN_PARALLEL_ITEMS`` is
+lowered so that small fixtures actually exercise the pool.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from core_engine.benchmarks.graph_generator import SyntheticGraphGenerator
+from core_engine.benchmarks.profiler import _write_model_files
+from core_engine.loader import parallel
+from core_engine.loader.dbt_loader import load_models_from_dbt_manifest
+from core_engine.loader.model_loader import load_models_from_directory
+from core_engine.loader.parallel import effective_workers, shard
+
+
+@pytest.fixture()
+def force_parallel(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(parallel, "MIN_PARALLEL_ITEMS", 1)
+
+
+@pytest.fixture()
+def models_dir(tmp_path: Path) -> Path:
+    directory = tmp_path / "models"
+    _write_model_files(SyntheticGraphGenerator.generate_realistic(40, seed=7), directory)
+    return directory
+
+
+# ---------------------------------------------------------------------------
+# Sharding helpers
+# ---------------------------------------------------------------------------
+
+
+class TestSharding:
+    def test_small_inputs_run_serially(self) -> None:
+        assert effective_workers(8, parallel.MIN_PARALLEL_ITEMS - 1) == 1
+
+    def test_workers_capped_by_item_count(self, force_parallel: None) -> None:
+        assert effective_workers(8, 3) == 3
+
+    def test_invalid_worker_count_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            effective_workers(0, 1000)
+
+    def test_shards_are_contiguous_and_complete(self) -> None:
+        items = list(range(23))
+        shards = shard(items, 2)
+        assert [x for s in shards for x in s] == items
+        assert max(map(len, shards)) - min(map(len, shards)) <= 1
+
+
+# ---------------------------------------------------------------------------
+# Directory loader
+# ---------------------------------------------------------------------------
+
+
+class TestParallelDirectoryLoad:
+    def test_matches_serial_load(self, models_dir: Path, force_parallel: None) -> None:
+        serial = load_models_from_directory(models_dir)
+        par = load_models_from_directory(models_dir, max_workers=2)
+        assert par == serial
+        assert [m.content_hash for m in par] == [m.content_hash for m in serial]
+
+    def test_matches_serial_load_with_cache(self, models_dir: Path, tmp_path: Path, force_parallel: None) -> None:
+        serial = load_models_from_directory(models_dir)
+        cache_dir = tmp_path / "cache"
+        cold = load_models_from_directory(models_dir, cache_dir=cache_dir, max_workers=2)
+        warm = load_models_from_directory(models_dir, cache_dir=cache_dir, max_workers=2)
+        assert cold == serial
+        assert warm == serial
+
+    def test_invalid_headers_skipped_like_serial(self, models_dir: Path, force_parallel: None) -> None:
+        (models_dir / "broken.sql").write_text("-- kind: FULL_REFRESH\n\nSELECT 1", encoding="utf-8")
+        serial = load_models_from_directory(models_dir)
+        assert load_models_from_directory(models_dir, max_workers=2) == serial
+        assert len(serial) == 40
+
+
+# ---------------------------------------------------------------------------
+# dbt manifest loader
+# ---------------------------------------------------------------------------
+
+
+def _manifest(n: int) -> dict:
+    nodes = {}
+    for i in range(n):
+        deps = [f"model.shop.m_{i - 1}"] if i else ["source.shop.raw.orders"]
+        nodes[f"model.shop.m_{i}"] = {
+            "resource_type": "model",
+            "unique_id": f"model.shop.m_{i}",
+            "name": f"m_{i}",
+            "schema": "analytics",
+            "package_name": "shop",
+            "original_file_path": f"models/m_{i}.sql",
+            "config": {"materialized": "ephemeral" if i % 7 == 3 else "table", "tags": ["daily"]},
+            "depends_on": {"nodes": deps},
+            "compiled_code": f"SELECT id, amount FROM t_{i}",  # noqa: S608 - fixture SQL
+            "columns": {"id": {"name": "id"}, "amount": {"name": "amount"}},
+        }
+    return {
+        "metadata": {"dbt_version": "1.7.0"},
+        "nodes": nodes,
+        "sources": {"source.shop.raw.orders": {"schema": "raw", "source_name": "raw", "name": "orders"}},
+        "exposures": {
+            "exposure.shop.board": {
+                "name": "board",
+                "type": "dashboard",
+                "depends_on": {"nodes": ["model.shop.m_0", "model.shop.m_5", "model.shop.m_5"]},
+            },
+            "exposure.shop.api": {
+                "name": "api",
+                "type": "application",
+                "depends_on": {"nodes": ["model.shop.m_5"]},
+            },
+        },
+    }
+
+
+class TestParallelDbtLoad:
+    def test_matches_serial_load(self, tmp_path: Path, force_parallel: None) -> None:
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps(_manifest(30)), encoding="utf-8")
+
+        serial = load_models_from_dbt_manifest(manifest_path)
+        par = load_models_from_dbt_manifest(manifest_path, max_workers=2)
+        assert par == serial
+        assert [m.content_hash for m in par] == [m.content_hash for m in serial]
+
+    def test_exposures_attached_once_and_sorted(self, tmp_path: Path) -> None:
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps(_manifest(8)), encoding="utf-8")
+
+        models = {m.name: m for m in load_models_from_dbt_manifest(manifest_path)}
+        assert [e.name for e in models["analytics.m_5"].exposures] == ["api", "board"]
+        assert [e.name for e in models["analytics.m_0"].exposures] == ["board"]
+        assert models["analytics.m_1"].exposures == []
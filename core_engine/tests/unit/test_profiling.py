@@ -135,6 +135,18 @@ class TestProfileCollector:
         collector.clear()
         assert collector.get_stats("clear_me") is None
 
+    def test_counters(self) -> None:
+        collector = ProfileCollector.get_instance()
+        assert collector.get_counter("cache.hits") == 0
+        collector.increment("cache.hits")
+        collector.increment("cache.hits", 2)
+        collector.increment("other.misses")
+        assert collector.get_counter("cache.hits") == 3
+        assert collector.get_counters("cache.") == {"cache.hits": 3}
+        assert collector.get_counters() == {"cache.hits": 3, "other.misses": 1}
+        collector.clear()
+        assert collector.get_counters() == {}
+
     def test_get_all_stats_sorted(self) -> None:
         collector = ProfileCollector.get_instance()
         for name in ["zz.op", "aa.op", "mm.op"]:
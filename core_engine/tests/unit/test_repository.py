@@ -10,6 +10,8 @@ Covers:
 - Updating cost after run creation via update_cost()
 - Batch methods: get_historical_stats_batch, get_failure_rates_batch (BL-062)
 - WatermarkRepository.get_watermarks_batch (BL-062)
+- Batched writes: RunRepository.create_runs, WatermarkRepository.update_watermarks_batch,
+  TelemetryRepository.record_batch
 - ModelRepository.get_models_batch (BL-062)
 - PlanRepository.list_recent with SQL-level offset (BL-063)
 """
@@ -22,7 +24,7 @@ from uuid import uuid4
 import pytest
 import pytest_asyncio
 from core_engine.state.plan_repository import PlanRepository
-from core_engine.state.repository import ModelRepository, RunRepository, WatermarkRepository
+from core_engine.state.repository import ModelRepository, RunRepository, TelemetryRepository, WatermarkRepository
 from core_engine.state.tables import Base, ModelTable, PlanTable, WatermarkTable
 from sqlalchemy import JSON, DateTime
 from sqlalchemy.dialects.postgresql import JSONB
@@ -645,3 +647,74 @@ class TestPlanRepositoryListRecentOffset:
         result = await repo_mine.list_recent(limit=10)
         assert len(result) == 1
         assert result[0].plan_id == "mine-plan"
+
+
+# ---------------------------------------------------------------------------
+# Batched writes used by the concurrent execution engine
+# ---------------------------------------------------------------------------
+
+
+class TestBatchedWrites:
+    """Verify the multi-row write helpers persist every row in one call."""
+
+    @pytest.mark.asyncio
+    async def test_create_runs_persists_all(self, async_session: AsyncSession):
+        repo = RunRepository(async_session, tenant_id=_TENANT)
+        records = [_make_run_record(plan_id="plan-batch", cost_usd=float(i)) for i in range(3)]
+
+        rows = await repo.create_runs(records)
+
+        assert len(rows) == 3
+        stored = await repo.get_by_plan("plan-batch")
+        assert {r.run_id for r in stored} == {rec["run_id"] for rec in records}
+        assert all(r.tenant_id == _TENANT for r in stored)
+
+    @pytest.mark.asyncio
+    async def test_create_runs_empty_is_noop(self, async_session: AsyncSession):
+        repo = RunRepository(async_session, tenant_id=_TENANT)
+        assert await repo.create_runs([]) == []
+
+    @pytest.mark.asyncio
+    async def test_update_watermarks_batch_upserts(self, async_session: AsyncSession):
+        repo = WatermarkRepository(async_session, tenant_id=_TENANT)
+        d1, d2, d3, d4 = date(2024, 1, 1), date(2024, 1, 31), date(2024, 2, 1), date(2024, 2, 29)
+
+        await repo.update_watermarks_batch([("m.a", d1, d2, 10), ("m.b", d3, d4, None)])
+        # Re-upserting an existing partition updates it in place.
+        await repo.update_watermarks_batch([("m.a", d1, d2, 42), ("m.a", d3, d4, 7)])
+
+        rows_a = await repo.get_all_for_model("m.a")
+        assert [(r.partition_start, r.row_count) for r in rows_a] == [(d1, 42), (d3, 7)]
+        assert len(await repo.get_all_for_model("m.b")) == 1
+
+    @pytest.mark.asyncio
+    async def test_update_watermarks_batch_collapses_duplicates(self, async_session: AsyncSession):
+        repo = WatermarkRepository(async_session, tenant_id=_TENANT)
+        d1, d2 = date(2024, 1, 1), date(2024, 1, 31)
+
+        await repo.update_watermarks_batch([("m.a", d1, d2, 1), ("m.a", d1, d2, 2)])
+
+        rows = await repo.get_all_for_model("m.a")
+        assert len(rows) == 1
+        assert rows[0].row_count == 2
+
+    @pytest.mark.asyncio
+    async def test_telemetry_record_batch(self, async_session: AsyncSession):
+        repo = TelemetryRepository(async_session, tenant_id=_TENANT)
+        entries = [
+            {
+                "run_id": f"run-{i}",
+                "model_name": "m.a",
+                "runtime_seconds": float(i),
+                "shuffle_bytes": 0,
+                "input_rows": 0,
+                "output_rows": 0,
+                "partition_count": 1,
+            }
+            for i in range(2)
+        ]
+
+        rows = await repo.record_batch(entries)
+
+        assert len(rows) == 2
+        assert len(await repo.get_for_run("run-1")) == 1
@@ -50,6 +50,7 @@ from core_engine.state.repository import (
     TenantConfigRepository,
     TestResultRepository,
     TokenRevocationRepository,
+    UsageCounterRepository,
     UserRepository,
     WatermarkRepository,
 )
@@ -1587,6 +1588,23 @@ class TestAPIKeyRepository:
         # Validating from tenant B should not find tenant A's key
         assert await repo_b.validate_key(plaintext) is None
 
+    async def test_validate_without_touch_then_record_last_used(self, async_session: AsyncSession) -> None:
+        repo = APIKeyRepository(async_session, _TENANT)
+        row_a, plaintext = await repo.create(user_id="user-1", name="A")
+        row_b, _ = await repo.create(user_id="user-1", name="B")
+        validated = await repo.validate_key(plaintext, touch=False)
+        assert validated is not None
+        assert validated.last_used_at is None
+
+        now = datetime.now(UTC)
+        updated = await repo.record_last_used({row_a.id: now, row_b.id: now - timedelta(minutes=1)})
+        assert updated == 2
+        # An older timestamp never moves last_used_at backwards.
+        assert await repo.record_last_used({row_a.id: now - timedelta(hours=1)}) == 0
+        # Other tenants' keys are untouched.
+        other = APIKeyRepository(async_session, _OTHER_TENANT)
+        assert await other.record_last_used({row_a.id: now + timedelta(minutes=1)}) == 0
+
 
 # ---------------------------------------------------------------------------
 # AnalyticsRepository (cross-tenant, skip PG-only methods)
@@ -1643,7 +1661,9 @@ class TestQuotaRepository:
         tenant_id: str,
         event_type: str,
         quantity: int = 1,
+        reserved: int = 0,
     ) -> None:
+        """Write an event the way the metering sink does, counters included."""
         row = UsageEventTable(
             event_id=_uid(),
             tenant_id=tenant_id,
@@ -1651,7 +1671,7 @@ class TestQuotaRepository:
             quantity=quantity,
         )
         session.add(row)
-        await session.flush()
+        await UsageCounterRepository(session).add_usage([(tenant_id, event_type, datetime.now(UTC), quantity, reserved)])
 
     async def test_get_monthly_event_count_empty(self, async_session: AsyncSession) -> None:
         repo = QuotaRepository(async_session, _TENANT)
@@ -1679,6 +1699,66 @@ class TestQuotaRepository:
         count = await repo_a.get_monthly_event_count("plan_run")
         assert count == 0
 
+    async def test_reserve_stops_at_limit(self, async_session: AsyncSession) -> None:
+        repo = QuotaRepository(async_session, _TENANT)
+        await self._insert_usage_event(async_session, _TENANT, "plan_run", 2)
+        assert await repo.reserve("plan_run", limit=4) == (True, 3)
+        assert await repo.reserve("plan_run", limit=4) == (True, 4)
+        assert await repo.reserve("plan_run", limit=4) == (False, 4)
+        # Reservations count against the quota but are not reported as usage.
+        assert await repo.get_monthly_event_count("plan_run") == 4
+        assert (await repo.get_current_usage())["plan_run"] == 2
+
+    async def test_recorded_usage_consumes_reservation(self, async_session: AsyncSession) -> None:
+        repo = QuotaRepository(async_session, _TENANT)
+        assert await repo.reserve("ai_call", limit=10) == (True, 1)
+        await self._insert_usage_event(async_session, _TENANT, "ai_call", 150, reserved=1)
+        assert await repo.get_monthly_event_count("ai_call") == 150
+        assert (await repo.get_current_usage())["ai_call"] == 150
+
+    async def test_unreserved_usage_keeps_reservation(self, async_session: AsyncSession) -> None:
+        repo = QuotaRepository(async_session, _TENANT)
+        assert await repo.reserve("plan_run", limit=10) == (True, 1)
+        await self._insert_usage_event(async_session, _TENANT, "plan_run", 2)
+        # Usage recorded without a reservation leaves the in-flight slot held.
+        assert await repo.get_monthly_event_count("plan_run") == 3
+
+    async def test_release_returns_reserved_slot(self, async_session: AsyncSession) -> None:
+        repo = QuotaRepository(async_session, _TENANT)
+        assert await repo.reserve("plan_run", limit=1) == (True, 1)
+        await repo.release("plan_run")
+        await repo.release("plan_run")  # never drops below zero
+        assert await repo.get_monthly_event_count("plan_run") == 0
+        assert await repo.reserve("plan_run", limit=1) == (True, 1)
+
+    async def test_reconcile_corrects_drift(self, async_session: AsyncSession) -> None:
+        repo = QuotaRepository(async_session, _TENANT)
+        await self._insert_usage_event(async_session, _TENANT, "plan_run", 3)
+        # An event written behind the sink's back, and an in-flight reservation.
+        async_session.add(UsageEventTable(event_id=_uid(), tenant_id=_OTHER_TENANT, event_type="plan_run", quantity=7))
+        await repo.reserve("plan_run", limit=100)
+        await async_session.flush()
+
+        drifted = await UsageCounterRepository(async_session).reconcile()
+        assert drifted == 1
+        # The live reservation survives; only the drifted counter changed.
+        assert await repo.get_monthly_event_count("plan_run") == 4
+        other = QuotaRepository(async_session, _OTHER_TENANT)
+        assert await other.get_monthly_event_count("plan_run") == 7
+        assert await UsageCounterRepository(async_session).reconcile() == 0
+
+    async def test_reconcile_clears_abandoned_reservations(self, async_session: AsyncSession) -> None:
+        repo = QuotaRepository(async_session, _TENANT)
+        await self._insert_usage_event(async_session, _TENANT, "ai_call", 2)
+        await repo.reserve("ai_call", limit=100)
+        await async_session.flush()
+
+        assert await UsageCounterRepository(async_session).reconcile(reservation_ttl=timedelta(0)) == 0
+        assert await repo.get_monthly_event_count("ai_call") == 2
+
+    async def test_reconcile_lock_is_free_on_sqlite(self, async_session: AsyncSession) -> None:
+        assert await UsageCounterRepository(async_session).try_lock_reconciliation() is True
+
 
 # ---------------------------------------------------------------------------
 # CustomerHealthRepository (cross-tenant)
@@ -1731,6 +1811,49 @@ class TestCustomerHealthRepository:
         updated = await repo.upsert("t-h", health_score=90.0, health_status="active")
         assert updated.health_score == pytest.approx(90.0)
 
+    async def test_upsert_many_inserts_then_updates(self, async_session: AsyncSession) -> None:
+        repo = CustomerHealthRepository(async_session)
+        count = await repo.upsert_many(
+            [
+                {"tenant_id": "t-bulk-1", "health_score": 80.0, "health_status": "active"},
+                {"tenant_id": "t-bulk-2", "health_score": 20.0, "health_status": "churning"},
+            ]
+        )
+        assert count == 2
+        await repo.upsert_many(
+            [{"tenant_id": "t-bulk-1", "health_score": 45.0, "health_status": "at_risk", "previous_score": 80.0}]
+        )
+        scores = await repo.get_scores()
+        assert scores["t-bulk-1"] == (pytest.approx(45.0), "at_risk")
+        assert scores["t-bulk-2"] == (pytest.approx(20.0), "churning")
+
+    async def test_upsert_many_empty(self, async_session: AsyncSession) -> None:
+        repo = CustomerHealthRepository(async_session)
+        assert await repo.upsert_many([]) == 0
+        assert await repo.get_scores() == {}
+
+    async def test_collect_engagement_signals(self, async_session: AsyncSession) -> None:
+        login_at = datetime(2026, 1, 10, tzinfo=UTC)
+        user = await UserRepository(async_session, _TENANT).create("signals@example.com", "Pass!", "Sig")
+        user.last_login_at = login_at
+        for event_type in ("plan_run", "plan_run", "ai_call", "api_request"):
+            async_session.add(UsageEventTable(event_id=_uid(), tenant_id=_TENANT, event_type=event_type, quantity=1))
+        async_session.add(UsageEventTable(event_id=_uid(), tenant_id=_OTHER_TENANT, event_type="plan_run", quantity=1))
+        await async_session.flush()
+
+        repo = CustomerHealthRepository(async_session)
+        signals = await repo.collect_engagement_signals(since=datetime.now(UTC) - timedelta(days=30))
+
+        mine = signals[_TENANT]
+        assert mine["last_login_at"].replace(tzinfo=UTC) == login_at
+        assert mine["last_plan_run_at"] is not None
+        assert mine["last_ai_call_at"] is not None
+        assert mine["distinct_event_types"] == 3
+        other = signals[_OTHER_TENANT]
+        assert other["last_login_at"] is None
+        assert other["last_ai_call_at"] is None
+        assert other["distinct_event_types"] == 1
+
 
 # ---------------------------------------------------------------------------
 # InvoiceRepository
@@ -1922,3 +2045,36 @@ class TestReportingRepository:
         result = await repo.get_llm_cost_by_call_type(since, until)
         assert len(result) == 1
         assert result[0]["call_type"] == "advisory"
+
+    async def test_stream_export_rows_events_in_batches(self, async_session: AsyncSession) -> None:
+        base = datetime.now(UTC) - timedelta(minutes=30)
+        for i in range(25):
+            async_session.add(
+                UsageEventTable(
+                    event_id=f"evt-{i:03d}",
+                    tenant_id=_TENANT,
+                    event_type="plan_run",
+                    quantity=i,
+                    metadata_json={"i": i},
+                    created_at=base + timedelta(seconds=i),
+                )
+            )
+        async_session.add(UsageEventTable(event_id="evt-other", tenant_id="other", event_type="plan_run"))
+        await async_session.flush()
+
+        repo = ReportingRepository(async_session, _TENANT)
+        since = datetime.now(UTC) - timedelta(hours=1)
+        until = datetime.now(UTC) + timedelta(hours=1)
+        rows = [row async for row in repo.stream_export_rows("events", since, until, batch_size=4)]
+        assert [row["event_id"] for row in rows] == [f"evt-{i:03d}" for i in range(25)]
+        assert rows[3]["quantity"] == 3
+        assert rows[3]["metadata"] == {"i": 3}
+
+        usage = [row async for row in repo.stream_export_rows("usage", since, until)]
+        assert usage == await repo.get_usage_by_actor(since, until)
+
+    async def test_stream_export_rows_unknown_type(self, async_session: AsyncSession) -> None:
+        repo = ReportingRepository(async_session, _TENANT)
+        with pytest.raises(ValueError, match="Unknown report type"):
+            async for _ in repo.stream_export_rows("nope", datetime.now(UTC), datetime.now(UTC)):
+                pass
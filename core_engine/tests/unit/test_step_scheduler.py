@@ -0,0 +1,132 @@
+"""Unit tests for core_engine.executor.scheduler."""
+
+from __future__ import annotations
+
+import pytest
+
+from core_engine.executor.scheduler import StepScheduler, StepState
+from core_engine.models.plan import PlanStep, RunType
+
+
+def _step(step_id: str, *depends_on: str) -> PlanStep:
+    return PlanStep(
+        step_id=step_id,
+        model=f"model_{step_id}",
+        run_type=RunType.FULL_REFRESH,
+        depends_on=list(depends_on),
+    )
+
+
+def _drain(scheduler: StepScheduler) -> list[str]:
+    ids = []
+    while (step := scheduler.next_ready()) is not None:
+        ids.append(step.step_id)
+    return ids
+
+
+# ---------------------------------------------------------------------------
+# Ready queue
+# ---------------------------------------------------------------------------
+
+
+class TestReadyQueue:
+    def test_roots_are_ready_in_plan_order(self):
+        scheduler = StepScheduler([_step("b"), _step("a"), _step("c", "a")])
+        assert _drain(scheduler) == ["b", "a"]
+        assert scheduler.running_count == 2
+
+    def test_child_released_only_after_all_parents(self):
+        scheduler = StepScheduler([_step("a"), _step("b"), _step("c", "a", "b")])
+        _drain(scheduler)
+        assert scheduler.mark_succeeded("a") == []
+        assert scheduler.state_of("c") == StepState.PENDING
+        unblocked = scheduler.mark_succeeded("b")
+        assert [s.step_id for s in unblocked] == ["c"]
+        assert _drain(scheduler) == ["c"]
+
+    def test_no_group_barrier(self):
+        """A fast branch proceeds without waiting for a slow sibling."""
+        scheduler = StepScheduler([_step("slow"), _step("fast"), _step("after_fast", "fast")])
+        _drain(scheduler)
+        scheduler.mark_succeeded("fast")
+        assert _drain(scheduler) == ["after_fast"]
+        assert scheduler.state_of("slow") == StepState.RUNNING
+
+    def test_external_dependencies_are_satisfied(self):
+        scheduler = StepScheduler([_step("a", "not-in-plan")])
+        assert _drain(scheduler) == ["a"]
+
+    def test_completed_steps_are_skipped(self):
+        scheduler = StepScheduler([_step("a"), _step("b", "a")], completed=["a"])
+        assert scheduler.state_of("a") == StepState.SUCCEEDED
+        assert _drain(scheduler) == ["b"]
+
+    def test_is_finished(self):
+        scheduler = StepScheduler([_step("a"), _step("b", "a")])
+        assert not scheduler.is_finished()
+        _drain(scheduler)
+        scheduler.mark_succeeded("a")
+        _drain(scheduler)
+        assert not scheduler.is_finished()
+        scheduler.mark_succeeded("b")
+        assert scheduler.is_finished()
+
+    def test_empty_plan_is_finished(self):
+        assert StepScheduler([]).is_finished()
+
+
+# ---------------------------------------------------------------------------
+# Failure propagation
+# ---------------------------------------------------------------------------
+
+
+class TestFailurePropagation:
+    def test_cancels_only_downstream_closure(self):
+        steps = [_step("a"), _step("b"), _step("c", "a"), _step("d", "c"), _step("e", "b")]
+        scheduler = StepScheduler(steps)
+        _drain(scheduler)
+
+        cancelled = scheduler.mark_failed("a")
+
+        assert [s.step_id for s in cancelled] == ["c", "d"]
+        assert scheduler.state_of("b") == StepState.RUNNING
+        scheduler.mark_succeeded("b")
+        assert _drain(scheduler) == ["e"]
+        scheduler.mark_succeeded("e")
+        assert scheduler.is_finished()
+        assert [s.step_id for s in scheduler.steps_in_state(StepState.CANCELLED)] == ["c", "d"]
+
+    def test_diamond_child_cancelled_once(self):
+        steps = [_step("a"), _step("b", "a"), _step("c", "a"), _step("d", "b", "c")]
+        scheduler = StepScheduler(steps)
+        _drain(scheduler)
+        cancelled = scheduler.mark_failed("a")
+        assert [s.step_id for s in cancelled] == ["b", "c", "d"]
+
+    def test_fail_fast_cancels_everything_not_started(self):
+        scheduler = StepScheduler([_step("a"), _step("b"), _step("c")], fail_fast=True)
+        assert scheduler.next_ready().step_id == "a"
+        cancelled = scheduler.mark_failed("a")
+        assert [s.step_id for s in cancelled] == ["b", "c"]
+        assert scheduler.next_ready() is None
+        assert scheduler.is_finished()
+
+    def test_reporting_unknown_or_idle_step_raises(self):
+        scheduler = StepScheduler([_step("a")])
+        with pytest.raises(ValueError, match="not running"):
+            scheduler.mark_succeeded("a")
+
+
+# ---------------------------------------------------------------------------
+# Validation
+# ---------------------------------------------------------------------------
+
+
+class TestValidation:
+    def test_duplicate_step_ids_rejected(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            StepScheduler([_step("a"), _step("a")])
+
+    def test_cycle_rejected(self):
+        with pytest.raises(ValueError, match="cycle"):
+            StepScheduler([_step("a", "b"), _step("b", "a")])